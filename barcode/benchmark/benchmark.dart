@@ -0,0 +1,277 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Measure the throughput of every symbology on the corpora generated by
+// build_corpus.py, and compare it to a baseline:
+//
+//   python3 build_corpus.py
+//   cd barcode
+//   dart run benchmark/benchmark.dart benchmark/corpus.jsonl \
+//       --save benchmark/baseline.json
+//   dart run benchmark/benchmark.dart benchmark/corpus.jsonl \
+//       --baseline benchmark/baseline.json
+//
+// The exit code is 1 if a corpus is slower than its baseline by more than
+// the tolerance, or if one of its codes can't be encoded.
+
+import 'dart:convert';
+import 'dart:io';
+
+import 'package:barcode/barcode.dart';
+
+/// Size of the barcodes, as the example
+const width = 200.0;
+const height = 80.0;
+
+/// The codes of a symbology to benchmark
+class Corpus {
+  Corpus(this.name, this.type, this.data);
+
+  factory Corpus.fromJson(Map<String, dynamic> json) => Corpus(
+        json['name'] as String,
+        BarcodeType.values.firstWhere(
+          (type) => type.toString() == 'BarcodeType.${json['type']}',
+          orElse: () => throw FormatException('Unknown type ${json['type']}'),
+        ),
+        List<String>.from(json['data'] as List),
+      );
+
+  final String name;
+
+  final BarcodeType type;
+
+  final List<String> data;
+}
+
+/// The throughput of a corpus
+class Result {
+  Result(
+    this.name,
+    this.codes,
+    this.rejected,
+    this.encodesPerSecond,
+    this.svgBytesPerSecond,
+    this.elementsPerEncode,
+  );
+
+  factory Result.fromJson(String name, Map<String, dynamic> json) => Result(
+        name,
+        json['codes'] as int,
+        json['rejected'] as int,
+        (json['encodesPerSecond'] as num).toDouble(),
+        (json['svgBytesPerSecond'] as num).toDouble(),
+        (json['elementsPerEncode'] as num).toDouble(),
+      );
+
+  final String name;
+
+  /// Number of codes of the corpus
+  final int codes;
+
+  /// Number of codes that can't be encoded
+  final int rejected;
+
+  /// Codes converted to drawing operations per second
+  final double encodesPerSecond;
+
+  /// Size of the SVG documents generated per second, encoded in UTF-8
+  final double svgBytesPerSecond;
+
+  /// Number of drawing elements returned by each encode
+  final double elementsPerEncode;
+
+  Map<String, dynamic> toJson() => <String, dynamic>{
+        'codes': codes,
+        'rejected': rejected,
+        'encodesPerSecond': encodesPerSecond,
+        'svgBytesPerSecond': svgBytesPerSecond,
+        'elementsPerEncode': elementsPerEncode,
+      };
+}
+
+/// Run [pass] over the corpus until [duration] is elapsed, returns the
+/// number of units counted by the passes per second
+double rate(int Function() pass, Duration duration) {
+  final watch = Stopwatch()..start();
+  var units = 0;
+  do {
+    units += pass();
+  } while (watch.elapsed < duration);
+  return units * Duration.microsecondsPerSecond / watch.elapsedMicroseconds;
+}
+
+/// Number of drawing elements of a code
+int elements(Barcode bc, String data) =>
+    bc.make(data, width: width, height: height, drawText: true).length;
+
+Result run(Corpus corpus, Duration duration) {
+  final bc = Barcode.fromType(corpus.type);
+
+  // Warm up, and leave out the codes the barcode rejects. The UTF-8 size
+  // of the SVG documents is measured once, out of the timed passes.
+  final data = <String>[];
+  final svgSizes = <int>[];
+  var count = 0;
+  for (final code in corpus.data) {
+    try {
+      count += elements(bc, code);
+      svgSizes.add(
+          utf8.encode(bc.toSvg(code, width: width, height: height)).length);
+      data.add(code);
+    } on BarcodeException catch (e) {
+      stderr.writeln('${corpus.name}: $e');
+    }
+  }
+
+  var encodes = 0.0;
+  var svgBytes = 0.0;
+  if (data.isNotEmpty) {
+    encodes = rate(() {
+      for (final code in data) {
+        elements(bc, code);
+      }
+      return data.length;
+    }, duration);
+
+    svgBytes = rate(() {
+      var bytes = 0;
+      for (var i = 0; i < data.length; i++) {
+        bc.toSvg(data[i], width: width, height: height);
+        bytes += svgSizes[i];
+      }
+      return bytes;
+    }, duration);
+  }
+
+  return Result(
+    corpus.name,
+    corpus.data.length,
+    corpus.data.length - data.length,
+    encodes,
+    svgBytes,
+    data.isEmpty ? 0 : count / data.length,
+  );
+}
+
+String column(Object value, int size) => '$value'.padLeft(size);
+
+Never usage() {
+  stderr.writeln('Usage: dart run benchmark/benchmark.dart CORPUS.jsonl '
+      '[--only NAME] [--duration MS] [--baseline FILE] [--tolerance PERCENT] '
+      '[--save FILE]');
+  exit(2);
+}
+
+void main(List<String> arguments) {
+  String? corpusFile;
+  String? baselineFile;
+  String? saveFile;
+  final only = <String>{};
+  var duration = const Duration(seconds: 1);
+  var tolerance = 10.0;
+
+  for (var i = 0; i < arguments.length; i++) {
+    final argument = arguments[i];
+    if (!argument.startsWith('--')) {
+      corpusFile = argument;
+      continue;
+    }
+    if (i + 1 >= arguments.length) {
+      usage();
+    }
+    final value = arguments[++i];
+    switch (argument) {
+      case '--only':
+        only.add(value);
+        break;
+      case '--duration':
+        duration = Duration(milliseconds: int.parse(value));
+        break;
+      case '--baseline':
+        baselineFile = value;
+        break;
+      case '--tolerance':
+        tolerance = double.parse(value);
+        break;
+      case '--save':
+        saveFile = value;
+        break;
+      default:
+        usage();
+    }
+  }
+  if (corpusFile == null) {
+    usage();
+  }
+
+  final baseline = <String, Result>{};
+  if (baselineFile != null) {
+    final json = jsonDecode(File(baselineFile).readAsStringSync())
+        as Map<String, dynamic>;
+    json.forEach((name, value) =>
+        baseline[name] = Result.fromJson(name, value as Map<String, dynamic>));
+  }
+
+  print('${'corpus'.padRight(24)}'
+      '${column('codes', 7)}${column('encodes/s', 12)}'
+      '${column('SVG kB/s', 12)}${column('elements', 10)}'
+      '${column('baseline', 10)}');
+
+  final results = <String, Result>{};
+  var failed = false;
+  for (final line in File(corpusFile).readAsLinesSync()) {
+    if (line.trim().isEmpty) {
+      continue;
+    }
+    final corpus = Corpus.fromJson(jsonDecode(line) as Map<String, dynamic>);
+    if (only.isNotEmpty && !only.contains(corpus.name)) {
+      continue;
+    }
+
+    final result = run(corpus, duration);
+    results[corpus.name] = result;
+    failed |= result.rejected > 0;
+
+    // Relative change of the encodes per second
+    var change = '';
+    final previous = baseline[corpus.name];
+    if (previous != null && previous.encodesPerSecond > 0) {
+      final percent =
+          (result.encodesPerSecond / previous.encodesPerSecond - 1) * 100;
+      change = '${percent >= 0 ? '+' : ''}${percent.toStringAsFixed(1)}%';
+      if (percent < -tolerance) {
+        change += ' !';
+        failed = true;
+      }
+    }
+
+    print('${corpus.name.padRight(24)}'
+        '${column(result.codes, 7)}'
+        '${column(result.encodesPerSecond.toStringAsFixed(0), 12)}'
+        '${column((result.svgBytesPerSecond / 1024).toStringAsFixed(0), 12)}'
+        '${column(result.elementsPerEncode.toStringAsFixed(1), 10)}'
+        '${column(change, 10)}');
+  }
+
+  print('Peak memory: ${ProcessInfo.maxRss ~/ (1024 * 1024)} MB');
+
+  if (saveFile != null) {
+    File(saveFile).writeAsStringSync(
+        const JsonEncoder.withIndent('  ').convert(results));
+  }
+
+  exit(failed ? 1 : 0);
+}
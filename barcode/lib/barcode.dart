@@ -15,8 +15,12 @@
  */
 
 export 'src/barcode.dart';
+export 'src/barcode_cache.dart';
 export 'src/barcode_exception.dart';
+export 'src/barcode_listener.dart';
 export 'src/barcode_operations.dart';
+export 'src/barcode_recipe.dart';
+export 'src/barcode_sheet.dart';
 export 'src/barcode_types.dart';
 export 'src/codabar.dart' show BarcodeCodabarStartStop;
 export 'src/datamatrix.dart' show DataMatrixEncoder;
@@ -19,6 +19,7 @@ import 'dart:typed_data';
 import '../barcode.dart';
 import 'barcode_2d.dart';
 import 'barcode_exception.dart';
+import 'maps/aztec.dart';
 import 'reedsolomon.dart';
 
 /// Aztec
@@ -45,75 +46,12 @@ class BarcodeAztec extends Barcode2D {
   /// Number of layers
   final int userSpecifiedLayers;
 
-  static const _maxNbBits = 32;
-
-  static const _maxNbBitsCompact = 4;
-
-  static const _wordSize = <int>[
-    4, 6, 6, 8, 8, 8, 8, 8, 8, 10, 10, 10, 10, 10, 10, 10, 10, 10, 10, //
-    10, 10, 10, 10, 12, 12, 12, 12, 12, 12, 12, 12, 12, 12,
-  ];
-
-  static bool _initialized = false;
-
-  static late Map<_EncodingMode, List<int?>> _charMap;
-
-  static void _init() {
-    _charMap = <_EncodingMode, List<int?>>{};
-
-    _charMap[_EncodingMode.mode_upper] = List<int?>.filled(256, null);
-    _charMap[_EncodingMode.mode_lower] = List<int?>.filled(256, null);
-    _charMap[_EncodingMode.mode_digit] = List<int?>.filled(256, null);
-    _charMap[_EncodingMode.mode_mixed] = List<int?>.filled(256, null);
-    _charMap[_EncodingMode.mode_punct] = List<int?>.filled(256, null);
-
-    _charMap[_EncodingMode.mode_upper]![0x20] = 1;
-    for (var c = 0x41; c <= 0x5a; c++) {
-      _charMap[_EncodingMode.mode_upper]![c] = c - 0x41 + 2;
-    }
-
-    _charMap[_EncodingMode.mode_lower]![0x20] = 1;
-    for (var c = 0x61; c <= 0x7a; c++) {
-      _charMap[_EncodingMode.mode_lower]![c] = c - 0x61 + 2;
-    }
-    _charMap[_EncodingMode.mode_digit]![0x20] = 1;
-    for (var c = 0x30; c <= 0x39; c++) {
-      _charMap[_EncodingMode.mode_digit]![c] = c - 0x30 + 2;
-    }
-    _charMap[_EncodingMode.mode_digit]![0x2c] = 12;
-    _charMap[_EncodingMode.mode_digit]![0x2e] = 13;
-
-    final mixedTable = <int>[
-      0, 0x20, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 27, 28, 29, 30, 31, //
-      0x40, 0x5c, 0x5e, 0x5f, 0x60, 0x7c, 0x7e, 127,
-    ];
-    for (var i = 0; i < mixedTable.length; i++) {
-      final v = mixedTable[i];
-      _charMap[_EncodingMode.mode_mixed]![v] = i;
-    }
-
-    const punctTable = <int>[
-      0, 0xd, 0, 0, 0, 0, 0x21, 0x27, 0x23, 0x24, 0x25, 0x26, 0x27, 0x28,
-      0x29, //
-      0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x2f, 0x3a, 0x3b, 0x3c, 0x3d, 0x3e, 0x3f,
-      0x5b, 0x5d, 0x7b, 0x7d,
-    ];
-
-    for (var i = 0; i < punctTable.length; i++) {
-      final v = punctTable[i];
-      if (v > 0) {
-        _charMap[_EncodingMode.mode_punct]![v] = i;
-      }
-    }
-  }
+  @override
+  List<Object?> get cacheKey =>
+      [...super.cacheKey, minECCPercent, userSpecifiedLayers];
 
   @override
   Barcode2DMatrix convert(Uint8List data) {
-    if (!_initialized) {
-      _init();
-      _initialized = true;
-    }
-
     final m = _encode(data);
 
     return Barcode2DMatrix(
@@ -175,15 +113,15 @@ class BarcodeAztec extends Barcode2D {
   GaloisField _getGF(int wordSize) {
     switch (wordSize) {
       case 4:
-        return GaloisField(0x13, 16, 1);
+        return GaloisField.gf16;
       case 6:
-        return GaloisField(0x43, 64, 1);
+        return GaloisField.gf64;
       case 8:
-        return GaloisField(0x012D, 256, 1);
+        return GaloisField.gf256;
       case 10:
-        return GaloisField(0x409, 1024, 1);
+        return GaloisField.gf1024;
       case 12:
-        return GaloisField(0x1069, 4096, 1);
+        return GaloisField.gf4096;
       default:
         throw const BarcodeException('Unable to find the Galois field');
     }
@@ -193,24 +131,13 @@ class BarcodeAztec extends Barcode2D {
     var states = <_State>[_State.initialState];
 
     for (var index = 0; index < data.length; index++) {
-      var pairCode = 0;
       var nextChar = 0;
       if (index + 1 < data.length) {
         nextChar = data[index + 1];
       }
 
-      final cur = data[index];
-      if (cur == 0xd && nextChar == 0xa) {
-        pairCode = 2;
-      } else if (cur == 0x2e && nextChar == 0x20) {
-        pairCode = 3;
-      } else if (cur == 0x2c && nextChar == 0x20) {
-        pairCode = 4;
-      } else if (cur == 0x3a && nextChar == 0x20) {
-        pairCode = 5;
-      }
-
-      if (pairCode > 0) {
+      final pairCode = AztecMaps.aztecPairs[(data[index] << 8) | nextChar];
+      if (pairCode != null) {
         // We have one of the four special PUNCT pairs.  Treat them specially.
         // Get a new set of states for the two new characters.
         states = _updateStateListForPair(states, data, index, pairCode);
@@ -281,18 +208,18 @@ class BarcodeAztec extends Barcode2D {
   List<_State> _updateStateForChar(_State s, List<int> data, int index) {
     final result = <_State>[];
     final ch = data[index];
-    final charInCurrentTable = _charMap[s.mode]![ch] != null;
+    final charInCurrentTable = _charValue(s.mode, ch) != AztecMaps.noCode;
 
     _State? stateNoBinary;
-    for (var mode in _EncodingMode.values) {
-      final charInMode = _charMap[mode]![ch];
-      if (charInMode != null && charInMode > 0) {
+    for (var mode = 0; mode < AztecMaps.aztecChars.length; mode++) {
+      final charInMode = _charValue(mode, ch);
+      if (charInMode > 0) {
         // Only create stateNoBinary the first time it's required.
         stateNoBinary ??= s.endBinaryShift(index);
         // Try generating the character by latching to its mode
         if (!charInCurrentTable ||
             mode == s.mode ||
-            mode == _EncodingMode.mode_digit) {
+            mode == AztecMaps.aztecModeDigit) {
           // If the character is in the current table, we don't want to latch to
           // any other mode except possibly digit (which uses only 4 bits).  Any
           // other latch would be equally successful *after* this character, and
@@ -303,8 +230,7 @@ class BarcodeAztec extends Barcode2D {
         // Try generating the character by switching to its mode.
 
         if (!charInCurrentTable &&
-            _shiftTable[s.mode] != null &&
-            _shiftTable[s.mode]![mode] != null) {
+            _shiftCode(s.mode, mode) != AztecMaps.noCode) {
           // It never makes sense to temporarily shift to another mode if the
           // character exists in the current mode.  That can never save bits.
           final res = stateNoBinary.shiftAndAppend(mode, charInMode);
@@ -312,7 +238,7 @@ class BarcodeAztec extends Barcode2D {
         }
       }
     }
-    if (s.bShiftByteCount > 0 || _charMap[s.mode]![ch] == null) {
+    if (s.bShiftByteCount > 0 || !charInCurrentTable) {
       // It's never worthwhile to go into binary shift mode if you're not already
       // in binary shift mode, and the character exists in your current mode.
       // That can never save bits over just outputting the char in the current mode.
@@ -343,19 +269,19 @@ class BarcodeAztec extends Barcode2D {
     final stateNoBinary = s.endBinaryShift(index);
     // Possibility 1.  Latch to MODE_PUNCT, and then append this code
     result
-        .add(stateNoBinary.latchAndAppend(_EncodingMode.mode_punct, pairCode));
-    if (s.mode != _EncodingMode.mode_punct) {
+        .add(stateNoBinary.latchAndAppend(AztecMaps.aztecModePunct, pairCode));
+    if (s.mode != AztecMaps.aztecModePunct) {
       // Possibility 2.  Shift to MODE_PUNCT, and then append this code.
       // Every state except MODE_PUNCT (handled above) can shift
       result.add(
-          stateNoBinary.shiftAndAppend(_EncodingMode.mode_punct, pairCode));
+          stateNoBinary.shiftAndAppend(AztecMaps.aztecModePunct, pairCode));
     }
     if (pairCode == 3 || pairCode == 4) {
       // both characters are in DIGITS.  Sometimes better to just add two digits
       final digitState = stateNoBinary
-          .latchAndAppend(_EncodingMode.mode_digit, 16 - pairCode)
+          .latchAndAppend(AztecMaps.aztecModeDigit, 16 - pairCode)
           . // period or comma in DIGIT
-          latchAndAppend(_EncodingMode.mode_digit, 1); // space in DIGIT
+          latchAndAppend(AztecMaps.aztecModeDigit, 1); // space in DIGIT
       result.add(digitState);
     }
     if (s.bShiftByteCount > 0) {
@@ -366,14 +292,6 @@ class BarcodeAztec extends Barcode2D {
     return result;
   }
 
-  int _totalBitsInLayer(int layers, bool compact) {
-    var tmp = 112;
-    if (compact) {
-      tmp = 88;
-    }
-    return (tmp + 16 * layers) * layers;
-  }
-
   List<bool> _stuffBits(List<bool> bits, int wordSize) {
     final out = <bool>[];
     final n = bits.length;
@@ -474,93 +392,70 @@ class BarcodeAztec extends Barcode2D {
     final bits = _highlevelEncode(data);
     final eccBits = ((bits.length * minECCPercent) ~/ 100) + 11;
     final totalSizeBits = bits.length + eccBits;
-    int layers;
-    int wordSize;
-    int totalBitsInLayer;
-    bool compact;
-    List<bool>? stuffedBits;
+    _CodeSize size;
+    List<bool> stuffedBits;
     if (userSpecifiedLayers != defaultLayers) {
-      compact = userSpecifiedLayers < 0;
-      if (compact) {
-        layers = -userSpecifiedLayers;
-      } else {
-        layers = userSpecifiedLayers;
-      }
-      if ((compact && layers > _maxNbBitsCompact) ||
-          (!compact && layers > _maxNbBits)) {
-        throw BarcodeException('Illegal value $userSpecifiedLayers for layers');
-      }
-      totalBitsInLayer = _totalBitsInLayer(layers, compact);
-      wordSize = _wordSize[layers];
-      final usableBitsInLayers =
-          totalBitsInLayer - (totalBitsInLayer % wordSize);
-      stuffedBits = _stuffBits(bits, wordSize);
-      if (stuffedBits.length + eccBits > usableBitsInLayers) {
-        throw const BarcodeException('Data too large for user specified layer');
-      }
-      if (compact && stuffedBits.length > wordSize * 64) {
+      size = _CodeSize.fromLayers(userSpecifiedLayers);
+      stuffedBits = _stuffBits(bits, size.wordSize);
+      if (stuffedBits.length + eccBits > size.usableBits ||
+          stuffedBits.length > size.wordSize * size.maxDataWords) {
         throw const BarcodeException('Data too large for user specified layer');
       }
     } else {
-      wordSize = 0;
-      stuffedBits = null;
+      var wordSize = 0;
+      var stuffed = <bool>[];
+      _CodeSize? found;
       // We look at the possible table sizes in the order Compact1, Compact2, Compact3,
       // Compact4, Normal4,...  Normal(i) for i < 4 isn't typically used since Compact(i+1)
       // is the same size, but has more data.
-      for (var i = 0;; i++) {
-        if (i > _maxNbBits) {
-          throw const BarcodeException('Data too large for an aztec code');
-        }
-        compact = i <= 3;
-        layers = i;
-        if (compact) {
-          layers = i + 1;
+      for (final s in _CodeSize.codeSizes) {
+        if (!s.compact && s.layers < AztecMaps.aztecCompactLayers) {
+          continue;
         }
-        totalBitsInLayer = _totalBitsInLayer(layers, compact);
-        if (totalSizeBits > totalBitsInLayer) {
+        if (totalSizeBits > s.totalBits) {
           continue;
         }
         // [Re]stuff the bits if this is the first opportunity, or if the
         // wordSize has changed
-        if (wordSize != _wordSize[layers]) {
-          wordSize = _wordSize[layers];
-          stuffedBits = _stuffBits(bits, wordSize);
+        if (wordSize != s.wordSize) {
+          wordSize = s.wordSize;
+          stuffed = _stuffBits(bits, wordSize);
         }
-        final usableBitsInLayers =
-            totalBitsInLayer - (totalBitsInLayer % wordSize);
-        if (compact && stuffedBits!.length > wordSize * 64) {
+        if (stuffed.length > wordSize * s.maxDataWords) {
           // Compact format only allows 64 data words, though C4 can hold more words than that
           continue;
         }
-        if (stuffedBits!.length + eccBits <= usableBitsInLayers) {
+        if (stuffed.length + eccBits <= s.usableBits) {
+          found = s;
           break;
         }
       }
+      if (found == null) {
+        throw const BarcodeException('Data too large for an aztec code');
+      }
+      size = found;
+      stuffedBits = stuffed;
     }
+    final compact = size.compact;
+    final layers = size.layers;
+    final wordSize = size.wordSize;
     final messageBits =
-        _generateCheckWords(stuffedBits, totalBitsInLayer, wordSize);
+        _generateCheckWords(stuffedBits, size.totalBits, wordSize);
     final messageSizeInWords = stuffedBits.length ~/ wordSize;
     final modeMessage =
         _generateModeMessage(compact, layers, messageSizeInWords);
 
     // allocate symbol
-    int baseMatrixSize;
-    if (compact) {
-      baseMatrixSize = 11 + layers * 4;
-    } else {
-      baseMatrixSize = 14 + layers * 4;
-    }
+    final baseMatrixSize = size.baseMatrixSize;
+    final matrixSize = size.matrixSize;
     final alignmentMap = List<int>.filled(baseMatrixSize, 0);
-    int matrixSize;
 
     if (compact) {
       // no alignment marks in compact mode, alignmentMap is a no-op
-      matrixSize = baseMatrixSize;
       for (var i = 0; i < alignmentMap.length; i++) {
         alignmentMap[i] = i;
       }
     } else {
-      matrixSize = baseMatrixSize + 1 + 2 * ((baseMatrixSize / 2 - 1) ~/ 15);
       final origCenter = baseMatrixSize ~/ 2;
       final center = matrixSize ~/ 2;
       for (var i = 0; i < origCenter; i++) {
@@ -687,31 +582,26 @@ Iterable<bool> _addBits(int b, int count) sync* {
   }
 }
 
-enum _EncodingMode {
-  mode_upper, // 5 bits
-  mode_lower, // 5 bits
-  mode_digit, // 4 bits
-  mode_mixed, // 5 bits
-  mode_punct, // 5 bits
+// The value of the character [ch] in [mode], or noCode if it's not in the
+// table of this mode
+int _charValue(int mode, int ch) {
+  final table = AztecMaps.aztecChars[mode];
+  return ch < table.length ? table[ch] : AztecMaps.noCode;
 }
 
-// A map showing the available shift codes.  (The shifts to BINARY are not shown)
-const _shiftTable = <_EncodingMode, Map<_EncodingMode, int>>{
-  _EncodingMode.mode_upper: {
-    _EncodingMode.mode_punct: 0,
-  },
-  _EncodingMode.mode_lower: {
-    _EncodingMode.mode_punct: 0,
-    _EncodingMode.mode_upper: 28,
-  },
-  _EncodingMode.mode_mixed: {
-    _EncodingMode.mode_punct: 0,
-  },
-  _EncodingMode.mode_digit: {
-    _EncodingMode.mode_punct: 0,
-    _EncodingMode.mode_upper: 15,
-  },
-};
+// The shift code from a mode to another, or noCode if there is none.
+// (The shifts to BINARY are not shown)
+int _shiftCode(int from, int to) =>
+    AztecMaps.aztecShift[from * AztecMaps.aztecChars.length + to];
+
+// The latch code from a mode to another. Up to 14 bits in the worst possible
+// case, and none if we are already there.
+int _latchCode(int from, int to) =>
+    AztecMaps.aztecLatch[from * AztecMaps.aztecChars.length + to];
+
+// The number of bits of the latch code from a mode to another
+int _latchCost(int from, int to) =>
+    AztecMaps.aztecLatchCost[from * AztecMaps.aztecChars.length + to];
 
 class _State {
   const _State({
@@ -722,95 +612,55 @@ class _State {
   });
 
   static const initialState = _State(
-    mode: _EncodingMode.mode_upper,
+    mode: AztecMaps.aztecModeUpper,
     tokens: null,
     bShiftByteCount: 0,
     bitCount: 0,
   );
 
-  final _EncodingMode mode;
+  final int mode;
   final _Token? tokens;
   final int bShiftByteCount;
   final int bitCount;
 
-// The Latch Table shows, for each pair of Modes, the optimal method for
-// getting from one mode to another.  In the worst possible case, this can
-// be up to 14 bits.  In the best possible case, we are already there!
-// The high half-word of each entry gives the number of bits.
-// The low half-word of each entry are the actual bits necessary to change
-  static const latchTable = <_EncodingMode, Map<_EncodingMode, int>>{
-    _EncodingMode.mode_upper: {
-      _EncodingMode.mode_upper: 0,
-      _EncodingMode.mode_lower: (5 << 16) + 28,
-      _EncodingMode.mode_digit: (5 << 16) + 30,
-      _EncodingMode.mode_mixed: (5 << 16) + 29,
-      _EncodingMode.mode_punct: (10 << 16) + (29 << 5) + 30,
-    },
-    _EncodingMode.mode_lower: {
-      _EncodingMode.mode_upper: (9 << 16) + (30 << 4) + 14,
-      _EncodingMode.mode_lower: 0,
-      _EncodingMode.mode_digit: (5 << 16) + 30,
-      _EncodingMode.mode_mixed: (5 << 16) + 29,
-      _EncodingMode.mode_punct: (10 << 16) + (29 << 5) + 30,
-    },
-    _EncodingMode.mode_digit: {
-      _EncodingMode.mode_upper: (4 << 16) + 14,
-      _EncodingMode.mode_lower: (9 << 16) + (14 << 5) + 28,
-      _EncodingMode.mode_digit: 0,
-      _EncodingMode.mode_mixed: (9 << 16) + (14 << 5) + 29,
-      _EncodingMode.mode_punct: (14 << 16) + (14 << 10) + (29 << 5) + 30,
-    },
-    _EncodingMode.mode_mixed: {
-      _EncodingMode.mode_upper: (5 << 16) + 29,
-      _EncodingMode.mode_lower: (5 << 16) + 28,
-      _EncodingMode.mode_digit: (10 << 16) + (29 << 5) + 30,
-      _EncodingMode.mode_mixed: 0,
-      _EncodingMode.mode_punct: (5 << 16) + 30,
-    },
-    _EncodingMode.mode_punct: {
-      _EncodingMode.mode_upper: (5 << 16) + 31,
-      _EncodingMode.mode_lower: (10 << 16) + (31 << 5) + 28,
-      _EncodingMode.mode_digit: (10 << 16) + (31 << 5) + 30,
-      _EncodingMode.mode_mixed: (10 << 16) + (31 << 5) + 29,
-      _EncodingMode.mode_punct: 0,
-    },
-  };
-
 // Create a new state representing this state with a latch to a (not
 // necessary different) mode, and then a code.
-  _State latchAndAppend(_EncodingMode mode, int value) {
+  _State latchAndAppend(int mode, int value) {
     var bitCount = this.bitCount;
     var tokens = this.tokens;
 
     if (mode != this.mode) {
-      final latch = latchTable[this.mode]![mode]!;
-      tokens = _SimpleToken(tokens, latch & 0xFFFF, latch >> 16);
-      bitCount += latch >> 16;
+      final latchCost = _latchCost(this.mode, mode);
+      tokens = _SimpleToken(tokens, _latchCode(this.mode, mode), latchCost);
+      bitCount += latchCost;
     }
-    tokens = _SimpleToken(tokens, value, _bitCount(mode));
+    final modeBits = AztecMaps.aztecModeBits[mode];
+    tokens = _SimpleToken(tokens, value, modeBits);
     return _State(
       mode: mode,
       tokens: tokens,
       bShiftByteCount: 0,
-      bitCount: bitCount + _bitCount(mode),
+      bitCount: bitCount + modeBits,
     );
   }
 
 // Create a new state representing this state, with a temporary shift
 // to a different mode to output a single value.
-  _State shiftAndAppend(_EncodingMode mode, int value) {
+  _State shiftAndAppend(int mode, int value) {
     var tokens = this.tokens;
 
     // Shifts exist only to UPPER and PUNCT, both with tokens size 5.
-    tokens = _SimpleToken(
-        tokens, _shiftTable[this.mode]![mode]!, _bitCount(this.mode));
-    tokens = _SimpleToken(tokens, value, 5);
+    tokens = _SimpleToken(tokens, _shiftCode(this.mode, mode),
+        AztecMaps.aztecModeBits[this.mode]);
+    tokens = _SimpleToken(tokens, value, AztecMaps.aztecModeBits[mode]);
 
     return _State(
       mode: this.mode,
       tokens: tokens,
       bShiftByteCount: 0,
-      bitCount: bitCount + _bitCount(this.mode) + 5,
+      bitCount: bitCount +
+          AztecMaps.aztecShiftCost[
+              this.mode * AztecMaps.aztecChars.length + mode],
     );
   }
 
@@ -820,12 +670,13 @@ class _State {
     var tokens = this.tokens;
     var mode = this.mode;
     var bitCnt = bitCount;
-    if (this.mode == _EncodingMode.mode_punct ||
-        this.mode == _EncodingMode.mode_digit) {
-      final latch = latchTable[this.mode]![_EncodingMode.mode_upper]!;
-      tokens = _SimpleToken(tokens, latch & 0xFFFF, latch >> 16);
-      bitCnt += latch >> 16;
-      mode = _EncodingMode.mode_upper;
+    if (this.mode == AztecMaps.aztecModePunct ||
+        this.mode == AztecMaps.aztecModeDigit) {
+      final latchCost = _latchCost(this.mode, AztecMaps.aztecModeUpper);
+      tokens = _SimpleToken(
+          tokens, _latchCode(this.mode, AztecMaps.aztecModeUpper), latchCost);
+      bitCnt += latchCost;
+      mode = AztecMaps.aztecModeUpper;
     }
     var deltaBitCount = 8;
     if (bShiftByteCount == 0 || bShiftByteCount == 31) {
@@ -866,7 +717,7 @@ class _State {
 // Returns true if "this" state is better (or equal) to be in than "that"
 // state under all possible circumstances.
   bool isBetterThanOrEqualTo(_State other) {
-    var mySize = bitCount + (latchTable[mode]![other.mode]! >> 16);
+    var mySize = bitCount + _latchCost(mode, other.mode);
 
     if (other.bShiftByteCount > 0 &&
         (bShiftByteCount == 0 || bShiftByteCount > other.bShiftByteCount)) {
@@ -890,11 +741,44 @@ class _State {
   }
 }
 
-int _bitCount(_EncodingMode em) {
-  if (em == _EncodingMode.mode_digit) {
-    return 4;
+class _CodeSize {
+  const _CodeSize(this.compact, this.layers, this.wordSize, this.totalBits,
+      this.baseMatrixSize, this.matrixSize, this.maxDataWords);
+
+  factory _CodeSize.fromTable(int index) {
+    final s = AztecMaps.aztecSizes[index];
+    return _CodeSize(s[0] == 1, s[1], s[2], s[3], s[4], s[5], s[6]);
   }
-  return 5;
+
+  // A negative number of layers selects a compact symbol
+  factory _CodeSize.fromLayers(int layers) {
+    if (layers < 0 && -layers <= AztecMaps.aztecCompactLayers) {
+      return codeSizes[-layers - 1];
+    }
+    if (layers > 0 && layers <= AztecMaps.aztecFullLayers) {
+      return codeSizes[AztecMaps.aztecCompactLayers + layers - 1];
+    }
+    throw BarcodeException('Illegal value $layers for layers');
+  }
+
+  final bool compact;
+
+  final int layers;
+
+  final int wordSize;
+
+  final int totalBits;
+
+  final int baseMatrixSize;
+
+  final int matrixSize;
+
+  final int maxDataWords;
+
+  int get usableBits => totalBits - (totalBits % wordSize);
+
+  static final codeSizes = List<_CodeSize>.generate(
+      AztecMaps.aztecSizes.length, _CodeSize.fromTable);
 }
 
 class _AztecCode {
@@ -21,7 +21,10 @@ import 'package:meta/meta.dart';
 
 import 'aztec.dart';
 import 'barcode_exception.dart';
+import 'barcode_listener.dart';
 import 'barcode_operations.dart';
+import 'barcode_recipe.dart';
+import 'barcode_svg.dart';
 import 'barcode_types.dart';
 import 'codabar.dart';
 import 'code128.dart';
@@ -50,6 +53,10 @@ abstract class Barcode {
   /// Abstract constructor
   const Barcode();
 
+  /// Receives the duration and count of the stages of all the barcodes
+  /// generated, none by default
+  static BarcodeListener? listener;
+
   /// Create a specific [Barcode] instance based on the [BarcodeType]
   /// this uses only the default barcode settings.
   /// For finer-grained usage, use the static methods:
@@ -117,9 +124,12 @@ abstract class Barcode {
   /// An additional character (denoted '*') is used for both start and stop
   /// delimiters, this can be controlled with the [drawSpacers] parameter.
   ///
+  /// With [fullAscii], all the ASCII characters can be encoded, using two
+  /// symbols for the ones that are not in the specification.
+  ///
   /// <img width="250" alt="CODE 39" src="https://raw.githubusercontent.com/DavBfr/dart_barcode/master/img/code-39.svg?sanitize=true">
-  static Barcode code39({bool drawSpacers = true}) =>
-      BarcodeCode39(drawSpacers);
+  static Barcode code39({bool drawSpacers = true, bool fullAscii = false}) =>
+      BarcodeCode39(drawSpacers, fullAscii);
 
   /// Code 93 [Barcode]
   ///
@@ -131,9 +141,13 @@ abstract class Barcode {
   /// Code 93 is used primarily by Canada Post to encode supplementary
   /// delivery information.
   ///
+  /// With [fullAscii], all the ASCII characters can be encoded, using a
+  /// shift symbol for the ones that are not in the specification.
+  ///
   /// <img width="200" alt="CODE 93" src="https://raw.githubusercontent.com/DavBfr/dart_barcode/master/img/code-93.svg?sanitize=true">
 
-  static Barcode code93() => const BarcodeCode93();
+  static Barcode code93({bool fullAscii = false}) =>
+      fullAscii ? const BarcodeCode93(true) : const BarcodeCode93(false);
 
   /// Code128 [Barcode]
   ///
@@ -393,8 +407,21 @@ abstract class Barcode {
   /// characters without using shift characters for code switching, and using
   /// only two different widths for bars and spaces.
   ///
+  /// With [numeric], the digits are encoded by pairs, halving the width of
+  /// the barcode. The number of digits must be even, "X" can stand for the
+  /// second digit of a pair.
+  ///
+  /// With [switchNumeric], the runs of digits of the ASCII data are encoded
+  /// by pairs, switching to the numeric mode and back with DLE characters.
+  /// It is ignored with [numeric].
+  ///
   /// <img width="200" alt="Telepen" src="https://raw.githubusercontent.com/DavBfr/dart_barcode/master/img/telepen.svg?sanitize=true">
-  static Barcode telepen() => const BarcodeTelepen();
+  static Barcode telepen({bool numeric = false, bool switchNumeric = false}) =>
+      numeric
+          ? const BarcodeTelepen(true)
+          : switchNumeric
+              ? const BarcodeTelepen(false, true)
+              : const BarcodeTelepen();
 
   /// QR Code
   ///
@@ -502,9 +529,12 @@ abstract class Barcode {
       BarcodeAztec(minECCPercent, userSpecifiedLayers);
 
   /// Main method to produce the barcode graphic description.
-  /// Returns a stream of drawing operations required to properly
+  /// Returns the drawing operations required to properly
   /// display the barcode as a UTF-8 string.
   ///
+  /// The whole barcode is encoded before the first operation is returned,
+  /// as [makeRecipe] does: an invalid data throws from this call.
+  ///
   /// Use it with:
   /// ```dart
   /// for (var op in Barcode.code39().make('HELLO', width: 200, height: 300)) {
@@ -539,25 +569,128 @@ abstract class Barcode {
     double? textPadding,
   });
 
-  /// Check if the Barcode is valid
-  @nonVirtual
-  bool isValid(String data) {
-    try {
-      verify(data);
-    } catch (_) {
-      return false;
+  /// Generate the barcode graphic description like [make], with the bars
+  /// stored in typed lists instead of one [BarcodeBar] object each.
+  BarcodeRecipe makeRecipe(
+    String data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      BarcodeRecipe.fromElements(make(
+        data,
+        width: width,
+        height: height,
+        drawText: drawText,
+        fontHeight: fontHeight,
+        textPadding: textPadding,
+      ));
+
+  /// Generate the barcode graphic description like [makeRecipe] but takes
+  /// a Uint8List data.
+  BarcodeRecipe makeRecipeBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      BarcodeRecipe.fromElements(makeBytes(
+        data,
+        width: width,
+        height: height,
+        drawText: drawText,
+        fontHeight: fontHeight,
+        textPadding: textPadding,
+      ));
+
+  /// Generate the barcode graphic description like [make], with the black
+  /// bars grouped by symbol in a single [BarcodeSymbols] operation instead
+  /// of [BarcodeBar] operations. Returns null if the bars can't be drawn
+  /// this way.
+  Iterable<BarcodeElement>? makeSymbols(
+    String data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      makeSymbolsBytes(
+        utf8.encoder.convert(data),
+        width: width,
+        height: height,
+        drawText: drawText,
+        fontHeight: fontHeight,
+        textPadding: textPadding,
+      );
+
+  /// Generate the barcode graphic description like [makeSymbols] but takes
+  /// a Uint8List data.
+  Iterable<BarcodeElement>? makeSymbolsBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      null;
+
+  /// Generate the barcode graphic description like [makeBytes], with all
+  /// the black bars in a single [BarcodePath] instead of [BarcodeBar]
+  /// operations. Returns null if the bars can't be drawn this way.
+  @protected
+  Iterable<BarcodeElement>? makeScaledBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      null;
+
+  /// Start measuring a stage for the [listener], returns null if there
+  /// is none
+  @protected
+  Stopwatch? startStage() => listener == null ? null : (Stopwatch()..start());
+
+  /// Report the [stage] measured by [watch] to the [listener] and measure
+  /// the next stage
+  @protected
+  void endStage(Stopwatch? watch, BarcodeStage stage, int count) {
+    if (watch == null) {
+      return;
     }
 
-    return true;
+    reportStage(stage, watch.elapsed, count);
+    watch.reset();
   }
 
+  /// Report a [stage] measured separately to the [listener], when its
+  /// result is known to be used
+  @protected
+  void reportStage(BarcodeStage stage, Duration elapsed, int count) =>
+      listener?.onStage(this, stage, elapsed, count);
+
+  /// Check if the Barcode is valid
+  @nonVirtual
+  bool isValid(String data) => isValidBytes(utf8.encoder.convert(data));
+
   /// Check if the Barcode is valid
   @nonVirtual
   bool isValidBytes(Uint8List data) {
+    final watch = startStage();
     try {
       verifyBytes(data);
     } catch (_) {
       return false;
+    } finally {
+      endStage(watch, BarcodeStage.verify, data.length);
     }
 
     return true;
@@ -591,6 +724,10 @@ abstract class Barcode {
   }
 
   /// Create an SVG file with this Barcode from String data
+  ///
+  /// If [scaled] is true and the barcode supports it, the bars are drawn
+  /// in module units with a single scale transform, which is faster to
+  /// generate for long barcodes.
   @nonVirtual
   String toSvg(
     String data, {
@@ -605,24 +742,33 @@ abstract class Barcode {
     int color = 0x000000,
     bool fullSvg = true,
     double baseline = .75,
+    bool scaled = false,
   }) {
-    fontHeight ??= height * 0.2;
-    textPadding ??= height * 0.05;
-
-    final recipe = make(
+    final output = StringBuffer();
+    writeSvg(
+      output,
       data,
-      width: width.toDouble(),
-      height: height.toDouble(),
+      x: x,
+      y: y,
+      width: width,
+      height: height,
       drawText: drawText,
+      fontFamily: fontFamily,
       fontHeight: fontHeight,
       textPadding: textPadding,
+      color: color,
+      fullSvg: fullSvg,
+      baseline: baseline,
+      scaled: scaled,
     );
-
-    return _toSvg(recipe, x, y, width, height, fontFamily, fontHeight,
-        textPadding, color, fullSvg, baseline);
+    return output.toString();
   }
 
   /// Create an SVG file with this Barcode from Uint8List data
+  ///
+  /// If [scaled] is true and the barcode supports it, the bars are drawn
+  /// in module units with a single scale transform, which is faster to
+  /// generate for long barcodes.
   @nonVirtual
   String toSvgBytes(
     Uint8List data, {
@@ -637,103 +783,218 @@ abstract class Barcode {
     int color = 0x000000,
     bool fullSvg = true,
     double baseline = .75,
+    bool scaled = false,
   }) {
-    fontHeight ??= height * 0.2;
-    textPadding ??= height * 0.05;
-
-    final recipe = makeBytes(
+    final output = StringBuffer();
+    writeSvgBytes(
+      output,
       data,
-      width: width.toDouble(),
-      height: height.toDouble(),
+      x: x,
+      y: y,
+      width: width,
+      height: height,
       drawText: drawText,
+      fontFamily: fontFamily,
       fontHeight: fontHeight,
       textPadding: textPadding,
+      color: color,
+      fullSvg: fullSvg,
+      baseline: baseline,
+      scaled: scaled,
     );
-
-    return _toSvg(recipe, x, y, width, height, fontFamily, fontHeight,
-        textPadding, color, fullSvg, baseline);
+    return output.toString();
   }
 
-  String _d(double d) {
-    assert(d != double.infinity);
-    return d.toStringAsFixed(5);
-  }
+  /// Write the SVG file of this Barcode from String data into [sink], one
+  /// bar at a time, as [toSvg] returns it
+  ///
+  /// The sink can be an `IOSink`, such as an HTTP response, to send the
+  /// document while it is generated.
+  @nonVirtual
+  void writeSvg(
+    StringSink sink,
+    String data, {
+    double x = 0,
+    double y = 0,
+    double width = 200,
+    double height = 80,
+    bool drawText = true,
+    String fontFamily = 'monospace',
+    double? fontHeight,
+    double? textPadding,
+    int color = 0x000000,
+    bool fullSvg = true,
+    double baseline = .75,
+    bool scaled = false,
+  }) {
+    fontHeight ??= height * 0.2;
+    textPadding ??= height * 0.05;
+
+    Iterable<BarcodeElement>? elements;
+    if (scaled) {
+      elements = makeScaledBytes(
+        utf8.encoder.convert(data),
+        width: width.toDouble(),
+        height: height.toDouble(),
+        drawText: drawText,
+        fontHeight: fontHeight,
+        textPadding: textPadding,
+      );
+    }
 
-  String _s(String s) {
-    const esc = HtmlEscape();
-    return esc.convert(s);
+    // Encode the whole barcode before writing, to leave the sink untouched
+    // if the data is invalid
+    final recipe = elements == null
+        ? makeRecipe(
+            data,
+            width: width.toDouble(),
+            height: height.toDouble(),
+            drawText: drawText,
+            fontHeight: fontHeight,
+            textPadding: textPadding,
+          )
+        : null;
+
+    _writeSvg(sink, recipe, elements ?? const <BarcodeElement>[], x, y,
+        width, height, fontFamily, fontHeight, color, fullSvg, baseline);
   }
 
-  String _c(int c) {
-    return '#${(c & 0xffffff).toRadixString(16).padLeft(6, '0')}';
+  /// Write the SVG file of this Barcode from Uint8List data into [sink],
+  /// one bar at a time, as [toSvgBytes] returns it
+  @nonVirtual
+  void writeSvgBytes(
+    StringSink sink,
+    Uint8List data, {
+    double x = 0,
+    double y = 0,
+    double width = 200,
+    double height = 80,
+    bool drawText = true,
+    String fontFamily = 'monospace',
+    double? fontHeight,
+    double? textPadding,
+    int color = 0x000000,
+    bool fullSvg = true,
+    double baseline = .75,
+    bool scaled = false,
+  }) {
+    fontHeight ??= height * 0.2;
+    textPadding ??= height * 0.05;
+
+    Iterable<BarcodeElement>? elements;
+    if (scaled) {
+      elements = makeScaledBytes(
+        data,
+        width: width.toDouble(),
+        height: height.toDouble(),
+        drawText: drawText,
+        fontHeight: fontHeight,
+        textPadding: textPadding,
+      );
+    }
+
+    final recipe = elements == null
+        ? makeRecipeBytes(
+            data,
+            width: width.toDouble(),
+            height: height.toDouble(),
+            drawText: drawText,
+            fontHeight: fontHeight,
+            textPadding: textPadding,
+          )
+        : null;
+
+    _writeSvg(sink, recipe, elements ?? const <BarcodeElement>[], x, y,
+        width, height, fontFamily, fontHeight, color, fullSvg, baseline);
   }
 
-  String _toSvg(
-    Iterable<BarcodeElement> recipe,
+  /// Write the SVG document of the bars and texts of [recipe], and of the
+  /// drawing operations [elements], iterated once for each kind of element
+  void _writeSvg(
+    StringSink output,
+    BarcodeRecipe? recipe,
+    Iterable<BarcodeElement> elements,
     double x,
     double y,
     double width,
     double height,
     String fontFamily,
     double fontHeight,
-    double textPadding,
     int color,
     bool fullSvg,
     double baseline,
   ) {
-    final path = StringBuffer();
-    final tSpan = StringBuffer();
+    final watch = startStage();
+    final counter = watch == null ? null : _BarcodeCountingSink(output);
+    output = counter ?? output;
 
-    // Draw the barcode
-    for (var elem in recipe) {
-      if (elem is BarcodeBar) {
-        if (elem.black) {
-          path.write('M ${_d(x + elem.left)} ${_d(y + elem.top)} ');
-          path.write('h ${_d(elem.width)} ');
-          path.write('v ${_d(elem.height)} ');
-          path.write('h ${_d(-elem.width)} ');
-          path.write('z ');
-        }
-      } else if (elem is BarcodeText) {
-        final lY = y + elem.top + elem.height * baseline;
-
-        final double lX;
-        String anchor;
-        switch (elem.align) {
-          case BarcodeTextAlign.left:
-            lX = x + elem.left;
-            anchor = 'start';
-            break;
-          case BarcodeTextAlign.center:
-            lX = x + elem.left + elem.width / 2;
-            anchor = 'middle';
-            break;
-          case BarcodeTextAlign.right:
-            lX = x + elem.left + elem.width;
-            anchor = 'end';
-            break;
+    if (fullSvg) {
+      output.write('<svg viewBox="${svgNumber(x)} ${svgNumber(y)} '
+          '${svgNumber(width)} ${svgNumber(height)}" '
+          'xmlns="http://www.w3.org/2000/svg">');
+    }
+
+    // The path of the bars is opened by the first black bar
+    var path = false;
+    void drawBar(double left, double top, double width, double height) {
+      if (!path) {
+        output.write('<path d="');
+        path = true;
+      }
+      output.write('M ${svgNumber(x + left)} ${svgNumber(y + top)} '
+          'h ${svgNumber(width)} v ${svgNumber(height)} '
+          'h ${svgNumber(-width)} z ');
+    }
+
+    var texts = elements;
+    if (recipe != null) {
+      // Draw the bars directly from the typed lists
+      final bounds = recipe.bounds;
+      for (var i = 0; i < recipe.length; i++) {
+        if (recipe.isBlack(i)) {
+          drawBar(bounds[i * 4], bounds[i * 4 + 1], bounds[i * 4 + 2],
+              bounds[i * 4 + 3]);
         }
+      }
+      texts = recipe.texts;
+    }
 
-        tSpan.write(
-            '<tspan style="text-anchor: $anchor" x="${_d(lX)}" y="${_d(lY)}">${_s(elem.text)}</tspan>');
+    // Draw the barcode
+    for (var elem in elements) {
+      if (elem is BarcodeBar && elem.black) {
+        drawBar(elem.left, elem.top, elem.width, elem.height);
       }
     }
 
-    final output = StringBuffer();
-    if (fullSvg) {
-      output.write(
-          '<svg viewBox="${_d(x)} ${_d(y)} ${_d(width)} ${_d(height)}" xmlns="http://www.w3.org/2000/svg">');
+    var scaledPath = false;
+    for (var elem in elements) {
+      if (elem is BarcodePath) {
+        if (path) {
+          output.write('" style="fill: ${svgColor(color)}"/>');
+          path = false;
+        }
+        output.write('<path transform="'
+            'translate(${svgNumber(x + elem.left)} ${svgNumber(y + elem.top)}) '
+            'scale(${svgNumber(elem.width / elem.modules)} '
+            '${svgNumber(elem.height)})" d="${elem.path}" '
+            'style="fill: ${svgColor(color)}"/>');
+        scaledPath = true;
+      }
+    }
+
+    if (path) {
+      output.write('" style="fill: ${svgColor(color)}"/>');
+    } else if (!scaledPath) {
+      output.write('<path d="" style="fill: ${svgColor(color)}"/>');
     }
 
-    output.write('<path d="$path" style="fill: ${_c(color)}"/>');
-    output.write(
-        '<text style="fill: ${_c(color)}; font-family: &quot;${_s(fontFamily)}&quot;; font-size: ${_d(fontHeight)}px" x="${_d(x)}" y="${_d(y)}">$tSpan</text>');
+    writeSvgText(output, texts, x, y, fontFamily, fontHeight, color, baseline);
 
     if (fullSvg) {
       output.write('</svg>');
     }
 
-    return output.toString();
+    endStage(watch, BarcodeStage.svg, counter?.bytes ?? 0);
   }
 
   /// Returns the list of accepted codePoints for this [Barcode]
@@ -750,6 +1011,60 @@ abstract class Barcode {
   /// Returns minimum number of characters this [Barcode] can encode
   int get minLength => 1;
 
+  /// The type and options of this barcode: two barcodes with equal keys
+  /// draw the same data the same way. Used by [BarcodeCache] to share the
+  /// results of separately created barcodes.
+  List<Object?> get cacheKey => <Object?>[runtimeType];
+
   @override
   String toString() => 'Barcode $name';
 }
+
+/// A [StringSink] counting the UTF-8 bytes of the strings written into
+/// another one
+class _BarcodeCountingSink implements StringSink {
+  _BarcodeCountingSink(this._sink);
+
+  final StringSink _sink;
+
+  /// Number of bytes written, once encoded in UTF-8
+  var bytes = 0;
+
+  void _count(int charCode) {
+    if (charCode < 0x80) {
+      bytes += 1;
+    } else if (charCode < 0x800) {
+      bytes += 2;
+    } else if (charCode >= 0xd800 && charCode < 0xe000) {
+      // Each half of a surrogate pair, 4 bytes together
+      bytes += 2;
+    } else {
+      bytes += charCode > 0xffff ? 4 : 3;
+    }
+  }
+
+  @override
+  void write(Object? object) {
+    final string = '$object';
+    for (var i = 0; i < string.length; i++) {
+      _count(string.codeUnitAt(i));
+    }
+    _sink.write(string);
+  }
+
+  @override
+  void writeAll(Iterable<dynamic> objects, [String separator = '']) =>
+      write(objects.join(separator));
+
+  @override
+  void writeCharCode(int charCode) {
+    _count(charCode);
+    _sink.writeCharCode(charCode);
+  }
+
+  @override
+  void writeln([Object? object = '']) {
+    write(object);
+    writeCharCode(0x0a);
+  }
+}
@@ -20,7 +20,11 @@ import 'dart:typed_data';
 import 'package:meta/meta.dart';
 
 import 'barcode.dart';
+import 'barcode_exception.dart';
+import 'barcode_listener.dart';
 import 'barcode_operations.dart';
+import 'barcode_recipe.dart';
+import 'maps/common.dart';
 
 /// One Dimension Barcode generation class
 abstract class Barcode1D extends Barcode {
@@ -38,61 +42,134 @@ abstract class Barcode1D extends Barcode {
     bool drawText = false,
     double? fontHeight,
     double? textPadding,
-  }) sync* {
+  }) =>
+      makeRecipeBytes(
+        data,
+        width: width,
+        height: height,
+        drawText: drawText,
+        fontHeight: fontHeight,
+        textPadding: textPadding,
+      ).elements;
+
+  @override
+  BarcodeRecipe makeRecipe(
+    String data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      makeRecipeBytes(
+        utf8.encoder.convert(data),
+        width: width,
+        height: height,
+        drawText: drawText,
+        fontHeight: fontHeight,
+        textPadding: textPadding,
+      );
+
+  @override
+  BarcodeRecipe makeRecipeBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) {
+    final recipe = BarcodeRecipeBuilder();
+    buildRecipe(
+      recipe,
+      data,
+      width: width,
+      height: height,
+      drawText: drawText,
+      fontHeight: fontHeight,
+      textPadding: textPadding,
+    );
+    return recipe.build();
+  }
+
+  /// Add the bars and texts of the barcode to [recipe], used by
+  /// [makeRecipeBytes] and [makeBytes]
+  @protected
+  void buildRecipe(
+    BarcodeRecipeBuilder recipe,
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) {
     assert(width > 0);
     assert(height > 0);
     assert(!drawText || fontHeight != null);
     fontHeight ??= 0;
     textPadding ??= defaultTextPadding;
 
+    final watch = startStage();
     final text = utf8.decoder.convert(data);
-    final bits = convert(text).toList();
+    final runs = convertRuns(text).toList();
+    final modules = runs.fold<int>(0, (int sum, int run) => sum + run);
+    endStage(watch, BarcodeStage.convert, modules);
 
-    if (bits.isEmpty) {
+    if (modules == 0) {
       return;
     }
 
     final top = marginTop(drawText, width, height, fontHeight, textPadding);
     final left = marginLeft(drawText, width, height, fontHeight, textPadding);
     final right = marginRight(drawText, width, height, fontHeight, textPadding);
-    final lineWidth = (width - left - right) / bits.length;
+    final lineWidth = (width - left - right) / modules;
+    final bars = recipe.length;
 
-    var color = bits.first;
-    var count = 1;
+    // Merge the consecutive runs of the same color into one bar
+    var color = true;
+    var black = true;
+    var index = 0;
+    var count = 0;
 
-    for (var i = 1; i < bits.length; i++) {
-      if (color == bits[i]) {
-        count++;
-        continue;
-      }
+    for (final run in runs) {
+      if (run > 0) {
+        if (black != color) {
+          if (count > 0) {
+            recipe.addBar(
+              left + index * lineWidth,
+              top,
+              count * lineWidth,
+              getHeight(
+                index,
+                count,
+                width,
+                height - top,
+                fontHeight,
+                textPadding,
+                drawText,
+              ),
+              black,
+            );
+          }
 
-      yield BarcodeBar(
-        left: left + (i - count) * lineWidth,
-        top: top,
-        width: count * lineWidth,
-        height: getHeight(
-          i - count,
-          count,
-          width,
-          height - top,
-          fontHeight,
-          textPadding,
-          drawText,
-        ),
-        black: color,
-      );
+          index += count;
+          count = 0;
+          black = color;
+        }
+
+        count += run;
+      }
 
-      color = bits[i];
-      count = 1;
+      color = !color;
     }
 
-    final l = bits.length;
-    yield BarcodeBar(
-      left: left + (l - count) * lineWidth,
-      top: top,
-      width: count * lineWidth,
-      height: getHeight(
-        l - count,
+    recipe.addBar(
+      left + index * lineWidth,
+      top,
+      count * lineWidth,
+      getHeight(
+        index,
         count,
         width,
         height - top,
@@ -100,14 +177,183 @@ abstract class Barcode1D extends Barcode {
         textPadding,
         drawText,
       ),
-      black: color,
+      black,
     );
+    endStage(watch, BarcodeStage.bars, recipe.length - bars);
 
     if (drawText) {
-      yield* makeText(text, width, height, fontHeight, textPadding, lineWidth);
+      final texts =
+          makeText(text, width, height, fontHeight, textPadding, lineWidth)
+              .toList();
+      recipe.addAll(texts);
+      endStage(watch, BarcodeStage.text, texts.length);
     }
   }
 
+  @override
+  Iterable<BarcodeElement>? makeScaledBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      _makeScaled(data, width, height, drawText, fontHeight, textPadding,
+          bySymbol: false);
+
+  @override
+  Iterable<BarcodeElement>? makeSymbolsBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      _makeScaled(data, width, height, drawText, fontHeight, textPadding,
+          bySymbol: true);
+
+  /// Draw the black bars in module units, as a [BarcodeSymbols] with one
+  /// path for each group of runs of [convertSymbols] if [bySymbol] is true,
+  /// or as a single [BarcodePath]. Returns null if the bars don't all have
+  /// the same height.
+  Iterable<BarcodeElement>? _makeScaled(
+    Uint8List data,
+    double width,
+    double height,
+    bool drawText,
+    double? fontHeight,
+    double? textPadding, {
+    required bool bySymbol,
+  }) {
+    assert(width > 0);
+    assert(height > 0);
+    assert(!drawText || fontHeight != null);
+    fontHeight ??= 0;
+    textPadding ??= defaultTextPadding;
+
+    // The stages are reported once the bars are known to be scaled, the
+    // caller converting the data again otherwise
+    final watch = startStage();
+    final text = utf8.decoder.convert(data);
+    final groups = bySymbol
+        ? convertSymbols(text).toList()
+        : [convertRuns(text).toList()];
+    final converted = watch?.elapsed;
+    watch?.reset();
+
+    // Start and end module of each black bar of each group, merging the
+    // consecutive runs of the same color inside the group
+    final groupBars = <List<int>>[];
+    final offsets = <int>[];
+    var modules = 0;
+    var barCount = 0;
+    for (final runs in groups) {
+      final bars = <int>[];
+      var black = true;
+      var module = 0;
+      for (final run in runs) {
+        if (black && run > 0) {
+          if (bars.isNotEmpty && bars.last == module) {
+            bars.last += run;
+          } else {
+            bars
+              ..add(module)
+              ..add(module + run);
+          }
+        }
+        module += run;
+        black = !black;
+      }
+      groupBars.add(bars);
+      offsets.add(modules);
+      modules += module;
+      barCount += bars.length ~/ 2;
+    }
+
+    if (modules == 0) {
+      if (converted != null) {
+        reportStage(BarcodeStage.convert, converted, 0);
+      }
+      return const <BarcodeElement>[];
+    }
+
+    final top = marginTop(drawText, width, height, fontHeight, textPadding);
+    final left = marginLeft(drawText, width, height, fontHeight, textPadding);
+    final right = marginRight(drawText, width, height, fontHeight, textPadding);
+    final lineWidth = (width - left - right) / modules;
+
+    // All the bars must have the same height to be scaled together
+    double? barHeight;
+    final paths = <String>[];
+    for (var g = 0; g < groupBars.length; g++) {
+      final bars = groupBars[g];
+      final path = StringBuffer();
+      for (var i = 0; i < bars.length; i += 2) {
+        final count = bars[i + 1] - bars[i];
+        final h = getHeight(offsets[g] + bars[i], count, width, height - top,
+            fontHeight, textPadding, drawText);
+        barHeight ??= h;
+        if (h != barHeight) {
+          return null;
+        }
+        path
+          ..write('M')
+          ..write(bars[i])
+          ..write(' 0')
+          ..write(_scaledBar(count));
+      }
+      paths.add(path.toString());
+    }
+    if (converted != null) {
+      reportStage(BarcodeStage.convert, converted, modules);
+    }
+    endStage(watch, BarcodeStage.bars, barCount);
+
+    final texts = drawText
+        ? makeText(text, width, height, fontHeight, textPadding, lineWidth)
+            .toList()
+        : const <BarcodeElement>[];
+    if (drawText) {
+      endStage(watch, BarcodeStage.text, texts.length);
+    }
+
+    return <BarcodeElement>[
+      if (bySymbol)
+        BarcodeSymbols(
+          left: left,
+          top: top,
+          width: modules * lineWidth,
+          height: barHeight ?? 0,
+          modules: modules,
+          paths: paths,
+          offsets: offsets,
+        )
+      else
+        BarcodePath(
+          left: left,
+          top: top,
+          width: modules * lineWidth,
+          height: barHeight ?? 0,
+          modules: modules,
+          path: paths.single,
+        ),
+      ...texts,
+    ];
+  }
+
+  /// Path fragments of a one unit high bar, indexed by width
+  static final _scaledBars = <String>[];
+
+  static String _scaledBar(int width) {
+    while (_scaledBars.length <= width) {
+      final w = _scaledBars.length;
+      _scaledBars.add('h${w}v1h-${w}z');
+    }
+    return _scaledBars[width];
+  }
+
   /// Get the bar height for a specific index
   @protected
   double getHeight(
@@ -185,6 +431,54 @@ abstract class Barcode1D extends Barcode {
     }
   }
 
+  /// Build a stream of [bool] that represents a white or black bar
+  /// from a list of bar widths, as returned by [convertRuns]
+  @protected
+  Iterable<bool> expandRuns(Iterable<int> runs) sync* {
+    var color = true;
+    for (final run in runs) {
+      for (var i = 0; i < run; i++) {
+        yield color;
+      }
+      color = !color;
+    }
+  }
+
+  /// Get the value of a [code] unit from a generated dense [table].
+  /// Throws a [BarcodeException] if the character can't be encoded
+  @protected
+  int lookup(List<int> table, int code) {
+    final value = code < table.length ? table[code] : CommonMaps.noCode;
+    if (value == CommonMaps.noCode) {
+      throw BarcodeException(
+          'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
+    }
+    return value;
+  }
+
+  /// Get the bar widths of a [code] unit from a generated dense [table]
+  /// of run lengths.
+  /// Throws a [BarcodeException] if the character can't be encoded
+  @protected
+  List<int> lookupRuns(List<List<int>> table, int code) {
+    if (code >= table.length || table[code].isEmpty) {
+      throw BarcodeException(
+          'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
+    }
+    return table[code];
+  }
+
+  /// Returns the code units that can be encoded with a generated dense
+  /// [table]
+  @protected
+  Iterable<int> tableCharSet(List<int> table) sync* {
+    for (var code = 0; code < table.length; code++) {
+      if (table[code] != CommonMaps.noCode) {
+        yield code;
+      }
+    }
+  }
+
   /// Computes a hexadecimal representation of the barcode, mostly for
   /// testing purposes
   @visibleForTesting
@@ -223,4 +517,39 @@ abstract class Barcode1D extends Barcode {
   /// which represents the presence or absence of a bar
   @protected
   Iterable<bool> convert(String data);
+
+  /// Barcode computation method used by [makeBytes], returns a stream of
+  /// bar widths in modules, alternating black and white, and starting with
+  /// a black bar. A zero width continues the previous bar of the same color.
+  ///
+  /// The default implementation counts the bars returned by [convert],
+  /// override it to build the bars from the generated run-length tables,
+  /// and use [expandRuns] to implement [convert].
+  @protected
+  Iterable<int> convertRuns(String data) sync* {
+    var color = true;
+    var count = 0;
+
+    for (final bit in convert(data)) {
+      if (bit != color) {
+        yield count;
+        color = bit;
+        count = 0;
+      }
+      count++;
+    }
+
+    yield count;
+  }
+
+  /// The bar widths of [convertRuns] split into the symbols of the
+  /// generated tables, each one starting with a black bar and, except the
+  /// last one, ending with a white space.
+  ///
+  /// The default implementation returns a single symbol, override it with
+  /// [convertRuns] to let the identical symbols share their drawing.
+  @protected
+  Iterable<List<int>> convertSymbols(String data) sync* {
+    yield convertRuns(data).toList();
+  }
 }
@@ -14,13 +14,16 @@
  * limitations under the License.
  */
 
+import 'dart:convert';
 import 'dart:typed_data';
 
 import 'package:meta/meta.dart';
 
 import 'barcode.dart';
 import 'barcode_exception.dart';
+import 'barcode_listener.dart';
 import 'barcode_operations.dart';
+import 'barcode_recipe.dart';
 
 /// Matrix representing the raw code pixels
 class Barcode2DMatrix {
@@ -70,11 +73,49 @@ abstract class Barcode2D extends Barcode {
     bool drawText = false,
     double? fontHeight,
     double? textPadding,
-  }) sync* {
+  }) =>
+      makeRecipeBytes(
+        data,
+        width: width,
+        height: height,
+        drawText: drawText,
+        fontHeight: fontHeight,
+        textPadding: textPadding,
+      ).elements;
+
+  @override
+  BarcodeRecipe makeRecipe(
+    String data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      makeRecipeBytes(
+        utf8.encoder.convert(data),
+        width: width,
+        height: height,
+        drawText: drawText,
+        fontHeight: fontHeight,
+        textPadding: textPadding,
+      );
+
+  @override
+  BarcodeRecipe makeRecipeBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) {
     assert(width > 0);
     assert(height > 0);
 
+    final watch = startStage();
     final matrix = convert(data);
+    endStage(watch, BarcodeStage.convert, matrix.width * matrix.height);
 
     // Center the barcode
     final mh = matrix.height * matrix.ratio;
@@ -93,6 +134,7 @@ abstract class Barcode2D extends Barcode {
     final offsetX = (width - w) / 2;
     final offsetY = (height - h) / 2;
 
+    final recipe = BarcodeRecipeBuilder();
     var start = 0;
     bool? color;
     var x = 0;
@@ -102,12 +144,12 @@ abstract class Barcode2D extends Barcode {
       color ??= pixel;
 
       if (pixel != color) {
-        yield BarcodeBar(
-          left: offsetX + start * pixelW,
-          top: offsetY + y * pixelH,
-          width: (x - start) * pixelW,
-          height: pixelH,
-          black: color,
+        recipe.addBar(
+          offsetX + start * pixelW,
+          offsetY + y * pixelH,
+          (x - start) * pixelW,
+          pixelH,
+          color,
         );
 
         color = pixel;
@@ -116,12 +158,12 @@ abstract class Barcode2D extends Barcode {
 
       x++;
       if (x >= matrix.width) {
-        yield BarcodeBar(
-          left: offsetX + start * pixelW,
-          top: offsetY + y * pixelH,
-          width: (matrix.width - start) * pixelW,
-          height: pixelH,
-          black: color,
+        recipe.addBar(
+          offsetX + start * pixelW,
+          offsetY + y * pixelH,
+          (matrix.width - start) * pixelW,
+          pixelH,
+          color,
         );
         color = null;
         start = 0;
@@ -129,6 +171,9 @@ abstract class Barcode2D extends Barcode {
         y++;
       }
     }
+    endStage(watch, BarcodeStage.bars, recipe.length);
+
+    return recipe.build();
   }
 
   @override
@@ -0,0 +1,341 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'dart:collection';
+import 'dart:typed_data';
+
+import 'barcode.dart';
+import 'barcode_operations.dart';
+
+/// Estimated memory used by a drawing operation, in bytes
+const _elementSize = 64;
+
+/// The arguments of a cached call
+class _BarcodeCacheKey {
+  _BarcodeCacheKey(Barcode barcode, String payload, List<Object?> arguments)
+      : this._(payload, [...barcode.cacheKey, ...arguments]);
+
+  _BarcodeCacheKey._(this.payload, this.arguments)
+      : hashCode = _hash(payload, arguments);
+
+  /// The data, with the method used
+  final String payload;
+
+  /// The type and options of the barcode, then the other arguments of the
+  /// method
+  final List<Object?> arguments;
+
+  @override
+  final int hashCode;
+
+  static int _hash(String payload, List<Object?> arguments) {
+    var hash = payload.hashCode;
+    for (final argument in arguments) {
+      hash = (hash * 31 + argument.hashCode) & 0x3fffffff;
+    }
+    return hash;
+  }
+
+  @override
+  bool operator ==(Object other) {
+    if (other is! _BarcodeCacheKey ||
+        payload != other.payload ||
+        arguments.length != other.arguments.length) {
+      return false;
+    }
+
+    for (var i = 0; i < arguments.length; i++) {
+      if (arguments[i] != other.arguments[i]) {
+        return false;
+      }
+    }
+
+    return true;
+  }
+}
+
+/// A cached value, with its estimated size in bytes
+class _BarcodeCacheEntry {
+  const _BarcodeCacheEntry(this.value, this.size);
+
+  final Object value;
+
+  final int size;
+}
+
+/// A least recently used cache of the drawing operations and SVG documents
+/// of barcodes.
+///
+/// The calls are the same as the [Barcode] methods, with the barcode as
+/// first argument. The results are kept for each symbology and its options,
+/// as [Barcode.cacheKey], data and geometry: two barcodes created by the
+/// same factory share their results. The least recently used results are
+/// evicted when the cache holds more than [maxEntries] results or [maxSize]
+/// bytes.
+///
+/// ```dart
+/// final cache = BarcodeCache();
+/// final bc = Barcode.code128();
+/// final svg = cache.toSvg(bc, 'SKU-1234');
+/// ```
+class BarcodeCache {
+  /// Create a cache of at most [maxEntries] results using about [maxSize]
+  /// bytes
+  BarcodeCache({
+    this.maxEntries = 1000,
+    this.maxSize = 16 * 1024 * 1024,
+  })  : assert(maxEntries > 0),
+        assert(maxSize > 0);
+
+  /// Maximum number of results kept
+  final int maxEntries;
+
+  /// Maximum estimated size of the results kept, in bytes
+  final int maxSize;
+
+  final _entries = LinkedHashMap<_BarcodeCacheKey, _BarcodeCacheEntry>();
+
+  var _size = 0;
+
+  var _hits = 0;
+
+  var _misses = 0;
+
+  var _evictions = 0;
+
+  /// Number of results found in the cache
+  int get hits => _hits;
+
+  /// Number of results computed and added to the cache
+  int get misses => _misses;
+
+  /// Number of results evicted to stay under [maxEntries] and [maxSize]
+  int get evictions => _evictions;
+
+  /// Number of results in the cache
+  int get length => _entries.length;
+
+  /// Estimated size of the results in the cache, in bytes
+  int get size => _size;
+
+  /// Remove all the results, the counters are kept
+  void clear() {
+    _entries.clear();
+    _size = 0;
+  }
+
+  /// Reset the hit, miss and eviction counters
+  void resetStatistics() {
+    _hits = 0;
+    _misses = 0;
+    _evictions = 0;
+  }
+
+  T _get<T extends Object>(
+    _BarcodeCacheKey key,
+    T Function() compute,
+    int Function(T value) sizeOf,
+  ) {
+    final entry = _entries.remove(key);
+    if (entry != null) {
+      // Move the result to the most recently used end
+      _entries[key] = entry;
+      _hits++;
+      return entry.value as T;
+    }
+
+    final value = compute();
+    _misses++;
+
+    final size = sizeOf(value);
+    if (size > maxSize) {
+      return value;
+    }
+
+    _entries[key] = _BarcodeCacheEntry(value, size);
+    _size += size;
+
+    while (_entries.length > maxEntries || _size > maxSize) {
+      final oldest = _entries.keys.first;
+      _size -= _entries.remove(oldest)!.size;
+      _evictions++;
+    }
+
+    return value;
+  }
+
+  static int _elementsSize(List<BarcodeElement> elements) {
+    var size = elements.length * _elementSize;
+    for (final element in elements) {
+      if (element is BarcodeText) {
+        size += element.text.length * 2;
+      } else if (element is BarcodePath) {
+        size += element.path.length * 2;
+      }
+    }
+    return size;
+  }
+
+  static int _stringSize(String value) => value.length * 2;
+
+  /// The drawing operations of [Barcode.make], as an unmodifiable list
+  List<BarcodeElement> make(
+    Barcode barcode,
+    String data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      _get(
+        _BarcodeCacheKey(barcode, 'make:$data',
+            [width, height, drawText, fontHeight, textPadding]),
+        () => List<BarcodeElement>.unmodifiable(barcode.make(
+          data,
+          width: width,
+          height: height,
+          drawText: drawText,
+          fontHeight: fontHeight,
+          textPadding: textPadding,
+        )),
+        _elementsSize,
+      );
+
+  /// The drawing operations of [Barcode.makeBytes], as an unmodifiable list
+  List<BarcodeElement> makeBytes(
+    Barcode barcode,
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      _get(
+        _BarcodeCacheKey(barcode, 'bytes:${String.fromCharCodes(data)}',
+            [width, height, drawText, fontHeight, textPadding]),
+        () => List<BarcodeElement>.unmodifiable(barcode.makeBytes(
+          data,
+          width: width,
+          height: height,
+          drawText: drawText,
+          fontHeight: fontHeight,
+          textPadding: textPadding,
+        )),
+        _elementsSize,
+      );
+
+  /// The SVG document of [Barcode.toSvg]
+  String toSvg(
+    Barcode barcode,
+    String data, {
+    double x = 0,
+    double y = 0,
+    double width = 200,
+    double height = 80,
+    bool drawText = true,
+    String fontFamily = 'monospace',
+    double? fontHeight,
+    double? textPadding,
+    int color = 0x000000,
+    bool fullSvg = true,
+    double baseline = .75,
+    bool scaled = false,
+  }) =>
+      _get(
+        _BarcodeCacheKey(barcode, 'svg:$data', [
+          x,
+          y,
+          width,
+          height,
+          drawText,
+          fontFamily,
+          fontHeight,
+          textPadding,
+          color,
+          fullSvg,
+          baseline,
+          scaled,
+        ]),
+        () => barcode.toSvg(
+          data,
+          x: x,
+          y: y,
+          width: width,
+          height: height,
+          drawText: drawText,
+          fontFamily: fontFamily,
+          fontHeight: fontHeight,
+          textPadding: textPadding,
+          color: color,
+          fullSvg: fullSvg,
+          baseline: baseline,
+          scaled: scaled,
+        ),
+        _stringSize,
+      );
+
+  /// The SVG document of [Barcode.toSvgBytes]
+  String toSvgBytes(
+    Barcode barcode,
+    Uint8List data, {
+    double x = 0,
+    double y = 0,
+    double width = 200,
+    double height = 80,
+    bool drawText = true,
+    String fontFamily = 'monospace',
+    double? fontHeight,
+    double? textPadding,
+    int color = 0x000000,
+    bool fullSvg = true,
+    double baseline = .75,
+    bool scaled = false,
+  }) =>
+      _get(
+        _BarcodeCacheKey(barcode, 'svgBytes:${String.fromCharCodes(data)}', [
+          x,
+          y,
+          width,
+          height,
+          drawText,
+          fontFamily,
+          fontHeight,
+          textPadding,
+          color,
+          fullSvg,
+          baseline,
+          scaled,
+        ]),
+        () => barcode.toSvgBytes(
+          data,
+          x: x,
+          y: y,
+          width: width,
+          height: height,
+          drawText: drawText,
+          fontFamily: fontFamily,
+          fontHeight: fontHeight,
+          textPadding: textPadding,
+          color: color,
+          fullSvg: fullSvg,
+          baseline: baseline,
+          scaled: scaled,
+        ),
+        _stringSize,
+      );
+}
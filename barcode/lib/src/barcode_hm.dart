@@ -20,7 +20,9 @@ import 'dart:typed_data';
 import 'package:meta/meta.dart';
 
 import 'barcode_1d.dart';
+import 'barcode_listener.dart';
 import 'barcode_operations.dart';
+import 'barcode_recipe.dart';
 
 /// The bar modulation type
 enum BarcodeHMBar {
@@ -45,22 +47,50 @@ abstract class BarcodeHM extends Barcode1D {
   final double _tracker;
 
   @override
-  Iterable<BarcodeElement> makeBytes(
+  List<Object?> get cacheKey => [...super.cacheKey, _tracker];
+
+  @override
+  Iterable<BarcodeElement>? makeScaledBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      null;
+
+  @override
+  Iterable<BarcodeElement>? makeSymbolsBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) =>
+      null;
+
+  @override
+  void buildRecipe(
+    BarcodeRecipeBuilder recipe,
     Uint8List data, {
     required double width,
     required double height,
     bool drawText = false,
     double? fontHeight,
     double? textPadding,
-  }) sync* {
+  }) {
     assert(width > 0);
     assert(height > 0);
     assert(!drawText || fontHeight != null);
     fontHeight ??= 0;
     textPadding ??= Barcode1D.defaultTextPadding;
 
+    final watch = startStage();
     final text = utf8.decoder.convert(data);
     final bars = convertHM(text).toList();
+    endStage(watch, BarcodeStage.convert, bars.length * 2 - 1);
 
     if (bars.isEmpty) {
       return;
@@ -96,48 +126,53 @@ abstract class BarcodeHM extends Barcode1D {
     for (final bar in bars) {
       switch (bar) {
         case BarcodeHMBar.tracker:
-          yield BarcodeBar(
-            left: left + (index * 2) * lineWidth,
-            top: top + barHeight / 2 - tracker / 2,
-            width: lineWidth,
-            height: tracker,
-            black: true,
+          recipe.addBar(
+            left + (index * 2) * lineWidth,
+            top + barHeight / 2 - tracker / 2,
+            lineWidth,
+            tracker,
+            true,
           );
           break;
         case BarcodeHMBar.ascender:
-          yield BarcodeBar(
-            left: left + (index * 2) * lineWidth,
-            top: top,
-            width: lineWidth,
-            height: barHeight / 2 + tracker / 2,
-            black: true,
+          recipe.addBar(
+            left + (index * 2) * lineWidth,
+            top,
+            lineWidth,
+            barHeight / 2 + tracker / 2,
+            true,
           );
           break;
         case BarcodeHMBar.descender:
-          yield BarcodeBar(
-            left: left + (index * 2) * lineWidth,
-            top: top + barHeight / 2 - tracker / 2,
-            width: lineWidth,
-            height: barHeight / 2 + tracker / 2,
-            black: true,
+          recipe.addBar(
+            left + (index * 2) * lineWidth,
+            top + barHeight / 2 - tracker / 2,
+            lineWidth,
+            barHeight / 2 + tracker / 2,
+            true,
           );
           break;
         case BarcodeHMBar.full:
-          yield BarcodeBar(
-            left: left + (index * 2) * lineWidth,
-            top: top,
-            width: lineWidth,
-            height: barHeight,
-            black: true,
+          recipe.addBar(
+            left + (index * 2) * lineWidth,
+            top,
+            lineWidth,
+            barHeight,
+            true,
           );
           break;
       }
 
       index++;
     }
+    endStage(watch, BarcodeStage.bars, bars.length);
 
     if (drawText) {
-      yield* makeText(text, width, height, fontHeight, textPadding, lineWidth);
+      final texts =
+          makeText(text, width, height, fontHeight, textPadding, lineWidth)
+              .toList();
+      recipe.addAll(texts);
+      endStage(watch, BarcodeStage.text, texts.length);
     }
   }
 
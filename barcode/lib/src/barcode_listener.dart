@@ -0,0 +1,124 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'barcode.dart';
+
+/// The stages of the generation of a barcode reported to a
+/// [BarcodeListener], with the meaning of their count
+enum BarcodeStage {
+  /// Check of the data by [Barcode.isValid], counts the bytes of the data
+  verify,
+
+  /// Encoding of the data into bar widths or a matrix, counts the modules.
+  /// The data is checked during this stage.
+  convert,
+
+  /// Merge of the modules into bars, counts the bars
+  bars,
+
+  /// Layout of the texts, counts the texts
+  text,
+
+  /// Serialization of the SVG document, counts its bytes encoded in UTF-8
+  svg,
+}
+
+/// Receives the duration and count of each stage of the barcodes
+/// generated while it is set as [Barcode.listener].
+///
+/// ```dart
+/// Barcode.listener = BarcodeStatistics();
+/// ```
+abstract class BarcodeListener {
+  /// Abstract constructor
+  const BarcodeListener();
+
+  /// Called when [barcode] completed [stage] in [elapsed], with [count]
+  /// units as described by [BarcodeStage]
+  void onStage(
+    Barcode barcode,
+    BarcodeStage stage,
+    Duration elapsed,
+    int count,
+  );
+}
+
+/// The totals of a stage for a symbology
+class BarcodeStageStatistics {
+  /// Number of times the stage was completed
+  int calls = 0;
+
+  /// Total duration of the stage
+  Duration elapsed = Duration.zero;
+
+  /// Total count of the stage
+  int count = 0;
+
+  /// Largest count of one call, to spot the pathological data
+  int maxCount = 0;
+
+  @override
+  String toString() =>
+      '$calls calls ${elapsed.inMicroseconds}us count $count max $maxCount';
+}
+
+/// A [BarcodeListener] adding up the stages of each symbology
+class BarcodeStatistics extends BarcodeListener {
+  final _stages = <String, Map<BarcodeStage, BarcodeStageStatistics>>{};
+
+  /// The names of the symbologies reported, as [Barcode.name]
+  Iterable<String> get names => _stages.keys;
+
+  /// The totals of [stage] for the symbology [name], or null if it was
+  /// never reported
+  BarcodeStageStatistics? stage(String name, BarcodeStage stage) =>
+      _stages[name]?[stage];
+
+  @override
+  void onStage(
+    Barcode barcode,
+    BarcodeStage stage,
+    Duration elapsed,
+    int count,
+  ) {
+    final statistics = _stages
+        .putIfAbsent(barcode.name, () => {})
+        .putIfAbsent(stage, () => BarcodeStageStatistics());
+
+    statistics
+      ..calls += 1
+      ..elapsed += elapsed
+      ..count += count;
+    if (count > statistics.maxCount) {
+      statistics.maxCount = count;
+    }
+  }
+
+  /// Remove all the totals
+  void clear() => _stages.clear();
+
+  @override
+  String toString() {
+    final output = StringBuffer();
+    _stages.forEach((name, stages) {
+      stages.forEach((stage, statistics) {
+        final label = stage.toString().split('.').last;
+        output.writeln('$name $label $statistics');
+      });
+    });
+    return output.toString();
+  }
+}
@@ -70,6 +70,71 @@ class BarcodeBar extends BarcodeElement {
       '$runtimeType [${black ? 'X' : ' '}] $left $top $width $height';
 }
 
+/// Path drawing operation, the black bars of a barcode drawn in module
+/// units and scaled to the rectangle of this element
+class BarcodePath extends BarcodeElement {
+  /// Create a path drawing operation from an SVG [path] where each bar
+  /// is one unit high, and [modules] units wide in total
+  const BarcodePath({
+    required double left,
+    required double top,
+    required double width,
+    required double height,
+    required this.modules,
+    required this.path,
+  }) : super(
+          left: left,
+          top: top,
+          width: width,
+          height: height,
+        );
+
+  /// Number of modules drawn horizontally
+  final int modules;
+
+  /// SVG path data of the black bars
+  final String path;
+
+  @override
+  String toString() => '$runtimeType $modules $left $top $width $height';
+}
+
+/// Symbols drawing operation, the black bars of a barcode drawn in module
+/// units like [BarcodePath], grouped by symbol so that the identical
+/// symbols can share their path
+class BarcodeSymbols extends BarcodeElement {
+  /// Create a symbols drawing operation from the SVG [paths] of the
+  /// symbols, each starting at its module in [offsets]
+  const BarcodeSymbols({
+    required double left,
+    required double top,
+    required double width,
+    required double height,
+    required this.modules,
+    required this.paths,
+    required this.offsets,
+  }) : super(
+          left: left,
+          top: top,
+          width: width,
+          height: height,
+        );
+
+  /// Number of modules drawn horizontally
+  final int modules;
+
+  /// SVG path data of the black bars of each symbol, one unit high, from
+  /// the first module of the symbol
+  final List<String> paths;
+
+  /// First module of each symbol
+  final List<int> offsets;
+
+  @override
+  String toString() =>
+      '$runtimeType ${paths.length} $modules $left $top $width $height';
+}
+
 /// Text alignement inside the [BarcodeText] zone
 enum BarcodeTextAlign {
   /// Align on the middle left
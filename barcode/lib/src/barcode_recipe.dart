@@ -0,0 +1,147 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'dart:typed_data';
+
+import 'barcode_operations.dart';
+
+/// The drawing operations of a barcode stored in typed lists instead of
+/// one [BarcodeBar] object per bar.
+///
+/// The bars are drawn first, then the [texts]:
+/// ```dart
+/// final recipe =
+///     Barcode.qrCode().makeRecipe('HELLO', width: 200, height: 200);
+/// for (var i = 0; i < recipe.length; i++) {
+///   if (recipe.isBlack(i)) {
+///     drawRect(recipe.left(i), recipe.top(i), recipe.width(i),
+///         recipe.height(i));
+///   }
+/// }
+/// ```
+class BarcodeRecipe {
+  /// Create a recipe from the bounds and colors of its bars
+  const BarcodeRecipe(this.bounds, this.colors, this.texts);
+
+  /// Create a recipe from drawing operations
+  factory BarcodeRecipe.fromElements(Iterable<BarcodeElement> elements) {
+    final recipe = BarcodeRecipeBuilder()..addAll(elements);
+    return recipe.build();
+  }
+
+  /// The left, top, width and height of each bar
+  final Float64List bounds;
+
+  /// The color of each bar, 1 for black and 0 for white
+  final Uint8List colors;
+
+  /// The texts to draw over the bars
+  final List<BarcodeText> texts;
+
+  /// Number of bars
+  int get length => colors.length;
+
+  /// Left position of the bar [index]
+  double left(int index) => bounds[index * 4];
+
+  /// Top position of the bar [index]
+  double top(int index) => bounds[index * 4 + 1];
+
+  /// Width of the bar [index]
+  double width(int index) => bounds[index * 4 + 2];
+
+  /// Height of the bar [index]
+  double height(int index) => bounds[index * 4 + 3];
+
+  /// Color of the bar [index]
+  bool isBlack(int index) => colors[index] != 0;
+
+  /// The bars and texts as drawing operations, created on demand
+  Iterable<BarcodeElement> get elements sync* {
+    for (var i = 0; i < length; i++) {
+      yield BarcodeBar(
+        left: left(i),
+        top: top(i),
+        width: width(i),
+        height: height(i),
+        black: isBlack(i),
+      );
+    }
+
+    yield* texts;
+  }
+}
+
+/// Build a [BarcodeRecipe] one bar at a time
+class BarcodeRecipeBuilder {
+  var _bounds = Float64List(64);
+
+  var _colors = Uint8List(16);
+
+  var _length = 0;
+
+  final _texts = <BarcodeText>[];
+
+  /// Number of bars added
+  int get length => _length;
+
+  /// Add a bar
+  void addBar(
+    double left,
+    double top,
+    double width,
+    double height,
+    bool black,
+  ) {
+    if (_length == _colors.length) {
+      _bounds = Float64List(_bounds.length * 2)..setAll(0, _bounds);
+      _colors = Uint8List(_colors.length * 2)..setAll(0, _colors);
+    }
+
+    final offset = _length * 4;
+    _bounds[offset] = left;
+    _bounds[offset + 1] = top;
+    _bounds[offset + 2] = width;
+    _bounds[offset + 3] = height;
+    _colors[_length++] = black ? 1 : 0;
+  }
+
+  /// Add a text
+  void addText(BarcodeText text) => _texts.add(text);
+
+  /// Add drawing operations, only the bars and texts are supported
+  void addAll(Iterable<BarcodeElement> elements) {
+    for (final element in elements) {
+      if (element is BarcodeBar) {
+        addBar(element.left, element.top, element.width, element.height,
+            element.black);
+      } else if (element is BarcodeText) {
+        addText(element);
+      } else {
+        throw ArgumentError.value(
+            element, 'elements', 'Unsupported drawing operation');
+      }
+    }
+  }
+
+  /// The recipe of the bars and texts added, sharing the lists of the
+  /// builder: no bar can be added after this call
+  BarcodeRecipe build() => BarcodeRecipe(
+        Float64List.sublistView(_bounds, 0, _length * 4),
+        Uint8List.sublistView(_colors, 0, _length),
+        List<BarcodeText>.unmodifiable(_texts),
+      );
+}
@@ -0,0 +1,266 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'dart:typed_data';
+
+import 'barcode.dart';
+import 'barcode_operations.dart';
+import 'barcode_svg.dart';
+
+/// A label of a sheet: the drawing operations of a barcode that can be
+/// drawn by symbols, or its SVG fragment
+class _BarcodeSheetLabel {
+  const _BarcodeSheetLabel(this.x, this.y, this.elements, this.svg);
+
+  final double x;
+
+  final double y;
+
+  final Iterable<BarcodeElement>? elements;
+
+  final String? svg;
+}
+
+/// A sheet of barcode labels laid out on a grid, written as a single SVG
+/// document.
+///
+/// The symbols of the linear barcodes that come from the generated tables
+/// are defined once in the `<defs>` of the document and placed with `<use>`
+/// references, each label having its own text. The other barcodes are
+/// drawn as [Barcode.toSvg] does.
+///
+/// ```dart
+/// final sheet = BarcodeSheet(columns: 5, labelWidth: 200, labelHeight: 80);
+/// for (final tag in tags) {
+///   sheet.add(Barcode.code128(), tag);
+/// }
+/// final svg = sheet.toSvg();
+/// ```
+class BarcodeSheet {
+  /// Create an empty sheet of labels of [labelWidth] by [labelHeight],
+  /// [columns] per row
+  BarcodeSheet({
+    this.columns = 1,
+    this.labelWidth = 200,
+    this.labelHeight = 80,
+    this.margin = 0,
+    this.spacing = 0,
+    this.drawText = true,
+    this.fontFamily = 'monospace',
+    double? fontHeight,
+    double? textPadding,
+    this.color = 0x000000,
+    this.baseline = .75,
+    this.idPrefix = 's',
+  })  : assert(columns > 0),
+        fontHeight = fontHeight ?? labelHeight * 0.2,
+        textPadding = textPadding ?? labelHeight * 0.05;
+
+  /// Number of labels on each row
+  final int columns;
+
+  /// Width of a label
+  final double labelWidth;
+
+  /// Height of a label
+  final double labelHeight;
+
+  /// Space around the labels
+  final double margin;
+
+  /// Space between two labels
+  final double spacing;
+
+  /// Draw the text of the barcodes
+  final bool drawText;
+
+  /// Font of the texts
+  final String fontFamily;
+
+  /// Height of the texts
+  final double fontHeight;
+
+  /// Space between the bars and the texts
+  final double textPadding;
+
+  /// Color of the bars and texts
+  final int color;
+
+  /// Baseline of the texts, relative to their height
+  final double baseline;
+
+  /// Prefix of the ids of the symbols in the `<defs>`, to tell apart the
+  /// sheets inlined in the same HTML page
+  final String idPrefix;
+
+  final _labels = <_BarcodeSheetLabel>[];
+
+  /// Number of labels
+  int get length => _labels.length;
+
+  /// Width of the sheet
+  double get width =>
+      margin * 2 + columns * labelWidth + (columns - 1) * spacing;
+
+  /// Height of the sheet
+  double get height {
+    final rows = (_labels.length + columns - 1) ~/ columns;
+    final gaps = rows > 0 ? rows - 1 : 0;
+    return margin * 2 + rows * labelHeight + gaps * spacing;
+  }
+
+  /// Add a label to the next cell of the grid.
+  /// Throws a [BarcodeException] if the data can't be encoded.
+  void add(Barcode barcode, String data) => _add(
+        barcode,
+        () => barcode.makeSymbols(
+          data,
+          width: labelWidth,
+          height: labelHeight,
+          drawText: drawText,
+          fontHeight: fontHeight,
+          textPadding: textPadding,
+        ),
+        (x, y) => barcode.toSvg(
+          data,
+          x: x,
+          y: y,
+          width: labelWidth,
+          height: labelHeight,
+          drawText: drawText,
+          fontFamily: fontFamily,
+          fontHeight: fontHeight,
+          textPadding: textPadding,
+          color: color,
+          fullSvg: false,
+          baseline: baseline,
+        ),
+      );
+
+  /// Add a label like [add] but takes a Uint8List data.
+  void addBytes(Barcode barcode, Uint8List data) => _add(
+        barcode,
+        () => barcode.makeSymbolsBytes(
+          data,
+          width: labelWidth,
+          height: labelHeight,
+          drawText: drawText,
+          fontHeight: fontHeight,
+          textPadding: textPadding,
+        ),
+        (x, y) => barcode.toSvgBytes(
+          data,
+          x: x,
+          y: y,
+          width: labelWidth,
+          height: labelHeight,
+          drawText: drawText,
+          fontFamily: fontFamily,
+          fontHeight: fontHeight,
+          textPadding: textPadding,
+          color: color,
+          fullSvg: false,
+          baseline: baseline,
+        ),
+      );
+
+  void _add(
+    Barcode barcode,
+    Iterable<BarcodeElement>? Function() symbols,
+    String Function(double x, double y) svg,
+  ) {
+    final index = _labels.length;
+    final x = margin + (index % columns) * (labelWidth + spacing);
+    final y = margin + (index ~/ columns) * (labelHeight + spacing);
+
+    final elements = symbols();
+    _labels.add(elements != null
+        ? _BarcodeSheetLabel(x, y, elements, null)
+        : _BarcodeSheetLabel(x, y, null, svg(x, y)));
+  }
+
+  /// Remove all the labels
+  void clear() => _labels.clear();
+
+  /// The SVG document of the sheet
+  String toSvg() {
+    final output = StringBuffer();
+    writeSvg(output);
+    return output.toString();
+  }
+
+  /// Write the SVG document of the sheet into [sink]
+  void writeSvg(StringSink sink) {
+    // Identify the distinct symbols of all the labels
+    final ids = <String, int>{};
+    for (final label in _labels) {
+      for (final elem in label.elements ?? const <BarcodeElement>[]) {
+        if (elem is BarcodeSymbols) {
+          for (final path in elem.paths) {
+            if (path.isNotEmpty) {
+              ids.putIfAbsent(path, () => ids.length);
+            }
+          }
+        }
+      }
+    }
+
+    sink.write('<svg viewBox="0 0 ${svgNumber(width)} ${svgNumber(height)}" '
+        'xmlns="http://www.w3.org/2000/svg" '
+        'xmlns:xlink="http://www.w3.org/1999/xlink">');
+
+    sink.write('<defs>');
+    ids.forEach(
+        (path, id) => sink.write('<path id="$idPrefix$id" d="$path"/>'));
+    sink.write('</defs>');
+
+    for (final label in _labels) {
+      if (label.svg != null) {
+        sink.write(label.svg);
+        continue;
+      }
+
+      final texts = <BarcodeElement>[];
+      for (final elem in label.elements!) {
+        if (elem is BarcodeSymbols) {
+          sink.write('<g transform="'
+              'translate(${svgNumber(label.x + elem.left)} '
+              '${svgNumber(label.y + elem.top)}) '
+              'scale(${svgNumber(elem.width / elem.modules)} '
+              '${svgNumber(elem.height)})" '
+              'style="fill: ${svgColor(color)}">');
+          for (var i = 0; i < elem.paths.length; i++) {
+            final id = ids[elem.paths[i]];
+            if (id != null) {
+              sink.write('<use xlink:href="#$idPrefix$id" '
+                  'x="${elem.offsets[i]}"/>');
+            }
+          }
+          sink.write('</g>');
+        } else if (elem is BarcodeText) {
+          texts.add(elem);
+        }
+      }
+
+      if (texts.isNotEmpty) {
+        writeSvgText(sink, texts, label.x, label.y, fontFamily, fontHeight,
+            color, baseline);
+      }
+    }
+
+    sink.write('</svg>');
+  }
+}
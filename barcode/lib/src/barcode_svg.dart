@@ -0,0 +1,82 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'dart:convert';
+
+import 'barcode_operations.dart';
+
+/// A number in an SVG document
+String svgNumber(double d) {
+  assert(d != double.infinity);
+  return d.toStringAsFixed(5);
+}
+
+/// A text in an SVG document
+String svgEscape(String s) {
+  const esc = HtmlEscape();
+  return esc.convert(s);
+}
+
+/// A color in an SVG document
+String svgColor(int c) {
+  return '#${(c & 0xffffff).toRadixString(16).padLeft(6, '0')}';
+}
+
+/// Write the [texts] placed at [x], [y] in a `<text>` element
+void writeSvgText(
+  StringSink output,
+  Iterable<BarcodeElement> texts,
+  double x,
+  double y,
+  String fontFamily,
+  double fontHeight,
+  int color,
+  double baseline,
+) {
+  output.write('<text style="fill: ${svgColor(color)}; '
+      'font-family: &quot;${svgEscape(fontFamily)}&quot;; '
+      'font-size: ${svgNumber(fontHeight)}px" '
+      'x="${svgNumber(x)}" y="${svgNumber(y)}">');
+
+  for (var elem in texts) {
+    if (elem is BarcodeText) {
+      final lY = y + elem.top + elem.height * baseline;
+
+      final double lX;
+      String anchor;
+      switch (elem.align) {
+        case BarcodeTextAlign.left:
+          lX = x + elem.left;
+          anchor = 'start';
+          break;
+        case BarcodeTextAlign.center:
+          lX = x + elem.left + elem.width / 2;
+          anchor = 'middle';
+          break;
+        case BarcodeTextAlign.right:
+          lX = x + elem.left + elem.width;
+          anchor = 'end';
+          break;
+      }
+
+      output.write('<tspan style="text-anchor: $anchor" '
+          'x="${svgNumber(lX)}" y="${svgNumber(lY)}">'
+          '${svgEscape(elem.text)}</tspan>');
+    }
+  }
+
+  output.write('</text>');
+}
@@ -18,8 +18,8 @@ import 'dart:typed_data';
 
 import 'barcode_1d.dart';
 import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'barcode_operations.dart';
+import 'maps/codabar.dart';
 
 /// Start and Stop symbols for BCodabar
 enum BarcodeCodabarStartStop {
@@ -64,15 +64,22 @@ class BarcodeCodabar extends Barcode1D {
   /// settings are ignored
   final bool explicitStartStop;
 
+  @override
+  List<Object?> get cacheKey =>
+      [...super.cacheKey, start, stop, printStartStop, explicitStartStop];
+
   @override
   Iterable<int> get charSet =>
-      BarcodeMaps.codabar.keys.where((int x) => x < 0x40);
+      tableCharSet(CodabarMaps.codabarTable).where((int x) => x < 0x40);
 
   @override
   String get name => 'CODABAR';
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) sync* {
     final startStop = <int>[0x41, 0x42, 0x43, 0x44];
 
     var lStart = startStop[start.index];
@@ -85,10 +92,10 @@ class BarcodeCodabar extends Barcode1D {
     }
 
     // Start
-    yield* add(BarcodeMaps.codabar[lStart]!, BarcodeMaps.codabarLen[lStart]!);
+    yield* _runs(lStart);
 
     // Space between chars
-    yield false;
+    yield 1;
 
     for (var code in data.codeUnits) {
       if (code > 0x40 || code == 0x2a) {
@@ -96,20 +103,20 @@ class BarcodeCodabar extends Barcode1D {
             'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
       }
 
-      final codeValue = BarcodeMaps.codabar[code];
-      if (codeValue == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
-      }
-      final codeLen = BarcodeMaps.codabarLen[code]!;
-      yield* add(codeValue, codeLen);
+      yield* _runs(code);
 
       // Space between chars
-      yield false;
+      yield 1;
     }
 
     // Stop
-    yield* add(BarcodeMaps.codabar[lStop]!, BarcodeMaps.codabarLen[lStop]!);
+    yield* _runs(lStop);
+  }
+
+  /// The bar widths of a character, without the trailing empty space
+  Iterable<int> _runs(int code) {
+    final runs = lookupRuns(CodabarMaps.codabarRuns, code);
+    return runs.take(runs.length - 1);
   }
 
   int _getStartStopByte(int value) {
@@ -15,29 +15,30 @@
  */
 
 import 'dart:convert';
+import 'dart:math';
 import 'dart:typed_data';
 
 import 'package:meta/meta.dart';
 
 import 'barcode_1d.dart';
 import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'barcode_operations.dart';
+import 'maps/code128.dart';
 
 /// Functions available in [BarcodeCode128] used for special purposes
 class BarcodeCode128Fnc {
   /// FNC1 at the beginning of a bar code indicates a GS1-128 bar code
   /// available in Code128A, Code128B, and Code128C
-  static const fnc1 = BarcodeMaps.code128FNC1String;
+  static const fnc1 = Code128Maps.code128FNC1String;
 
   /// Function 2 available in Code128A and Code128B
-  static const fnc2 = BarcodeMaps.code128FNC2String;
+  static const fnc2 = Code128Maps.code128FNC2String;
 
   /// Function 3 available in Code128A and Code128B
-  static const fnc3 = BarcodeMaps.code128FNC3String;
+  static const fnc3 = Code128Maps.code128FNC3String;
 
   /// Function 4 available in Code128A and Code128B
-  static const fnc4 = BarcodeMaps.code128FNC4String;
+  static const fnc4 = Code128Maps.code128FNC4String;
 }
 
 /// Code128 [Barcode]
@@ -87,214 +88,204 @@ class BarcodeCode128 extends Barcode1D {
   final bool addSpaceAfterParenthesis;
 
   @override
-  Iterable<int> get charSet => BarcodeMaps.code128B.keys
-          .where((int x) => useCode128B && x >= 0)
-          .followedBy(
-              BarcodeMaps.code128A.keys.where((int x) => useCode128A && x >= 0))
-          .followedBy(useCode128C
-              ? List<int>.generate(10, (int index) => index + 0x30)
-              : [])
-          .followedBy([
-        BarcodeMaps.code128FNC1,
-        if (useCode128A || useCode128B) BarcodeMaps.code128FNC2,
-        if (useCode128A || useCode128B) BarcodeMaps.code128FNC3,
-        if (useCode128A || useCode128B) BarcodeMaps.code128FNC4,
-        if (isGS1) ...[40, 41],
-      ]).toSet();
+  List<Object?> get cacheKey => [
+        ...super.cacheKey,
+        useCode128A,
+        useCode128B,
+        useCode128C,
+        isGS1,
+        escapes,
+        keepParenthesis,
+        addSpaceAfterParenthesis,
+      ];
+
+  /// The classes of [Code128Maps.code128Class] enabled for this barcode
+  int get _classes =>
+      (useCode128A ? Code128Maps.code128ClassA : 0) |
+      (useCode128B ? Code128Maps.code128ClassB : 0) |
+      (useCode128C
+          ? Code128Maps.code128ClassC | Code128Maps.code128ClassDigit
+          : 0);
+
+  @override
+  Iterable<int> get charSet {
+    final classes = _classes;
+
+    return Iterable<int>.generate(Code128Maps.code128Class.length)
+        .where((int code) => Code128Maps.code128Class[code] & classes != 0)
+        .followedBy([if (isGS1) ...[40, 41]]).toSet();
+  }
 
   @override
   String get name => isGS1 ? 'GS1 128' : 'CODE 128';
 
+  /// The sets to try, in order of preference, when several encodings
+  /// have the same length
+  static const _preferredSets = <int>[
+    Code128Maps.code128SetC,
+    Code128Maps.code128SetA,
+    Code128Maps.code128SetB,
+  ];
+
   /// Find the shortest code using a mix of tables A B or C
   Iterable<int> shortestCode(List<int> data) {
-    // table is defined as:
-    //   0 = 000 no table set
-    //   1 = 001 table A
-    //   2 = 010 table B
-    //   4 = 100 table C
-    var table = 0;
-
-    // the last table seen
-    //   0 = none
-    //   1 = table A
-    //   2 = table B
-    //   3 = table C
-    var lastTable = 0;
-
-    // the number of chars for the current table
-    var length = 0;
-    var digitCount = 0;
-    // var fnc1Count = 0;
-
-    final result = <int>[];
-
-    void addFrom(List<int> data, int start) {
-      Map<int, int>? t;
-      if (table & 4 != 0 && digitCount & 1 == 0 /*&& digitCount > 0*/) {
-        // New data from table C
-        t = BarcodeMaps.code128C;
-        if (lastTable == 1) {
-          result.add(t[BarcodeMaps.code128CodeA]!);
-        } else if (lastTable == 2) {
-          result.add(t[BarcodeMaps.code128CodeB]!);
-        }
-        lastTable = 3;
-      } else if (table & 1 != 0) {
-        // New data from table A
-        t = BarcodeMaps.code128A;
-        if (lastTable == 2) {
-          result.add(t[BarcodeMaps.code128CodeB]!);
-        } else if (lastTable == 3) {
-          result.add(t[BarcodeMaps.code128CodeC]!);
-        }
-        lastTable = 1;
-      } else if (table & 2 != 0) {
-        // New data from table B
-        t = BarcodeMaps.code128B;
-        if (lastTable == 1) {
-          result.add(t[BarcodeMaps.code128CodeA]!);
-        } else if (lastTable == 3) {
-          result.add(t[BarcodeMaps.code128CodeC]!);
-        }
-        lastTable = 2;
-      }
-
-      if (t == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCodes(data)}" to $name Barcode');
-      }
+    const sets = 3;
+    const setA = Code128Maps.code128SetA;
+    const setB = Code128Maps.code128SetB;
+    const setC = Code128Maps.code128SetC;
 
-      // Add sublist(start, length + start)
-      if (lastTable == 3) {
-        // Encode Code 128C $digitCount
-        for (var i = start + length - 1; i >= start; i--) {
-          if (data[i] == BarcodeMaps.code128FNC1) {
-            result.add(t[BarcodeMaps.code128FNC1]!);
-          } else {
-            final digit = data[i] - 0x30 + (data[i - 1] - 0x30) * 10;
-            assert(t[digit] != null);
-            result.add(t[digit]!);
-            i--;
-          }
-        }
-      } else {
-        for (final c in data.sublist(start, start + length).reversed) {
-          assert(t[c] != null);
-          result.add(t[c]!);
-        }
-      }
+    if (data.isEmpty) {
+      return const <int>[];
     }
 
-    for (var index = data.length - 1; index >= 0; index--) {
+    // Number of characters consumed by one symbol of each set at each
+    // position, 0 if the set can't encode the character
+    final classes = _classes;
+    final codeClasses = Uint8List(data.length);
+    for (var index = 0; index < data.length; index++) {
       final code = data[index];
+      final codeClass = code < Code128Maps.code128Class.length
+          ? Code128Maps.code128Class[code] & classes
+          : 0;
+
+      if (codeClass == 0) {
+        throw BarcodeException(
+            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
+      }
 
-      final codeA = useCode128A && BarcodeMaps.code128A.containsKey(code);
-      final codeB = useCode128B && BarcodeMaps.code128B.containsKey(code);
-      final isFnc1 = code == BarcodeMaps.code128FNC1;
-      final codeC = useCode128C && (code >= 0x30 && code <= 0x39);
+      codeClasses[index] = codeClass;
+    }
 
-      var available = 0;
-      if (codeA) {
-        available = 1;
+    final steps = Uint8List(data.length * sets);
+    for (var index = 0; index < data.length; index++) {
+      final codeClass = codeClasses[index];
+      if (codeClass & Code128Maps.code128ClassA != 0) {
+        steps[index * sets + setA] = 1;
       }
-      if (codeB) {
-        available |= 2;
+      if (codeClass & Code128Maps.code128ClassB != 0) {
+        steps[index * sets + setB] = 1;
       }
-      if (codeC || isFnc1) {
-        available |= 4;
+      if (codeClass & Code128Maps.code128ClassC != 0) {
+        steps[index * sets + setC] = 1;
+      } else if (codeClass & Code128Maps.code128ClassDigit != 0 &&
+          index + 1 < data.length &&
+          codeClasses[index + 1] & Code128Maps.code128ClassDigit != 0) {
+        steps[index * sets + setC] = 2;
       }
+    }
 
-      if (available == 0) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
-      }
+    // Minimal cost to encode the data after each position,
+    // for each current set
+    const unreachable = 0x7fffffff;
+    final costs = Int32List((data.length + 1) * sets);
+    for (var index = data.length - 1; index >= 0; index--) {
+      for (var from = 0; from < sets; from++) {
+        var best = unreachable;
 
-      if (codeC) {
-        // It's a digit
-        digitCount++;
-      } else if (isFnc1) {
-        length++;
-        addFrom(data, index);
-        length = 0;
-        digitCount = 0;
-        continue;
-      } else {
-        if (digitCount >= 4) {
-          // Use to CODE C to output 4 digits or more
-
-          if (digitCount & 1 != 0) {
-            // if Odd number, remove the first digit
-            digitCount--;
-          } else {
-            // addFrom(data, index + 1);
+        for (var next = 0; next < sets; next++) {
+          final step = steps[index * sets + next];
+          if (step == 0) {
+            continue;
           }
-          if (length > digitCount) {
-            length -= digitCount;
-            // First: Add $length chars using one of the tables A or B
-            table &= 3;
-            if (table == 0) {
-              throw BarcodeException(
-                  'Unable to encode "${String.fromCharCodes(data)}" to $name Barcode');
-            }
-            addFrom(data, index + digitCount + 1);
-            length = digitCount;
+          final cost = costs[(index + step) * sets + next];
+          if (cost == unreachable) {
+            continue;
           }
-          // Then: Optimize $digitCount with table C');
-          table = 4;
-          addFrom(data, index + 1);
-          table = 0;
-          length = 0;
+          best = min(
+              best,
+              cost +
+                  Code128Maps.code128SymbolCost +
+                  Code128Maps.code128SwitchCost[from * sets + next]);
         }
-        digitCount = 0;
-        // fnc1Count = 0;
-      }
 
-      if (table == 0) {
-        // Add first $code to table $available
-        table = available;
-        length++;
-      } else {
-        final newTable = table & available;
-        if (newTable == 0) {
-          // Change table to any of $table
-          addFrom(data, index + 1);
-          length = 0;
-          table = available;
-        } else {
-          table = newTable;
+        if (from != setC) {
+          final other = from == setA ? setB : setA;
+          final cost = costs[(index + 1) * sets + from];
+          if (steps[index * sets + other] != 0 && cost != unreachable) {
+            best = min(
+                best,
+                cost +
+                    Code128Maps.code128SymbolCost +
+                    Code128Maps.code128ShiftCost);
+          }
         }
-        length++;
+
+        costs[index * sets + from] = best;
+      }
+    }
+
+    // The value of the symbol of a set at a position
+    int value(int index, int codeSet) {
+      final code = data[index];
+      switch (codeSet) {
+        case setA:
+          return Code128Maps.code128ATable[code];
+        case setB:
+          return Code128Maps.code128BTable[code];
+      }
+      if (steps[index * sets + setC] == 2) {
+        return Code128Maps
+            .code128CTable[(code - 0x30) * 10 + data[index + 1] - 0x30];
       }
+      return Code128Maps.code128CTable[code];
     }
 
-    if (digitCount >= 2) {
-      if (digitCount & 1 != 0) {
-        // Odd number of digits, add the last one
-        length -= digitCount - 1;
-        addFrom(data, digitCount - 1);
-        digitCount--;
-      } else if (length > digitCount) {
-        length -= digitCount;
-        addFrom(data, digitCount);
+    // Select the start set
+    var current = -1;
+    var best = unreachable;
+    for (final next in _preferredSets) {
+      final step = steps[next];
+      if (step != 0 && costs[step * sets + next] < best) {
+        current = next;
+        best = costs[step * sets + next];
       }
-      table = 4;
-      length = digitCount;
     }
-    if (length > 0) {
-      // Add remaining data
-      addFrom(data, 0);
+
+    if (current < 0) {
+      throw BarcodeException(
+          'Unable to encode "${String.fromCharCodes(data)}" to $name Barcode');
     }
 
-    // Add the start code
-    if (lastTable == 1) {
-      result.add(BarcodeMaps.code128StartCodeA);
-    } else if (lastTable == 2) {
-      result.add(BarcodeMaps.code128StartCodeB);
-    } else if (lastTable == 3) {
-      result.add(BarcodeMaps.code128StartCodeC);
+    final result = <int>[Code128Maps.code128Start[current]];
+
+    // Follow the path of minimal cost
+    var index = 0;
+    while (index < data.length) {
+      final target = costs[index * sets + current];
+      var found = false;
+
+      for (final next in _preferredSets) {
+        final step = steps[index * sets + next];
+        if (step != 0 &&
+            costs[(index + step) * sets + next] +
+                    Code128Maps.code128SymbolCost +
+                    Code128Maps.code128SwitchCost[current * sets + next] ==
+                target) {
+          if (next != current) {
+            result.add(Code128Maps.code128Latch[current * sets + next]);
+          }
+          result.add(value(index, next));
+          index += step;
+          current = next;
+          found = true;
+          break;
+        }
+      }
+
+      if (!found) {
+        // Shift one character to the other set
+        if (current == setA) {
+          result.add(Code128Maps.code128A[Code128Maps.code128ShiftB]!);
+          result.add(value(index, setB));
+        } else {
+          result.add(Code128Maps.code128B[Code128Maps.code128ShiftA]!);
+          result.add(value(index, setA));
+        }
+        index++;
+      }
     }
 
-    return result.reversed;
+    return result;
   }
 
   /// Update the string to insert FNC1
@@ -306,7 +297,7 @@ class BarcodeCode128 extends Barcode1D {
       var start = 0;
       for (final match in RegExp(r'\(.+?\)').allMatches(data)) {
         result.write(data.substring(start, match.start));
-        result.write(BarcodeMaps.code128FNC1String);
+        result.write(Code128Maps.code128FNC1String);
         if (text && keepParenthesis) {
           result.write('(');
         }
@@ -330,16 +321,16 @@ class BarcodeCode128 extends Barcode1D {
         result.write(data.substring(start, match.start));
         switch (match.group(0)) {
           case '{1}':
-            result.write(BarcodeMaps.code128FNC1String);
+            result.write(Code128Maps.code128FNC1String);
             break;
           case '{2}':
-            result.write(BarcodeMaps.code128FNC2String);
+            result.write(Code128Maps.code128FNC2String);
             break;
           case '{3}':
-            result.write(BarcodeMaps.code128FNC3String);
+            result.write(Code128Maps.code128FNC3String);
             break;
           case '{4}':
-            result.write(BarcodeMaps.code128FNC4String);
+            result.write(Code128Maps.code128FNC4String);
             break;
           default:
             result.write(match.group(0));
@@ -355,14 +346,20 @@ class BarcodeCode128 extends Barcode1D {
   }
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) =>
+      convertSymbols(data).expand((runs) => runs);
+
+  @override
+  Iterable<List<int>> convertSymbols(String data) sync* {
     data = adaptData(data);
 
     final checksum = <int>[];
 
     for (var codeIndex in shortestCode(data.codeUnits)) {
-      final codeValue = BarcodeMaps.code128[codeIndex]!;
-      yield* add(codeValue, BarcodeMaps.code128Len);
+      yield Code128Maps.code128Runs[codeIndex];
       checksum.add(codeIndex);
     }
 
@@ -374,15 +371,13 @@ class BarcodeCode128 extends Barcode1D {
       sum += code * mul;
     }
     sum = sum % 103;
-    yield* add(BarcodeMaps.code128[sum]!, BarcodeMaps.code128Len);
+    yield Code128Maps.code128Runs[sum];
 
     // Stop
-    yield* add(
-        BarcodeMaps.code128[BarcodeMaps.code128Stop]!, BarcodeMaps.code128Len);
+    yield Code128Maps.code128Runs[Code128Maps.code128Stop];
 
     // Termination Bars
-    yield true;
-    yield true;
+    yield const <int>[2];
   }
 
   @override
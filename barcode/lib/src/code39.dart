@@ -15,9 +15,8 @@
  */
 
 import 'barcode_1d.dart';
-import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'barcode_operations.dart';
+import 'maps/code39.dart';
 
 /// Code 39 [Barcode]
 ///
@@ -27,33 +26,49 @@ import 'barcode_operations.dart';
 ///
 /// An additional character (denoted '*') is used for both start and stop
 /// delimiters. This can be disabled by setting [drawSpacers] to false.
+///
+/// With [fullAscii], the 128 ASCII characters can be encoded, the ones
+/// that are not in the Code 39 specification using two symbols.
 class BarcodeCode39 extends Barcode1D {
   /// Create a code 39 Barcode
-  const BarcodeCode39(this.drawSpacers);
+  const BarcodeCode39(this.drawSpacers, this.fullAscii);
 
   /// Draw the start '*' and end '*' chars in the left and right margins
   final bool drawSpacers;
 
+  /// Encode the full ASCII character set
+  final bool fullAscii;
+
+  @override
+  List<Object?> get cacheKey => [...super.cacheKey, drawSpacers, fullAscii];
+
   @override
-  Iterable<int> get charSet => BarcodeMaps.code39.keys;
+  Iterable<int> get charSet => fullAscii
+      ? Iterable<int>.generate(Code39Maps.code39AsciiRuns.length)
+      : tableCharSet(Code39Maps.code39Table);
 
   @override
   String get name => 'CODE 39';
 
   @override
-  Iterable<bool> convert(String data) sync* {
-    yield* add(BarcodeMaps.code39StartStop, BarcodeMaps.code39Len);
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) =>
+      convertSymbols(data).expand((runs) => runs);
+
+  @override
+  Iterable<List<int>> convertSymbols(String data) sync* {
+    yield Code39Maps.code39StartStopRuns;
+
+    final table =
+        fullAscii ? Code39Maps.code39AsciiRuns : Code39Maps.code39Runs;
 
     for (var code in data.codeUnits) {
-      final codeValue = BarcodeMaps.code39[code];
-      if (codeValue == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
-      }
-      yield* add(codeValue, BarcodeMaps.code39Len);
+      yield lookupRuns(table, code);
     }
 
-    yield* add(BarcodeMaps.code39StartStop, BarcodeMaps.code39Len);
+    yield Code39Maps.code39StartStopRuns;
   }
 
   @override
@@ -65,18 +80,29 @@ class BarcodeCode39 extends Barcode1D {
     double textPadding,
     double lineWidth,
   ) sync* {
-    final text = drawSpacers ? '*$data*' : data;
-
-    final additionalOffset = drawSpacers ? 0 : 1;
-    for (var i = 0; i < text.length; i++) {
-      yield BarcodeText(
-        left: lineWidth * BarcodeMaps.code39Len * (i + additionalOffset),
-        top: height - fontHeight,
-        width: lineWidth * BarcodeMaps.code39Len,
-        height: fontHeight,
-        text: text[i],
-        align: BarcodeTextAlign.center,
-      );
+    BarcodeText symbolText(String text, int index, int count) => BarcodeText(
+          left: lineWidth * Code39Maps.code39Len * index,
+          top: height - fontHeight,
+          width: lineWidth * Code39Maps.code39Len * count,
+          height: fontHeight,
+          text: text,
+          align: BarcodeTextAlign.center,
+        );
+
+    if (drawSpacers) {
+      yield symbolText('*', 0, 1);
+    }
+
+    // Each character is centered on its symbols, after the start character
+    var index = 1;
+    for (var code in data.codeUnits) {
+      final count = fullAscii ? Code39Maps.code39AsciiLen[code] : 1;
+      yield symbolText(String.fromCharCode(code), index, count);
+      index += count;
+    }
+
+    if (drawSpacers) {
+      yield symbolText('*', index, 1);
     }
   }
 }
@@ -15,8 +15,7 @@
  */
 
 import 'barcode_1d.dart';
-import 'barcode_exception.dart';
-import 'barcode_maps.dart';
+import 'maps/code93.dart';
 
 /// Code 93 [Barcode]
 ///
@@ -27,30 +26,49 @@ import 'barcode_maps.dart';
 ///
 /// Code 93 is used primarily by Canada Post to encode supplementary
 /// delivery information.
+///
+/// With [fullAscii], the 128 ASCII characters can be encoded, the ones
+/// that are not in the Code 93 specification using a shift symbol.
 class BarcodeCode93 extends Barcode1D {
   /// Create a Code 93 Barcode
-  const BarcodeCode93();
+  const BarcodeCode93(this.fullAscii);
+
+  /// Encode the full ASCII character set
+  final bool fullAscii;
 
   @override
-  Iterable<int> get charSet => BarcodeMaps.code93.keys.where((int x) => x > 0);
+  List<Object?> get cacheKey => [...super.cacheKey, fullAscii];
+
+  @override
+  Iterable<int> get charSet => fullAscii
+      ? Iterable<int>.generate(Code93Maps.code93AsciiRuns.length)
+      : tableCharSet(Code93Maps.code93Table);
 
   @override
   String get name => 'CODE 93';
 
   @override
-  Iterable<bool> convert(String data) sync* {
-    // Start
-    yield* add(BarcodeMaps.code93StartStop, BarcodeMaps.code93Len);
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
 
-    final keys = BarcodeMaps.code93.keys.toList();
+  @override
+  Iterable<int> convertRuns(String data) =>
+      convertSymbols(data).expand((runs) => runs);
+
+  @override
+  Iterable<List<int>> convertSymbols(String data) sync* {
+    // Start
+    yield Code93Maps.code93StartStopRuns;
 
+    final values = <int>[];
     for (var code in data.codeUnits) {
-      final codeValue = BarcodeMaps.code93[code];
-      if (codeValue == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
+      if (fullAscii) {
+        yield lookupRuns(Code93Maps.code93AsciiRuns, code);
+        values.addAll(Code93Maps.code93AsciiValues[code]);
+      } else {
+        final value = lookup(Code93Maps.code93Value, code);
+        yield Code93Maps.code93Runs[value];
+        values.add(value);
       }
-      yield* add(codeValue, BarcodeMaps.code93Len);
     }
 
     // Checksum
@@ -59,10 +77,10 @@ class BarcodeCode93 extends Barcode1D {
     var indexC = 1;
     var indexK = 2;
 
-    for (var index = data.codeUnits.length - 1; index >= 0; index--) {
-      final code = data.codeUnits[index];
-      sumC += keys.indexOf(code) * indexC;
-      sumK += keys.indexOf(code) * indexK;
+    for (var index = values.length - 1; index >= 0; index--) {
+      final value = values[index];
+      sumC += value * indexC;
+      sumK += value * indexK;
 
       indexC++;
       if (indexC > 20) {
@@ -75,15 +93,15 @@ class BarcodeCode93 extends Barcode1D {
     }
 
     sumC = sumC % 47;
-    yield* add(BarcodeMaps.code93[keys[sumC]]!, BarcodeMaps.code93Len);
+    yield Code93Maps.code93Runs[sumC];
 
     sumK = (sumK + sumC) % 47;
-    yield* add(BarcodeMaps.code93[keys[sumK]]!, BarcodeMaps.code93Len);
+    yield Code93Maps.code93Runs[sumK];
 
     // Stop
-    yield* add(BarcodeMaps.code93StartStop, BarcodeMaps.code93Len);
+    yield Code93Maps.code93StartStopRuns;
 
     // Termination Bar
-    yield true;
+    yield const <int>[1];
   }
 }
@@ -19,6 +19,8 @@ import 'dart:typed_data';
 import 'barcode_2d.dart';
 import 'barcode_exception.dart';
 import 'barcode_operations.dart';
+import 'barcode_recipe.dart';
+import 'maps/datamatrix.dart';
 import 'reedsolomon.dart';
 
 /// Data Matrix
@@ -50,13 +52,33 @@ class BarcodeDataMatrix extends Barcode2D {
     );
   }
 
+  @override
+  BarcodeRecipe makeRecipe(
+    String data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) {
+    final encoder = DataMatrixEncoder()..ascii(data);
+    return makeRecipeBytes(
+      encoder.toBytes(),
+      width: width,
+      height: height,
+      drawText: drawText,
+      fontHeight: fontHeight,
+      textPadding: textPadding,
+    );
+  }
+
   @override
   Barcode2DMatrix convert(Uint8List data) {
     var text = <int>[...data];
 
     _CodeSize? size;
     for (final s in _CodeSize.codeSizes) {
-      if (s.dataCodewords() >= text.length) {
+      if (s.dataCodewords >= text.length) {
         size = s;
         break;
       }
@@ -65,7 +87,7 @@ class BarcodeDataMatrix extends Barcode2D {
     if (size == null) {
       throw const BarcodeException('Too much data to encode');
     }
-    text = _addPadding(text, size.dataCodewords());
+    text = _addPadding(text, size.dataCodewords);
     text = _ErrorCorrection.ec.calcECC(text, size);
     final code = _render(text, size);
 
@@ -87,180 +109,24 @@ class BarcodeDataMatrix extends Barcode2D {
   int get maxLength => 1559;
 
   List<bool> _render(List<int> data, _CodeSize size) {
-    final cl = _CodeLayout(size);
-    cl.setValues(data);
-    return cl.merge();
-  }
-
-  List<int> _addPadding(List<int> data, int toCount) {
-    if (data.length < toCount) {
-      data.add(0x81);
-    }
+    final result = _finderPattern(size);
 
-    while (data.length < toCount) {
-      final r = ((149 * (data.length + 1)) % 253) + 1;
-      data.add((0x81 + r) % 254);
+    // Scatter the codeword bits to their precomputed positions
+    final placement = size.placement;
+    final bits = data.length * 8;
+    for (var i = 0; i < bits; i++) {
+      result[placement[i]] = (data[i >> 3] >> (7 - (i & 7))) & 1 == 1;
     }
 
-    return data;
-  }
-}
-
-class _CodeLayout {
-  _CodeLayout(this.size) {
-    matrix = List<bool>.filled(size.matrixColumns() * size.matrixRows(), false);
-    occupy = List<bool>.filled(size.matrixColumns() * size.matrixRows(), false);
-  }
-
-  late List<bool> matrix;
-  late List<bool> occupy;
-  final _CodeSize size;
-
-  bool occupied(int row, int col) {
-    return occupy[col + row * size.matrixColumns()];
-  }
-
-  void setXY(int row, int col, int value, int bitNum) {
-    final val = ((value >> (7 - bitNum)) & 1) == 1;
-
-    if (row < 0) {
-      row += size.matrixRows();
-      col += 4 - ((size.matrixRows() + 4) % 8);
-    }
-
-    if (col < 0) {
-      col += size.matrixColumns();
-      row += 4 - ((size.matrixColumns() + 4) % 8);
-    }
-
-    assert(!occupied(row, col), 'Field already occupied row: $row col: $col');
-
-    occupy[col + row * size.matrixColumns()] = true;
-
-    matrix[col + row * size.matrixColumns()] = val;
-  }
-
-  void setSimple(int row, int col, int value) {
-    setXY(row - 2, col - 2, value, 0);
-    setXY(row - 2, col - 1, value, 1);
-    setXY(row - 1, col - 2, value, 2);
-    setXY(row - 1, col - 1, value, 3);
-    setXY(row - 1, col - 0, value, 4);
-    setXY(row - 0, col - 2, value, 5);
-    setXY(row - 0, col - 1, value, 6);
-    setXY(row - 0, col - 0, value, 7);
-  }
-
-  void corner1(int value) {
-    setXY(size.matrixRows() - 1, 0, value, 0);
-    setXY(size.matrixRows() - 1, 1, value, 1);
-    setXY(size.matrixRows() - 1, 2, value, 2);
-    setXY(0, size.matrixColumns() - 2, value, 3);
-    setXY(0, size.matrixColumns() - 1, value, 4);
-    setXY(1, size.matrixColumns() - 1, value, 5);
-    setXY(2, size.matrixColumns() - 1, value, 6);
-    setXY(3, size.matrixColumns() - 1, value, 7);
-  }
-
-  void corner2(int value) {
-    setXY(size.matrixRows() - 3, 0, value, 0);
-    setXY(size.matrixRows() - 2, 0, value, 1);
-    setXY(size.matrixRows() - 1, 0, value, 2);
-    setXY(0, size.matrixColumns() - 4, value, 3);
-    setXY(0, size.matrixColumns() - 3, value, 4);
-    setXY(0, size.matrixColumns() - 2, value, 5);
-    setXY(0, size.matrixColumns() - 1, value, 6);
-    setXY(1, size.matrixColumns() - 1, value, 7);
-  }
-
-  void corner3(int value) {
-    setXY(size.matrixRows() - 3, 0, value, 0);
-    setXY(size.matrixRows() - 2, 0, value, 1);
-    setXY(size.matrixRows() - 1, 0, value, 2);
-    setXY(0, size.matrixColumns() - 2, value, 3);
-    setXY(0, size.matrixColumns() - 1, value, 4);
-    setXY(1, size.matrixColumns() - 1, value, 5);
-    setXY(2, size.matrixColumns() - 1, value, 6);
-    setXY(3, size.matrixColumns() - 1, value, 7);
-  }
-
-  void corner4(int value) {
-    setXY(size.matrixRows() - 1, 0, value, 0);
-    setXY(size.matrixRows() - 1, size.matrixColumns() - 1, value, 1);
-    setXY(0, size.matrixColumns() - 3, value, 2);
-    setXY(0, size.matrixColumns() - 2, value, 3);
-    setXY(0, size.matrixColumns() - 1, value, 4);
-    setXY(1, size.matrixColumns() - 3, value, 5);
-    setXY(1, size.matrixColumns() - 2, value, 6);
-    setXY(1, size.matrixColumns() - 1, value, 7);
-  }
-
-  void setValues(List<int> data) {
-    var idx = 0;
-    var row = 4;
-    var col = 0;
-
-    while ((row < size.matrixRows()) || (col < size.matrixColumns())) {
-      if ((row == size.matrixRows()) && (col == 0)) {
-        corner1(data[idx]);
-        idx++;
-      }
-      if ((row == size.matrixRows() - 2) &&
-          (col == 0) &&
-          (size.matrixColumns() % 4 != 0)) {
-        corner2(data[idx]);
-        idx++;
-      }
-      if ((row == size.matrixRows() - 2) &&
-          (col == 0) &&
-          (size.matrixColumns() % 8 == 4)) {
-        corner3(data[idx]);
-        idx++;
-      }
-
-      if ((row == size.matrixRows() + 4) &&
-          (col == 2) &&
-          (size.matrixColumns() % 8 == 0)) {
-        corner4(data[idx]);
-        idx++;
-      }
-
-      while (true) {
-        if ((row < size.matrixRows()) && (col >= 0) && !occupied(row, col)) {
-          setSimple(row, col, data[idx]);
-          idx++;
-        }
-        row -= 2;
-        col += 2;
-        if ((row < 0) || (col >= size.matrixColumns())) {
-          break;
-        }
-      }
-      row += 1;
-      col += 3;
-
-      while (true) {
-        if ((row >= 0) && (col < size.matrixColumns()) && !occupied(row, col)) {
-          setSimple(row, col, data[idx]);
-          idx++;
-        }
-        row += 2;
-        col -= 2;
-        if ((row >= size.matrixRows()) || (col < 0)) {
-          break;
-        }
-      }
-      row += 3;
-      col += 1;
+    // The modules left over by the placement algorithm are black
+    for (var i = bits; i < placement.length; i++) {
+      result[placement[i]] = true;
     }
 
-    if (!occupied(size.matrixRows() - 1, size.matrixColumns() - 1)) {
-      setXY(size.matrixRows() - 1, size.matrixColumns() - 1, 255, 0);
-      setXY(size.matrixRows() - 2, size.matrixColumns() - 2, 255, 0);
-    }
+    return result;
   }
 
-  List<bool> merge() {
+  List<bool> _finderPattern(_CodeSize size) {
     final result = List<bool>.filled(size.rows * size.columns, false);
 
     void setXY(int x, int y, bool v) {
@@ -299,35 +165,39 @@ class _CodeLayout {
       }
     }
 
-    for (var hRegion = 0; hRegion < size.regionCountHorizontal; hRegion++) {
-      for (var vRegion = 0; vRegion < size.regionCountVertical; vRegion++) {
-        for (var x = 0; x < size.regionColumns(); x++) {
-          final colMatrix = (size.regionColumns() * hRegion) + x;
-          final colResult = ((2 + size.regionColumns()) * hRegion) + x + 1;
+    return result;
+  }
 
-          for (var y = 0; y < size.regionRows(); y++) {
-            final rowMatrix = (size.regionRows() * vRegion) + y;
-            final rowResult = ((2 + size.regionRows()) * vRegion) + y + 1;
-            final val = matrix[colMatrix + rowMatrix * size.matrixColumns()];
+  List<int> _addPadding(List<int> data, int toCount) {
+    if (data.length < toCount) {
+      data.add(0x81);
+    }
 
-            setXY(colResult, rowResult, val);
-          }
-        }
-      }
+    while (data.length < toCount) {
+      final r = ((149 * (data.length + 1)) % 253) + 1;
+      data.add((0x81 + r) % 254);
     }
 
-    return result;
+    return data;
   }
 }
 
 class _CodeSize {
-  const _CodeSize(this.rows, this.columns, this.regionCountHorizontal,
-      this.regionCountVertical, this.eccCount, this.blockCount);
+  const _CodeSize(this.index, this.rows, this.columns,
+      this.regionCountHorizontal, this.regionCountVertical,
+      this.dataCodewords, this.eccCount, this.blockCount);
 
+  factory _CodeSize.fromTable(int index) {
+    final s = DataMatrixMaps.dataMatrixSizes[index];
+    return _CodeSize(index, s[0], s[1], s[2], s[3], s[4], s[5], s[6]);
+  }
+
+  final int index;
   final int rows;
   final int columns;
   final int regionCountHorizontal;
   final int regionCountVertical;
+  final int dataCodewords;
   final int eccCount;
   final int blockCount;
 
@@ -339,69 +209,26 @@ class _CodeSize {
     return (columns - (regionCountVertical * 2)) ~/ regionCountVertical;
   }
 
-  int matrixRows() {
-    return regionRows() * regionCountHorizontal;
-  }
-
-  int matrixColumns() {
-    return regionColumns() * regionCountVertical;
-  }
-
-  int dataCodewords() {
-    return ((matrixColumns() * matrixRows()) ~/ 8) - eccCount;
-  }
-
   int dataCodewordsForBlock(int idx) {
-    if (rows == 144 && columns == 144) {
-      // Special Case...
-      if (idx < 8) {
-        return 156;
-      } else {
-        return 155;
-      }
-    }
-    return dataCodewords() ~/ blockCount;
+    // The first blocks get one more codeword if the data can't be
+    // evenly interleaved (144x144)
+    return dataCodewords ~/ blockCount +
+        (idx < dataCodewords % blockCount ? 1 : 0);
   }
 
   int errorCorrectionCodewordsPerBlock() {
     return eccCount ~/ blockCount;
   }
 
-  static const codeSizes = <_CodeSize>[
-    _CodeSize(10, 10, 1, 1, 5, 1),
-    _CodeSize(12, 12, 1, 1, 7, 1),
-    _CodeSize(14, 14, 1, 1, 10, 1),
-    _CodeSize(16, 16, 1, 1, 12, 1),
-    _CodeSize(18, 18, 1, 1, 14, 1),
-    _CodeSize(20, 20, 1, 1, 18, 1),
-    _CodeSize(22, 22, 1, 1, 20, 1),
-    _CodeSize(24, 24, 1, 1, 24, 1),
-    _CodeSize(26, 26, 1, 1, 28, 1),
-    _CodeSize(32, 32, 2, 2, 36, 1),
-    _CodeSize(36, 36, 2, 2, 42, 1),
-    _CodeSize(40, 40, 2, 2, 48, 1),
-    _CodeSize(44, 44, 2, 2, 56, 1),
-    _CodeSize(48, 48, 2, 2, 68, 1),
-    _CodeSize(52, 52, 2, 2, 84, 2),
-    _CodeSize(64, 64, 4, 4, 112, 2),
-    _CodeSize(72, 72, 4, 4, 144, 4),
-    _CodeSize(80, 80, 4, 4, 192, 4),
-    _CodeSize(88, 88, 4, 4, 224, 4),
-    _CodeSize(96, 96, 4, 4, 272, 4),
-    _CodeSize(104, 104, 4, 4, 336, 6),
-    _CodeSize(120, 120, 6, 6, 408, 6),
-    _CodeSize(132, 132, 6, 6, 496, 8),
-    _CodeSize(144, 144, 6, 6, 620, 10),
-  ];
+  /// Position in the symbol of each codeword bit
+  List<int> get placement => DataMatrixMaps.dataMatrixPlacement[index]();
+
+  static final codeSizes = List<_CodeSize>.generate(
+      DataMatrixMaps.dataMatrixSizes.length, _CodeSize.fromTable);
 }
 
 class _ErrorCorrection {
-  _ErrorCorrection() {
-    final gf = GaloisField(301, 256, 1);
-    rs = ReedSolomonEncoder(gf);
-  }
-
-  late ReedSolomonEncoder rs;
+  final rs = ReedSolomonEncoder(GaloisField.gf256);
 
   static final ec = _ErrorCorrection();
 
@@ -18,6 +18,7 @@ import 'package:meta/meta.dart';
 
 import 'barcode_1d.dart';
 import 'barcode_exception.dart';
+import 'maps/ean.dart';
 
 /// Base class to generate EAN Barcodes
 ///
@@ -31,6 +32,19 @@ abstract class BarcodeEan extends Barcode1D {
   Iterable<int> get charSet =>
       List<int>.generate(10, (int index) => index + 0x30);
 
+  /// Bar widths of the L, G and R codes, the [set] index is the same
+  /// as in [EanMaps.ean]
+  static const _runs = <List<List<int>>>[
+    EanMaps.eanLRuns,
+    EanMaps.eanGRuns,
+    EanMaps.eanRRuns,
+  ];
+
+  /// Get the bar widths of a digit [code] unit, using the L (0), G (1)
+  /// or R (2) [set] of codes
+  @protected
+  List<int> digitRuns(int code, int set) => lookupRuns(_runs[set], code);
+
   /// Check the EAN Barcode length and verify the checksum.
   /// if the checksum is omitted, calculate and append it to the data.
   @protected
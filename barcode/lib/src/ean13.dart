@@ -18,9 +18,9 @@ import 'dart:convert';
 import 'dart:typed_data';
 
 import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'barcode_operations.dart';
 import 'ean.dart';
+import 'maps/ean.dart';
 
 /// EAN 13 Barcode
 ///
@@ -35,6 +35,9 @@ class BarcodeEan13 extends BarcodeEan {
   /// Draw the end char '>' in the right margin
   final bool drawEndChar;
 
+  @override
+  List<Object?> get cacheKey => [...super.cacheKey, drawEndChar];
+
   static const String _finalSpacer = '>';
 
   @override
@@ -54,42 +57,38 @@ class BarcodeEan13 extends BarcodeEan {
   }
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) sync* {
     data = checkLength(data, maxLength);
 
     // Start
-    yield* add(BarcodeMaps.eanStartEnd, 3);
+    yield* EanMaps.eanStartEndRuns;
 
     var index = 0;
-    final first = BarcodeMaps.eanFirst[data.codeUnits.first];
+    final first = EanMaps.eanFirst[data.codeUnits.first];
     if (first == null) {
       throw BarcodeException(
           'Unable to encode "${String.fromCharCode(data.codeUnits.first)}" to $name Barcode');
     }
 
     for (var code in data.codeUnits.sublist(1)) {
-      final codes = BarcodeMaps.ean[code];
-
-      if (codes == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
-      }
-
       if (index == 6) {
-        yield* add(BarcodeMaps.eanCenter, 5);
+        yield* EanMaps.eanCenterRuns;
       }
 
       if (index < 6) {
-        yield* add(codes[(first >> index) & 1], 7);
+        yield* digitRuns(code, (first >> index) & 1);
       } else {
-        yield* add(codes[2], 7);
+        yield* digitRuns(code, 2);
       }
 
       index++;
     }
 
     // Stop
-    yield* add(BarcodeMaps.eanStartEnd, 3);
+    yield* EanMaps.eanStartEndRuns;
   }
 
   @override
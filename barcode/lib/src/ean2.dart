@@ -15,9 +15,9 @@
  */
 
 import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'barcode_operations.dart';
 import 'ean.dart';
+import 'maps/ean.dart';
 
 /// EAN 2 Barcode
 ///
@@ -37,7 +37,10 @@ class BarcodeEan2 extends BarcodeEan {
   int get maxLength => 2;
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) sync* {
     verify(data);
     int idata;
     try {
@@ -48,26 +51,19 @@ class BarcodeEan2 extends BarcodeEan {
     final pattern = idata % 4;
 
     // Start
-    yield* add(BarcodeMaps.eanStartEan2, 5);
+    yield* EanMaps.eanStartEan2Runs;
 
     var index = 0;
     for (var code in data.codeUnits) {
-      final codes = BarcodeMaps.ean[code];
-
-      if (codes == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
-      }
-
       if (index == 1) {
-        yield* add(BarcodeMaps.eanCenterEan2, 2);
+        yield* EanMaps.eanCenterEan2Runs;
       }
 
       if (index == 0) {
-        yield* add(codes[pattern < 2 ? 0 : 1], 7);
+        yield* digitRuns(code, pattern < 2 ? 0 : 1);
       } else {
         //index == 1
-        yield* add(codes[pattern % 2 == 0 ? 0 : 1], 7);
+        yield* digitRuns(code, pattern % 2 == 0 ? 0 : 1);
       }
       index++;
     }
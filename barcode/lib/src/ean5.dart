@@ -14,9 +14,8 @@
  * limitations under the License.
  */
 
-import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'ean2.dart';
+import 'maps/ean.dart';
 
 /// EAN 5 Barcode
 ///
@@ -52,28 +51,24 @@ class BarcodeEan5 extends BarcodeEan2 {
   }
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) sync* {
     verify(data);
     final checksum = checkSumModulo10(data);
-    final pattern = BarcodeMaps.ean5Checksum[checksum.codeUnitAt(0)];
+    final pattern = EanMaps.ean5Checksum[checksum.codeUnitAt(0)];
 
     // Start
-    yield* add(BarcodeMaps.eanStartEan2, 5);
+    yield* EanMaps.eanStartEan2Runs;
 
     var index = 0;
     for (var code in data.codeUnits) {
-      final codes = BarcodeMaps.ean[code];
-
-      if (codes == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
-      }
-
       if (index >= 1) {
-        yield* add(BarcodeMaps.eanCenterEan2, 2);
+        yield* EanMaps.eanCenterEan2Runs;
       }
 
-      yield* add(codes[(pattern! >> index) & 1], 7);
+      yield* digitRuns(code, (pattern! >> index) & 1);
       index++;
     }
   }
@@ -17,10 +17,9 @@
 import 'dart:convert';
 import 'dart:typed_data';
 
-import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'barcode_operations.dart';
 import 'ean.dart';
+import 'maps/ean.dart';
 
 /// EAN 8 Barcode
 ///
@@ -37,6 +36,9 @@ class BarcodeEan8 extends BarcodeEan {
   /// Draw the start '<' and end '>' chars in the left and right margins
   final bool drawSpacers;
 
+  @override
+  List<Object?> get cacheKey => [...super.cacheKey, drawSpacers];
+
   static const String _startSpacer = '<';
 
   static const String _finalSpacer = '>';
@@ -58,31 +60,27 @@ class BarcodeEan8 extends BarcodeEan {
   }
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) sync* {
     data = checkLength(data, maxLength);
 
     // Start
-    yield* add(BarcodeMaps.eanStartEnd, 3);
+    yield* EanMaps.eanStartEndRuns;
 
     var index = 0;
     for (var code in data.codeUnits) {
-      final codes = BarcodeMaps.ean[code];
-
-      if (codes == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
-      }
-
       if (index == 4) {
-        yield* add(BarcodeMaps.eanCenter, 5);
+        yield* EanMaps.eanCenterRuns;
       }
 
-      yield* add(codes[index < 4 ? 0 : 2], 7);
+      yield* digitRuns(code, index < 4 ? 0 : 2);
       index++;
     }
 
     // Stop
-    yield* add(BarcodeMaps.eanStartEnd, 3);
+    yield* EanMaps.eanStartEndRuns;
   }
 
   @override
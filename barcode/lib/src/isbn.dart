@@ -29,6 +29,9 @@ class BarcodeIsbn extends BarcodeEan13 {
   /// Draw the ISBN number as text on the top of the barcode
   final bool drawIsbn;
 
+  @override
+  List<Object?> get cacheKey => [...super.cacheKey, drawIsbn];
+
   @override
   double marginTop(
     bool drawText,
@@ -19,9 +19,10 @@ import 'dart:typed_data';
 
 import 'barcode_1d.dart';
 import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'barcode_operations.dart';
+import 'barcode_recipe.dart';
 import 'ean.dart';
+import 'maps/itf.dart';
 
 /// 2 of 5 Barcode
 ///
@@ -58,6 +59,17 @@ class BarcodeItf extends BarcodeEan {
   /// The Barcode length if fixed length
   final int? fixedLength;
 
+  @override
+  List<Object?> get cacheKey => [
+        ...super.cacheKey,
+        addChecksum,
+        zeroPrepend,
+        drawBorder,
+        borderWidth,
+        quietWidth,
+        fixedLength,
+      ];
+
   @override
   String get name => 'ITF';
 
@@ -131,7 +143,14 @@ class BarcodeItf extends BarcodeEan {
   }
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) =>
+      convertSymbols(data).expand((runs) => runs);
+
+  @override
+  Iterable<List<int>> convertSymbols(String data) sync* {
     if (fixedLength != null) {
       data = checkLength(data, fixedLength!);
     } else {
@@ -150,51 +169,85 @@ class BarcodeItf extends BarcodeEan {
     }
 
     // Start
-    yield* add(BarcodeMaps.itfStart, 4);
+    yield ItfMaps.itfStartRuns;
 
+    // The bars and spaces of each pair are interleaved by build_maps.py
     final cu = data.codeUnits;
-    for (var i = 0; i < cu.length / 2; i++) {
-      final tuple = <int?>[
-        BarcodeMaps.itf[cu[i * 2]],
-        BarcodeMaps.itf[cu[i * 2 + 1]]
-      ];
+    for (var i = 0; i + 1 < cu.length; i += 2) {
+      final pair = lookup(ItfMaps.itfValue, cu[i]) * 10 +
+          lookup(ItfMaps.itfValue, cu[i + 1]);
+      yield Uint8List.sublistView(
+          ItfMaps.itfPairRuns, pair * 10, pair * 10 + 10);
+    }
 
-      if (tuple[0] == null || tuple[1] == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(cu[i * 2])}${String.fromCharCode(cu[i * 2 + 1])}" to $name Barcode');
-      }
+    // End
+    yield ItfMaps.itfEndRuns;
+  }
 
-      for (var n = 0; n < 10; n++) {
-        final v = (tuple[n % 2]! >> (n ~/ 2)) & 1;
-        final c = n % 2 == 0;
-        yield c;
-        if (v != 0) {
-          yield c;
-          yield c;
-        }
-      }
+  @override
+  Iterable<BarcodeElement>? makeScaledBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) {
+    if (drawBorder) {
+      return null;
     }
 
-    // End
-    yield* add(BarcodeMaps.itfEnd, 5);
+    return super.makeScaledBytes(
+      data,
+      width: width,
+      height: height,
+      drawText: drawText,
+      fontHeight: fontHeight,
+      textPadding: textPadding,
+    );
+  }
+
+  @override
+  Iterable<BarcodeElement>? makeSymbolsBytes(
+    Uint8List data, {
+    required double width,
+    required double height,
+    bool drawText = false,
+    double? fontHeight,
+    double? textPadding,
+  }) {
+    if (drawBorder) {
+      return null;
+    }
+
+    return super.makeSymbolsBytes(
+      data,
+      width: width,
+      height: height,
+      drawText: drawText,
+      fontHeight: fontHeight,
+      textPadding: textPadding,
+    );
   }
 
   @override
-  Iterable<BarcodeElement> makeBytes(
+  void buildRecipe(
+    BarcodeRecipeBuilder recipe,
     Uint8List data, {
     required double width,
     required double height,
     bool drawText = false,
     double? fontHeight,
     double? textPadding,
-  }) sync* {
+  }) {
     assert(width > 0);
     assert(height > 0);
     assert(!drawText || fontHeight != null);
     fontHeight ??= 0;
     textPadding ??= Barcode1D.defaultTextPadding;
 
-    yield* super.makeBytes(
+    super.buildRecipe(
+      recipe,
       data,
       width: width,
       height: height,
@@ -207,25 +260,11 @@ class BarcodeItf extends BarcodeEan {
       final bw = _getBorderWidth(width);
       final hp = drawText ? fontHeight + textPadding : 0;
 
-      yield BarcodeBar(left: 0, top: 0, width: width, height: bw, black: true);
-      yield BarcodeBar(
-          left: 0,
-          top: height - hp - bw,
-          width: width,
-          height: bw,
-          black: true);
-      yield BarcodeBar(
-          left: 0,
-          top: bw,
-          width: bw,
-          height: height - hp - bw * 2,
-          black: true);
-      yield BarcodeBar(
-          left: width - bw,
-          top: bw,
-          width: bw,
-          height: height - hp - bw * 2,
-          black: true);
+      recipe
+        ..addBar(0, 0, width, bw, true)
+        ..addBar(0, height - hp - bw, width, bw, true)
+        ..addBar(0, bw, bw, height - hp - bw * 2, true)
+        ..addBar(width - bw, bw, bw, height - hp - bw * 2, true);
     }
   }
 
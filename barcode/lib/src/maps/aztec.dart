@@ -0,0 +1,680 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash 8174390679d1ff48
+// Content hash c790c9c32fe30f2c
+
+// ignore_for_file: public_member_api_docs
+
+import 'common.dart';
+
+class AztecMaps {
+  static const noCode = CommonMaps.noCode;
+
+  /// Aztec encoding modes
+  static const aztecModeUpper = 0;
+  static const aztecModeLower = 1;
+  static const aztecModeDigit = 2;
+  static const aztecModeMixed = 3;
+  static const aztecModePunct = 4;
+
+  /// Aztec number of bits of the codes, indexed by mode
+  static const aztecModeBits = <int>[5, 5, 4, 5, 5];
+
+  /// Aztec upper mode values, indexed by code unit
+  static const aztecUpper = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x1, // " "
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x2, // "A"
+    0x3, // "B"
+    0x4, // "C"
+    0x5, // "D"
+    0x6, // "E"
+    0x7, // "F"
+    0x8, // "G"
+    0x9, // "H"
+    0xa, // "I"
+    0xb, // "J"
+    0xc, // "K"
+    0xd, // "L"
+    0xe, // "M"
+    0xf, // "N"
+    0x10, // "O"
+    0x11, // "P"
+    0x12, // "Q"
+    0x13, // "R"
+    0x14, // "S"
+    0x15, // "T"
+    0x16, // "U"
+    0x17, // "V"
+    0x18, // "W"
+    0x19, // "X"
+    0x1a, // "Y"
+    0x1b, // "Z"
+  ];
+
+  /// Aztec lower mode values, indexed by code unit
+  static const aztecLower = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x1, // " "
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x2, // "a"
+    0x3, // "b"
+    0x4, // "c"
+    0x5, // "d"
+    0x6, // "e"
+    0x7, // "f"
+    0x8, // "g"
+    0x9, // "h"
+    0xa, // "i"
+    0xb, // "j"
+    0xc, // "k"
+    0xd, // "l"
+    0xe, // "m"
+    0xf, // "n"
+    0x10, // "o"
+    0x11, // "p"
+    0x12, // "q"
+    0x13, // "r"
+    0x14, // "s"
+    0x15, // "t"
+    0x16, // "u"
+    0x17, // "v"
+    0x18, // "w"
+    0x19, // "x"
+    0x1a, // "y"
+    0x1b, // "z"
+  ];
+
+  /// Aztec digit mode values, indexed by code unit
+  static const aztecDigit = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x1, // " "
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xc, // ","
+    noCode,
+    0xd, // "."
+    noCode,
+    0x2, // "0"
+    0x3, // "1"
+    0x4, // "2"
+    0x5, // "3"
+    0x6, // "4"
+    0x7, // "5"
+    0x8, // "6"
+    0x9, // "7"
+    0xa, // "8"
+    0xb, // "9"
+  ];
+
+  /// Aztec mixed mode values, indexed by code unit
+  static const aztecMixed = <int>[
+    0x0, // 0x0
+    0x2, // 0x1
+    0x3, // 0x2
+    0x4, // 0x3
+    0x5, // 0x4
+    0x6, // 0x5
+    0x7, // 0x6
+    0x8, // 0x7
+    0x9, // 0x8
+    0xa, // 0x9
+    0xb, // 0xa
+    0xc, // 0xb
+    0xd, // 0xc
+    0xe, // 0xd
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xf, // 0x1b
+    0x10, // 0x1c
+    0x11, // 0x1d
+    0x12, // 0x1e
+    0x13, // 0x1f
+    0x1, // " "
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x14, // "@"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x15, // "\"
+    noCode,
+    0x16, // "^"
+    0x17, // "_"
+    0x18, // "`"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x19, // "|"
+    noCode,
+    0x1a, // "~"
+    0x1b, // 0x7f
+  ];
+
+  /// Aztec punct mode values, indexed by code unit
+  static const aztecPunct = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x1, // 0xd
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x6, // "!"
+    noCode,
+    0x8, // "#"
+    0x9, // "$"
+    0xa, // "%"
+    0xb, // "&"
+    0xc, // "'"
+    0xd, // "("
+    0xe, // ")"
+    0xf, // "*"
+    0x10, // "+"
+    0x11, // ","
+    0x12, // "-"
+    0x13, // "."
+    0x14, // "/"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x15, // ":"
+    0x16, // ";"
+    0x17, // "<"
+    0x18, // "="
+    0x19, // ">"
+    0x1a, // "?"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x1b, // "["
+    noCode,
+    0x1c, // "]"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x1d, // "{"
+    noCode,
+    0x1e, // "}"
+  ];
+
+  /// Aztec values of the modes, indexed by mode
+  static const aztecChars = <List<int>>[
+    aztecUpper,
+    aztecLower,
+    aztecDigit,
+    aztecMixed,
+    aztecPunct,
+  ];
+
+  /// Aztec codes to latch from a mode (row) to another (column)
+  static const aztecLatch = <int>[
+    0x0, 0x1c, 0x1e, 0x1d, 0x3be, // from Upper
+    0x1ee, 0x0, 0x1e, 0x1d, 0x3be, // from Lower
+    0xe, 0x1dc, 0x0, 0x1dd, 0x3bbe, // from Digit
+    0x1d, 0x1c, 0x3be, 0x0, 0x1e, // from Mixed
+    0x1f, 0x3fc, 0x3fe, 0x3fd, 0x0, // from Punct
+  ];
+
+  /// Aztec number of bits of the latch codes
+  static const aztecLatchCost = <int>[
+    0, 5, 5, 5, 10, // from Upper
+    9, 0, 5, 5, 10, // from Lower
+    4, 9, 0, 9, 14, // from Digit
+    5, 5, 10, 0, 5, // from Mixed
+    5, 10, 10, 10, 0, // from Punct
+  ];
+
+  /// Aztec codes to shift from a mode (row) to another (column)
+  static const aztecShift = <int>[
+    noCode, noCode, noCode, noCode, 0, // from Upper
+    28, noCode, noCode, noCode, 0, // from Lower
+    15, noCode, noCode, noCode, 0, // from Digit
+    noCode, noCode, noCode, noCode, 0, // from Mixed
+    noCode, noCode, noCode, noCode, noCode, // from Punct
+  ];
+
+  /// Aztec number of bits of a shift and the shifted character
+  static const aztecShiftCost = <int>[
+    noCode, noCode, noCode, noCode, 10, // from Upper
+    10, noCode, noCode, noCode, 10, // from Lower
+    9, noCode, noCode, noCode, 9, // from Digit
+    noCode, noCode, noCode, noCode, 10, // from Mixed
+    noCode, noCode, noCode, noCode, noCode, // from Punct
+  ];
+
+  /// Aztec punct values of the special pairs of characters, indexed
+  /// by the first and second code units
+  static const aztecPairs = <int, int>{
+    0xd0a: 2, // 0xd 0xa
+    0x2e20: 3, // "." " "
+    0x2c20: 4, // "," " "
+    0x3a20: 5, // ":" " "
+  };
+
+  static const aztecCompactLayers = 4;
+  static const aztecFullLayers = 32;
+
+  /// Aztec symbol sizes, the compact ones first: compact, layers, word size,
+  /// bits, matrix size without and with the reference grid, maximum data words
+  static const aztecSizes = <List<int>>[
+    <int>[1, 1, 6, 104, 15, 15, 64],
+    <int>[1, 2, 6, 240, 19, 19, 64],
+    <int>[1, 3, 8, 408, 23, 23, 64],
+    <int>[1, 4, 8, 608, 27, 27, 64],
+    <int>[0, 1, 6, 128, 18, 19, 2048],
+    <int>[0, 2, 6, 288, 22, 23, 2048],
+    <int>[0, 3, 8, 480, 26, 27, 2048],
+    <int>[0, 4, 8, 704, 30, 31, 2048],
+    <int>[0, 5, 8, 960, 34, 37, 2048],
+    <int>[0, 6, 8, 1248, 38, 41, 2048],
+    <int>[0, 7, 8, 1568, 42, 45, 2048],
+    <int>[0, 8, 8, 1920, 46, 49, 2048],
+    <int>[0, 9, 10, 2304, 50, 53, 2048],
+    <int>[0, 10, 10, 2720, 54, 57, 2048],
+    <int>[0, 11, 10, 3168, 58, 61, 2048],
+    <int>[0, 12, 10, 3648, 62, 67, 2048],
+    <int>[0, 13, 10, 4160, 66, 71, 2048],
+    <int>[0, 14, 10, 4704, 70, 75, 2048],
+    <int>[0, 15, 10, 5280, 74, 79, 2048],
+    <int>[0, 16, 10, 5888, 78, 83, 2048],
+    <int>[0, 17, 10, 6528, 82, 87, 2048],
+    <int>[0, 18, 10, 7200, 86, 91, 2048],
+    <int>[0, 19, 10, 7904, 90, 95, 2048],
+    <int>[0, 20, 10, 8640, 94, 101, 2048],
+    <int>[0, 21, 10, 9408, 98, 105, 2048],
+    <int>[0, 22, 10, 10208, 102, 109, 2048],
+    <int>[0, 23, 12, 11040, 106, 113, 2048],
+    <int>[0, 24, 12, 11904, 110, 117, 2048],
+    <int>[0, 25, 12, 12800, 114, 121, 2048],
+    <int>[0, 26, 12, 13728, 118, 125, 2048],
+    <int>[0, 27, 12, 14688, 122, 131, 2048],
+    <int>[0, 28, 12, 15680, 126, 135, 2048],
+    <int>[0, 29, 12, 16704, 130, 139, 2048],
+    <int>[0, 30, 12, 17760, 134, 143, 2048],
+    <int>[0, 31, 12, 18848, 138, 147, 2048],
+    <int>[0, 32, 12, 19968, 142, 151, 2048],
+  ];
+}
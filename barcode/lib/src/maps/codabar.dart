@@ -0,0 +1,292 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash 23246d7de86d07e0
+// Content hash f990b0244edbfb23
+
+// ignore_for_file: public_member_api_docs
+
+import 'common.dart';
+
+class CodabarMaps {
+  static const noCode = CommonMaps.noCode;
+
+  /// Codabar conversion bits
+  static const codabar = <int, int>{
+    0x30: 0x195, // "0" => "101010011"
+    0x31: 0x135, // "1" => "101011001"
+    0x34: 0x12d, // "4" => "101101001"
+    0x35: 0x12b, // "5" => "110101001"
+    0x32: 0x1a5, // "2" => "101001011"
+    0x2d: 0x165, // "-" => "101001101"
+    0x24: 0x14d, // "$" => "101100101"
+    0x39: 0x14b, // "9" => "110100101"
+    0x36: 0x1a9, // "6" => "100101011"
+    0x37: 0x169, // "7" => "100101101"
+    0x38: 0x159, // "8" => "100110101"
+    0x33: 0x153, // "3" => "110010101"
+    0x2e: 0x2db, // "." => "1101101101"
+    0x2f: 0x35b, // "/" => "1101101011"
+    0x3a: 0x36b, // ":" => "1101011011"
+    0x2b: 0x36d, // "+" => "1011011011"
+    0x43: 0x325, // "C" => "1010010011"
+    0x44: 0x265, // "D" => "1010011001"
+    0x41: 0x24d, // "A" => "1011001001"
+    0x42: 0x349, // "B" => "1001001011"
+  };
+
+  static const codabarLen = <int, int>{
+    0x30: 9, // "0"
+    0x31: 9, // "1"
+    0x34: 9, // "4"
+    0x35: 9, // "5"
+    0x32: 9, // "2"
+    0x2d: 9, // "-"
+    0x24: 9, // "$"
+    0x39: 9, // "9"
+    0x36: 9, // "6"
+    0x37: 9, // "7"
+    0x38: 9, // "8"
+    0x33: 9, // "3"
+    0x2e: 10, // "."
+    0x2f: 10, // "/"
+    0x3a: 10, // ":"
+    0x2b: 10, // "+"
+    0x43: 10, // "C"
+    0x44: 10, // "D"
+    0x41: 10, // "A"
+    0x42: 10, // "B"
+  };
+
+  /// Codabar conversion bits, indexed by code unit
+  static const codabarTable = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x14d, // "$"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x36d, // "+"
+    noCode,
+    0x165, // "-"
+    0x2db, // "."
+    0x35b, // "/"
+    0x195, // "0"
+    0x135, // "1"
+    0x1a5, // "2"
+    0x153, // "3"
+    0x12d, // "4"
+    0x12b, // "5"
+    0x1a9, // "6"
+    0x169, // "7"
+    0x159, // "8"
+    0x14b, // "9"
+    0x36b, // ":"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x24d, // "A"
+    0x349, // "B"
+    0x325, // "C"
+    0x265, // "D"
+  ];
+
+  /// Codabar bits count, indexed by code unit
+  static const codabarLenTable = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x9, // "$"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xa, // "+"
+    noCode,
+    0x9, // "-"
+    0xa, // "."
+    0xa, // "/"
+    0x9, // "0"
+    0x9, // "1"
+    0x9, // "2"
+    0x9, // "3"
+    0x9, // "4"
+    0x9, // "5"
+    0x9, // "6"
+    0x9, // "7"
+    0x9, // "8"
+    0x9, // "9"
+    0xa, // ":"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xa, // "A"
+    0xa, // "B"
+    0xa, // "C"
+    0xa, // "D"
+  ];
+
+  /// Codabar bar widths, indexed by code unit
+  static const codabarRuns = <List<int>>[
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[1, 1, 2, 2, 1, 1, 1, 0], // "$"
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[1, 1, 2, 1, 2, 1, 2, 0], // "+"
+    <int>[],
+    <int>[1, 1, 1, 2, 2, 1, 1, 0], // "-"
+    <int>[2, 1, 2, 1, 2, 1, 1, 0], // "."
+    <int>[2, 1, 2, 1, 1, 1, 2, 0], // "/"
+    <int>[1, 1, 1, 1, 1, 2, 2, 0], // "0"
+    <int>[1, 1, 1, 1, 2, 2, 1, 0], // "1"
+    <int>[1, 1, 1, 2, 1, 1, 2, 0], // "2"
+    <int>[2, 2, 1, 1, 1, 1, 1, 0], // "3"
+    <int>[1, 1, 2, 1, 1, 2, 1, 0], // "4"
+    <int>[2, 1, 1, 1, 1, 2, 1, 0], // "5"
+    <int>[1, 2, 1, 1, 1, 1, 2, 0], // "6"
+    <int>[1, 2, 1, 1, 2, 1, 1, 0], // "7"
+    <int>[1, 2, 2, 1, 1, 1, 1, 0], // "8"
+    <int>[2, 1, 1, 2, 1, 1, 1, 0], // "9"
+    <int>[2, 1, 1, 1, 2, 1, 2, 0], // ":"
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[1, 1, 2, 2, 1, 2, 1, 0], // "A"
+    <int>[1, 2, 1, 2, 1, 1, 2, 0], // "B"
+    <int>[1, 1, 1, 2, 1, 2, 2, 0], // "C"
+    <int>[1, 1, 1, 2, 2, 2, 1, 0], // "D"
+  ];
+}
@@ -0,0 +1,535 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash f297ec46ef83256f
+// Content hash abad1e7ed6f0c8de
+
+// ignore_for_file: public_member_api_docs
+
+import 'common.dart';
+
+class Code39Maps {
+  static const noCode = CommonMaps.noCode;
+
+  /// Code 39 conversion bits
+  static const code39 = <int, int>{
+    0x30: 0xb65, // 0
+    0x31: 0xd4b, // 1
+    0x32: 0xd4d, // 2
+    0x33: 0xa9b, // 3
+    0x34: 0xd65, // 4
+    0x35: 0xacb, // 5
+    0x36: 0xacd, // 6
+    0x37: 0xda5, // 7
+    0x38: 0xb4b, // 8
+    0x39: 0xb4d, // 9
+    0x41: 0xd2b, // A
+    0x42: 0xd2d, // B
+    0x43: 0xa5b, // C
+    0x44: 0xd35, // D
+    0x45: 0xa6b, // E
+    0x46: 0xa6d, // F
+    0x47: 0xd95, // G
+    0x48: 0xb2b, // H
+    0x49: 0xb2d, // I
+    0x4a: 0xb35, // J
+    0x4b: 0xcab, // K
+    0x4c: 0xcad, // L
+    0x4d: 0x95b, // M
+    0x4e: 0xcb5, // N
+    0x4f: 0x96b, // O
+    0x50: 0x96d, // P
+    0x51: 0xcd5, // Q
+    0x52: 0x9ab, // R
+    0x53: 0x9ad, // S
+    0x54: 0x9b5, // T
+    0x55: 0xd53, // U
+    0x56: 0xd59, // V
+    0x57: 0xab3, // W
+    0x58: 0xd69, // X
+    0x59: 0xad3, // Y
+    0x5a: 0xad9, // Z
+    0x2d: 0xda9, // -
+    0x2e: 0xb53, // .
+    0x20: 0xb59, //
+    0x24: 0xa49, // $
+    0x2f: 0x949, // /
+    0x2b: 0x929, // +
+    0x25: 0x925, // %
+  };
+
+  /// Code 39 misc bits
+  static const code39StartStop = 0xb69;
+  static const int code39Len = 13;
+
+  /// Code 39 conversion bits, indexed by code unit
+  static const code39Table = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xb59, // " "
+    noCode,
+    noCode,
+    noCode,
+    0xa49, // "$"
+    0x925, // "%"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x929, // "+"
+    noCode,
+    0xda9, // "-"
+    0xb53, // "."
+    0x949, // "/"
+    0xb65, // "0"
+    0xd4b, // "1"
+    0xd4d, // "2"
+    0xa9b, // "3"
+    0xd65, // "4"
+    0xacb, // "5"
+    0xacd, // "6"
+    0xda5, // "7"
+    0xb4b, // "8"
+    0xb4d, // "9"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xd2b, // "A"
+    0xd2d, // "B"
+    0xa5b, // "C"
+    0xd35, // "D"
+    0xa6b, // "E"
+    0xa6d, // "F"
+    0xd95, // "G"
+    0xb2b, // "H"
+    0xb2d, // "I"
+    0xb35, // "J"
+    0xcab, // "K"
+    0xcad, // "L"
+    0x95b, // "M"
+    0xcb5, // "N"
+    0x96b, // "O"
+    0x96d, // "P"
+    0xcd5, // "Q"
+    0x9ab, // "R"
+    0x9ad, // "S"
+    0x9b5, // "T"
+    0xd53, // "U"
+    0xd59, // "V"
+    0xab3, // "W"
+    0xd69, // "X"
+    0xad3, // "Y"
+    0xad9, // "Z"
+  ];
+
+  /// Code 39 bar widths, indexed by code unit
+  static const code39Runs = <List<int>>[
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[1, 2, 2, 1, 1, 1, 2, 1, 1, 1], // " "
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1], // "$"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1], // "%"
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1], // "+"
+    <int>[],
+    <int>[1, 2, 1, 1, 1, 1, 2, 1, 2, 1], // "-"
+    <int>[2, 2, 1, 1, 1, 1, 2, 1, 1, 1], // "."
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1], // "/"
+    <int>[1, 1, 1, 2, 2, 1, 2, 1, 1, 1], // "0"
+    <int>[2, 1, 1, 2, 1, 1, 1, 1, 2, 1], // "1"
+    <int>[1, 1, 2, 2, 1, 1, 1, 1, 2, 1], // "2"
+    <int>[2, 1, 2, 2, 1, 1, 1, 1, 1, 1], // "3"
+    <int>[1, 1, 1, 2, 2, 1, 1, 1, 2, 1], // "4"
+    <int>[2, 1, 1, 2, 2, 1, 1, 1, 1, 1], // "5"
+    <int>[1, 1, 2, 2, 2, 1, 1, 1, 1, 1], // "6"
+    <int>[1, 1, 1, 2, 1, 1, 2, 1, 2, 1], // "7"
+    <int>[2, 1, 1, 2, 1, 1, 2, 1, 1, 1], // "8"
+    <int>[1, 1, 2, 2, 1, 1, 2, 1, 1, 1], // "9"
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[2, 1, 1, 1, 1, 2, 1, 1, 2, 1], // "A"
+    <int>[1, 1, 2, 1, 1, 2, 1, 1, 2, 1], // "B"
+    <int>[2, 1, 2, 1, 1, 2, 1, 1, 1, 1], // "C"
+    <int>[1, 1, 1, 1, 2, 2, 1, 1, 2, 1], // "D"
+    <int>[2, 1, 1, 1, 2, 2, 1, 1, 1, 1], // "E"
+    <int>[1, 1, 2, 1, 2, 2, 1, 1, 1, 1], // "F"
+    <int>[1, 1, 1, 1, 1, 2, 2, 1, 2, 1], // "G"
+    <int>[2, 1, 1, 1, 1, 2, 2, 1, 1, 1], // "H"
+    <int>[1, 1, 2, 1, 1, 2, 2, 1, 1, 1], // "I"
+    <int>[1, 1, 1, 1, 2, 2, 2, 1, 1, 1], // "J"
+    <int>[2, 1, 1, 1, 1, 1, 1, 2, 2, 1], // "K"
+    <int>[1, 1, 2, 1, 1, 1, 1, 2, 2, 1], // "L"
+    <int>[2, 1, 2, 1, 1, 1, 1, 2, 1, 1], // "M"
+    <int>[1, 1, 1, 1, 2, 1, 1, 2, 2, 1], // "N"
+    <int>[2, 1, 1, 1, 2, 1, 1, 2, 1, 1], // "O"
+    <int>[1, 1, 2, 1, 2, 1, 1, 2, 1, 1], // "P"
+    <int>[1, 1, 1, 1, 1, 1, 2, 2, 2, 1], // "Q"
+    <int>[2, 1, 1, 1, 1, 1, 2, 2, 1, 1], // "R"
+    <int>[1, 1, 2, 1, 1, 1, 2, 2, 1, 1], // "S"
+    <int>[1, 1, 1, 1, 2, 1, 2, 2, 1, 1], // "T"
+    <int>[2, 2, 1, 1, 1, 1, 1, 1, 2, 1], // "U"
+    <int>[1, 2, 2, 1, 1, 1, 1, 1, 2, 1], // "V"
+    <int>[2, 2, 2, 1, 1, 1, 1, 1, 1, 1], // "W"
+    <int>[1, 2, 1, 1, 2, 1, 1, 1, 2, 1], // "X"
+    <int>[2, 2, 1, 1, 2, 1, 1, 1, 1, 1], // "Y"
+    <int>[1, 2, 2, 1, 2, 1, 1, 1, 1, 1], // "Z"
+  ];
+
+  /// Code 39 misc bar widths
+  static const code39StartStopRuns = <int>[1, 2, 1, 1, 2, 1, 2, 1, 1, 1];
+
+  /// Code 39 full ASCII bar widths of the one or two symbols,
+  /// indexed by code unit
+  static const code39AsciiRuns = <List<int>>[
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 2, 1, 1, 1, 1, 1, 1, 2, 1], // 0x0
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1], // 0x1
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 1, 1, 2, 1], // 0x2
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1], // 0x3
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 2, 1], // 0x4
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 2, 2, 1, 1, 1, 1], // 0x5
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 2, 2, 1, 1, 1, 1], // 0x6
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 2, 1], // 0x7
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1, 1, 1], // 0x8
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 2, 1, 1, 1], // 0x9
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1], // 0xa
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 1], // 0xb
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1], // 0xc
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1], // 0xd
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 2, 1], // 0xe
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1], // 0xf
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1], // 0x10
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1], // 0x11
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 1, 2, 2, 1, 1], // 0x12
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 1, 2, 2, 1, 1], // 0x13
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 1, 2, 2, 1, 1], // 0x14
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 1, 2, 1], // 0x15
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 2, 1], // 0x16
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1], // 0x17
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1], // 0x18
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 2, 1, 1, 2, 1, 1, 1, 1, 1], // 0x19
+    <int>[1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 2, 2, 1, 2, 1, 1, 1, 1, 1], // 0x1a
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1], // 0x1b
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1, 1, 2, 1], // 0x1c
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1], // 0x1d
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 2, 1], // 0x1e
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 2, 2, 1, 1, 1, 1], // 0x1f
+    <int>[1, 2, 2, 1, 1, 1, 2, 1, 1, 1], // " "
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1], // "!"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1, 1, 2, 1], // """
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1], // "#"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 2, 1], // "$"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 2, 2, 1, 1, 1, 1], // "%"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 2, 1, 2, 2, 1, 1, 1, 1], // "&"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 2, 1], // "'"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1, 1, 1], // "("
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 2, 1, 1, 1], // ")"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1], // "*"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 1], // "+"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1], // ","
+    <int>[1, 2, 1, 1, 1, 1, 2, 1, 2, 1], // "-"
+    <int>[2, 2, 1, 1, 1, 1, 2, 1, 1, 1], // "."
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1], // "/"
+    <int>[1, 1, 1, 2, 2, 1, 2, 1, 1, 1], // "0"
+    <int>[2, 1, 1, 2, 1, 1, 1, 1, 2, 1], // "1"
+    <int>[1, 1, 2, 2, 1, 1, 1, 1, 2, 1], // "2"
+    <int>[2, 1, 2, 2, 1, 1, 1, 1, 1, 1], // "3"
+    <int>[1, 1, 1, 2, 2, 1, 1, 1, 2, 1], // "4"
+    <int>[2, 1, 1, 2, 2, 1, 1, 1, 1, 1], // "5"
+    <int>[1, 1, 2, 2, 2, 1, 1, 1, 1, 1], // "6"
+    <int>[1, 1, 1, 2, 1, 1, 2, 1, 2, 1], // "7"
+    <int>[2, 1, 1, 2, 1, 1, 2, 1, 1, 1], // "8"
+    <int>[1, 1, 2, 2, 1, 1, 2, 1, 1, 1], // "9"
+    <int>[1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 1, 2, 2, 1, 2, 1, 1, 1, 1, 1], // ":"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 2, 2, 1, 1, 1, 1], // ";"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 2, 1], // "<"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1, 1, 1], // "="
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 2, 1, 1, 1], // ">"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1], // "?"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 2, 1], // "@"
+    <int>[2, 1, 1, 1, 1, 2, 1, 1, 2, 1], // "A"
+    <int>[1, 1, 2, 1, 1, 2, 1, 1, 2, 1], // "B"
+    <int>[2, 1, 2, 1, 1, 2, 1, 1, 1, 1], // "C"
+    <int>[1, 1, 1, 1, 2, 2, 1, 1, 2, 1], // "D"
+    <int>[2, 1, 1, 1, 2, 2, 1, 1, 1, 1], // "E"
+    <int>[1, 1, 2, 1, 2, 2, 1, 1, 1, 1], // "F"
+    <int>[1, 1, 1, 1, 1, 2, 2, 1, 2, 1], // "G"
+    <int>[2, 1, 1, 1, 1, 2, 2, 1, 1, 1], // "H"
+    <int>[1, 1, 2, 1, 1, 2, 2, 1, 1, 1], // "I"
+    <int>[1, 1, 1, 1, 2, 2, 2, 1, 1, 1], // "J"
+    <int>[2, 1, 1, 1, 1, 1, 1, 2, 2, 1], // "K"
+    <int>[1, 1, 2, 1, 1, 1, 1, 2, 2, 1], // "L"
+    <int>[2, 1, 2, 1, 1, 1, 1, 2, 1, 1], // "M"
+    <int>[1, 1, 1, 1, 2, 1, 1, 2, 2, 1], // "N"
+    <int>[2, 1, 1, 1, 2, 1, 1, 2, 1, 1], // "O"
+    <int>[1, 1, 2, 1, 2, 1, 1, 2, 1, 1], // "P"
+    <int>[1, 1, 1, 1, 1, 1, 2, 2, 2, 1], // "Q"
+    <int>[2, 1, 1, 1, 1, 1, 2, 2, 1, 1], // "R"
+    <int>[1, 1, 2, 1, 1, 1, 2, 2, 1, 1], // "S"
+    <int>[1, 1, 1, 1, 2, 1, 2, 2, 1, 1], // "T"
+    <int>[2, 2, 1, 1, 1, 1, 1, 1, 2, 1], // "U"
+    <int>[1, 2, 2, 1, 1, 1, 1, 1, 2, 1], // "V"
+    <int>[2, 2, 2, 1, 1, 1, 1, 1, 1, 1], // "W"
+    <int>[1, 2, 1, 1, 2, 1, 1, 1, 2, 1], // "X"
+    <int>[2, 2, 1, 1, 2, 1, 1, 1, 1, 1], // "Y"
+    <int>[1, 2, 2, 1, 2, 1, 1, 1, 1, 1], // "Z"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 1], // "["
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1], // "\"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1], // "]"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 2, 1], // "^"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1], // "_"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1], // "`"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1], // "a"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 1, 1, 2, 1], // "b"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1], // "c"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 1, 1, 2, 1], // "d"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 2, 2, 1, 1, 1, 1], // "e"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 2, 2, 1, 1, 1, 1], // "f"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 2, 1, 2, 1], // "g"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1, 1, 1], // "h"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 2, 1, 1, 1], // "i"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1, 1, 1], // "j"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 1], // "k"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 1, 2, 2, 1], // "l"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1], // "m"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 1, 2, 2, 1], // "n"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1], // "o"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1], // "p"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1], // "q"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 1, 2, 2, 1, 1], // "r"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 2, 2, 1, 1], // "s"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 2, 2, 1, 1], // "t"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 2, 1, 1, 1, 1, 1, 1, 2, 1], // "u"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 2, 1, 1, 1, 1, 1, 2, 1], // "v"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 1], // "w"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 1, 1, 2, 1], // "x"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2, 2, 1, 1, 2, 1, 1, 1, 1, 1], // "y"
+    <int>[1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 1, 2, 2, 1, 2, 1, 1, 1, 1, 1], // "z"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 1], // "{"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 1, 1, 2, 2, 2, 1], // "|"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 2, 1, 1, 1, 1, 1, 2, 2, 1, 1], // "}"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 2, 1, 1, 1, 2, 2, 1, 1], // "~"
+    <int>[1, 1, 1, 2, 1, 2, 1, 2, 1, 1, 1, 1, 1, 1, 2, 1, 2, 2, 1, 1], // 0x7f
+  ];
+
+  /// Code 39 full ASCII number of symbols, indexed by code unit
+  static const code39AsciiLen = <int>[
+    0x2, // 0x0
+    0x2, // 0x1
+    0x2, // 0x2
+    0x2, // 0x3
+    0x2, // 0x4
+    0x2, // 0x5
+    0x2, // 0x6
+    0x2, // 0x7
+    0x2, // 0x8
+    0x2, // 0x9
+    0x2, // 0xa
+    0x2, // 0xb
+    0x2, // 0xc
+    0x2, // 0xd
+    0x2, // 0xe
+    0x2, // 0xf
+    0x2, // 0x10
+    0x2, // 0x11
+    0x2, // 0x12
+    0x2, // 0x13
+    0x2, // 0x14
+    0x2, // 0x15
+    0x2, // 0x16
+    0x2, // 0x17
+    0x2, // 0x18
+    0x2, // 0x19
+    0x2, // 0x1a
+    0x2, // 0x1b
+    0x2, // 0x1c
+    0x2, // 0x1d
+    0x2, // 0x1e
+    0x2, // 0x1f
+    0x1, // " "
+    0x2, // "!"
+    0x2, // """
+    0x2, // "#"
+    0x2, // "$"
+    0x2, // "%"
+    0x2, // "&"
+    0x2, // "'"
+    0x2, // "("
+    0x2, // ")"
+    0x2, // "*"
+    0x2, // "+"
+    0x2, // ","
+    0x1, // "-"
+    0x1, // "."
+    0x2, // "/"
+    0x1, // "0"
+    0x1, // "1"
+    0x1, // "2"
+    0x1, // "3"
+    0x1, // "4"
+    0x1, // "5"
+    0x1, // "6"
+    0x1, // "7"
+    0x1, // "8"
+    0x1, // "9"
+    0x2, // ":"
+    0x2, // ";"
+    0x2, // "<"
+    0x2, // "="
+    0x2, // ">"
+    0x2, // "?"
+    0x2, // "@"
+    0x1, // "A"
+    0x1, // "B"
+    0x1, // "C"
+    0x1, // "D"
+    0x1, // "E"
+    0x1, // "F"
+    0x1, // "G"
+    0x1, // "H"
+    0x1, // "I"
+    0x1, // "J"
+    0x1, // "K"
+    0x1, // "L"
+    0x1, // "M"
+    0x1, // "N"
+    0x1, // "O"
+    0x1, // "P"
+    0x1, // "Q"
+    0x1, // "R"
+    0x1, // "S"
+    0x1, // "T"
+    0x1, // "U"
+    0x1, // "V"
+    0x1, // "W"
+    0x1, // "X"
+    0x1, // "Y"
+    0x1, // "Z"
+    0x2, // "["
+    0x2, // "\"
+    0x2, // "]"
+    0x2, // "^"
+    0x2, // "_"
+    0x2, // "`"
+    0x2, // "a"
+    0x2, // "b"
+    0x2, // "c"
+    0x2, // "d"
+    0x2, // "e"
+    0x2, // "f"
+    0x2, // "g"
+    0x2, // "h"
+    0x2, // "i"
+    0x2, // "j"
+    0x2, // "k"
+    0x2, // "l"
+    0x2, // "m"
+    0x2, // "n"
+    0x2, // "o"
+    0x2, // "p"
+    0x2, // "q"
+    0x2, // "r"
+    0x2, // "s"
+    0x2, // "t"
+    0x2, // "u"
+    0x2, // "v"
+    0x2, // "w"
+    0x2, // "x"
+    0x2, // "y"
+    0x2, // "z"
+    0x2, // "{"
+    0x2, // "|"
+    0x2, // "}"
+    0x2, // "~"
+    0x2, // 0x7f
+  ];
+}
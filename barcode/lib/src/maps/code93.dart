@@ -0,0 +1,654 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash bdf858a85924217a
+// Content hash 67bf80711daebb19
+
+// ignore_for_file: public_member_api_docs
+
+import 'common.dart';
+
+class Code93Maps {
+  static const noCode = CommonMaps.noCode;
+
+  /// Code 93 conversion bits
+  static const code93 = <int, int>{
+    0x30: 0x51, // 0
+    0x31: 0x25, // 1
+    0x32: 0x45, // 2
+    0x33: 0x85, // 3
+    0x34: 0x29, // 4
+    0x35: 0x49, // 5
+    0x36: 0x89, // 6
+    0x37: 0x15, // 7
+    0x38: 0x91, // 8
+    0x39: 0xa1, // 9
+    0x41: 0x2b, // A
+    0x42: 0x4b, // B
+    0x43: 0x8b, // C
+    0x44: 0x53, // D
+    0x45: 0x93, // E
+    0x46: 0xa3, // F
+    0x47: 0x2d, // G
+    0x48: 0x4d, // H
+    0x49: 0x8d, // I
+    0x4a: 0x59, // J
+    0x4b: 0xb1, // K
+    0x4c: 0x35, // L
+    0x4d: 0x65, // M
+    0x4e: 0xc5, // N
+    0x4f: 0x69, // O
+    0x50: 0xd1, // P
+    0x51: 0x5b, // Q
+    0x52: 0x9b, // R
+    0x53: 0x6b, // S
+    0x54: 0xcb, // T
+    0x55: 0xd3, // U
+    0x56: 0xb3, // V
+    0x57: 0x6d, // W
+    0x58: 0xcd, // X
+    0x59: 0xd9, // Y
+    0x5a: 0xb9, // Z
+    0x2d: 0xe9, // -
+    0x2e: 0x57, // .
+    0x20: 0x97, //
+    0x24: 0xa7, // $
+    0x2f: 0xed, // /
+    0x2b: 0xdd, // +
+    0x25: 0xeb, // %
+    -1: code93Dollar,
+    -2: code93Percent,
+    -3: code93Slash,
+    -4: code93Plus,
+    -5: code93StartStop,
+    -6: code93ReverseStop,
+  };
+
+  /// Code 93 misc bits
+  static const code93Dollar = 0xc9;
+  static const code93Percent = 0xb7;
+  static const code93Slash = 0xd7;
+  static const code93Plus = 0x99;
+  static const code93StartStop = 0xf5;
+  static const code93ReverseStop = 0xbd;
+  static const code93Len = 9;
+
+  /// Code 93 conversion bits, indexed by code unit
+  static const code93Table = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x97, // " "
+    noCode,
+    noCode,
+    noCode,
+    0xa7, // "$"
+    0xeb, // "%"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xdd, // "+"
+    noCode,
+    0xe9, // "-"
+    0x57, // "."
+    0xed, // "/"
+    0x51, // "0"
+    0x25, // "1"
+    0x45, // "2"
+    0x85, // "3"
+    0x29, // "4"
+    0x49, // "5"
+    0x89, // "6"
+    0x15, // "7"
+    0x91, // "8"
+    0xa1, // "9"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x2b, // "A"
+    0x4b, // "B"
+    0x8b, // "C"
+    0x53, // "D"
+    0x93, // "E"
+    0xa3, // "F"
+    0x2d, // "G"
+    0x4d, // "H"
+    0x8d, // "I"
+    0x59, // "J"
+    0xb1, // "K"
+    0x35, // "L"
+    0x65, // "M"
+    0xc5, // "N"
+    0x69, // "O"
+    0xd1, // "P"
+    0x5b, // "Q"
+    0x9b, // "R"
+    0x6b, // "S"
+    0xcb, // "T"
+    0xd3, // "U"
+    0xb3, // "V"
+    0x6d, // "W"
+    0xcd, // "X"
+    0xd9, // "Y"
+    0xb9, // "Z"
+  ];
+
+  /// Code 93 checksum values, indexed by code unit
+  static const code93Value = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x26, // " "
+    noCode,
+    noCode,
+    noCode,
+    0x27, // "$"
+    0x2a, // "%"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x29, // "+"
+    noCode,
+    0x24, // "-"
+    0x25, // "."
+    0x28, // "/"
+    0x0, // "0"
+    0x1, // "1"
+    0x2, // "2"
+    0x3, // "3"
+    0x4, // "4"
+    0x5, // "5"
+    0x6, // "6"
+    0x7, // "7"
+    0x8, // "8"
+    0x9, // "9"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xa, // "A"
+    0xb, // "B"
+    0xc, // "C"
+    0xd, // "D"
+    0xe, // "E"
+    0xf, // "F"
+    0x10, // "G"
+    0x11, // "H"
+    0x12, // "I"
+    0x13, // "J"
+    0x14, // "K"
+    0x15, // "L"
+    0x16, // "M"
+    0x17, // "N"
+    0x18, // "O"
+    0x19, // "P"
+    0x1a, // "Q"
+    0x1b, // "R"
+    0x1c, // "S"
+    0x1d, // "T"
+    0x1e, // "U"
+    0x1f, // "V"
+    0x20, // "W"
+    0x21, // "X"
+    0x22, // "Y"
+    0x23, // "Z"
+  ];
+
+  /// Code 93 conversion bits, indexed by checksum value
+  static const code93Symbol = <int>[
+    0x51, // "0"
+    0x25, // "1"
+    0x45, // "2"
+    0x85, // "3"
+    0x29, // "4"
+    0x49, // "5"
+    0x89, // "6"
+    0x15, // "7"
+    0x91, // "8"
+    0xa1, // "9"
+    0x2b, // "A"
+    0x4b, // "B"
+    0x8b, // "C"
+    0x53, // "D"
+    0x93, // "E"
+    0xa3, // "F"
+    0x2d, // "G"
+    0x4d, // "H"
+    0x8d, // "I"
+    0x59, // "J"
+    0xb1, // "K"
+    0x35, // "L"
+    0x65, // "M"
+    0xc5, // "N"
+    0x69, // "O"
+    0xd1, // "P"
+    0x5b, // "Q"
+    0x9b, // "R"
+    0x6b, // "S"
+    0xcb, // "T"
+    0xd3, // "U"
+    0xb3, // "V"
+    0x6d, // "W"
+    0xcd, // "X"
+    0xd9, // "Y"
+    0xb9, // "Z"
+    0xe9, // "-"
+    0x57, // "."
+    0x97, // " "
+    0xa7, // "$"
+    0xed, // "/"
+    0xdd, // "+"
+    0xeb, // "%"
+    0xc9, // Dollar
+    0xb7, // Percent
+    0xd7, // Slash
+    0x99, // Plus
+  ];
+
+  /// Code 93 bar widths, indexed by checksum value
+  static const code93Runs = <List<int>>[
+    <int>[1, 3, 1, 1, 1, 2], // "0"
+    <int>[1, 1, 1, 2, 1, 3], // "1"
+    <int>[1, 1, 1, 3, 1, 2], // "2"
+    <int>[1, 1, 1, 4, 1, 1], // "3"
+    <int>[1, 2, 1, 1, 1, 3], // "4"
+    <int>[1, 2, 1, 2, 1, 2], // "5"
+    <int>[1, 2, 1, 3, 1, 1], // "6"
+    <int>[1, 1, 1, 1, 1, 4], // "7"
+    <int>[1, 3, 1, 2, 1, 1], // "8"
+    <int>[1, 4, 1, 1, 1, 1], // "9"
+    <int>[2, 1, 1, 1, 1, 3], // "A"
+    <int>[2, 1, 1, 2, 1, 2], // "B"
+    <int>[2, 1, 1, 3, 1, 1], // "C"
+    <int>[2, 2, 1, 1, 1, 2], // "D"
+    <int>[2, 2, 1, 2, 1, 1], // "E"
+    <int>[2, 3, 1, 1, 1, 1], // "F"
+    <int>[1, 1, 2, 1, 1, 3], // "G"
+    <int>[1, 1, 2, 2, 1, 2], // "H"
+    <int>[1, 1, 2, 3, 1, 1], // "I"
+    <int>[1, 2, 2, 1, 1, 2], // "J"
+    <int>[1, 3, 2, 1, 1, 1], // "K"
+    <int>[1, 1, 1, 1, 2, 3], // "L"
+    <int>[1, 1, 1, 2, 2, 2], // "M"
+    <int>[1, 1, 1, 3, 2, 1], // "N"
+    <int>[1, 2, 1, 1, 2, 2], // "O"
+    <int>[1, 3, 1, 1, 2, 1], // "P"
+    <int>[2, 1, 2, 1, 1, 2], // "Q"
+    <int>[2, 1, 2, 2, 1, 1], // "R"
+    <int>[2, 1, 1, 1, 2, 2], // "S"
+    <int>[2, 1, 1, 2, 2, 1], // "T"
+    <int>[2, 2, 1, 1, 2, 1], // "U"
+    <int>[2, 2, 2, 1, 1, 1], // "V"
+    <int>[1, 1, 2, 1, 2, 2], // "W"
+    <int>[1, 1, 2, 2, 2, 1], // "X"
+    <int>[1, 2, 2, 1, 2, 1], // "Y"
+    <int>[1, 2, 3, 1, 1, 1], // "Z"
+    <int>[1, 2, 1, 1, 3, 1], // "-"
+    <int>[3, 1, 1, 1, 1, 2], // "."
+    <int>[3, 1, 1, 2, 1, 1], // " "
+    <int>[3, 2, 1, 1, 1, 1], // "$"
+    <int>[1, 1, 2, 1, 3, 1], // "/"
+    <int>[1, 1, 3, 1, 2, 1], // "+"
+    <int>[2, 1, 1, 1, 3, 1], // "%"
+    <int>[1, 2, 1, 2, 2, 1], // Dollar
+    <int>[3, 1, 2, 1, 1, 1], // Percent
+    <int>[3, 1, 1, 1, 2, 1], // Slash
+    <int>[1, 2, 2, 2, 1, 1], // Plus
+  ];
+
+  /// Code 93 misc bar widths
+  static const code93DollarRuns = <int>[1, 2, 1, 2, 2, 1];
+  static const code93PercentRuns = <int>[3, 1, 2, 1, 1, 1];
+  static const code93SlashRuns = <int>[3, 1, 1, 1, 2, 1];
+  static const code93PlusRuns = <int>[1, 2, 2, 2, 1, 1];
+  static const code93StartStopRuns = <int>[1, 1, 1, 1, 4, 1];
+  static const code93ReverseStopRuns = <int>[1, 1, 4, 1, 1, 1];
+
+  /// Code 93 full ASCII checksum values of the one or two symbols,
+  /// indexed by code unit
+  static const code93AsciiValues = <List<int>>[
+    <int>[44, 30], // 0x0
+    <int>[43, 10], // 0x1
+    <int>[43, 11], // 0x2
+    <int>[43, 12], // 0x3
+    <int>[43, 13], // 0x4
+    <int>[43, 14], // 0x5
+    <int>[43, 15], // 0x6
+    <int>[43, 16], // 0x7
+    <int>[43, 17], // 0x8
+    <int>[43, 18], // 0x9
+    <int>[43, 19], // 0xa
+    <int>[43, 20], // 0xb
+    <int>[43, 21], // 0xc
+    <int>[43, 22], // 0xd
+    <int>[43, 23], // 0xe
+    <int>[43, 24], // 0xf
+    <int>[43, 25], // 0x10
+    <int>[43, 26], // 0x11
+    <int>[43, 27], // 0x12
+    <int>[43, 28], // 0x13
+    <int>[43, 29], // 0x14
+    <int>[43, 30], // 0x15
+    <int>[43, 31], // 0x16
+    <int>[43, 32], // 0x17
+    <int>[43, 33], // 0x18
+    <int>[43, 34], // 0x19
+    <int>[43, 35], // 0x1a
+    <int>[44, 10], // 0x1b
+    <int>[44, 11], // 0x1c
+    <int>[44, 12], // 0x1d
+    <int>[44, 13], // 0x1e
+    <int>[44, 14], // 0x1f
+    <int>[38], // " "
+    <int>[45, 10], // "!"
+    <int>[45, 11], // """
+    <int>[45, 12], // "#"
+    <int>[39], // "$"
+    <int>[42], // "%"
+    <int>[45, 15], // "&"
+    <int>[45, 16], // "'"
+    <int>[45, 17], // "("
+    <int>[45, 18], // ")"
+    <int>[45, 19], // "*"
+    <int>[41], // "+"
+    <int>[45, 21], // ","
+    <int>[36], // "-"
+    <int>[37], // "."
+    <int>[40], // "/"
+    <int>[0], // "0"
+    <int>[1], // "1"
+    <int>[2], // "2"
+    <int>[3], // "3"
+    <int>[4], // "4"
+    <int>[5], // "5"
+    <int>[6], // "6"
+    <int>[7], // "7"
+    <int>[8], // "8"
+    <int>[9], // "9"
+    <int>[45, 35], // ":"
+    <int>[44, 15], // ";"
+    <int>[44, 16], // "<"
+    <int>[44, 17], // "="
+    <int>[44, 18], // ">"
+    <int>[44, 19], // "?"
+    <int>[44, 31], // "@"
+    <int>[10], // "A"
+    <int>[11], // "B"
+    <int>[12], // "C"
+    <int>[13], // "D"
+    <int>[14], // "E"
+    <int>[15], // "F"
+    <int>[16], // "G"
+    <int>[17], // "H"
+    <int>[18], // "I"
+    <int>[19], // "J"
+    <int>[20], // "K"
+    <int>[21], // "L"
+    <int>[22], // "M"
+    <int>[23], // "N"
+    <int>[24], // "O"
+    <int>[25], // "P"
+    <int>[26], // "Q"
+    <int>[27], // "R"
+    <int>[28], // "S"
+    <int>[29], // "T"
+    <int>[30], // "U"
+    <int>[31], // "V"
+    <int>[32], // "W"
+    <int>[33], // "X"
+    <int>[34], // "Y"
+    <int>[35], // "Z"
+    <int>[44, 20], // "["
+    <int>[44, 21], // "\"
+    <int>[44, 22], // "]"
+    <int>[44, 23], // "^"
+    <int>[44, 24], // "_"
+    <int>[44, 32], // "`"
+    <int>[46, 10], // "a"
+    <int>[46, 11], // "b"
+    <int>[46, 12], // "c"
+    <int>[46, 13], // "d"
+    <int>[46, 14], // "e"
+    <int>[46, 15], // "f"
+    <int>[46, 16], // "g"
+    <int>[46, 17], // "h"
+    <int>[46, 18], // "i"
+    <int>[46, 19], // "j"
+    <int>[46, 20], // "k"
+    <int>[46, 21], // "l"
+    <int>[46, 22], // "m"
+    <int>[46, 23], // "n"
+    <int>[46, 24], // "o"
+    <int>[46, 25], // "p"
+    <int>[46, 26], // "q"
+    <int>[46, 27], // "r"
+    <int>[46, 28], // "s"
+    <int>[46, 29], // "t"
+    <int>[46, 30], // "u"
+    <int>[46, 31], // "v"
+    <int>[46, 32], // "w"
+    <int>[46, 33], // "x"
+    <int>[46, 34], // "y"
+    <int>[46, 35], // "z"
+    <int>[44, 25], // "{"
+    <int>[44, 26], // "|"
+    <int>[44, 27], // "}"
+    <int>[44, 28], // "~"
+    <int>[44, 29], // 0x7f
+  ];
+
+  /// Code 93 full ASCII bar widths of the one or two symbols,
+  /// indexed by code unit
+  static const code93AsciiRuns = <List<int>>[
+    <int>[3, 1, 2, 1, 1, 1, 2, 2, 1, 1, 2, 1], // 0x0
+    <int>[1, 2, 1, 2, 2, 1, 2, 1, 1, 1, 1, 3], // 0x1
+    <int>[1, 2, 1, 2, 2, 1, 2, 1, 1, 2, 1, 2], // 0x2
+    <int>[1, 2, 1, 2, 2, 1, 2, 1, 1, 3, 1, 1], // 0x3
+    <int>[1, 2, 1, 2, 2, 1, 2, 2, 1, 1, 1, 2], // 0x4
+    <int>[1, 2, 1, 2, 2, 1, 2, 2, 1, 2, 1, 1], // 0x5
+    <int>[1, 2, 1, 2, 2, 1, 2, 3, 1, 1, 1, 1], // 0x6
+    <int>[1, 2, 1, 2, 2, 1, 1, 1, 2, 1, 1, 3], // 0x7
+    <int>[1, 2, 1, 2, 2, 1, 1, 1, 2, 2, 1, 2], // 0x8
+    <int>[1, 2, 1, 2, 2, 1, 1, 1, 2, 3, 1, 1], // 0x9
+    <int>[1, 2, 1, 2, 2, 1, 1, 2, 2, 1, 1, 2], // 0xa
+    <int>[1, 2, 1, 2, 2, 1, 1, 3, 2, 1, 1, 1], // 0xb
+    <int>[1, 2, 1, 2, 2, 1, 1, 1, 1, 1, 2, 3], // 0xc
+    <int>[1, 2, 1, 2, 2, 1, 1, 1, 1, 2, 2, 2], // 0xd
+    <int>[1, 2, 1, 2, 2, 1, 1, 1, 1, 3, 2, 1], // 0xe
+    <int>[1, 2, 1, 2, 2, 1, 1, 2, 1, 1, 2, 2], // 0xf
+    <int>[1, 2, 1, 2, 2, 1, 1, 3, 1, 1, 2, 1], // 0x10
+    <int>[1, 2, 1, 2, 2, 1, 2, 1, 2, 1, 1, 2], // 0x11
+    <int>[1, 2, 1, 2, 2, 1, 2, 1, 2, 2, 1, 1], // 0x12
+    <int>[1, 2, 1, 2, 2, 1, 2, 1, 1, 1, 2, 2], // 0x13
+    <int>[1, 2, 1, 2, 2, 1, 2, 1, 1, 2, 2, 1], // 0x14
+    <int>[1, 2, 1, 2, 2, 1, 2, 2, 1, 1, 2, 1], // 0x15
+    <int>[1, 2, 1, 2, 2, 1, 2, 2, 2, 1, 1, 1], // 0x16
+    <int>[1, 2, 1, 2, 2, 1, 1, 1, 2, 1, 2, 2], // 0x17
+    <int>[1, 2, 1, 2, 2, 1, 1, 1, 2, 2, 2, 1], // 0x18
+    <int>[1, 2, 1, 2, 2, 1, 1, 2, 2, 1, 2, 1], // 0x19
+    <int>[1, 2, 1, 2, 2, 1, 1, 2, 3, 1, 1, 1], // 0x1a
+    <int>[3, 1, 2, 1, 1, 1, 2, 1, 1, 1, 1, 3], // 0x1b
+    <int>[3, 1, 2, 1, 1, 1, 2, 1, 1, 2, 1, 2], // 0x1c
+    <int>[3, 1, 2, 1, 1, 1, 2, 1, 1, 3, 1, 1], // 0x1d
+    <int>[3, 1, 2, 1, 1, 1, 2, 2, 1, 1, 1, 2], // 0x1e
+    <int>[3, 1, 2, 1, 1, 1, 2, 2, 1, 2, 1, 1], // 0x1f
+    <int>[3, 1, 1, 2, 1, 1], // " "
+    <int>[3, 1, 1, 1, 2, 1, 2, 1, 1, 1, 1, 3], // "!"
+    <int>[3, 1, 1, 1, 2, 1, 2, 1, 1, 2, 1, 2], // """
+    <int>[3, 1, 1, 1, 2, 1, 2, 1, 1, 3, 1, 1], // "#"
+    <int>[3, 2, 1, 1, 1, 1], // "$"
+    <int>[2, 1, 1, 1, 3, 1], // "%"
+    <int>[3, 1, 1, 1, 2, 1, 2, 3, 1, 1, 1, 1], // "&"
+    <int>[3, 1, 1, 1, 2, 1, 1, 1, 2, 1, 1, 3], // "'"
+    <int>[3, 1, 1, 1, 2, 1, 1, 1, 2, 2, 1, 2], // "("
+    <int>[3, 1, 1, 1, 2, 1, 1, 1, 2, 3, 1, 1], // ")"
+    <int>[3, 1, 1, 1, 2, 1, 1, 2, 2, 1, 1, 2], // "*"
+    <int>[1, 1, 3, 1, 2, 1], // "+"
+    <int>[3, 1, 1, 1, 2, 1, 1, 1, 1, 1, 2, 3], // ","
+    <int>[1, 2, 1, 1, 3, 1], // "-"
+    <int>[3, 1, 1, 1, 1, 2], // "."
+    <int>[1, 1, 2, 1, 3, 1], // "/"
+    <int>[1, 3, 1, 1, 1, 2], // "0"
+    <int>[1, 1, 1, 2, 1, 3], // "1"
+    <int>[1, 1, 1, 3, 1, 2], // "2"
+    <int>[1, 1, 1, 4, 1, 1], // "3"
+    <int>[1, 2, 1, 1, 1, 3], // "4"
+    <int>[1, 2, 1, 2, 1, 2], // "5"
+    <int>[1, 2, 1, 3, 1, 1], // "6"
+    <int>[1, 1, 1, 1, 1, 4], // "7"
+    <int>[1, 3, 1, 2, 1, 1], // "8"
+    <int>[1, 4, 1, 1, 1, 1], // "9"
+    <int>[3, 1, 1, 1, 2, 1, 1, 2, 3, 1, 1, 1], // ":"
+    <int>[3, 1, 2, 1, 1, 1, 2, 3, 1, 1, 1, 1], // ";"
+    <int>[3, 1, 2, 1, 1, 1, 1, 1, 2, 1, 1, 3], // "<"
+    <int>[3, 1, 2, 1, 1, 1, 1, 1, 2, 2, 1, 2], // "="
+    <int>[3, 1, 2, 1, 1, 1, 1, 1, 2, 3, 1, 1], // ">"
+    <int>[3, 1, 2, 1, 1, 1, 1, 2, 2, 1, 1, 2], // "?"
+    <int>[3, 1, 2, 1, 1, 1, 2, 2, 2, 1, 1, 1], // "@"
+    <int>[2, 1, 1, 1, 1, 3], // "A"
+    <int>[2, 1, 1, 2, 1, 2], // "B"
+    <int>[2, 1, 1, 3, 1, 1], // "C"
+    <int>[2, 2, 1, 1, 1, 2], // "D"
+    <int>[2, 2, 1, 2, 1, 1], // "E"
+    <int>[2, 3, 1, 1, 1, 1], // "F"
+    <int>[1, 1, 2, 1, 1, 3], // "G"
+    <int>[1, 1, 2, 2, 1, 2], // "H"
+    <int>[1, 1, 2, 3, 1, 1], // "I"
+    <int>[1, 2, 2, 1, 1, 2], // "J"
+    <int>[1, 3, 2, 1, 1, 1], // "K"
+    <int>[1, 1, 1, 1, 2, 3], // "L"
+    <int>[1, 1, 1, 2, 2, 2], // "M"
+    <int>[1, 1, 1, 3, 2, 1], // "N"
+    <int>[1, 2, 1, 1, 2, 2], // "O"
+    <int>[1, 3, 1, 1, 2, 1], // "P"
+    <int>[2, 1, 2, 1, 1, 2], // "Q"
+    <int>[2, 1, 2, 2, 1, 1], // "R"
+    <int>[2, 1, 1, 1, 2, 2], // "S"
+    <int>[2, 1, 1, 2, 2, 1], // "T"
+    <int>[2, 2, 1, 1, 2, 1], // "U"
+    <int>[2, 2, 2, 1, 1, 1], // "V"
+    <int>[1, 1, 2, 1, 2, 2], // "W"
+    <int>[1, 1, 2, 2, 2, 1], // "X"
+    <int>[1, 2, 2, 1, 2, 1], // "Y"
+    <int>[1, 2, 3, 1, 1, 1], // "Z"
+    <int>[3, 1, 2, 1, 1, 1, 1, 3, 2, 1, 1, 1], // "["
+    <int>[3, 1, 2, 1, 1, 1, 1, 1, 1, 1, 2, 3], // "\"
+    <int>[3, 1, 2, 1, 1, 1, 1, 1, 1, 2, 2, 2], // "]"
+    <int>[3, 1, 2, 1, 1, 1, 1, 1, 1, 3, 2, 1], // "^"
+    <int>[3, 1, 2, 1, 1, 1, 1, 2, 1, 1, 2, 2], // "_"
+    <int>[3, 1, 2, 1, 1, 1, 1, 1, 2, 1, 2, 2], // "`"
+    <int>[1, 2, 2, 2, 1, 1, 2, 1, 1, 1, 1, 3], // "a"
+    <int>[1, 2, 2, 2, 1, 1, 2, 1, 1, 2, 1, 2], // "b"
+    <int>[1, 2, 2, 2, 1, 1, 2, 1, 1, 3, 1, 1], // "c"
+    <int>[1, 2, 2, 2, 1, 1, 2, 2, 1, 1, 1, 2], // "d"
+    <int>[1, 2, 2, 2, 1, 1, 2, 2, 1, 2, 1, 1], // "e"
+    <int>[1, 2, 2, 2, 1, 1, 2, 3, 1, 1, 1, 1], // "f"
+    <int>[1, 2, 2, 2, 1, 1, 1, 1, 2, 1, 1, 3], // "g"
+    <int>[1, 2, 2, 2, 1, 1, 1, 1, 2, 2, 1, 2], // "h"
+    <int>[1, 2, 2, 2, 1, 1, 1, 1, 2, 3, 1, 1], // "i"
+    <int>[1, 2, 2, 2, 1, 1, 1, 2, 2, 1, 1, 2], // "j"
+    <int>[1, 2, 2, 2, 1, 1, 1, 3, 2, 1, 1, 1], // "k"
+    <int>[1, 2, 2, 2, 1, 1, 1, 1, 1, 1, 2, 3], // "l"
+    <int>[1, 2, 2, 2, 1, 1, 1, 1, 1, 2, 2, 2], // "m"
+    <int>[1, 2, 2, 2, 1, 1, 1, 1, 1, 3, 2, 1], // "n"
+    <int>[1, 2, 2, 2, 1, 1, 1, 2, 1, 1, 2, 2], // "o"
+    <int>[1, 2, 2, 2, 1, 1, 1, 3, 1, 1, 2, 1], // "p"
+    <int>[1, 2, 2, 2, 1, 1, 2, 1, 2, 1, 1, 2], // "q"
+    <int>[1, 2, 2, 2, 1, 1, 2, 1, 2, 2, 1, 1], // "r"
+    <int>[1, 2, 2, 2, 1, 1, 2, 1, 1, 1, 2, 2], // "s"
+    <int>[1, 2, 2, 2, 1, 1, 2, 1, 1, 2, 2, 1], // "t"
+    <int>[1, 2, 2, 2, 1, 1, 2, 2, 1, 1, 2, 1], // "u"
+    <int>[1, 2, 2, 2, 1, 1, 2, 2, 2, 1, 1, 1], // "v"
+    <int>[1, 2, 2, 2, 1, 1, 1, 1, 2, 1, 2, 2], // "w"
+    <int>[1, 2, 2, 2, 1, 1, 1, 1, 2, 2, 2, 1], // "x"
+    <int>[1, 2, 2, 2, 1, 1, 1, 2, 2, 1, 2, 1], // "y"
+    <int>[1, 2, 2, 2, 1, 1, 1, 2, 3, 1, 1, 1], // "z"
+    <int>[3, 1, 2, 1, 1, 1, 1, 3, 1, 1, 2, 1], // "{"
+    <int>[3, 1, 2, 1, 1, 1, 2, 1, 2, 1, 1, 2], // "|"
+    <int>[3, 1, 2, 1, 1, 1, 2, 1, 2, 2, 1, 1], // "}"
+    <int>[3, 1, 2, 1, 1, 1, 2, 1, 1, 1, 2, 2], // "~"
+    <int>[3, 1, 2, 1, 1, 1, 2, 1, 1, 2, 2, 1], // 0x7f
+  ];
+}
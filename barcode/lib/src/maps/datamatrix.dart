@@ -0,0 +1,3779 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash ffa57c1e8d404483
+// Content hash 432c948b778b1dd2
+
+// ignore_for_file: public_member_api_docs
+
+import 'dart:convert';
+import 'dart:typed_data';
+
+class DataMatrixMaps {
+  /// Data Matrix symbol sizes: rows, columns, regions vertically, regions
+  /// horizontally, data codewords, error correction codewords and blocks
+  static const dataMatrixSizes = <List<int>>[
+    <int>[10, 10, 1, 1, 3, 5, 1],
+    <int>[12, 12, 1, 1, 5, 7, 1],
+    <int>[14, 14, 1, 1, 8, 10, 1],
+    <int>[16, 16, 1, 1, 12, 12, 1],
+    <int>[18, 18, 1, 1, 18, 14, 1],
+    <int>[20, 20, 1, 1, 22, 18, 1],
+    <int>[22, 22, 1, 1, 30, 20, 1],
+    <int>[24, 24, 1, 1, 36, 24, 1],
+    <int>[26, 26, 1, 1, 44, 28, 1],
+    <int>[32, 32, 2, 2, 62, 36, 1],
+    <int>[36, 36, 2, 2, 86, 42, 1],
+    <int>[40, 40, 2, 2, 114, 48, 1],
+    <int>[44, 44, 2, 2, 144, 56, 1],
+    <int>[48, 48, 2, 2, 174, 68, 1],
+    <int>[52, 52, 2, 2, 204, 84, 2],
+    <int>[64, 64, 4, 4, 280, 112, 2],
+    <int>[72, 72, 4, 4, 368, 144, 4],
+    <int>[80, 80, 4, 4, 456, 192, 4],
+    <int>[88, 88, 4, 4, 576, 224, 4],
+    <int>[96, 96, 4, 4, 696, 272, 4],
+    <int>[104, 104, 4, 4, 816, 336, 6],
+    <int>[120, 120, 6, 6, 1050, 408, 6],
+    <int>[132, 132, 6, 6, 1304, 496, 8],
+    <int>[144, 144, 6, 6, 1558, 620, 10],
+  ];
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static const dataMatrixPlacement10x10 = <int>[
+    0x25, 0x26, 0x2f, 0x30, 0x29, 0x39, 0x3a, 0x33, // 0
+    0xb, 0xc, 0x15, 0x16, 0x17, 0x1f, 0x20, 0x21, // 8
+    0x49, 0x4a, 0x53, 0x54, 0x55, 0xd, 0xe, 0xf, // 16
+    0x56, 0x57, 0x10, 0x11, 0x12, 0x1a, 0x1b, 0x1c, // 24
+    0x18, 0x19, 0x22, 0x23, 0x24, 0x2c, 0x2d, 0x2e, // 32
+    0x2a, 0x2b, 0x34, 0x35, 0x36, 0x3e, 0x3f, 0x40, // 40
+    0x44, 0x3d, 0x4e, 0x47, 0x48, 0x58, 0x51, 0x52, // 48
+    0x37, 0x38, 0x41, 0x42, 0x43, 0x4b, 0x4c, 0x4d, // 56
+  ];
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static const dataMatrixPlacement12x12 = <int>[
+    0x15, 0x16, 0x21, 0x22, 0x31, 0x2d, 0x2e, 0x3d, // 0
+    0xd, 0xe, 0x19, 0x1a, 0x1b, 0x25, 0x26, 0x27, // 8
+    0x6d, 0x6e, 0x79, 0x7a, 0x7b, 0xf, 0x10, 0x11, // 16
+    0x7c, 0x7d, 0x12, 0x13, 0x14, 0x1e, 0x1f, 0x20, // 24
+    0x1c, 0x1d, 0x28, 0x29, 0x2a, 0x34, 0x35, 0x36, // 32
+    0x32, 0x33, 0x3e, 0x3f, 0x40, 0x4a, 0x4b, 0x4c, // 40
+    0x3a, 0x49, 0x46, 0x55, 0x56, 0x52, 0x61, 0x62, // 48
+    0x57, 0x58, 0x63, 0x64, 0x65, 0x6f, 0x70, 0x71, // 56
+    0x41, 0x42, 0x4d, 0x4e, 0x4f, 0x59, 0x5a, 0x5b, // 64
+    0x2b, 0x2c, 0x37, 0x38, 0x39, 0x43, 0x44, 0x45, // 72
+    0x50, 0x51, 0x5c, 0x5d, 0x5e, 0x68, 0x69, 0x6a, // 80
+    0x66, 0x67, 0x72, 0x73, 0x74, 0x7e, 0x7f, 0x80, // 88
+    0x82, 0x75, // 96
+  ];
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static const dataMatrixPlacement14x14 = <int>[
+    0x6d, 0x6e, 0x7b, 0x7c, 0x39, 0x89, 0x8a, 0x47, // 0
+    0xf, 0x10, 0x1d, 0x1e, 0x1f, 0x2b, 0x2c, 0x2d, // 8
+    0xa1, 0xa2, 0xaf, 0xb0, 0xb1, 0x11, 0x12, 0x13, // 16
+    0xb2, 0xb3, 0x14, 0x15, 0x16, 0x22, 0x23, 0x24, // 24
+    0x20, 0x21, 0x2e, 0x2f, 0x30, 0x3c, 0x3d, 0x3e, // 32
+    0x3a, 0x3b, 0x48, 0x49, 0x4a, 0x56, 0x57, 0x58, // 40
+    0x98, 0x55, 0xa6, 0x63, 0x64, 0xb4, 0x71, 0x72, // 48
+    0xa9, 0xaa, 0xab, 0x19, 0x1a, 0x28, 0x36, 0x44, // 56
+    0x7f, 0x80, 0x8d, 0x8e, 0x8f, 0x9b, 0x9c, 0x9d, // 64
+    0x65, 0x66, 0x73, 0x74, 0x75, 0x81, 0x82, 0x83, // 72
+    0x4b, 0x4c, 0x59, 0x5a, 0x5b, 0x67, 0x68, 0x69, // 80
+    0x31, 0x32, 0x3f, 0x40, 0x41, 0x4d, 0x4e, 0x4f, // 88
+    0x17, 0x18, 0x25, 0x26, 0x27, 0x33, 0x34, 0x35, // 96
+    0x42, 0x43, 0x50, 0x51, 0x52, 0x5e, 0x5f, 0x60, // 104
+    0x5c, 0x5d, 0x6a, 0x6b, 0x6c, 0x78, 0x79, 0x7a, // 112
+    0x76, 0x77, 0x84, 0x85, 0x86, 0x92, 0x93, 0x94, // 120
+    0x90, 0x91, 0x9e, 0x9f, 0xa0, 0xac, 0xad, 0xae, // 128
+    0x87, 0x88, 0x95, 0x96, 0x97, 0xa3, 0xa4, 0xa5, // 136
+  ];
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static const dataMatrixPlacement16x16 = <int>[
+    0x5d, 0x5e, 0x6d, 0x6e, 0x41, 0x7d, 0x7e, 0x51, // 0
+    0x11, 0x12, 0x21, 0x22, 0x23, 0x31, 0x32, 0x33, // 8
+    0xd5, 0xd6, 0xe5, 0xe6, 0xe7, 0x13, 0x14, 0x15, // 16
+    0xe8, 0xe9, 0x16, 0x17, 0x18, 0x26, 0x27, 0x28, // 24
+    0x24, 0x25, 0x34, 0x35, 0x36, 0x44, 0x45, 0x46, // 32
+    0x42, 0x43, 0x52, 0x53, 0x54, 0x62, 0x63, 0x64, // 40
+    0x8e, 0x61, 0x9e, 0x71, 0x72, 0xae, 0x81, 0x82, // 48
+    0xc1, 0xd1, 0xe1, 0x1b, 0x1c, 0x1d, 0x1e, 0x2e, // 56
+    0x91, 0x92, 0xa1, 0xa2, 0xa3, 0xb1, 0xb2, 0xb3, // 64
+    0x73, 0x74, 0x83, 0x84, 0x85, 0x93, 0x94, 0x95, // 72
+    0x55, 0x56, 0x65, 0x66, 0x67, 0x75, 0x76, 0x77, // 80
+    0x37, 0x38, 0x47, 0x48, 0x49, 0x57, 0x58, 0x59, // 88
+    0x19, 0x1a, 0x29, 0x2a, 0x2b, 0x39, 0x3a, 0x3b, // 96
+    0x2c, 0x2d, 0x3c, 0x3d, 0x3e, 0x4c, 0x4d, 0x4e, // 104
+    0x4a, 0x4b, 0x5a, 0x5b, 0x5c, 0x6a, 0x6b, 0x6c, // 112
+    0x68, 0x69, 0x78, 0x79, 0x7a, 0x88, 0x89, 0x8a, // 120
+    0x86, 0x87, 0x96, 0x97, 0x98, 0xa6, 0xa7, 0xa8, // 128
+    0xa4, 0xa5, 0xb4, 0xb5, 0xb6, 0xc4, 0xc5, 0xc6, // 136
+    0xc2, 0xc3, 0xd2, 0xd3, 0xd4, 0xe2, 0xe3, 0xe4, // 144
+    0xb7, 0xb8, 0xc7, 0xc8, 0xc9, 0xd7, 0xd8, 0xd9, // 152
+    0x99, 0x9a, 0xa9, 0xaa, 0xab, 0xb9, 0xba, 0xbb, // 160
+    0x7b, 0x7c, 0x8b, 0x8c, 0x8d, 0x9b, 0x9c, 0x9d, // 168
+    0xac, 0xad, 0xbc, 0xbd, 0xbe, 0xcc, 0xcd, 0xce, // 176
+    0xca, 0xcb, 0xda, 0xdb, 0xdc, 0xea, 0xeb, 0xec, // 184
+    0xee, 0xdd, // 192
+  ];
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement18x18 = _unpackUint16(
+      'RQBGAFcAWABJAGkAagBbABMAFAAlACYAJwA3ADgAOQARARIBIwEkASUBFQAWABcAJgEn'
+      'ARgAGQAaACoAKwAsACgAKQA6ADsAPABMAE0ATgBKAEsAXABdAF4AbgBvAHAAfABtAI4A'
+      'fwCAAKAAkQCSANUA1gDnAOgA2QD5APoA6wCjAKQAtQC2ALcAxwDIAMkAgQCCAJMAlACV'
+      'AKUApgCnAF8AYABxAHIAcwCDAIQAhQA9AD4ATwBQAFEAYQBiAGMAGwAcAC0ALgAvAD8A'
+      'QABBABkBGgErASwBLQEdAB4AHwAuAS8BIAAhACIAMgAzADQAMAAxAEIAQwBEAFQAVQBW'
+      'AFIAUwBkAGUAZgB2AHcAeAB0AHUAhgCHAIgAmACZAJoAlgCXAKgAqQCqALoAuwC8ALgA'
+      'uQDKAMsAzADcAN0A3gDaANsA7ADtAO4A/gD/AAABDAH9AB4BDwEQATABIQEiAe8A8AAB'
+      'AQIBAwETARQBFQHNAM4A3wDgAOEA8QDyAPMAqwCsAL0AvgC/AM8A0ADRAIkAigCbAJwA'
+      'nQCtAK4ArwBnAGgAeQB6AHsAiwCMAI0AngCfALAAsQCyAMIAwwDEAMAAwQDSANMA1ADk'
+      'AOUA5gDiAOMA9AD1APYABgEHAQgBBAEFARYBFwEYASgBKQEqAfcA+AAJAQoBCwEbARwB'
+      'HQE=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement20x20 = _unpackUint16(
+      'JQAmADkAOgBRAE0ATgBlABUAFgApACoAKwA9AD4APwBVAVYBaQFqAWsBFwAYABkAbAFt'
+      'ARoAGwAcAC4ALwAwACwALQBAAEEAQgBUAFUAVgBSAFMAZgBnAGgAegB7AHwAYgB5AHYA'
+      'jQCOAIoAoQCiAMUAxgDZANoA8QDtAO4ABQG1ALYAyQDKAMsA3QDeAN8AjwCQAKMApACl'
+      'ALcAuAC5AGkAagB9AH4AfwCRAJIAkwBDAEQAVwBYAFkAawBsAG0AHQAeADEAMgAzAEUA'
+      'RgBHAF0BXgFxAXIBcwEfACAAIQB0AXUBIgAjACQANgA3ADgANAA1AEgASQBKAFwAXQBe'
+      'AFoAWwBuAG8AcACCAIMAhACAAIEAlACVAJYAqACpAKoApgCnALoAuwC8AM4AzwDQAMwA'
+      'zQDgAOEA4gD0APUA9gDyAPMABgEHAQgBGgEbARwBAgEZARYBLQEuASoBQQFCAS8BMAFD'
+      'AUQBRQFXAVgBWQEJAQoBHQEeAR8BMQEyATMB4wDkAPcA+AD5AAsBDAENAb0AvgDRANIA'
+      '0wDlAOYA5wCXAJgAqwCsAK0AvwDAAMEAcQByAIUAhgCHAJkAmgCbAEsATABfAGAAYQBz'
+      'AHQAdQCIAIkAnACdAJ4AsACxALIArgCvAMIAwwDEANYA1wDYANQA1QDoAOkA6gD8AP0A'
+      '/gD6APsADgEPARABIgEjASQBIAEhATQBNQE2AUgBSQFKAUYBRwFaAVsBXAFuAW8BcAE3'
+      'ATgBSwFMAU0BXwFgAWEBEQESASUBJgEnATkBOgE7AesA7AD/AAABAQETARQBFQEoASkB'
+      'PAE9AT4BUAFRAVIBTgFPAWIBYwFkAXYBdwF4AXoBZQE=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement22x22 = _unpackUint16(
+      'rQCuAMMAxABZANkA2gBvABcAGAAtAC4ALwBDAEQARQCpAaoBvwHAAcEBGQAaABsAwgHD'
+      'ARwAHQAeADIAMwA0ADAAMQBGAEcASABcAF0AXgBaAFsAcABxAHIAhgCHAIgA8ACFAAYB'
+      'mwCcABwBsQCyAF0BXgFzAXQBCQGJAYoBHwHHAMgA3QDeAN8A8wD0APUAnQCeALMAtAC1'
+      'AMkAygDLAHMAdACJAIoAiwCfAKAAoQBJAEoAXwBgAGEAdQB2AHcAHwAgADUANgA3AEsA'
+      'TABNALEBsgHHAcgByQEhACIAIwDKAcsBJAAlACYAOgA7ADwAOAA5AE4ATwBQAGQAZQBm'
+      'AGIAYwB4AHkAegCOAI8AkACMAI0AogCjAKQAuAC5ALoAtgC3AMwAzQDOAOIA4wDkAOAA'
+      '4QD2APcA+AAMAQ0BDgEKAQsBIAEhASIBNgE3ATgBoAE1AbYBSwFMAcwBYQFiAbkBugG7'
+      'ASkAKgBAAFYAbAB3AXgBjQGOAY8BowGkAaUBTQFOAWMBZAFlAXkBegF7ASMBJAE5AToB'
+      'OwFPAVABUQH5APoADwEQAREBJQEmAScBzwDQAOUA5gDnAPsA/AD9AKUApgC7ALwAvQDR'
+      'ANIA0wB7AHwAkQCSAJMApwCoAKkAUQBSAGcAaABpAH0AfgB/ACcAKAA9AD4APwBTAFQA'
+      'VQBqAGsAgACBAIIAlgCXAJgAlACVAKoAqwCsAMAAwQDCAL4AvwDUANUA1gDqAOsA7ADo'
+      'AOkA/gD/AAABFAEVARYBEgETASgBKQEqAT4BPwFAATwBPQFSAVMBVAFoAWkBagFmAWcB'
+      'fAF9AX4BkgGTAZQBkAGRAaYBpwGoAbwBvQG+AX8BgAGVAZYBlwGrAawBrQFVAVYBawFs'
+      'AW0BgQGCAYMBKwEsAUEBQgFDAVcBWAFZAQEBAgEXARgBGQEtAS4BLwHXANgA7QDuAO8A'
+      'AwEEAQUBGgEbATABMQEyAUYBRwFIAUQBRQFaAVsBXAFwAXEBcgFuAW8BhAGFAYYBmgGb'
+      'AZwBmAGZAa4BrwGwAcQBxQHGAYcBiAGdAZ4BnwGzAbQBtQE=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement24x24 = _unpackUint16(
+      'jQCOAKUApgBhAL0AvgB5ABkAGgAxADIAMwBJAEoASwD9Af4BFQIWAhcCGwAcAB0AGAIZ'
+      'Ah4AHwAgADYANwA4ADQANQBMAE0ATgBkAGUAZgBiAGMAegB7AHwAkgCTAJQA1gCRAO4A'
+      'qQCqAAYBwQDCAE0BTgFlAWYBIQF9AX4BOQHZANoA8QDyAPMACQEKAQsBqwCsAMMAxADF'
+      'ANsA3ADdAH0AfgCVAJYAlwCtAK4ArwBPAFAAZwBoAGkAfwCAAIEAIQAiADkAOgA7AFEA'
+      'UgBTAAUCBgIdAh4CHwIjACQAJQAgAiECJgAnACgAPgA/AEAAPAA9AFQAVQBWAGwAbQBu'
+      'AGoAawCCAIMAhACaAJsAnACYAJkAsACxALIAyADJAMoAxgDHAN4A3wDgAPYA9wD4APQA'
+      '9QAMAQ0BDgEkASUBJgEiASMBOgE7ATwBUgFTAVQBlgFRAa4BaQFqAcYBgQGCAeEB+QER'
+      'AisALAAtAC4ARgCZAZoBsQGyAbMByQHKAcsBawFsAYMBhAGFAZsBnAGdAT0BPgFVAVYB'
+      'VwFtAW4BbwEPARABJwEoASkBPwFAAUEB4QDiAPkA+gD7ABEBEgETAbMAtADLAMwAzQDj'
+      'AOQA5QCFAIYAnQCeAJ8AtQC2ALcAVwBYAG8AcABxAIcAiACJACkAKgBBAEIAQwBZAFoA'
+      'WwBEAEUAXABdAF4AdAB1AHYAcgBzAIoAiwCMAKIAowCkAKAAoQC4ALkAugDQANEA0gDO'
+      'AM8A5gDnAOgA/gD/AAAB/AD9ABQBFQEWASwBLQEuASoBKwFCAUMBRAFaAVsBXAFYAVkB'
+      'cAFxAXIBiAGJAYoBhgGHAZ4BnwGgAbYBtwG4AbQBtQHMAc0BzgHkAeUB5gHiAeMB+gH7'
+      'AfwBEgITAhQCzwHQAecB6AHpAf8BAAIBAqEBogG5AboBuwHRAdIB0wFzAXQBiwGMAY0B'
+      'owGkAaUBRQFGAV0BXgFfAXUBdgF3ARcBGAEvATABMQFHAUgBSQHpAOoAAQECAQMBGQEa'
+      'ARsBuwC8ANMA1ADVAOsA7ADtAAQBBQEcAR0BHgE0ATUBNgEyATMBSgFLAUwBYgFjAWQB'
+      'YAFhAXgBeQF6AZABkQGSAY4BjwGmAacBqAG+Ab8BwAG8Ab0B1AHVAdYB7AHtAe4B6gHr'
+      'AQICAwIEAhoCGwIcAtcB2AHvAfAB8QEHAggCCQKpAaoBwQHCAcMB2QHaAdsBewF8AZMB'
+      'lAGVAasBrAGtAcQBxQHcAd0B3gH0AfUB9gHyAfMBCgILAgwCIgIjAiQCJgINAg==');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement26x26 = _unpackUint16(
+      'ZQBmAH8AgABpAJkAmgCDABsAHAA1ADYANwBPAFAAUQBZAloCcwJ0AnUCHQAeAB8AdgJ3'
+      'AiAAIQAiADoAOwA8ADgAOQBSAFMAVABsAG0AbgBqAGsAhACFAIYAngCfAKAAtACdAM4A'
+      'twC4AOgA0QDSADUBNgFPAVABOQFpAWoBUwHrAOwABQEGAQcBHwEgASEBuQC6ANMA1ADV'
+      'AO0A7gDvAIcAiAChAKIAowC7ALwAvQBVAFYAbwBwAHEAiQCKAIsAIwAkAD0APgA/AFcA'
+      'WABZAGECYgJ7AnwCfQIlACYAJwB+An8CKAApACoAQgBDAEQAQABBAFoAWwBcAHQAdQB2'
+      'AHIAcwCMAI0AjgCmAKcAqACkAKUAvgC/AMAA2ADZANoA1gDXAPAA8QDyAAoBCwEMAQgB'
+      'CQEiASMBJAE8AT0BPgE6ATsBVAFVAVYBbgFvAXABhAFtAZ4BhwGIAbgBoQGiAQUCBgIf'
+      'AiACCQI5AjoCIwK7AbwB1QHWAdcB7wHwAfEBiQGKAaMBpAGlAb0BvgG/AVcBWAFxAXIB'
+      'cwGLAYwBjQElASYBPwFAAUEBWQFaAVsB8wD0AA0BDgEPAScBKAEpAcEAwgDbANwA3QD1'
+      'APYA9wCPAJAAqQCqAKsAwwDEAMUAXQBeAHcAeAB5AJEAkgCTACsALABFAEYARwBfAGAA'
+      'YQBpAmoCgwKEAoUCLQAuAC8AhgKHAjAAMQAyAEoASwBMAEgASQBiAGMAZAB8AH0AfgB6'
+      'AHsAlACVAJYArgCvALAArACtAMYAxwDIAOAA4QDiAN4A3wD4APkA+gASARMBFAEQAREB'
+      'KgErASwBRAFFAUYBQgFDAVwBXQFeAXYBdwF4AXQBdQGOAY8BkAGoAakBqgGmAacBwAHB'
+      'AcIB2gHbAdwB2AHZAfIB8wH0AQwCDQIOAgoCCwIkAiUCJgI+Aj8CQAJUAj0CbgJXAlgC'
+      'iAJxAnICJwIoAkECQgJDAlsCXAJdAvUB9gEPAhACEQIpAioCKwLDAcQB3QHeAd8B9wH4'
+      'AfkBkQGSAasBrAGtAcUBxgHHAV8BYAF5AXoBewGTAZQBlQEtAS4BRwFIAUkBYQFiAWMB'
+      '+wD8ABUBFgEXAS8BMAExAckAygDjAOQA5QD9AP4A/wCXAJgAsQCyALMAywDMAM0A5gDn'
+      'AAABAQECARoBGwEcARgBGQEyATMBNAFMAU0BTgFKAUsBZAFlAWYBfgF/AYABfAF9AZYB'
+      'lwGYAbABsQGyAa4BrwHIAckBygHiAeMB5AHgAeEB+gH7AfwBFAIVAhYCEgITAiwCLQIu'
+      'AkYCRwJIAkQCRQJeAl8CYAJ4AnkCegIvAjACSQJKAksCYwJkAmUC/QH+ARcCGAIZAjEC'
+      'MgIzAssBzAHlAeYB5wH/AQACAQKZAZoBswG0AbUBzQHOAc8BZwFoAYEBggGDAZsBnAGd'
+      'AbYBtwHQAdEB0gHqAesB7AHoAekBAgIDAgQCHAIdAh4CGgIbAjQCNQI2Ak4CTwJQAkwC'
+      'TQJmAmcCaAKAAoECggI3AjgCUQJSAlMCawJsAm0C');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement32x32 = _unpackUint16(
+      '/QD+AB0BHgGBAD0BPgGhACEAIgBBAEIAQwBhAGIAYwCnA6gDxwPIA8kDIwAkACUAygPL'
+      'AyYAJwAoAEYARwBIAEQARQBkAGUAZgCEAIUAhgCCAIMAogCjAKQAwgDDAMQAXgHBAH4B'
+      '4QDiAJ4BAQECAT0CPgJdAl4CgQF9An4CoQEhASIBQQFCAUMBYQFiAWMB4wDkAAMBBAEF'
+      'ASMBJAElAaUApgDFAMYAxwDlAOYA5wBnAGgAhwCIAIkApwCoAKkAKQAqAEkASgBLAGkA'
+      'agBrALEDsgPRA9ID0wMrACwALQDUA9UDLgAxADIATgBRAFIATABNAGwAbQBuAIwAjQCO'
+      'AIoAiwCqAKsArADKAMsAzADIAMkA6ADpAOoACAEJAQoBBgEHASYBJwEoAUYBRwFIAUQB'
+      'RQFkAWUBZgGEAYUBhgGCAYMBogGjAaQBwgHDAcQBngLBAb4CIQIiAt4CQQJCAj0DPgNd'
+      'A14DwQJ9A34D4QJhAmICgQKCAoMCoQKiAqMCIwIkAkMCRAJFAmMCZAJlAqUBpgHFAcYB'
+      'xwElAiYCJwJnAWgBhwGIAYkBpwGoAakBKQEqAUkBSgFLAWkBagFrAesA7AALAQwBDQEr'
+      'ASwBLQGtAK4AzQDOANEA7QDuAPEAcQByAJEAkgCTALEAsgCzADMANABTAFQAVQBzAHQA'
+      'dQC5A7oD2QPaA9sDNQA2ADcA3APdAzgAOQA6AFgAWQBaAFYAVwB2AHcAeACWAJcAmACU'
+      'AJUAtAC1ALYA1ADVANYA0gDTAPIA8wD0ABIBEwEUAQ4BEQEuATEBMgFOAVEBUgFMAU0B'
+      'bAFtAW4BjAGNAY4BigGLAaoBqwGsAcoBywHMAcgByQEoAikCKgJIAkkCSgJGAkcCZgJn'
+      'AmgChgKHAogChAKFAqQCpQKmAsQCxQLGAsICwwLiAuMC5AICAwMDBAOeAwEDvgMhAyID'
+      '3gNBA0IDwQPCA8MDPQA+AF4AfgCeAGEDYgOBA4IDgwOhA6IDowMjAyQDQwNEA0UDYwNk'
+      'A2UD5QLmAgUDBgMHAyUDJgMnA6cCqALHAsgCyQLnAugC6QJpAmoCiQKKAosCqQKqAqsC'
+      'KwIsAksCTAJNAmsCbAJtAq0BrgHNAc4B0QEtAi4CMQJxAXIBkQGSAZMBsQGyAbMBMwE0'
+      'AVMBVAFVAXMBdAF1AfUA9gAVARYBFwE1ATYBNwG3ALgA1wDYANkA9wD4APkAeQB6AJkA'
+      'mgCbALkAugC7ADsAPABbAFwAXQB7AHwAfQCcAJ0AvAC9AL4A3ADdAN4A2gDbAPoA+wD8'
+      'ABoBGwEcARgBGQE4ATkBOgFYAVkBWgFWAVcBdgF3AXgBlgGXAZgBlAGVAbQBtQG2AdQB'
+      '1QHWAdIB0wEyAjMCNAJSAlMCVAJOAlECbgJxAnICjgKRApICjAKNAqwCrQKuAswCzQLO'
+      'AsoCywLqAusC7AIKAwsDDAMIAwkDKAMpAyoDSANJA0oDRgNHA2YDZwNoA4YDhwOIA4QD'
+      'hQOkA6UDpgPEA8UDxgNpA2oDiQOKA4sDqQOqA6sDKwMsA0sDTANNA2sDbANtA+0C7gIN'
+      'Aw4DEQMtAy4DMQOxArIC0QLSAtMC8QLyAvMCcwJ0ApMClAKVArMCtAK1AjUCNgJVAlYC'
+      'VwJ1AnYCdwK3AbgB1wHYAdkBNwI4AjkCeQF6AZkBmgGbAbkBugG7ATsBPAFbAVwBXQF7'
+      'AXwBfQGcAZ0BvAG9Ab4B3AHdAd4B2gHbAToCOwI8AloCWwJcAlgCWQJ4AnkCegKYApkC'
+      'mgKWApcCtgK3ArgC1gLXAtgC1ALVAvQC9QL2AhQDFQMWAxIDEwMyAzMDNANSA1MDVANO'
+      'A1EDbgNxA3IDjgORA5IDjAONA6wDrQOuA8wDzQPOA3MDdAOTA5QDlQOzA7QDtQM1AzYD'
+      'VQNWA1cDdQN2A3cD9wL4AhcDGAMZAzcDOAM5A7kCugLZAtoC2wL5AvoC+wJ7AnwCmwKc'
+      'Ap0CuwK8Ar0C3ALdAvwC/QL+AhwDHQMeAxoDGwM6AzsDPANaA1sDXANYA1kDeAN5A3oD'
+      'mAOZA5oDlgOXA7YDtwO4A9YD1wPYA3sDfAObA5wDnQO7A7wDvQM=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement36x36 = _unpackUint16(
+      'jQCOALEAsgCRANUA1gC1ACUAJgBJAEoASwBtAG4AbwCnBKgEywTMBM0EJwAoACkAzgTP'
+      'BCoAKwAsAE4ATwBQAEwATQBwAHEAcgCUAJUAlgCSAJMAtgC3ALgA2gDbANwA+gDZAB4B'
+      '/QD+AEIBIQEiAa0BrgHRAdIBsQH1AfYB1QFFAUYBaQFqAWsBjQGOAY8B/wAAASMBJAEl'
+      'AUcBSAFJAbkAugDdAN4A3wABAQIBAwFzAHQAlwCYAJkAuwC8AL0ALQAuAFEAUgBTAHUA'
+      'dgB3AK8EsATTBNQE1QQvADAAMQDWBNcEMgAzADQAVgBXAFgAVABVAHgAeQB6AJwAnQCe'
+      'AJoAmwC+AL8AwADiAOMA5ADgAOEABAEFAQYBKAEpASoBJgEnAUoBSwFMAW4BbwFwAWwB'
+      'bQGQAZEBkgG0AbUBtgGyAbMB1gHXAdgB+gH7AfwBGgL5AT4CHQIeAmICQQJCAhUDFgM5'
+      'AzoDGQNdA14DPQOtAq4C0QLSAtMC9QL2AvcCHwIgAkMCRAJFAq8CsAKxAtkB2gH9Af4B'
+      '/wEhAiICIwKTAZQBtwG4AbkB2wHcAd0BTQFOAXEBcgFzAZUBlgGXAQcBCAErASwBLQFP'
+      'AVABUQHBAMIA5QDmAOcACQEKAQsBewB8AJ8AoACjAMMAxADHADcAOABbAFwAXQB/AIAA'
+      'gQC5BLoE3QTeBN8EOQA6ADsA4AThBDwAPQA+AGAAYQBiAF4AXwCCAIMAhACmAKcAqACk'
+      'AKUAyADJAMoA7ADtAO4A6ADrAAwBDwEQATABMwE0AS4BLwFSAVMBVAF2AXcBeAF0AXUB'
+      'mAGZAZoBvAG9Ab4BugG7Ad4B3wHgAQICAwIEAgACAQIkAiUCJgJIAkkCSgJGAkcCsgKz'
+      'ArQC1gLXAtgC1ALVAvgC+QL6AhwDHQMeAxoDGwM+Az8DQANiA2MDZAOCA2EDpgOFA4YD'
+      'ygOpA6oDNQQ2BFkEWgQ5BH0EfgRdBM0DzgPxA/ID8wMVBBYEFwSHA4gDqwOsA60DzwPQ'
+      'A9EDQQNCA2UDZgNnA4kDigOLA/sC/AIfAyADIQNDA0QDRQO1ArYC2QLaAtsC/QL+Av8C'
+      'JwIoAksCTAJNArcCuAK5AuEB4gEFAgYCBwIpAioCKwKbAZwBvwHAAcMB4wHkAecBVwFY'
+      'AXsBfAF9AZ8BoAGhAREBEgE1ATYBNwFZAVoBWwHLAMwA7wDwAPEAEwEUARUBhQCGAKkA'
+      'qgCrAM0AzgDPAD8AQABjAGQAZQCHAIgAiQDBBMIE5QTmBOcEQQBCAEMA6ATpBEQARQBG'
+      'AGgAaQBqAGYAZwCKAIsAjACuAK8AsACsAK0A0ADRANIA9AD1APYA8gDzABYBFwEYAToB'
+      'OwE8ATgBOQFcAV0BXgGAAYEBggF+AX8BogGjAaQBxgHHAcgBxAHFAegB6QHqAQwCDQIO'
+      'AggCCwIsAi8CMAJQAlMCVAJOAk8CugK7ArwC3gLfAuAC3ALdAgADAQMCAyQDJQMmAyID'
+      'IwNGA0cDSANqA2sDbANoA2kDjAONA44DsAOxA7IDrgOvA9ID0wPUA/YD9wP4A/QD9QMY'
+      'BBkEGgQ8BD0EPgQ6BDsEXgRfBGAEggSDBIQEogSBBMYEpQSmBOoEyQTKBGEEYgSFBIYE'
+      'hwSpBKoEqwQbBBwEPwRABEEEYwRkBGUE1QPWA/kD+gP7Ax0EHgQfBI8DkAOzA7QDtQPX'
+      'A9gD2QNJA0oDbQNuA28DkQOSA5MDAwMEAycDKAMrA0sDTANPA78CwALjAuQC5QIHAwgD'
+      'CQMxAjICVQJWAlcCwQLCAsMC6wHsAQ8CEAIRAjMCNAI1AqUBpgHJAcoBywHtAe4B7wFf'
+      'AWABgwGEAYUBpwGoAakBGQEaAT0BPgE/AWEBYgFjAdMA1AD3APgA+QAbARwBHQFAAUEB'
+      'ZAFlAWYBiAGJAYoBhgGHAaoBqwGsAc4BzwHQAcwBzQHwAfEB8gEUAhUCFgISAhMCNgI3'
+      'AjgCWgJbAlwCWAJZAsQCxQLGAugC6QLqAuYC5wIKAwsDDAMuAy8DMAMsAy0DUANRA1ID'
+      'dAN1A3YDcANzA5QDlwOYA7gDuwO8A7YDtwPaA9sD3AP+A/8DAAT8A/0DIAQhBCIERARF'
+      'BEYEQgRDBGYEZwRoBIoEiwSMBIgEiQSsBK0ErgTQBNEE0gRpBGoEjQSOBI8EsQSyBLME'
+      'IwQkBEcESARLBGsEbARvBN8D4AMDBAQEBQQnBCgEKQSZA5oDvQO+A78D4QPiA+MDUwNU'
+      'A3cDeAN5A5sDnAOdAw0DDgMxAzIDMwNVA1YDVwPHAsgC6wLsAu0CDwMQAxEDOQI6Al0C'
+      'XgJfAskCygLLAvMB9AEXAhgCGQI7AjwCPQJgAmECzALNAs4C8ALxAvIC7gLvAhIDEwMU'
+      'AzYDNwM4AzQDNQNYA1kDWgN8A30DfgN6A3sDngOfA6ADwgPDA8QDwAPBA+QD5QPmAwgE'
+      'CQQKBAYEBwQqBCsELAROBE8EUARMBE0EcARxBHIElASVBJYEkASTBLQEtwS4BNgE2wTc'
+      'BHMEdASXBJgEmQS7BLwEvQQtBC4EUQRSBFMEdQR2BHcE5wPoAwsEDAQNBC8EMAQxBKED'
+      'ogPFA8YDxwPpA+oD6wNbA1wDfwOAA4EDowOkA6UDyAPJA+wD7QPuAxAEEQQSBA4EDwQy'
+      'BDMENARWBFcEWARUBFUEeAR5BHoEnASdBJ4EmgSbBL4EvwTABOIE4wTkBHsEfASfBKAE'
+      'oQTDBMQExQQ=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement40x40 = _unpackUint16(
+      'PQE+AWUBZgGhAI0BjgHJACkAKgBRAFIAUwB5AHoAewDPBdAF9wX4BfkFKwAsAC0A+gX7'
+      'BS4ALwAwAFYAVwBYAFQAVQB8AH0AfgCkAKUApgCiAKMAygDLAMwA8gDzAPQAtgHxAN4B'
+      'GQEaAQYCQQFCAX0CfgKlAqYC4QHNAs4CCQJpAWoBkQGSAZMBuQG6AbsBGwEcAUMBRAFF'
+      'AWsBbAFtAc0AzgD1APYA9wAdAR4BHwF/AIAApwCoAKkAzwDQANEAMQAyAFkAWgBbAIEA'
+      'ggCDANcF2AX/BQAGAQYzADQANQACBgUGNgA3ADgAXgBfAGAAXABdAIQAhQCGAKwArQCu'
+      'AKoAqwDSANMA1AD6APsA/AD4APkAIAEhASIBSAFJAUoBRgFHAW4BbwFwAZYBlwGYAZQB'
+      'lQG8Ab0BvgHkAeUB5gHiAeMBCgILAgwCMgIzAjQC9gIxAm4DWQJaApYDgQKCAg0EDgQ1'
+      'BDYEcQNdBF4EmQOpAqoC0QLSAtMCSQNKA0sDWwJcAoMChAKFAqsCrAKtAg0CDgI1AjYC'
+      'NwJdAl4CXwK/AcAB5wHoAekBDwIQAhECcQFyAZkBmgGbAcEBwgHDASMBJAFLAUwBTQFz'
+      'AXQBdQHVANYA/QD+AP8AJQEmAScBhwCIAK8AsACxANcA2ADZADkAOgBhAGIAZQCJAIoA'
+      'jQDhBeIFCQYKBgsGPQA+AD8ADAYNBkAAQQBCAGgAaQBqAGYAZwCOAI8AkAC2ALcAuACy'
+      'ALUA2gDdAN4AAgEFAQYBAAEBASgBKQEqAVABUQFSAU4BTwF2AXcBeAGeAZ8BoAGcAZ0B'
+      'xAHFAcYB7AHtAe4B6gHrARICEwIUAjoCOwI8AjgCOQJgAmECYgKIAokCigKGAocCrgKv'
+      'ArAC1gLXAtgC1ALVAkwDTQNOA3QDdQN2A3IDcwOaA5sDnAPCA8MDxAOGBMEDrgTpA+oD'
+      '1gQRBBIETQVOBXUFdgWxBJ0FngXZBDkEOgRhBGIEYwSJBIoEiwTrA+wDEwQUBBUEOwQ8'
+      'BD0EnQOeA8UDxgPHA+0D7gPvA08DUAN3A3gDeQOfA6ADoQOxArIC2QLaAtsCUQNSA1MD'
+      'YwJkAosCjAKNArMCtAK1AhUCFgI9Aj4CPwJlAmYCZwLHAcgB7wHwAfEBFwIYAhkCeQF6'
+      'AaEBogGlAckBygHNAS0BLgFVAVYBVwF9AX4BfwHfAOAABwEIAQkBLwEwATEBkQCSALkA'
+      'ugC7AOEA4gDjAEMARABrAGwAbQCTAJQAlQDpBeoFEQYSBhMGRQBGAEcAFAYVBkgASQBK'
+      'AHAAcQByAG4AbwCWAJcAmAC+AL8AwAC8AL0A5ADlAOYADAENAQ4BCgELATIBMwE0AVoB'
+      'WwFcAVgBWQGAAYEBggGoAakBqgGmAacBzgHPAdAB9gH3AfgB8gH1ARoCHQIeAkICRQJG'
+      'AkACQQJoAmkCagKQApECkgKOAo8CtgK3ArgC3gLfAuAC3ALdAlQDVQNWA3wDfQN+A3oD'
+      'ewOiA6MDpAPKA8sDzAPIA8kD8APxA/IDGAQZBBoEFgQXBD4EPwRABGYEZwRoBGQEZQSM'
+      'BI0EjgS0BLUEtgSyBLME2gTbBNwEAgUDBQQFxgUBBe4FKQUqBRYGUQVSBfEF8gXzBU0A'
+      'TgB2AJ4AxgB5BXoFoQWiBaMFyQXKBcsFKwUsBVMFVAVVBXsFfAV9Bd0E3gQFBQYFBwUt'
+      'BS4FLwWPBJAEtwS4BLkE3wTgBOEEQQRCBGkEagRrBJEEkgSTBPMD9AMbBBwEHQRDBEQE'
+      'RQSlA6YDzQPOA88D9QP2A/cDVwNYA38DgAOBA6cDqAOpA7kCugLhAuIC5QJZA1oDXQNt'
+      'Am4ClQKWApcCvQK+Ar8CHwIgAkcCSAJJAm8CcAJxAtEB0gH5AfoB+wEhAiICIwKDAYQB'
+      'qwGsAa0B0wHUAdUBNQE2AV0BXgFfAYUBhgGHAecA6AAPARABEQE3ATgBOQGZAJoAwQDC'
+      'AMMA6QDqAOsASwBMAHMAdAB1AJsAnACdAMQAxQDsAO0A7gAUARUBFgESARMBOgE7ATwB'
+      'YgFjAWQBYAFhAYgBiQGKAbABsQGyAa4BrwHWAdcB2AH+Af8BAAL8Af0BJAIlAiYCTAJN'
+      'Ak4CSgJLAnICcwJ0ApoCmwKcApgCmQLAAsECwgLoAukC6gLmAucCXgNfA2ADhgOHA4gD'
+      'ggOFA6oDrQOuA9ID1QPWA9AD0QP4A/kD+gMgBCEEIgQeBB8ERgRHBEgEbgRvBHAEbARt'
+      'BJQElQSWBLwEvQS+BLoEuwTiBOME5AQKBQsFDAUIBQkFMAUxBTIFWAVZBVoFVgVXBX4F'
+      'fwWABaYFpwWoBaQFpQXMBc0FzgX0BfUF9gWBBYIFqQWqBasF0QXSBdMFMwU0BVsFXAVd'
+      'BYMFhAWFBeUE5gQNBQ4FDwU1BTYFNwWXBJgEvwTABMEE5wToBOkESQRKBHEEcgR1BJkE'
+      'mgSdBP0D/gMlBCYEJwRNBE4ETwSvA7AD1wPYA9kD/wMABAEEYQNiA4kDigOLA7EDsgOz'
+      'A8MCxALrAuwC7QJjA2QDZQN1AnYCnQKeAp8CxQLGAscCJwIoAk8CUAJRAncCeAJ5AtkB'
+      '2gEBAgICAwIpAioCKwKLAYwBswG0AbUB2wHcAd0BBAIFAiwCLQIuAlQCVQJWAlICUwJ6'
+      'AnsCfAKiAqMCpAKgAqECyALJAsoC8ALxAvIC7gLvAmYDZwNoA44DjwOQA4wDjQO0A7UD'
+      'tgPcA90D3gPaA9sDAgQDBAQEKgQrBCwEKAQpBFAEUQRSBHgEeQR6BHYEdwSeBJ8EoATG'
+      'BMcEyATCBMUE6gTtBO4EEgUVBRYFEAURBTgFOQU6BWAFYQViBV4FXwWGBYcFiAWuBa8F'
+      'sAWsBa0F1AXVBdYF/AX9Bf4FiQWKBbEFsgW1BdkF2gXdBT0FPgVlBWYFZwWNBY4FjwXv'
+      'BPAEFwUYBRkFPwVABUEFoQSiBMkEygTLBPEE8gTzBFMEVAR7BHwEfQSjBKQEpQQFBAYE'
+      'LQQuBC8EVQRWBFcEtwO4A98D4APhAwcECAQJBGkDagORA5IDkwO5A7oDuwPLAswC8wL0'
+      'AvUCawNsA20DlAOVA7wDvQO+A+QD5QPmA+ID4wMKBAsEDAQyBDMENAQwBDEEWARZBFoE'
+      'gASBBIIEfgR/BKYEpwSoBM4EzwTQBMwEzQT0BPUE9gQcBR0FHgUaBRsFQgVDBUQFagVr'
+      'BWwFaAVpBZAFkQWSBbgFuQW6BbYFtwXeBd8F4AUGBgcGCAaTBZQFuwW8Bb0F4wXkBeUF'
+      'RQVGBW0FbgVvBZUFlgWXBfcE+AQfBSAFIQVHBUgFSQWpBKoE0QTSBNME+QT6BPsEWwRc'
+      'BIMEhASFBKsErAStBNQE1QT8BP0E/gQkBSUFJgUiBSMFSgVLBUwFcgVzBXQFcAVxBZgF'
+      'mQWaBcAFwQXCBb4FvwXmBecF6AUOBg8GEAabBZwFwwXEBcUF6wXsBe0F');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement44x44 = _unpackUint16(
+      'rQCuANkA2gCxAAUBBgHdAC0ALgBZAFoAWwCFAIYAhwAPBxAHOwc8Bz0HLwAwADEAPgc/'
+      'BzIAMwA0AF4AXwBgAFwAXQCIAIkAigC0ALUAtgCyALMA3gDfAOAACgELAQwBMgEJAV4B'
+      'NQE2AYoBYQFiAQ0CDgI5AjoCEQJlAmYCPQKNAY4BuQG6AbsB5QHmAecBNwE4AWMBZAFl'
+      'AY8BkAGRAeEA4gANAQ4BDwE5AToBOwGLAIwAtwC4ALkA4wDkAOUANQA2AGEAYgBjAI0A'
+      'jgCPABcHGAdDB0QHRQc3ADgAOQBGB0cHOgA7ADwAZgBnAGgAZABlAJAAkQCSALwAvQC+'
+      'ALoAuwDmAOcA6AASARMBFAEQAREBPAE9AT4BaAFpAWoBZgFnAZIBkwGUAb4BvwHAAbwB'
+      'vQHoAekB6gEUAhUCFgISAhMCPgI/AkACagJrAmwCkgJpAr4ClQKWAuoCwQLCAm0DbgOZ'
+      'A5oDcQMdBB4E9QPtAu4CGQMaAxsDRQNGA0cDlwKYAsMCxALFAu8C8ALxAkECQgJtAm4C'
+      'bwKZApoCmwLrAewBFwIYAhkCQwJEAkUClQGWAcEBwgHDAe0B7gHvAT8BQAFrAWwBbQGX'
+      'AZgBmQHpAOoAFQEWARcBQQFCAUMBkwCUAL8AwADBAOsA7ADtAD0APgBpAGoAawCVAJYA'
+      'lwAfByAHSwdMB08HPwBAAEMAUAdRB0QARQBGAHAAcQByAGwAbwCYAJsAnADEAMcAyADC'
+      'AMMA7gDvAPAAGgEbARwBGAEZAUQBRQFGAXABcQFyAW4BbwGaAZsBnAHGAccByAHEAcUB'
+      '8AHxAfIBHAIdAh4CGgIbAkYCRwJIAnICcwJ0AnACcQKcAp0CngLIAskCygLGAscC8gLz'
+      'AvQCHgMfAyADHAMdA0gDSQNKA3QDdQN2A3IDcwP2A/cD+AMiBCMEJARKBCEEdgRNBE4E'
+      'ogR5BHoEJQUmBVEFUgUpBX0FfgVVBaUEpgTRBNIE0wT9BP4E/wRPBFAEewR8BH0EpwSo'
+      'BKkE+QP6AyUEJgQnBFEEUgRTBEsDTAN3A3gDeQP7A/wD/QP1AvYCIQMiAyMDTQNOA08D'
+      'nwKgAssCzALNAvcC+AL5AkkCSgJ1AnYCdwKhAqICowLzAfQBHwIgAiECSwJMAk0CnQGe'
+      'AckBygHLAfUB9gH3AUcBSAFzAXQBdwGfAaABowHzAPQAHwEgASEBSwFMAU0BnQCeAMkA'
+      'ygDLAPUA9gD3AEcASABzAHQAdQCfAKAAoQApByoHVQdWB1cHSQBKAEsAWAdZB0wATQBO'
+      'AHgAeQB6AHYAdwCiAKMApADOAM8A0ADMAM0A+AD5APoAJAElASYBIgEjAU4BTwFQAXoB'
+      'ewF8AXgBeQGkAaUBpgHQAdEB0gHMAc8B+AH7AfwBJAInAigCIgIjAk4CTwJQAnoCewJ8'
+      'AngCeQKkAqUCpgLQAtEC0gLOAs8C+gL7AvwCJgMnAygDJAMlA1ADUQNSA3wDfQN+A3oD'
+      'ewP+A/8DAAQqBCsELAQoBCkEVARVBFYEgASBBIIEfgR/BKoEqwSsBNYE1wTYBNQE1QQA'
+      'BQEFAgUsBS0FLgUqBSsFVgVXBVgFggWDBYQFqgWBBdYFrQWuBQIG2QXaBYUGhgaxBrIG'
+      'iQbdBt4GtQYFBgYGMQYyBjMGXQZeBl8GrwWwBdsF3AXdBQcGCAYJBlkFWgWFBYYFhwWx'
+      'BbIFswUDBQQFLwUwBTEFWwVcBV0FrQSuBNkE2gTbBAUFBgUHBVcEWASDBIQEhQSvBLAE'
+      'sQQBBAIELQQuBC8EWQRaBFsEUwNUA38DgAOBAwMEBAQFBP0C/gIpAyoDKwNVA1YDVwOn'
+      'AqgC0wLUAtcC/wIAAwMDUwJUAn8CgAKBAqsCrAKtAv0B/gEpAioCKwJVAlYCVwKnAagB'
+      '0wHUAdUB/wEAAgECUQFSAX0BfgF/AakBqgGrAfsA/AAnASgBKQFTAVQBVQGlAKYA0QDS'
+      'ANMA/QD+AP8ATwBQAHsAfAB9AKcAqACpADEHMgddB14HXwdRAFIAUwBgB2EHVABVAFYA'
+      'gACBAIIAfgB/AKoAqwCsANYA1wDYANQA1QAAAQEBAgEsAS0BLgEqASsBVgFXAVgBggGD'
+      'AYQBgAGBAawBrQGuAdgB2QHaAdYB1wECAgMCBAIuAi8CMAIsAi0CWAJZAloChAKFAoYC'
+      'ggKDAq4CrwKwAtoC2wLcAtgC2QIEAwUDBgMwAzEDMgMsAy8DWANbA1wDhAOHA4gDggOD'
+      'AwYEBwQIBDIEMwQ0BDAEMQRcBF0EXgSIBIkEigSGBIcEsgSzBLQE3gTfBOAE3ATdBAgF'
+      'CQUKBTQFNQU2BTIFMwVeBV8FYAWKBYsFjAWIBYkFtAW1BbYF4AXhBeIF3gXfBQoGCwYM'
+      'BjYGNwY4BjQGNQZgBmEGYgaMBo0GjgaKBosGtga3BrgG4gbjBuQGCgfhBjYHDQcOB2IH'
+      'OQc6B7kGugblBuYG5wYRBxIHEwdjBmQGjwaQBpEGuwa8Br0GDQYOBjkGOgY7BmUGZgZn'
+      'BrcFuAXjBeQF5QUPBhAGEQZhBWIFjQWOBY8FuQW6BbsFCwUMBTcFOAU5BWMFZAVlBbUE'
+      'tgThBOIE4wQNBQ4FDwVfBGAEiwSMBI8EtwS4BLsECwQMBDcEOAQ5BGMEZARlBF0DXgOJ'
+      'A4oDiwMNBA4EDwQHAwgDMwM0AzUDXwNgA2EDsQKyAt0C3gLfAgkDCgMLA1sCXAKHAogC'
+      'iQKzArQCtQIFAgYCMQIyAjMCXQJeAl8CrwGwAdsB3AHdAQcCCAIJAlkBWgGFAYYBhwGx'
+      'AbIBswEDAQQBLwEwATEBWwFcAV0BiAGJAbQBtQG2AeAB4QHiAd4B3wEKAgsCDAI2AjcC'
+      'OAI0AjUCYAJhAmICjAKNAo4CigKLArYCtwK4AuIC4wLkAuAC4QIMAw0DDgM4AzkDOgM2'
+      'AzcDYgNjA2QDjgOPA5ADjAONAxAEEQQSBDwEPQQ+BDoEOwRmBGcEaASSBJMElASQBJEE'
+      'vAS9BL4E6ATpBOoE5ATnBBAFEwUUBTwFPwVABToFOwVmBWcFaAWSBZMFlAWQBZEFvAW9'
+      'Bb4F6AXpBeoF5gXnBRIGEwYUBj4GPwZABjwGPQZoBmkGagaUBpUGlgaSBpMGvga/BsAG'
+      '6gbrBuwG6AbpBhQHFQcWB0AHQQdCB8EGwgbtBu4G7wYZBxoHGwdrBmwGlwaYBpkGwwbE'
+      'BsUGFQYWBkEGQgZDBm0GbgZvBr8FwAXrBewF7wUXBhgGGwZrBWwFlwWYBZkFwwXEBcUF'
+      'FQUWBUEFQgVDBW0FbgVvBb8EwATrBOwE7QQXBRgFGQVpBGoElQSWBJcEwQTCBMMEEwQU'
+      'BD8EQARBBGsEbARtBGUDZgORA5IDkwMVBBYEFwQPAxADOwM8Az0DZwNoA2kDuQK6AuUC'
+      '5gLnAhEDEgMTA2MCZAKPApACkQK7ArwCvQLoAukCFAMVAxYDQANBA0IDPgM/A2oDawNs'
+      'A5YDlwOYA5QDlQMYBBkEGgREBEUERgRCBEMEbgRvBHAEmgSbBJwEmASZBMQExQTGBPAE'
+      '8QTyBO4E7wQaBRsFHAVGBUcFSAVEBUUFcAVxBXIFnAWdBZ4FmgWbBcYFxwXIBfIF8wX0'
+      'BfAF8QUcBh0GHgZIBkkGSgZEBkcGcAZzBnQGnAafBqAGmgabBsYGxwbIBvIG8wb0BvAG'
+      '8QYcBx0HHgdIB0kHSgfLBswG9wb4BvkGIwckByUHdQZ2BqEGogajBs0GzgbPBh8GIAZL'
+      'BkwGTQZ3BngGeQbJBcoF9QX2BfcFIQYiBiMGcwV0BZ8FoAWhBcsFzAXNBR0FHgVJBUoF'
+      'SwV1BXYFdwXHBMgE8wT0BPUEHwUgBSEFcQRyBJ0EngSfBMkEygTLBBsEHARHBEgESQRz'
+      'BHQEdQSgBKEEzATNBM4E+AT5BPoE9gT3BCIFIwUkBU4FTwVQBUwFTQV4BXkFegWkBaUF'
+      'pgWiBaMFzgXPBdAF+gX7BfwF+AX5BSQGJQYmBlAGUQZSBk4GTwZ6BnsGfAamBqcGqAak'
+      'BqUG0AbRBtIG/Ab9Bv4G+gb7BiYHJwcoB1IHUwdUB9MG1Ab/BgAHAQcrBywHLQd9Bn4G'
+      'qQaqBqsG1QbWBtcGJwYoBlMGVAZVBn8GgAaBBtEF0gX9Bf4F/wUpBioGKwZ7BXwFpwWo'
+      'BakF0wXUBdUFAAYBBiwGLQYuBlgGWQZaBlYGVwaCBoMGhAauBq8GsAasBq0G2AbZBtoG'
+      'BAcFBwYHAgcDBy4HLwcwB1oHWwdcB9sG3AYHBwgHCQczBzQHNQc=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement48x48 = _unpackUint16(
+      'fQF+Aa0BrgHBAN0B3gHxADEAMgBhAGIAYwCRAJIAkwB3CHgIpwioCKkIMwA0ADUAqgir'
+      'CDYANwA4AGYAZwBoAGQAZQCUAJUAlgDEAMUAxgDCAMMA8gDzAPQAIgEjASQBDgIhAT4C'
+      'UQFSAW4CgQGCAf0C/gItAy4DQQJdA14DcQKxAbIB4QHiAeMBEQISAhMCUwFUAYMBhAGF'
+      'AbMBtAG1AfUA9gAlASYBJwFVAVYBVwGXAJgAxwDIAMkA9wD4APkAOQA6AGkAagBrAJkA'
+      'mgCbAH8IgAivCLAIsQg7ADwAPQCyCLMIPgA/AEAAbgBvAHAAbABtAJwAnQCeAMwAzQDO'
+      'AMoAywD6APsA/AAqASsBLAEoASkBWAFZAVoBiAGJAYoBhgGHAbYBtwG4AeYB5wHoAeQB'
+      '5QEUAhUCFgJEAkUCRgJCAkMCcgJzAnQCogKjAqQCjgOhAr4D0QLSAu4DAQMCA90E3gQN'
+      'BQ4FwQM9BT4F8QMxAzIDYQNiA2MDkQOSA5MD0wLUAgMDBAMFAzMDNAM1A3UCdgKlAqYC'
+      'pwLVAtYC1wIXAhgCRwJIAkkCdwJ4AnkCuQG6AekB6gHrARkCGgIbAlsBXAGLAYwBjQG7'
+      'AbwBvQH9AP4ALQEuAS8BXQFeAV8BnwCgAM8A0ADRAP8AAAEBAUEAQgBxAHIAcwChAKIA'
+      'owCJCIoIuQi6CLsIQwBEAEUAvAi9CEYASQBKAHYAeQB6AHQAdQCkAKUApgDUANUA1gDS'
+      'ANMAAgEDAQQBMgEzATQBMAExAWABYQFiAZABkQGSAY4BjwG+Ab8BwAHuAe8B8AHsAe0B'
+      'HAIdAh4CTAJNAk4CSgJLAnoCewJ8AqoCqwKsAqgCqQLYAtkC2gIIAwkDCgMGAwcDNgM3'
+      'AzgDZgNnA2gDZANlA5QDlQOWA8QDxQPGA8IDwwPyA/MD9AMiBCMEJARuBSEEngWxBLIE'
+      'zgXhBOIEXQZeBo0GjgahBb0GvgbRBREFEgVBBUIFQwVxBXIFcwWzBLQE4wTkBOUEEwUU'
+      'BRUF9QP2AyUEJgQnBLUEtgS3BJcDmAPHA8gDyQP3A/gD+QM5AzoDaQNqA2sDmQOaA5sD'
+      '2wLcAgsDDAMNAzsDPAM9A30CfgKtAq4CrwLdAt4C3wIfAiACTwJQAlECfwKAAoECwQHC'
+      'AfEB8gHzASECIgIjAmMBZAGTAZQBlQHDAcQBxQEFAQYBNQE2ATkBZQFmAWkBqQCqANkA'
+      '2gDbAAkBCgELAUsATAB7AHwAfQCrAKwArQCRCJIIwQjCCMMITQBOAE8AxAjFCFAAUQBS'
+      'AIAAgQCCAH4AfwCuAK8AsADeAN8A4ADcAN0ADAENAQ4BPAE9AT4BOgE7AWoBawFsAZoB'
+      'mwGcAZYBmQHGAckBygH2AfkB+gH0AfUBJAIlAiYCVAJVAlYCUgJTAoICgwKEArICswK0'
+      'ArACsQLgAuEC4gIQAxEDEgMOAw8DPgM/A0ADbgNvA3ADbANtA5wDnQOeA8wDzQPOA8oD'
+      'ywP6A/sD/AMqBCsELAQoBCkEuAS5BLoE6ATpBOoE5gTnBBYFFwUYBUYFRwVIBUQFRQV0'
+      'BXUFdgWkBaUFpgWiBaMF0gXTBdQFAgYDBgQG7gYBBh4HMQYyBk4HYQZiBt0H3gcNCA4I'
+      'IQc9CD4IUQeRBpIGwQbCBsMG8QbyBvMGMwY0BmMGZAZlBpMGlAaVBtUF1gUFBgYGBwY1'
+      'BjYGNwZ3BXgFpwWoBakF1wXYBdkFGQUaBUkFSgVLBXkFegV7BbsEvATrBOwE7QQbBRwF'
+      'HQX9A/4DLQQuBC8EvQS+BL8EnwOgA88D0APRA/8DAAQBBEEDQgNxA3IDcwOhA6IDowPj'
+      'AuQCEwMUAxUDQwNEA0UDhQKGArUCtgK5AuUC5gLpAikCKgJZAloCWwKJAooCiwLLAcwB'
+      '+wH8Af0BKwIsAi0CbQFuAZ0BngGfAc0BzgHPAQ8BEAE/AUABQQFvAXABcQGxALIA4QDi'
+      'AOMAEQESARMBUwBUAIMAhACFALMAtAC1AJkImgjJCMoIywhVAFYAVwDMCM0IWABZAFoA'
+      'iACJAIoAhgCHALYAtwC4AOYA5wDoAOQA5QAUARUBFgFEAUUBRgFCAUMBcgFzAXQBogGj'
+      'AaQBoAGhAdAB0QHSAQACAQICAv4B/wEuAi8CMAJeAl8CYAJcAl0CjAKNAo4CvAK9Ar4C'
+      'ugK7AuoC6wLsAhoDGwMcAxYDGQNGA0kDSgN2A3kDegN0A3UDpAOlA6YD1APVA9YD0gPT'
+      'AwIEAwQEBDIEMwQ0BDAEMQTABMEEwgTwBPEE8gTuBO8EHgUfBSAFTgVPBVAFTAVNBXwF'
+      'fQV+BawFrQWuBaoFqwXaBdsF3AUKBgsGDAYIBgkGOAY5BjoGaAZpBmoGZgZnBpYGlwaY'
+      'BsYGxwbIBsQGxQb0BvUG9gYkByUHJgciByMHUgdTB1QHggeDB4QHbgiBB54IsQeyB84I'
+      '4QfiB6EIogijCF0AXgCOAL4A7gARCBIIQQhCCEMIcQhyCHMIswe0B+MH5AflBxMIFAgV'
+      'CFUHVgeFB4YHhwe1B7YHtwf3BvgGJwcoBykHVwdYB1kHmQaaBskGygbLBvkG+gb7BjsG'
+      'PAZrBmwGbQabBpwGnQbdBd4FDQYOBg8GPQY+Bj8GfwWABa8FsAWxBd8F4AXhBSEFIgVR'
+      'BVIFUwWBBYIFgwXDBMQE8wT0BPUEIwUkBSUFBQQGBDUENgQ5BMUExgTJBKkDqgPZA9oD'
+      '2wMJBAoECwRLA0wDewN8A30DqwOsA60D7QLuAh0DHgMfA00DTgNPA48CkAK/AsACwQLv'
+      'AvAC8QIxAjICYQJiAmMCkQKSApMC0wHUAQMCBAIFAjMCNAI1AnUBdgGlAaYBpwHVAdYB'
+      '1wEXARgBRwFIAUkBdwF4AXkBuQC6AOkA6gDrABkBGgEbAVsAXACLAIwAjQC7ALwAvQDs'
+      'AO0AHAEdAR4BTAFNAU4BSgFLAXoBewF8AaoBqwGsAagBqQHYAdkB2gEIAgkCCgIGAgcC'
+      'NgI3AjgCZgJnAmgCZAJlApQClQKWAsQCxQLGAsICwwLyAvMC9AIiAyMDJAMgAyEDUANR'
+      'A1IDgAOBA4IDfgN/A64DrwOwA94D3wPgA9wD3QMMBA0EDgQ8BD0EPgQ6BDsEygTLBMwE'
+      '+gT7BPwE9gT5BCYFKQUqBVYFWQVaBVQFVQWEBYUFhgW0BbUFtgWyBbMF4gXjBeQFEgYT'
+      'BhQGEAYRBkAGQQZCBnAGcQZyBm4GbwaeBp8GoAbOBs8G0AbMBs0G/Ab9Bv4GLActBy4H'
+      'KgcrB1oHWwdcB4oHiweMB4gHiQe4B7kHugfoB+kH6gfmB+cHFggXCBgIRghHCEgIRAhF'
+      'CHQIdQh2CKQIpQimCBkIGghJCEoISwh5CHoIewi7B7wH6wfsB+0HGwgcCB0IXQdeB40H'
+      'jgePB70Hvge/B/8GAAcvBzAHMQdfB2AHYQehBqIG0QbSBtMGAQcCBwMHQwZEBnMGdAZ1'
+      'BqMGpAalBuUF5gUVBhYGGQZFBkYGSQaJBYoFuQW6BbsF6QXqBesFKwUsBVsFXAVdBYsF'
+      'jAWNBc0EzgT9BP4E/wQtBS4FLwUPBBAEPwRABEEEzwTQBNEEsQOyA+ED4gPjAxEEEgQT'
+      'BFMDVAODA4QDhQOzA7QDtQP1AvYCJQMmAycDVQNWA1cDlwKYAscCyALJAvcC+AL5AjkC'
+      'OgJpAmoCawKZApoCmwLbAdwBCwIMAg0COwI8Aj0CbAJtApwCnQKeAswCzQLOAsoCywL6'
+      'AvsC/AIqAysDLAMoAykDWANZA1oDiAOJA4oDhgOHA7YDtwO4A+YD5wPoA+QD5QMUBBUE'
+      'FgREBEUERgRCBEME0gTTBNQEAgUDBQQFAAUBBTAFMQUyBWAFYQViBV4FXwWOBY8FkAW+'
+      'Bb8FwAW8Bb0F7AXtBe4FHAYdBh4GGgYbBkoGSwZMBnoGewZ8BnYGeQamBqkGqgbWBtkG'
+      '2gbUBtUGBAcFBwYHNAc1BzYHMgczB2IHYwdkB5IHkweUB5AHkQfAB8EHwgfwB/EH8gfu'
+      'B+8HHggfCCAITghPCFAITAhNCHwIfQh+CKwIrQiuCCEIIghRCFIIUwiBCIIIgwjDB8QH'
+      '8wf0B/UHIwgkCCUIZQdmB5UHlgeZB8UHxgfJBwkHCgc5BzoHOwdpB2oHawerBqwG2wbc'
+      'Bt0GCwcMBw0HTQZOBn0GfgZ/Bq0GrgavBu8F8AUfBiAGIQZPBlAGUQaRBZIFwQXCBcMF'
+      '8QXyBfMFMwU0BWMFZAVlBZMFlAWVBdUE1gQFBQYFBwU1BTYFNwUXBBgERwRIBEkE1wTY'
+      'BNkEuQO6A+kD6gPrAxkEGgQbBFsDXAOLA4wDjQO7A7wDvQPsA+0DHAQdBB4ETARNBE4E'
+      'SgRLBNoE2wTcBAoFCwUMBQgFCQU4BTkFOgVoBWkFagVmBWcFlgWXBZgFxgXHBcgFxAXF'
+      'BfQF9QX2BSQGJQYmBiIGIwZSBlMGVAaCBoMGhAaABoEGsAaxBrIG4AbhBuIG3gbfBg4H'
+      'DwcQBz4HPwdABzwHPQdsB20HbgecB50HngeaB5sHygfLB8wH+gf7B/wH9gf5ByYIKQgq'
+      'CFYIWQhaCFQIVQiECIUIhgi0CLUItggrCCwIWwhcCF0IiwiMCI0IzQfOB/0H/gf/By0I'
+      'LggvCG8HcAefB6AHoQfPB9AH0QcRBxIHQQdCB0MHcQdyB3MHswa0BuMG5AblBhMHFAcV'
+      'B1UGVgaFBoYGhwa1BrYGtwb3BfgFJwYoBikGVwZYBlkGmQWaBckFygXLBfkF+gX7BTsF'
+      'PAVrBWwFbQWbBZwFnQXMBc0F/AX9Bf4FLAYtBi4GKgYrBloGWwZcBooGiwaMBogGiQa4'
+      'BrkGugboBukG6gbmBucGFgcXBxgHRgdHB0gHRAdFB3QHdQd2B6QHpQemB6IHowfSB9MH'
+      '1AcCCAMIBAgACAEIMAgxCDIIYAhhCGIIXghfCI4IjwiQCL4IvwjACDMINAhjCGQIZQiT'
+      'CJQIlQjVB9YHBQgGCAcINQg2CDcIdwd4B6cHqAepB9cH2AfZBxkHGgdJB0oHSwd5B3oH'
+      'ewe7BrwG6wbsBu0GGwccBx0HTAdNB3wHfQd+B6wHrQeuB6oHqwfaB9sH3AcKCAsIDAgI'
+      'CAkIOAg5CDoIaAhpCGoIZghnCJYIlwiYCMYIxwjICDsIPAhrCGwIbQibCJwInQg=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement52x52 = _unpackUint16(
+      'zQDOAAEBAgHRADUBNgEFATUANgBpAGoAawCdAJ4AnwD3CfgJKwosCi0KNwA4ADkALgov'
+      'CjoAOwA8AG4AbwBwAGwAbQCgAKEAogDUANUA1gDSANMABgEHAQgBOgE7ATwBagE5AZ4B'
+      'bQFuAdIBoQGiAW0CbgKhAqICcQLVAtYCpQLVAdYBCQIKAgsCPQI+Aj8CbwFwAaMBpAGl'
+      'AdcB2AHZAQkBCgE9AT4BPwFxAXIBcwGjAKQA1wDYANkACwEMAQ0BPQA+AHEAcgBzAKUA'
+      'pgCnAP8JAAozCjQKNQo/AEAAQQA2CjcKQgBDAEQAdgB3AHgAdAB1AKgAqQCqANwA3QDe'
+      'ANoA2wAOAQ8BEAFCAUMBRAFAAUEBdAF1AXYBqAGpAaoBpgGnAdoB2wHcAQ4CDwIQAgwC'
+      'DQJAAkECQgJ0AnUCdgJyAnMCpgKnAqgC2gLbAtwCCgPZAj4DDQMOA3IDQQNCAw0EDgRB'
+      'BEIEEQR1BHYERQR1A3YDqQOqA6sD3QPeA98DDwMQA0MDRANFA3cDeAN5A6kCqgLdAt4C'
+      '3wIRAxIDEwNDAkQCdwJ4AnkCqwKsAq0C3QHeARECEgITAkUCRgJHAncBeAGrAawBrQHf'
+      'AeAB4QERARIBRQFGAUcBeQF6AXsBqwCsAN8A4ADhABMBFAEVAUUARgB5AHoAewCtAK4A'
+      'rwAHCggKOwo8Cj0KRwBIAEkAPgo/CkoASwBMAH4AfwCAAHwAfQCwALEAsgDkAOUA5gDi'
+      'AOMAFgEXARgBSgFLAUwBSAFJAXwBfQF+AbABsQGyAa4BrwHiAeMB5AEWAhcCGAIUAhUC'
+      'SAJJAkoCfAJ9An4CegJ7Aq4CrwKwAuIC4wLkAuAC4QIUAxUDFgNIA0kDSgNGA0cDegN7'
+      'A3wDrgOvA7ADrAOtA+AD4QPiAxQEFQQWBBIEEwRGBEcESAR6BHsEfASqBHkE3gStBK4E'
+      'EgXhBOIEFQYWBkkGSgYZBn0GfgZNBn0FfgWxBbIFswXlBeYF5wWvBLAE4wTkBOUEfwWA'
+      'BYEFSQRKBH0EfgR/BLEEsgSzBOMD5AMXBBgEGQRLBEwETQR9A34DsQOyA7MD5QPmA+cD'
+      'FwMYA0sDTANNA38DgAOBA7ECsgLlAuYC5wIZAxoDGwNLAkwCfwKAAoECswK0ArUC5QHm'
+      'ARkCGgIbAk0CTgJPAn8BgAGzAbQBtQHnAegB6QEZARoBTQFOAU8BgQGCAYMBswC0AOcA'
+      '6ADrABsBHAEfAU8AUACDAIQAhQC3ALgAuQARChIKRQpGCkcKUQBSAFMASApJClQAVQBW'
+      'AIgAiQCKAIYAhwC6ALsAvADuAO8A8ADsAO0AIAEhASIBVAFVAVYBUAFTAYQBhwGIAbgB'
+      'uwG8AbYBtwHqAesB7AEeAh8CIAIcAh0CUAJRAlIChAKFAoYCggKDArYCtwK4AuoC6wLs'
+      'AugC6QIcAx0DHgNQA1EDUgNOA08DggODA4QDtgO3A7gDtAO1A+gD6QPqAxwEHQQeBBoE'
+      'GwROBE8EUASCBIMEhASABIEEtAS1BLYE6ATpBOoE5gTnBIIFgwWEBbYFtwW4BbQFtQXo'
+      'BekF6gUcBh0GHgYaBhsGTgZPBlAGggaDBoQGsgaBBuYGtQa2BhoH6QbqBrUHtgfpB+oH'
+      'uQcdCB4I7QcdBx4HUQdSB1MHhQeGB4cHtwa4BusG7AbtBh8HIAchB1EGUgaFBoYGhwa5'
+      'BroGuwbrBewFHwYgBiEGUwZUBlUGhQWGBbkFugW7Be0F7gXvBbcEuATrBOwE7QSHBYgF'
+      'iQVRBFIEhQSGBIcEuQS6BLsE6wPsAx8EIAQhBFMEVARVBIUDhgO5A7oDuwPtA+4D7wMf'
+      'AyADUwNUA1UDhwOIA4kDuQK6Au0C7gLvAiEDIgMjA1MCVAKHAogCiwK7ArwCvwLvAfAB'
+      'IwIkAiUCVwJYAlkCiQGKAb0BvgG/AfEB8gHzASMBJAFXAVgBWQGLAYwBjQG9AL4A8QDy'
+      'APMAJQEmAScBVwBYAIsAjACNAL8AwADBABkKGgpNCk4KTwpZAFoAWwBQClEKXABdAF4A'
+      'kACRAJIAjgCPAMIAwwDEAPYA9wD4APQA9QAoASkBKgFcAV0BXgFaAVsBjgGPAZABwgHD'
+      'AcQBwAHBAfQB9QH2ASgCKQIqAiYCJwJaAlsCXAKOAo8CkAKMAo0CwALBAsIC9AL1AvYC'
+      '8ALzAiQDJwMoA1gDWwNcA1YDVwOKA4sDjAO+A78DwAO8A70D8APxA/IDJAQlBCYEIgQj'
+      'BFYEVwRYBIoEiwSMBIgEiQS8BL0EvgTwBPEE8gTuBO8EigWLBYwFvgW/BcAFvAW9BfAF'
+      '8QXyBSQGJQYmBiIGIwZWBlcGWAaKBosGjAaIBokGvAa9Br4G8AbxBvIG7gbvBiIHIwck'
+      'B1YHVwdYB1QHVQeIB4kHige8B70Hvge6B7sH7gfvB/AHIggjCCQIUgghCIYIVQhWCLoI'
+      'iQiKCFUJVgmJCYoJWQm9Cb4JjQm9CL4I8QjyCPMIJQkmCScJVwhYCIsIjAiNCL8IwAjB'
+      'CPEH8gclCCYIJwhZCFoIWwiLB4wHvwfAB8EH8wf0B/UHJQcmB1kHWgdbB40HjgePB78G'
+      'wAbzBvQG9QYnBygHKQdZBloGjQaOBo8GwQbCBsMG8wX0BScGKAYpBlsGXAZdBo0FjgXB'
+      'BcIFwwX1BfYF9wW/BMAE8wT0BPUEjwWQBZEFWQRaBI0EjgSPBMEEwgTDBPMD9AMnBCgE'
+      'KwRbBFwEXwSPA5ADwwPEA8UD9wP4A/kDKQMqA10DXgNfA5EDkgOTA8MCxAL3AvgC+QIr'
+      'AywDLQNdAl4CkQKSApMCxQLGAscC9wH4ASsCLAItAl8CYAJhApEBkgHFAcYBxwH5AfoB'
+      '+wErASwBXwFgAWEBkwGUAZUBxQDGAPkA+gD7AC0BLgEvAV8AYACTAJQAlQDHAMgAyQAh'
+      'CiIKVQpWClcKYQBiAGMAWApZCmQAZQBmAJgAmQCaAJYAlwDKAMsAzAD+AP8AAAH8AP0A'
+      'MAExATIBZAFlAWYBYgFjAZYBlwGYAcoBywHMAcgByQH8Af0B/gEwAjECMgIuAi8CYgJj'
+      'AmQClgKXApgClAKVAsgCyQLKAvwC/QL+AvoC+wIuAy8DMANiA2MDZANgA2EDlAOVA5YD'
+      'yAPJA8oDxgPHA/oD+wP8Ay4ELwQwBCwELQRgBGEEYgSUBJUElgSQBJMExATHBMgE+AT7'
+      'BPwE9gT3BJIFkwWUBcYFxwXIBcQFxQX4BfkF+gUsBi0GLgYqBisGXgZfBmAGkgaTBpQG'
+      'kAaRBsQGxQbGBvgG+Qb6BvYG9wYqBysHLAdeB18HYAdcB10HkAeRB5IHxAfFB8YHwgfD'
+      'B/YH9wf4ByoIKwgsCCgIKQhcCF0IXgiQCJEIkgiOCI8IwgjDCMQI9gj3CPgI9Aj1CCgJ'
+      'KQkqCVwJXQleCVoJWwmOCY8JkAnCCcMJxAnyCcEJJgr1CfYJWgopCioKkQmSCcUJxgnH'
+      'CfkJ+gn7CSsJLAlfCWAJYQmTCZQJlQnFCMYI+Qj6CPsILQkuCS8JXwhgCJMIlAiVCMcI'
+      'yAjJCPkH+gctCC4ILwhhCGIIYwiTB5QHxwfIB8kH+wf8B/0HLQcuB2EHYgdjB5UHlgeX'
+      'B8cGyAb7BvwG/QYvBzAHMQdhBmIGlQaWBpcGyQbKBssG+wX8BS8GMAYzBmMGZAZnBpcF'
+      'mAXLBcwFzQX/BQAGAQbJBMoE/QT+BP8EmQWaBZsFYwRkBJcEmASZBMsEzATNBP0D/gMx'
+      'BDIEMwRlBGYEZwSXA5gDywPMA80D/wMABAEEMQMyA2UDZgNnA5kDmgObA8sCzAL/AgAD'
+      'AQMzAzQDNQNlAmYCmQKaApsCzQLOAs8C/wEAAjMCNAI1AmcCaAJpApkBmgHNAc4BzwEB'
+      'AgICAwIzATQBZwFoAWkBmwGcAZ0B0AHRAQQCBQIGAjgCOQI6AjYCNwJqAmsCbAKeAp8C'
+      'oAKcAp0C0ALRAtICBAMFAwYDAgMDAzYDNwM4A2oDawNsA2gDaQOcA50DngPQA9ED0gPO'
+      'A88DAgQDBAQENgQ3BDgENAQ1BGgEaQRqBJwEnQSeBJoEmwTOBM8E0AQCBQMFBAUABQEF'
+      'nAWdBZ4F0AXRBdIFzgXPBQIGAwYEBjYGNwY4BjQGNQZoBmkGagacBp0GngaYBpsGzAbP'
+      'BtAGAAcDBwQH/gb/BjIHMwc0B2YHZwdoB2QHZQeYB5kHmgfMB80HzgfKB8sH/gf/BwAI'
+      'MggzCDQIMAgxCGQIZQhmCJgImQiaCJYIlwjKCMsIzAj+CP8IAAn8CP0IMAkxCTIJZAll'
+      'CWYJYgljCZYJlwmYCcoJywnMCcgJyQn8Cf0J/gkwCjEKMgqZCZoJzQnOCc8JAQoCCgMK'
+      'Mwk0CWcJaAlpCZsJnAmdCc0IzggBCQIJAwk1CTYJNwlnCGgImwicCJ0IzwjQCNEIAQgC'
+      'CDUINgg3CGkIaghrCJsHnAfPB9AH0wcDCAQIBwg3BzgHawdsB20HnwegB6EH0QbSBgUH'
+      'BgcHBzkHOgc7B2sGbAafBqAGoQbTBtQG1QYFBgYGOQY6BjsGbQZuBm8GnwWgBdMF1AXV'
+      'BQcGCAYJBtEE0gQFBQYFBwWhBaIFowVrBGwEnwSgBKEE0wTUBNUEBQQGBDkEOgQ7BG0E'
+      'bgRvBJ8DoAPTA9QD1QMHBAgECQQ5AzoDbQNuA28DoQOiA6MD0wLUAgcDCAMJAzsDPAM9'
+      'A3ADcQOkA6UDpgPYA9kD2gPWA9cDCgQLBAwEPgQ/BEAEPAQ9BHAEcQRyBKQEpQSmBKIE'
+      'owTWBNcE2AQKBQsFDAUIBQkFpAWlBaYF2AXZBdoF1gXXBQoGCwYMBj4GPwZABjwGPQZw'
+      'BnEGcgakBqUGpgaiBqMG1gbXBtgGCgcLBwwHCAcJBzwHPQc+B3AHcQdyB24HbweiB6MH'
+      'pAfWB9cH2AfUB9UHCAgJCAoIPAg9CD4IOAg7CGwIbwhwCKAIowikCJ4InwjSCNMI1AgG'
+      'CQcJCAkECQUJOAk5CToJbAltCW4JaglrCZ4JnwmgCdIJ0wnUCdAJ0QkECgUKBgo4CjkK'
+      'OgqhCaIJ1QnWCdcJCQoKCgsKOwk8CW8JcAlzCaMJpAmnCdcI2AgLCQwJDQk/CUAJQQlx'
+      'CHIIpQimCKcI2QjaCNsICwgMCD8IQAhBCHMIdAh1CKUHpgfZB9oH2wcNCA4IDwg/B0AH'
+      'cwd0B3UHpweoB6kH2QbaBg0HDgcPB0EHQgdDB3MGdAanBqgGqQbbBtwG3QYNBg4GQQZC'
+      'BkMGdQZ2BncGpwWoBdsF3AXdBQ8GEAYRBtkE2gQNBQ4FDwWpBaoFqwVzBHQEpwSoBKkE'
+      '2wTcBN0EEAURBawFrQWuBeAF4QXiBd4F3wUSBhMGFAZGBkcGSAZEBkUGeAZ5BnoGrAat'
+      'Bq4GqgarBt4G3wbgBhIHEwcUBxAHEQdEB0UHRgd4B3kHegd2B3cHqgerB6wH3gffB+AH'
+      '3AfdBxAIEQgSCEQIRQhGCEIIQwh2CHcIeAiqCKsIrAioCKkI3AjdCN4IEAkRCRIJDgkP'
+      'CUIJQwlECXYJdwl4CXQJdQmoCakJqgncCd0J3gnYCdsJDAoPChAKQApDCkQKqwmsCd8J'
+      '4AnhCRMKFAoVCkUJRgl5CXoJewmtCa4JrwnfCOAIEwkUCRUJRwlICUkJeQh6CK0Irgiv'
+      'COEI4gjjCBMIFAhHCEgISQh7CHwIfQitB64H4QfiB+MHFQgWCBcIRwdIB3sHfAd9B68H'
+      'sAexB+EG4gYVBxYHFwdJB0oHSwd7BnwGrwawBrEG4wbkBuUGGAcZB0wHTQdOB4AHgQeC'
+      'B34HfweyB7MHtAfmB+cH6AfkB+UHGAgZCBoITAhNCE4ISghLCH4IfwiACLIIswi0CLAI'
+      'sQjkCOUI5ggYCRkJGgkWCRcJSglLCUwJfgl/CYAJfAl9CbAJsQmyCeQJ5QnmCeIJ4wkW'
+      'ChcKGApKCksKTAqzCbQJ5wnoCekJGwocCh0KTQlOCYEJggmDCbUJtgm3CecI6AgbCRwJ'
+      'HQlPCVAJUQmBCIIItQi2CLcI6QjqCOsIGwgcCE8IUAhRCIMIhAiFCLgIuQjsCO0I7ggg'
+      'CSEJIgkeCR8JUglTCVQJhgmHCYgJhAmFCbgJuQm6CewJ7QnuCeoJ6wkeCh8KIApSClMK'
+      'VAq7CbwJ7wnwCfEJIwokCiUK');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement64x64 = _unpackUint16(
+      '/QD+AD0BPgEBAX0BfgFBAUEAQgCBAIIAgwDBAMIAwwBDD0QPgw+ED4UPQwBEAEUAhg+H'
+      'D0YARwBIAIYAhwCIAIQAhQDEAMUAxgAEAQUBBgECAQMBQgFDAUQBggGDAYQBvgGBAf4B'
+      'wQHCAT4CAQICAv0C/gI9Az4DAQN9A34DQQNBAkICgQKCAoMCwQLCAsMCwwHEAQMCBAIF'
+      'AkMCRAJFAkUBRgGFAYYBhwHFAcYBxwHHAMgABwEIAQkBRwFIAUkBSQBKAIkAigCLAMkA'
+      'ygDLAEsPTA+LD4wPjQ9LAEwATQCOD5EPTgBRAFIAjgCRAJIAjACNAMwAzQDOAAwBDQEO'
+      'AQoBCwFKAUsBTAGKAYsBjAGIAYkByAHJAcoBCAIJAgoCBgIHAkYCRwJIAoYChwKIAoQC'
+      'hQLEAsUCxgIEAwUDBgMCAwMDQgNDA0QDggODA4QDvgOBA34EQQRCBL4EgQSCBH0FfgW9'
+      'Bb4FgQX9Bf4FwQXBBMIEAQUCBQMFQQVCBUMFQwREBIMEhASFBMMExATFBEUDRgOFA4YD'
+      'hwNFBEYERwTHAsgCBwMIAwkDRwNIA0kDSQJKAokCigKLAskCygLLAssBzAELAgwCDQJL'
+      'AkwCTQJNAU4BjQGOAZEBzQHOAdEB0QDSABEBEgETAVEBUgFTAVMAVACTAJQAlQDTANQA'
+      '1QBVD1YPlQ+WD5cPVQBWAFcAmA+ZD1gAWQBaAJgAmQCaAJYAlwDWANcA2AAWARcBGAEU'
+      'ARUBVAFVAVYBlAGVAZYBkgGTAdIB0wHUARICEwIUAg4CEQJOAlECUgKOApECkgKMAo0C'
+      'zALNAs4CDAMNAw4DCgMLA0oDSwNMA4oDiwOMA4gDiQNIBEkESgSIBIkEigSGBIcExgTH'
+      'BMgEBgUHBQgFBAUFBUQFRQVGBYQFhQWGBYIFgwXCBcMFxAUCBgMGBAY+BgEGfgZBBkIG'
+      'vgaBBoIGfQd+B70HvgeBB30IfghBCMEGwgYBBwIHAwdBB0IHQwdDBkQGgwaEBoUGwwbE'
+      'BsUGxQXGBQUGBgYHBkUGRgZHBkcFSAWHBYgFiQXHBcgFyQXJBMoECQUKBQsFSQVKBUsF'
+      'SwRMBIsEjASNBMsEzATNBE0DTgONA44DkQNNBE4EUQTRAtICEQMSAxMDUQNSA1MDUwJU'
+      'ApMClAKVAtMC1ALVAtUB1gEVAhYCFwJVAlYCVwJXAVgBlwGYAZkB1wHYAdkB2QDaABkB'
+      'GgEbAVkBWgFbAVsAXACbAJwAnQDbANwA3QBdD14PnQ+eD6EPXQBeAGEAog+jD2IAYwBk'
+      'AKIAowCkAJ4AoQDeAOEA4gAeASEBIgEcAR0BXAFdAV4BnAGdAZ4BmgGbAdoB2wHcARoC'
+      'GwIcAhgCGQJYAlkCWgKYApkCmgKWApcC1gLXAtgCFgMXAxgDFAMVA1QDVQNWA5QDlQOW'
+      'A5IDkwNSBFMEVASSBJMElASOBJEEzgTRBNIEDgURBRIFDAUNBUwFTQVOBYwFjQWOBYoF'
+      'iwXKBcsFzAUKBgsGDAYIBgkGSAZJBkoGiAaJBooGhgaHBsYGxwbIBgYHBwcIBwQHBQdE'
+      'B0UHRgeEB4UHhgeCB4MHQghDCEQIggiDCIQIvgiBCP4IwQjCCD4JAQkCCf0J/gk9Cj4K'
+      'AQp9Cn4KQQpBCUIJgQmCCYMJwQnCCcMJwwjECAMJBAkFCUMJRAlFCUUIRgiFCIYIhwjF'
+      'CMYIxwhHB0gHhweIB4kHRwhICEkIyQbKBgkHCgcLB0kHSgdLB0sGTAaLBowGjQbLBswG'
+      'zQbNBc4FDQYOBhEGTQZOBlEGUQVSBZEFkgWTBdEF0gXTBdME1AQTBRQFFQVTBVQFVQVV'
+      'BFYElQSWBJcE1QTWBNcEVwNYA5cDmAOZA1cEWARZBNkC2gIZAxoDGwNZA1oDWwNbAlwC'
+      'mwKcAp0C2wLcAt0C3QHeAR0CHgIhAl0CXgJhAmEBYgGhAaIBowHhAeIB4wHjAOQAIwEk'
+      'ASUBYwFkAWUBZQBmAKUApgCnAOUA5gDnAGcPaA+nD6gPqQ9nAGgAaQCqD6sPagBrAGwA'
+      'qgCrAKwAqACpAOgA6QDqACgBKQEqASYBJwFmAWcBaAGmAacBqAGkAaUB5AHlAeYBJAIl'
+      'AiYCIgIjAmICYwJkAqICowKkAp4CoQLeAuEC4gIeAyEDIgMcAx0DXANdA14DnAOdA54D'
+      'mgObA1oEWwRcBJoEmwScBJgEmQTYBNkE2gQYBRkFGgUWBRcFVgVXBVgFlgWXBZgFlAWV'
+      'BdQF1QXWBRQGFQYWBhIGEwZSBlMGVAaSBpMGlAaOBpEGzgbRBtIGDgcRBxIHDAcNB0wH'
+      'TQdOB4wHjQeOB4oHiwdKCEsITAiKCIsIjAiICIkIyAjJCMoICAkJCQoJBgkHCUYJRwlI'
+      'CYYJhwmICYQJhQnECcUJxgkECgUKBgoCCgMKQgpDCkQKggqDCoQKvgqBCv4KwQrCCj4L'
+      'AQsCC30Mfgy9DL4MgQz9DP4MwQxBC0ILgQuCC4MLQQxCDEMMwwrECgMLBAsFC0MLRAtF'
+      'C0UKRgqFCoYKhwrFCsYKxwrHCcgJBwoICgkKRwpICkkKSQlKCYkJigmLCckJygnLCcsI'
+      'zAgLCQwJDQlLCUwJTQlNCE4IjQiOCJEIzQjOCNEIUQdSB5EHkgeTB1EIUghTCNMG1AYT'
+      'BxQHFQdTB1QHVQdVBlYGlQaWBpcG1QbWBtcG1wXYBRcGGAYZBlcGWAZZBlkFWgWZBZoF'
+      'mwXZBdoF2wXbBNwEGwUcBR0FWwVcBV0FXQReBJ0EngShBN0E3gThBGEDYgOhA6IDowNh'
+      'BGIEYwTjAuQCIwMkAyUDYwNkA2UDZQJmAqUCpgKnAuUC5gLnAucB6AEnAigCKQJnAmgC'
+      'aQJpAWoBqQGqAasB6QHqAesB6wDsACsBLAEtAWsBbAFtAW0AbgCtAK4AsQDtAO4A8QBx'
+      'D3IPsQ+yD7MPcQByAHMAtA+1D3QAdQB2ALQAtQC2ALIAswDyAPMA9AAyATMBNAEuATEB'
+      'bgFxAXIBrgGxAbIBrAGtAewB7QHuASwCLQIuAioCKwJqAmsCbAKqAqsCrAKoAqkC6ALp'
+      'AuoCKAMpAyoDJgMnA2YDZwNoA6YDpwOoA6QDpQNkBGUEZgSkBKUEpgSiBKME4gTjBOQE'
+      'IgUjBSQFHgUhBV4FYQViBZ4FoQWiBZwFnQXcBd0F3gUcBh0GHgYaBhsGWgZbBlwGmgab'
+      'BpwGmAaZBtgG2QbaBhgHGQcaBxYHFwdWB1cHWAeWB5cHmAeUB5UHVAhVCFYIlAiVCJYI'
+      'kgiTCNII0wjUCBIJEwkUCQ4JEQlOCVEJUgmOCZEJkgmMCY0JzAnNCc4JDAoNCg4KCgoL'
+      'CkoKSwpMCooKiwqMCogKiQrICskKygoICwkLCgsGCwcLRgtHC0gLhguHC4gLhAuFC0QM'
+      'RQxGDIQMhQyGDIIMgwzCDMMMxAwCDQMNBA0+DQENfg1BDUINvg2BDYINfQ5+Dr0Ovg6B'
+      'Dv0O/g7BDsENwg0BDgIOAw5BDkIOQw5DDUQNgw2EDYUNww3EDcUNxQzGDAUNBg0HDUUN'
+      'Rg1HDUcMSAyHDIgMiQzHDMgMyQxJC0oLiQuKC4sLSQxKDEsMywrMCgsLDAsNC0sLTAtN'
+      'C00KTgqNCo4KkQrNCs4K0QrRCdIJEQoSChMKUQpSClMKUwlUCZMJlAmVCdMJ1AnVCdUI'
+      '1ggVCRYJFwlVCVYJVwlXCFgIlwiYCJkI1wjYCNkIWQdaB5kHmgebB1kIWghbCNsG3AYb'
+      'BxwHHQdbB1wHXQddBl4GnQaeBqEG3QbeBuEG4QXiBSEGIgYjBmEGYgZjBmMFZAWjBaQF'
+      'pQXjBeQF5QXlBOYEJQUmBScFZQVmBWcFZwRoBKcEqASpBOcE6ATpBGkDagOpA6oDqwNp'
+      'BGoEawTrAuwCKwMsAy0DawNsA20DbQJuAq0CrgKxAu0C7gLxAvEB8gExAjICMwJxAnIC'
+      'cwJzAXQBswG0AbUB8wH0AfUB9QD2ADUBNgE3AXUBdgF3AXcAeAC3ALgAuQD3APgA+QB5'
+      'D3oPuQ+6D7sPeQB6AHsAvA+9D3wAfQB+ALwAvQC+ALoAuwD6APsA/AA6ATsBPAE4ATkB'
+      'eAF5AXoBuAG5AboBtgG3AfYB9wH4ATYCNwI4AjQCNQJ0AnUCdgK0ArUCtgKyArMC8gLz'
+      'AvQCMgMzAzQDLgMxA24DcQNyA64DsQOyA6wDrQNsBG0EbgSsBK0ErgSqBKsE6gTrBOwE'
+      'KgUrBSwFKAUpBWgFaQVqBagFqQWqBaYFpwXmBecF6AUmBicGKAYkBiUGZAZlBmYGpAal'
+      'BqYGogajBuIG4wbkBiIHIwckBx4HIQdeB2EHYgeeB6EHogecB50HXAhdCF4InAidCJ4I'
+      'mgibCNoI2wjcCBoJGwkcCRgJGQlYCVkJWgmYCZkJmgmWCZcJ1gnXCdgJFgoXChgKFAoV'
+      'ClQKVQpWCpQKlQqWCpIKkwrSCtMK1AoSCxMLFAsOCxELTgtRC1ILjguRC5ILjAuNC0wM'
+      'TQxODIwMjQyODIoMiwzKDMsMzAwKDQsNDA0IDQkNSA1JDUoNiA2JDYoNhg2HDcYNxw3I'
+      'DQYOBw4IDgQOBQ5EDkUORg6EDoUOhg6CDoMOwg7DDsQOAg8DDwQPPg8BD34PQQ9CD74P'
+      'gQ+CD8UOxg4FDwYPBw9FD0YPRw9HDkgOhw6IDokOxw7IDskOyQ3KDQkOCg4LDkkOSg5L'
+      'DksNTA2LDYwNjQ3LDcwNzQ3NDM4MDQ0ODRENTQ1ODVENUQxSDJEMkgyTDNEM0gzTDFML'
+      'VAuTC5QLlQtTDFQMVQzVCtYKFQsWCxcLVQtWC1cLVwpYCpcKmAqZCtcK2ArZCtkJ2gkZ'
+      'ChoKGwpZCloKWwpbCVwJmwmcCZ0J2wncCd0J3QjeCB0JHgkhCV0JXglhCWEIYgihCKII'
+      'owjhCOII4whjB2QHowekB6UHYwhkCGUI5QbmBiUHJgcnB2UHZgdnB2cGaAanBqgGqQbn'
+      'BugG6QbpBeoFKQYqBisGaQZqBmsGawVsBasFrAWtBesF7AXtBe0E7gQtBS4FMQVtBW4F'
+      'cQVxBHIEsQSyBLME8QTyBPMEcwN0A7MDtAO1A3MEdAR1BPUC9gI1AzYDNwN1A3YDdwN3'
+      'AngCtwK4ArkC9wL4AvkC+QH6ATkCOgI7AnkCegJ7AnsBfAG7AbwBvQH7AfwB/QE8Aj0C'
+      'fAJ9An4CvAK9Ar4CugK7AvoC+wL8AjoDOwM8AzgDOQN4A3kDegO4A7kDugO2A7cDdgR3'
+      'BHgEtgS3BLgEtAS1BPQE9QT2BDQFNQU2BTIFMwVyBXMFdAWyBbMFtAWuBbEF7gXxBfIF'
+      'LgYxBjIGLAYtBmwGbQZuBqwGrQauBqoGqwbqBusG7AYqBysHLAcoBykHaAdpB2oHqAep'
+      'B6oHpgenB2YIZwhoCKYIpwioCKQIpQjkCOUI5ggkCSUJJgkiCSMJYgljCWQJogmjCaQJ'
+      'ngmhCd4J4QniCR4KIQoiChwKHQpcCl0KXgqcCp0KngqaCpsK2grbCtwKGgsbCxwLGAsZ'
+      'C1gLWQtaC5gLmQuaC5YLlwtWDFcMWAyWDJcMmAyUDJUM1AzVDNYMFA0VDRYNEg0TDVIN'
+      'Uw1UDZINkw2UDY4NkQ3ODdEN0g0ODhEOEg4MDg0OTA5NDk4OjA6NDo4Oig6LDsoOyw7M'
+      'DgoPCw8MDwgPCQ9ID0kPSg+ID4kPig/NDs4ODQ8ODxEPTQ9OD1EPUQ5SDpEOkg6TDtEO'
+      '0g7TDtMN1A0TDhQOFQ5TDlQOVQ5VDVYNlQ2WDZcN1Q3WDdcN1wzYDBcNGA0ZDVcNWA1Z'
+      'DVkMWgyZDJoMmwzZDNoM2wxbC1wLmwucC50LWwxcDF0M3QreCh0LHgshC10LXgthC2EK'
+      'YgqhCqIKowrhCuIK4wrjCeQJIwokCiUKYwpkCmUKZQlmCaUJpgmnCeUJ5gnnCecI6Agn'
+      'CSgJKQlnCWgJaQlpCGoIqQiqCKsI6QjqCOsIawdsB6sHrAetB2sIbAhtCO0G7gYtBy4H'
+      'MQdtB24HcQdxBnIGsQayBrMG8QbyBvMG8wX0BTMGNAY1BnMGdAZ1BnUFdgW1BbYFtwX1'
+      'BfYF9wX3BPgENwU4BTkFdwV4BXkFeQR6BLkEugS7BPkE+gT7BHsDfAO7A7wDvQN7BHwE'
+      'fQS8BL0E/AT9BP4EPAU9BT4FOgU7BXoFewV8BboFuwW8BbgFuQX4BfkF+gU4BjkGOgY2'
+      'BjcGdgZ3BngGtga3BrgGtAa1BvQG9Qb2BjQHNQc2BzIHMwdyB3MHdAeyB7MHtAeuB7EH'
+      'bghxCHIIrgixCLIIrAitCOwI7QjuCCwJLQkuCSoJKwlqCWsJbAmqCasJrAmoCakJ6Anp'
+      'CeoJKAopCioKJgonCmYKZwpoCqYKpwqoCqQKpQrkCuUK5gokCyULJgsiCyMLYgtjC2QL'
+      'ogujC6QLnguhC14MYQxiDJ4MoQyiDJwMnQzcDN0M3gwcDR0NHg0aDRsNWg1bDVwNmg2b'
+      'DZwNmA2ZDdgN2Q3aDRgOGQ4aDhYOFw5WDlcOWA6WDpcOmA6UDpUO1A7VDtYOFA8VDxYP'
+      'Eg8TD1IPUw9UD5IPkw+UD9cO2A4XDxgPGQ9XD1gPWQ9ZDloOmQ6aDpsO2Q7aDtsO2w3c'
+      'DRsOHA4dDlsOXA5dDl0NXg2dDZ4NoQ3dDd4N4Q3hDOIMIQ0iDSMNYQ1iDWMNYwxkDKMM'
+      'pAylDOMM5AzlDGULZgulC6YLpwtlDGYMZwznCugKJwsoCykLZwtoC2kLaQpqCqkKqgqr'
+      'CukK6grrCusJ7AkrCiwKLQprCmwKbQptCW4JrQmuCbEJ7QnuCfEJ8QjyCDEJMgkzCXEJ'
+      'cglzCXMIdAizCLQItQjzCPQI9Qh1B3YHtQe2B7cHdQh2CHcI9wb4BjcHOAc5B3cHeAd5'
+      'B3kGega5BroGuwb5BvoG+wb7BfwFOwY8Bj0GewZ8Bn0GvAa9BvwG/Qb+BjwHPQc+BzoH'
+      'Owd6B3sHfAe6B7sHvAe4B7kHeAh5CHoIuAi5CLoItgi3CPYI9wj4CDYJNwk4CTQJNQl0'
+      'CXUJdgm0CbUJtgmyCbMJ8gnzCfQJMgozCjQKLgoxCm4KcQpyCq4KsQqyCqwKrQrsCu0K'
+      '7gosCy0LLgsqCysLagtrC2wLqgurC6wLqAupC2gMaQxqDKgMqQyqDKYMpwzmDOcM6Awm'
+      'DScNKA0kDSUNZA1lDWYNpA2lDaYNog2jDeIN4w3kDSIOIw4kDh4OIQ5eDmEOYg6eDqEO'
+      'og6cDp0O3A7dDt4OHA8dDx4PGg8bD1oPWw9cD5oPmw+cD+EO4g4hDyIPIw9hD2IPYw9j'
+      'DmQOow6kDqUO4w7kDuUO5Q3mDSUOJg4nDmUOZg5nDmcNaA2nDagNqQ3nDegN6Q3pDOoM'
+      'KQ0qDSsNaQ1qDWsNawxsDKsMrAytDOsM7AztDG0LbgutC64LsQttDG4McQzxCvIKMQsy'
+      'CzMLcQtyC3MLcwp0CrMKtAq1CvMK9Ar1CvUJ9gk1CjYKNwp1CnYKdwp3CXgJtwm4CbkJ'
+      '9wn4CfkJ+Qj6CDkJOgk7CXkJegl7CXsIfAi7CLwIvQj7CPwI/Qg8CT0JfAl9CX4JvAm9'
+      'Cb4Jugm7CfoJ+wn8CToKOwo8CjgKOQp4CnkKegq4CrkKugq2CrcK9gr3CvgKNgs3CzgL'
+      'NAs1C3QLdQt2C7QLtQu2C7ILswtyDHMMdAyyDLMMtAyuDLEM7gzxDPIMLg0xDTINLA0t'
+      'DWwNbQ1uDawNrQ2uDaoNqw3qDesN7A0qDisOLA4oDikOaA5pDmoOqA6pDqoOpg6nDuYO'
+      '5w7oDiYPJw8oDyQPJQ9kD2UPZg+kD6UPpg/pDuoOKQ8qDysPaQ9qD2sPaw5sDqsOrA6t'
+      'DusO7A7tDu0N7g0tDi4OMQ5tDm4OcQ5xDXINsQ2yDbMN8Q3yDfMN8wz0DDMNNA01DXMN'
+      'dA11DXUMdgy1DLYMtwz1DPYM9wx3C3gLtwu4C7kLdwx4DHkM+Qr6CjkLOgs7C3kLegt7'
+      'C3sKfAq7CrwKvQr7CvwK/Qo8Cz0LfAt9C34LvAu9C74Lugu7C3oMewx8DLoMuwy8DLgM'
+      'uQz4DPkM+gw4DTkNOg02DTcNdg13DXgNtg23DbgNtA21DfQN9Q32DTQONQ42DjIOMw5y'
+      'DnMOdA6yDrMOtA6uDrEO7g7xDvIOLg8xDzIPLA8tD2wPbQ9uD6wPrQ+uD/MO9A4zDzQP'
+      'NQ9zD3QPdQ91DnYOtQ62DrcO9Q72DvcO9w34DTcOOA45DncOeA55DnkNeg25DboNuw35'
+      'DfoN+w37DPwMOw08DT0New18DX0NvA29DfwN/Q3+DTwOPQ4+DjoOOw56DnsOfA66DrsO'
+      'vA64DrkO+A75DvoOOA85DzoPNg83D3YPdw94D7YPtw+4D/sO/A47DzwPPQ97D3wPfQ8=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement72x72 = _unpackUint16(
+      'HQEeAWUBZgEhAa0BrgFpAUkASgCRAJIAkwDZANoA2wBrE2wTsxO0E7UTSwBMAE0AthO3'
+      'E04ATwBQAJYAlwCYAJQAlQDcAN0A3gAkASUBJgEiASMBagFrAWwBsgGzAbQB9gGxAT4C'
+      '+QH6AYYCQQJCAl0DXgOlA6YDYQPtA+4DqQOJAooC0QLSAtMCGQMaAxsD+wH8AUMCRAJF'
+      'AosCjAKNAm0BbgG1AbYBtwH9Af4B/wHfAOAAJwEoASkBbwFwAXEBUQBSAJkAmgCbAOEA'
+      '4gDjAHMTdBO7E7wTvRNTAFQAVQC+E78TVgBXAFgAngCfAKAAnACdAOQA5QDmACwBLQEu'
+      'ASoBKwFyAXMBdAG6AbsBvAG4AbkBAAIBAgICSAJJAkoCRgJHAo4CjwKQAtYC1wLYAtQC'
+      '1QIcAx0DHgNkA2UDZgNiA2MDqgOrA6wD8gPzA/QDNgTxA34EOQQ6BMYEgQSCBC0GLgZ1'
+      'BnYGMQa9Br4GeQZZBVoFoQWiBaMF6QXqBesFOwQ8BIMEhASFBFsFXAVdBa0DrgP1A/YD'
+      '9wM9BD4EPwQfAyADZwNoA2kDrwOwA7EDkQKSAtkC2gLbAiEDIgMjAwMCBAJLAkwCTQKT'
+      'ApQClQJ1AXYBvQG+Ab8BBQIGAgcC5wDoAC8BMAEzAXcBeAF7AVsAXACjAKQApQDrAOwA'
+      '7QB9E34TxRPGE8cTXQBeAF8AyBPJE2AAYQBiAKgAqQCqAKYApwDuAO8A8AA2ATcBOAE0'
+      'ATUBfAF9AX4BxAHFAcYBwAHDAQgCCwIMAlACUwJUAk4CTwKWApcCmALeAt8C4ALcAt0C'
+      'JAMlAyYDbANtA24DagNrA7IDswO0A/oD+wP8A/gD+QNABEEEQgSIBIkEigSGBIcEXgVf'
+      'BWAFpgWnBagFpAWlBewF7QXuBTQGNQY2BjIGMwZ6BnsGfAbCBsMGxAYGB8EGTgcJBwoH'
+      'lgdRB1IHbQhuCLUItghxCP0I/gi5CJkHmgfhB+IH4wcpCCoIKwgLBwwHUwdUB1UHmwec'
+      'B50HfQZ+BsUGxgbHBg0HDgcPB+8F8AU3BjgGOQZ/BoAGgQZhBWIFqQWqBasF8QXyBfMF'
+      'QwREBIsEjASNBGMFZAVlBbUDtgP9A/4D/wNFBEYERwQnAygDbwNwA3MDtwO4A7sDmwKc'
+      'AuMC5ALlAisDLAMtAw0CDgJVAlYCVwKdAp4CnwJ/AYABxwHIAckBDwIQAhEC8QDyADkB'
+      'OgE7AYEBggGDAWMAZACrAKwArQDzAPQA9QCFE4YTzRPOE88TZQBmAGcA0BPRE2gAaQBq'
+      'ALAAsQCyAK4ArwD2APcA+AA+AT8BQAE8AT0BhAGFAYYBzAHNAc4BygHLARICEwIUAloC'
+      'WwJcAlgCWQKgAqECogLoAukC6gLmAucCLgMvAzADdgN3A3gDdAN1A7wDvQO+AwQEBQQG'
+      'BAAEAwRIBEsETASQBJMElASOBI8EZgVnBWgFrgWvBbAFrAWtBfQF9QX2BTwGPQY+BjoG'
+      'OwaCBoMGhAbKBssGzAbIBskGEAcRBxIHWAdZB1oHVgdXB54HnwegB+YH5wfoB+QH5Qcs'
+      'CC0ILgh0CHUIdghyCHMIugi7CLwIAgkDCQQJRgkBCY4JSQlKCdYJkQmSCT0LPguFC4YL'
+      'QQvNC84LiQtpCmoKsQqyCrMK+Qr6CvsKSwlMCZMJlAmVCWsKbAptCr0IvggFCQYJBwlN'
+      'CU4JTwkvCDAIdwh4CHkIvwjACMEIoQeiB+kH6gfrBzEIMggzCBMHFAdbB1wHXQejB6QH'
+      'pQeFBoYGzQbOBs8GFQcWBxcH9wX4BT8GQAZDBocGiAaLBmsFbAWzBbQFtQX7BfwF/QVN'
+      'BE4ElQSWBJcEbQVuBW8FvwPAAwcECAQJBE8EUARRBDEDMgN5A3oDewPBA8IDwwOjAqQC'
+      '6wLsAu0CMwM0AzUDFQIWAl0CXgJfAqUCpgKnAocBiAHPAdAB0QEXAhgCGQL5APoAQQFC'
+      'AUUBiQGKAY0BbQBuALUAtgC3AP0A/gD/AI8TkBPXE9gT2RNvAHAAcQDaE9sTcgBzAHQA'
+      'ugC7ALwAuAC5AAABAQECAUgBSQFKAUYBRwGOAY8BkAHWAdcB2AHSAdUBGgIdAh4CYgJl'
+      'AmYCYAJhAqgCqQKqAvAC8QLyAu4C7wI2AzcDOAN+A38DgAN8A30DxAPFA8YDDAQNBA4E'
+      'CgQLBFIEUwRUBJoEmwScBJgEmQRwBXEFcgW4BbkFugW2BbcF/gX/BQAGRgZHBkgGRAZF'
+      'BowGjQaOBtQG1QbWBtAG0wYYBxsHHAdgB2MHZAdeB18HpgenB6gH7gfvB/AH7AftBzQI'
+      'NQg2CHwIfQh+CHoIewjCCMMIxAgKCQsJDAkICQkJUAlRCVIJmAmZCZoJlgmXCW4Kbwpw'
+      'CrYKtwq4CrQKtQr8Cv0K/gpEC0ULRgtCC0MLiguLC4wL0gvTC9QLFgzRC14MGQwaDKYM'
+      'YQxiDH0Nfg3FDcYNgQ0NDg4OyQ2pDKoM8QzyDPMMOQ06DTsNGwwcDGMMZAxlDKsMrAyt'
+      'DI0LjgvVC9YL1wsdDB4MHwz/CgALRwtIC0kLjwuQC5ELcQpyCrkKugq7CgELAgsDC1MJ'
+      'VAmbCZwJnQlzCnQKdQrFCMYIDQkOCQ8JVQlWCVcJNwg4CH8IgAiDCMcIyAjLCKsHrAfz'
+      'B/QH9Qc7CDwIPQgdBx4HZQdmB2cHrQeuB68HjwaQBtcG2AbZBh8HIAchBwEGAgZJBkoG'
+      'SwaRBpIGkwZzBXQFuwW8Bb0FAwYEBgUGVQRWBJ0EngSfBHUFdgV3BccDyAMPBBAEEQRX'
+      'BFgEWQQ5AzoDgQOCA4UDyQPKA80DrQKuAvUC9gL3Aj0DPgM/Ax8CIAJnAmgCaQKvArAC'
+      'sQKRAZIB2QHaAdsBIQIiAiMCAwEEAUsBTAFNAZMBlAGVAXUAdgC9AL4AvwAFAQYBBwGX'
+      'E5gT3xPgE+ETdwB4AHkA4hPjE3oAewB8AMIAwwDEAMAAwQAIAQkBCgFQAVEBUgFOAU8B'
+      'lgGXAZgB3gHfAeAB3AHdASQCJQImAmwCbQJuAmoCawKyArMCtAL6AvsC/AL4AvkCQANB'
+      'A0IDiAOJA4oDhgOHA84DzwPQAxYEFwQYBBIEFQRaBF0EXgSiBKUEpgSgBKEEeAV5BXoF'
+      'wAXBBcIFvgW/BQYGBwYIBk4GTwZQBkwGTQaUBpUGlgbcBt0G3gbaBtsGIgcjByQHagdr'
+      'B2wHaAdpB7AHsQeyB/gH+Qf6B/YH9wc+CD8IQAiGCIcIiAiECIUIzAjNCM4IFAkVCRYJ'
+      'EAkTCVgJWwlcCaAJowmkCZ4Jnwl2CncKeAq+Cr8KwAq8Cr0KBAsFCwYLTAtNC04LSgtL'
+      'C5ILkwuUC9oL2wvcC9gL2QsgDCEMIgxoDGkMagxmDGcMrgyvDLAM9gz3DPgM9Az1DDwN'
+      'PQ0+DYQNhQ2GDYINgw3KDcsNzA0SDhMOFA5WDhEOng5ZDloO5g6hDqIOTRBOEJUQlhBR'
+      'EN0Q3hCZEHkPeg/BD8IPww8JEAoQCxBbDlwOow6kDqUOew98D30PzQ3ODRUOFg4XDl0O'
+      'Xg5fDj8NQA2HDYgNiQ3PDdAN0Q2xDLIM+Qz6DPsMQQ1CDUMNIwwkDGsMbAxtDLMMtAy1'
+      'DJULlgvdC94L3wslDCYMJwwHCwgLTwtQC1MLlwuYC5sLewp8CsMKxArFCgsLDAsNC10J'
+      'XgmlCaYJpwl9Cn4KfwrPCNAIFwkYCRkJXwlgCWEJQQhCCIkIigiLCNEI0gjTCLMHtAf7'
+      'B/wH/QdDCEQIRQglByYHbQduB28HtQe2B7cHlwaYBt8G4AbhBicHKAcpBwkGCgZRBlIG'
+      'VQaZBpoGnQZ9BX4FxQXGBccFDQYOBg8GXwRgBKcEqASpBH8FgAWBBdED0gMZBBoEGwRh'
+      'BGIEYwRDA0QDiwOMA40D0wPUA9UDtQK2Av0C/gL/AkUDRgNHAycCKAJvAnACcQK3ArgC'
+      'uQKZAZoB4QHiAeMBKQIqAisCCwEMAVMBVAFXAZsBnAGfAX8AgADHAMgAyQAPARABEQGh'
+      'E6IT6RPqE+sTgQCCAIMA7BPtE4QAhQCGAMwAzQDOAMoAywASARMBFAFaAVsBXAFYAVkB'
+      'oAGhAaIB6AHpAeoB5AHnASwCLwIwAnQCdwJ4AnICcwK6ArsCvAICAwMDBAMAAwEDSANJ'
+      'A0oDkAORA5IDjgOPA9YD1wPYAx4EHwQgBBwEHQRkBGUEZgSsBK0ErgSqBKsEggWDBYQF'
+      'ygXLBcwFyAXJBRAGEQYSBlgGWQZaBlYGVwaeBp8GoAbmBucG6AbiBuUGKgctBy4Hcgd1'
+      'B3YHcAdxB7gHuQe6BwAIAQgCCP4H/wdGCEcISAiOCI8IkAiMCI0I1AjVCNYIHAkdCR4J'
+      'GgkbCWIJYwlkCaoJqwmsCagJqQmACoEKggrICskKygrGCscKDgsPCxALVgtXC1gLVAtV'
+      'C5wLnQueC+QL5QvmC+AL4wsoDCsMLAxwDHMMdAxuDG8Mtgy3DLgM/gz/DAAN/Az9DEQN'
+      'RQ1GDYwNjQ2ODYoNiw3SDdMN1A0aDhsOHA4YDhkOYA5hDmIOqA6pDqoOpg6nDn4Pfw+A'
+      'D8YPxw/ID8QPxQ8MEA0QDhBUEFUQVhBSEFMQmhCbEJwQ4hDjEOQQJhHhEG4RKREqEbYR'
+      'cRFyEY0SjhLVEtYSkRIdEx4T2RK5EboRARICEgMSSRJKEksSKxEsEXMRdBF1EbsRvBG9'
+      'EZ0QnhDlEOYQ5xAtES4RLxEPEBAQVxBYEFkQnxCgEKEQgQ+CD8kPyg/LDxEQEhATEGMO'
+      'ZA6rDqwOrQ6DD4QPhQ/VDdYNHQ4eDh8OZQ5mDmcORw1IDY8NkA2TDdcN2A3bDbsMvAwD'
+      'DQQNBQ1LDUwNTQ0tDC4MdQx2DHcMvQy+DL8MnwugC+cL6AvpCy8MMAwxDBELEgtZC1oL'
+      'WwuhC6ILowuDCoQKywrMCs0KEwsUCxULZQlmCa0JrgmvCYUKhgqHCtcI2AgfCSAJIQln'
+      'CWgJaQlJCEoIkQiSCJUI2QjaCN0IvQe+BwUIBggHCE0ITghPCC8HMAd3B3gHeQe/B8AH'
+      'wQehBqIG6QbqBusGMQcyBzMHEwYUBlsGXAZdBqMGpAalBoUFhgXNBc4FzwUVBhYGFwZn'
+      'BGgErwSwBLEEhwWIBYkF2QPaAyEEIgQjBGkEagRrBEsDTAOTA5QDlwPbA9wD3wO/AsAC'
+      'BwMIAwkDTwNQA1EDMQIyAnkCegJ7AsECwgLDAqMBpAHrAewB7QEzAjQCNQIVARYBXQFe'
+      'AV8BpQGmAacBhwCIAM8A0ADRABcBGAEZAakTqhPxE/IT8xOJAIoAiwD0E/UTjACNAI4A'
+      '1ADVANYA0gDTABoBGwEcAWIBYwFkAWABYQGoAakBqgHwAfEB8gHuAe8BNgI3AjgCfgJ/'
+      'AoACfAJ9AsQCxQLGAgwDDQMOAwoDCwNSA1MDVAOaA5sDnAOYA5kD4APhA+IDKAQpBCoE'
+      'JAQnBGwEbwRwBLQEtwS4BLIEswSKBYsFjAXSBdMF1AXQBdEFGAYZBhoGYAZhBmIGXgZf'
+      'BqYGpwaoBu4G7wbwBuwG7QY0BzUHNgd8B30Hfgd6B3sHwgfDB8QHCggLCAwICAgJCFAI'
+      'UQhSCJgImQiaCJYIlwjeCN8I4AgmCScJKAkiCSUJagltCW4Jsgm1CbYJsAmxCYgKiQqK'
+      'CtAK0QrSCs4KzwoWCxcLGAteC18LYAtcC10LpAulC6YL7AvtC+4L6gvrCzIMMww0DHoM'
+      'ewx8DHgMeQzADMEMwgwIDQkNCg0GDQcNTg1PDVANlg2XDZgNlA2VDdwN3Q3eDSQOJQ4m'
+      'DiAOIw5oDmsObA6wDrMOtA6uDq8Ohg+HD4gPzg/PD9APzA/NDxQQFRAWEFwQXRBeEFoQ'
+      'WxCiEKMQpBDqEOsQ7BDoEOkQMBExETIReBF5EXoRdhF3Eb4RvxHAEQYSBxIIEgQSBRJM'
+      'Ek0SThKUEpUSlhKSEpMS2hLbEtwSIhMjEyQTZhMhE64TaRNqE/YTsROyE90S3hIlEyYT'
+      'JxNtE24TbxNPElASlxKYEpkS3xLgEuESwRHCEQkSChILElESUhJTEjMRNBF7EXwRfRHD'
+      'EcQRxRGlEKYQ7RDuEO8QNRE2ETcRFxAYEF8QYBBjEKcQqBCrEIsPjA/TD9QP1Q8bEBwQ'
+      'HRBtDm4OtQ62DrcOjQ+OD48P3w3gDScOKA4pDm8OcA5xDlENUg2ZDZoNmw3hDeIN4w3D'
+      'DMQMCw0MDQ0NUw1UDVUNNQw2DH0Mfgx/DMUMxgzHDKcLqAvvC/AL8Qs3DDgMOQwZCxoL'
+      'YQtiC2ULqQuqC60LjQqOCtUK1grXCh0LHgsfC28JcAm3CbgJuQmPCpAKkQrhCOIIKQkq'
+      'CSsJcQlyCXMJUwhUCJsInAidCOMI5AjlCMUHxgcNCA4IDwhVCFYIVwg3BzgHfweAB4EH'
+      'xwfIB8kHqQaqBvEG8gbzBjkHOgc7BxsGHAZjBmQGZwarBqwGrwaPBZAF1wXYBdkFHwYg'
+      'BiEGcQRyBLkEugS7BJEFkgWTBeMD5AMrBCwELQRzBHQEdQRVA1YDnQOeA58D5QPmA+cD'
+      'xwLIAg8DEAMRA1cDWANZAzkCOgKBAoICgwLJAsoCywKrAawB8wH0AfUBOwI8Aj0ChAKF'
+      'AswCzQLOAhQDFQMWAxIDEwNaA1sDXAOiA6MDpAOgA6ED6APpA+oDMAQxBDIELgQvBHYE'
+      'dwR4BL4EvwTABLwEvQSUBZUFlgXcBd0F3gXaBdsFIgYjBiQGagZrBmwGaAZpBrAGsQay'
+      'BvgG+Qb6BvQG9wY8Bz8HQAeEB4cHiAeCB4MHygfLB8wHEggTCBQIEAgRCFgIWQhaCKAI'
+      'oQiiCJ4InwjmCOcI6AguCS8JMAksCS0JdAl1CXYJvAm9Cb4Jugm7CZIKkwqUCtoK2wrc'
+      'CtgK2QogCyELIgtoC2kLagtmC2cLrguvC7AL9gv3C/gL8gv1CzoMPQw+DIIMhQyGDIAM'
+      'gQzIDMkMygwQDRENEg0ODQ8NVg1XDVgNng2fDaANnA2dDeQN5Q3mDSwOLQ4uDioOKw5y'
+      'DnMOdA66DrsOvA64DrkOkA+RD5IP2A/ZD9oP1g/XDx4QHxAgEGYQZxBoEGQQZRCsEK0Q'
+      'rhD0EPUQ9hDwEPMQOBE7ETwRgBGDEYQRfhF/EcYRxxHIEQ4SDxIQEgwSDRJUElUSVhKc'
+      'Ep0SnhKaEpsS4hLjEuQSKhMrEywTKBMpE3ATcRNyE7gTuRO6E+US5hItEy4TLxN1E3YT'
+      'dxNXElgSnxKgEqMS5xLoEusSyxHMERMSFBIVElsSXBJdEj0RPhGFEYYRhxHNEc4RzxGv'
+      'ELAQ9xD4EPkQPxFAEUERIRAiEGkQahBrELEQshCzEJMPlA/bD9wP3Q8jECQQJRB1DnYO'
+      'vQ6+Dr8OlQ+WD5cP5w3oDS8OMA4xDncOeA55DlkNWg2hDaINpQ3pDeoN7Q3NDM4MFQ0W'
+      'DRcNXQ1eDV8NPwxADIcMiAyJDM8M0AzRDLELsgv5C/oL+wtBDEIMQwwjCyQLawtsC20L'
+      'swu0C7ULlQqWCt0K3grfCiULJgsnC3cJeAm/CcAJwQmXCpgKmQrpCOoIMQkyCTMJeQl6'
+      'CXsJWwhcCKMIpAinCOsI7AjvCM8H0AcXCBgIGQhfCGAIYQhBB0IHiQeKB4sH0QfSB9MH'
+      'swa0BvsG/Ab9BkMHRAdFByUGJgZtBm4Gbwa1BrYGtwaXBZgF3wXgBeEFJwYoBikGeQR6'
+      'BMEEwgTDBJkFmgWbBesD7AMzBDQENQR7BHwEfQTEBMUEnAWdBZ4F5AXlBeYF4gXjBSoG'
+      'KwYsBnIGcwZ0BnAGcQa4BrkGugYABwEHAgf+Bv8GRgdHB0gHjgePB5AHjAeNB9QH1QfW'
+      'BxwIHQgeCBoIGwhiCGMIZAiqCKsIrAioCKkI8AjxCPIIOAk5CToJNAk3CXwJfwmACcQJ'
+      'xwnICcIJwwmaCpsKnAriCuMK5ArgCuEKKAspCyoLcAtxC3ILbgtvC7YLtwu4C/4L/wsA'
+      'DPwL/QtEDEUMRgyMDI0MjgyKDIsM0gzTDNQMGg0bDRwNGA0ZDWANYQ1iDagNqQ2qDaYN'
+      'pw3uDe8N8A02DjcOOA4yDjUOeg59Dn4Owg7FDsYOwA7BDpgPmQ+aD+AP4Q/iD94P3w8m'
+      'ECcQKBBuEG8QcBBsEG0QtBC1ELYQ/BD9EP4Q+hD7EEIRQxFEEYoRixGMEYgRiRHQEdER'
+      '0hEYEhkSGhIWEhcSXhJfEmASphKnEqgSpBKlEuwS7RLuEjQTNRM2EzATMxN4E3sTfBPA'
+      'E8MTxBPvEvASNxM4EzkTfxOAE4ETYRJiEqkSqhKrEvES8hLzEtMR1BEbEhwSHRJjEmQS'
+      'ZRJFEUYRjRGOEY8R1RHWEdcRtxC4EP8QABEBEUcRSBFJESkQKhBxEHIQdRC5ELoQvRCd'
+      'D54P5Q/mD+cPLRAuEC8Qfw6ADscOyA7JDp8PoA+hD/EN8g05DjoOOw6BDoIOgw5jDWQN'
+      'qw2sDa0N8w30DfUN1QzWDB0NHg0fDWUNZg1nDUcMSAyPDJAMkQzXDNgM2Qy5C7oLAQwC'
+      'DAMMSQxKDEsMKwssC3MLdAt3C7sLvAu/C58KoArnCugK6QovCzALMQuBCYIJyQnKCcsJ'
+      'oQqiCqMK8wj0CDsJPAk9CYMJhAmFCWUIZgitCK4Irwj1CPYI9wjXB9gHHwggCCEIZwho'
+      'CGkISQdKB5EHkgeTB9kH2gfbB7sGvAYDBwQHBQdLB0wHTQeUB5UH3AfdB94HJAglCCYI'
+      'IggjCGoIawhsCLIIswi0CLAIsQj4CPkI+ghACUEJQgk+CT8JhgmHCYgJzgnPCdAJzAnN'
+      'CaQKpQqmCuwK7QruCuoK6woyCzMLNAt6C3sLfAt4C3kLwAvBC8ILCAwJDAoMBAwHDEwM'
+      'TwxQDJQMlwyYDJIMkwzaDNsM3AwiDSMNJA0gDSENaA1pDWoNsA2xDbINrg2vDfYN9w34'
+      'DT4OPw5ADjwOPQ6EDoUOhg7MDs0Ozg7KDssOog+jD6QP6g/rD+wP6A/pDzAQMRAyEHgQ'
+      'eRB6EHYQdxC+EL8QwBAGEQcRCBECEQURShFNEU4RkhGVEZYRkBGREdgR2RHaESASIRIi'
+      'Eh4SHxJmEmcSaBKuEq8SsBKsEq0S9BL1EvYSPBM9Ez4TOhM7E4ITgxOEE8oTyxPME/cS'
+      '+BI/E0ATQROHE4gTiRNpEmoSsRKyErUS+RL6Ev0S3RHeESUSJhInEm0SbhJvEk8RUBGX'
+      'EZgRmRHfEeAR4RHBEMIQCREKEQsRURFSEVMRMxA0EHsQfBB9EMMQxBDFEKUPpg/tD+4P'
+      '7w81EDYQNxCHDogOzw7QDtEOpw+oD6kP+Q36DUEOQg5DDokOig6LDmsNbA2zDbQNtw37'
+      'DfwN/w3fDOAMJw0oDSkNbw1wDXENUQxSDJkMmgybDOEM4gzjDMMLxAsLDAwMDQxTDFQM'
+      'VQw1CzYLfQt+C38LxQvGC8cLpwqoCu8K8ArxCjcLOAs5C4kJignRCdIJ0wmpCqoKqwr7'
+      'CPwIQwlECUUJiwmMCY0J1AnVCawKrQquCvQK9Qr2CvIK8wo6CzsLPAuCC4MLhAuAC4EL'
+      'yAvJC8oLEAwRDBIMDgwPDFYMVwxYDJ4MnwygDJwMnQzkDOUM5gwsDS0NLg0qDSsNcg1z'
+      'DXQNug27DbwNuA25DQAOAQ4CDkgOSQ5KDkQORw6MDo8OkA7UDtcO2A7SDtMOqg+rD6wP'
+      '8g/zD/QP8A/xDzgQORA6EIAQgRCCEH4QfxDGEMcQyBAOEQ8REBEMEQ0RVBFVEVYRnBGd'
+      'EZ4RmhGbEeIR4xHkESoSKxIsEigSKRJwEnESchK4ErkSuhK2ErcS/hL/EgATRhNHE0gT'
+      'QhNFE4oTjROOE9IT1RPWEwETAhNJE0oTSxORE5ITkxNzEnQSuxK8Er0SAxMEEwUT5RHm'
+      'ES0SLhIvEnUSdhJ3ElcRWBGfEaARoRHnEegR6RHJEMoQERESERMRWRFaEVsROxA8EIMQ'
+      'hBCHEMsQzBDPEK8PsA/3D/gP+Q8/EEAQQRCRDpIO2Q7aDtsOsQ+yD7MPAw4EDksOTA5N'
+      'DpMOlA6VDnUNdg29Db4Nvw0FDgYOBw7nDOgMLw0wDTENdw14DXkNWQxaDKEMogyjDOkM'
+      '6gzrDMsLzAsTDBQMFQxbDFwMXQykDKUM7AztDO4MNA01DTYNMg0zDXoNew18DcINww3E'
+      'DcANwQ0IDgkOCg5QDlEOUg5ODk8Olg6XDpgO3g7fDuAO3A7dDrQPtQ+2D/wP/Q/+D/oP'
+      '+w9CEEMQRBCKEIsQjBCIEIkQ0BDRENIQGBEZERoRFBEXEVwRXxFgEaQRpxGoEaIRoxHq'
+      'EesR7BEyEjMSNBIwEjESeBJ5EnoSwBLBEsISvhK/EgYTBxMIE04TTxNQE0wTTROUE5UT'
+      'lhPcE90T3hMJEwoTURNSE1MTmROaE5sTexJ8EsMSxBLHEgsTDBMPE+8R8BE3EjgSORJ/'
+      'EoASgRJhEWIRqRGqEasR8RHyEfMR0xDUEBsRHBEdEWMRZBFlEUUQRhCNEI4QjxDVENYQ'
+      '1xC3D7gP/w8AEAEQRxBIEEkQmQ6aDuEO4g7jDrkPug+7DwsODA5TDlQOVQ6bDpwOnQ7k'
+      'DuUOvA+9D74PBBAFEAYQAhADEEoQSxBMEJIQkxCUEJAQkRDYENkQ2hAgESERIhEeER8R'
+      'ZhFnEWgRrhGvEbARrBGtEfQR9RH2ETwSPRI+EjoSOxKCEoMShBLKEssSzBLIEskSEBMR'
+      'ExITWBNZE1oTVBNXE5wTnxOgE+QT5xPoExMTFBNbE1wTXROjE6QTpROFEoYSzRLOEs8S'
+      'FRMWExcT9xH4ET8SQBJBEocSiBKJEmkRahGxEbIRsxH5EfoR+xHbENwQIxEkESURaxFs'
+      'EW0RtBG1EfwR/RH+EUQSRRJGEkISQxKKEosSjBLSEtMS1BLQEtESGBMZExoTYBNhE2IT'
+      'XhNfE6YTpxOoE+4T7xPwExsTHBNjE2QTZROrE6wTrRM=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement80x80 = _unpackUint16(
+      'PQE+AY0BjgFBAd0B3gGRAVEAUgChAKIAowDxAPIA8wATGBQYYxhkGGUYUwBUAFUAZhhn'
+      'GFYAVwBYAKYApwCoAKQApQD0APUA9gBEAUUBRgFCAUMBkgGTAZQB4gHjAeQBLgLhAX4C'
+      'MQIyAs4CgQKCAr0DvgMNBA4EwQNdBF4EEQTRAtICIQMiAyMDcQNyA3MDMwI0AoMChAKF'
+      'AtMC1ALVApUBlgHlAeYB5wE1AjYCNwL3APgARwFIAUkBlwGYAZkBWQBaAKkAqgCrAPkA'
+      '+gD7ABsYHBhrGGwYbRhbAFwAXQBuGG8YXgBfAGAArgCvALAArACtAPwA/QD+AEwBTQFO'
+      'AUoBSwGaAZsBnAHqAesB7AHoAekBOAI5AjoCiAKJAooChgKHAtYC1wLYAiYDJwMoAyQD'
+      'JQN0A3UDdgPEA8UDxgPCA8MDEgQTBBQEYgRjBGQErgRhBP4EsQSyBE4FAQUCBd0G3gYt'
+      'By4H4QZ9B34HMQdRBVIFoQWiBaMFkQaSBpMGswS0BAMFBAUFBVMFVAVVBRUEFgRlBGYE'
+      'ZwS1BLYEtwR3A3gDxwPIA8kDFwQYBBkE2QLaAikDKgMrA3kDegN7AzsCPAKLAowCjQLb'
+      'AtwC3QKdAZ4B7QHuAe8BPQI+Aj8C/wAAAU8BUAFRAZ8BoAGhAWEAYgCxALIAtQABAQIB'
+      'BQElGCYYdRh2GHcYZQBmAGcAeBh5GGgAaQBqALgAuQC6ALYAtwAGAQcBCAFWAVcBWAFS'
+      'AVUBogGlAaYB8gH1AfYB8AHxAUACQQJCApACkQKSAo4CjwLeAt8C4AIuAy8DMAMsAy0D'
+      'fAN9A34DzAPNA84DygPLAxoEGwQcBGoEawRsBGgEaQS4BLkEugQIBQkFCgUGBQcFVgVX'
+      'BVgFpgWnBagFpAWlBZQGlQaWBuQG5QbmBuIG4wYyBzMHNAeCB4MHhAfOB4EHHgjRB9IH'
+      'bgghCCIIXQleCa0JrglhCf0J/gmxCXEIcgjBCMIIwwgRCRIJEwnTB9QHIwgkCCUIcwh0'
+      'CHUINQc2B4UHhgeHB9UH1gfXB5cGmAbnBugG6QY3BzgHOQdZBVoFqQWqBasFmQaaBpsG'
+      'uwS8BAsFDAUNBVsFXAVdBR0EHgRtBG4EbwS9BL4EvwR/A4ADzwPQA9EDHwQgBCEE4QLi'
+      'AjEDMgM1A4EDggOFA0UCRgKVApYClwLlAuYC5wKnAagB9wH4AfkBRwJIAkkCCQEKAVkB'
+      'WgFbAakBqgGrAWsAbAC7ALwAvQALAQwBDQEtGC4YfRh+GH8YbQBuAG8AgBiBGHAAcQBy'
+      'AMAAwQDCAL4AvwAOAQ8BEAFeAV8BYAFcAV0BrAGtAa4B/AH9Af4B+gH7AUoCSwJMApoC'
+      'mwKcApgCmQLoAukC6gI4AzkDOgM2AzcDhgOHA4gD1gPXA9gD0gPVAyIEJQQmBHIEdQR2'
+      'BHAEcQTABMEEwgQQBREFEgUOBQ8FXgVfBWAFrgWvBbAFrAWtBZwGnQaeBuwG7QbuBuoG'
+      '6wY6BzsHPAeKB4sHjAeIB4kH2AfZB9oHKAgpCCoIJggnCHYIdwh4CMYIxwjICMQIxQgU'
+      'CRUJFglkCWUJZgliCWMJsgmzCbQJAgoDCgQKTgoBCp4KUQpSCu4KoQqiCt0L3gstDC4M'
+      '4QsdDR4N0QzxCvIKQQtCC0MLkQuSC5MLUwpUCqMKpAqlCvMK9Ar1CrUJtgkFCgYKBwpV'
+      'ClYKVwoXCRgJZwloCWkJtwm4CbkJeQh6CMkIygjLCBkJGgkbCdsH3AcrCCwILQh7CHwI'
+      'fQg9Bz4HjQeOB48H3QfeB98HnwagBu8G8AbxBj8HQAdBB2EFYgWxBbIFtQWhBqIGpQbF'
+      'BMYEFQUWBRcFZQVmBWcFJwQoBHcEeAR5BMcEyATJBIkDigPZA9oD2wMpBCoEKwTrAuwC'
+      'OwM8Az0DiwOMA40DTQJOAp0CngKfAu0C7gLvAq8BsAH/AQACAQJPAlACUQIRARIBYQFi'
+      'AWMBsQGyAbMBcwB0AMMAxADFABMBFAEVATUYNhiFGIYYiRh1AHYAeQCKGIsYegB7AHwA'
+      'ygDLAMwAxgDJABYBGQEaAWYBaQFqAWQBZQG0AbUBtgEEAgUCBgICAgMCUgJTAlQCogKj'
+      'AqQCoAKhAvAC8QLyAkADQQNCAz4DPwOOA48DkAPeA98D4APcA90DLAQtBC4EfAR9BH4E'
+      'egR7BMoEywTMBBoFGwUcBRgFGQVoBWkFagW4BbkFugW2BbcFpganBqgG9gb3BvgG8gb1'
+      'BkIHRQdGB5IHlQeWB5AHkQfgB+EH4gcwCDEIMgguCC8Ifgh/CIAIzgjPCNAIzAjNCBwJ'
+      'HQkeCWwJbQluCWoJawm6CbsJvAkKCgsKDAoICgkKWApZCloKqAqpCqoKpgqnCvYK9wr4'
+      'CkYLRwtIC0QLRQuUC5ULlgvkC+UL5gviC+ML0gzTDNQMIg0jDSQNbg0hDb4NcQ1yDQ4O'
+      'wQ3CDf0O/g5ND04PAQ+dD54PUQ8RDhIOYQ5iDmMOsQ6yDrMOcw10DcMNxA3FDRMOFA4V'
+      'DtUM1gwlDSYNJw11DXYNdw2XC5gL5wvoC+kL1wzYDNkM+Qr6CkkLSgtLC5kLmgubC1sK'
+      'XAqrCqwKrQr7CvwK/Qq9Cb4JDQoOCg8KXQpeCl8KHwkgCW8JcAlxCb8JwAnBCYEIggjR'
+      'CNII1QghCSIJJQnlB+YHNQg2CDcIhQiGCIcIRwdIB5cHmAeZB+cH6AfpB6kGqgb5BvoG'
+      '+wZJB0oHSwdrBWwFuwW8Bb0FqwasBq0GzQTOBB0FHgUfBW0FbgVvBS8EMAR/BIAEgQTP'
+      'BNAE0QSRA5ID4QPiA+MDMQQyBDME8wL0AkMDRANFA5MDlAOVA1UCVgKlAqYCqQL1AvYC'
+      '+QK5AboBCQIKAgsCWQJaAlsCGwEcAWsBbAFtAbsBvAG9AX0AfgDNAM4AzwAdAR4BHwE/'
+      'GEAYjxiQGJEYfwCAAIEAkhiTGIIAgwCEANIA0wDUANAA0QAgASEBIgFwAXEBcgFuAW8B'
+      'vgG/AcABDgIPAhACDAINAlwCXQJeAqwCrQKuAqoCqwL6AvsC/AJKA0sDTANGA0kDlgOZ'
+      'A5oD5gPpA+oD5APlAzQENQQ2BIQEhQSGBIIEgwTSBNME1AQiBSMFJAUgBSEFcAVxBXIF'
+      'wAXBBcIFvgW/Ba4GrwawBv4G/wYAB/wG/QZMB00HTgecB50HngeaB5sH6gfrB+wHOgg7'
+      'CDwIOAg5CIgIiQiKCNgI2QjaCNYI1wgmCScJKAl2CXcJeAlyCXUJwgnFCcYJEgoVChYK'
+      'EAoRCmAKYQpiCrAKsQqyCq4Krwr+Cv8KAAtOC08LUAtMC00LnAudC54L7AvtC+4L6gvr'
+      'C9oM2wzcDCoNKw0sDSgNKQ14DXkNeg3IDckNyg3GDccNFg4XDhgOZg5nDmgOZA5lDrQO'
+      'tQ62DgQPBQ8GDwIPAw9SD1MPVA+iD6MPpA/uD6EPPhDxD/IPjhBBEEIQfRF+Ec0RzhGB'
+      'ER0SHhLREZEQkhDhEOIQ4xAxETIRMxHzD/QPQxBEEEUQkxCUEJUQVQ9WD6UPpg+nD/UP'
+      '9g/3D7cOuA4HDwgPCQ9XD1gPWQ8ZDhoOaQ5qDmsOuQ66DrsOew18DcsNzA3NDRsOHA4d'
+      'Dt0M3gwtDS4NLw19DX4Nfw2fC6AL7wvwC/EL3wzgDOEMAQsCC1ELUgtVC6ELogulC2UK'
+      'Zgq1CrYKtwoFCwYLBwvHCcgJFwoYChkKZwpoCmkKKQkqCXkJegl7CckJygnLCYsIjAjb'
+      'CNwI3QgrCSwJLQntB+4HPQg+CD8IjQiOCI8ITwdQB58HoAehB+8H8AfxB7EGsgYBBwIH'
+      'AwdRB1IHUwdzBXQFwwXEBcUFswa0BrUG1QTWBCUFJgUpBXUFdgV5BTkEOgSJBIoEiwTZ'
+      'BNoE2wSbA5wD6wPsA+0DOwQ8BD0E/QL+Ak0DTgNPA50DngOfA18CYAKvArACsQL/AgAD'
+      'AQPBAcIBEQISAhMCYQJiAmMCIwEkAXMBdAF1AcMBxAHFAYUAhgDVANYA1wAlASYBJwFH'
+      'GEgYlxiYGJkYhwCIAIkAmhidGIoAjQCOANoA3QDeANgA2QAoASkBKgF4AXkBegF2AXcB'
+      'xgHHAcgBFgIXAhgCFAIVAmQCZQJmArQCtQK2ArICswICAwMDBANSA1MDVANQA1EDoAOh'
+      'A6ID8APxA/ID7gPvAz4EPwRABI4EjwSQBIwEjQTcBN0E3gQsBS0FLgUqBSsFegV7BXwF'
+      'ygXLBcwFxgXJBbYGuQa6BgYHCQcKBwQHBQdUB1UHVgekB6UHpgeiB6MH8gfzB/QHQghD'
+      'CEQIQAhBCJAIkQiSCOAI4QjiCN4I3wguCS8JMAl+CX8JgAl8CX0JzAnNCc4JHAodCh4K'
+      'GgobCmoKawpsCroKuwq8CrgKuQoICwkLCgtYC1kLWgtWC1cLpgunC6gL9gv3C/gL8gv1'
+      'C+IM5QzmDDINNQ02DTANMQ2ADYENgg3QDdEN0g3ODc8NHg4fDiAObg5vDnAObA5tDrwO'
+      'vQ6+DgwPDQ8ODwoPCw9aD1sPXA+qD6sPrA+oD6kP+A/5D/oPSBBJEEoQRhBHEJYQlxCY'
+      'EOYQ5xDoEOQQ5RA0ETURNhGEEYURhhGCEYMR0hHTEdQRIhIjEiQSbhIhEl4TERMSE64T'
+      'YRNiE50UnhTtFO4UoRQ9FT4V8RSxE7ITARQCFAMUURRSFFMUExMUE2MTZBNlE7MTtBO1'
+      'E9UR1hElEiYSJxIVExYTFxM3ETgRhxGIEYkR1xHYEdkRmRCaEOkQ6hDrEDkROhE7EfsP'
+      '/A9LEEwQTRCbEJwQnRBdD14PrQ+uD68P/Q/+D/8Pvw7ADg8PEA8RD18PYA9hDyEOIg5x'
+      'DnIOdQ7BDsIOxQ6FDYYN1Q3WDdcNJQ4mDicO5wzoDDcNOA05DYcNiA2JDakLqgv5C/oL'
+      '+wvpDOoM6wwLCwwLWwtcC10LqwusC60LbQpuCr0Kvgq/Cg0LDgsPC88J0AkfCiAKIQpv'
+      'CnAKcQoxCTIJgQmCCYMJ0QnSCdMJkwiUCOMI5AjlCDMJNAk1CfUH9gdFCEYISQiVCJYI'
+      'mQhZB1oHqQeqB6sH+Qf6B/sHuwa8BgsHDAcNB1sHXAddB30FfgXNBc4FzwW9Br4Gvwbf'
+      'BOAELwUwBTEFfwWABYEFQQRCBJEEkgSTBOEE4gTjBKMDpAPzA/QD9QNDBEQERQQFAwYD'
+      'VQNWA1cDpQOmA6cDZwJoArcCuAK5AgcDCAMJA8kBygEZAhoCHQJpAmoCbQItAS4BfQF+'
+      'AX8BzQHOAc8BjwCQAN8A4ADhAC8BMAExAVEYUhihGKIYoxiRAJIAkwCkGKUYlACVAJYA'
+      '5ADlAOYA4gDjADIBMwE0AYIBgwGEAYABgQHQAdEB0gEgAiECIgIeAh8CbgJvAnACvgK/'
+      'AsACugK9AgoDDQMOA1oDXQNeA1gDWQOoA6kDqgP4A/kD+gP2A/cDRgRHBEgElgSXBJgE'
+      'lASVBOQE5QTmBDQFNQU2BTIFMwWCBYMFhAXSBdMF1AXQBdEFwAbBBsIGEAcRBxIHDgcP'
+      'B14HXwdgB64HrwewB6wHrQf8B/0H/gdMCE0ITghKCEsImgibCJwI6gjrCOwI5gjpCDYJ'
+      'OQk6CYYJiQmKCYQJhQnUCdUJ1gkkCiUKJgoiCiMKcgpzCnQKwgrDCsQKwArBChALEQsS'
+      'C2ALYQtiC14LXwuuC68LsAv+C/8LAAz8C/0L7AztDO4MPA09DT4NOg07DYoNiw2MDdoN'
+      '2w3cDdgN2Q0oDikOKg54DnkOeg52DncOxg7HDsgOFg8XDxgPEg8VD2IPZQ9mD7IPtQ+2'
+      'D7APsQ8AEAEQAhBQEFEQUhBOEE8QnhCfEKAQ7hDvEPAQ7BDtEDwRPRE+EYwRjRGOEYoR'
+      'ixHaEdsR3BEqEisSLBIoEikSGBMZExoTaBNpE2oTZhNnE7YTtxO4EwYUBxQIFAQUBRRU'
+      'FFUUVhSkFKUUphSiFKMU8hTzFPQUQhVDFUQVjhVBFd4VkRWSFS4W4RXiFR0XHhdtF24X'
+      'IRe9F74XcRcxFjIWgRaCFoMW0RbSFtMWkxWUFeMV5BXlFTMWNBY1FvUU9hRFFUYVRxWV'
+      'FZYVlxVXFFgUpxSoFKkU9xT4FPkUuRO6EwkUChQLFFkUWhRbFBsTHBNrE2wTbRO7E7wT'
+      'vRPdEd4RLRIuEi8SHRMeEx8TPxFAEY8RkBGREd8R4BHhEaEQohDxEPIQ9RBBEUIRRREF'
+      'EAYQVRBWEFcQpRCmEKcQZw9oD7cPuA+5DwcQCBAJEMkOyg4ZDxoPGw9pD2oPaw8rDiwO'
+      'ew58Dn0Oyw7MDs0OjQ2ODd0N3g3fDS0OLg4vDu8M8Aw/DUANQQ2PDZANkQ2xC7ILAQwC'
+      'DAMM8QzyDPMMEwsUC2MLZAtlC7MLtAu1C3UKdgrFCsYKyQoVCxYLGQvZCdoJKQoqCisK'
+      'eQp6CnsKOwk8CYsJjAmNCdsJ3AndCZ0IngjtCO4I7wg9CT4JPwn/BwAITwhQCFEInwig'
+      'CKEIYQdiB7EHsgezBwEIAggDCMMGxAYTBxQHFQdjB2QHZQeFBYYF1QXWBdcFxQbGBscG'
+      '5wToBDcFOAU5BYcFiAWJBUkESgSZBJoEnQTpBOoE7QStA64D/QP+A/8DTQROBE8EDwMQ'
+      'A18DYANhA68DsAOxA3ECcgLBAsICwwIRAxIDEwPTAdQBIwIkAiUCcwJ0AnUCNQE2AYUB'
+      'hgGHAdUB1gHXAZcAmADnAOgA6QA3ATgBOQFZGFoYqRiqGKsYmQCaAJsArBitGJwAnQCe'
+      'AOwA7QDuAOoA6wA6ATsBPAGKAYsBjAGIAYkB2AHZAdoBKAIpAioCJgInAnYCdwJ4AsYC'
+      'xwLIAsQCxQIUAxUDFgNkA2UDZgNiA2MDsgOzA7QDAgQDBAQEAAQBBFAEUQRSBKAEoQSi'
+      'BJ4EnwTuBO8E8AQ+BT8FQAU6BT0FigWNBY4F2gXdBd4F2AXZBcgGyQbKBhgHGQcaBxYH'
+      'FwdmB2cHaAe2B7cHuAe0B7UHBAgFCAYIVAhVCFYIUghTCKIIowikCPII8wj0CPAI8QhA'
+      'CUEJQgmQCZEJkgmOCY8J3gnfCeAJLgovCjAKLAotCnwKfQp+CswKzQrOCsoKywoaCxsL'
+      'HAtqC2sLbAtmC2kLtgu5C7oLBgwJDAoMBAwFDPQM9Qz2DEQNRQ1GDUINQw2SDZMNlA3i'
+      'DeMN5A3gDeENMA4xDjIOgA6BDoIOfg5/Ds4Ozw7QDh4PHw8gDxwPHQ9sD20Pbg+8D70P'
+      'vg+6D7sPChALEAwQWhBbEFwQWBBZEKgQqRCqEPgQ+RD6EPYQ9xBGEUcRSBGWEZcRmBGS'
+      'EZUR4hHlEeYRMhI1EjYSMBIxEiATIRMiE3ATcRNyE24TbxO+E78TwBMOFA8UEBQMFA0U'
+      'XBRdFF4UrBStFK4UqhSrFPoU+xT8FEoVSxVMFUgVSRWYFZkVmhXoFekV6hXmFecVNhY3'
+      'FjgWhhaHFogWhBaFFtQW1RbWFiQXJRcmFyIXIxdyF3MXdBfCF8MXxBcOGMEXXhgRGBIY'
+      'rhhhGGIYdRd2F8UXxhfHFxUYFhgXGNcW2BYnFygXKRd3F3gXeRc5FjoWiRaKFosW2Rba'
+      'FtsWmxWcFesV7BXtFTsWPBY9Fv0U/hRNFU4VTxWdFZ4VnxVfFGAUrxSwFLEU/xQAFQEV'
+      'wRPCExEUEhQVFGEUYhRlFCUTJhN1E3YTdxPFE8YTxxPnEegRNxI4EjkSJxMoEykTSRFK'
+      'EZkRmhGbEekR6hHrEasQrBD7EPwQ/RBLEUwRTRENEA4QXRBeEF8QrRCuEK8Qbw9wD78P'
+      'wA/BDw8QEBARENEO0g4hDyIPIw9xD3IPcw8zDjQOgw6EDoUO0w7UDtUOlQ2WDeUN5g3p'
+      'DTUONg45DvkM+gxJDUoNSw2ZDZoNmw27C7wLCwwMDA0M+wz8DP0MHQseC20LbgtvC70L'
+      'vgu/C38KgArPCtAK0QofCyALIQvhCeIJMQoyCjMKgQqCCoMKQwlECZMJlAmVCeMJ5Anl'
+      'CaUIpgj1CPYI9whFCUYJRwkHCAgIVwhYCFkIpwioCKkIaQdqB7kHuge9BwkICggNCM0G'
+      'zgYdBx4HHwdtB24HbwePBZAF3wXgBeEFzwbQBtEG8QTyBEEFQgVDBZEFkgWTBVMEVASj'
+      'BKQEpQTzBPQE9QS1A7YDBQQGBAcEVQRWBFcEFwMYA2cDaANpA7cDuAO5A3kCegLJAsoC'
+      'ywIZAxoDGwPbAdwBKwIsAi0CewJ8An0CzALNAhwDHQMeA2wDbQNuA2oDawO6A7sDvAMK'
+      'BAsEDAQIBAkEWARZBFoEqASpBKoEpgSnBPYE9wT4BEYFRwVIBUQFRQWUBZUFlgXkBeUF'
+      '5gXiBeMF0gbTBtQGIgcjByQHIAchB3AHcQdyB8AHwQfCB74HvwcOCA8IEAheCF8IYAha'
+      'CF0IqgitCK4I+gj9CP4I+Aj5CEgJSQlKCZgJmQmaCZYJlwnmCecJ6Ak2CjcKOAo0CjUK'
+      'hAqFCoYK1ArVCtYK0grTCiILIwskC3ILcwt0C3ALcQvAC8ELwgsQDBEMEgwODA8M/gz/'
+      'DAANTg1PDVANTA1NDZwNnQ2eDewN7Q3uDeoN6w06DjsOPA6KDosOjA6GDokO1g7ZDtoO'
+      'Jg8pDyoPJA8lD3QPdQ92D8QPxQ/GD8IPww8SEBMQFBBiEGMQZBBgEGEQsBCxELIQABEB'
+      'EQIR/hD/EE4RTxFQEZ4RnxGgEZwRnRHsEe0R7hE8Ej0SPhI6EjsSKhMrEywTehN7E3wT'
+      'eBN5E8gTyRPKExgUGRQaFBYUFxRmFGcUaBS2FLcUuBSyFLUUAhUFFQYVUhVVFVYVUBVR'
+      'FaAVoRWiFfAV8RXyFe4V7xU+Fj8WQBaOFo8WkBaMFo0W3BbdFt4WLBctFy4XKhcrF3oX'
+      'exd8F8oXyxfMF8gXyRcYGBkYGhhoGGkYahh9F34XzRfOF88XHRgeGB8Y3xbgFi8XMBcx'
+      'F38XgBeBF0EWQhaRFpIWlRbhFuIW5RalFaYV9RX2FfcVRRZGFkcWBxUIFVcVWBVZFacV'
+      'qBWpFWkUahS5FLoUuxQJFQoVCxXLE8wTGxQcFB0UaxRsFG0ULRMuE30TfhN/E80TzhPP'
+      'E+8R8BE/EkASQRIvEzATMRNREVIRoRGiEaMR8RHyEfMRsxC0EAMRBBEFEVMRVBFVERUQ'
+      'FhBlEGYQaRC1ELYQuRB5D3oPyQ/KD8sPGRAaEBsQ2w7cDisPLA8tD3sPfA99Dz0OPg6N'
+      'Do4Ojw7dDt4O3w6fDaAN7w3wDfENPw5ADkEOAQ0CDVENUg1TDaENog2jDcMLxAsTDBQM'
+      'FQwDDQQNBQ0lCyYLdQt2C3cLxQvGC8cLhwqICtcK2ArZCicLKAspC+kJ6gk5CjoKPQqJ'
+      'CooKjQpNCU4JnQmeCZ8J7QnuCe8JrwiwCP8IAAkBCU8JUAlRCREIEghhCGIIYwixCLII'
+      'swhzB3QHwwfEB8UHEwgUCBUI1QbWBiUHJgcnB3UHdgd3B5cFmAXnBegF6QXXBtgG2Qb5'
+      'BPoESQVKBUsFmQWaBZsFWwRcBKsErAStBPsE/AT9BEwFTQWcBZ0FngXsBe0F7gXqBesF'
+      '2gbbBtwGKgcrBywHKAcpB3gHeQd6B8gHyQfKB8YHxwcWCBcIGAhmCGcIaAhkCGUItAi1'
+      'CLYIBAkFCQYJAgkDCVIJUwlUCaIJowmkCaAJoQnwCfEJ8glACkEKQgo+Cj8KjgqPCpAK'
+      '3grfCuAK2grdCioLLQsuC3oLfQt+C3gLeQvIC8kLygsYDBkMGgwWDBcMBg0HDQgNVg1X'
+      'DVgNVA1VDaQNpQ2mDfQN9Q32DfIN8w1CDkMORA6SDpMOlA6QDpEO4A7hDuIOMA8xDzIP'
+      'Lg8vD34Pfw+AD84Pzw/QD8wPzQ8cEB0QHhBsEG0QbhBqEGsQuhC7ELwQChELEQwRBhEJ'
+      'EVYRWRFaEaYRqRGqEaQRpRH0EfUR9hFEEkUSRhJCEkMSMhMzEzQTghODE4QTgBOBE9AT'
+      '0RPSEyAUIRQiFB4UHxRuFG8UcBS+FL8UwBS8FL0UDBUNFQ4VXBVdFV4VWhVbFaoVqxWs'
+      'FfoV+xX8FfgV+RVIFkkWShaYFpkWmhaWFpcW5hbnFugWNhc3FzgXMhc1F4IXhReGF9IX'
+      '1RfWF9AX0RcgGCEYIhhwGHEYchiHF4gX1xfYF9kXJxgoGCkY6RbqFjkXOhc7F4kXiheL'
+      'F0sWTBabFpwWnRbrFuwW7RatFa4V/RX+Ff8VTRZOFk8WDxUQFV8VYBVhFa8VsBWxFXEU'
+      'chTBFMIUwxQRFRIVExXTE9QTIxQkFCUUcxR0FHUUNRM2E4UThhOJE9UT1hPZE/kR+hFJ'
+      'EkoSSxI5EzoTOxNbEVwRqxGsEa0R+xH8Ef0RvRC+EA0RDhEPEV0RXhFfER8QIBBvEHAQ'
+      'cRC/EMAQwRCBD4IP0Q/SD9MPIRAiECMQ4w7kDjMPNA81D4MPhA+FD0UORg6VDpYOlw7l'
+      'DuYO5w6nDagN9w34DfkNRw5IDkkOCQ0KDVkNWg1dDakNqg2tDc0LzgsdDB4MHwwNDQ4N'
+      'Dw0vCzALfwuAC4ELzwvQC9ELkQqSCuEK4grjCjELMgszC/MJ9AlDCkQKRQqTCpQKlQpV'
+      'CVYJpQmmCacJ9Qn2CfcJtwi4CAcJCAkJCVcJWAlZCRkIGghpCGoIawi5CLoIuwh7B3wH'
+      'ywfMB80HGwgcCB0IbAhtCLwIvQi+CAwJDQkOCQoJCwlaCVsJXAmqCasJrAmoCakJ+An5'
+      'CfoJSApJCkoKRgpHCpYKlwqYCuYK5wroCuQK5Qo0CzULNguEC4ULhguCC4ML0gvTC9QL'
+      'IgwjDCQMIAwhDBANEQ0SDWANYQ1iDV4NXw2uDa8NsA3+Df8NAA76Df0NSg5NDk4Omg6d'
+      'Dp4OmA6ZDugO6Q7qDjgPOQ86DzYPNw+GD4cPiA/WD9cP2A/UD9UPJBAlECYQdBB1EHYQ'
+      'chBzEMIQwxDEEBIRExEUERARERFgEWERYhGwEbERshGuEa8R/hH/EQASThJPElASTBJN'
+      'EjwTPRM+E4wTjROOE4oTixPaE9sT3BMqFCsULBQmFCkUdhR5FHoUxhTJFMoUxBTFFBQV'
+      'FRUWFWQVZRVmFWIVYxWyFbMVtBUCFgMWBBYAFgEWUBZRFlIWoBahFqIWnhafFu4W7xbw'
+      'Fj4XPxdAFzwXPReMF40XjhfcF90X3hfaF9sXKhgrGCwYehh7GHwYjxeQF98X4BfhFy8Y'
+      'MBgxGPEW8hZBF0IXQxeRF5IXkxdTFlQWoxakFqUW8xb0FvUWtRW2FQUWBhYJFlUWVhZZ'
+      'FhkVGhVpFWoVaxW5FboVuxV7FHwUyxTMFM0UGxUcFR0V3RPeEy0ULhQvFH0UfhR/FD8T'
+      'QBOPE5ATkRPfE+AT4RMBEgISURJSElMSQRNCE0MTYxFkEbMRtBG1EQMSBBIFEsUQxhAV'
+      'ERYRFxFlEWYRZxEnECgQdxB4EHkQxxDIEMkQiQ+KD9kP2g/dDykQKhAtEO0O7g49Dz4P'
+      'Pw+ND44Pjw9PDlAOnw6gDqEO7w7wDvEOsQ2yDQEOAg4DDlEOUg5TDhMNFA1jDWQNZQ2z'
+      'DbQNtQ3VC9YLJQwmDCcMFQ0WDRcNNws4C4cLiAuJC9cL2AvZC5kKmgrpCuoK6wo5CzoL'
+      'Owv7CfwJSwpMCk0KmwqcCp0K7ArtCjwLPQs+C4wLjQuOC4oLiwvaC9sL3AsqDCsMLAwo'
+      'DCkMGA0ZDRoNaA1pDWoNZg1nDbYNtw24DQYOBw4IDgQOBQ5UDlUOVg6kDqUOpg6iDqMO'
+      '8g7zDvQOQg9DD0QPQA9BD5APkQ+SD+AP4Q/iD94P3w8uEC8QMBB+EH8QgBB6EH0QyhDN'
+      'EM4QGhEdER4RGBEZEWgRaRFqEbgRuRG6EbYRtxEGEgcSCBJWElcSWBJUElUSRBNFE0YT'
+      'lBOVE5YTkhOTE+IT4xPkEzIUMxQ0FDAUMRSAFIEUghTQFNEU0hTOFM8UHhUfFSAVbhVv'
+      'FXAVbBVtFbwVvRW+FQwWDRYOFgoWCxZaFlsWXBaqFqsWrBamFqkW9hb5FvoWRhdJF0oX'
+      'RBdFF5QXlReWF+QX5RfmF+IX4xcyGDMYNBiCGIMYhBiZF5oX6RfqF+sXORg6GDsY+xb8'
+      'FksXTBdNF5sXnBedF10WXhatFq4Wrxb9Fv4W/xa/FcAVDxYQFhEWXxZgFmEWIRUiFXEV'
+      'chVzFcEVwhXDFYMUhBTTFNQU1RQjFSQVJRXlE+YTNRQ2FDcUhRSGFIcURxNIE5cTmBOZ'
+      'E+cT6BPpEwkSChJZEloSXRJJE0oTTRNtEW4RvRG+Eb8RDRIOEg8SzxDQEB8RIBEhEW8R'
+      'cBFxETEQMhCBEIIQgxDRENIQ0xCTD5QP4w/kD+UPMxA0EDUQ9Q72DkUPRg9HD5UPlg+X'
+      'D1cOWA6nDqgOqQ73DvgO+Q65DboNCQ4KDgsOWQ5aDlsOGw0cDWsNbA1tDbsNvA29DQwO'
+      'DQ5cDl0OXg6sDq0Org6qDqsO+g77DvwOSg9LD0wPSA9JD5gPmQ+aD+gP6Q/qD+YP5w82'
+      'EDcQOBCGEIcQiBCEEIUQ1BDVENYQJBElESYRIhEjEXIRcxF0EcIRwxHEEcARwREQEhES'
+      'EhJgEmESYhJeEl8SThNPE1ATnhOfE6ATmhOdE+oT7RPuEzoUPRQ+FDgUORSIFIkUihTY'
+      'FNkU2hTWFNcUJhUnFSgVdhV3FXgVdBV1FcQVxRXGFRQWFRYWFhIWExZiFmMWZBayFrMW'
+      'tBawFrEWABcBFwIXUBdRF1IXThdPF54XnxegF+4X7xfwF+wX7Rc8GD0YPhiMGI0Yjhih'
+      'F6IX8RfyF/MXQRhCGEMYAxcEF1MXVBdVF6MXpBelF2UWZha1FrYWtxYFFwYXBxfHFcgV'
+      'FxYYFhkWZxZoFmkWKRUqFXkVehV9FckVyhXNFY0UjhTdFN4U3xQtFS4VLxXvE/ATPxRA'
+      'FEEUjxSQFJEUURNSE6ETohOjE/ET8hPzExMSFBJjEmQSZRJTE1QTVRN1EXYRxRHGEccR'
+      'FRIWEhcS1xDYECcRKBEpEXcReBF5ETkQOhCJEIoQixDZENoQ2xCbD5wP6w/sD+0POxA8'
+      'ED0QjBCNENwQ3RDeECwRLREuESoRKxF6EXsRfBHKEcsRzBHIEckRGBIZEhoSaBJpEmoS'
+      'ZhJnElYTVxNYE6YTpxOoE6QTpRP0E/UT9hNEFEUURhRCFEMUkhSTFJQU4hTjFOQU4BTh'
+      'FDAVMRUyFYAVgRWCFX4VfxXOFc8V0BUeFh8WIBYaFh0WahZtFm4Wuha9Fr4WuBa5FggX'
+      'CRcKF1gXWRdaF1YXVxemF6cXqBf2F/cX+Bf0F/UXRBhFGEYYlBiVGJYYqReqF/kX+hf9'
+      'F0kYShhNGA0XDhddF14XXxetF64XrxdvFnAWvxbAFsEWDxcQFxEX0RXSFSEWIhYjFnEW'
+      'chZzFjMVNBWDFYQVhRXTFdQV1RWVFJYU5RTmFOcUNRU2FTcV9xP4E0cUSBRJFJcUmBSZ'
+      'FFkTWhOpE6oTqxP5E/oT+xMbEhwSaxJsEm0SWxNcE10TrBOtE/wT/RP+E0wUTRROFEoU'
+      'SxSaFJsUnBTqFOsU7BToFOkUOBU5FToViBWJFYoVhhWHFdYV1xXYFSYWJxYoFiQWJRZ0'
+      'FnUWdhbEFsUWxhbCFsMWEhcTFxQXYhdjF2QXYBdhF7AXsReyFwAYARgCGP4X/xdOGE8Y'
+      'UBieGJ8YoBizF7QXAxgEGAUYUxhUGFUYFRcWF2UXZhdnF7UXthe3F3cWeBbHFsgWyRYX'
+      'FxgXGRfZFdoVKRYqFisWeRZ6FnsWOxU8FYsVjBWNFdsV3BXdFSwWLRZ8Fn0WfhbMFs0W'
+      'zhbKFssWGhcbFxwXahdrF2wXaBdpF7gXuRe6FwgYCRgKGAYYBxhWGFcYWBimGKcYqBi7'
+      'F7wXCxgMGA0YWxhcGF0Y');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement88x88 = _unpackUint16(
+      'XQFeAbUBtgFhAQ0CDgK5AVkAWgCxALIAswAJAQoBCwE7HTwdkx2UHZUdWwBcAF0Alh2X'
+      'HV4AXwBgALYAtwC4ALQAtQAMAQ0BDgFkAWUBZgFiAWMBugG7AbwBEgITAhQCZgIRAr4C'
+      'aQJqAhYDwQLCAh0EHgR1BHYEIQTNBM4EeQQZAxoDcQNyA3MDyQPKA8sDawJsAsMCxALF'
+      'AhsDHAMdA70BvgEVAhYCFwJtAm4CbwIPARABZwFoAWkBvwHAAcEBYQBiALkAugC7ABEB'
+      'EgETAUMdRB2bHZwdnR1jAGQAZQCeHZ8dZgBnAGgAvgC/AMAAvAC9ABQBFQEWAWwBbQFu'
+      'AWoBawHCAcMBxAEaAhsCHAIYAhkCcAJxAnICyALJAsoCxgLHAh4DHwMgA3YDdwN4A3QD'
+      'dQPMA80DzgMkBCUEJgQiBCMEegR7BHwE0gTTBNQEJgXRBH4FKQUqBdYFgQWCBd0G3gY1'
+      'BzYH4QY9CD4I6QfZBdoFMQYyBjMGiQaKBosGKwUsBYMFhAWFBdsF3AXdBX0EfgTVBNYE'
+      '1wQtBS4FLwXPA9ADJwQoBCkEfwSABIEEIQMiA3kDegN7A9ED0gPTA3MCdALLAswCzQIj'
+      'AyQDJQPFAcYBHQIeAh8CdQJ2AncCFwEYAW8BcAFxAccByAHJAWkAagDBAMIAwwAZARoB'
+      'GwFLHUwdox2kHacdawBsAG8AqB2pHXAAcQByAMgAyQDKAMQAxwAcAR8BIAF0AXcBeAFy'
+      'AXMBygHLAcwBIgIjAiQCIAIhAngCeQJ6AtAC0QLSAs4CzwImAycDKAN+A38DgAN8A30D'
+      '1APVA9YDLAQtBC4EKgQrBIIEgwSEBNoE2wTcBNgE2QQwBTEFMgWIBYkFigWGBYcF3gXf'
+      'BeAFNgY3BjgGNAY1BowGjQaOBuQG5QbmBuIG4wbqB+sH7AdCCEMIRAiWCEEI7giZCJoI'
+      'RgnxCPIITQpOCqUKpgpRCv0K/gqpCkkJSgmhCaIJown5CfoJ+wmbCJwI8wj0CPUISwlM'
+      'CU0J7QfuB0UIRghHCJ0IngifCI8GkAbnBugG6QbvB/AH8QfhBeIFOQY6BjsGkQaSBpMG'
+      'MwU0BYsFjAWNBeMF5AXlBYUEhgTdBN4E3wQ1BTYFNwXXA9gDLwQwBDEEhwSIBIkEKQMq'
+      'A4EDggODA9kD2gPbA3sCfALTAtQC1wIrAywDLwPPAdABJwIoAikCfwKAAoECIQEiAXkB'
+      'egF7AdEB0gHTAXMAdADLAMwAzQAjASQBJQFVHVYdrR2uHa8ddQB2AHcAsB2xHXgAeQB6'
+      'ANAA0QDSAM4AzwAmAScBKAF+AX8BgAF8AX0B1AHVAdYBLAItAi4CKgIrAoICgwKEAtoC'
+      '2wLcAtgC2QIwAzEDMgOIA4kDigOEA4cD3APfA+ADNAQ3BDgEMgQzBIoEiwSMBOIE4wTk'
+      'BOAE4QQ4BTkFOgWQBZEFkgWOBY8F5gXnBegFPgY/BkAGPAY9BpQGlQaWBuwG7QbuBuoG'
+      '6wbyB/MH9AdKCEsITAhICEkIoAihCKII+Aj5CPoI9gj3CE4JTwlQCaYJpwmoCaQJpQn8'
+      'Cf0J/glUClUKVgpSClMKqgqrCqwKAgsDCwQLVgsBC64LWQtaCwYMsQuyCw0NDg1lDWYN'
+      'EQ29Db4NaQ0JDAoMYQxiDGMMuQy6DLsMWwtcC7MLtAu1CwsMDAwNDK0KrgoFCwYLBwtd'
+      'C14LXwv/CQAKVwpYClkKrwqwCrEKUQlSCakJqgmrCQEKAgoDCqMIpAj7CPwI/QhTCVQJ'
+      'VQn1B/YHTQhOCE8IpQimCKcIlwaYBu8G8AbxBvcH+Af5B+kF6gVBBkIGQwaZBpoGmwY7'
+      'BTwFkwWUBZcF6wXsBe8FjwSQBOcE6ATpBD8FQAVBBeED4gM5BDoEOwSRBJIEkwQzAzQD'
+      'iwOMA40D4wPkA+UDhQKGAt0C3gLfAjUDNgM3A9cB2AEvAjACMQKHAogCiQIpASoBgQGC'
+      'AYMB2QHaAdsBewB8ANMA1ADVACsBLAEtAV0dXh21HbYdtx19AH4AfwC4HbkdgACBAIIA'
+      '2ADZANoA1gDXAC4BLwEwAYYBhwGIAYQBhQHcAd0B3gE0AjUCNgIyAjMCigKLAowC4gLj'
+      'AuQC4ALhAjgDOQM6A5ADkQOSA44DjwPmA+cD6AM+BD8EQAQ8BD0ElASVBJYE7ATtBO4E'
+      '6gTrBEIFQwVEBZoFmwWcBZgFmQXwBfEF8gVIBkkGSgZEBkcGnAafBqAG9Ab3BvgG8gbz'
+      'BvoH+wf8B1IIUwhUCFAIUQioCKkIqggACQEJAgn+CP8IVglXCVgJrgmvCbAJrAmtCQQK'
+      'BQoGClwKXQpeCloKWwqyCrMKtAoKCwsLDAsICwkLYAthC2ILuAu5C7oLtgu3Cw4MDwwQ'
+      'DGYMZwxoDGQMZQy8DL0MvgwUDRUNFg0SDRMNag1rDWwNwg3DDcQNFg7BDW4OGQ4aDsYO'
+      'cQ5yDn0QfhDVENYQgRAtES4R2RB5D3oP0Q/SD9MPKRAqECsQGw4cDnMOdA51DnsPfA99'
+      'D20Nbg3FDcYNxw0dDh4OHw6/DMAMFw0YDRkNbw1wDXENEQwSDGkMagxrDMEMwgzDDGML'
+      'ZAu7C7wLvQsTDBQMFQy1CrYKDQsOCw8LZQtmC2cLBwoICl8KYAphCrcKuAq5ClkJWgmx'
+      'CbIJswkJCgoKCwqrCKwIAwkECQcJWwlcCV8J/wcACFcIWAhZCK8IsAixCKEGogb5BvoG'
+      '+wYBCAIIAwjzBfQFSwZMBk0GowakBqUGRQVGBZ0FngWfBfUF9gX3BZcEmATvBPAE8QRH'
+      'BUgFSQXpA+oDQQRCBEMEmQSaBJsEOwM8A5MDlAOVA+sD7APtA40CjgLlAuYC5wI9Az4D'
+      'PwPfAeABNwI4AjkCjwKQApECMQEyAYkBigGNAeEB4gHlAYUAhgDdAN4A3wA1ATYBNwFn'
+      'HWgdvx3AHcEdhwCIAIkAwh3DHYoAiwCMAOIA4wDkAOAA4QA4ATkBOgGQAZEBkgGOAY8B'
+      '5gHnAegBPgI/AkACOgI9ApIClQKWAuoC7QLuAugC6QJAA0EDQgOYA5kDmgOWA5cD7gPv'
+      'A/ADRgRHBEgERARFBJwEnQSeBPQE9QT2BPIE8wRKBUsFTAWiBaMFpAWgBaEF+AX5BfoF'
+      'UAZRBlIGTgZPBqYGpwaoBv4G/wYAB/wG/QYECAUIBghcCF0IXghaCFsIsgizCLQICgkL'
+      'CQwJCAkJCWAJYQliCbgJuQm6CbQJtwkMCg8KEApkCmcKaApiCmMKugq7CrwKEgsTCxQL'
+      'EAsRC2gLaQtqC8ALwQvCC74LvwsWDBcMGAxuDG8McAxsDG0MxAzFDMYMHA0dDR4NGg0b'
+      'DXINcw10DcoNyw3MDcgNyQ0gDiEOIg54DnkOeg52DncOfg9/D4AP1g/XD9gP1A/VDywQ'
+      'LRAuEIQQhRCGEIIQgxDaENsQ3BAyETMRNBGGETER3hGJEYoRNhLhEeIRPRM+E5UTlhNB'
+      'E+0T7hOZEzkSOhKREpISkxLpEuoS6xKLEYwR4xHkEeUROxI8Ej0S3RDeEDURNhE3EY0R'
+      'jhGPES8QMBCHEIgQiRDfEOAQ4RCBD4IP2Q/aD9sPMRAyEDMQIw4kDnsOfA59DoMPhA+F'
+      'D3UNdg3NDc4Nzw0lDiYOJw7HDMgMHw0gDSENdw14DXkNGQwaDHEMcgxzDMkMygzLDGsL'
+      'bAvDC8QLxwsbDBwMHwy/CsAKFwsYCxkLbwtwC3ELEQoSCmkKagprCsEKwgrDCmMJZAm7'
+      'CbwJvQkTChQKFQq1CLYIDQkOCQ8JZQlmCWcJBwgICF8IYAhhCLcIuAi5CKkGqgYBBwIH'
+      'AwcJCAoICwj7BfwFUwZUBlUGqwasBq0GTQVOBaUFpgWnBf0F/gX/BZ8EoAT3BPgE+QRP'
+      'BVAFUQXxA/IDSQRKBE0EoQSiBKUERQNGA50DngOfA/UD9gP3A5cCmALvAvAC8QJHA0gD'
+      'SQPpAeoBQQJCAkMCmQKaApsCOwE8AZMBlAGVAesB7AHtAY0AjgDlAOYA5wA9AT4BPwFv'
+      'HXAdxx3IHckdjwCQAJEAyh3LHZIAkwCUAOoA6wDsAOgA6QBAAUEBQgGYAZkBmgGWAZcB'
+      '7gHvAfABRgJHAkgCRAJFApwCnQKeAvQC9QL2AvIC8wJKA0sDTAOiA6MDpAOgA6ED+AP5'
+      'A/oDUARRBFIETgRPBKYEpwSoBP4E/wQABfoE/QRSBVUFVgWqBa0FrgWoBakFAAYBBgIG'
+      'WAZZBloGVgZXBq4GrwawBgYHBwcIBwQHBQcMCA0IDghkCGUIZghiCGMIugi7CLwIEgkT'
+      'CRQJEAkRCWgJaQlqCcAJwQnCCb4JvwkWChcKGApuCm8KcApsCm0KxArFCsYKHAsdCx4L'
+      'GgsbC3ILcwt0C8oLywvMC8gLyQsgDCEMIgx4DHkMegx0DHcMzAzPDNAMJA0nDSgNIg0j'
+      'DXoNew18DdIN0w3UDdAN0Q0oDikOKg6ADoEOgg5+Dn8Ohg+HD4gP3g/fD+AP3A/dDzQQ'
+      'NRA2EIwQjRCOEIoQixDiEOMQ5BA6ETsRPBE4ETkRkBGREZIR6BHpEeoR5hHnET4SPxJA'
+      'EpYSlxKYEpQSlRLsEu0S7hJEE0UTRhNCE0MTmhObE5wT8hPzE/QTRhTxE54USRRKFPYU'
+      'oRSiFP0V/hVVFlYWARZdF14XCRf5FPoUURVSFVMVqRWqFasVSxRMFKMUpBSlFPsU/BT9'
+      'FJ0TnhP1E/YT9xNNFE4UTxTvEvASRxNIE0kTnxOgE6ETQRJCEpkSmhKbEvES8hLzEpMR'
+      'lBHrEewR7RFDEkQSRRLlEOYQPRE+ET8RlRGWEZcRNxA4EI8QkBCREOcQ6BDpEIkPig/h'
+      'D+IP4w85EDoQOxArDiwOgw6EDocOiw+MD48Pfw2ADdcN2A3ZDS8OMA4xDtEM0gwpDSoN'
+      'Kw2BDYINgw0jDCQMewx8DH0M0wzUDNUMdQt2C80LzgvPCyUMJgwnDMcKyAofCyALIQt3'
+      'C3gLeQsZChoKcQpyCnMKyQrKCssKawlsCcMJxAnFCRsKHAodCr0IvggVCRYJFwltCW4J'
+      'bwkPCBAIZwhoCGkIvwjACMEIsQayBgkHCgcNBxEIEggVCAUGBgZdBl4GXwa1BrYGtwZX'
+      'BVgFrwWwBbEFBwYIBgkGqQSqBAEFAgUDBVkFWgVbBfsD/ANTBFQEVQSrBKwErQRNA04D'
+      'pQOmA6cD/QP+A/8DnwKgAvcC+AL5Ak8DUANRA/EB8gFJAkoCSwKhAqICowJDAUQBmwGc'
+      'AZ0B8wH0AfUBlQCWAO0A7gDvAEUBRgFHAXcdeB3PHdAd0x2XAJgAmwDUHdUdnACdAJ4A'
+      '9AD1APYA8ADzAEgBSwFMAaABowGkAZ4BnwH2AfcB+AFOAk8CUAJMAk0CpAKlAqYC/AL9'
+      'Av4C+gL7AlIDUwNUA6oDqwOsA6gDqQMABAEEAgRYBFkEWgRWBFcErgSvBLAEBgUHBQgF'
+      'BAUFBVwFXQVeBbQFtQW2BbIFswUKBgsGDAZiBmMGZAZgBmEGuAa5BroGEAcRBxIHDgcP'
+      'BxYIFwgYCG4IbwhwCGoIbQjCCMUIxggaCR0JHgkYCRkJcAlxCXIJyAnJCcoJxgnHCR4K'
+      'HwogCnYKdwp4CnQKdQrMCs0KzgokCyULJgsiCyMLegt7C3wL0gvTC9QL0AvRCygMKQwq'
+      'DIAMgQyCDH4MfwzWDNcM2AwuDS8NMA0sDS0NhA2FDYYN3A3dDd4N2g3bDTIOMw40DooO'
+      'iw6MDogOiQ6QD5EPkg/oD+kP6g/kD+cPPBA/EEAQlBCXEJgQkhCTEOoQ6xDsEEIRQxFE'
+      'EUARQRGYEZkRmhHwEfER8hHuEe8RRhJHEkgSnhKfEqASnBKdEvQS9RL2EkwTTRNOE0oT'
+      'SxOiE6MTpBP6E/sT/BP4E/kTUBRRFFIUqBSpFKoUphSnFP4U/xQAFVYVVxVYFVQVVRWs'
+      'Fa0VrhUEFgUWBhYCFgMWChcLFwwXYhdjF2QXthdhFw4YuRe6F2YYERgSGG0ZbhnFGcYZ'
+      'cRkdGh4ayRlpGGoYwRjCGMMYGRkaGRsZuxe8FxMYFBgVGGsYbBhtGA0XDhdlF2YXZxe9'
+      'F74XvxevFbAVBxYIFgkWDxcQFxEXARUCFVkVWhVbFbEVshWzFVMUVBSrFKwUrRQDFQQV'
+      'BRWlE6YT/RP+E/8TVRRWFFcU9xL4Ek8TUBNRE6cTqBOpE0kSShKhEqISoxL5EvoS+xKb'
+      'EZwR8xH0EfcRSxJMEk8S7xDwEEcRSBFJEZ8RoBGhEUEQQhCZEJoQmxDxEPIQ8xCTD5QP'
+      '6w/sD+0PQxBEEEUQNQ42Do0Ojg6PDpUPlg+XD4cNiA3fDeAN4Q03DjgOOQ7ZDNoMMQ0y'
+      'DTMNiQ2KDYsNKwwsDIMMhAyFDNsM3AzdDH0LfgvVC9YL1wstDC4MLwzPCtAKJwsoCykL'
+      'fwuAC4ELIQoiCnkKegp9CtEK0grVCnUJdgnNCc4JzwklCiYKJwrHCMgIHwkgCSEJdwl4'
+      'CXkJGQgaCHEIcghzCMkIygjLCLsGvAYTBxQHFQcbCBwIHQgNBg4GZQZmBmcGvQa+Br8G'
+      'XwVgBbcFuAW5BQ8GEAYRBrEEsgQJBQoFCwVhBWIFYwUDBAQEWwRcBF0EswS0BLUEVQNW'
+      'A60DrgOvAwUEBgQHBKcCqAL/AgADAwNXA1gDWwP7AfwBUwJUAlUCqwKsAq0CTQFOAaUB'
+      'pgGnAf0B/gH/AZ8AoAD3APgA+QBPAVABUQGBHYId2R3aHdsdoQCiAKMA3B3dHaQApQCm'
+      'APwA/QD+APoA+wBSAVMBVAGqAasBrAGoAakBAAIBAgICWAJZAloCVgJXAq4CrwKwAgYD'
+      'BwMIAwQDBQNcA10DXgO0A7UDtgOwA7MDCAQLBAwEYARjBGQEXgRfBLYEtwS4BA4FDwUQ'
+      'BQwFDQVkBWUFZgW8Bb0FvgW6BbsFEgYTBhQGagZrBmwGaAZpBsAGwQbCBhgHGQcaBxYH'
+      'FwceCB8IIAh2CHcIeAh0CHUIzAjNCM4IJAklCSYJIgkjCXoJewl8CdIJ0wnUCdAJ0Qko'
+      'CikKKgqACoEKggp+Cn8K1grXCtgKLgsvCzALKgstC4ILhQuGC9oL3QveC9gL2QswDDEM'
+      'MgyIDIkMigyGDIcM3gzfDOAMNg03DTgNNA01DYwNjQ2ODeQN5Q3mDeIN4w06DjsOPA6S'
+      'DpMOlA6QDpEOmA+ZD5oP8A/xD/IP7g/vD0YQRxBIEJ4QnxCgEJwQnRD0EPUQ9hBMEU0R'
+      'ThFKEUsRohGjEaQR+hH7EfwR+BH5EVASURJSEqgSqRKqEqQSpxL8Ev8SABNUE1cTWBNS'
+      'E1MTqhOrE6wTAhQDFAQUABQBFFgUWRRaFLAUsRSyFK4UrxQGFQcVCBVeFV8VYBVcFV0V'
+      'tBW1FbYVDBYNFg4WChYLFhIXExcUF2oXaxdsF2gXaRfAF8EXwhcYGBkYGhgWGBcYbhhv'
+      'GHAYxhjHGMgYxBjFGBwZHRkeGXQZdRl2GXIZcxnKGcsZzBkiGiMaJBp2GiEazhp5Gnoa'
+      'JhvRGtIaLRwuHIUchhwxHN0c3hyJHCkbKhuBG4IbgxvZG9ob2xt7Gnwa0xrUGtUaKxss'
+      'Gy0bzRnOGSUaJhonGn0afhp/Gh8ZIBl3GXgZeRnPGdAZ0RlxGHIYyRjKGMsYIRkiGSMZ'
+      'wxfEFxsYHBgdGHMYdBh1GBUXFhdtF24XbxfFF8YXxxe3FbgVDxYQFhEWFxcYFxkXCRUK'
+      'FWEVYhVjFbkVuhW7FVsUXBSzFLQUtxQLFQwVDxWvE7ATBxQIFAkUXxRgFGEUARMCE1kT'
+      'WhNbE7ETshOzE1MSVBKrEqwSrRIDEwQTBROlEaYR/RH+Ef8RVRJWElcS9xD4EE8RUBFR'
+      'EacRqBGpEUkQShChEKIQoxD5EPoQ+xCbD5wP8w/0D/UPSxBMEE0QPQ4+DpUOlg6XDp0P'
+      'ng+fD48NkA3nDegN6Q0/DkAOQQ7hDOIMOQ06DT0NkQ2SDZUNNQw2DI0MjgyPDOUM5gzn'
+      'DIcLiAvfC+AL4Qs3DDgMOQzZCtoKMQsyCzMLiQuKC4sLKwosCoMKhAqFCtsK3ArdCn0J'
+      'fgnVCdYJ1wktCi4KLwrPCNAIJwkoCSkJfwmACYEJIQgiCHkIegh7CNEI0gjTCMMGxAYb'
+      'BxwHHQcjCCQIJQgVBhYGbQZuBm8GxQbGBscGZwVoBb8FwAXDBRcGGAYbBrsEvAQTBRQF'
+      'FQVrBWwFbQUNBA4EZQRmBGcEvQS+BL8EXwNgA7cDuAO5Aw8EEAQRBLECsgIJAwoDCwNh'
+      'A2IDYwMDAgQCWwJcAl0CswK0ArUCVQFWAa0BrgGvAQUCBgIHAqcAqAD/AAABAQFXAVgB'
+      'WQGJHYod4R3iHeMdqQCqAKsA5B3lHawArQCuAAQBBQEGAQIBAwFaAVsBXAGyAbMBtAGw'
+      'AbEBCAIJAgoCYAJhAmICXgJfArYCtwK4Ag4DDwMQAwwDDQNkA2UDZgO8A70DvgO6A7sD'
+      'EgQTBBQEagRrBGwEaARpBMAEwQTCBBgFGQUaBRYFFwVuBW8FcAXGBccFyAXEBcUFHAYd'
+      'Bh4GdAZ1BnYGcAZzBsgGywbMBiAHIwckBx4HHwcmCCcIKAh+CH8IgAh8CH0I1AjVCNYI'
+      'LAktCS4JKgkrCYIJgwmECdoJ2wncCdgJ2QkwCjEKMgqICokKigqGCocK3grfCuAKNgs3'
+      'CzgLNAs1C4wLjQuOC+QL5QvmC+IL4ws6DDsMPAySDJMMlAyQDJEM6AzpDOoMQA1BDUIN'
+      'Pg0/DZYNlw2YDe4N7w3wDeoN7Q1CDkUORg6aDp0Ong6YDpkOoA+hD6IP+A/5D/oP9g/3'
+      'D04QTxBQEKYQpxCoEKQQpRD8EP0Q/hBUEVURVhFSEVMRqhGrEawRAhIDEgQSABIBElgS'
+      'WRJaErASsRKyEq4SrxIGEwcTCBNeE18TYBNcE10TtBO1E7YTDBQNFA4UChQLFGIUYxRk'
+      'FLoUuxS8FLgUuRQQFREVEhVoFWkVahVkFWcVvBW/FcAVFBYXFhgWEhYTFhoXGxccF3IX'
+      'cxd0F3AXcRfIF8kXyhcgGCEYIhgeGB8Ydhh3GHgYzhjPGNAYzBjNGCQZJRkmGXwZfRl+'
+      'GXoZexnSGdMZ1BkqGisaLBooGikagBqBGoIa2BrZGtoa1hrXGi4bLxswG4YbhxuIG4Qb'
+      'hRvcG90b3hs0HDUcNhwyHDMcihyLHIwc4hzjHOQcNh3hHI4dOR06HeYdkR2SHY0cjhzl'
+      'HOYc5xw9HT4dPx3fG+AbNxw4HDkcjxyQHJEcMRsyG4kbihuLG+Eb4hvjG4MahBrbGtwa'
+      '3RozGzQbNRvVGdYZLRouGi8ahRqGGocaJxkoGX8ZgBmBGdcZ2BnZGXkYehjRGNIY0xgp'
+      'GSoZKxnLF8wXIxgkGCcYexh8GH8YHxcgF3cXeBd5F88X0BfRF8EVwhUZFhoWGxYhFyIX'
+      'IxcTFRQVaxVsFW0VwxXEFcUVZRRmFL0UvhS/FBUVFhUXFbcTuBMPFBAUERRnFGgUaRQJ'
+      'EwoTYRNiE2MTuRO6E7sTWxJcErMStBK1EgsTDBMNE60RrhEFEgYSBxJdEl4SXxL/EAAR'
+      'VxFYEVkRrxGwEbERURBSEKkQqhCtEAERAhEFEaUPpg/9D/4P/w9VEFYQVxBHDkgOnw6g'
+      'DqEOpw+oD6kPmQ2aDfEN8g3zDUkOSg5LDusM7AxDDUQNRQ2bDZwNnQ09DD4MlQyWDJcM'
+      '7QzuDO8MjwuQC+cL6AvpCz8MQAxBDOEK4go5CzoLOwuRC5ILkwszCjQKiwqMCo0K4wrk'
+      'CuUKhQmGCd0J3gnfCTUKNgo3CtcI2AgvCTAJMwmHCYgJiwkrCCwIgwiECIUI2wjcCN0I'
+      'zQbOBiUHJgcnBy0ILggvCB8GIAZ3BngGeQbPBtAG0QZxBXIFyQXKBcsFIQYiBiMGwwTE'
+      'BBsFHAUdBXMFdAV1BRUEFgRtBG4EbwTFBMYExwRnA2gDvwPAA8EDFwQYBBkEuQK6AhED'
+      'EgMTA2kDagNrAwsCDAJjAmQCZQK7ArwCvQIUAxUDbANtA24DxAPFA8YDwgPDAxoEGwQc'
+      'BHIEcwR0BHAEcQTIBMkEygQgBSEFIgUeBR8FdgV3BXgFzgXPBdAFzAXNBSQGJQYmBnwG'
+      'fQZ+BnoGewbSBtMG1AYqBysHLAcoBykHMAgxCDIIiAiJCIoIhgiHCN4I3wjgCDYJNwk4'
+      'CTQJNQmMCY0JjgnkCeUJ5gngCeMJOAo7CjwKkAqTCpQKjgqPCuYK5wroCj4LPwtACzwL'
+      'PQuUC5ULlgvsC+0L7gvqC+sLQgxDDEQMmgybDJwMmAyZDPAM8QzyDEgNSQ1KDUYNRw2e'
+      'DZ8NoA32DfcN+A30DfUNTA5NDk4OpA6lDqYOog6jDqoPqw+sDwIQAxAEEAAQARBYEFkQ'
+      'WhCwELEQshCuEK8QBhEHEQgRXhFfEWARWhFdEbIRtRG2EQoSDRIOEggSCRJgEmESYhK4'
+      'ErkSuhK2ErcSDhMPExATZhNnE2gTZBNlE7wTvRO+ExQUFRQWFBIUExRqFGsUbBTCFMMU'
+      'xBTAFMEUGBUZFRoVcBVxFXIVbhVvFcYVxxXIFR4WHxYgFhwWHRYkFyUXJhd8F30Xfhd6'
+      'F3sX0hfTF9QXKhgrGCwYKBgpGIAYgRiCGNgY2RjaGNQY1xgsGS8ZMBmEGYcZiBmCGYMZ'
+      '2hnbGdwZMhozGjQaMBoxGogaiRqKGuAa4RriGt4a3xo2GzcbOBuOG48bkBuMG40b5Bvl'
+      'G+YbPBw9HD4cOhw7HJIckxyUHOoc6xzsHOgc6RxAHUEdQh2YHZkdmh2VHJYc7RzuHO8c'
+      'RR1GHUcd5xvoGz8cQBxBHJccmByZHDkbOhuRG5IbkxvpG+ob6xuLGowa4xrkGucaOxs8'
+      'Gz8b3xngGTcaOBo5Go8akBqRGjEZMhmJGYoZixnhGeIZ4xmDGIQY2xjcGN0YMxk0GTUZ'
+      '1RfWFy0YLhgvGIUYhhiHGCcXKBd/F4AXgRfXF9gX2RfJFcoVIRYiFiMWKRcqFysXGxUc'
+      'FXMVdBV1FcsVzBXNFW0UbhTFFMYUxxQdFR4VHxW/E8ATFxQYFBkUbxRwFHEUERMSE2kT'
+      'ahNtE8ETwhPFE2USZhK9Er4SvxIVExYTFxO3EbgRDxIQEhESZxJoEmkSCREKEWERYhFj'
+      'EbkRuhG7EVsQXBCzELQQtRALEQwRDRGtD64PBRAGEAcQXRBeEF8QTw5QDqcOqA6pDq8P'
+      'sA+xD6ENog35DfoN+w1RDlIOUw7zDPQMSw1MDU0Now2kDaUNRQxGDJ0MngyfDPUM9gz3'
+      'DJcLmAvvC/AL8wtHDEgMSwzrCuwKQwtEC0ULmwucC50LPQo+CpUKlgqXCu0K7grvCo8J'
+      'kAnnCegJ6Qk/CkAKQQrhCOIIOQk6CTsJkQmSCZMJMwg0CIsIjAiNCOMI5AjlCNUG1gYt'
+      'By4HLwc1CDYINwgnBigGfwaABoEG1wbYBtkGeQV6BdEF0gXTBSkGKgYrBssEzAQjBSQF'
+      'JQV7BXwFfQXUBdUFLAYtBi4GhAaFBoYGggaDBtoG2wbcBjIHMwc0BzAHMQc4CDkIOgiQ'
+      'CJEIkgiOCI8I5gjnCOgIPgk/CUAJPAk9CZQJlQmWCewJ7QnuCeoJ6wlCCkMKRAqaCpsK'
+      'nAqYCpkK8ArxCvIKSAtJC0oLRgtHC54LnwugC/YL9wv4C/QL9QtMDE0MTgykDKUMpgyg'
+      'DKMM+Az7DPwMUA1TDVQNTg1PDaYNpw2oDf4N/w0ADvwN/Q1UDlUOVg6sDq0Org6qDqsO'
+      'sg+zD7QPChALEAwQCBAJEGAQYRBiELgQuRC6ELYQtxAOEQ8REBFmEWcRaBFkEWURvBG9'
+      'Eb4RFBIVEhYSEhITEmoSaxJsEsISwxLEEsASwRIYExkTGhNwE3ETchNuE28TxhPHE8gT'
+      'HhQfFCAUGhQdFHIUdRR2FMoUzRTOFMgUyRQgFSEVIhV4FXkVehV2FXcVzhXPFdAVJhYn'
+      'FigWJBYlFiwXLRcuF4QXhReGF4IXgxfaF9sX3BcyGDMYNBgwGDEYiBiJGIoY4BjhGOIY'
+      '3hjfGDYZNxk4GY4ZjxmQGYwZjRnkGeUZ5hk8Gj0aPho6GjsakhqTGpQa6hrrGuwa6Brp'
+      'GkAbQRtCG5gbmRuaG5QblxvsG+8b8BtEHEccSBxCHEMcmhybHJwc8hzzHPQc8BzxHEgd'
+      'SR1KHaAdoR2iHZ8coBz3HPgc+RxPHVAdUR3xG/IbSRxKHEscoRyiHKMcQxtEG5sbnBud'
+      'G/Mb9Bv1G5UalhrtGu4a7xpFG0YbRxvnGegZPxpAGkEalxqYGpkaORk6GZEZkhmTGekZ'
+      '6hnrGYsYjBjjGOQY5Rg7GTwZPRndF94XNRg2GDcYjRiOGI8YLxcwF4cXiBeJF98X4Bfh'
+      'F9EV0hUpFioWLRYxFzIXNRclFSYVfRV+FX8V1RXWFdcVdxR4FM8U0BTRFCcVKBUpFckT'
+      'yhMhFCIUIxR5FHoUexQbExwTcxN0E3UTyxPME80TbRJuEsUSxhLHEh0THhMfE78RwBEX'
+      'EhgSGRJvEnAScRIRERIRaRFqEWsRwRHCEcMRYxBkELsQvBC9EBMRFBEVEbUPtg8NEA4Q'
+      'DxBlEGYQZxBXDlgOrw6wDrMOtw+4D7sPqw2sDQMOBA4FDlsOXA5dDv0M/gxVDVYNVw2t'
+      'Da4Nrw1PDFAMpwyoDKkM/wwADQENoQuiC/kL+gv7C1EMUgxTDPMK9ApLC0wLTQujC6QL'
+      'pQtFCkYKnQqeCp8K9Qr2CvcKlwmYCe8J8AnxCUcKSApJCukI6ghBCUIJQwmZCZoJmwk7'
+      'CDwIkwiUCJUI6wjsCO0IRAlFCZwJnQmeCfQJ9Qn2CfIJ8wlKCksKTAqiCqMKpAqgCqEK'
+      '+Ar5CvoKUAtRC1ILTgtPC6YLpwuoC/4L/wsADPwL/QtUDFUMVgysDK0MrgyqDKsMAg0D'
+      'DQQNWg1bDVwNWA1ZDbANsQ2yDQgOCQ4KDgYOBw5eDl8OYA62DrcOuA60DrUOvA+9D74P'
+      'FBAVEBYQEBATEGgQaxBsEMAQwxDEEL4QvxAWERcRGBFuEW8RcBFsEW0RxBHFEcYRHBId'
+      'Eh4SGhIbEnIScxJ0EsoSyxLMEsgSyRIgEyETIhN4E3kTehN2E3cTzhPPE9ATJhQnFCgU'
+      'JBQlFHwUfRR+FNQU1RTWFNIU0xQqFSsVLBWCFYMVhBWAFYEV2BXZFdoVMBYxFjIWLhYv'
+      'FjYXNxc4F44XjxeQF4oXjRfiF+UX5hc6GD0YPhg4GDkYkBiRGJIY6BjpGOoY5hjnGD4Z'
+      'PxlAGZYZlxmYGZQZlRnsGe0Z7hlEGkUaRhpCGkMamhqbGpwa8hrzGvQa8BrxGkgbSRtK'
+      'G6AboRuiG54bnxv2G/cb+BtOHE8cUBxMHE0cpBylHKYc/Bz9HP4c+hz7HFIdUx1UHaod'
+      'qx2sHaccqBz/HAAdAR1XHVgdWR35G/obURxSHFMcqRyqHKscSxtMG6MbpBulG/sb/Bv9'
+      'G50anhr1GvYa9xpNG04bTxvvGfAZRxpIGkkanxqgGqEaQRlCGZkZmhmdGfEZ8hn1GZUY'
+      'lhjtGO4Y7xhFGUYZRxnnF+gXPxhAGEEYlxiYGJkYORc6F5EXkheTF+kX6hfrF9sV3BUz'
+      'FjQWNRY7FzwXPRctFS4VhRWGFYcV3RXeFd8VfxSAFNcU2BTZFC8VMBUxFdET0hMpFCoU'
+      'KxSBFIIUgxQjEyQTexN8E30T0xPUE9UTdRJ2Es0SzhLPEiUTJhMnE8cRyBEfEiASIxJ3'
+      'EngSexIbERwRcxF0EXURyxHMEc0RbRBuEMUQxhDHEB0RHhEfEb8PwA8XEBgQGRBvEHAQ'
+      'cRBhDmIOuQ66DrsOwQ/CD8MPsw20DQsODA4NDmMOZA5lDgUNBg1dDV4NXw21DbYNtw1X'
+      'DFgMrwywDLEMBw0IDQkNqQuqCwEMAgwDDFkMWgxbDPsK/ApTC1QLVQurC6wLrQsEDAUM'
+      'XAxdDF4MtAy1DLYMsgyzDAoNCw0MDWINYw1kDWANYQ24DbkNug0QDhEOEg4ODg8OZg5n'
+      'DmgOvg6/DsAOvA69DsQPxQ/GDxwQHRAeEBoQGxByEHMQdBDKEMsQzBDIEMkQIBEhESIR'
+      'eBF5EXoRdhF3Ec4RzxHQESYSJxIoEiQSJRJ8En0SfhLUEtUS1hLQEtMSKBMrEywTgBOD'
+      'E4QTfhN/E9YT1xPYEy4ULxQwFCwULRSEFIUUhhTcFN0U3hTaFNsUMhUzFTQVihWLFYwV'
+      'iBWJFeAV4RXiFTgWORY6FjYWNxY+Fz8XQBeWF5cXmBeUF5UX7BftF+4XRBhFGEYYQhhD'
+      'GJoYmxicGPIY8xj0GPAY8RhIGUkZShmgGaEZohmeGZ8Z9hn3GfgZThpPGlAaShpNGqIa'
+      'pRqmGvoa/Rr+Gvga+RpQG1EbUhuoG6kbqhumG6cb/hv/GwAcVhxXHFgcVBxVHKwcrRyu'
+      'HAQdBR0GHQIdAx1aHVsdXB2yHbMdtB2vHLAcBx0IHQkdXx1gHWEdARwCHFkcWhxdHLEc'
+      'shy1HFUbVhutG64brxsFHAYcBxynGqga/xoAGwEbVxtYG1kb+Rn6GVEaUhpTGqkaqhqr'
+      'GksZTBmjGaQZpRn7GfwZ/RmdGJ4Y9Rj2GPcYTRlOGU8Z7xfwF0cYSBhJGJ8YoBihGEEX'
+      'QheZF5oXmxfxF/IX8xfjFeQVOxY8Fj0WQxdEF0UXNRU2FY0VjhWPFeUV5hXnFYcUiBTf'
+      'FOAU4xQ3FTgVOxXbE9wTMxQ0FDUUixSMFI0ULRMuE4UThhOHE90T3hPfE38SgBLXEtgS'
+      '2RIvEzATMRPREdIRKRIqEisSgRKCEoMSIxEkEXsRfBF9EdMR1BHVEXUQdhDNEM4QzxAl'
+      'ESYRJxHHD8gPHxAgECEQdxB4EHkQaQ5qDsEOwg7DDskPyg/LD7sNvA0TDhQOFQ5rDmwO'
+      'bQ7EDsUOzA/ND84PJBAlECYQIhAjEHoQexB8ENIQ0xDUENAQ0RAoESkRKhGAEYERghF+'
+      'EX8R1hHXEdgRLhIvEjASLBItEoQShRKGEtwS3RLeEtoS2xIyEzMTNBOKE4sTjBOIE4kT'
+      '4BPhE+ITOBQ5FDoUNhQ3FI4UjxSQFOYU5xToFOQU5RQ8FT0VPhWUFZUVlhWQFZMV6BXr'
+      'FewVQBZDFkQWPhY/FkYXRxdIF54XnxegF5wXnRf0F/UX9hdMGE0YThhKGEsYohijGKQY'
+      '+hj7GPwY+Bj5GFAZURlSGagZqRmqGaYZpxn+Gf8ZABpWGlcaWBpUGlUarBqtGq4aBBsF'
+      'GwYbAhsDG1obWxtcG7Ibsxu0G7AbsRsIHAkcChxgHGEcYhxeHF8cthy3HLgcDh0PHRAd'
+      'Ch0NHWIdZR1mHbodvR2+HbkcuhwRHRIdEx1pHWodax0LHAwcYxxkHGUcuxy8HL0cXRte'
+      'G7Ubthu3Gw0cDhwPHK8asBoHGwgbCRtfG2AbYRsBGgIaWRpaGlsasRqyGrMaUxlUGasZ'
+      'rBmtGQMaBBoFGqUYphj9GP4Y/xhVGVYZVxn3F/gXTxhQGFMYpxioGKsYSxdMF6MXpBel'
+      'F/sX/Bf9F+0V7hVFFkYWRxZNF04XTxc/FUAVlxWYFZkV7xXwFfEVkRSSFOkU6hTrFEEV'
+      'QhVDFeMT5BM7FDwUPRSTFJQUlRQ1EzYTjROOE48T5RPmE+cThxKIEt8S4BLhEjcTOBM5'
+      'E9kR2hExEjISMxKJEooSixIrESwRgxGEEYUR2xHcEd0RNBI1EowSjRKOEuQS5RLmEuIS'
+      '4xI6EzsTPBOSE5MTlBOQE5ET6BPpE+oTQBRBFEIUPhQ/FJYUlxSYFO4U7xTwFOwU7RRE'
+      'FUUVRhWcFZ0VnhWaFZsV8hXzFfQVShZLFkwWSBZJFlAXURdSF6gXqReqF6YXpxf+F/8X'
+      'ABhWGFcYWBhUGFUYrBitGK4YBBkFGQYZABkDGVgZWxlcGbAZsxm0Ga4ZrxkGGgcaCBpe'
+      'Gl8aYBpcGl0atBq1GrYaDBsNGw4bChsLG2IbYxtkG7obuxu8G7gbuRsQHBEcEhxoHGkc'
+      'ahxmHGccvhy/HMAcFh0XHRgdFB0VHWwdbR1uHcQdxR3GHcEcwhwZHRodGx1xHXIdcx0T'
+      'HBQcaxxsHG0cwxzEHMUcZRtmG70bvhu/GxUcFhwXHLcauBoPGxAbExtnG2gbaxsLGgwa'
+      'YxpkGmUauxq8Gr0aXRleGbUZthm3GQ0aDhoPGq8YsBgHGQgZCRlfGWAZYRkBGAIYWRha'
+      'GFsYsRiyGLMYUxdUF6sXrBetFwMYBBgFGPUV9hVNFk4WTxZVF1YXVxdHFUgVnxWgFaEV'
+      '9xX4FfkVmRSaFPEU8hTzFEkVShVLFesT7BNDFEQURRSbFJwUnRT0FPUUTBVNFU4VpBWl'
+      'FaYVohWjFfoV+xX8FVIWUxZUFlAWURZYF1kXWhewF7EXsheuF68XBhgHGAgYXhhfGGAY'
+      'XBhdGLQYtRi2GAwZDRkOGQoZCxliGWMZZBm6GbsZvBm4GbkZEBoRGhIaaBppGmoaZhpn'
+      'Gr4avxrAGhYbFxsYGxQbFRtsG20bbhvEG8UbxhvAG8MbGBwbHBwccBxzHHQcbhxvHMYc'
+      'xxzIHB4dHx0gHRwdHR10HXUddh3MHc0dzh3LHMwcIx0kHSUdex18HX0dHRweHHUcdhx3'
+      'HM0czhzPHG8bcBvHG8gbyRsfHCAcIRzBGsIaGRsaGxsbcRtyG3MbExoUGmsabBptGsMa'
+      'xBrFGmUZZhm9Gb4ZvxkVGhYaFxq3GLgYDxkQGREZZxloGWkZCRgKGGEYYhhjGLkYuhi7'
+      'GFsXXBezF7QXtRcLGAwYDRhkGGUYvBi9GL4YFBkVGRYZEhkTGWoZaxlsGcIZwxnEGcAZ'
+      'wRkYGhkaGhpwGnEachpuGm8axhrHGsgaHhsfGyAbHBsdG3QbdRt2G8wbzRvOG8obyxsi'
+      'HCMcJBx6HHscfBx4HHkc0BzRHNIcKB0pHSodJh0nHX4dfx2AHdYd1x3YHdMc1BwrHSwd'
+      'LR2DHYQdhR0lHCYcfRx+HH8c1RzWHNccdxt4G88b0BvRGyccKBwpHMkayhohGyIbIxt5'
+      'G3obexsbGhwacxp0GnUayxrMGs0aJBslG3wbfRt+G9Qb1RvWG9Ib0xsqHCscLByCHIMc'
+      'hByAHIEc2BzZHNocMB0xHTIdLh0vHYYdhx2IHd4d3x3gHdsc3BwzHTQdNR2LHYwdjR0=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement96x96 = _unpackUint16(
+      'fQF+Ad0B3gGBAT0CPgLhAWEAYgDBAMIAwwAhASIBIwHjIuQiQyNEI0UjYwBkAGUARiNH'
+      'I2YAZwBoAMYAxwDIAMQAxQAkASUBJgGEAYUBhgGCAYMB4gHjAeQBQgJDAkQCngJBAv4C'
+      'oQKiAl4DAQMCA30EfgTdBN4EgQQ9BT4F4QRhA2IDwQPCA8MDIQQiBCMEowKkAgMDBAMF'
+      'A2MDZANlA+UB5gFFAkYCRwKlAqYCpwInASgBhwGIAYkB5wHoAekBaQBqAMkAygDLACkB'
+      'KgErAesi7CJLI0wjTSNrAGwAbQBOI08jbgBvAHAAzgDPANAAzADNACwBLQEuAYwBjQGO'
+      'AYoBiwHqAesB7AFKAksCTAJIAkkCqAKpAqoCCAMJAwoDBgMHA2YDZwNoA8YDxwPIA8QD'
+      'xQMkBCUEJgSEBIUEhgSCBIME4gTjBOQEQgVDBUQFngVBBf4FoQWiBV4GAQYCBn0Hfgfd'
+      'B94HgQc9CD4I4QdhBmIGwQbCBsMGIQciByMHowWkBQMGBAYFBmMGZAZlBuUE5gRFBUYF'
+      'RwWlBaYFpwUnBCgEhwSIBIkE5wToBOkEaQNqA8kDygPLAykEKgQrBKsCrAILAwwDDQNr'
+      'A2wDbQPtAe4BTQJOAk8CrQKuAq8CLwEwAY8BkAGRAe8B8AHxAXEAcgDRANIA0wAxATIB'
+      'MwHzIvQiUyNUI1UjcwB0AHUAViNZI3YAeQB6ANYA2QDaANQA1QA0ATUBNgGUAZUBlgGS'
+      'AZMB8gHzAfQBUgJTAlQCUAJRArACsQKyAhADEQMSAw4DDwNuA28DcAPOA88D0APMA80D'
+      'LAQtBC4EjASNBI4EigSLBOoE6wTsBEoFSwVMBUgFSQWoBakFqgUIBgkGCgYGBgcGZgZn'
+      'BmgGxgbHBsgGxAbFBiQHJQcmB4QHhQeGB4IHgwfiB+MH5AdCCEMIRAieCEEIvglhCWIJ'
+      'HgrBCcIJPQs+C50LngtBC/0L/guhCyEKIgqBCoIKgwrhCuIK4wpjCWQJwwnECcUJIwok'
+      'CiUK5QfmB0UIRghHCGUJZglnCScHKAeHB4gHiQfnB+gH6QdpBmoGyQbKBssGKQcqBysH'
+      'qwWsBQsGDAYNBmsGbAZtBu0E7gRNBU4FTwWtBa4FrwUvBDAEjwSQBJEE7wTwBPEEcQNy'
+      'A9ED0gPTAzEEMgQzBLMCtAITAxQDFQNzA3QDdQP1AfYBVQJWAlkCtQK2ArkCOQE6AZkB'
+      'mgGbAfkB+gH7AXsAfADbANwA3QA7ATwBPQH9Iv4iXSNeI18jfQB+AH8AYCNhI4AAgQCC'
+      'AOAA4QDiAN4A3wA+AT8BQAGeAZ8BoAGcAZ0B/AH9Af4BXAJdAl4CWgJbAroCuwK8AhoD'
+      'GwMcAxYDGQN2A3kDegPWA9kD2gPUA9UDNAQ1BDYElASVBJYEkgSTBPIE8wT0BFIFUwVU'
+      'BVAFUQWwBbEFsgUQBhEGEgYOBg8GbgZvBnAGzgbPBtAGzAbNBiwHLQcuB4wHjQeOB4oH'
+      'iwfqB+sH7AdKCEsITAhICEkIaAlpCWoJyAnJCcoJxgnHCSYKJwooCoYKhwqICoQKhQrk'
+      'CuUK5gpEC0ULRgtCC0MLogujC6QLAgwDDAQMXgwBDL4MYQxiDB4NwQzCDD0OPg6dDp4O'
+      'QQ79Dv4OoQ4hDSINgQ2CDYMN4Q3iDeMNYwxkDMMMxAzFDCMNJA0lDaULpgsFDAYMBwxl'
+      'DGYMZwznCugKRwtIC0kLpwuoC6kLKQoqCokKigqLCukK6grrCmsJbAnLCcwJzQkrCiwK'
+      'LQrtB+4HTQhOCE8IbQluCW8JLwcwB48HkAeRB+8H8AfxB3EGcgbRBtIG0wYxBzIHMwez'
+      'BbQFEwYUBhUGcwZ0BnUG9QT2BFUFVgVZBbUFtgW5BTkEOgSZBJoEmwT5BPoE+wR7A3wD'
+      '2wPcA90DOwQ8BD0EvQK+Ah0DHgMfA30DfgN/A/8BAAJfAmACYQK/AsACwQJBAUIBoQGi'
+      'AaMBAQICAgMCgwCEAOMA5ADlAEMBRAFFAQUjBiNlI2YjZyOFAIYAhwBoI2kjiACJAIoA'
+      '6ADpAOoA5gDnAEYBRwFIAaYBpwGoAaQBpQEEAgUCBgJkAmUCZgJiAmMCwgLDAsQCIgMj'
+      'AyQDIAMhA4ADgQOCA+AD4QPiA94D3wM+BD8EQASeBJ8EoAScBJ0E/AT9BP4EXAVdBV4F'
+      'WgVbBboFuwW8BRoGGwYcBhYGGQZ2BnkGegbWBtkG2gbUBtUGNAc1BzYHlAeVB5YHkgeT'
+      'B/IH8wf0B1IIUwhUCFAIUQhwCXEJcgnQCdEJ0gnOCc8JLgovCjAKjgqPCpAKjAqNCuwK'
+      '7QruCkwLTQtOC0oLSwuqC6sLrAsKDAsMDAwIDAkMaAxpDGoMyAzJDMoMxgzHDCYNJw0o'
+      'DYYNhw2IDYQNhQ3kDeUN5g1EDkUORg5CDkMOog6jDqQOAg8DDwQPXg8BD74PYQ9iDx4Q'
+      'wQ/CDz0RPhGdEZ4RQRG9Er4SYRIhECIQgRCCEIMQ4RDiEOMQYw9kD8MPxA/FDyMQJBAl'
+      'EKUOpg4FDwYPBw9lD2YPZw/nDegNRw5IDkkOpw6oDqkOKQ0qDYkNig2LDekN6g3rDWsM'
+      'bAzLDMwMzQwrDSwNLQ2tC64LDQwODA8MbQxuDG8M7wrwCk8LUAtRC68LsAuxCzEKMgqR'
+      'CpIKkwrxCvIK8wpzCXQJ0wnUCdUJMwo0CjUK9Qf2B1UIVghZCHUJdgl5CTkHOgeZB5oH'
+      'mwf5B/oH+wd7BnwG2wbcBt0GOwc8Bz0HvQW+BR0GHgYfBn0GfgZ/Bv8EAAVfBWAFYQW/'
+      'BcAFwQVBBEIEoQSiBKMEAQUCBQMFgwOEA+MD5APlA0MERARFBMUCxgIlAyYDJwOFA4YD'
+      'hwMHAggCZwJoAmkCxwLIAskCSQFKAakBqgGrAQkCCgILAosAjADrAOwA7QBLAUwBTQEN'
+      'Iw4jbSNuI3EjjQCOAJEAciNzI5IAkwCUAPIA8wD0AO4A8QBOAVEBUgGuAbEBsgGsAa0B'
+      'DAINAg4CbAJtAm4CagJrAsoCywLMAioDKwMsAygDKQOIA4kDigPoA+kD6gPmA+cDRgRH'
+      'BEgEpgSnBKgEpASlBAQFBQUGBWQFZQVmBWIFYwXCBcMFxAUiBiMGJAYgBiEGgAaBBoIG'
+      '4AbhBuIG3gbfBj4HPwdAB54HnwegB5wHnQf8B/0H/gdcCF0IXghaCFsIegl7CXwJ2gnb'
+      'CdwJ1gnZCTYKOQo6CpYKmQqaCpQKlQr0CvUK9gpUC1ULVgtSC1MLsguzC7QLEgwTDBQM'
+      'EAwRDHAMcQxyDNAM0QzSDM4MzwwuDS8NMA2ODY8NkA2MDY0N7A3tDe4NTA5NDk4OSg5L'
+      'DqoOqw6sDgoPCw8MDwgPCQ9oD2kPag/ID8kPyg/GD8cPJhAnECgQhhCHEIgQhBCFEOQQ'
+      '5RDmEEQRRRFGEUIRQxFiEmMSZBLCEsMSxBIeE8ESfhMhEyIT3hOBE4IT/RT+FF0VXhUB'
+      'Fb0VvhVhFeET4hNBFEIUQxShFKIUoxQjEyQTgxOEE4UT4xPkE+UTZRJmEsUSxhLHEiUT'
+      'JhMnE+cQ6BBHEUgRSRFnEmgSaRIpECoQiRCKEIsQ6RDqEOsQaw9sD8sPzA/NDysQLBAt'
+      'EK0Org4NDw4PDw9tD24Pbw/vDfANTw5QDlEOrw6wDrEOMQ0yDZENkg2TDfEN8g3zDXMM'
+      'dAzTDNQM1QwzDTQNNQ21C7YLFQwWDBkMdQx2DHkM+Qr6ClkLWgtbC7kLugu7CzsKPAqb'
+      'CpwKnQr7CvwK/Qp9CX4J3QneCd8JPQo+Cj8K/wcACF8IYAhhCH8JgAmBCUEHQgehB6IH'
+      'owcBCAIIAwiDBoQG4wbkBuUGQwdEB0UHxQXGBSUGJgYnBoUGhgaHBgcFCAVnBWgFaQXH'
+      'BcgFyQVJBEoEqQSqBKsECQUKBQsFiwOMA+sD7APtA0sETARNBM0CzgItAy4DMQONA44D'
+      'kQMRAhICcQJyAnMC0QLSAtMCUwFUAbMBtAG1ARMCFAIVApUAlgD1APYA9wBVAVYBVwEX'
+      'IxgjdyN4I3kjlwCYAJkAeiN7I5oAmwCcAPoA+wD8APgA+QBYAVkBWgG4AbkBugG2AbcB'
+      'FgIXAhgCdgJ3AngCdAJ1AtQC1QLWAjQDNQM2AzIDMwOSA5MDlAPyA/MD9APuA/EDTgRR'
+      'BFIErgSxBLIErAStBAwFDQUOBWwFbQVuBWoFawXKBcsFzAUqBisGLAYoBikGiAaJBooG'
+      '6AbpBuoG5gbnBkYHRwdIB6YHpweoB6QHpQcECAUIBghkCGUIZghiCGMIggmDCYQJ4gnj'
+      'CeQJ4AnhCUAKQQpCCqAKoQqiCp4Knwr+Cv8KAAteC18LYAtcC10LvAu9C74LHAwdDB4M'
+      'GgwbDHoMewx8DNoM2wzcDNYM2Qw2DTkNOg2WDZkNmg2UDZUN9A31DfYNVA5VDlYOUg5T'
+      'DrIOsw60DhIPEw8UDxAPEQ9wD3EPcg/QD9EP0g/OD88PLhAvEDAQjhCPEJAQjBCNEOwQ'
+      '7RDuEEwRTRFOEUoRSxFqEmsSbBLKEssSzBLIEskSKBMpEyoTiBOJE4oThhOHE+YT5xPo'
+      'E0YURxRIFEQURRSkFKUUphQEFQUVBhUCFQMVYhVjFWQVwhXDFcQVHhbBFX4WIRYiFt4W'
+      'gRaCFv0X/hddGF4YARi9GL4YYRjhFuIWQRdCF0MXoReiF6MXIxYkFoMWhBaFFuMW5Bbl'
+      'FmUVZhXFFcYVxxUlFiYWJxanFKgUBxUIFQkVZxVoFWkV6RPqE0kUShRLFKkUqhSrFCsT'
+      'LBOLE4wTjRPrE+wT7RNtEm4SzRLOEs8SLRMuEy8T7xDwEE8RUBFREW8ScBJxEjEQMhCR'
+      'EJIQkxDxEPIQ8xBzD3QP0w/UD9UPMxA0EDUQtQ62DhUPFg8ZD3UPdg95D/kN+g1ZDloO'
+      'Ww65DroOuw47DTwNmw2cDZ0N+w38Df0NfQx+DN0M3gzfDD0NPg0/Db8LwAsfDCAMIQx/'
+      'DIAMgQwBCwILYQtiC2MLwQvCC8MLQwpECqMKpAqlCgMLBAsFC4UJhgnlCeYJ5wlFCkYK'
+      'RwoHCAgIZwhoCGkIhwmICYkJSQdKB6kHqgerBwkICggLCIsGjAbrBuwG7QZLB0wHTQfN'
+      'Bc4FLQYuBjEGjQaOBpEGEQUSBXEFcgVzBdEF0gXTBVMEVASzBLQEtQQTBRQFFQWVA5YD'
+      '9QP2A/cDVQRWBFcE1wLYAjcDOAM5A5cDmAOZAxkCGgJ5AnoCewLZAtoC2wJbAVwBuwG8'
+      'Ab0BGwIcAh0CnQCeAP0A/gD/AF0BXgFfAR8jICN/I4AjgSOfAKAAoQCCI4MjogCjAKQA'
+      'AgEDAQQBAAEBAWABYQFiAcABwQHCAb4BvwEeAh8CIAJ+An8CgAJ8An0C3ALdAt4CPAM9'
+      'Az4DOgM7A5oDmwOcA/oD+wP8A/gD+QNYBFkEWgS4BLkEugS2BLcEFgUXBRgFdgV3BXgF'
+      'dAV1BdQF1QXWBTQGNQY2BjIGMwaSBpMGlAbyBvMG9AbuBvEGTgdRB1IHrgexB7IHrAet'
+      'BwwIDQgOCGwIbQhuCGoIawiKCYsJjAnqCesJ7AnoCekJSApJCkoKqAqpCqoKpgqnCgYL'
+      'BwsIC2YLZwtoC2QLZQvEC8ULxgskDCUMJgwiDCMMggyDDIQM4gzjDOQM4AzhDEANQQ1C'
+      'DaANoQ2iDZ4Nnw3+Df8NAA5eDl8OYA5cDl0OvA69Dr4OHA8dDx4PGg8bD3oPew98D9oP'
+      '2w/cD9YP2Q82EDkQOhCWEJkQmhCUEJUQ9BD1EPYQVBFVEVYRUhFTEXIScxJ0EtIS0xLU'
+      'EtAS0RIwEzETMhOQE5ETkhOOE48T7hPvE/ATThRPFFAUTBRNFKwUrRSuFAwVDRUOFQoV'
+      'CxVqFWsVbBXKFcsVzBXIFckVKBYpFioWiBaJFooWhhaHFuYW5xboFkYXRxdIF0QXRRek'
+      'F6UXphcEGAUYBhgCGAMYYhhjGGQYwhjDGMQYHhnBGH4ZIRkiGd4ZgRmCGb0bvhsdHB4c'
+      'wRt9HH4cIRzhGeIZQRpCGkMaYRtiG2MbIxkkGYMZhBmFGeMZ5BnlGWUYZhjFGMYYxxgl'
+      'GSYZJxmnF6gXBxgIGAkYZxhoGGkY6RbqFkkXShdLF6kXqherFysWLBaLFowWjRbrFuwW'
+      '7RZtFW4VzRXOFc8VLRYuFi8WrxSwFA8VEBURFW8VcBVxFfET8hNRFFIUUxSxFLIUsxQz'
+      'EzQTkxOUE5UT8xP0E/UTdRJ2EtUS1hLZEjUTNhM5E/kQ+hBZEVoRWxF5EnoSexI7EDwQ'
+      'mxCcEJ0Q+xD8EP0QfQ9+D90P3g/fDz0QPhA/EL8OwA4fDyAPIQ9/D4APgQ8BDgIOYQ5i'
+      'DmMOwQ7CDsMOQw1EDaMNpA2lDQMOBA4FDoUMhgzlDOYM5wxFDUYNRw3HC8gLJwwoDCkM'
+      'hwyIDIkMCQsKC2kLagtrC8kLygvLC0sKTAqrCqwKrQoLCwwLDQuNCY4J7QnuCfEJTQpO'
+      'ClEKEQgSCHEIcghzCJEJkgmTCVMHVAezB7QHtQcTCBQIFQiVBpYG9Qb2BvcGVQdWB1cH'
+      '1wXYBTcGOAY5BpcGmAaZBhkFGgV5BXoFewXZBdoF2wVbBFwEuwS8BL0EGwUcBR0FnQOe'
+      'A/0D/gP/A10EXgRfBN8C4AI/A0ADQQOfA6ADoQMhAiICgQKCAoMC4QLiAuMCYwFkAcMB'
+      'xAHFASMCJAIlAqUApgAFAQYBCQFlAWYBaQEpIyojiSOKI4sjqQCqAKsAjCONI6wArQCu'
+      'AAwBDQEOAQoBCwFqAWsBbAHKAcsBzAHGAckBJgIpAioChgKJAooChAKFAuQC5QLmAkQD'
+      'RQNGA0IDQwOiA6MDpAMCBAMEBAQABAEEYARhBGIEwATBBMIEvgS/BB4FHwUgBX4FfwWA'
+      'BXwFfQXcBd0F3gU8Bj0GPgY6BjsGmgabBpwG+gb7BvwG+Ab5BlgHWQdaB7gHuQe6B7YH'
+      'twcWCBcIGAh2CHcIeAh0CHUIlAmVCZYJ9An1CfYJ8gnzCVIKUwpUCrIKswq0Cq4KsQoO'
+      'CxELEgtuC3ELcgtsC20LzAvNC84LLAwtDC4MKgwrDIoMiwyMDOoM6wzsDOgM6QxIDUkN'
+      'Sg2oDakNqg2mDacNBg4HDggOZg5nDmgOZA5lDsQOxQ7GDiQPJQ8mDyIPIw+CD4MPhA/i'
+      'D+MP5A/gD+EPQBBBEEIQoBChEKIQnhCfEP4Q/xAAEV4RXxFgEVwRXRF8En0SfhLcEt0S'
+      '3hLaEtsSOhM7EzwTmhObE5wTlhOZE/YT+RP6E1YUWRRaFFQUVRS0FLUUthQUFRUVFhUS'
+      'FRMVchVzFXQV0hXTFdQV0BXRFTAWMRYyFpAWkRaSFo4WjxbuFu8W8BZOF08XUBdMF00X'
+      'rBetF64XDBgNGA4YChgLGGoYaxhsGMoYyxjMGMgYyRgoGSkZKhmIGYkZihmGGYcZ5hnn'
+      'GegZRhpHGkgaRBpFGmQbZRtmG8QbxRvGG8IbwxsiHCMcJByCHIMchBzeHIEcPh3hHOIc'
+      'nh1BHUIdvR6+Hh0fHh/BHn0ffh8hH6Edoh0BHgIeAx5hHmIeYx7jHOQcQx1EHUUdox2k'
+      'HaUdJRwmHIUchhyHHOUc5hznHGcbaBvHG8gbyRsnHCgcKRzpGeoZSRpKGksaaRtqG2sb'
+      'KxksGYsZjBmNGesZ7BntGW0YbhjNGM4YzxgtGS4ZLxmvF7AXDxgQGBEYbxhwGHEY8Rby'
+      'FlEXUhdTF7EXshezFzMWNBaTFpQWlRbzFvQW9RZ1FXYV1RXWFdkVNRY2FjkWuRS6FBkV'
+      'GhUbFXkVehV7FfsT/BNbFFwUXRS7FLwUvRQ9Ez4TnROeE58T/RP+E/8TfxKAEt8S4BLh'
+      'Ej8TQBNBEwERAhFhEWIRYxGBEoISgxJDEEQQoxCkEKUQAxEEEQURhQ+GD+UP5g/nD0UQ'
+      'RhBHEMcOyA4nDygPKQ+HD4gPiQ8JDgoOaQ5qDmsOyQ7KDssOSw1MDasNrA2tDQsODA4N'
+      'Do0MjgztDO4M8QxNDU4NUQ3RC9ILMQwyDDMMkQySDJMMEwsUC3MLdAt1C9ML1AvVC1UK'
+      'Vgq1CrYKtwoVCxYLFwuXCZgJ9wn4CfkJVwpYClkKGQgaCHkIegh7CJkJmgmbCVsHXAe7'
+      'B7wHvQcbCBwIHQidBp4G/Qb+Bv8GXQdeB18H3wXgBT8GQAZBBp8GoAahBiEFIgWBBYIF'
+      'gwXhBeIF4wVjBGQEwwTEBMUEIwUkBSUFpQOmAwUEBgQJBGUEZgRpBOkC6gJJA0oDSwOp'
+      'A6oDqwMrAiwCiwKMAo0C6wLsAu0CbQFuAc0BzgHPAS0CLgIvAq8AsAAPARABEQFvAXAB'
+      'cQExIzIjkSOSI5MjsQCyALMAlCOVI7QAtQC2ABQBFQEWARIBEwFyAXMBdAHSAdMB1AHQ'
+      'AdEBMAIxAjICkAKRApICjgKPAu4C7wLwAk4DTwNQA0wDTQOsA60DrgMMBA0EDgQKBAsE'
+      'agRrBGwEygTLBMwExgTJBCYFKQUqBYYFiQWKBYQFhQXkBeUF5gVEBkUGRgZCBkMGogaj'
+      'BqQGAgcDBwQHAAcBB2AHYQdiB8AHwQfCB74HvwceCB8IIAh+CH8IgAh8CH0InAmdCZ4J'
+      '/An9Cf4J+gn7CVoKWwpcCroKuwq8CrgKuQoYCxkLGgt4C3kLegt2C3cL1gvXC9gLNgw3'
+      'DDgMNAw1DJQMlQyWDPQM9Qz2DPIM8wxSDVMNVA2yDbMNtA2uDbENDg4RDhIObg5xDnIO'
+      'bA5tDswOzQ7ODiwPLQ8uDyoPKw+KD4sPjA/qD+sP7A/oD+kPSBBJEEoQqBCpEKoQphCn'
+      'EAYRBxEIEWYRZxFoEWQRZRGEEoUShhLkEuUS5hLiEuMSQhNDE0QTohOjE6QToBOhEwAU'
+      'ARQCFGAUYRRiFF4UXxS+FL8UwBQeFR8VIBUcFR0VfBV9FX4V3BXdFd4V2hXbFToWOxY8'
+      'FpoWmxacFpYWmRb2FvkW+hZWF1kXWhdUF1UXtBe1F7YXFBgVGBYYEhgTGHIYcxh0GNIY'
+      '0xjUGNAY0RgwGTEZMhmQGZEZkhmOGY8Z7hnvGfAZThpPGlAaTBpNGmwbbRtuG8wbzRvO'
+      'G8obyxsqHCscLByKHIscjByIHIkc6BzpHOocSB1JHUodRh1HHaYdpx2oHQYeBx4IHgQe'
+      'BR5kHmUeZh7EHsUexh7CHsMeIh8jHyQfgh+DH4Qf3h+BHz4g4R/iH54gQSBCIL0hviEd'
+      'Ih4iwSF9In4iISKhIKIgASECIQMhYSFiIWMh4x/kH0MgRCBFIKMgpCClICUfJh+FH4Yf'
+      'hx/lH+Yf5x9nHmgexx7IHskeJx8oHykfqR2qHQkeCh4LHmkeah5rHusc7BxLHUwdTR2r'
+      'HawdrR0tHC4cjRyOHI8c7RzuHO8cbxtwG88b0BvRGy8cMBwxHPEZ8hlRGlIaUxpxG3Ib'
+      'cxszGTQZkxmUGZUZ8xn0GfUZdRh2GNUY1hjZGDUZNhk5GbkXuhcZGBoYGxh5GHoYexj7'
+      'FvwWWxdcF10Xuxe8F70XPRY+Fp0WnhafFv0W/hb/Fn8VgBXfFeAV4RU/FkAWQRbBFMIU'
+      'IRUiFSMVgRWCFYMVAxQEFGMUZBRlFMMUxBTFFEUTRhOlE6YTpxMFFAYUBxSHEogS5xLo'
+      'EukSRxNIE0kTCREKEWkRahFrEYkSihKLEksQTBCrEKwQrRALEQwRDRGND44P7Q/uD/EP'
+      'TRBOEFEQ0Q7SDjEPMg8zD5EPkg+TDxMOFA5zDnQOdQ7TDtQO1Q5VDVYNtQ22DbcNFQ4W'
+      'DhcOlwyYDPcM+Az5DFcNWA1ZDdkL2gs5DDoMOwyZDJoMmwwbCxwLewt8C30L2wvcC90L'
+      'XQpeCr0Kvgq/Ch0LHgsfC58JoAn/CQAKAQpfCmAKYQohCCIIgQiCCIMIoQmiCaMJYwdk'
+      'B8MHxAfFByMIJAglCKUGpgYFBwYHCQdlB2YHaQfpBeoFSQZKBksGqQaqBqsGKwUsBYsF'
+      'jAWNBesF7AXtBW0EbgTNBM4EzwQtBS4FLwWvA7ADDwQQBBEEbwRwBHEE8QLyAlEDUgNT'
+      'A7EDsgOzAzMCNAKTApQClQLzAvQC9QJ1AXYB1QHWAdcBNQI2AjcCtwC4ABcBGAEZAXcB'
+      'eAF5ATkjOiOZI5ojmyO5ALoAuwCcI50jvAC9AL4AHAEdAR4BGgEbAXoBewF8AdoB2wHc'
+      'AdgB2QE4AjkCOgKYApkCmgKWApcC9gL3AvgCVgNXA1gDVANVA7QDtQO2AxQEFQQWBBIE'
+      'EwRyBHMEdATSBNME1ATQBNEEMAUxBTIFkAWRBZIFjgWPBe4F7wXwBU4GTwZQBkwGTQas'
+      'Bq0GrgYMBw0HDgcKBwsHagdrB2wHygfLB8wHxgfJByYIKQgqCIYIiQiKCIQIhQikCaUJ'
+      'pgkECgUKBgoCCgMKYgpjCmQKwgrDCsQKwArBCiALIQsiC4ALgQuCC34LfwveC98L4As+'
+      'DD8MQAw8DD0MnAydDJ4M/Az9DP4M+gz7DFoNWw1cDboNuw28DbgNuQ0YDhkOGg54DnkO'
+      'eg52DncO1g7XDtgONg83DzgPNA81D5QPlQ+WD/QP9Q/2D/IP8w9SEFMQVBCyELMQtBCu'
+      'ELEQDhERERIRbhFxEXIRbBFtEYwSjRKOEuwS7RLuEuoS6xJKE0sTTBOqE6sTrBOoE6kT'
+      'CBQJFAoUaBRpFGoUZhRnFMYUxxTIFCYVJxUoFSQVJRWEFYUVhhXkFeUV5hXiFeMVQhZD'
+      'FkQWohajFqQWoBahFgAXARcCF2AXYRdiF14XXxe+F78XwBceGB8YIBgcGB0YfBh9GH4Y'
+      '3BjdGN4Y2hjbGDoZOxk8GZoZmxmcGZYZmRn2GfkZ+hlWGlkaWhpUGlUadBt1G3Yb1BvV'
+      'G9Yb0hvTGzIcMxw0HJIckxyUHJAckRzwHPEc8hxQHVEdUh1OHU8drh2vHbAdDh4PHhAe'
+      'DB4NHmwebR5uHswezR7OHsoeyx4qHysfLB+KH4sfjB+IH4kf6B/pH+ofSCBJIEogRiBH'
+      'IKYgpyCoIAYhByEIIQQhBSFkIWUhZiHEIcUhxiHCIcMhIiIjIiQigiKDIoQi3iKBIj4j'
+      '4SLiIp4jQSNCIyUiJiKFIoYihyLlIuYi5yJnIWghxyHIIckhJyIoIikiqSCqIAkhCiEL'
+      'IWkhaiFrIesf7B9LIEwgTSCrIKwgrSAtHy4fjR+OH48f7R/uH+8fbx5wHs8e0B7RHi8f'
+      'MB8xH7Edsh0RHhIeEx5xHnIecx7zHPQcUx1UHVUdsx20HbUdNRw2HJUclhyZHPUc9hz5'
+      'HHkbehvZG9ob2xs5HDocOxz7GfwZWxpcGl0aext8G30bPRk+GZ0ZnhmfGf0Z/hn/GX8Y'
+      'gBjfGOAY4Rg/GUAZQRnBF8IXIRgiGCMYgRiCGIMYAxcEF2MXZBdlF8MXxBfFF0UWRhal'
+      'FqYWpxYFFwYXBxeHFYgV5xXoFekVRxZIFkkWyRTKFCkVKhUrFYkVihWLFQsUDBRrFGwU'
+      'bRTLFMwUzRRNE04TrROuE7ETDRQOFBEUkRKSEvES8hLzElETUhNTExMRFBFzEXQRdRGT'
+      'EpQSlRJVEFYQtRC2ELcQFREWERcRlw+YD/cP+A/5D1cQWBBZENkO2g45DzoPOw+ZD5oP'
+      'mw8bDhwOew58Dn0O2w7cDt0OXQ1eDb0Nvg2/DR0OHg4fDp8MoAz/DAANAQ1fDWANYQ3h'
+      'C+ILQQxCDEMMoQyiDKMMIwskC4MLhAuFC+ML5AvlC2UKZgrFCsYKyQolCyYLKQupCaoJ'
+      'CQoKCgsKaQpqCmsKKwgsCIsIjAiNCKsJrAmtCW0HbgfNB84HzwctCC4ILwivBrAGDwcQ'
+      'BxEHbwdwB3EH8QXyBVEGUgZTBrEGsgazBjMFNAWTBZQFlQXzBfQF9QV1BHYE1QTWBNcE'
+      'NQU2BTcFtwO4AxcEGAQZBHcEeAR5BPkC+gJZA1oDWwO5A7oDuwM7AjwCmwKcAp0C+wL8'
+      'Av0CXANdA7wDvQO+AxwEHQQeBBoEGwR6BHsEfATaBNsE3ATYBNkEOAU5BToFmAWZBZoF'
+      'lgWXBfYF9wX4BVYGVwZYBlQGVQa0BrUGtgYUBxUHFgcSBxMHcgdzB3QH0gfTB9QH0AfR'
+      'BzAIMQgyCJAIkQiSCI4IjwiuCa8JsAkOCg8KEAoMCg0KbAptCm4KzArNCs4KygrLCioL'
+      'KwssC4oLiwuMC4YLiQvmC+kL6gtGDEkMSgxEDEUMpAylDKYMBA0FDQYNAg0DDWINYw1k'
+      'DcINww3EDcANwQ0gDiEOIg6ADoEOgg5+Dn8O3g7fDuAOPg8/D0APPA89D5wPnQ+eD/wP'
+      '/Q/+D/oP+w9aEFsQXBC6ELsQvBC4ELkQGBEZERoReBF5EXoRdhF3EZYSlxKYEvYS9xL4'
+      'EvQS9RJUE1UTVhO0E7UTthOyE7MTEhQTFBQUchRzFHQUbhRxFM4U0RTSFC4VMRUyFSwV'
+      'LRWMFY0VjhXsFe0V7hXqFesVShZLFkwWqharFqwWqBapFggXCRcKF2gXaRdqF2YXZxfG'
+      'F8cXyBcmGCcYKBgkGCUYhBiFGIYY5BjlGOYY4hjjGEIZQxlEGaIZoxmkGaAZoRkAGgEa'
+      'AhpgGmEaYhpeGl8afht/G4Ab3hvfG+Ab3BvdGzwcPRw+HJwcnRyeHJocmxz6HPsc/Bxa'
+      'HVsdXB1WHVkdth25HbodFh4ZHhoeFB4VHnQedR52HtQe1R7WHtIe0x4yHzMfNB+SH5Mf'
+      'lB+QH5Ef8B/xH/IfUCBRIFIgTiBPIK4gryCwIA4hDyEQIQwhDSFsIW0hbiHMIc0hziHK'
+      'IcshKiIrIiwiiiKLIowiiCKJIugi6SLqIkgjSSNKIy0iLiKNIo4ijyLtIu4i7yJvIXAh'
+      'zyHQIdEhLyIwIjEisSCyIBEhEiETIXEhciFzIfMf9B9TIFQgVSCzILQgtSA1HzYflR+W'
+      'H5kf9R/2H/kfeR56Htke2h7bHjkfOh87H7sdvB0bHhweHR57HnwefR79HP4cXR1eHV8d'
+      'vR2+Hb8dPxxAHJ8coByhHP8cAB0BHYEbghvhG+Ib4xtBHEIcQxwDGgQaYxpkGmUagxuE'
+      'G4UbRRlGGaUZphmnGQUaBhoHGocYiBjnGOgY6RhHGUgZSRnJF8oXKRgqGCsYiRiKGIsY'
+      'CxcMF2sXbBdtF8sXzBfNF00WThatFq4WsRYNFw4XEReRFZIV8RXyFfMVURZSFlMW0xTU'
+      'FDMVNBU1FZMVlBWVFRUUFhR1FHYUdxTVFNYU1xRXE1gTtxO4E7kTFxQYFBkUmRKaEvkS'
+      '+hL7ElkTWhNbExsRHBF7EXwRfRGbEpwSnRJdEF4QvRC+EL8QHREeER8Rnw+gD/8PABAB'
+      'EF8QYBBhEOEO4g5BD0IPQw+hD6IPow8jDiQOgw6EDoUO4w7kDuUOZQ1mDcUNxg3JDSUO'
+      'Jg4pDqkMqgwJDQoNCw1pDWoNaw3rC+wLSwxMDE0MqwysDK0MLQsuC40LjguPC+0L7gvv'
+      'C28KcArPCtAK0QovCzALMQuxCbIJEQoSChMKcQpyCnMKMwg0CJMIlAiVCLMJtAm1CXUH'
+      'dgfVB9YH1wc1CDYINwi3BrgGFwcYBxkHdwd4B3kH+QX6BVkGWgZbBrkGuga7BjsFPAWb'
+      'BZwFnQX7BfwF/QVcBl0GvAa9Br4GHAcdBx4HGgcbB3oHewd8B9oH2wfcB9gH2Qc4CDkI'
+      'OgiYCJkImgiWCJcItgm3CbgJFgoXChgKFAoVCnQKdQp2CtQK1QrWCtIK0woyCzMLNAuS'
+      'C5MLlAuQC5EL8AvxC/ILUAxRDFIMTgxPDK4MrwywDA4NDw0QDQwNDQ1sDW0Nbg3MDc0N'
+      'zg3KDcsNKg4rDiwOig6LDowOhg6JDuYO6Q7qDkYPSQ9KD0QPRQ+kD6UPpg8EEAUQBhAC'
+      'EAMQYhBjEGQQwhDDEMQQwBDBECARIREiEYARgRGCEX4RfxGeEp8SoBL+Ev8SABP8Ev0S'
+      'XBNdE14TvBO9E74TuhO7ExoUGxQcFHoUexR8FHgUeRTYFNkU2hQ4FTkVOhU2FTcVlhWX'
+      'FZgV9hX3FfgV9BX1FVQWVRZWFrQWtRa2FrIWsxYSFxMXFBdyF3MXdBduF3EXzhfRF9IX'
+      'LhgxGDIYLBgtGIwYjRiOGOwY7RjuGOoY6xhKGUsZTBmqGasZrBmoGakZCBoJGgoaaBpp'
+      'GmoaZhpnGoYbhxuIG+Yb5xvoG+Qb5RtEHEUcRhykHKUcphyiHKMcAh0DHQQdYh1jHWQd'
+      'YB1hHcAdwR3CHSAeIR4iHh4eHx5+Hn8egB7eHt8e4B7cHt0ePB89Hz4fnB+dH54fmh+b'
+      'H/of+x/8H1ogWyBcIFYgWSC2ILkguiAWIRkhGiEUIRUhdCF1IXYh1CHVIdYh0iHTITIi'
+      'MyI0IpIikyKUIpAikSLwIvEi8iJQI1EjUiM1IjYilSKWIpki9SL2IvkieSF6Idkh2iHb'
+      'ITkiOiI7IrsgvCAbIRwhHSF7IXwhfSH9H/4fXSBeIF8gvSC+IL8gPx9AH58foB+hH/8f'
+      'ACABIIEegh7hHuIe4x5BH0IfQx/DHcQdIx4kHiUegx6EHoUeBR0GHWUdZh1nHcUdxh3H'
+      'HUccSBynHKgcqRwHHQgdCR2JG4ob6RvqG+sbSRxKHEscCxoMGmsabBptGosbjBuNG00Z'
+      'ThmtGa4ZsRkNGg4aERqRGJIY8RjyGPMYURlSGVMZ0xfUFzMYNBg1GJMYlBiVGBUXFhd1'
+      'F3YXdxfVF9YX1xdXFlgWtxa4FrkWFxcYFxkXmRWaFfkV+hX7FVkWWhZbFtsU3BQ7FTwV'
+      'PRWbFZwVnRUdFB4UfRR+FH8U3RTeFN8UXxNgE78TwBPBEx8UIBQhFKESohIBEwITAxNh'
+      'E2ITYxMjESQRgxGEEYURoxKkEqUSZRBmEMUQxhDJECURJhEpEakPqg8JEAoQCxBpEGoQ'
+      'axDrDuwOSw9MD00Pqw+sD60PLQ4uDo0Ojg6PDu0O7g7vDm8NcA3PDdAN0Q0vDjAOMQ6x'
+      'DLIMEQ0SDRMNcQ1yDXMN8wv0C1MMVAxVDLMMtAy1DDULNguVC5YLlwv1C/YL9wt3CngK'
+      '1wrYCtkKNws4CzkLuQm6CRkKGgobCnkKegp7CjsIPAibCJwInQi7CbwJvQkcCh0KfAp9'
+      'Cn4K3ArdCt4K2grbCjoLOws8C5oLmwucC5gLmQv4C/kL+gtYDFkMWgxWDFcMtgy3DLgM'
+      'Fg0XDRgNFA0VDXQNdQ12DdQN1Q3WDdIN0w0yDjMONA6SDpMOlA6QDpEO8A7xDvIOUA9R'
+      'D1IPTg9PD64Prw+wDw4QDxAQEAwQDRBsEG0QbhDMEM0QzhDKEMsQKhErESwRihGLEYwR'
+      'hhGJEaYSqRKqEgYTCRMKEwQTBRNkE2UTZhPEE8UTxhPCE8MTIhQjFCQUghSDFIQUgBSB'
+      'FOAU4RTiFEAVQRVCFT4VPxWeFZ8VoBX+Ff8VABb8Ff0VXBZdFl4WvBa9Fr4Wuha7FhoX'
+      'GxccF3oXexd8F3gXeRfYF9kX2hc4GDkYOhg2GDcYlhiXGJgY9hj3GPgY9Bj1GFQZVRlW'
+      'GbQZtRm2GbIZsxkSGhMaFBpyGnMadBpuGnEajhuRG5Ib7hvxG/Ib7BvtG0wcTRxOHKwc'
+      'rRyuHKocqxwKHQsdDB1qHWsdbB1oHWkdyB3JHcodKB4pHioeJh4nHoYehx6IHuYe5x7o'
+      'HuQe5R5EH0UfRh+kH6Ufph+iH6MfAiADIAQgYiBjIGQgYCBhIMAgwSDCICAhISEiIR4h'
+      'HyF+IX8hgCHeId8h4CHcId0hPCI9Ij4inCKdIp4imiKbIvoi+yL8IlojWyNcIz8iQCKf'
+      'IqAioSL/IgAjASOBIYIh4SHiIeMhQSJCIkMiwyDEICMhJCElIYMhhCGFIQUgBiBlIGYg'
+      'ZyDFIMYgxyBHH0gfpx+oH6kfByAIIAkgiR6KHuke6h7rHkkfSh9LH8sdzB0rHiweLR6L'
+      'HowejR4NHQ4dbR1uHXEdzR3OHdEdURxSHLEcshyzHBEdEh0THZMblBvzG/Qb9RtTHFQc'
+      'VRwVGhYadRp2GncalRuWG5cbVxlYGbcZuBm5GRcaGBoZGpkYmhj5GPoY+xhZGVoZWxnb'
+      'F9wXOxg8GD0YmxicGJ0YHRceF30Xfhd/F90X3hffF18WYBa/FsAWwRYfFyAXIRehFaIV'
+      'ARYCFgMWYRZiFmMW4xTkFEMVRBVFFaMVpBWlFSUUJhSFFIYUiRTlFOYU6RRpE2oTyRPK'
+      'E8sTKRQqFCsUqxKsEgsTDBMNE2sTbBNtEy0RLhGNEY4RjxGtEq4SrxJvEHAQzxDQENEQ'
+      'LxEwETERsQ+yDxEQEhATEHEQchBzEPMO9A5TD1QPVQ+zD7QPtQ81DjYOlQ6WDpcO9Q72'
+      'DvcOdw14DdcN2A3ZDTcOOA45DrkMugwZDRoNGw15DXoNew37C/wLWwxcDF0Muwy8DL0M'
+      'HA0dDXwNfQ1+DdwN3Q3eDdoN2w06DjsOPA6aDpsOnA6YDpkO+A75DvoOWA9ZD1oPVg9X'
+      'D7YPtw+4DxYQFxAYEBQQFRB0EHUQdhDUENUQ1hDSENMQMhEzETQRkhGTEZQRkBGREbAS'
+      'sRKyEhATERMSEw4TDxNuE28TcBPOE88T0BPME80TLBQtFC4UjBSNFI4UihSLFOoU6xTs'
+      'FEoVSxVMFUYVSRWmFakVqhUGFgkWChYEFgUWZBZlFmYWxBbFFsYWwhbDFiIXIxckF4IX'
+      'gxeEF4AXgRfgF+EX4hdAGEEYQhg+GD8YnhifGKAY/hj/GAAZ/Bj9GFwZXRleGbwZvRm+'
+      'GboZuxkaGhsaHBp6GnsafBp4GnkamBuZG5ob+Bv5G/ob9hv3G1YcVxxYHLYctxy4HLQc'
+      'tRwUHRUdFh10HXUddh1yHXMd0h3THdQdMh4zHjQeLh4xHo4ekR6SHu4e8R7yHuwe7R5M'
+      'H00fTh+sH60frh+qH6sfCiALIAwgaiBrIGwgaCBpIMggySDKICghKSEqISYhJyGGIYch'
+      'iCHmIech6CHkIeUhRCJFIkYipCKlIqYioiKjIgIjAyMEI2IjYyNkI0ciSCKnIqgiqSIH'
+      'IwgjCSOJIYoh6SHqIeshSSJKIksiyyDMICshLCEtIYshjCGNIQ0gDiBtIG4gcSDNIM4g'
+      '0SBRH1IfsR+yH7MfESASIBMgkx6UHvMe9B71HlMfVB9VH9Ud1h01HjYeNx6VHpYelx4X'
+      'HRgddx14HXkd1x3YHdkdWRxaHLkcuhy7HBkdGh0bHZsbnBv7G/wb/RtbHFwcXRwdGh4a'
+      'fRp+Gn8anRueG58bXxlgGb8ZwBnBGR8aIBohGqEYohgBGQIZAxlhGWIZYxnjF+QXQxhE'
+      'GEUYoxikGKUYJRcmF4UXhheJF+UX5hfpF2kWahbJFsoWyxYpFyoXKxerFawVCxYMFg0W'
+      'axZsFm0W7RTuFE0VThVPFa0VrhWvFS8UMBSPFJAUkRTvFPAU8RRxE3IT0RPSE9MTMRQy'
+      'FDMUsxK0EhMTFBMVE3MTdBN1EzURNhGVEZYRlxG1ErYStxJ3EHgQ1xDYENkQNxE4ETkR'
+      'uQ+6DxkQGhAbEHkQehB7EPsO/A5bD1wPXQ+7D7wPvQ8cEB0QfBB9EH4Q3BDdEN4Q2hDb'
+      'EDoROxE8EZoRmxGcEZgRmRG4ErkSuhIYExkTGhMWExcTdhN3E3gT1hPXE9gT1BPVEzQU'
+      'NRQ2FJQUlRSWFJIUkxTyFPMU9BRSFVMVVBVQFVEVsBWxFbIVEBYRFhIWDhYPFm4WbxZw'
+      'Fs4WzxbQFswWzRYsFy0XLheMF40XjheKF4sX6hfrF+wXShhLGEwYRhhJGKYYqRiqGAYZ'
+      'CRkKGQQZBRlkGWUZZhnEGcUZxhnCGcMZIhojGiQaghqDGoQagBqBGqAboRuiGwAcARwC'
+      'HP4b/xteHF8cYBy+HL8cwBy8HL0cHB0dHR4dfB19HX4deh17Hdod2x3cHToeOx48Hjge'
+      'OR6YHpkemh74Hvke+h72HvceVh9XH1gfth+3H7gftB+1HxQgFSAWIHQgdSB2IHIgcyDS'
+      'INMg1CAyITMhNCEuITEhjiGRIZIh7iHxIfIh7CHtIUwiTSJOIqwirSKuIqoiqyIKIwsj'
+      'DCNqI2sjbCNRIlIisSKyIrMiESMSIxMjkyGUIfMh9CH1IVMiVCJVItUg1iA1ITYhNyGV'
+      'IZYhlyEXIBggdyB4IHkg1yDYINkgWR9aH7kfuh+7HxkgGiAbIJsenB77Hvwe/R5bH1wf'
+      'XR/dHd4dPR4+Hj8enR6eHp8eHx0gHX8dgB2BHd8d4B3hHWEcYhzBHMIcwxwhHSIdIx2j'
+      'G6QbAxwEHAUcYxxkHGUcJRomGoUahhqJGqUbphupG2kZahnJGcoZyxkpGioaKxqrGKwY'
+      'CxkMGQ0ZaxlsGW0Z7RfuF00YThhPGK0YrhivGC8XMBePF5AXkRfvF/AX8RdxFnIW0RbS'
+      'FtMWMRcyFzMXsxW0FRMWFBYVFnMWdBZ1FvUU9hRVFVYVVxW1FbYVtxU3FDgUlxSYFJkU'
+      '9xT4FPkUeRN6E9kT2hPbEzkUOhQ7FLsSvBIbExwTHRN7E3wTfRPcE90TPBQ9FD4UnBSd'
+      'FJ4UmhSbFPoU+xT8FFoVWxVcFVgVWRW4FbkVuhUYFhkWGhYWFhcWdhZ3FngW1hbXFtgW'
+      '1BbVFjQXNRc2F5QXlReWF5IXkxfyF/MX9BdSGFMYVBhQGFEYsBixGLIYEBkRGRIZDhkP'
+      'GW4ZbxlwGc4ZzxnQGcwZzRksGi0aLhqMGo0ajhqKGosaqhurG6wbChwLHAwcBhwJHGYc'
+      'aRxqHMYcyRzKHMQcxRwkHSUdJh2EHYUdhh2CHYMd4h3jHeQdQh5DHkQeQB5BHqAeoR6i'
+      'HgAfAR8CH/4e/x5eH18fYB++H78fwB+8H70fHCAdIB4gfCB9IH4geiB7INog2yDcIDoh'
+      'OyE8ITghOSGYIZkhmiH4Ifkh+iH2IfchViJXIlgitiK3IrgitCK1IhQjFSMWI3QjdSN2'
+      'I1kiWiK5IroiuyIZIxojGyObIZwh+yH8If0hWyJcIl0i3SDeID0hPiE/IZ0hniGfIR8g'
+      'ICB/IIAggSDfIOAg4SBhH2IfwR/CH8MfISAiICMgox6kHgMfBB8FH2MfZB9lH+Ud5h1F'
+      'HkYeSR6lHqYeqR4pHSodiR2KHYsd6R3qHesdaxxsHMsczBzNHCsdLB0tHa0brhsNHA4c'
+      'DxxtHG4cbxwvGjAajxqQGpEarxuwG7EbcRlyGdEZ0hnTGTEaMhozGrMYtBgTGRQZFRlz'
+      'GXQZdRn1F/YXVRhWGFcYtRi2GLcYNxc4F5cXmBeZF/cX+Bf5F3kWehbZFtoW2xY5FzoX'
+      'Oxe7FbwVGxYcFh0WexZ8Fn0W3BbdFjwXPRc+F5wXnReeF5oXmxf6F/sX/BdaGFsYXBhY'
+      'GFkYuBi5GLoYGBkZGRoZFhkXGXYZdxl4GdYZ1xnYGdQZ1Rk0GjUaNhqUGpUalhqSGpMa'
+      'shuzG7QbEhwTHBQcEBwRHHAccRxyHNAc0RzSHM4czxwuHS8dMB2OHY8dkB2MHY0d7B3t'
+      'He4dTB5NHk4eSh5LHqoeqx6sHgofCx8MHwYfCR9mH2kfah/GH8kfyh/EH8UfJCAlICYg'
+      'hCCFIIYggiCDIOIg4yDkIEIhQyFEIUAhQSGgIaEhoiEAIgEiAiL+If8hXiJfImAiviK/'
+      'IsAivCK9IhwjHSMeI3wjfSN+I2EiYiLBIsIiwyIhIyIjIyOjIaQhAyIEIgUiYyJkImUi'
+      '5SDmIEUhRiFJIaUhpiGpISkgKiCJIIogiyDpIOog6yBrH2wfyx/MH80fKyAsIC0grR6u'
+      'Hg0fDh8PH20fbh9vH+8d8B1PHlAeUR6vHrAesR4xHTIdkR2SHZMd8R3yHfMdcxx0HNMc'
+      '1BzVHDMdNB01HbUbthsVHBYcFxx1HHYcdxw3GjgalxqYGpkatxu4G7kbeRl6GdkZ2hnb'
+      'GTkaOho7GrsYvBgbGRwZHRl7GXwZfRncGd0ZPBo9Gj4anBqdGp4amhqbGrobuxu8Gxoc'
+      'GxwcHBgcGRx4HHkcehzYHNkc2hzWHNccNh03HTgdlh2XHZgdlB2VHfQd9R32HVQeVR5W'
+      'HlIeUx6yHrMetB4SHxMfFB8QHxEfcB9xH3If0B/RH9Ifzh/PHy4gLyAwII4gjyCQIIwg'
+      'jSDsIO0g7iBMIU0hTiFKIUshqiGrIawhCiILIgwiBiIJImYiaSJqIsYiySLKIsQixSIk'
+      'IyUjJiOEI4UjhiNrImwiyyLMIs0iKyMsIy0jrSGuIQ0iDiIPIm0ibiJvIu8g8CBPIVAh'
+      'USGvIbAhsSExIDIgkSCSIJMg8SDyIPMgcx90H9Mf1B/VHzMgNCA1ILUeth4VHxYfFx91'
+      'H3Yfdx/3HfgdVx5YHlketx64HrkeOR06HZkdmh2bHfkd+h37HXscfBzbHNwc3Rw7HTwd'
+      'PR2cHZ0d/B39Hf4dXB5dHl4eWh5bHroeux68HhofGx8cHxgfGR94H3kfeh/YH9kf2h/W'
+      'H9cfNiA3IDggliCXIJgglCCVIPQg9SD2IFQhVSFWIVIhUyGyIbMhtCESIhMiFCIQIhEi'
+      'cCJxInIi0CLRItIiziLPIi4jLyMwI44jjyOQI3MidCLTItQi1SIzIzQjNSO1IbYhFSIW'
+      'IhcidSJ2Inci9yD4IFchWCFZIbchuCG5ITkgOiCZIJogmyD5IPog+yB7H3wf2x/cH90f'
+      'OyA8ID0gnCCdIPwg/SD+IFwhXSFeIVohWyG6IbshvCEaIhsiHCIYIhkieCJ5Inoi2CLZ'
+      'Itoi1iLXIjYjNyM4I5YjlyOYI3sifCLbItwi3SI7IzwjPSM=');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement104x104 = _unpackUint16(
+      'nQGeAQUCBgKhAW0CbgIJAmkAagDRANIA0wA5AToBOwELKQwpcyl0KXUpawBsAG0Adil3'
+      'KW4AbwBwANYA1wDYANQA1QA8AT0BPgGkAaUBpgGiAaMBCgILAgwCcgJzAnQC1gJxAj4D'
+      '2QLaAqYDQQNCA90E3gRFBUYF4QStBa4FSQWpA6oDEQQSBBMEeQR6BHsE2wLcAkMDRANF'
+      'A6sDrAOtAw0CDgJ1AnYCdwLdAt4C3wI/AUABpwGoAakBDwIQAhECcQByANkA2gDbAEEB'
+      'QgFDARMpFCl7KXwpfSlzAHQAdQB+KX8pdgB3AHgA3gDfAOAA3ADdAEQBRQFGAawBrQGu'
+      'AaoBqwESAhMCFAJ6AnsCfAJ4AnkC4ALhAuICSANJA0oDRgNHA64DrwOwAxYEFwQYBBQE'
+      'FQR8BH0EfgTkBOUE5gTiBOMESgVLBUwFsgWzBbQFFgaxBX4GGQYaBuYGgQaCBh0IHgiF'
+      'CIYIIQjtCO4IiQjpBuoGUQdSB1MHuQe6B7sHGwYcBoMGhAaFBusG7AbtBk0FTgW1BbYF'
+      'twUdBh4GHwZ/BIAE5wToBOkETwVQBVEFsQOyAxkEGgQbBIEEggSDBOMC5AJLA0wDTQOz'
+      'A7QDtQMVAhYCfQJ+An8C5QLmAucCRwFIAa8BsAGxARcCGAIZAnkAegDhAOIA4wBJAUoB'
+      'SwEbKRwpgymEKYUpewB8AH0AhimHKX4AfwCAAOYA5wDoAOQA5QBMAU0BTgG0AbUBtgGy'
+      'AbMBGgIbAhwCggKDAoQCgAKBAugC6QLqAlADUQNSA04DTwO2A7cDuAMeBB8EIAQcBB0E'
+      'hASFBIYE7ATtBO4E6gTrBFIFUwVUBboFuwW8BbgFuQUgBiEGIgaIBokGigaGBocG7gbv'
+      'BvAGVgdXB1gHVAdVB7wHvQe+ByQIJQgmCCIIIwiKCIsIjAjyCPMI9AhWCfEIvglZCVoJ'
+      'JgrBCcIJLQwuDJUMlgwxDP0M/gyZDPkK+gphC2ILYwvJC8oLywtbCVwJwwnECcUJ+wr8'
+      'Cv0KjQiOCPUI9gj3CF0JXglfCb8HwAcnCCgIKQiPCJAIkQjxBvIGWQdaB1sHwQfCB8MH'
+      'IwYkBosGjAaNBvMG9Ab1BlUFVgW9Bb4FvwUlBiYGJwaHBIgE7wTwBPEEVwVYBVkFuQO6'
+      'AyEEIgQjBIkEigSLBOsC7AJTA1QDVQO7A7wDvQMdAh4ChQKGAocC7QLuAu8CTwFQAbcB'
+      'uAG7AR8CIAIjAoMAhADrAOwA7QBTAVQBVQElKSYpjSmOKY8phQCGAIcAkCmRKYgAiQCK'
+      'APAA8QDyAO4A7wBWAVcBWAG+Ab8BwAG8Ab0BJAIlAiYCjAKNAo4CiAKLAvAC8wL0AlgD'
+      'WwNcA1YDVwO+A78DwAMmBCcEKAQkBCUEjASNBI4E9AT1BPYE8gTzBFoFWwVcBcIFwwXE'
+      'BcAFwQUoBikGKgaQBpEGkgaOBo8G9gb3BvgGXgdfB2AHXAddB8QHxQfGBywILQguCCoI'
+      'KwiSCJMIlAj6CPsI/Aj4CPkIYAlhCWIJyAnJCcoJxgnHCf4K/woAC2YLZwtoC2QLZQvM'
+      'C80Lzgs0DDUMNgwyDDMMmgybDJwMAg0DDQQNZg0BDc4NaQ1qDTYO0Q3SDW0Pbg/VD9YP'
+      'cQ89ED4Q2Q85DjoOoQ6iDqMOCQ8KDwsPaw1sDdMN1A3VDTsOPA49Dp0MngwFDQYNBw1t'
+      'DW4Nbw3PC9ALNww4DDkMnwygDKEMAQsCC2kLagtrC9EL0gvTC2MJZAnLCcwJzQkDCwQL'
+      'BQuVCJYI/Qj+CP8IZQlmCWcJxwfIBy8IMAgxCJcImAiZCPkG+gZhB2IHYwfJB8oHywcr'
+      'BiwGkwaUBpUG+wb8Bv0GXQVeBcUFxgXHBS0GLgYvBo8EkAT3BPgE+wRfBWAFYwXDA8QD'
+      'KwQsBC0EkwSUBJUE9QL2Al0DXgNfA8UDxgPHAycCKAKPApACkQL3AvgC+QJZAVoBwQHC'
+      'AcMBKQIqAisCiwCMAPMA9AD1AFsBXAFdAS0pLimVKZYplymNAI4AjwCYKZkpkACRAJIA'
+      '+AD5APoA9gD3AF4BXwFgAcYBxwHIAcQBxQEsAi0CLgKUApUClgKSApMC+gL7AvwCYgNj'
+      'A2QDYANhA8gDyQPKAzAEMQQyBC4ELwSWBJcEmAT+BP8EAAX8BP0EZAVlBWYFzAXNBc4F'
+      'yAXLBTAGMwY0BpgGmwacBpYGlwb+Bv8GAAdmB2cHaAdkB2UHzAfNB84HNAg1CDYIMggz'
+      'CJoImwicCAIJAwkECQAJAQloCWkJagnQCdEJ0gnOCc8JBgsHCwgLbgtvC3ALbAttC9QL'
+      '1QvWCzwMPQw+DDoMOwyiDKMMpAwKDQsNDA0IDQkNcA1xDXIN2A3ZDdoN1g3XDT4OPw5A'
+      'DqYOpw6oDqQOpQ4MDw0PDg90D3UPdg9yD3MP2g/bD9wPQhBDEEQQphBBEA4RqRCqEHYR'
+      'ERESEa0SrhIVExYTsRJ9E34TGRN5EXoR4RHiEeMRSRJKEksSqxCsEBMRFBEVEXsRfBF9'
+      'Ed0P3g9FEEYQRxCtEK4QrxAPDxAPdw94D3kP3w/gD+EPQQ5CDqkOqg6rDhEPEg8TD3MN'
+      'dA3bDdwN3Q1DDkQORQ6lDKYMDQ0ODQ8NdQ12DXcN1wvYCz8MQAxBDKcMqAypDAkLCgtx'
+      'C3ILcwvZC9oL2wtrCWwJ0wnUCdUJCwsMCw0LnQieCAUJBgkHCW0JbglvCc8H0Ac3CDgI'
+      'OwifCKAIowgDBwQHawdsB20H0wfUB9UHNQY2Bp0GngafBgUHBgcHB2cFaAXPBdAF0QU3'
+      'BjgGOQaZBJoEAQUCBQMFaQVqBWsFywPMAzMENAQ1BJsEnASdBP0C/gJlA2YDZwPNA84D'
+      'zwMvAjAClwKYApkC/wIAAwEDYQFiAckBygHLATECMgIzApMAlAD7APwA/QBjAWQBZQE1'
+      'KTYpnSmeKZ8plQCWAJcAoCmhKZgAmQCaAAABAQECAf4A/wBmAWcBaAHOAc8B0AHMAc0B'
+      'NAI1AjYCnAKdAp4CmgKbAgIDAwMEA2oDawNsA2gDaQPQA9ED0gM4BDkEOgQ2BDcEngSf'
+      'BKAEBgUHBQgFBAUFBWwFbQVuBdQF1QXWBdIF0wU6BjsGPAaiBqMGpAagBqEGCAcJBwoH'
+      'cAdxB3IHbgdvB9YH1wfYBz4IPwhACDwIPQikCKUIpggMCQ0JDgkICQsJcAlzCXQJ2Anb'
+      'CdwJ1gnXCQ4LDwsQC3YLdwt4C3QLdQvcC90L3gtEDEUMRgxCDEMMqgyrDKwMEg0TDRQN'
+      'EA0RDXgNeQ16DeAN4Q3iDd4N3w1GDkcOSA6uDq8OsA6sDq0OFA8VDxYPfA99D34Peg97'
+      'D+IP4w/kD0oQSxBMEEgQSRCwELEQshAYERkRGhEWERcRfhF/EYAR5hHnEegR5BHlEUwS'
+      'TRJOErQStRK2ErISsxIaExsTHBOCE4MThBPmE4ETThTpE+oTthRRFFIUvRa+FiUXJhfB'
+      'Fo0XjhcpF4kVihXxFfIV8xVZFloWWxbrE+wTUxRUFFUUixWMFY0VHRMeE4UThhOHE+0T'
+      '7hPvE08SUBK3ErgSuRIfEyATIROBEYIR6RHqEesRURJSElMSsxC0EBsRHBEdEYMRhBGF'
+      'EeUP5g9NEE4QTxC1ELYQtxAXDxgPfw+AD4EP5w/oD+kPSQ5KDrEOsg6zDhkPGg8bD3sN'
+      'fA3jDeQN5Q1LDkwOTQ6tDK4MFQ0WDRcNfQ1+DX8N3wvgC0cMSAxLDK8MsAyzDBMLFAt7'
+      'C3wLfQvjC+QL5Qt1CXYJ3QneCd8JFQsWCxcLpwioCA8JEAkRCXcJeAl5CdkH2gdBCEII'
+      'QwipCKoIqwgLBwwHcwd0B3UH2wfcB90HPQY+BqUGpganBg0HDgcPB28FcAXXBdgF2QU/'
+      'BkAGQQahBKIECQUKBQsFcQVyBXMF0wPUAzsEPAQ9BKMEpASlBAUDBgNtA24DbwPVA9YD'
+      '1wM3AjgCnwKgAqECBwMIAwkDaQFqAdEB0gHVATkCOgI9Ap0AngAFAQYBBwFtAW4BbwE/'
+      'KUAppymoKakpnwCgAKEAqimrKaIAowCkAAoBCwEMAQgBCQFwAXEBcgHYAdkB2gHWAdcB'
+      'PgI/AkACpgKnAqgCogKlAgoDDQMOA3IDdQN2A3ADcQPYA9kD2gNABEEEQgQ+BD8EpgSn'
+      'BKgEDgUPBRAFDAUNBXQFdQV2BdwF3QXeBdoF2wVCBkMGRAaqBqsGrAaoBqkGEAcRBxIH'
+      'eAd5B3oHdgd3B94H3wfgB0YIRwhICEQIRQisCK0IrggUCRUJFgkSCRMJegl7CXwJ4gnj'
+      'CeQJ4AnhCRgLGQsaC4ALgQuCC34LfwvmC+cL6AtODE8MUAxMDE0MtAy1DLYMHA0dDR4N'
+      'GA0bDYANgw2EDegN6w3sDeYN5w1ODk8OUA62DrcOuA60DrUOHA8dDx4PhA+FD4YPgg+D'
+      'D+oP6w/sD1IQUxBUEFAQURC4ELkQuhAgESERIhEeER8RhhGHEYgR7hHvEfAR7BHtEVQS'
+      'VRJWErwSvRK+EroSuxIiEyMTJBOKE4sTjBOIE4kT8BPxE/ITWBRZFFoUVhRXFI4VjxWQ'
+      'FfYV9xX4FfQV9RVcFl0WXhbEFsUWxhbCFsMWKhcrFywXkheTF5QX9heRF14Y+Rf6F8YY'
+      'YRhiGP0Z/hllGmYaARrNGs4aaRrJGMoYMRkyGTMZmRmaGZsZ+xf8F2MYZBhlGMsYzBjN'
+      'GC0XLheVF5YXlxf9F/4X/xdfFmAWxxbIFskWLxcwFzEXkRWSFfkV+hX7FWEWYhZjFvMT'
+      '9BNbFFwUXRSTFZQVlRUlEyYTjROOE48T9RP2E/cTVxJYEr8SwBLBEicTKBMpE4kRihHx'
+      'EfIR8xFZEloSWxK7ELwQIxEkESURixGMEY0R7Q/uD1UQVhBXEL0QvhC/EB8PIA+HD4gP'
+      'iw/vD/AP8w9TDlQOuw68Dr0OIw8kDyUPhQ2GDe0N7g3vDVUOVg5XDrcMuAwfDSANIQ2H'
+      'DYgNiQ3pC+oLUQxSDFMMuQy6DLsMGwscC4MLhAuFC+sL7AvtC30JfgnlCeYJ5wkdCx4L'
+      'HwuvCLAIFwkYCRkJfwmACYEJ4QfiB0kISghLCLEIsgizCBMHFAd7B3wHfQfjB+QH5QdF'
+      'BkYGrQauBq8GFQcWBxcHdwV4Bd8F4AXhBUcGSAZJBqkEqgQRBRIFFQV5BXoFfQXdA94D'
+      'RQRGBEcErQSuBK8EDwMQA3cDeAN5A98D4APhA0ECQgKpAqoCqwIRAxIDEwNzAXQB2wHc'
+      'Ad0BQwJEAkUCpQCmAA0BDgEPAXUBdgF3AUcpSCmvKbApsSmnAKgAqQCyKbMpqgCrAKwA'
+      'EgETARQBEAERAXgBeQF6AeAB4QHiAd4B3wFGAkcCSAKuAq8CsAKsAq0CFAMVAxYDfAN9'
+      'A34DegN7A+ID4wPkA0oESwRMBEgESQSwBLEEsgQYBRkFGgUWBRcFfgV/BYAF5gXnBegF'
+      '4gXlBUoGTQZOBrIGtQa2BrAGsQYYBxkHGgeAB4EHggd+B38H5gfnB+gHTghPCFAITAhN'
+      'CLQItQi2CBwJHQkeCRoJGwmCCYMJhAnqCesJ7AnoCekJIAshCyILiAuJC4oLhguHC+4L'
+      '7wvwC1YMVwxYDFQMVQy8DL0MvgwkDSUNJg0iDSMNig2LDYwN8g3zDfQN8A3xDVgOWQ5a'
+      'DsAOwQ7CDr4Ovw4mDycPKA+OD48PkA+MD40P9A/1D/YPXBBdEF4QWBBbEMAQwxDEECgR'
+      'KxEsESYRJxGOEY8RkBH2EfcR+BH0EfURXBJdEl4SxBLFEsYSwhLDEioTKxMsE5ITkxOU'
+      'E5ATkRP4E/kT+hNgFGEUYhReFF8UlhWXFZgV/hX/FQAW/BX9FWQWZRZmFswWzRbOFsoW'
+      'yxYyFzMXNBeaF5sXnBeYF5kXABgBGAIYaBhpGGoYZhhnGM4YzxjQGDYZNxk4GTQZNRmc'
+      'GZ0ZnhkEGgUaBhoCGgMaahprGmwa0hrTGtQaNhvRGp4bORs6GwYcoRuiGz0dPh2lHaYd'
+      'QR0NHg4eqR0JHAoccRxyHHMc2RzaHNscOxs8G6MbpBulGwscDBwNHG0abhrVGtYa1xo9'
+      'Gz4bPxufGaAZBxoIGgkabxpwGnEa0RjSGDkZOhk7GaEZohmjGQMYBBhrGGwYbRjTGNQY'
+      '1Rg1FzYXnReeF58XBRgGGAcYZxZoFs8W0BbRFjcXOBc5F5kVmhUBFgIWAxZpFmoWaxb7'
+      'E/wTYxRkFGUUmxWcFZ0VLRMuE5UTlhOXE/0T/hP/E18SYBLHEsgSyxIvEzATMxOTEZQR'
+      '+xH8Ef0RYxJkEmUSxRDGEC0RLhEvEZURlhGXEfcP+A9fEGAQYRDHEMgQyRApDyoPkQ+S'
+      'D5MP+Q/6D/sPWw5cDsMOxA7FDisPLA8tD40Njg31DfYN9w1dDl4OXw6/DMAMJw0oDSkN'
+      'jw2QDZEN8QvyC1kMWgxbDMEMwgzDDCMLJAuLC4wLjQvzC/QL9QuFCYYJ7QnuCe8JJQsm'
+      'CycLtwi4CB8JIAkhCYcJiAmJCekH6gdRCFIIVQi5CLoIvQgdBx4HhQeGB4cH7QfuB+8H'
+      'TwZQBrcGuAa5Bh8HIAchB4EFggXpBeoF6wVRBlIGUwazBLQEGwUcBR0FgwWEBYUF5QPm'
+      'A00ETgRPBLUEtgS3BBcDGAN/A4ADgQPnA+gD6QNJAkoCsQKyArMCGQMaAxsDewF8AeMB'
+      '5AHlAUsCTAJNAq0ArgAVARYBFwF9AX4BfwFPKVAptym4KbkprwCwALEAuim7KbIAswC0'
+      'ABoBGwEcARgBGQGAAYEBggHoAekB6gHmAecBTgJPAlACtgK3ArgCtAK1AhwDHQMeA4QD'
+      'hQOGA4IDgwPqA+sD7ANSBFMEVARQBFEEuAS5BLoEIAUhBSIFHgUfBYYFhwWIBe4F7wXw'
+      'BewF7QVUBlUGVga8Br0Gvga6BrsGIgcjByQHigeLB4wHiAeJB/AH8QfyB1gIWQhaCFYI'
+      'Vwi+CL8IwAgmCScJKAkiCSUJigmNCY4J8gn1CfYJ8AnxCSgLKQsqC5ALkQuSC44Ljwv2'
+      'C/cL+AteDF8MYAxcDF0MxAzFDMYMLA0tDS4NKg0rDZINkw2UDfoN+w38DfgN+Q1gDmEO'
+      'Yg7IDskOyg7GDscOLg8vDzAPlg+XD5gPlA+VD/wP/Q/+D2QQZRBmEGIQYxDKEMsQzBAy'
+      'ETMRNBEwETERmBGZEZoRABIBEgIS/hH/EWYSZxJoEs4SzxLQEswSzRI0EzUTNhOcE50T'
+      'nhOYE5sTABQDFAQUaBRrFGwUZhRnFJ4VnxWgFQYWBxYIFgQWBRZsFm0WbhbUFtUW1hbS'
+      'FtMWOhc7FzwXohejF6QXoBehFwgYCRgKGHAYcRhyGG4YbxjWGNcY2Bg+GT8ZQBk8GT0Z'
+      'pBmlGaYZDBoNGg4aChoLGnIacxp0Gtoa2xrcGtga2RpAG0EbQhuoG6kbqhumG6cbDhwP'
+      'HBAcdhx3HHgcdBx1HNwc3RzeHEQdRR1GHUIdQx2qHasdrB0SHhMeFB52HhEe3h55Hnoe'
+      'Rh/hHuIeTSFOIbUhtiFRIR0iHiK5IRkgGiCBIIIggyDpIOog6yB7Hnwe4x7kHuUeGyAc'
+      'IB0grR2uHRUeFh4XHn0efh5/Ht8c4BxHHUgdSR2vHbAdsR0RHBIceRx6HHsc4RziHOMc'
+      'QxtEG6sbrButGxMcFBwVHHUadhrdGt4a3xpFG0YbRxunGagZDxoQGhEadxp4Gnka2Rja'
+      'GEEZQhlDGakZqhmrGQsYDBhzGHQYdRjbGNwY3Rg9Fz4XpRemF6cXDRgOGA8YbxZwFtcW'
+      '2BbbFj8XQBdDF6MVpBULFgwWDRZzFnQWdRYFFAYUbRRuFG8UpRWmFacVNxM4E58ToBOh'
+      'EwcUCBQJFGkSahLREtIS0xI5EzoTOxObEZwRAxIEEgUSaxJsEm0SzRDOEDURNhE3EZ0R'
+      'nhGfEf8PABBnEGgQaRDPENAQ0RAxDzIPmQ+aD5sPARACEAMQYw5kDssOzA7NDjMPNA81'
+      'D5UNlg39Df4N/w1lDmYOZw7HDMgMLw0wDTENlw2YDZkN+Qv6C2EMYgxlDMkMygzNDC0L'
+      'LguVC5YLlwv9C/4L/wuPCZAJ9wn4CfkJLwswCzELwQjCCCkJKgkrCZEJkgmTCfMH9Adb'
+      'CFwIXQjDCMQIxQglByYHjQeOB48H9Qf2B/cHVwZYBr8GwAbBBicHKAcpB4kFigXxBfIF'
+      '8wVZBloGWwa7BLwEIwUkBSUFiwWMBY0F7QPuA1UEVgRXBL0EvgS/BB8DIAOHA4gDiQPv'
+      'A/AD8QNRAlICuQK6ArsCIQMiAyMDgwGEAesB7AHvAVMCVAJXArcAuAAfASABIQGHAYgB'
+      'iQFZKVopwSnCKcMpuQC6ALsAxCnFKbwAvQC+ACQBJQEmASIBIwGKAYsBjAHyAfMB9AHw'
+      'AfEBWAJZAloCwALBAsICvAK/AiQDJwMoA4wDjwOQA4oDiwPyA/MD9ANaBFsEXARYBFkE'
+      'wATBBMIEKAUpBSoFJgUnBY4FjwWQBfYF9wX4BfQF9QVcBl0GXgbEBsUGxgbCBsMGKgcr'
+      'BywHkgeTB5QHkAeRB/gH+Qf6B2AIYQhiCF4IXwjGCMcIyAguCS8JMAksCS0JlAmVCZYJ'
+      '/An9Cf4J+gn7CTILMws0C5oLmwucC5gLmQsADAEMAgxoDGkMagxmDGcMzgzPDNAMNg03'
+      'DTgNMg01DZoNnQ2eDQIOBQ4GDgAOAQ5oDmkOag7QDtEO0g7ODs8ONg83DzgPng+fD6AP'
+      'nA+dDwQQBRAGEGwQbRBuEGoQaxDSENMQ1BA6ETsRPBE4ETkRoBGhEaIRCBIJEgoSBhIH'
+      'Em4SbxJwEtYS1xLYEtQS1RI8Ez0TPhOkE6UTphOiE6MTChQLFAwUchRzFHQUcBRxFKgV'
+      'qRWqFRAWERYSFg4WDxZ2FncWeBbeFt8W4BbcFt0WRBdFF0YXrBetF64XqBerFxAYExgU'
+      'GHgYexh8GHYYdxjeGN8Y4BhGGUcZSBlEGUUZrBmtGa4ZFBoVGhYaEhoTGnoaexp8GuIa'
+      '4xrkGuAa4RpIG0kbShuwG7EbshuuG68bFhwXHBgcfhx/HIAcfBx9HOQc5RzmHEwdTR1O'
+      'HUodSx2yHbMdtB0aHhseHB4YHhkegB6BHoIe6B7pHuoe5h7nHh4gHyAgIIYghyCIIIQg'
+      'hSDsIO0g7iBUIVUhViFSIVMhuiG7IbwhIiIjIiQihiIhIu4iiSKKIlYj8SLyIo0kjiT1'
+      'JPYkkSRdJV4l+SRZI1ojwSPCI8MjKSQqJCskiyKMIvMi9CL1IlsjXCNdI70hviElIiYi'
+      'JyKNIo4ijyLvIPAgVyFYIVkhvyHAIcEhISAiIIkgiiCLIPEg8iDzIIMehB7rHuwe7R4j'
+      'ICQgJSC1HbYdHR4eHh8ehR6GHoce5xzoHE8dUB1RHbcduB25HRkcGhyBHIIcgxzpHOoc'
+      '6xxLG0wbsxu0G7UbGxwcHB0cfRp+GuUa5hrnGk0bThtPG68ZsBkXGhgaGxp/GoAagxrj'
+      'GOQYSxlMGU0Zsxm0GbUZFRgWGH0Yfhh/GOUY5hjnGEcXSBevF7AXsRcXGBgYGRh5FnoW'
+      '4RbiFuMWSRdKF0sXqxWsFRMWFBYVFnsWfBZ9Fg0UDhR1FHYUdxStFa4VrxU/E0ATpxOo'
+      'E6kTDxQQFBEUcRJyEtkS2hLbEkETQhNDE6MRpBELEgwSDRJzEnQSdRLVENYQPRE+ET8R'
+      'pRGmEacRBxAIEG8QcBBxENcQ2BDZEDkPOg+hD6IPpQ8JEAoQDRBtDm4O1Q7WDtcOPQ8+'
+      'Dz8Pnw2gDQcOCA4JDm8OcA5xDtEM0gw5DToNOw2hDaINow0DDAQMawxsDG0M0wzUDNUM'
+      'NQs2C50LngufCwUMBgwHDJcJmAn/CQAKAQo3CzgLOQvJCMoIMQkyCTMJmQmaCZsJ+wf8'
+      'B2MIZAhlCMsIzAjNCC0HLgeVB5YHlwf9B/4H/wdfBmAGxwbIBskGLwcwBzEHkQWSBfkF'
+      '+gX7BWEGYgZjBsMExAQrBSwFLwWTBZQFlwX3A/gDXwRgBGEExwTIBMkEKQMqA5EDkgOT'
+      'A/kD+gP7A1sCXALDAsQCxQIrAywDLQONAY4B9QH2AfcBXQJeAl8CvwDAACcBKAEpAY8B'
+      'kAGRAWEpYinJKcopyynBAMIAwwDMKc0pxADFAMYALAEtAS4BKgErAZIBkwGUAfoB+wH8'
+      'AfgB+QFgAmECYgLIAskCygLGAscCLgMvAzADlgOXA5gDlAOVA/wD/QP+A2QEZQRmBGIE'
+      'YwTKBMsEzAQyBTMFNAUwBTEFmAWZBZoFAAYBBgIG/AX/BWQGZwZoBswGzwbQBsoGywYy'
+      'BzMHNAeaB5sHnAeYB5kHAAgBCAIIaAhpCGoIZghnCM4IzwjQCDYJNwk4CTQJNQmcCZ0J'
+      'ngkECgUKBgoCCgMKOgs7CzwLogujC6QLoAuhCwgMCQwKDHAMcQxyDG4MbwzWDNcM2Aw+'
+      'DT8NQA08DT0NpA2lDaYNDA4NDg4OCg4LDnIOcw50DtoO2w7cDtgO2Q5AD0EPQg+oD6kP'
+      'qg+mD6cPDhAPEBAQdhB3EHgQchB1ENoQ3RDeEEIRRRFGEUARQRGoEakRqhEQEhESEhIO'
+      'Eg8SdhJ3EngS3hLfEuAS3BLdEkQTRRNGE6wTrROuE6oTqxMSFBMUFBR6FHsUfBR4FHkU'
+      'sBWxFbIVGBYZFhoWFhYXFn4WfxaAFuYW5xboFuQW5RZMF00XThe0F7UXtheyF7MXGhgb'
+      'GBwYghiDGIQYgBiBGOgY6RjqGFAZURlSGU4ZTxm2GbcZuBkeGh8aIBocGh0ahBqFGoYa'
+      '7BrtGu4a6BrrGlAbUxtUG7gbuxu8G7YbtxseHB8cIByGHIcciByEHIUc7BztHO4cVB1V'
+      'HVYdUh1THbodux28HSIeIx4kHiAeIR6IHokeih7wHvEe8h7uHu8eJiAnICggjiCPIJAg'
+      'jCCNIPQg9SD2IFwhXSFeIVohWyHCIcMhxCEqIisiLCIoIikikCKRIpIi+CL5Ivoi9iL3'
+      'Il4jXyNgI8YjxyPII8QjxSMsJC0kLiSUJJUkliSSJJMk+iT7JPwkYiVjJWQlxiVhJS4m'
+      'ySXKJZYmMSYyJs0nzic1KDYo0SedKJ4oOSiZJpomAScCJwMnaSdqJ2snyyXMJTMmNCY1'
+      'JpsmnCadJv0k/iRlJWYlZyXNJc4lzyUvJDAklySYJJkk/yQAJQElYSNiI8kjyiPLIzEk'
+      'MiQzJJMilCL7Ivwi/SJjI2QjZSPFIcYhLSIuIi8ilSKWIpci9yD4IF8hYCFhIcchyCHJ'
+      'ISkgKiCRIJIgkyD5IPog+yCLHowe8x70HvUeKyAsIC0gvR2+HSUeJh4nHo0ejh6PHu8c'
+      '8BxXHVgdWx2/HcAdwx0jHCQcixyMHI0c8xz0HPUcVRtWG70bvhu/GyUcJhwnHIcaiBrv'
+      'GvAa8RpXG1gbWRu5GboZIRoiGiMaiRqKGosa6xjsGFMZVBlVGbsZvBm9GR0YHhiFGIYY'
+      'hxjtGO4Y7xhPF1AXtxe4F7kXHxggGCEYgRaCFukW6hbrFlEXUhdTF7MVtBUbFhwWHRaD'
+      'FoQWhRYVFBYUfRR+FH8UtRW2FbcVRxNIE68TsBOxExcUGBQZFHkSehLhEuIS5RJJE0oT'
+      'TROtEa4RFRIWEhcSfRJ+En8S3xDgEEcRSBFJEa8RsBGxEREQEhB5EHoQexDhEOIQ4xBD'
+      'D0QPqw+sD60PExAUEBUQdQ52Dt0O3g7fDkUPRg9HD6cNqA0PDhAOEQ53DngOeQ7ZDNoM'
+      'QQ1CDUMNqQ2qDasNCwwMDHMMdAx1DNsM3AzdDD0LPgulC6YLpwsNDA4MDwyfCaAJBwoI'
+      'CgkKPwtAC0EL0QjSCDkJOgk7CaEJogmjCQMIBAhrCGwIbwjTCNQI1wg3BzgHnwegB6EH'
+      'BwgICAkIaQZqBtEG0gbTBjkHOgc7B5sFnAUDBgQGBQZrBmwGbQbNBM4ENQU2BTcFnQWe'
+      'BZ8F/wMABGcEaARpBM8E0ATRBDEDMgOZA5oDmwMBBAIEAwRjAmQCywLMAs0CMwM0AzUD'
+      'lQGWAf0B/gH/AWUCZgJnAscAyAAvATABMQGXAZgBmQFpKWop0SnSKdMpyQDKAMsA1CnV'
+      'KcwAzQDOADQBNQE2ATIBMwGaAZsBnAECAgMCBAIAAgECaAJpAmoC0ALRAtICzgLPAjYD'
+      'NwM4A54DnwOgA5wDnQMEBAUEBgRsBG0EbgRqBGsE0gTTBNQEOgU7BTwFOAU5BaAFoQWi'
+      'BQgGCQYKBgYGBwZuBm8GcAbWBtcG2AbUBtUGPAc9Bz4HpAelB6YHogejBwoICwgMCHII'
+      'cwh0CHAIcQjYCNkI2ghACUEJQgk8CT8JpAmnCagJDAoPChAKCgoLCkILQwtEC6oLqwus'
+      'C6gLqQsQDBEMEgx4DHkMegx2DHcM3gzfDOAMRg1HDUgNRA1FDawNrQ2uDRQOFQ4WDhIO'
+      'Ew56DnsOfA7iDuMO5A7gDuEOSA9JD0oPsA+xD7IPrg+vDxYQFxAYEH4QfxCAEHwQfRDk'
+      'EOUQ5hBMEU0RThFKEUsRshGzEbQRGhIbEhwSGBIZEoASgRKCEugS6RLqEuYS5xJOE08T'
+      'UBO2E7cTuBOyE7UTGhQdFB4UghSFFIYUgBSBFLgVuRW6FSAWIRYiFh4WHxaGFocWiBbu'
+      'Fu8W8BbsFu0WVBdVF1YXvBe9F74Xuhe7FyIYIxgkGIoYixiMGIgYiRjwGPEY8hhYGVkZ'
+      'WhlWGVcZvhm/GcAZJhonGigaJBolGowajRqOGvQa9Rr2GvIa8xpaG1sbXBvCG8MbxBvA'
+      'G8EbKBwpHCockByRHJIcjhyPHPYc9xz4HF4dXx1gHVwdXR3EHcUdxh0sHi0eLh4oHise'
+      'kB6THpQe+B77Hvwe9h73Hi4gLyAwIJYglyCYIJQglSD8IP0g/iBkIWUhZiFiIWMhyiHL'
+      'IcwhMiIzIjQiMCIxIpgimSKaIgAjASMCI/4i/yJmI2cjaCPOI88j0CPMI80jNCQ1JDYk'
+      'nCSdJJ4kmiSbJAIlAyUEJWolayVsJWglaSXQJdEl0iU4JjkmOiY2JjcmniafJqAmBicH'
+      'JwgnBCcFJ2wnbSduJ9Qn1SfWJ9In0yc6KDsoPCiiKKMopCgGKaEobikJKQop1ilxKXIp'
+      'PSg+KKUopiinKA0pDikPKW8ncCfXJ9gn2Sc/KEAoQSihJqImCScKJwsncSdyJ3Mn0yXU'
+      'JTsmPCY9JqMmpCalJgUlBiVtJW4lbyXVJdYl1yU3JDgknySgJKEkByUIJQklaSNqI9Ej'
+      '0iPTIzkkOiQ7JJsinCIDIwQjBSNrI2wjbSPNIc4hNSI2IjcinSKeIp8i/yAAIWchaCFr'
+      'Ic8h0CHTITMgNCCbIJwgnSADIQQhBSGVHpYe/R7+Hv8eNSA2IDcgxx3IHS8eMB4xHpce'
+      'mB6ZHvkc+hxhHWIdYx3JHcodyx0rHCwckxyUHJUc+xz8HP0cXRteG8UbxhvHGy0cLhwv'
+      'HI8akBr3Gvga+RpfG2AbYRvBGcIZKRoqGisakRqSGpMa8xj0GFsZXBldGcMZxBnFGSUY'
+      'JhiNGI4Yjxj1GPYY9xhXF1gXvxfAF8EXJxgoGCkYiRaKFvEW8hb1FlkXWhddF70VvhUl'
+      'FiYWJxaNFo4WjxYfFCAUhxSIFIkUvxXAFcEVURNSE7kTuhO7EyEUIhQjFIMShBLrEuwS'
+      '7RJTE1QTVRO1EbYRHRIeEh8ShRKGEocS5xDoEE8RUBFREbcRuBG5ERkQGhCBEIIQgxDp'
+      'EOoQ6xBLD0wPsw+0D7UPGxAcEB0QfQ5+DuUO5g7nDk0PTg9PD68NsA0XDhgOGQ5/DoAO'
+      'gQ7hDOIMSQ1KDUsNsQ2yDbMNEwwUDHsMfAx/DOMM5AznDEcLSAuvC7ALsQsXDBgMGQyp'
+      'CaoJEQoSChMKSQtKC0sL2wjcCEMJRAlFCasJrAmtCQ0IDgh1CHYIdwjdCN4I3wg/B0AH'
+      'pweoB6kHDwgQCBEIcQZyBtkG2gbbBkEHQgdDB6MFpAULBgwGDQZzBnQGdQbVBNYEPQU+'
+      'BT8FpQWmBacFBwQIBG8EcARxBNcE2ATZBDkDOgOhA6IDowMJBAoECwRrAmwC0wLUAtUC'
+      'OwM8Az0DpAOlAwwEDQQOBHQEdQR2BHIEcwTaBNsE3ARCBUMFRAVABUEFqAWpBaoFEAYR'
+      'BhIGDgYPBnYGdwZ4Bt4G3wbgBtwG3QZEB0UHRgesB60HrgeqB6sHEggTCBQIegh7CHwI'
+      'eAh5COAI4QjiCEgJSQlKCUYJRwmuCa8JsAkWChcKGAoUChUKTAtNC04LtAu1C7YLsguz'
+      'CxoMGwwcDIIMgwyEDIAMgQzoDOkM6gxQDVENUg1MDU8NtA23DbgNHA4fDiAOGg4bDoIO'
+      'gw6EDuoO6w7sDugO6Q5QD1EPUg+4D7kPug+2D7cPHhAfECAQhhCHEIgQhBCFEOwQ7RDu'
+      'EFQRVRFWEVIRUxG6EbsRvBEiEiMSJBIgEiESiBKJEooS8BLxEvIS7hLvElYTVxNYE74T'
+      'vxPAE7wTvRMkFCUUJhSMFI0UjhSKFIsUwhXDFcQVKhYrFiwWKBYpFpAWkRaSFvgW+Rb6'
+      'FvYW9xZeF18XYBfGF8cXyBfCF8UXKhgtGC4YkhiVGJYYkBiRGPgY+Rj6GGAZYRliGV4Z'
+      'XxnGGccZyBkuGi8aMBosGi0alBqVGpYa/Br9Gv4a+hr7GmIbYxtkG8obyxvMG8gbyRsw'
+      'HDEcMhyYHJkcmhyWHJcc/hz/HAAdZh1nHWgdZB1lHcwdzR3OHTQeNR42HjIeMx6aHpse'
+      'nB4CHwMfBB8AHwEfOCA5IDogoCChIKIgniCfIAYhByEIIW4hbyFwIWwhbSHUIdUh1iE8'
+      'Ij0iPiI4IjsioCKjIqQiCCMLIwwjBiMHI24jbyNwI9Yj1yPYI9Qj1SM8JD0kPiSkJKUk'
+      'piSiJKMkCiULJQwlciVzJXQlcCVxJdgl2SXaJUAmQSZCJj4mPyamJqcmqCYOJw8nECcM'
+      'Jw0ndCd1J3Yn3CfdJ94n2ifbJ0IoQyhEKKooqyisKKgoqSgQKREpEil4KXkpeilFKEYo'
+      'rSiuKK8oFSkWKRcpdyd4J98n4CfhJ0coSChJKKkmqiYRJxInEyd5J3oneyfbJdwlQyZE'
+      'JkUmqyasJq0mDSUOJXUldiV3Jd0l3iXfJT8kQCSnJKgkqyQPJRAlEyVzI3Qj2yPcI90j'
+      'QyREJEUkpSKmIg0jDiMPI3UjdiN3I9ch2CE/IkAiQSKnIqgiqSIJIQohcSFyIXMh2SHa'
+      'IdshOyA8IKMgpCClIAshDCENIZ0enh4FHwYfBx89ID4gPyDPHdAdNx44Hjkenx6gHqEe'
+      'AR0CHWkdah1rHdEd0h3THTMcNBybHJwcnRwDHQQdBR1lG2YbzRvOG88bNRw2HDcclxqY'
+      'Gv8aABsBG2cbaBtpG8kZyhkxGjIaNRqZGpoanRr9GP4YZRlmGWcZzRnOGc8ZLxgwGJcY'
+      'mBiZGP8YABkBGWEXYhfJF8oXyxcxGDIYMxiTFpQW+xb8Fv0WYxdkF2UXxRXGFS0WLhYv'
+      'FpUWlhaXFicUKBSPFJAUkRTHFcgVyRVZE1oTwRPCE8MTKRQqFCsUixKMEvMS9BL1ElsT'
+      'XBNdE70RvhElEiYSJxKNEo4SjxLvEPAQVxFYEVkRvxHAEcERIRAiEIkQihCLEPEQ8hDz'
+      'EFMPVA+7D7wPvw8jECQQJxCHDogO7w7wDvEOVw9YD1kPuQ26DSEOIg4jDokOig6LDusM'
+      '7AxTDVQNVQ27DbwNvQ0dDB4MhQyGDIcM7QzuDO8MTwtQC7cLuAu5Cx8MIAwhDLEJsgkZ'
+      'ChoKGwpRC1ILUwvjCOQISwlMCU0Jswm0CbUJFQgWCH0Ifgh/COUI5gjnCEcHSAevB7AH'
+      'sQcXCBgIGQh5BnoG4QbiBuMGSQdKB0sHqwWsBRMGFAYVBnsGfAZ9BuQG5QZMB00HTge0'
+      'B7UHtgeyB7MHGggbCBwIggiDCIQIgAiBCOgI6QjqCFAJUQlSCU4JTwm2CbcJuAkeCh8K'
+      'IAocCh0KVAtVC1YLvAu9C74Lugu7CyIMIwwkDIoMiwyMDIgMiQzwDPEM8gxYDVkNWg1W'
+      'DVcNvg2/DcANJg4nDigOJA4lDowOjQ6ODvQO9Q72DvIO8w5aD1sPXA/CD8MPxA/AD8EP'
+      'KBApECoQkBCREJIQjBCPEPQQ9xD4EFwRXxFgEVoRWxHCEcMRxBEqEisSLBIoEikSkBKR'
+      'EpIS+BL5EvoS9hL3El4TXxNgE8YTxxPIE8QTxRMsFC0ULhSUFJUUlhSSFJMUyhXLFcwV'
+      'MhYzFjQWMBYxFpgWmRaaFgAXARcCF/4W/xZmF2cXaBfOF88X0BfMF80XNBg1GDYYnBid'
+      'GJ4YmhibGAIZAxkEGWoZaxlsGWgZaRnQGdEZ0hk4GjkaOho2GjcanhqfGqAaBhsHGwgb'
+      'AhsFG2obbRtuG9Ib1RvWG9Ab0Rs4HDkcOhygHKEcohyeHJ8cBh0HHQgdbh1vHXAdbB1t'
+      'HdQd1R3WHTwePR4+HjoeOx6iHqMepB4KHwsfDB8IHwkfQCBBIEIgqCCpIKogpiCnIA4h'
+      'DyEQIXYhdyF4IXQhdSHcId0h3iFEIkUiRiJCIkMiqiKrIqwiEiMTIxQjECMRI3gjeSN6'
+      'I+Aj4SPiI94j3yNGJEckSCSuJK8ksCSsJK0kFCUVJRYlfCV9JX4leCV7JeAl4yXkJUgm'
+      'SyZMJkYmRyauJq8msCYWJxcnGCcUJxUnfCd9J34n5CflJ+Yn4ifjJ0ooSyhMKLIosyi0'
+      'KLAosSgYKRkpGimAKYEpgilNKE4otSi2KLcoHSkeKR8pfyeAJ+cn6CfrJ08oUChTKLMm'
+      'tCYbJxwnHSeDJ4QnhSflJeYlTSZOJk8mtSa2JrcmFyUYJX8lgCWBJecl6CXpJUkkSiSx'
+      'JLIksyQZJRolGyV7I3wj4yPkI+UjSyRMJE0krSKuIhUjFiMXI30jfiN/I98h4CFHIkgi'
+      'SSKvIrAisSIRIRIheSF6IXsh4SHiIeMhQyBEIKsgrCCtIBMhFCEVIaUeph4NHw4fDx9F'
+      'IEYgRyDXHdgdPx5AHkEepx6oHqkeCR0KHXEdch11Hdkd2h3dHT0cPhylHKYcpxwNHQ4d'
+      'Dx1vG3Ab1xvYG9kbPxxAHEEcoRqiGgkbChsLG3EbchtzG9MZ1Bk7GjwaPRqjGqQapRoF'
+      'GQYZbRluGW8Z1RnWGdcZNxg4GJ8YoBihGAcZCBkJGWkXahfRF9IX0xc5GDoYOxibFpwW'
+      'AxcEFwUXaxdsF20XzRXOFTUWNhY3Fp0WnhafFi8UMBSXFJgUmRTPFdAV0RVhE2ITyRPK'
+      'E8sTMRQyFDMUkxKUEvsS/BL/EmMTZBNnE8cRyBEvEjASMRKXEpgSmRL5EPoQYRFiEWMR'
+      'yRHKEcsRKxAsEJMQlBCVEPsQ/BD9EF0PXg/FD8YPxw8tEC4QLxCPDpAO9w74DvkOXw9g'
+      'D2EPwQ3CDSkOKg4rDpEOkg6TDvMM9AxbDVwNXQ3DDcQNxQ0lDCYMjQyODI8M9Qz2DPcM'
+      'VwtYC78LwAvBCycMKAwpDLkJugkhCiIKIwpZC1oLWwvrCOwIUwlUCVUJuwm8Cb0JJAol'
+      'ClwLXQteC8QLxQvGC8ILwwsqDCsMLAySDJMMlAyQDJEM+Az5DPoMYA1hDWINXg1fDcYN'
+      'xw3IDS4OLw4wDiwOLQ6UDpUOlg78Dv0O/g76DvsOYg9jD2QPyg/LD8wPyA/JDzAQMRAy'
+      'EJgQmRCaEJYQlxD+EP8QABFmEWcRaBFkEWURzBHNEc4RNBI1EjYSMhIzEpoSmxKcEgIT'
+      'AxMEEwATARNoE2kTahPQE9ET0hPME88TNBQ3FDgUnBSfFKAUmhSbFNIV0xXUFToWOxY8'
+      'FjgWORagFqEWohYIFwkXChcGFwcXbhdvF3AX1hfXF9gX1BfVFzwYPRg+GKQYpRimGKIY'
+      'oxgKGQsZDBlyGXMZdBlwGXEZ2BnZGdoZQBpBGkIaPho/GqYapxqoGg4bDxsQGwwbDRt0'
+      'G3UbdhvcG90b3hvaG9sbQhxDHEQcqhyrHKwcqBypHBAdER0SHXgdeR16HXYddx3eHd8d'
+      '4B1GHkceSB5CHkUeqh6tHq4eEh8VHxYfEB8RH0ggSSBKILAgsSCyIK4gryAWIRchGCF+'
+      'IX8hgCF8IX0h5CHlIeYhTCJNIk4iSiJLIrIisyK0IhojGyMcIxgjGSOAI4EjgiPoI+kj'
+      '6iPmI+cjTiRPJFAktiS3JLgktCS1JBwlHSUeJYQlhSWGJYIlgyXqJesl7CVSJlMmVCZQ'
+      'JlEmuCa5JromICchJyInHicfJ4YnhyeIJ+4n7yfwJ+wn7SdUKFUoVii8KL0ovii4KLso'
+      'ICkjKSQpiCmLKYwpVyhYKL8owCjBKCcpKCkpKYkniifxJ/In8ydZKFooWyi7JrwmIyck'
+      'JyUniyeMJ40n7SXuJVUmViZXJr0mvia/Jh8lICWHJYgliSXvJfAl8SVRJFIkuSS6JLsk'
+      'ISUiJSMlgyOEI+sj7CPtI1MkVCRVJLUitiIdIx4jHyOFI4YjhyPnIeghTyJQIlEityK4'
+      'IrkiGSEaIYEhgiGFIekh6iHtIU0gTiC1ILYgtyAdIR4hHyGvHrAeFx8YHxkfTyBQIFEg'
+      '4R3iHUkeSh5LHrEesh6zHhMdFB17HXwdfR3jHeQd5R1FHEYcrRyuHK8cFR0WHRcddxt4'
+      'G98b4BvhG0ccSBxJHKkaqhoRGxIbExt5G3obexvbGdwZQxpEGkUaqxqsGq0aDRkOGXUZ'
+      'dhl3Gd0Z3hnfGT8YQBinGKgYqRgPGRAZERlxF3IX2RfaF9sXQRhCGEMYoxakFgsXDBcP'
+      'F3MXdBd3F9cV2BU/FkAWQRanFqgWqRY5FDoUoRSiFKMU2RXaFdsVaxNsE9MT1BPVEzsU'
+      'PBQ9FJ0SnhIFEwYTBxNtE24TbxPPEdARNxI4EjkSnxKgEqESARECEWkRahFrEdER0hHT'
+      'ETMQNBCbEJwQnRADEQQRBRFlD2YPzQ/OD88PNRA2EDcQlw6YDv8OAA8BD2cPaA9pD8kN'
+      'yg0xDjIOMw6ZDpoOmw77DPwMYw1kDWUNyw3MDc0NNA41DpwOnQ6eDgQPBQ8GDwIPAw9q'
+      'D2sPbA/SD9MP1A/QD9EPOBA5EDoQoBChEKIQnhCfEAYRBxEIEW4RbxFwEWwRbRHUEdUR'
+      '1hE8Ej0SPhI6EjsSohKjEqQSChMLEwwTCBMJE3ATcRNyE9gT2RPaE9YT1xM+FD8UQBSm'
+      'FKcUqBSkFKUU3BXdFd4VRBZFFkYWQhZDFqoWqxasFhIXExcUFxAXERd4F3kXehfgF+EX'
+      '4hfcF98XRBhHGEgYrBivGLAYqhirGBIZExkUGXoZexl8GXgZeRngGeEZ4hlIGkkaShpG'
+      'GkcarhqvGrAaFhsXGxgbFBsVG3wbfRt+G+Qb5RvmG+Ib4xtKHEscTByyHLMctBywHLEc'
+      'GB0ZHRodgB2BHYIdfh1/HeYd5x3oHU4eTx5QHkweTR60HrUeth4cHx0fHh8aHxsfUiBT'
+      'IFQguiC7ILwguCC5ICAhISEiIYghiSGKIYYhhyHuIe8h8CFWIlciWCJSIlUiuiK9Ir4i'
+      'IiMlIyYjICMhI4gjiSOKI/Aj8SPyI+4j7yNWJFckWCS+JL8kwCS8JL0kJCUlJSYljCWN'
+      'JY4liiWLJfIl8yX0JVomWyZcJlgmWSbAJsEmwiYoJyknKicmJycnjiePJ5An9if3J/gn'
+      '9Cf1J1woXSheKMQoxSjGKMIowygqKSspLCmSKZMplClfKGAoxyjIKMkoLykwKTEpkSeS'
+      'J/kn+if7J2EoYihjKMMmxCYrJywnLSeTJ5QnlSf1JfYlXSZeJl8mxSbGJscmJyUoJY8l'
+      'kCWRJfcl+CX5JVkkWiTBJMIkxSQpJSolLSWNI44j9SP2I/cjXSReJF8kvyLAIicjKCMp'
+      'I48jkCORI/Eh8iFZIloiWyLBIsIiwyIjISQhiyGMIY0h8yH0IfUhVSBWIL0gviC/ICUh'
+      'JiEnIbceuB4fHyAfIR9XIFggWSDpHeodUR5SHlMeuR66HrseGx0cHYMdhB2FHesd7B3t'
+      'HU0cThy1HLYctxwdHR4dHx1/G4Ab5xvoG+kbTxxQHFEcsRqyGhkbGhsbG4EbghuDG+MZ'
+      '5BlLGkwaTxqzGrQatxoXGRgZfxmAGYEZ5xnoGekZSRhKGLEYshizGBkZGhkbGXsXfBfj'
+      'F+QX5RdLGEwYTRitFq4WFRcWFxcXfRd+F38X3xXgFUcWSBZJFq8WsBaxFkEUQhSpFKoU'
+      'qxThFeIV4xVzE3QT2xPcE90TQxREFEUUpRKmEg0TDhMPE3UTdhN3E9cR2BE/EkASQRKn'
+      'EqgSqRIJEQoRcRFyEXMR2RHaEdsROxA8EKMQpBClEAsRDBENEXQRdRHcEd0R3hFEEkUS'
+      'RhJCEkMSqhKrEqwSEhMTExQTEBMRE3gTeRN6E+AT4RPiE94T3xNGFEcUSBSuFK8UsBSs'
+      'FK0U5BXlFeYVTBZNFk4WShZLFrIWsxa0FhoXGxccFxgXGReAF4EXghfoF+kX6hfmF+cX'
+      'ThhPGFAYthi3GLgYtBi1GBwZHRkeGYQZhRmGGYIZgxnqGesZ7BlSGlMaVBpQGlEauBq5'
+      'GroaIBshGyIbHBsfG4QbhxuIG+wb7xvwG+ob6xtSHFMcVBy6HLscvBy4HLkcIB0hHSId'
+      'iB2JHYodhh2HHe4d7x3wHVYeVx5YHlQeVR68Hr0evh4kHyUfJh8iHyMfWiBbIFwgwiDD'
+      'IMQgwCDBICghKSEqIZAhkSGSIY4hjyH2Ifch+CFeIl8iYCJcIl0ixCLFIsYiLCMtIy4j'
+      'KiMrI5IjkyOUI/oj+yP8I/gj+SNgJGEkYiTIJMkkyiTGJMckLiUvJTAlliWXJZglkiWV'
+      'Jfol/SX+JWImZSZmJmAmYSbIJskmyiYwJzEnMicuJy8nlieXJ5gn/if/JwAo/Cf9J2Qo'
+      'ZShmKMwozSjOKMooyygyKTMpNCmaKZspnClnKGgozyjQKNEoNyk4KTkpmSeaJwEoAigF'
+      'KGkoaihtKM0mziY1JzYnNyedJ54nnyf/JQAmZyZoJmkmzybQJtEmMSUyJZklmiWbJQEm'
+      'AiYDJmMkZCTLJMwkzSQzJTQlNSWVI5Yj/SP+I/8jZSRmJGckxyLIIi8jMCMxI5cjmCOZ'
+      'I/kh+iFhImIiYyLJIsoiyyIrISwhkyGUIZUh+yH8If0hXSBeIMUgxiDHIC0hLiEvIb8e'
+      'wB4nHygfKR9fIGAgYSDxHfIdWR5aHlsewR7CHsMeIx0kHYsdjB2PHfMd9B33HVccWBy/'
+      'HMAcwRwnHSgdKR2JG4ob8RvyG/MbWRxaHFscuxq8GiMbJBslG4sbjBuNG+0Z7hlVGlYa'
+      'Vxq9Gr4avxofGSAZhxmIGYkZ7xnwGfEZURhSGLkYuhi7GCEZIhkjGYMXhBfrF+wX7RdT'
+      'GFQYVRi1FrYWHRceFx8XhReGF4cX5xXoFU8WUBZRFrcWuBa5FkkUShSxFLIUsxTpFeoV'
+      '6xV7E3wT4xPkE+UTSxRMFE0UtBS1FOwV7RXuFVQWVRZWFlIWUxa6FrsWvBYiFyMXJBcg'
+      'FyEXiBeJF4oX8BfxF/IX7hfvF1YYVxhYGL4YvxjAGLwYvRgkGSUZJhmMGY0ZjhmKGYsZ'
+      '8hnzGfQZWhpbGlwaWBpZGsAawRrCGigbKRsqGyYbJxuOG48bkBv2G/cb+Bv0G/UbXBxd'
+      'HF4cxBzFHMYcwhzDHCodKx0sHZIdkx2UHZAdkR34Hfkd+h1gHmEeYh5cHl8exB7HHsge'
+      'LB8vHzAfKh8rH2IgYyBkIMogyyDMIMggySAwITEhMiGYIZkhmiGWIZch/iH/IQAiZiJn'
+      'ImgiZCJlIswizSLOIjQjNSM2IzIjMyOaI5sjnCMCJAMkBCQAJAEkaCRpJGok0CTRJNIk'
+      'ziTPJDYlNyU4JZ4lnyWgJZwlnSUEJgUmBiZsJm0mbiZqJmsm0ibTJtQmOic7JzwnOCc5'
+      'J6AnoSeiJwgoCSgKKAYoByhuKG8ocCjWKNco2CjSKNUoOik9KT4poimlKaYpcShyKNko'
+      '2ijbKEEpQilDKaMnpCcLKAwoDShzKHQodSjVJtYmPSc+Jz8npSemJ6cnByYIJm8mcCZx'
+      'Jtcm2CbZJjklOiWhJaIloyUJJgomCyZrJGwk0yTUJNUkOyU8JT0lnSOeIwUkBiQHJG0k'
+      'biRvJM8i0CI3IzgjOSOfI6AjoSMBIgIiaSJqImsi0SLSItMiMyE0IZshnCGfIQMiBCIH'
+      'ImcgaCDPINAg0SA3ITghOSHJHsoeMR8yHzMfaSBqIGsg+x38HWMeZB5lHssezB7NHi0d'
+      'Lh2VHZYdlx39Hf4d/x1fHGAcxxzIHMkcLx0wHTEdkRuSG/kb+hv7G2EcYhxjHMMaxBor'
+      'GywbLRuTG5QblRv1GfYZXRpeGl8axRrGGscaJxkoGY8ZkBmRGfcZ+Bn5GVkYWhjBGMIY'
+      'wxgpGSoZKxmLF4wX8xf0F/UXWxhcGF0YxBjFGCwZLRkuGZQZlRmWGZIZkxn6GfsZ/Bli'
+      'GmMaZBpgGmEayBrJGsoaMBsxGzIbLhsvG5YblxuYG/4b/xsAHPwb/RtkHGUcZhzMHM0c'
+      'zhzKHMscMh0zHTQdmh2bHZwdmB2ZHQAeAR4CHmgeaR5qHmYeZx7OHs8e0B42HzcfOB80'
+      'HzUfbCBtIG4g1CDVINYg0iDTIDohOyE8IaIhoyGkIaAhoSEIIgkiCiJwInEiciJsIm8i'
+      '1CLXItgiPCM/I0AjOiM7I6IjoyOkIwokCyQMJAgkCSRwJHEkciTYJNkk2iTWJNckPiU/'
+      'JUAlpiWnJaglpCWlJQwmDSYOJnQmdSZ2JnImcybaJtsm3CZCJ0MnRCdAJ0EnqCepJ6on'
+      'ECgRKBIoDigPKHYodyh4KN4o3yjgKNwo3ShEKUUpRimsKa0pril5KHoo4SjiKOMoSSlK'
+      'KUspqyesJxMoFCgVKHsofCh9KN0m3iZFJ0YnRyetJ64nrycPJhAmdyZ4Jnkm3ybgJuEm'
+      'QSVCJaklqiWrJREmEiYTJnMkdCTbJNwk3yRDJUQlRyWnI6gjDyQQJBEkdyR4JHkk2SLa'
+      'IkEjQiNDI6kjqiOrIwsiDCJzInQidSLbItwi3SI9IT4hpSGmIachDSIOIg8ibyBwINcg'
+      '2CDZID8hQCFBIdEe0h45HzofOx9xIHIgcyADHgQeax5sHm0e0x7UHtUeNR02HZ0dnh2f'
+      'HQUeBh4HHmccaBzPHNAc0Rw3HTgdOR2ZG5obARwCHAMcaRxqHGscyxrMGjMbNBs1G5sb'
+      'nBudGwQcBRxsHG0cbhzUHNUc1hzSHNMcOh07HTwdoh2jHaQdoB2hHQgeCR4KHnAecR5y'
+      'Hm4ebx7WHtce2B4+Hz8fQB88Hz0fdCB1IHYg3CDdIN4g2iDbIEIhQyFEIaohqyGsIagh'
+      'qSEQIhEiEiJ4InkieiJ2Inci3iLfIuAiRiNHI0gjRCNFI6wjrSOuIxQkFSQWJBIkEyR6'
+      'JHskfCTiJOMk5CTgJOEkSCVJJUolsCWxJbIlrCWvJRQmFyYYJnwmfyaAJnomeybiJuMm'
+      '5CZKJ0snTCdIJ0knsCexJ7InGCgZKBooFigXKH4ofyiAKOYo5yjoKOQo5ShMKU0pTim0'
+      'KbUptimBKIIo6SjqKOsoUSlSKVMpsye0JxsoHCgfKIMohCiHKOcm6CZPJ1AnUSe3J7gn'
+      'uScZJhomgSaCJoMm6SbqJusmSyVMJbMltCW1JRsmHCYdJn0kfiTlJOYk5yRNJU4lTyWv'
+      'I7AjFyQYJBkkfySAJIEk4SLiIkkjSiNLI7EjsiOzIxMiFCJ7InwifSLjIuQi5SJFIUYh'
+      'rSGuIa8hFSIWIhcidyB4IN8g4CDhIEchSCFJIdke2h5BH0IfQx95IHogeyALHgwecx50'
+      'HnUe2x7cHt0eRB9FH3wgfSB+IOQg5SDmIOIg4yBKIUshTCGyIbMhtCGwIbEhGCIZIhoi'
+      'gCKBIoIifiJ/IuYi5yLoIk4jTyNQI0wjTSO0I7UjtiMcJB0kHiQaJBskgiSDJIQk6iTr'
+      'JOwk6CTpJFAlUSVSJbgluSW6JbYltyUeJh8mICaGJocmiCaEJoUm7CbtJu4mVCdVJ1Yn'
+      'UidTJ7onuye8JyIoIygkKCAoISiIKIkoiijwKPEo8ijsKO8oVClXKVgpvCm/KcApiyiM'
+      'KPMo9Cj1KFspXCldKb0nviclKCYoJyiNKI4ojyjvJvAmVydYJ1knvyfAJ8EnISYiJokm'
+      'iiaLJvEm8ibzJlMlVCW7JbwlvSUjJiQmJSaFJIYk7STuJO8kVSVWJVcltyO4Ix8kICQh'
+      'JIckiCSJJOki6iJRI1IjUyO5I7ojuyMbIhwigyKEIoUi6yLsIu0iVCNVI7wjvSO+IyQk'
+      'JSQmJCIkIySKJIskjCTyJPMk9CTwJPEkWCVZJVolwCXBJcIlviW/JSYmJyYoJo4mjyaQ'
+      'JowmjSb0JvUm9iZcJ10nXidaJ1snwifDJ8QnKigrKCwoKCgpKJAokSiSKPgo+Sj6KPYo'
+      '9yheKV8pYCnGKccpyCmTKJQo+yj8KP0oYylkKWUpxSfGJy0oLigvKJUoliiXKPcm+CZf'
+      'J2AnYSfHJ8gnyScpJiomkSaSJpMm+Sb6JvsmWyVcJcMlxCXFJSsmLCYtJpQmlSb8Jv0m'
+      '/iZkJ2UnZidiJ2MnyifLJ8wnMigzKDQoMCgxKJgomSiaKAApASkCKf4o/yhmKWcpaCnO'
+      'Kc8p0CmbKJwoAykEKQUpaylsKW0p');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement120x120 = _unpackUint16(
+      'vQO+AzUENgThAa0ErgRZAnkAegDxAPIA8wBpAWoBawHfNuA2VzdYN1k3ewB8AH0AWjdb'
+      'N34AfwCAAPYA9wD4APQA9QBsAW0BbgHkAeUB5gHiAeMBWgJbAlwC0gLTAtQCJgXRAp4F'
+      'SQNKAxYGwQPCA30Hfgf1B/YHoQVtCG4IGQY5BDoEsQSyBLMEKQUqBSsFSwNMA8MDxAPF'
+      'AzsEPAQ9BF0CXgLVAtYC1wJNA04DTwNvAXAB5wHoAekBXwJgAmECgQCCAPkA+gD7AHEB'
+      'cgFzAec26DZfN2A3YTeDAIQAhQBiN2U3hgCHAIgA/gD/AAAB/AD9AHQBdQF2AewB7QHu'
+      'AeoB6wFiAmMCZALaAtsC3ALYAtkCUANRA1IDyAPJA8oDxgPHAz4EPwRABLYEtwS4BLQE'
+      'tQQsBS0FLgWkBaUFpgWiBaMFGgYbBhwGkgaTBpQG5giRBk4KCQcKB8YKgQeCBy0MLgyl'
+      'DKYMUQodDR4NyQr5B/oHcQhyCHMI2QnaCdsJCwcMB4MHhAeFB/sH/Af9Bx0GHgaVBpYG'
+      'lwYNBw4HDwcvBTAFpwWoBakFHwYgBiEGQQRCBLkEugS7BDEFMgUzBVMDVAPLA8wDzQND'
+      'BEQERQRlAmYC3QLeAt8CVQNWA1cDdwF4Ae8B8AHxAWcCaAJpAokAigABAQIBBQF5AXoB'
+      'fQHxNvI2aTdqN2s3jQCOAI8AbDdtN5AAkQCSAAgBCQEKAQYBBwF+AX8BgAH2AfcB+AHy'
+      'AfUBagJtAm4C4gLlAuYC4ALhAlgDWQNaA9AD0QPSA84DzwNGBEcESAS+BL8EwAS8BL0E'
+      'NAU1BTYFrAWtBa4FqgWrBSIGIwYkBpoGmwacBpgGmQYQBxEHEgeIB4kHigeGB4cH/gf/'
+      'BwAIdgh3CHgIdAh1CNwJ3QneCVQKVQpWClIKUwrKCssKzApCC0MLRAuWDUELDg65C7oL'
+      'hg4xDDIM7Q/uD2UQZhARDt0Q3hCJDqkMqgwhDSINIw2ZDZoNmw27C7wLMww0DDUMqwys'
+      'DK0MzQrOCkULRgtHC70Lvgu/C98J4AlXClgKWQrPCtAK0QoBCAIIeQh6CHsI4QniCeMJ'
+      'EwcUB4sHjAeNBwMIBAgFCCUGJgadBp4GnwYVBxYHFwc3BTgFrwWwBbEFJwYoBikGSQRK'
+      'BMEEwgTFBDkFOgU9BV0DXgPVA9YD1wNNBE4ETwRvAnAC5wLoAukCXwNgA2EDgQGCAfkB'
+      '+gH7AXECcgJzApMAlAALAQwBDQGDAYQBhQH5Nvo2cTdyN3M3lQCWAJcAdDd1N5gAmQCa'
+      'ABABEQESAQ4BDwGGAYcBiAH+Af8BAAL8Af0BdAJ1AnYC7ALtAu4C6gLrAmIDYwNkA9oD'
+      '2wPcA9gD2QNQBFEEUgTIBMkEygTGBMcEPgU/BUAFtgW3BbgFsgW1BSoGLQYuBqIGpQam'
+      'BqAGoQYYBxkHGgeQB5EHkgeOB48HBggHCAgIfgh/CIAIfAh9COQJ5QnmCVwKXQpeCloK'
+      'WwrSCtMK1ApKC0sLTAtIC0kLwAvBC8ILOAw5DDoMNgw3DK4MrwywDCYNJw0oDSQNJQ2c'
+      'DZ0Nng0UDhUOFg4SDhMOig6LDowOAg8DDwQPVhEBD84ReQ96D0YS8Q/yD50UnhQVFRYV'
+      '0RGNFY4VORNpEGoQ4RDiEOMQWRFaEVsRew98D/MP9A/1D2sQbBBtEI0Ojg4FDwYPBw99'
+      'D34Pfw+fDaANFw4YDhkOjw6QDpEOsQyyDCkNKg0rDaENog2jDcMLxAs7DDwMPQyzDLQM'
+      'tQzVCtYKTQtOC08LxQvGC8cL5wnoCV8KYAphCtcK2ArZCgkICgiBCIIIhQjpCeoJ7Qkd'
+      'Bx4HlQeWB5cHDQgOCA8ILwYwBqcGqAapBh8HIAchB0EFQgW5BboFuwUxBjIGMwZTBFQE'
+      'ywTMBM0EQwVEBUUFZQNmA90D3gPfA1UEVgRXBHcCeALvAvAC8QJnA2gDaQOJAYoBAQIC'
+      'AgMCeQJ6AnsCmwCcABMBFAEVAYsBjAGNAQM3BDd7N3w3fTedAJ4AoQB+N383ogCjAKQA'
+      'GgEbARwBFgEZAY4BkQGSAQYCCQIKAgQCBQJ8An0CfgL0AvUC9gLyAvMCagNrA2wD4gPj'
+      'A+QD4APhA1gEWQRaBNAE0QTSBM4EzwRGBUcFSAW+Bb8FwAW8Bb0FNAY1BjYGrAatBq4G'
+      'qgarBiIHIwckB5oHmwecB5gHmQcQCBEIEgiICIkIigiGCIcI7gnvCfAJZgpnCmgKYgpl'
+      'CtoK3QreClILVQtWC1ALUQvIC8kLygtADEEMQgw+DD8Mtgy3DLgMLg0vDTANLA0tDaQN'
+      'pQ2mDRwOHQ4eDhoOGw6SDpMOlA4KDwsPDA8IDwkPgA+BD4IP+A/5D/oP9g/3D24QbxBw'
+      'EOYQ5xDoEOQQ5RBcEV0RXhHUEdUR1hHSEdMROhM7EzwTshOzE7QTBhaxE34WKRQqFPYW'
+      'oRSiFF0YXhjVGNYYgRZNGU4Z+RYZFRoVkRWSFZMVCRYKFgsWKxQsFKMUpBSlFBsVHBUd'
+      'FT0TPhO1E7YTtxMtFC4ULxRfEWAR1xHYEdkRPxNAE0ETcRByEOkQ6hDrEGERYhFjEYMP'
+      'hA/7D/wP/Q9zEHQQdRCVDpYODQ8ODw8PhQ+GD4cPpw2oDR8OIA4hDpcOmA6ZDrkMugwx'
+      'DTINNQ2pDaoNrQ3NC84LRQxGDEcMvQy+DL8M3wrgClcLWAtZC88L0AvRC/EJ8glpCmoK'
+      'awrhCuIK4woTCBQIiwiMCI0I8wn0CfUJJQcmB50HngefBxUIFggXCDcGOAavBrAGsQYn'
+      'BygHKQdJBUoFwQXCBcMFOQY6BjsGWwRcBNME1ATVBEsFTAVNBW0DbgPlA+YD6QNdBF4E'
+      'YQSBAoIC+QL6AvsCcQNyA3MDkwGUAQsCDAINAoMChAKFAqUApgAdAR4BHwGVAZYBlwEL'
+      'Nww3gzeEN4U3pwCoAKkAhjeHN6oAqwCsACIBIwEkASABIQGYAZkBmgEQAhECEgIOAg8C'
+      'hgKHAogC/gL/AgAD/AL9AnQDdQN2A+wD7QPuA+oD6wNiBGMEZATaBNsE3ATWBNkETgVR'
+      'BVIFxgXJBcoFxAXFBTwGPQY+BrQGtQa2BrIGswYqBysHLAeiB6MHpAegB6EHGAgZCBoI'
+      'kAiRCJIIjgiPCPYJ9wn4CW4KbwpwCmwKbQrkCuUK5gpcC10LXgtaC1sL0gvTC9QLSgxL'
+      'DEwMSAxJDMAMwQzCDDgNOQ06DTYNNw2uDa8NsA0mDicOKA4iDiUOmg6dDp4OEg8VDxYP'
+      'EA8RD4gPiQ+KDwAQARACEP4P/w92EHcQeBDuEO8Q8BDsEO0QZBFlEWYR3BHdEd4R2hHb'
+      'EUITQxNEE7oTuxO8E7gTuRMwFDEUMhSoFKkUqhSmFKcUHhUfFSAVlhWXFZgVlBWVFQwW'
+      'DRYOFoQWhRaGFoIWgxb6FvsW/BZyF3MXdBfGGXEXPhrpF+oXthphGGIYDR0OHYUdhh1B'
+      'Gv0d/h25GtkY2hhRGVIZUxnJGcoZyxnrF+wXYxhkGGUY2xjcGN0Y/Rb+FnUXdhd3F+0X'
+      '7hfvFw8WEBaHFogWiRb/FgAXARchFSIVmRWaFZsVERYSFhMWMxQ0FKsUrBStFCMVJBUl'
+      'FUUTRhO9E74TvxM1FDYUNxRnEWgR3xHgEeERRxNIE0kTeRB6EPEQ8hD1EGkRahFtEY0P'
+      'jg8FEAYQBxB9EH4QfxCfDqAOFw8YDxkPjw+QD5EPsQ2yDSkOKg4rDqEOog6jDsMMxAw7'
+      'DTwNPQ2zDbQNtQ3VC9YLTQxODE8MxQzGDMcM5wroCl8LYAthC9cL2AvZC/kJ+glxCnIK'
+      'cwrpCuoK6wobCBwIkwiUCJUI+wn8Cf0JLQcuB6UHpgepBx0IHgghCEEGQga5BroGuwYx'
+      'BzIHMwdTBVQFywXMBc0FQwZEBkUGZQRmBN0E3gTfBFUFVgVXBXcDeAPvA/AD8QNnBGgE'
+      'aQSJAooCAQMCAwMDeQN6A3sDmwGcARMCFAIVAosCjAKNAq0ArgAlASYBJwGdAZ4BnwEV'
+      'NxY3jTeON483rwCwALEAkDeRN7IAtQC2ACoBLQEuASgBKQGgAaEBogEYAhkCGgIWAhcC'
+      'jgKPApACBgMHAwgDBAMFA3wDfQN+A/QD9QP2A/ID8wNqBGsEbATiBOME5ATgBOEEWAVZ'
+      'BVoF0AXRBdIFzgXPBUYGRwZIBr4GvwbABrwGvQY0BzUHNgesB60HrgeqB6sHIggjCCQI'
+      'mgibCJwIlgiZCP4JAQoCCnYKeQp6CnQKdQrsCu0K7gpkC2ULZgtiC2ML2gvbC9wLUgxT'
+      'DFQMUAxRDMgMyQzKDEANQQ1CDT4NPw22DbcNuA0uDi8OMA4sDi0OpA6lDqYOHA8dDx4P'
+      'Gg8bD5IPkw+UDwoQCxAMEAgQCRCAEIEQghD4EPkQ+hD2EPcQbhFvEXAR5hHnEegR4hHl'
+      'EUoTTRNOE8ITxRPGE8ATwRM4FDkUOhSwFLEUshSuFK8UJhUnFSgVnhWfFaAVnBWdFRQW'
+      'FRYWFowWjRaOFooWixYCFwMXBBd6F3sXfBd4F3kX8BfxF/IXaBhpGGoYZhhnGN4Y3xjg'
+      'GFYZVxlYGVQZVRnMGc0ZzhlEGkUaRhpCGkMauhq7GrwaMhszGzQbdh4xG+4emRyaHGYf'
+      'ER0SHc0gziBFIUYh8R69Ib4haR+JHYodAR4CHgMeeR56HnsemxycHBMdFB0VHYsdjB2N'
+      'Hb0avho1GzYbNxudHJ4cnxzPGdAZRxpIGkkavxrAGsEa4RjiGFkZWhlbGdEZ0hnTGfMX'
+      '9BdrGGwYbRjjGOQY5RgFFwYXfRd+F38X9Rf2F/cXFxYYFo8WkBaRFgcXCBcJFykVKhWh'
+      'FaIVpRUZFhoWHRY9FD4UtRS2FLcULRUuFS8VTxNQE8cTyBPJEz8UQBRBFHERchHpEeoR'
+      '6xFRE1ITUxODEIQQ+xD8EP0QcxF0EXURlQ+WDw0QDhAPEIUQhhCHEKcOqA4fDyAPIQ+X'
+      'D5gPmQ+5DboNMQ4yDjMOqQ6qDqsOywzMDEMNRA1FDbsNvA29Dd0L3gtVDFYMWQzNDM4M'
+      '0QzxCvIKaQtqC2sL4QviC+MLAwoECnsKfAp9CvMK9Ar1CiUIJgidCJ4InwgFCgYKBwo3'
+      'BzgHrwewB7EHJwgoCCkISQZKBsEGwgbDBjkHOgc7B1sFXAXTBdQF1QVLBkwGTQZtBG4E'
+      '5QTmBOcEXQVeBV8FfwOAA/cD+AP5A28EcARxBJECkgIJAwoDDQOBA4IDhQOlAaYBHQIe'
+      'Ah8ClQKWApcCtwC4AC8BMAExAacBqAGpAR03HjeVN5Y3lze5ALoAuwCYN5k3vAC9AL4A'
+      'NAE1ATYBMgEzAaoBqwGsASICIwIkAiACIQKYApkCmgIQAxEDEgMOAw8DhgOHA4gD/gP/'
+      'AwAE+gP9A3IEdQR2BOoE7QTuBOgE6QRgBWEFYgXYBdkF2gXWBdcFTgZPBlAGxgbHBsgG'
+      'xAbFBjwHPQc+B7QHtQe2B7IHswcqCCsILAiiCKMIpAigCKEICAoJCgoKgAqBCoIKfgp/'
+      'CvYK9wr4Cm4LbwtwC2wLbQvkC+UL5gtcDF0MXgxaDFsM0gzTDNQMSg1LDUwNRg1JDb4N'
+      'wQ3CDTYOOQ46DjQONQ6sDq0Org4kDyUPJg8iDyMPmg+bD5wPEhATEBQQEBAREIgQiRCK'
+      'EAARARECEf4Q/xB2EXcReBHuEe8R8BHsEe0RVBNVE1YTzBPNE84TyhPLE0IUQxREFLoU'
+      'uxS8FLgUuRQwFTEVMhWoFakVqhWmFacVHhYfFiAWlhaXFpgWkhaVFgoXDRcOF4IXhReG'
+      'F4AXgRf4F/kX+hdwGHEYchhuGG8Y5hjnGOgYXhlfGWAZXBldGdQZ1RnWGUwaTRpOGkoa'
+      'SxrCGsMaxBo6GzsbPBs4GzkboByhHKIcGB0ZHRodFh0XHY4djx2QHQYeBx4IHgQeBR58'
+      'Hn0efh70HvUe9h7yHvMeah9rH2wf4h/jH+QfNiLhH64iWSBaICYj0SDSII0kjiQFJQYl'
+      'sSJtJm4mKSNJIUohwSHCIcMhOSI6IjsiWyBcINMg1CDVIEshTCFNIW0fbh/lH+Yf5x9d'
+      'IF4gXyB/HoAe9x74Hvkebx9wH3EfkR2SHQkeCh4LHoEegh6DHqMcpBwbHRwdHR2THZQd'
+      'lR3FGsYaPRs+Gz8bpRymHKcc1xnYGU8aUBpRGscayBrJGukY6hhhGWIZZRnZGdoZ3Rn9'
+      'F/4XdRh2GHcY7RjuGO8YDxcQF4cXiBeJF/8XABgBGCEWIhaZFpoWmxYRFxIXExczFTQV'
+      'qxWsFa0VIxYkFiUWRRRGFL0UvhS/FDUVNhU3FVcTWBPPE9AT0RNHFEgUSRR5EXoR8RHy'
+      'EfMRWRNaE1sTixCMEAMRBBEFEXsRfBF9EZ0Png8VEBYQGRCNEI4QkRCxDrIOKQ8qDysP'
+      'oQ+iD6MPww3EDTsOPA49DrMOtA61DtUM1gxNDU4NTw3FDcYNxw3nC+gLXwxgDGEM1wzY'
+      'DNkM+Qr6CnELcgtzC+kL6gvrCwsKDAqDCoQKhQr7CvwK/QotCC4IpQimCKcIDQoOCg8K'
+      'PwdAB7cHuAe5By8IMAgxCFEGUgbJBsoGzQZBB0IHRQdlBWYF3QXeBd8FVQZWBlcGdwR4'
+      'BO8E8ATxBGcFaAVpBYkDigMBBAIEAwR5BHoEewSbApwCEwMUAxUDiwOMA40DrQGuASUC'
+      'JgInAp0CngKfAr8AwAA3ATgBOQGvAbABsQElNyY3nTeeN6E3wQDCAMMAojejN8QAxQDG'
+      'ADwBPQE+AToBOwGyAbMBtAEqAisCLAIoAikCoAKhAqICGAMZAxoDFgMXA44DjwOQAwYE'
+      'BwQIBAQEBQR8BH0EfgT0BPUE9gTyBPMEagVrBWwF4gXjBeQF4AXhBVgGWQZaBtAG0QbS'
+      'Bs4GzwZGB0cHSAe+B78HwAe6B70HMgg1CDYIqgitCK4IqAipCBAKEQoSCogKiQqKCoYK'
+      'hwr+Cv8KAAt2C3cLeAt0C3UL7AvtC+4LZAxlDGYMYgxjDNoM2wzcDFINUw1UDVANUQ3I'
+      'DckNyg1ADkEOQg4+Dj8Otg63DrgOLg8vDzAPLA8tD6QPpQ+mDxwQHRAeEBoQGxCSEJMQ'
+      'lBAKEQsRDBEGEQkRfhGBEYIR9hH5EfoR9BH1EVwTXRNeE9QT1RPWE9IT0xNKFEsUTBTC'
+      'FMMUxBTAFMEUOBU5FToVsBWxFbIVrhWvFSYWJxYoFp4WnxagFpwWnRYUFxUXFheMF40X'
+      'jheKF4sXAhgDGAQYehh7GHwYeBh5GPAY8RjyGGgZaRlqGWYZZxneGd8Z4BlWGlcaWBpS'
+      'GlUayhrNGs4aQhtFG0YbQBtBG6gcqRyqHCAdIR0iHR4dHx2WHZcdmB0OHg8eEB4MHg0e'
+      'hB6FHoYe/B79Hv4e+h77HnIfcx90H+of6x/sH+gf6R9gIGEgYiDYINkg2iDWINcgTiFP'
+      'IVAhxiHHIcghxCHFITwiPSI+IrQitSK2IrIisyIqIysjLCOiI6MjpCPmJqEjXicZJBok'
+      '1ieRJJIkPSk+KbUptilhJy0qLirZJ/kl+iVxJnImcybpJuom6yYbJBwkkySUJJUk+yX8'
+      'Jf0lLSMuI6UjpiOnIx0kHiQfJD8iQCK3IrgiuSIvIzAjMSNRIVIhySHKIcshQSJCIkMi'
+      'YyBkINsg3CDdIFMhVCFVIXUfdh/tH+4f7x9lIGYgZyCHHoge/x4AHwEfdx94H3kfmR2a'
+      'HREeEh4VHokeih6NHq0crhwlHSYdJx2dHZ4dnx3PGtAaRxtIG0kbrxywHLEc4RniGVka'
+      'WhpbGtEa0hrTGvMY9BhrGWwZbRnjGeQZ5RkFGAYYfRh+GH8Y9Rj2GPcYFxcYF48XkBeR'
+      'FwcYCBgJGCkWKhahFqIWoxYZFxoXGxc7FTwVsxW0FbUVKxYsFi0WTRROFMUUxhTJFD0V'
+      'PhVBFWETYhPZE9oT2xNRFFIUUxSDEYQR+xH8Ef0RYxNkE2UTlRCWEA0RDhEPEYURhhGH'
+      'EacPqA8fECAQIRCXEJgQmRC5DroOMQ8yDzMPqQ+qD6sPyw3MDUMORA5FDrsOvA69Dt0M'
+      '3gxVDVYNVw3NDc4Nzw3vC/ALZwxoDGkM3wzgDOEMAQsCC3kLegt9C/EL8gv1CxUKFgqN'
+      'Co4KjwoFCwYLBws3CDgIrwiwCLEIFwoYChkKSQdKB8EHwgfDBzkIOgg7CFsGXAbTBtQG'
+      '1QZLB0wHTQdtBW4F5QXmBecFXQZeBl8GfwSABPcE+AT5BG8FcAVxBZEDkgMJBAoECwSB'
+      'BIIEgwSjAqQCGwMcAx0DkwOUA5UDtQG2AS0CLgIxAqUCpgKpAskAygBBAUIBQwG5AboB'
+      'uwEvNzA3pzeoN6k3ywDMAM0AqjerN84AzwDQAEYBRwFIAUQBRQG8Ab0BvgE0AjUCNgIy'
+      'AjMCqgKrAqwCIgMjAyQDHgMhA5YDmQOaAw4EEQQSBAwEDQSEBIUEhgT8BP0E/gT6BPsE'
+      'cgVzBXQF6gXrBewF6AXpBWAGYQZiBtgG2QbaBtYG1wZOB08HUAfGB8cHyAfEB8UHPAg9'
+      'CD4ItAi1CLYIsgizCBoKGwocCpIKkwqUCpAKkQoICwkLCguAC4ELggt+C38L9gv3C/gL'
+      'bgxvDHAMagxtDOIM5QzmDFoNXQ1eDVgNWQ3QDdEN0g1IDkkOSg5GDkcOvg6/DsAONg83'
+      'DzgPNA81D6wPrQ+uDyQQJRAmECIQIxCaEJsQnBASERMRFBEQERERiBGJEYoRABIBEgIS'
+      '/hH/EWYTZxNoE94T3xPgE9wT3RNUFFUUVhTMFM0UzhTKFMsUQhVDFUQVuhW7FbwVthW5'
+      'FS4WMRYyFqYWqRaqFqQWpRYcFx0XHheUF5UXlheSF5MXChgLGAwYghiDGIQYgBiBGPgY'
+      '+Rj6GHAZcRlyGW4ZbxnmGecZ6BleGl8aYBpcGl0a1BrVGtYaTBtNG04bShtLG7Icsxy0'
+      'HCodKx0sHSgdKR2gHaEdoh0YHhkeGh4WHhcejh6PHpAeBh8HHwgfAh8FH3offR9+H/If'
+      '9R/2H/Af8R9oIGkgaiDgIOEg4iDeIN8gViFXIVghziHPIdAhzCHNIUQiRSJGIrwivSK+'
+      'IroiuyIyIzMjNCOqI6sjrCOoI6kjICQhJCIkmCSZJJokliSXJP4l/yUAJnYmdyZ4JnQm'
+      'dSbsJu0m7iZkJ2UnZidiJ2Mn2ifbJ9wnUihTKFQopipRKB4rySjKKJYrQSlCKf0s/ix1'
+      'LXYtISvtLe4tmSu5KbopMSoyKjMqqSqqKqsqyyjMKEMpRClFKbspvCm9Kd0n3idVKFYo'
+      'VyjNKM4ozyjvJvAmZydoJ2kn3yfgJ+EnASYCJnkmeiZ7JvEm8ibzJiMkJCSbJJwknSQD'
+      'JgQmBSY1IzYjrSOuI68jJSQmJCckRyJIIr8iwCLBIjcjOCM5I1khWiHRIdIh1SFJIkoi'
+      'TSJtIG4g5SDmIOcgXSFeIV8hfx+AH/cf+B/5H28gcCBxIJEekh4JHwofCx+BH4Ifgx+j'
+      'HaQdGx4cHh0ekx6UHpUetRy2HC0dLh0vHaUdph2nHdca2BpPG1AbURu3HLgcuRzpGeoZ'
+      'YRpiGmMa2RraGtsa+xj8GHMZdBl1GesZ7BntGQ0YDhiFGIYYiRj9GP4YARkhFyIXmRea'
+      'F5sXERgSGBMYMxY0FqsWrBatFiMXJBclF0UVRhW9Fb4VvxU1FjYWNxZXFFgUzxTQFNEU'
+      'RxVIFUkVaRNqE+ET4hPjE1kUWhRbFIsRjBEDEgQSBRJrE2wTbROdEJ4QFREWERcRjRGO'
+      'EY8Rrw+wDycQKBApEJ8QoBChEMEOwg45DzoPPQ+xD7IPtQ/VDdYNTQ5ODk8OxQ7GDscO'
+      '5wzoDF8NYA1hDdcN2A3ZDfkL+gtxDHIMcwzpDOoM6wwLCwwLgwuEC4UL+wv8C/0LHQoe'
+      'CpUKlgqXCg0LDgsPCz8IQAi3CLgIuQgfCiAKIQpRB1IHyQfKB8sHQQhCCEMIYwZkBtsG'
+      '3AbdBlMHVAdVB3UFdgXtBe4F8QVlBmYGaQaJBIoEAQUCBQMFeQV6BXsFmwOcAxMEFAQV'
+      'BIsEjASNBK0CrgIlAyYDJwOdA54DnwO/AcABNwI4AjkCrwKwArEC0QDSAEkBSgFLAcEB'
+      'wgHDATc3ODevN7A3sTfTANQA1QCyN7U31gDXANgATgFPAVABTAFNAcQBxQHGATwCPQI+'
+      'AjoCOwKyArMCtAIqAysDLAMoAykDoAOhA6IDGAQZBBoEFgQXBI4EjwSQBAYFBwUIBQQF'
+      'BQV8BX0FfgX0BfUF9gXyBfMFagZrBmwG4gbjBuQG3gbhBlYHWQdaB84H0QfSB8wHzQdE'
+      'CEUIRgi8CL0Ivgi6CLsIIgojCiQKmgqbCpwKmAqZChALEQsSC4gLiQuKC4YLhwv+C/8L'
+      'AAx2DHcMeAx0DHUM7AztDO4MZA1lDWYNYg1jDdoN2w3cDVIOUw5UDlAOUQ7IDskOyg5A'
+      'D0EPQg8+Dz8Ptg+3D7gPLhAvEDAQKhAtEKIQpRCmEBoRHREeERgRGRGQEZERkhEIEgkS'
+      'ChIGEgcSbhNvE3AT5hPnE+gT5BPlE1wUXRReFNQU1RTWFNIU0xRKFUsVTBXCFcMVxBXA'
+      'FcEVOBY5FjoWsBaxFrIWrhavFiYXJxcoF54XnxegF5wXnRcUGBUYFhiMGI0YjhiKGIsY'
+      'AhkDGQQZehl7GXwZdhl5Ge4Z8RnyGWYaaRpqGmQaZRrcGt0a3hpUG1UbVhtSG1Mbuhy7'
+      'HLwcMh0zHTQdMB0xHagdqR2qHSAeIR4iHh4eHx6WHpcemB4OHw8fEB8MHw0fhB+FH4Yf'
+      '/B/9H/4f+h/7H3IgcyB0IOog6yDsIOgg6SBgIWEhYiHYIdkh2iHWIdchTiJPIlAixiLH'
+      'IsgiwiLFIjojPSM+I7IjtSO2I7AjsSMoJCkkKiSgJKEkoiSeJJ8kBiYHJggmfiZ/JoAm'
+      'fCZ9JvQm9Sb2JmwnbSduJ2onayfiJ+Mn5CdaKFsoXChYKFko0CjRKNIoSClJKUopRilH'
+      'Kb4pvynAKTYqNyo4KjQqNSqsKq0qriokKyUrJisiKyMrmiubK5wrEiwTLBQsZi4RLM4v'
+      'iSyKLEYwAS0CLa0xrjElMiYy0S+dMp4ySTB5LXot8S3yLfMtWS9aL1sviyyMLAMtBC0F'
+      'LXstfC19LZ0rnisVLBYsFyyNLI4sjyyvKrAqJysoKykrnyugK6ErwSnCKTkqOio7KrEq'
+      'siqzKtMo1ChLKUwpTSnDKcQpxSnlJ+YnXSheKF8o1SjWKNco9yb4Jm8ncCdxJ+cn6Cfp'
+      'JwkmCiaBJoImhSb5Jvom/SYtJC4kpSSmJKckDSYOJg8mPyNAI7cjuCO5Iy8kMCQxJFEi'
+      'UiLJIsoiyyJBI0IjQyNjIWQh2yHcId0hUyJUIlUidSB2IO0g7iDvIGUhZiFnIYcfiB//'
+      'HwAgASB3IHggeSCZHpoeER8SHxMfiR+KH4sfqx2sHSMeJB4lHpsenB6dHr0cvhw1HTYd'
+      'OR2tHa4dsR3hGuIaWRtaG1sbwRzCHMMc8xn0GWsabBptGuMa5BrlGgUZBhl9GX4Zfxn1'
+      'GfYZ9xkXGBgYjxiQGJEYBxkIGQkZKRcqF6EXohejFxkYGhgbGDsWPBazFrQWtRYrFywX'
+      'LRdNFU4VxRXGFccVPRY+Fj8WXxRgFNcU2BTZFE8VUBVRFXETchPpE+oT7RNhFGIUZRSV'
+      'EZYRDRIOEg8SdRN2E3cTpxCoEB8RIBEhEZcRmBGZEbkPug8xEDIQMxCpEKoQqxDLDswO'
+      'Qw9ED0UPuw+8D70P3Q3eDVUOVg5XDs0Ozg7PDu8M8AxnDWgNaQ3fDeAN4Q0BDAIMeQx6'
+      'DHsM8QzyDPMMEwsUC4sLjAuNCwMMBAwFDCUKJgqdCp4KoQoVCxYLGQtJCEoIwQjCCMMI'
+      'KQoqCisKWwdcB9MH1AfVB0sITAhNCG0GbgblBuYG5wZdB14HXwd/BYAF9wX4BfkFbwZw'
+      'BnEGkQSSBAkFCgULBYEFggWDBaMDpAMbBBwEHQSTBJQElQS1ArYCLQMuAy8DpQOmA6cD'
+      'xwHIAT8CQAJBArcCuAK5AtkA2gBRAVIBVQHJAcoBzQFBN0I3uTe6N7s33QDeAN8AvDe9'
+      'N+AA4QDiAFgBWQFaAVYBVwHOAc8B0AFGAkcCSAJCAkUCugK9Ar4CMgM1AzYDMAMxA6gD'
+      'qQOqAyAEIQQiBB4EHwSWBJcEmAQOBQ8FEAUMBQ0FhAWFBYYF/AX9Bf4F+gX7BXIGcwZ0'
+      'BuoG6wbsBugG6QZgB2EHYgfYB9kH2gfWB9cHTghPCFAIxgjHCMgIxAjFCCwKLQouCqQK'
+      'pQqmCqIKowoaCxsLHAuSC5MLlAuOC5ELBgwJDAoMfgyBDIIMfAx9DPQM9Qz2DGwNbQ1u'
+      'DWoNaw3iDeMN5A1aDlsOXA5YDlkO0A7RDtIOSA9JD0oPRg9HD74Pvw/ADzYQNxA4EDQQ'
+      'NRCsEK0QrhAkESURJhEiESMRmhGbEZwREhITEhQSEBIREngTeRN6E/AT8RPyE+4T7xNm'
+      'FGcUaBTeFN8U4BTaFN0UUhVVFVYVyhXNFc4VyBXJFUAWQRZCFrgWuRa6FrYWtxYuFy8X'
+      'MBemF6cXqBekF6UXHBgdGB4YlBiVGJYYkhiTGAoZCxkMGYIZgxmEGYAZgRn4GfkZ+hlw'
+      'GnEachpuGm8a5hrnGugaXhtfG2AbXBtdG8QcxRzGHDwdPR0+HTodOx2yHbMdtB0qHise'
+      'LB4mHikenh6hHqIeFh8ZHxofFB8VH4wfjR+OHwQgBSAGIAIgAyB6IHsgfCDyIPMg9CDw'
+      'IPEgaCFpIWoh4CHhIeIh3iHfIVYiVyJYIs4izyLQIswizSJEI0UjRiO8I70jviO6I7sj'
+      'MiQzJDQkqiSrJKwkqCSpJBAmESYSJogmiSaKJoYmhyb+Jv8mACd2J3cneCdyJ3Un6ift'
+      'J+4nYihlKGYoYChhKNgo2SjaKFApUSlSKU4pTynGKccpyCk+Kj8qQCo8Kj0qtCq1KrYq'
+      'LCstKy4rKisrK6IroyukKxosGywcLBgsGSyQLJEskiwILQktCi0GLQctfi1/LYAt9i33'
+      'Lfgt9C31LVwvXS9eL9Qv1S/WL9Iv0y9KMEswTDDCMMMwxDAWM8EwjjM5MToxBjSxMbIx'
+      'bTVuNeU15jWRM102XjYJNCkyKjKhMqIyozIZMxozGzM7MTwxszG0MbUxKzIsMi0yTTBO'
+      'MMUwxjDHMD0xPjE/MV8vYC/XL9gv2S9PMFAwUTCBLYIt+S36LfstYS9iL2MvkyyULAst'
+      'DC0NLYMthC2FLaUrpisdLB4sHyyVLJYslyy3KrgqLyswKzErpyuoK6krySnKKUEqQipF'
+      'Krkquiq9Kt0o3ihVKVYpVynNKc4pzynvJ/AnZyhoKGko3yjgKOEoAScCJ3kneid7J/En'
+      '8ifzJxMmFCaLJowmjSYDJwQnBSc1JDYkrSSuJK8kFSYWJhcmRyNII78jwCPBIzckOCQ5'
+      'JFkiWiLRItIi0yJJI0ojSyNrIWwh4yHkIeUhWyJcIl0ifSB+IPUg9iD5IG0hbiFxIZEf'
+      'kh8JIAogCyCBIIIggyCjHqQeGx8cHx0fkx+UH5UftR22HS0eLh4vHqUeph6nHsccyBw/'
+      'HUAdQR23HbgduR3pGuoaYRtiG2MbyRzKHMsc+xn8GXMadBp1Gusa7BrtGg0ZDhmFGYYZ'
+      'hxn9Gf4Z/xkfGCAYlxiYGJkYDxkQGREZMRcyF6kXqhetFyEYIhglGEUWRha9Fr4WvxY1'
+      'FzYXNxdXFVgVzxXQFdEVRxZIFkkWaRRqFOEU4hTjFFkVWhVbFXsTfBPzE/QT9RNrFGwU'
+      'bRSdEZ4RFRIWEhcSfRN+E38TrxCwECcRKBEpEZ8RoBGhEcEPwg85EDoQOxCxELIQsxDT'
+      'DtQOSw9MD00Pww/ED8UP5Q3mDV0OXg5hDtUO1g7ZDvkM+gxxDXINcw3pDeoN6w0LDAwM'
+      'gwyEDIUM+wz8DP0MHQseC5ULlguXCw0MDgwPDC8KMAqnCqgKqQofCyALIQtRCFIIyQjK'
+      'CMsIMQoyCjMKYwdkB9sH3AfdB1MIVAhVCHUGdgbtBu4G7wZlB2YHZweHBYgF/wUABgEG'
+      'dwZ4BnkGmQSaBBEFEgUVBYkFigWNBa0DrgMlBCYEJwSdBJ4EnwS/AsACNwM4AzkDrwOw'
+      'A7ED0QHSAUkCSgJLAsECwgLDAuMA5ABbAVwBXQHTAdQB1QFJN0o3wTfCN8M35QDmAOcA'
+      'xDfFN+gA6QDqAGABYQFiAV4BXwHWAdcB2AFOAk8CUAJMAk0CxALFAsYCPAM9Az4DOgM7'
+      'A7IDswO0AyoEKwQsBCgEKQSgBKEEogQYBRkFGgUWBRcFjgWPBZAFBgYHBggGAgYFBnoG'
+      'fQZ+BvIG9Qb2BvAG8QZoB2kHagfgB+EH4gfeB98HVghXCFgIzgjPCNAIzAjNCDQKNQo2'
+      'CqwKrQquCqoKqwoiCyMLJAuaC5sLnAuYC5kLEAwRDBIMiAyJDIoMhgyHDP4M/wwADXYN'
+      'dw14DXQNdQ3sDe0N7g1kDmUOZg5iDmMO2g7bDtwOUg9TD1QPTg9RD8YPyQ/KDz4QQRBC'
+      'EDwQPRC0ELUQthAsES0RLhEqESsRohGjEaQRGhIbEhwSGBIZEoATgROCE/gT+RP6E/YT'
+      '9xNuFG8UcBTmFOcU6BTkFOUUXBVdFV4V1BXVFdYV0hXTFUoWSxZMFsIWwxbEFsAWwRY4'
+      'FzkXOhewF7EXsheuF68XJhgnGCgYnhifGKAYmhidGBIZFRkWGYoZjRmOGYgZiRkAGgEa'
+      'Ahp4Gnkaehp2Gnca7hrvGvAaZhtnG2gbZBtlG8wczRzOHEQdRR1GHUIdQx26HbsdvB0y'
+      'HjMeNB4wHjEeqB6pHqoeIB8hHyIfHh8fH5Yflx+YHw4gDyAQIAwgDSCEIIUghiD8IP0g'
+      '/iD6IPsgciFzIXQh6iHrIewh5iHpIV4iYSJiItYi2SLaItQi1SJMI00jTiPEI8UjxiPC'
+      'I8MjOiQ7JDwksiSzJLQksCSxJBgmGSYaJpAmkSaSJo4mjyYGJwcnCCd+J38ngCd8J30n'
+      '9Cf1J/YnbChtKG4oaihrKOIo4yjkKFopWylcKVgpWSnQKdEp0ilIKkkqSipGKkcqviq/'
+      'KsAqNis3KzgrMis1K6orrSuuKyIsJSwmLCAsISyYLJksmiwQLREtEi0OLQ8thi2HLYgt'
+      '/i3/LQAu/C39LWQvZS9mL9wv3S/eL9ov2y9SMFMwVDDKMMswzDDIMMkwQDFBMUIxuDG5'
+      'MboxtjG3MS4yLzIwMqYypzKoMqQypTIcMx0zHjOUM5UzljOSM5MzCjQLNAw0gjSDNIQ0'
+      '1jaBNE43+TT6NMY3cTVyNVE3UjdTN+0A7gBmAd4BVgLpNeo1YTZiNmM22TbaNts2+zT8'
+      'NHM1dDV1Nes17DXtNQ00DjSFNIY0hzT9NP40/zQfMyAzlzOYM5kzDzQQNBE0MTIyMqky'
+      'qjKrMiEzIjMjM0MxRDG7MbwxvTEzMjQyNTJVMFYwzTDOMM8wRTFGMUcxZy9oL98v4C/h'
+      'L1cwWDBZMIktii0BLgIuBS5pL2ovbS+dLJ4sFS0WLRctjS2OLY8tryuwKycsKCwpLJ8s'
+      'oCyhLMEqwio5KzorOyuxK7IrsyvTKdQpSypMKk0qwyrEKsUq5SjmKF0pXilfKdUp1inX'
+      'Kfcn+CdvKHAocSjnKOgo6SgJJwongSeCJ4Mn+Sf6J/snGyYcJpMmlCaVJgsnDCcNJz0k'
+      'PiS1JLYkuSQdJh4mISZRI1IjySPKI8sjQSRCJEMkYyJkItsi3CLdIlMjVCNVI3UhdiHt'
+      'Ie4h7yFlImYiZyKHIIgg/yAAIQEhdyF4IXkhmR+aHxEgEiATIIkgiiCLIKserB4jHyQf'
+      'JR+bH5wfnR+9Hb4dNR42HjcerR6uHq8ezxzQHEcdSB1JHb8dwB3BHfEa8hppG2obbRvR'
+      'HNIc1RwFGgYafRp+Gn8a9Rr2GvcaFxkYGY8ZkBmRGQcaCBoJGikYKhihGKIYoxgZGRoZ'
+      'Gxk7FzwXsxe0F7UXKxgsGC0YTRZOFsUWxhbHFj0XPhc/F18VYBXXFdgV2RVPFlAWURZx'
+      'FHIU6RTqFOsUYRViFWMVgxOEE/sT/BP9E3MUdBR1FKURphEdEh4SIRKFE4YTiRO5ELoQ'
+      'MREyETMRqRGqEasRyw/MD0MQRBBFELsQvBC9EN0O3g5VD1YPVw/ND84Pzw/vDfANZw5o'
+      'DmkO3w7gDuEOAQ0CDXkNeg17DfEN8g3zDRMMFAyLDIwMjQwDDQQNBQ0lCyYLnQueC58L'
+      'FQwWDBcMNwo4Cq8KsAqxCicLKAspC1kIWgjRCNII1Qg5CjoKPQptB24H5QfmB+cHXQhe'
+      'CF8IfwaABvcG+Ab5Bm8HcAdxB5EFkgUJBgoGCwaBBoIGgwajBKQEGwUcBR0FkwWUBZUF'
+      'tQO2Ay0ELgQvBKUEpgSnBMcCyAI/A0ADQQO3A7gDuQPZAdoBUQJSAlMCyQLKAssC6wDs'
+      'AGMBZAFlAdsB3AHdAVQCVQLMAs0CzgJEA0UDRgNCA0MDugO7A7wDMgQzBDQEMAQxBKgE'
+      'qQSqBCAFIQUiBR4FHwWWBZcFmAUOBg8GEAYMBg0GhAaFBoYG/Ab9Bv4G+gb7BnIHcwd0'
+      'B+oH6wfsB+gH6QdgCGEIYgjYCNkI2gjWCNcIPgo/CkAKtgq3CrgKsgq1CioLLQsuC6IL'
+      'pQumC6ALoQsYDBkMGgyQDJEMkgyODI8MBg0HDQgNfg1/DYANfA19DfQN9Q32DWwObQ5u'
+      'DmoOaw7iDuMO5A5aD1sPXA9YD1kP0A/RD9IPSBBJEEoQRhBHEL4QvxDAEDYRNxE4ETQR'
+      'NRGsEa0RrhEkEiUSJhIiEiMSihOLE4wTAhQDFAQU/hMBFHYUeRR6FO4U8RTyFOwU7RRk'
+      'FWUVZhXcFd0V3hXaFdsVUhZTFlQWyhbLFswWyBbJFkAXQRdCF7gXuRe6F7YXtxcuGC8Y'
+      'MBimGKcYqBikGKUYHBkdGR4ZlBmVGZYZkhmTGQoaCxoMGoIagxqEGoAagRr4Gvka+hpw'
+      'G3EbchtuG28b1hzXHNgcTh1PHVAdSh1NHcIdxR3GHToePR4+HjgeOR6wHrEesh4oHykf'
+      'Kh8mHycfnh+fH6AfFiAXIBggFCAVIIwgjSCOIAQhBSEGIQIhAyF6IXshfCHyIfMh9CHw'
+      'IfEhaCJpImoi4CLhIuIi3iLfIlYjVyNYI84jzyPQI8wjzSNEJEUkRiS8JL0kviS6JLsk'
+      'IiYjJiQmmiabJpwmliaZJg4nEScSJ4YniSeKJ4QnhSf8J/0n/id0KHUodihyKHMo6ijr'
+      'KOwoYiljKWQpYClhKdgp2SnaKVAqUSpSKk4qTyrGKscqyCo+Kz8rQCs8Kz0rtCu1K7Yr'
+      'LCwtLC4sKiwrLKIsoyykLBotGy0cLRgtGS2QLZEtki0ILgkuCi4GLgcubi9vL3Av5i/n'
+      'L+gv4i/lL1owXTBeMNIw1TDWMNAw0TBIMUkxSjHAMcExwjG+Mb8xNjI3MjgyrjKvMrAy'
+      'rDKtMiQzJTMmM5wznTOeM5ozmzMSNBM0FDSKNIs0jDSINIk0ADUBNQI1eDV5NXo1djV3'
+      'Ne417zXwNWY2ZzZoNmQ2ZTbcNt023jZUN1U3VjfxNfI1aTZqNms24TbiNuM2AzUENXs1'
+      'fDV9NfM19DX1NRU0FjSNNI40jzQFNQY1BzUnMygznzOgM6EzFzQYNBk0OTI6MrEysjK1'
+      'MikzKjMtM00xTjHFMcYxxzE9Mj4yPzJfMGAw1zDYMNkwTzFQMVExcS9yL+kv6i/rL2Ew'
+      'YjBjMJMtlC0LLgwuDS5zL3QvdS+lLKYsHS0eLR8tlS2WLZcttyu4Ky8sMCwxLKcsqCyp'
+      'LMkqyipBK0IrQyu5K7oruyvbKdwpUypUKlUqyyrMKs0q7SjuKGUpZilpKd0p3inhKQEo'
+      'Aih5KHooeyjxKPIo8ygTJxQniyeMJ40nAygEKAUoJSYmJp0mniafJhUnFicXJ0ckSCS/'
+      'JMAkwSQnJigmKSZZI1oj0SPSI9MjSSRKJEskayJsIuMi5CLlIlsjXCNdI30hfiH1IfYh'
+      '9yFtIm4ibyKPIJAgByEIIQkhfyGAIYEhoR+iHxkgGiAdIJEgkiCVILUeth4tHy4fLx+l'
+      'H6Yfpx/HHcgdPx5AHkEetx64Hrke2RzaHFEdUh1THckdyh3LHfsa/BpzG3QbdRvbHNwc'
+      '3RwNGg4ahRqGGoca/Rr+Gv8aHxkgGZcZmBmZGQ8aEBoRGjEYMhipGKoYqxghGSIZIxlD'
+      'F0QXuxe8F70XMxg0GDUYVRZWFs0WzhbRFkUXRhdJF2kVahXhFeIV4xVZFloWWxZ7FHwU'
+      '8xT0FPUUaxVsFW0VjROOEwUUBhQHFH0UfhR/FK8RsBEnEigSKRKPE5ATkRPBEMIQORE6'
+      'ETsRsRGyEbMR0w/UD0sQTBBNEMMQxBDFEOUO5g5dD14PXw/VD9YP1w/3DfgNbw5wDnEO'
+      '5w7oDukOCQ0KDYENgg2FDfkN+g39DR0MHgyVDJYMlwwNDQ4NDw0vCzALpwuoC6kLHwwg'
+      'DCEMQQpCCrkKugq7CjELMgszC2MIZAjbCNwI3QhDCkQKRQp1B3YH7QfuB+8HZQhmCGcI'
+      'hwaIBv8GAAcBB3cHeAd5B5kFmgURBhIGEwaJBooGiwarBKwEIwUkBSUFmwWcBZ0FFAYV'
+      'BowGjQaOBgQHBQcGBwIHAwd6B3sHfAfyB/MH9AfwB/EHaAhpCGoI4AjhCOII3gjfCEYK'
+      'RwpICr4KvwrACrwKvQo0CzULNgusC60LrguqC6sLIgwjDCQMmgybDJwMmAyZDBANEQ0S'
+      'DYgNiQ2KDYYNhw3+Df8NAA52DncOeA5yDnUO6g7tDu4OYg9lD2YPYA9hD9gP2Q/aD1AQ'
+      'URBSEE4QTxDGEMcQyBA+ET8RQBE8ET0RtBG1EbYRLBItEi4SKhIrEpITkxOUEwoUCxQM'
+      'FAgUCRSAFIEUghT4FPkU+hT2FPcUbhVvFXAV5hXnFegV5BXlFVwWXRZeFtQW1RbWFtIW'
+      '0xZKF0sXTBfCF8MXxBe+F8EXNhg5GDoYrhixGLIYrBitGCQZJRkmGZwZnRmeGZoZmxkS'
+      'GhMaFBqKGosajBqIGokaABsBGwIbeBt5G3obdht3G94c3xzgHFYdVx1YHVQdVR3MHc0d'
+      'zh1EHkUeRh5CHkMeuh67HrweMh8zHzQfMB8xH6gfqR+qHyAgISAiIB4gHyCWIJcgmCAO'
+      'IQ8hECEKIQ0hgiGFIYYh+iH9If4h+CH5IXAicSJyIugi6SLqIuYi5yJeI18jYCPWI9cj'
+      '2CPUI9UjTCRNJE4kxCTFJMYkwiTDJComKyYsJqImoyakJqAmoSYYJxknGieQJ5EnkieO'
+      'J48nBigHKAgofih/KIAofCh9KPQo9Sj2KGwpbSluKWopayniKeMp5ClaKlsqXCpWKlkq'
+      'zirRKtIqRitJK0orRCtFK7wrvSu+KzQsNSw2LDIsMyyqLKssrCwiLSMtJC0gLSEtmC2Z'
+      'LZotEC4RLhIuDi4PLnYvdy94L+4v7y/wL+wv7S9kMGUwZjDcMN0w3jDaMNswUjFTMVQx'
+      'yjHLMcwxyDHJMUAyQTJCMrgyuTK6MrYytzIuMy8zMDOmM6czqDOiM6UzGjQdNB40kjSV'
+      'NJY0kDSRNAg1CTUKNYA1gTWCNX41fzX2Nfc1+DVuNm82cDZsNm025DblNuY2XDddN143'
+      '+TX6NXE2cjZ1Nuk26jbtNg01DjWFNYY1hzX9Nf41/zUfNCA0lzSYNJk0DzUQNRE1MTMy'
+      'M6kzqjOrMyE0IjQjNEMyRDK7MrwyvTIzMzQzNTNVMVYxzTHOMc8xRTJGMkcyZzBoMN8w'
+      '4DDhMFcxWDFZMXkvei/xL/Iv8y9pMGowazCbLZwtEy4ULhUuey98L30vrSyuLCUtJi0p'
+      'LZ0tni2hLcErwis5LDosOyyxLLIssyzTKtQqSytMK00rwyvEK8Ur5SnmKV0qXipfKtUq'
+      '1irXKvco+ChvKXApcSnnKegp6SkJKAoogSiCKIMo+Sj6KPsoGyccJ5MnlCeVJwsoDCgN'
+      'KC0mLialJqYmpyYdJx4nHydPJFAkxyTIJMkkLyYwJjEmYSNiI9kj2iPdI1EkUiRVJHUi'
+      'diLtIu4i7yJlI2YjZyOHIYgh/yEAIgEidyJ4InkimSCaIBEhEiETIYkhiiGLIasfrB8j'
+      'ICQgJSCbIJwgnSC9Hr4eNR82HzcfrR+uH68fzx3QHUceSB5JHr8ewB7BHuEc4hxZHVod'
+      'Wx3RHdId0x0DGwQbext8G30b4xzkHOUcFRoWGo0ajhqRGgUbBhsJGykZKhmhGaIZoxkZ'
+      'GhoaGxo7GDwYsxi0GLUYKxksGS0ZTRdOF8UXxhfHFz0YPhg/GF8WYBbXFtgW2RZPF1AX'
+      'URdxFXIV6RXqFesVYRZiFmMWgxSEFPsU/BT9FHMVdBV1FZUTlhMNFA4UDxSFFIYUhxS3'
+      'EbgRLxIwEjESlxOYE5kTyRDKEEERQhFFEbkRuhG9Ed0P3g9VEFYQVxDNEM4QzxDvDvAO'
+      'Zw9oD2kP3w/gD+EPAQ4CDnkOeg57DvEO8g7zDhMNFA2LDYwNjQ0DDgQOBQ4lDCYMnQye'
+      'DJ8MFQ0WDRcNNws4C68LsAuxCycMKAwpDEkKSgrBCsIKwwo5CzoLOwtrCGwI4wjkCOUI'
+      'SwpMCk0KxArFCjwLPQs+C7QLtQu2C7ILswsqDCsMLAyiDKMMpAygDKEMGA0ZDRoNkA2R'
+      'DZINjg2PDQYOBw4IDn4Ofw6ADnwOfQ70DvUO9g5sD20Pbg9qD2sP4g/jD+QPWhBbEFwQ'
+      'WBBZENAQ0RDSEEgRSRFKEUYRRxG+Eb8RwBE2EjcSOBIyEjUSmhOdE54TEhQVFBYUEBQR'
+      'FIgUiRSKFAAVARUCFf4U/xR2FXcVeBXuFe8V8BXsFe0VZBZlFmYW3BbdFt4W2hbbFlIX'
+      'UxdUF8oXyxfMF8gXyRdAGEEYQhi4GLkYuhi2GLcYLhkvGTAZphmnGagZpBmlGRwaHRoe'
+      'GpQalRqWGpIakxoKGwsbDBuCG4MbhBt+G4Eb5hzpHOocXh1hHWIdXB1dHdQd1R3WHUwe'
+      'TR5OHkoeSx7CHsMexB46HzsfPB84HzkfsB+xH7IfKCApICogJiAnIJ4gnyCgIBYhFyEY'
+      'IRQhFSGMIY0hjiEEIgUiBiICIgMieiJ7Inwi8iLzIvQi8CLxImgjaSNqI+Aj4SPiI94j'
+      '3yNWJFckWCTOJM8k0CTKJM0kMiY1JjYmqiatJq4mqCapJiAnISciJ5gnmSeaJ5YnlycO'
+      'KA8oECiGKIcoiCiEKIUo/Cj9KP4odCl1KXYpcilzKeop6ynsKWIqYypkKmAqYSrYKtkq'
+      '2ipQK1ErUitOK08rxivHK8grPiw/LEAsPCw9LLQstSy2LCwtLS0uLSotKy2iLaMtpC0a'
+      'LhsuHC4WLhkufi+BL4Iv9i/5L/ov9C/1L2wwbTBuMOQw5TDmMOIw4zBaMVsxXDHSMdMx'
+      '1DHQMdExSDJJMkoywDLBMsIyvjK/MjYzNzM4M64zrzOwM6wzrTMkNCU0JjScNJ00njSa'
+      'NJs0EjUTNRQ1ijWLNYw1iDWJNQA2ATYCNng2eTZ6NnY2dzbuNu828DZmN2c3aDcDNgQ2'
+      'ezZ8Nn028zb0NvU2FTUWNY01jjWPNQU2BjYHNic0KDSfNKA0oTQXNRg1GTU5MzozsTOy'
+      'M7MzKTQqNCs0SzJMMsMyxDLFMjszPDM9M10xXjHVMdYx2TFNMk4yUTJxMHIw6TDqMOsw'
+      'YTFiMWMxgy+EL/sv/C/9L3MwdDB1MKUtpi0dLh4uHy6FL4Yvhy+3LLgsLy0wLTEtpy2o'
+      'LaktySvKK0EsQixDLLksuiy7LNsq3CpTK1QrVSvLK8wrzSvtKe4pZSpmKmcq3SreKt8q'
+      '/ygAKXcpeCl5Ke8p8CnxKREoEiiJKIoojSgBKQIpBSklJyYnnSeeJ58nFSgWKBcoNyY4'
+      'Jq8msCaxJicnKCcpJ1kkWiTRJNIk0yQ5JjomOyZrI2wj4yPkI+UjWyRcJF0kfSJ+IvUi'
+      '9iL3Im0jbiNvI48hkCEHIggiCSJ/IoAigSKhIKIgGSEaIRshkSGSIZMhsx+0HysgLCAt'
+      'IKMgpCClIMUexh49Hz4fQR+1H7YfuR/ZHdodUR5SHlMeyR7KHsse6xzsHGMdZB1lHdsd'
+      '3B3dHQ0bDhuFG4YbhxvtHO4c7xwfGiAalxqYGpkaDxsQGxEbMRkyGakZqhmrGSEaIhoj'
+      'GkMYRBi7GLwYvRgzGTQZNRlVF1YXzRfOF88XRRhGGEcYZxZoFt8W4BbhFlcXWBdZF3kV'
+      'ehXxFfIV9RVpFmoWbRaNFI4UBRUGFQcVfRV+FX8VnxOgExcUGBQZFI8UkBSRFMERwhE5'
+      'EjoSOxKhE6IToxPTENQQSxFMEU0RwxHEEcUR5Q/mD10QXhBfENUQ1hDXEPcO+A5vD3AP'
+      'cQ/nD+gP6Q8JDgoOgQ6CDoMO+Q76DvsOGw0cDZMNlA2VDQsODA4NDoQOhQ78Dv0O/g50'
+      'D3UPdg9yD3MP6g/rD+wPYhBjEGQQYBBhENgQ2RDaEFARURFSEU4RTxHGEccRyBE+Ej8S'
+      'QBI8Ej0SpBOlE6YTHBQdFB4UGhQbFJIUkxSUFAoVCxUMFQgVCRWAFYEVghX4FfkV+hX2'
+      'FfcVbhZvFnAW5hbnFugW4hblFloXXRdeF9IX1RfWF9AX0RdIGEkYShjAGMEYwhi+GL8Y'
+      'Nhk3GTgZrhmvGbAZrBmtGSQaJRomGpwanRqeGpoamxoSGxMbFBuKG4sbjBuIG4kb8Bzx'
+      'HPIcaB1pHWodZh1nHd4d3x3gHVYeVx5YHlQeVR7MHs0ezh5EH0UfRh9CH0Mfuh+7H7wf'
+      'MiAzIDQgLiAxIKYgqSCqIB4hISEiIRwhHSGUIZUhliEMIg0iDiIKIgsigiKDIoQi+iL7'
+      'Ivwi+CL5InAjcSNyI+gj6SPqI+Yj5yNeJF8kYCTWJNck2CTUJNUkPCY9Jj4mtCa1JrYm'
+      'siazJionKycsJ6InoyekJ6AnoScYKBkoGiiQKJEokiiOKI8oBikHKQgpfil/KYApeil9'
+      'KfIp9Sn2KWoqbSpuKmgqaSrgKuEq4ipYK1krWitWK1crzivPK9ArRixHLEgsRCxFLLws'
+      'vSy+LDQtNS02LTItMy2qLastrC0iLiMuJC4gLiEuiC+JL4ovADABMAIw/i//L3YwdzB4'
+      'MO4w7zDwMOww7TBkMWUxZjHcMd0x3jHaMdsxUjJTMlQyyjLLMswyxjLJMj4zQTNCM7Yz'
+      'uTO6M7QztTMsNC00LjSkNKU0pjSiNKM0GjUbNRw1kjWTNZQ1kDWRNQg2CTYKNoA2gTaC'
+      'Nn42fzb2Nvc2+DZuN283cDcLNgw2gzaENoU2+zb8Nv02HTUeNZU1ljWZNQ02DjYRNjE0'
+      'MjSpNKo0qzQhNSI1IzVDM0QzuzO8M70zMzQ0NDU0VTJWMs0yzjLPMkUzRjNHM2cxaDHf'
+      'MeAx4TFXMlgyWTJ5MHow8TDyMPMwaTFqMWsxiy+MLwMwBDAFMHswfDB9MK0tri0lLiYu'
+      'Jy6NL44vjy+/LMAsNy04LTktry2wLbEt0SvSK0ksSixNLMEswizFLOUq5ipdK14rXyvV'
+      'K9Yr1yv3KfgpbypwKnEq5yroKukqCSkKKYEpgimDKfkp+in7KRsoHCiTKJQolSgLKQwp'
+      'DSktJy4npSemJ6cnHSgeKB8oPyZAJrcmuCa5Ji8nMCcxJ2EkYiTZJNok2yRBJkImQyZz'
+      'I3Qj6yPsI+0jYyRkJGUkhSKGIv0i/iIBI3UjdiN5I5khmiERIhIiEyKJIooiiyKrIKwg'
+      'IyEkISUhmyGcIZ0hvR++HzUgNiA3IK0griCvIM8e0B5HH0gfSR+/H8AfwR/hHeIdWR5a'
+      'Hlse0R7SHtMe8xz0HGsdbB1tHeMd5B3lHRUbFhuNG44bjxv1HPYc9xwnGiganxqgGqEa'
+      'FxsYGxkbORk6GbEZshm1GSkaKhotGk0YThjFGMYYxxg9GT4ZPxlfF2AX1xfYF9kXTxhQ'
+      'GFEYcRZyFukW6hbrFmEXYhdjF4MVhBX7FfwV/RVzFnQWdRaVFJYUDRUOFQ8VhRWGFYcV'
+      'pxOoEx8UIBQhFJcUmBSZFMkRyhFBEkISQxKpE6oTqxPbENwQUxFUEVURyxHMEc0RRBJF'
+      'EqwTrROuEyQUJRQmFCIUIxSaFJsUnBQSFRMVFBUQFREViBWJFYoVABYBFgIW/hX/FXYW'
+      'dxZ4Fu4W7xbwFuwW7RZkF2UXZhfcF90X3hfaF9sXUhhTGFQYyhjLGMwYyBjJGEAZQRlC'
+      'GbgZuRm6GbYZtxkuGi8aMBqmGqcaqBqiGqUaGhsdGx4bkhuVG5YbkBuRG/gc+Rz6HHAd'
+      'cR1yHW4dbx3mHecd6B1eHl8eYB5cHl0e1B7VHtYeTB9NH04fSh9LH8Ifwx/EHzogOyA8'
+      'IDggOSCwILEgsiAoISkhKiEmISchniGfIaAhFiIXIhgiFCIVIowijSKOIgQjBSMGIwIj'
+      'AyN6I3sjfCPyI/Mj9CPuI/EjZiRpJGok3iThJOIk3CTdJEQmRSZGJrwmvSa+JromuyYy'
+      'JzMnNCeqJ6snrCeoJ6knICghKCIomCiZKJooliiXKA4pDykQKYYphymIKYQphSn8Kf0p'
+      '/il0KnUqdipyKnMq6irrKuwqYitjK2QrYCthK9gr2SvaK1AsUSxSLE4sTyzGLMcsyCw+'
+      'LT8tQC06LT0tsi21LbYtKi4tLi4uKC4pLpAvkS+SLwgwCTAKMAYwBzB+MH8wgDD2MPcw'
+      '+DD0MPUwbDFtMW4x5DHlMeYx4jHjMVoyWzJcMtIy0zLUMtAy0TJIM0kzSjPAM8EzwjO+'
+      'M78zNjQ3NDg0rjSvNLA0rDStNCQ1JTUmNZw1nTWeNZo1mzUSNhM2FDaKNos2jDaGNok2'
+      '/jYBNwI3djd5N3o3FTYWNo02jjaPNgU3BjcHNyc1KDWfNaA1oTUXNhg2GTY5NDo0sTSy'
+      'NLM0KTUqNSs1SzNMM8MzxDPFMzs0PDQ9NF0yXjLVMtYy1zJNM04zTzNvMXAx5zHoMekx'
+      'XzJgMmEygTCCMPkw+jD9MHExcjF1MZUvli8NMA4wDzCFMIYwhzC3LbgtLy4wLjEuly+Y'
+      'L5kvySzKLEEtQi1DLbktui27Ldsr3CtTLFQsVSzLLMwszSztKu4qZStmK2cr3SveK98r'
+      '/ykAKncqeCp5Ku8q8CrxKhEpEimJKYopiykBKgIqAyojKCQomyicKJ0oEykUKRUpNSc2'
+      'J60nriexJyUoJigpKEkmSibBJsImwyY5JzonOydrJGwk4yTkJOUkSyZMJk0mfSN+I/Uj'
+      '9iP3I20kbiRvJI8ikCIHIwgjCSN/I4AjgSOhIaIhGSIaIhsikSKSIpMisyC0ICshLCEt'
+      'IaMhpCGlIcUfxh89ID4gPyC1ILYgtyDXHtgeTx9QH1Efxx/IH8kf6R3qHWEeYh5lHtke'
+      '2h7dHv0c/hx1HXYddx3tHe4d7x0fGyAblxuYG5kb/xwAHQEdMRoyGqkaqhqrGiEbIhsj'
+      'G0MZRBm7GbwZvRkzGjQaNRpVGFYYzRjOGM8YRRlGGUcZZxdoF98X4BfhF1cYWBhZGHkW'
+      'ehbxFvIW8xZpF2oXaxeLFYwVAxYEFgUWexZ8Fn0W9Bb1FmwXbRduF+QX5RfmF+IX4xda'
+      'GFsYXBjSGNMY1BjQGNEYSBlJGUoZwBnBGcIZvhm/GTYaNxo4Gq4arxqwGqwarRokGyUb'
+      'JhucG50bnhuaG5sbAh0DHQQdeh17HXwdeB15HfAd8R3yHWgeaR5qHmYeZx7eHt8e4B5W'
+      'H1cfWB9SH1Ufyh/NH84fQiBFIEYgQCBBILgguSC6IDAhMSEyIS4hLyGmIachqCEeIh8i'
+      'ICIcIh0ilCKVIpYiDCMNIw4jCiMLI4IjgyOEI/oj+yP8I/gj+SNwJHEkciToJOkk6iTm'
+      'JOckTiZPJlAmxibHJsgmxCbFJjwnPSc+J7QntSe2J7InsycqKCsoLCiiKKMopCieKKEo'
+      'FikZKRopjimRKZIpjCmNKQQqBSoGKnwqfSp+KnoqeyryKvMq9CpqK2srbCtoK2kr4Cvh'
+      'K+IrWCxZLFosVixXLM4szyzQLEYtRy1ILUQtRS28Lb0tvi00LjUuNi4yLjMumi+bL5wv'
+      'EjATMBQwEDARMIgwiTCKMAAxATECMf4w/zB2MXcxeDHuMe8x8DHqMe0xYjJlMmYy2jLd'
+      'Mt4y2DLZMlAzUTNSM8gzyTPKM8YzxzM+ND80QDS2NLc0uDS0NLU0LDUtNS41pDWlNaY1'
+      'ojWjNRo2GzYcNpI2kzaUNpA2kTYINwk3CjeAN4E3gjcdNh42lTaWNpc2DTcONw83LzUw'
+      'Nac1qDWpNR82IDYhNkE0QjS5NLo0vTQxNTI1NTVVM1YzzTPOM88zRTRGNEc0ZzJoMt8y'
+      '4DLhMlczWDNZM3kxejHxMfIx8zFpMmoyazKLMIwwAzEEMQUxezF8MX0xnS+eLxUwFjAX'
+      'MI0wjjCPML8twC03LjguOS6fL6AvoS/RLNIsSS1KLUstwS3CLcMt4yvkK1ssXCxdLNMs'
+      '1CzVLPUq9iptK24rcSvlK+Yr6SsJKgoqgSqCKoMq+Sr6KvsqGykcKZMplCmVKQsqDCoN'
+      'Ki0oLiilKKYopygdKR4pHyk/J0Antye4J7knLygwKDEoUSZSJskmyibLJkEnQidDJ3Mk'
+      'dCTrJOwk7SRTJlQmVSaFI4Yj/SP+I/8jdSR2JHcklyKYIg8jECMRI4cjiCOJI6khqiEh'
+      'IiIiJSKZIpoinSK9IL4gNSE2ITchrSGuIa8hzx/QH0cgSCBJIL8gwCDBIOEe4h5ZH1of'
+      'Wx/RH9If0x/zHfQdax5sHm0e4x7kHuUeBR0GHX0dfh1/HfUd9h33HScbKBufG6AboRsH'
+      'HQgdCR05GjoasRqyGrMaKRsqGysbSxlMGcMZxBnFGTsaPBo9GrQatRosGy0bLhukG6Ub'
+      'phuiG6MbCh0LHQwdgh2DHYQdgB2BHfgd+R36HXAecR5yHm4ebx7mHuce6B5eH18fYB9c'
+      'H10f1B/VH9YfTCBNIE4gSiBLIMIgwyDEIDohOyE8ITghOSGwIbEhsiEoIikiKiImIici'
+      'niKfIqAiFiMXIxgjEiMVI4ojjSOOIwIkBSQGJAAkASR4JHkkeiTwJPEk8iTuJO8kViZX'
+      'JlgmzibPJtAmzCbNJkQnRSdGJ7wnvSe+J7onuycyKDMoNCiqKKsorCioKKkoICkhKSIp'
+      'mCmZKZoplimXKQ4qDyoQKoYqhyqIKoQqhSr8Kv0q/ip0K3UrdityK3Mr6ivrK+wrYixj'
+      'LGQsXixhLNYs2SzaLE4tUS1SLUwtTS3ELcUtxi08Lj0uPi46Ljsuoi+jL6QvGjAbMBww'
+      'GDAZMJAwkTCSMAgxCTEKMQYxBzF+MX8xgDH2Mfcx+DH0MfUxbDJtMm4y5DLlMuYy4jLj'
+      'MlozWzNcM9Iz0zPUM9Az0TNINEk0SjTANME0wjS+NL80NjU3NTg1rjWvNbA1qjWtNSI2'
+      'JTYmNpo2nTaeNpg2mTYQNxE3EjeIN4k3ijcnNig2nzagNqE2FzcYNxk3OTU6NbE1sjWz'
+      'NSk2KjYrNks0TDTDNMQ0xTQ7NTw1PTVdM14z1TPWM9czTTRONE80bzJwMucy6DLpMl8z'
+      'YDNhM4ExgjH5Mfox+zFxMnIyczKTMJQwCzEMMQ0xgzGEMYUxpS+mLx0wHjAhMJUwljCZ'
+      'MMktyi1BLkIuQy6pL6ovqy/bLNwsUy1ULVUtyy3MLc0t7SvuK2UsZixnLN0s3izfLP8q'
+      'ACt3K3greSvvK/Ar8SsRKhIqiSqKKosqASsCKwMrIykkKZspnCmdKRMqFCoVKjUoNiit'
+      'KK4oryglKSYpJylHJ0gnvyfAJ8EnNyg4KDkoWSZaJtEm0ibVJkknSidNJ30kfiT1JPYk'
+      '9yRdJl4mXyaPI5AjByQIJAkkfySAJIEkoSKiIhkjGiMbI5EjkiOTI7MhtCErIiwiLSKj'
+      'IqQipSLFIMYgPSE+IT8htSG2Ibch1x/YH08gUCBRIMcgyCDJIOke6h5hH2IfYx/ZH9of'
+      '2x/7Hfwdcx50HnUe6x7sHu0eZB9lH9wf3R/eH1QgVSBWIFIgUyDKIMsgzCBCIUMhRCFA'
+      'IUEhuCG5IbohMCIxIjIiLiIvIqYipyKoIh4jHyMgIxwjHSOUI5UjliMMJA0kDiQKJAsk'
+      'giSDJIQk+iT7JPwk+CT5JGAmYSZiJtgm2SbaJtYm1yZOJ08nUCfGJ8cnyCfCJ8UnOig9'
+      'KD4osii1KLYosCixKCgpKSkqKaApoSmiKZ4pnykWKhcqGCqOKo8qkCqMKo0qBCsFKwYr'
+      'fCt9K34reit7K/Ir8yv0K2osayxsLGgsaSzgLOEs4ixYLVktWi1WLVctzi3PLdAtRi5H'
+      'LkguRC5FLqwvrS+uLyQwJTAmMCIwIzCaMJswnDASMRMxFDEOMRExhjGJMYox/jEBMgIy'
+      '/DH9MXQydTJ2Muwy7TLuMuoy6zJiM2MzZDPaM9sz3DPYM9kzUDRRNFI0yDTJNMo0xjTH'
+      'ND41PzVANbY1tzW4NbQ1tTUsNi02LjakNqU2pjaiNqM2GjcbNxw3kjeTN5Q3LzYwNqc2'
+      'qDapNh83IDchN0E1QjW5Nbo1uzUxNjI2MzZTNFQ0yzTMNM00QzVENUU1ZTNmM90z3jPh'
+      'M1U0VjRZNHkyejLxMvIy8zJpM2ozazOLMYwxAzIEMgUyezJ8Mn0ynTCeMBUxFjEXMY0x'
+      'jjGPMa8vsC8nMCgwKTCfMKAwoTDRLdItSS5KLksusS+yL7Mv4yzkLFstXC1dLdMt1C3V'
+      'LfUr9ittLG4sbyzlLOYs5ywHKwgrfyuAK4Er9yv4K/krGSoaKpEqkiqVKgkrCisNKy0p'
+      'LimlKaYppykdKh4qHyo/KEAotyi4KLkoLykwKTEpUSdSJ8knyifLJ0EoQihDKGMmZCbb'
+      'Jtwm3SZTJ1QnVSeFJIYk/ST+JP8kZSZmJmcmlyOYIw8kECQRJIckiCSJJKkiqiIhIyIj'
+      'IyOZI5ojmyO7IbwhMyI0IjUiqyKsIq0iJCMlI5wjnSOeIxQkFSQWJBIkEySKJIskjCQC'
+      'JQMlBCUAJQElaCZpJmom4CbhJuIm3ibfJlYnVydYJ84nzyfQJ8wnzSdEKEUoRii8KL0o'
+      'vii6KLsoMikzKTQpqimrKawpqCmpKSAqISoiKpgqmSqaKpYqlyoOKw8rECuGK4criCuC'
+      'K4Ur+iv9K/4rcix1LHYscCxxLOgs6SzqLGAtYS1iLV4tXy3WLdct2C1OLk8uUC5MLk0u'
+      'tC+1L7YvLDAtMC4wKjArMKIwozCkMBoxGzEcMRgxGTGQMZExkjEIMgkyCjIGMgcyfjJ/'
+      'MoAy9jL3Mvgy9DL1MmwzbTNuM+Qz5TPmM+Iz4zNaNFs0XDTSNNM01DTONNE0RjVJNUo1'
+      'vjXBNcI1vDW9NTQ2NTY2Nqw2rTauNqo2qzYiNyM3JDeaN5s3nDc5Njo2sTayNrM2KTcq'
+      'Nys3SzVMNcM1xDXFNTs2PDY9Nl00XjTVNNY01zRNNU41TzVvM3Az5zPoM+kzXzRgNGE0'
+      'gTKCMvky+jL7MnEzcjNzM5MxlDELMgwyDTKDMoQyhTKlMKYwHTEeMR8xlTGWMZcxty+4'
+      'Ly8wMDAxMKcwqDCpMNkt2i1RLlIuVS65L7ovvS/tLO4sZS1mLWct3S3eLd8t/ysALHcs'
+      'eCx5LO8s8CzxLBErEiuJK4oriysBLAIsAywjKiQqmyqcKp0qEysUKxUrNSk2Ka0primv'
+      'KSUqJionKkcoSCi/KMAowSg3KTgpOSlZJ1on0SfSJ9MnSShKKEsoayZsJuMm5CblJlsn'
+      'XCddJ9Qn1SdMKE0oTijEKMUoxijCKMMoOik7KTwpsimzKbQpsCmxKSgqKSoqKqAqoSqi'
+      'Kp4qnyoWKxcrGCuOK48rkCuMK40rBCwFLAYsfCx9LH4seix7LPIs8yz0LGotay1sLWgt'
+      'aS3gLeEt4i1YLlkuWi5WLlcuvi+/L8AvNjA3MDgwMjA1MKowrTCuMCIxJTEmMSAxITGY'
+      'MZkxmjEQMhEyEjIOMg8yhjKHMogy/jL/MgAz/DL9MnQzdTN2M+wz7TPuM+oz6zNiNGM0'
+      'ZDTaNNs03DTYNNk0UDVRNVI1yDXJNco1xjXHNT42PzZANrY2tza4NrQ2tTYsNy03Ljek'
+      'N6U3pjdBNkI2uTa6Nrs2MTcyNzM3UzVUNcs1zDXNNUM2RDZFNmU0ZjTdNN403zRVNVY1'
+      'VzV3M3gz7zPwM/EzZzRoNGk0iTKKMgEzAjMFM3kzejN9M50xnjEVMhYyFzKNMo4yjzKv'
+      'MLAwJzEoMSkxnzGgMaExwS/CLzkwOjA7MLEwsjCzMOMt5C1bLlwuXS7DL8QvxS/1LPYs'
+      'bS1uLW8t5S3mLectBywILH8sgCyBLPcs+Cz5LBkrGiuRK5IrkysJLAosCywrKiwqoyqk'
+      'KqUqGyscKx0rlCuVKwwsDSwOLIQshSyGLIIsgyz6LPss/CxyLXMtdC1wLXEt6C3pLeot'
+      'YC5hLmIuXi5fLsYvxy/ILz4wPzBAMDwwPTC0MLUwtjAsMS0xLjEqMSsxojGjMaQxGjIb'
+      'MhwyGDIZMpAykTKSMggzCTMKMwYzBzN+M38zgDP2M/cz+DPyM/UzajRtNG404jTlNOY0'
+      '4DThNFg1WTVaNdA10TXSNc41zzVGNkc2SDa+Nr82wDa8Nr02NDc1NzY3rDetN643STZK'
+      'NsE2wjbFNjk3Ojc9N101XjXVNdY11zVNNk42TzZvNHA05zToNOk0XzVgNWE1gTOCM/kz'
+      '+jP7M3E0cjRzNJMylDILMwwzDTODM4QzhTOlMaYxHTIeMh8ylTKWMpcytzC4MC8xMDEx'
+      'MacxqDGpMckvyi9BMEIwQzC5MLowuzDrLewtYy5kLmUuyy/ML80vRDBFMLwwvTC+MDQx'
+      'NTE2MTIxMzGqMasxrDEiMiMyJDIgMiEymDKZMpoyEDMRMxIzDjMPM4YzhzOIM/4z/zMA'
+      'NPwz/TN0NHU0djTsNO007jTqNOs0YjVjNWQ12jXbNdw12DXZNVA2UTZSNsg2yTbKNsY2'
+      'xzY+Nz83QDe2N7c3uDdTNlQ2yzbMNs02QzdEN0U3ZTVmNd013jXfNVU2VjZXNnc0eDTv'
+      'NPA08TRnNWg1aTWJM4ozATQCNAM0eTR6NHs0mzKcMhMzFDMVM4szjDONMwQ0BTR8NH00'
+      'fjT0NPU09jTyNPM0ajVrNWw14jXjNeQ14DXhNVg2WTZaNtA20TbSNs42zzZGN0c3SDe+'
+      'N783wDdbNlw20zbUNtU2SzdMN003');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement132x132 = _unpackUint16(
+      'DQIOApECkgIRAhUDFgOVAoUAhgAJAQoBCwGNAY4BjwGHQohCC0MMQw1DhwCIAIkADkMP'
+      'Q4oAiwCMAA4BDwEQAQwBDQGQAZEBkgEUAhUCFgISAhMClgKXApgCGgMbAxwDmgMZAx4E'
+      'nQOeA6IEIQQiBC0GLgaxBrIGMQY1BzYHtQalBKYEKQUqBSsFrQWuBa8FnwOgAyMEJAQl'
+      'BKcEqASpBJkCmgIdAx4DHwOhA6IDowOTAZQBFwIYAhkCmwKcAp0CjQCOABEBEgETAZUB'
+      'lgGXAY9CkEITQxRDFUOPAJAAkQAWQxdDkgCTAJQAFgEXARgBFAEVAZgBmQGaARwCHQIe'
+      'AhoCGwKeAp8CoAIiAyMDJAMgAyEDpAOlA6YDKAQpBCoEJgQnBKoEqwSsBC4FLwUwBSwF'
+      'LQWwBbEFsgU0BjUGNgYyBjMGtga3BrgGOgc7BzwHugc5Bz4IvQe+B8IIQQhCCE0KTgrR'
+      'CtIKUQpdDF4M3QvFCMYISQlKCUsJzQnOCc8JvwfAB0MIRAhFCMcIyAjJCLkGugY9Bz4H'
+      'PwfBB8IHwwezBbQFNwY4BjkGuwa8Br0GrQSuBDEFMgUzBbUFtgW3BacDqAMrBCwELQSv'
+      'BLAEsQShAqICJQMmAycDqQOqA6sDmwGcAR8CIAIhAqMCpAKlApUAlgAZARoBGwGdAZ4B'
+      'nwGXQphCG0McQx9DlwCYAJsAIEMhQ5wAnQCeACABIQEiARwBHwGgAaMBpAEkAicCKAIi'
+      'AiMCpgKnAqgCKgMrAywDKAMpA6wDrQOuAzAEMQQyBC4ELwSyBLMEtAQ2BTcFOAU0BTUF'
+      'uAW5BboFPAY9Bj4GOgY7Br4GvwbABkIHQwdEB0AHQQfEB8UHxgdICEkISghGCEcIygjL'
+      'CMwITglPCVAJTAlNCdAJ0QnSCVQKVQpWClIKUwreC98L4AtiDGMMZAziDGEMZg3lDOYM'
+      '6g1pDWoNdQ92D/kP+g95D30QfhD9D+0N7g1xDnIOcw71DvYO9w7nDOgMaw1sDW0N7w3w'
+      'DfEN4QviC2UMZgxnDOkM6gzrDNMJ1AlXClgKWQrjC+QL5QvNCM4IUQlSCVMJ1QnWCdcJ'
+      'xwfIB0sITAhNCM8I0AjRCMEGwgZFB0YHRwfJB8oHywe7BbwFPwZABkEGwwbEBsUGtQS2'
+      'BDkFOgU7Bb0FvgW/Ba8DsAMzBDQENwS3BLgEuwSrAqwCLwMwAzEDswO0A7UDpQGmASkC'
+      'KgIrAq0CrgKvAp8AoAAjASQBJQGnAagBqQGhQqJCJUMmQydDoQCiAKMAKEMpQ6QApQCm'
+      'ACgBKQEqASYBJwGqAasBrAEuAi8CMAIsAi0CsAKxArICNAM1AzYDMgMzA7YDtwO4AzoE'
+      'OwQ8BDgEOQS8BL0EvgRABUEFQgU8BT8FwAXDBcQFRAZHBkgGQgZDBsYGxwbIBkoHSwdM'
+      'B0gHSQfMB80HzgdQCFEIUghOCE8I0gjTCNQIVglXCVgJVAlVCdgJ2QnaCVwKXQpeCloK'
+      'WwrmC+cL6AtqDGsMbAxoDGkM7AztDO4McA1xDXINbg1vDfIN8w30DXYOdw54DnQOdQ74'
+      'DvkO+g58D30Pfg96D3sP/g//DwAQghCDEIQQAhGBEIYRBREGEQoSiRGKEZUTlhMZFBoU'
+      'mROdFJ4UHRQNEg4SkRKSEpMSFRMWExcTBxEIEYsRjBGNEQ8SEBIREgEQAhCFEIYQhxAJ'
+      'EQoRCxH7DvwOfw+AD4EPAxAEEAUQ9Q32DXkOeg57Dv0O/g7/Du8M8AxzDXQNdQ33DfgN'
+      '+Q3pC+oLbQxuDG8M8QzyDPMM2wncCV8KYAphCusL7AvtC9UI1ghZCVoJWwndCd4J3wnP'
+      'B9AHUwhUCFcI1wjYCNsIywbMBk8HUAdRB9MH1AfVB8UFxgVJBkoGSwbNBs4Gzwa/BMAE'
+      'QwVEBUUFxwXIBckFuQO6Az0EPgQ/BMEEwgTDBLMCtAI3AzgDOQO7A7wDvQOtAa4BMQIy'
+      'AjMCtQK2ArcCpwCoACsBLAEtAa8BsAGxAalCqkItQy5DL0OpAKoAqwAwQzFDrACtAK4A'
+      'MAExATIBLgEvAbIBswG0ATYCNwI4AjQCNQK4ArkCugI8Az0DPgM6AzsDvgO/A8ADQgRD'
+      'BEQEQARBBMQExQTGBEgFSQVKBUYFRwXKBcsFzAVOBk8GUAZMBk0G0AbRBtIGVAdVB1YH'
+      'UgdTB9YH1wfYB1oIWwhcCFgIWQjcCN0I3ghgCWEJYglcCV8J4AnjCeQJZApnCmgKYgpj'
+      'Cu4L7wvwC3IMcwx0DHAMcQz0DPUM9gx4DXkNeg12DXcN+g37DfwNfg5/DoAOfA59DgAP'
+      'AQ8CD4QPhQ+GD4IPgw8GEAcQCBCKEIsQjBCIEIkQDBENEQ4RkBGREZIRjhGPERISExIU'
+      'EpYSlxKYEpQSlRIYExkTGhOcE50TnhOaE5sTHhQfFCAUohSjFKQUIhWhFKYVJRUmFSoW'
+      'qRWqFb0YvhhBGUIZwRjFGcYZRRk1FzYXuRe6F7sXPRg+GD8YJxUoFasVrBWtFTcXOBc5'
+      'FyEUIhSlFKYUpxQpFSoVKxUbExwTnxOgE6ETIxQkFCUUFRIWEpkSmhKbEh0THhMfEw8R'
+      'EBGTEZQRlREXEhgSGRIJEAoQjRCOEI8QERESERMRAw8ED4cPiA+JDwsQDBANEP0N/g2B'
+      'DoIOgw4FDwYPBw/3DPgMew18DX8N/w0ADgMO8wv0C3cMeAx5DPsM/Az9DOUJ5glpCmoK'
+      'awr1C/YL9wvfCOAIYwlkCWUJ5wnoCekJ2QfaB10IXghfCOEI4gjjCNMG1AZXB1gHWQfb'
+      'B9wH3QfNBc4FUQZSBlMG1QbWBtcGxwTIBEsFTAVNBc8F0AXRBcEDwgNFBEYERwTJBMoE'
+      'ywS7ArwCPwNAA0EDwwPEA8UDtQG2ATkCOgI9Ar0CvgLBArEAsgA1ATYBNwG5AboBuwGz'
+      'QrRCN0M4QzlDswC0ALUAOkM7Q7YAtwC4ADoBOwE8ATgBOQG8Ab0BvgFAAkECQgI+Aj8C'
+      'wgLDAsQCRgNHA0gDQgNFA8YDyQPKA0oETQROBEgESQTMBM0EzgRQBVEFUgVOBU8F0gXT'
+      'BdQFVgZXBlgGVAZVBtgG2QbaBlwHXQdeB1oHWwfeB98H4AdiCGMIZAhgCGEI5AjlCOYI'
+      'aAlpCWoJZglnCeoJ6wnsCW4KbwpwCmwKbQr4C/kL+gt8DH0Mfgx6DHsM/gz/DAANgg2D'
+      'DYQNgA2BDQQOBQ4GDogOiQ6KDoQOhw4IDwsPDA+MD48PkA+KD4sPDhAPEBAQkhCTEJQQ'
+      'kBCREBQRFREWEZgRmRGaEZYRlxEaEhsSHBKeEp8SoBKcEp0SIBMhEyITpBOlE6YTohOj'
+      'EyYUJxQoFKoUqxSsFKgUqRQsFS0VLhWwFbEVshWuFa8VOhc7FzwXvhe/F8AXvBe9F0AY'
+      'QRhCGMQYxRjGGMIYwxhGGUcZSBnKGcsZzBlKGskZzhpNGk4aUhvRGtIa3RzeHGEdYh3h'
+      'HOUd5h1lHVUbVhvZG9ob2xtdHF4cXxxPGlAa0xrUGtUaVxtYG1kbSRlKGc0ZzhnPGVEa'
+      'UhpTGkMYRBjHGMgYyRhLGUwZTRk9Fz4XwRfCF8MXRRhGGEcYLxUwFbMVtBW1FT8XQBdB'
+      'FykUKhStFK4UrxQxFTIVMxUjEyQTpxOoE6kTKxQsFC0UHRIeEqESohKjEiUTJhMnExcR'
+      'GBGbEZwRnxEfEiASIxITEBQQlxCYEJkQGxEcER0RDQ8OD5EPkg+TDxUQFhAXEAcOCA6L'
+      'DowOjQ4PDxAPEQ8BDQINhQ2GDYcNCQ4KDgsO+wv8C38MgAyBDAMNBA0FDe0J7glxCnIK'
+      'cwr9C/4L/wvnCOgIawlsCW0J7wnwCfEJ4QfiB2UIZghnCOkI6gjrCNsG3AZfB2AHYQfj'
+      'B+QH5QfVBdYFWQZaBl0G3QbeBuEG0QTSBFUFVgVXBdkF2gXbBcsDzANPBFAEUQTTBNQE'
+      '1QTFAsYCSQNKA0sDzQPOA88DvwHAAUMCRAJFAscCyALJArkAugA9AT4BPwHBAcIBwwG7'
+      'QrxCP0NAQ0FDuwC8AL0AQkNDQ74AvwDAAEIBQwFEAUABQQHEAcUBxgFIAkkCSgJGAkcC'
+      'ygLLAswCTgNPA1ADTANNA9AD0QPSA1QEVQRWBFIEUwTWBNcE2ARaBVsFXAVYBVkF3AXd'
+      'Bd4FYAZhBmIGXgZfBuIG4wbkBmYHZwdoB2IHZQfmB+kH6gdqCG0IbghoCGkI7AjtCO4I'
+      'cAlxCXIJbglvCfIJ8wn0CXYKdwp4CnQKdQoADAEMAgyEDIUMhgyCDIMMBg0HDQgNig2L'
+      'DYwNiA2JDQwODQ4ODpAOkQ6SDo4Ojw4SDxMPFA+WD5cPmA+UD5UPGBAZEBoQnBCdEJ4Q'
+      'mhCbEB4RHxEgEaIRoxGkEaARoREkEiUSJhKoEqkSqhKkEqcSKBMrEywTrBOvE7ATqhOr'
+      'Ey4ULxQwFLIUsxS0FLAUsRQ0FTUVNhW4FbkVuhW2FbcVQhdDF0QXxhfHF8gXxBfFF0gY'
+      'SRhKGMwYzRjOGMoYyxhOGU8ZUBnSGdMZ1BnQGdEZVBpVGlYa2BrZGtoa1hrXGlobWxtc'
+      'G94b3xvgG9wb3RtgHGEcYhzkHOUc5hziHOMcZh1nHWgd6h3rHewdah7pHe4ebR5uHnIf'
+      '8R7yHv0g/iCBIYIhASENIw4jjSJ1H3Yf+R/6H/sffSB+IH8gbx5wHvMe9B71HncfeB95'
+      'H2kdah3tHe4d7x1xHnIecx5jHGQc5xzoHOkcax1sHW0dXRteG+Eb4hvjG2UcZhxnHFca'
+      'WBrbGtwa3RpfG2AbYRtRGVIZ1RnWGdcZWRpaGlsaSxhMGM8Y0BjRGFMZVBlVGUUXRhfJ'
+      'F8oXyxdNGE4YTxg3FTgVuxW8Fb8VRxdIF0sXMxQ0FLcUuBS5FDsVPBU9FS0TLhOxE7IT'
+      'sxM1FDYUNxQnEigSqxKsEq0SLxMwEzETIREiEaURphGnESkSKhIrEhsQHBCfEKAQoRAj'
+      'ESQRJREVDxYPmQ+aD5sPHRAeEB8QDw4QDpMOlA6VDhcPGA8ZDwkNCg2NDY4Njw0RDhIO'
+      'Ew4DDAQMhwyIDIkMCw0MDQ0N9Qn2CXkKegp9CgUMBgwJDPEI8gh1CXYJdwn5CfoJ+wnr'
+      'B+wHbwhwCHEI8wj0CPUI5QbmBmkHagdrB+0H7gfvB98F4AVjBmQGZQbnBugG6QbZBNoE'
+      'XQVeBV8F4QXiBeMF0wPUA1cEWARZBNsE3ATdBM0CzgJRA1IDUwPVA9YD1wPHAcgBSwJM'
+      'Ak0CzwLQAtECwQDCAEUBRgFHAckBygHLAcNCxEJHQ0hDS0PDAMQAxwBMQ01DyADJAMoA'
+      'TAFNAU4BSAFLAcwBzwHQAVACUwJUAk4CTwLSAtMC1AJWA1cDWANUA1UD2APZA9oDXARd'
+      'BF4EWgRbBN4E3wTgBGIFYwVkBWAFYQXkBeUF5gVoBmkGagZmBmcG6gbrBuwGbgdvB3AH'
+      'bAdtB/AH8QfyB3QIdQh2CHIIcwj2CPcI+Ah6CXsJfAl4CXkJ/An9Cf4JgAqBCoIKfgp/'
+      'CgoMCwwMDI4MjwyQDIoMjQwODRENEg2SDZUNlg2QDZENFA4VDhYOmA6ZDpoOlg6XDhoP'
+      'Gw8cD54Pnw+gD5wPnQ8gECEQIhCkEKUQphCiEKMQJhEnESgRqhGrEawRqBGpESwSLRIu'
+      'ErASsRKyEq4SrxIyEzMTNBO2E7cTuBO0E7UTOBQ5FDoUvBS9FL4UuhS7FD4VPxVAFcIV'
+      'wxXEFcAVwRVMF00XThfQF9EX0hfMF88XUBhTGFQY1BjXGNgY0hjTGFYZVxlYGdoZ2xnc'
+      'GdgZ2RlcGl0aXhrgGuEa4hreGt8aYhtjG2Qb5hvnG+gb5BvlG2gcaRxqHOwc7RzuHOoc'
+      '6xxuHW8dcB3yHfMd9B3wHfEddB51HnYe+B75Hvoe9h73Hnofex98H/4f/x8AIPwf/R+A'
+      'IIEggiAEIQUhBiECIQMhjiKPIpAiEiMTIxQjkiMRIxYklSOWI5okGSQaJCUmJiapJqom'
+      'KSYtJy4nrSadJJ4kISUiJSMlpSWmJacllyOYIxskHCQdJJ8koCShJJEikiIVIxYjFyOZ'
+      'I5ojmyODIIQgByEIIQkhkyKUIpUifR9+HwEgAiADIIUghiCHIHceeB77Hvwe/R5/H4Af'
+      'gR9xHXId9R32HfcdeR56HnseaxxsHO8c8BzxHHMddB11HWUbZhvpG+ob6xttHG4cbxxf'
+      'GmAa4xrkGucaZxtoG2sbWxlcGd8Z4BnhGWMaZBplGlUYVhjZGNoY2xhdGV4ZXxlPF1AX'
+      '0xfUF9UXVxhYGFkYQRVCFcUVxhXHFVEXUhdTFzsUPBS/FMAUwRRDFUQVRRU1EzYTuRO6'
+      'E7sTPRQ+FD8ULxIwErMStBK1EjcTOBM5EykRKhGtEa4RrxExEjISMxIjECQQpxCoEKkQ'
+      'KxEsES0RHQ8eD6EPog+lDyUQJhApEBkOGg6dDp4Onw4hDyIPIw8TDRQNlw2YDZkNGw4c'
+      'Dh0ODQwODJEMkgyTDBUNFg0XDf8JAAqDCoQKhQoPDBAMEQz5CPoIfQl+CX8JAQoCCgMK'
+      '8wf0B3cIeAh5CPsI/Aj9CO0G7gZxB3IHcwf1B/YH9wfnBegFawZsBm0G7wbwBvEG4QTi'
+      'BGUFZgVnBekF6gXrBdsD3ANfBGAEYwTjBOQE5wTXAtgCWwNcA10D3wPgA+ED0QHSAVUC'
+      'VgJXAtkC2gLbAssAzABPAVABUQHTAdQB1QHNQs5CUUNSQ1NDzQDOAM8AVENVQ9AA0QDS'
+      'AFQBVQFWAVIBUwHWAdcB2AFaAlsCXAJYAlkC3ALdAt4CYANhA2IDXgNfA+ID4wPkA2YE'
+      'ZwRoBGQEZQToBOkE6gRsBW0FbgVoBWsF7AXvBfAFcAZzBnQGbgZvBvIG8wb0BnYHdwd4'
+      'B3QHdQf4B/kH+gd8CH0Ifgh6CHsI/gj/CAAJggmDCYQJgAmBCQQKBQoGCogKiQqKCoYK'
+      'hwoSDBMMFAyWDJcMmAyUDJUMGA0ZDRoNnA2dDZ4Nmg2bDR4OHw4gDqIOow6kDqAOoQ4k'
+      'DyUPJg+oD6kPqg+mD6cPKhArECwQrhCvELAQqhCtEC4RMREyEbIRtRG2EbARsRE0EjUS'
+      'NhK4ErkSuhK2ErcSOhM7EzwTvhO/E8ATvBO9E0AUQRRCFMQUxRTGFMIUwxRGFUcVSBXK'
+      'FcsVzBXIFckVVBdVF1YX2BfZF9oX1hfXF1oYWxhcGN4Y3xjgGNwY3RhgGWEZYhnkGeUZ'
+      '5hniGeMZZhpnGmga6hrrGuwa6BrpGmwbbRtuG/Ab8RvyG+wb7xtwHHMcdBz0HPcc+Bzy'
+      'HPMcdh13HXgd+h37Hfwd+B35HXwefR5+HgAfAR8CH/4e/x6CH4MfhB8GIAcgCCAEIAUg'
+      'iCCJIIogDCENIQ4hCiELIZYilyKYIhojGyMcIxgjGSOcI50jniMgJCEkIiQeJB8koiSj'
+      'JKQkJiUnJSglJCUlJaglqSWqJSwmLSYuJiomKyauJq8msCYyJzMnNCeyJzEnNii1J7Yn'
+      'uig5KDooRSpGKskqyipJKk0rTivNKr0ovihBKUIpQynFKcYpxym3J7gnOyg8KD0ovyjA'
+      'KMEosSayJjUnNic3J7knuie7J6slrCUvJjAmMSazJrQmtSalJKYkKSUqJSslrSWuJa8l'
+      'nyOgIyMkJCQlJKckqCSpJJkimiIdIx4jHyOhI6IjoyOLIIwgDyEQIREhmyKcIp0ihR+G'
+      'HwkgCiALII0gjiCPIH8egB4DHwQfBx+HH4gfix97HXwd/x0AHgEegx6EHoUedRx2HPkc'
+      '+hz7HH0dfh1/HW8bcBvzG/Qb9Rt3HHgceRxpGmoa7RruGu8acRtyG3MbYxlkGecZ6Bnp'
+      'GWsabBptGl0YXhjhGOIY4xhlGWYZZxlXF1gX2xfcF90XXxhgGGEYSRVKFc0VzhXPFVkX'
+      'WhdbF0MURBTHFMgUyRRLFUwVTRU9Ez4TwRPCE8UTRRRGFEkUORI6Er0SvhK/EkETQhND'
+      'EzMRNBG3EbgRuRE7EjwSPRItEC4QsRCyELMQNRE2ETcRJw8oD6sPrA+tDy8QMBAxECEO'
+      'Ig6lDqYOpw4pDyoPKw8bDRwNnw2gDaENIw4kDiUOFQwWDJkMmgybDB0NHg0fDQcKCAqL'
+      'CowKjQoXDBgMGQwBCQIJhQmGCYcJCQoKCgsK+wf8B38IgAiDCAMJBAkHCfcG+AZ7B3wH'
+      'fQf/BwAIAQjxBfIFdQZ2BncG+Qb6BvsG6wTsBG8FcAVxBfMF9AX1BeUD5gNpBGoEawTt'
+      'BO4E7wTfAuACYwNkA2UD5wPoA+kD2QHaAV0CXgJfAuEC4gLjAtMA1ABXAVgBWQHbAdwB'
+      '3QHVQtZCWUNaQ1tD1QDWANcAXENdQ9gA2QDaAFwBXQFeAVoBWwHeAd8B4AFiAmMCZAJg'
+      'AmEC5ALlAuYCaANpA2oDZgNnA+oD6wPsA24EbwRwBGwEbQTwBPEE8gR0BXUFdgVyBXMF'
+      '9gX3BfgFegZ7BnwGeAZ5BvwG/Qb+BoAHgQeCB34HfwcCCAMIBAiGCIcIiAiECIUICAkJ'
+      'CQoJjAmNCY4JiAmLCQwKDwoQCpAKkwqUCo4KjwoaDBsMHAyeDJ8MoAycDJ0MIA0hDSIN'
+      'pA2lDaYNog2jDSYOJw4oDqoOqw6sDqgOqQ4sDy0PLg+wD7EPsg+uD68PMhAzEDQQthC3'
+      'ELgQtBC1EDgRORE6EbwRvRG+EboRuxE+Ej8SQBLCEsMSxBLAEsESRBNFE0YTyBPJE8oT'
+      'xhPHE0oUSxRMFM4UzxTQFMoUzRROFVEVUhXSFdUV1hXQFdEVXBddF14X4BfhF+IX3hff'
+      'F2IYYxhkGOYY5xjoGOQY5RhoGWkZahnsGe0Z7hnqGesZbhpvGnAa8hrzGvQa8BrxGnQb'
+      'dRt2G/gb+Rv6G/Yb9xt6HHscfBz+HP8cAB38HP0cgB2BHYIdBB4FHgYeAh4DHoYehx6I'
+      'HgofCx8MHwgfCR+MH40fjh8QIBEgEiAMIA8gkCCTIJQgFCEXIRghEiETIZ4inyKgIiIj'
+      'IyMkIyAjISOkI6UjpiMoJCkkKiQmJCckqiSrJKwkLiUvJTAlLCUtJbAlsSWyJTQmNSY2'
+      'JjImMya2JrcmuCY6JzsnPCc4JzknvCe9J74nQChBKEIoPig/KMIowyjEKEYpRylIKUQp'
+      'RSnIKckpyilMKk0qTipKKksqzirPKtAqUitTK1Qr0itRK1Ys1SvWK9osWSxaLG0vbi/x'
+      'L/IvcS91MHYw9S/lLeYtaS5qLmsu7S7uLu8u1yvYK1ssXCxdLOct6C3pLdEq0ipVK1Yr'
+      'VyvZK9or2yvLKcwpTypQKlEq0yrUKtUqxSjGKEkpSilLKc0pzinPKb8nwCdDKEQoRSjH'
+      'KMgoySi5JromPSc+Jz8nwSfCJ8MnsyW0JTcmOCY5JrsmvCa9Jq0kriQxJTIlMyW1JbYl'
+      'tyWnI6gjKyQsJC8krySwJLMkoyKkIicjKCMpI6sjrCOtI5UgliAZIRohGyGlIqYipyKP'
+      'H5AfEyAUIBUglyCYIJkgiR6KHg0fDh8PH5Efkh+TH4MdhB0HHggeCR6LHowejR59HH4c'
+      'AR0CHQMdhR2GHYcddxt4G/sb/Bv9G38cgByBHHEachr1GvYa9xp5G3obextrGWwZ7xnw'
+      'GfEZcxp0GnUaZRhmGOkY6hjtGG0ZbhlxGWEXYhflF+YX5xdpGGoYaxhTFVQV1xXYFdkV'
+      'YxdkF2UXTRROFNEU0hTTFFUVVhVXFUcTSBPLE8wTzRNPFFAUURRBEkISxRLGEscSSRNK'
+      'E0sTOxE8Eb8RwBHBEUMSRBJFEjUQNhC5ELoQuxA9ET4RPxEvDzAPsw+0D7UPNxA4EDkQ'
+      'KQ4qDq0Org6vDjEPMg8zDyMNJA2nDagNqw0rDiwOLw4fDCAMowykDKUMJw0oDSkNEQoS'
+      'CpUKlgqXCiEMIgwjDAsJDAmPCZAJkQkTChQKFQoFCAYIiQiKCIsIDQkOCQ8J/wYAB4MH'
+      'hAeFBwcICAgJCPkF+gV9Bn4GfwYBBwIHAwfzBPQEdwV4BXkF+wX8Bf0F7QPuA3EEcgRz'
+      'BPUE9gT3BOcC6AJrA2wDbQPvA/AD8QPhAeIBZQJmAmkC6QLqAu0C3QDeAGEBYgFjAeUB'
+      '5gHnAd9C4EJjQ2RDZUPfAOAA4QBmQ2dD4gDjAOQAZgFnAWgBZAFlAegB6QHqAWwCbQJu'
+      'AmoCawLuAu8C8AJyA3MDdANuA3ED8gP1A/YDdgR5BHoEdAR1BPgE+QT6BHwFfQV+BXoF'
+      'ewX+Bf8FAAaCBoMGhAaABoEGBAcFBwYHiAeJB4oHhgeHBwoICwgMCI4IjwiQCIwIjQgQ'
+      'CREJEgmUCZUJlgmSCZMJFgoXChgKmgqbCpwKmAqZCiQMJQwmDKgMqQyqDKYMpwwqDSsN'
+      'LA2uDa8NsA2sDa0NMA4xDjIOtA61DrYOsA6zDjQPNw84D7gPuw+8D7YPtw86EDsQPBC+'
+      'EL8QwBC8EL0QQBFBEUIRxBHFEcYRwhHDEUYSRxJIEsoSyxLMEsgSyRJME00TThPQE9ET'
+      '0hPOE88TUhRTFFQU1hTXFNgU1BTVFFgVWRVaFdwV3RXeFdoV2xVmF2cXaBfqF+sX7Bfo'
+      'F+kXbBhtGG4Y8BjxGPIY7hjvGHIZcxl0GfYZ9xn4GfIZ9Rl2Gnkaehr6Gv0a/hr4Gvka'
+      'fBt9G34bABwBHAIc/hv/G4IcgxyEHAYdBx0IHQQdBR2IHYkdih0MHg0eDh4KHgsejh6P'
+      'HpAeEh8THxQfEB8RH5QflR+WHxggGSAaIBYgFyCaIJsgnCAeIR8hICEcIR0hqCKpIqoi'
+      'LCMtIy4jKiMrI64jryOwIzIkMyQ0JDAkMSS0JLUktiQ4JTklOiU0JTcluCW7JbwlPCY/'
+      'JkAmOiY7Jr4mvybAJkInQydEJ0AnQSfEJ8UnxidIKEkoSihGKEcoyijLKMwoTilPKVAp'
+      'TClNKdAp0SnSKVQqVSpWKlIqUyrWKtcq2CpaK1srXCtYK1kr3CvdK94rYCxhLGIsXixf'
+      'LOot6y3sLW4uby5wLmwubS7wLvEu8i50L3Uvdi9yL3Mv9i/3L/gvejB7MHww+jB5MH4x'
+      '/TD+MAIygTGCMY0zjjMRNBI0kTOVNJY0FTQFMgYyiTKKMosyDTMOMw8z/zAAMYMxhDGF'
+      'MQcyCDIJMvkv+i99MH4wfzABMQIxAzHzLvQudy94L3kv+y/8L/0v7S3uLXEuci5zLvUu'
+      '9i73Lt8r4CtjLGQsZSzvLfAt8S3ZKtoqXSteK18r4SviK+Mr0ynUKVcqWCpZKtsq3Crd'
+      'Ks0ozihRKVIpUynVKdYp1ynHJ8gnSyhMKE8ozyjQKNMowybEJkcnSCdJJ8snzCfNJ70l'
+      'viVBJkImQybFJsYmxya3JLgkOyU8JT0lvyXAJcElsSOyIzUkNiQ3JLkkuiS7JKsirCIv'
+      'IzAjMSOzI7QjtSOdIJ4gISEiISMhrSKuIq8ilx+YHxsgHCAdIJ8goCChIJEekh4VHxYf'
+      'Fx+ZH5ofmx+LHYwdDx4QHhEekx6UHpUehRyGHAkdCh0NHY0djh2RHYEbghsFHAYcBxyJ'
+      'HIocixx7Gnwa/xoAGwEbgxuEG4UbdRl2GfkZ+hn7GX0afhp/Gm8YcBjzGPQY9Rh3GXgZ'
+      'eRlpF2oX7RfuF+8XcRhyGHMYWxVcFd8V4BXhFWsXbBdtF1UUVhTZFNoU2xRdFV4VXxVP'
+      'E1AT0xPUE9UTVxRYFFkUSRJKEs0SzhLPElETUhNTE0MRRBHHEcgRyxFLEkwSTxI/EEAQ'
+      'wxDEEMUQRxFIEUkROQ86D70Pvg+/D0EQQhBDEDMONA63DrgOuQ47DzwPPQ8tDS4NsQ2y'
+      'DbMNNQ42DjcOJwwoDKsMrAytDC8NMA0xDRkKGgqdCp4KnwopDCoMKwwTCRQJlwmYCZkJ'
+      'GwocCh0KDQgOCJEIkgiTCBUJFgkXCQcHCAeLB4wHjQcPCBAIEQgBBgIGhQaGBokGCQcK'
+      'Bw0H/QT+BIEFggWDBQUGBgYHBvcD+AN7BHwEfQT/BAAFAQXxAvICdQN2A3cD+QP6A/sD'
+      '6wHsAW8CcAJxAvMC9AL1AuUA5gBpAWoBawHtAe4B7wHnQuhCa0NsQ21D5wDoAOkAbkNv'
+      'Q+oA6wDsAG4BbwFwAWwBbQHwAfEB8gF0AnUCdgJyAnMC9gL3AvgCegN7A3wDeAN5A/wD'
+      '/QP+A4AEgQSCBH4EfwQCBQMFBAWGBYcFiAWEBYUFCAYJBgoGjAaNBo4GigaLBg4HDwcQ'
+      'B5IHkweUB44HkQcSCBUIFgiWCJkImgiUCJUIGAkZCRoJnAmdCZ4JmgmbCR4KHwogCqIK'
+      'owqkCqAKoQosDC0MLgywDLEMsgyuDK8MMg0zDTQNtg23DbgNtA21DTgOOQ46DrwOvQ6+'
+      'DroOuw4+Dz8PQA/CD8MPxA/AD8EPRBBFEEYQyBDJEMoQxhDHEEoRSxFMEc4RzxHQEcwR'
+      'zRFQElESUhLUEtUS1hLQEtMSVBNXE1gT2BPbE9wT1hPXE1oUWxRcFN4U3xTgFNwU3RRg'
+      'FWEVYhXkFeUV5hXiFeMVbhdvF3AX8hfzF/QX8BfxF3QYdRh2GPgY+Rj6GPYY9xh6GXsZ'
+      'fBn+Gf8ZABr8Gf0ZgBqBGoIaBBsFGwYbAhsDG4YbhxuIGwocCxwMHAgcCRyMHI0cjhwQ'
+      'HREdEh0OHQ8dkh2THZQdFh4XHhgeEh4VHpYemR6aHhofHR8eHxgfGR+cH50fnh8gICEg'
+      'IiAeIB8goiCjIKQgJiEnISghJCElIbAisSKyIjQjNSM2IzIjMyO2I7cjuCM6JDskPCQ4'
+      'JDkkvCS9JL4kQCVBJUIlPiU/JcIlwyXEJUYmRyZIJkQmRSbIJskmyiZMJ00nTidKJ0sn'
+      'zifPJ9AnUihTKFQoUChRKNQo1SjWKFgpWSlaKVQpVynYKdsp3ClcKl8qYCpaKlsq3irf'
+      'KuAqYitjK2QrYCthK+Qr5SvmK2gsaSxqLGYsZyzyLfMt9C12LncueC50LnUu+C75Lvou'
+      'fC99L34vei97L/4v/y8AMIIwgzCEMIAwgTAEMQUxBjGIMYkxijGGMYcxCjILMgwyjjKP'
+      'MpAyjDKNMhAzETMSM5QzlTOWM5IzkzMWNBc0GDSaNJs0nDQaNZk0njUdNR41IjahNaI1'
+      'rTeuNzE4MjixN705vjk9OSU2JjapNqo2qzYtNy43LzcfNSA1ozWkNaU1JzYoNik2GTQa'
+      'NJ00njSfNCE1IjUjNRMzFDOXM5gzmTMbNBw0HTQNMg4ykTKSMpMyFTMWMxczBzEIMYsx'
+      'jDGNMQ8yEDIRMgEwAjCFMIYwhzAJMQoxCzH7Lvwufy+AL4EvAzAEMAUw9S32LXkuei57'
+      'Lv0u/i7/Lucr6CtrLGwsbyz3Lfgt+y3jKuQqZytoK2kr6yvsK+0r3SneKWEqYipjKuUq'
+      '5irnKtco2ChbKVwpXSnfKeAp4SnRJ9InVShWKFco2SjaKNsoyybMJk8nUCdRJ9Mn1CfV'
+      'J8UlxiVJJkomSybNJs4mzya/JMAkQyVEJUUlxyXIJckluSO6Iz0kPiQ/JMEkwiTDJLMi'
+      'tCI3IzgjOSO7I7wjvSOlIKYgKSEqIS0htSK2IrkioR+iHyUgJiAnIKkgqiCrIJsenB4f'
+      'HyAfIR+jH6QfpR+VHZYdGR4aHhsenR6eHp8ejxyQHBMdFB0VHZcdmB2ZHYkbihsNHA4c'
+      'DxyRHJIckxyDGoQaBxsIGwkbixuMG40bfRl+GQEaAhoDGoUahhqHGncYeBj7GPwY/Rh/'
+      'GYAZgRlxF3IX9Rf2F/cXeRh6GHsYYxVkFecV6BXrFXMXdBd3F18UYBTjFOQU5RRnFWgV'
+      'aRVZE1oT3RPeE98TYRRiFGMUUxJUEtcS2BLZElsTXBNdE00RThHREdIR0xFVElYSVxJH'
+      'EEgQyxDMEM0QTxFQEVERQQ9CD8UPxg/HD0kQShBLEDsOPA6/DsAOwQ5DD0QPRQ81DTYN'
+      'uQ26DbsNPQ4+Dj8OLwwwDLMMtAy1DDcNOA05DSEKIgqlCqYKqQoxDDIMNQwdCR4JoQmi'
+      'CaMJJQomCicKFwgYCJsInAidCB8JIAkhCREHEgeVB5YHlwcZCBoIGwgLBgwGjwaQBpEG'
+      'EwcUBxUHBQUGBYkFigWLBQ0GDgYPBv8DAASDBIQEhQQHBQgFCQX5AvoCfQN+A38DAQQC'
+      'BAME8wH0AXcCeAJ5AvsC/AL9Au0A7gBxAXIBcwH1AfYB9wHvQvBCc0N0Q3dD7wDwAPMA'
+      'eEN5Q/QA9QD2AHgBeQF6AXQBdwH4AfsB/AF8An8CgAJ6AnsC/gL/AgADggODA4QDgAOB'
+      'AwQEBQQGBIgEiQSKBIYEhwQKBQsFDAWOBY8FkAWMBY0FEAYRBhIGlAaVBpYGkgaTBhYH'
+      'FwcYB5oHmwecB5gHmQccCB0IHgigCKEIogieCJ8IIgkjCSQJpgmnCagJpAmlCSgKKQoq'
+      'CqwKrQquCqoKqwo2DDcMOAy6DLsMvAy2DLkMOg09DT4Nvg3BDcINvA29DUAOQQ5CDsQO'
+      'xQ7GDsIOww5GD0cPSA/KD8sPzA/ID8kPTBBNEE4Q0BDRENIQzhDPEFIRUxFUEdYR1xHY'
+      'EdQR1RFYElkSWhLcEt0S3hLaEtsSXhNfE2AT4hPjE+QT4BPhE2QUZRRmFOgU6RTqFOYU'
+      '5xRqFWsVbBXuFe8V8BXsFe0VeBd5F3oX/Bf9F/4X+Bf7F3wYfxiAGAAZAxkEGf4Y/xiC'
+      'GYMZhBkGGgcaCBoEGgUaiBqJGooaDBsNGw4bChsLG44bjxuQGxIcExwUHBAcERyUHJUc'
+      'lhwYHRkdGh0WHRcdmh2bHZwdHh4fHiAeHB4dHqAeoR6iHiQfJR8mHyIfIx+mH6cfqB8q'
+      'ICsgLCAoICkgrCCtIK4gMCExITIhLiEvIboiuyK8Ij4jPyNAIzojPSO+I8EjwiNCJEUk'
+      'RiRAJEEkxCTFJMYkSCVJJUolRiVHJcolyyXMJU4mTyZQJkwmTSbQJtEm0iZUJ1UnVidS'
+      'J1Mn1ifXJ9gnWihbKFwoWChZKNwo3SjeKGApYSliKV4pXyniKeMp5ClmKmcqaCpkKmUq'
+      '6CrpKuoqbCttK24raitrK+4r7yvwK3Iscyx0LHAscSz8Lf0t/i2ALoEugi58Ln8uAC8D'
+      'LwQvhC+HL4gvgi+DLwYwBzAIMIowizCMMIgwiTAMMQ0xDjGQMZExkjGOMY8xEjITMhQy'
+      'ljKXMpgylDKVMhgzGTMaM5wznTOeM5ozmzMeNB80IDSiNKM0pDSgNKE0JDUlNSY1qDWp'
+      'Nao1pjWnNSo2KzYsNq42rzawNqw2rTYwNzE3Mje0N7U3tjeyN7M3Pjk/OUA5wjnDOcQ5'
+      'QjrBOcY6RTpGOko7yTrKOtU81jxZPVo92TzdPd49XT1NO0470TvSO9M7VTxWPFc8RzpI'
+      'Oss6zDrNOk87UDtRO0E5QjnFOcY5xzlJOko6SzozNzQ3tze4N7k3QzlEOUU5LTYuNrE2'
+      'sjazNjU3Njc3Nyc1KDWrNaw1rTUvNjA2MTYhNCI0pTSmNKc0KTUqNSs1GzMcM58zoDOh'
+      'MyM0JDQlNBUyFjKZMpoymzIdMx4zHzMPMRAxkzGUMZcxFzIYMhsyCzAMMI8wkDCRMBMx'
+      'FDEVMQUvBi+JL4oviy8NMA4wDzD/LQAugy6ELoUuBy8ILwkv8SvyK3Usdix3LAEuAi4D'
+      'Lusq7CpvK3ArcSvzK/Qr9SvlKeYpaSpqKmsq7SruKu8q3yjgKGMpZCllKecp6CnpKdkn'
+      '2iddKF4oXyjhKOIo4yjTJtQmVydYJ1kn2yfcJ90nzSXOJVEmUiZVJtUm1ibZJskkyiRN'
+      'JU4lTyXRJdIl0yXDI8QjRyRIJEkkyyTMJM0kvSK+IkEjQiNDI8UjxiPHI68gsCAzITQh'
+      'NSG/IsAiwSKpH6ofLSAuIC8gsSCyILMgox6kHicfKB8pH6sfrB+tH50dnh0hHiIeIx6l'
+      'HqYepx6XHJgcGx0cHR0dnx2gHaEdkRuSGxUcFhwXHJkcmhybHIsajBoPGxAbExuTG5Qb'
+      'lxuHGYgZCxoMGg0ajxqQGpEagRiCGAUZBhkHGYkZihmLGXsXfBf/FwAYARiDGIQYhRht'
+      'FW4V8RXyFfMVfRd+F38XZxRoFOsU7BTtFG8VcBVxFWETYhPlE+YT5xNpFGoUaxRbElwS'
+      '3xLgEuESYxNkE2UTVRFWEdkR2hHbEV0SXhJfEk8QUBDTENQQ1RBXEVgRWRFJD0oPzQ/O'
+      'D9EPURBSEFUQRQ5GDskOyg7LDk0PTg9PDz8NQA3DDcQNxQ1HDkgOSQ45DDoMvQy+DL8M'
+      'QQ1CDUMNKwosCq8KsAqxCjsMPAw9DCUJJgmpCaoJqwktCi4KLwofCCAIowikCKUIJwko'
+      'CSkJGQcaB50HngefByEIIggjCBMGFAaXBpgGmQYbBxwHHQcNBQ4FkQWSBZMFFQYWBhcG'
+      'BwQIBIsEjASPBA8FEAUTBQMDBAOHA4gDiQMLBAwEDQT9Af4BgQKCAoMCBQMGAwcD9wD4'
+      'AHsBfAF9Af8BAAIBAvlC+kJ9Q35Df0P5APoA+wCAQ4FD/AD9AP4AgAGBAYIBfgF/AQIC'
+      'AwIEAoYChwKIAoQChQIIAwkDCgOMA40DjgOKA4sDDgQPBBAEkgSTBJQEkASRBBQFFQUW'
+      'BZgFmQWaBZQFlwUYBhsGHAacBp8GoAaaBpsGHgcfByAHogejB6QHoAehByQIJQgmCKgI'
+      'qQiqCKYIpwgqCSsJLAmuCa8JsAmsCa0JMAoxCjIKtAq1CrYKsgqzCj4MPwxADMIMwwzE'
+      'DMAMwQxEDUUNRg3IDckNyg3GDccNSg5LDkwOzg7PDtAOzA7NDlAPUQ9SD9QP1Q/WD9IP'
+      '0w9WEFcQWBDaENsQ3BDWENkQWhFdEV4R3hHhEeIR3BHdEWASYRJiEuQS5RLmEuIS4xJm'
+      'E2cTaBPqE+sT7BPoE+kTbBRtFG4U8BTxFPIU7hTvFHIVcxV0FfYV9xX4FfQV9RWAF4EX'
+      'ghcEGAUYBhgCGAMYhhiHGIgYChkLGQwZCBkJGYwZjRmOGRAaERoSGg4aDxqSGpMalBoW'
+      'GxcbGBsUGxUbmBuZG5obHBwdHB4cGBwbHJwcnxygHCAdIx0kHR4dHx2iHaMdpB0mHice'
+      'KB4kHiUeqB6pHqoeLB8tHy4fKh8rH64frx+wHzIgMyA0IDAgMSC0ILUgtiA4ITkhOiE2'
+      'ITchwiLDIsQiRiNHI0gjRCNFI8gjySPKI0wkTSROJEokSyTOJM8k0CRSJVMlVCVQJVEl'
+      '1CXVJdYlWCZZJlomViZXJtom2ybcJl4nXydgJ1onXSfeJ+En4idiKGUoZihgKGEo5Cjl'
+      'KOYoaClpKWopZilnKeop6ynsKW4qbypwKmwqbSrwKvEq8ip0K3UrdityK3Mr9iv3K/gr'
+      'eix7LHwseCx5LAQuBS4GLoguiS6KLoYuhy4KLwsvDC+OL48vkC+ML40vEDARMBIwlDCV'
+      'MJYwkjCTMBYxFzEYMZoxmzGcMZgxmTEcMh0yHjKgMqEyojKcMp8yIDMjMyQzpDOnM6gz'
+      'ojOjMyY0JzQoNKo0qzSsNKg0qTQsNS01LjWwNbE1sjWuNa81MjYzNjQ2tja3Nrg2tDa1'
+      'Njg3OTc6N7w3vTe+N7o3uzdGOUc5SDnKOcs5zDnIOck5TDpNOk460DrROtI6zjrPOlI7'
+      'UztUO9Y71zvYO9Q71TtYPFk8WjzcPN083jzaPNs8Xj1fPWA94j3jPeQ9Yj7hPeY+ZT5m'
+      'Pmo/6T7qPvVA9kB5QXpB+UD9Qf5BfUFtP24/8T/yP/M/dUB2QHdAZz5oPus+7D7tPm8/'
+      'cD9xP2E9Yj3lPeY95z1pPmo+az5bPFw83zzgPOE8Yz1kPWU9VTtWO9k72jvbO108Xjxf'
+      'PE86UDrTOtQ61TpXO1g7WTtJOUo5zTnOOc85UTpSOlM6Ozc8N783wDfBN0s5TDlNOTU2'
+      'Nja5Nro2uzY9Nz43PzcvNTA1szW0Nbc1NzY4Njs2KzQsNK80sDSxNDM1NDU1NSUzJjOp'
+      'M6ozqzMtNC40LzQfMiAyozKkMqUyJzMoMykzGTEaMZ0xnjGfMSEyIjIjMhMwFDCXMJgw'
+      'mTAbMRwxHTENLw4vkS+SL5MvFTAWMBcwBy4ILosujC6NLg8vEC8RL/kr+it9LH4sfywJ'
+      'LgouCy7zKvQqdyt4K3kr+yv8K/0r7SnuKXEqcip1KvUq9ir5Kuko6ihtKW4pbynxKfIp'
+      '8ynjJ+QnZyhoKGko6yjsKO0o3SbeJmEnYidjJ+Un5ifnJ9cl2CVbJlwmXSbfJuAm4SbR'
+      'JNIkVSVWJVcl2SXaJdslyyPMI08kUCRRJNMk1CTVJMUixiJJI0ojSyPNI84jzyO3ILgg'
+      'OyE8IT0hxyLIIskisR+yHzUgNiA3ILkguiC7IKserB4vHzAfMx+zH7Qftx+nHagdKx4s'
+      'Hi0erx6wHrEeoRyiHCUdJh0nHakdqh2rHZsbnBsfHCAcIRyjHKQcpRyVGpYaGRsaGxsb'
+      'nRueG58bjxmQGRMaFBoVGpcamBqZGokYihgNGQ4ZDxmRGZIZkxmDF4QXBxgIGAkYixiM'
+      'GI0YdRV2FfkV+hX7FYUXhheHF28UcBTzFPQU9RR3FXgVeRVpE2oT7RPuE/ETcRRyFHUU'
+      'ZRJmEukS6hLrEm0TbhNvE18RYBHjEeQR5RFnEmgSaRJZEFoQ3RDeEN8QYRFiEWMRUw9U'
+      'D9cP2A/ZD1sQXBBdEE0OTg7RDtIO0w5VD1YPVw9HDUgNyw3MDc0NTw5QDlEOQQxCDMUM'
+      'xgzHDEkNSg1LDTMKNAq3CrgKuQpDDEQMRQwtCS4JsQmyCbMJNQo2CjcKJwgoCKsIrAiv'
+      'CC8JMAkzCSMHJAenB6gHqQcrCCwILQgdBh4GoQaiBqMGJQcmBycHFwUYBZsFnAWdBR8G'
+      'IAYhBhEEEgSVBJYElwQZBRoFGwULAwwDjwOQA5EDEwQUBBUEBQIGAokCigKLAg0DDgMP'
+      'A/8AAAGDAYQBhQEHAggCCQIBQwJDhUOGQ4dDAQECAQMBiEOJQwQBBQEGAYgBiQGKAYYB'
+      'hwEKAgsCDAKOAo8CkAKMAo0CEAMRAxIDlAOVA5YDkgOTAxYEFwQYBJoEmwScBJgEmQQc'
+      'BR0FHgWgBaEFogWeBZ8FIgYjBiQGpganBqgGpAalBigHKQcqB6wHrQeuB6oHqwcuCC8I'
+      'MAiyCLMItAiwCLEINAk1CTYJuAm5CboJtAm3CTgKOwo8CrwKvwrACroKuwpGDEcMSAzK'
+      'DMsMzAzIDMkMTA1NDU4N0A3RDdINzg3PDVIOUw5UDtYO1w7YDtQO1Q5YD1kPWg/cD90P'
+      '3g/aD9sPXhBfEGAQ4hDjEOQQ4BDhEGQRZRFmEegR6RHqEeYR5xFqEmsSbBLuEu8S8BLs'
+      'Eu0ScBNxE3IT9BP1E/YT8hPzE3YUdxR4FPoU+xT8FPYU+RR6FX0VfhX+FQEWAhb8Ff0V'
+      'iBeJF4oXDBgNGA4YChgLGI4YjxiQGBIZExkUGRAZERmUGZUZlhkYGhkaGhoWGhcamhqb'
+      'GpwaHhsfGyAbHBsdG6AboRuiGyQcJRwmHCIcIxymHKccqBwqHSsdLB0oHSkdrB2tHa4d'
+      'MB4xHjIeLh4vHrIesx60HjYfNx84HzQfNR+4H7kfuh88ID0gPiA4IDsgvCC/IMAgQCFD'
+      'IUQhPiE/IcoiyyLMIk4jTyNQI0wjTSPQI9Ej0iNUJFUkViRSJFMk1iTXJNgkWiVbJVwl'
+      'WCVZJdwl3SXeJWAmYSZiJl4mXybiJuMm5CZmJ2cnaCdkJ2Un6CfpJ+onbChtKG4oaihr'
+      'KO4o7yjwKHIpcyl0KXApcSn0KfUp9il4Knkqeip2Kncq+ir7Kvwqfit/K4Areit9K/4r'
+      'ASwCLIIshSyGLIAsgSwMLg0uDi6QLpEuki6OLo8uEi8TLxQvli+XL5gvlC+VLxgwGTAa'
+      'MJwwnTCeMJowmzAeMR8xIDGiMaMxpDGgMaExJDIlMiYyqDKpMqoypjKnMiozKzMsM64z'
+      'rzOwM6wzrTMwNDE0MjS0NLU0tjSyNLM0NjU3NTg1ujW7Nbw1uDW5NTw2PTY+NsA2wTbC'
+      'Nrw2vzZAN0M3RDfEN8c3yDfCN8M3TjlPOVA50jnTOdQ50DnROVQ6VTpWOtg62TraOtY6'
+      '1zpaO1s7XDveO9874DvcO907YDxhPGI85DzlPOY84jzjPGY9Zz1oPeo96z3sPeg96T1s'
+      'Pm0+bj7wPvE+8j7uPu8+cj9zP3Q/9j/3P/g/9D/1P3hAeUB6QPxA/UD+QPpA+0B+QX9B'
+      'gEECQgNCBEKCQgFCBkOFQoZCikMJQwpDgUGCQQVCBkIHQolCikKLQntAfED/QABBAUGD'
+      'QYRBhUF1P3Y/+T/6P/s/fUB+QH9Abz5wPvM+9D71Pnc/eD95P2k9aj3tPe497z1xPnI+'
+      'cz5jPGQ85zzoPOk8az1sPW09XTteO+E74jvjO2U8ZjxnPFc6WDrbOtw63zpfO2A7YztT'
+      'OVQ51znYOdk5WzpcOl06RTdGN8k3yjfLN1U5VjlXOT82QDbDNsQ2xTZHN0g3STc5NTo1'
+      'vTW+Nb81QTZCNkM2MzQ0NLc0uDS5NDs1PDU9NS0zLjOxM7IzszM1NDY0NzQnMigyqzKs'
+      'Mq0yLzMwMzEzITEiMaUxpjGnMSkyKjIrMhswHDCfMKAwoTAjMSQxJTEVLxYvmS+aL50v'
+      'HTAeMCEwES4SLpUuli6XLhkvGi8bLwMsBCyHLIgsiSwTLhQuFS79Kv4qgSuCK4MrBSwG'
+      'LAcs9yn4KXsqfCp9Kv8qACsBK/Eo8ih1KXYpdyn5Kfop+ynrJ+wnbyhwKHEo8yj0KPUo'
+      '5SbmJmknaidrJ+0n7ifvJ98l4CVjJmQmZSbnJugm6SbZJNokXSVeJV8l4SXiJeMl0yPU'
+      'I1ckWCRbJNsk3CTfJM8i0CJTI1QjVSPXI9gj2SPBIMIgRSFGIUch0SLSItMiux+8Hz8g'
+      'QCBBIMMgxCDFILUeth45HzofOx+9H74fvx+vHbAdMx40HjUetx64HrkeqRyqHC0dLh0v'
+      'HbEdsh2zHaMbpBsnHCgcKRyrHKwcrRydGp4aIRsiGyMbpRumG6cblxmYGRsaHBodGp8a'
+      'oBqhGpEYkhgVGRYZGRmZGZoZnRmNF44XERgSGBMYlRiWGJcYfxWAFQMWBBYFFo8XkBeR'
+      'F3kUehT9FP4U/xSBFYIVgxVzE3QT9xP4E/kTexR8FH0UbRJuEvES8hLzEnUTdhN3E2cR'
+      'aBHrEewR7RFvEnAScRJhEGIQ5RDmEOcQaRFqEWsRWw9cD98P4A/hD2MQZBBlEFUOVg7Z'
+      'DtoO2w5dD14PXw9PDVAN0w3UDdcNVw5YDlsOSwxMDM8M0AzRDFMNVA1VDT0KPgrBCsIK'
+      'wwpNDE4MTww3CTgJuwm8Cb0JPwpACkEKMQgyCLUItgi3CDkJOgk7CSsHLAevB7AHsQcz'
+      'CDQINQglBiYGqQaqBqsGLQcuBy8HHwUgBaMFpAWlBScGKAYpBhkEGgSdBJ4EnwQhBSIF'
+      'IwUTAxQDlwOYA5kDGwQcBB0EoAShBCQFJQUmBagFqQWqBaYFpwUqBisGLAauBq8GsAas'
+      'Bq0GMAcxBzIHtAe1B7YHsgezBzYINwg4CLoIuwi8CLgIuQg8CT0JPgnACcEJwgm+Cb8J'
+      'QgpDCkQKxgrHCsgKxArFClAMUQxSDNQM1QzWDNIM0wxWDVcNWA3aDdsN3A3YDdkNXA5d'
+      'Dl4O4A7hDuIO3A7fDmAPYw9kD+QP5w/oD+IP4w9mEGcQaBDqEOsQ7BDoEOkQbBFtEW4R'
+      '8BHxEfIR7hHvEXIScxJ0EvYS9xL4EvQS9RJ4E3kTehP8E/0T/hP6E/sTfhR/FIAUAhUD'
+      'FQQVABUBFYQVhRWGFQgWCRYKFgYWBxaSF5MXlBcWGBcYGBgUGBUYmBiZGJoYHBkdGR4Z'
+      'GhkbGZ4ZnxmgGSIaIxokGh4aIRqiGqUaphomGykbKhskGyUbqBupG6obLBwtHC4cKhwr'
+      'HK4crxywHDIdMx00HTAdMR20HbUdth04HjkeOh42Hjceuh67HrwePh8/H0AfPB89H8Af'
+      'wR/CH0QgRSBGIEIgQyDGIMcgyCBKIUshTCFIIUkh1CLVItYiWCNZI1ojViNXI9oj2yPc'
+      'I14kXyRgJFwkXSTgJOEk4iRkJWUlZiVgJWMl5CXnJeglaCZrJmwmZiZnJuom6ybsJm4n'
+      'bydwJ2wnbSfwJ/En8id0KHUodihyKHMo9ij3KPgoeil7KXwpeCl5Kfwp/Sn+KYAqgSqC'
+      'Kn4qfyoCKwMrBCuGK4criCuEK4UrCCwJLAosjCyNLI4siiyLLBYuFy4YLpoumy6cLpgu'
+      'mS4cLx0vHi+gL6Evoi+eL58vIjAjMCQwpjCnMKgwojClMCYxKTEqMaoxrTGuMagxqTEs'
+      'Mi0yLjKwMrEysjKuMq8yMjMzMzQztjO3M7gztDO1Mzg0OTQ6NLw0vTS+NLo0uzQ+NT81'
+      'QDXCNcM1xDXANcE1RDZFNkY2yDbJNso2xjbHNko3SzdMN843zzfQN8w3zTdYOVk5Wjnc'
+      'Od053jnaOds5XjpfOmA64jrjOuQ64DrhOmQ7ZTtmO+g76TvqO+Q75ztoPGs8bDzsPO88'
+      '8DzqPOs8bj1vPXA98j3zPfQ98D3xPXQ+dT52Pvg++T76PvY+9z56P3s/fD/+P/8/AED8'
+      'P/0/gECBQIJABEEFQQZBAkEDQYZBh0GIQQpCC0IMQghCCUKMQo1CjkIQQxFDEkOJQYpB'
+      'DUIOQg9CkUKSQpNCg0CEQAdBCEEJQYtBjEGNQX0/fj8BQAJAA0CFQIZAh0B3Png++z78'
+      'Pv8+fz+AP4M/cz10Pfc9+D35PXs+fD59Pm08bjzxPPI88zx1PXY9dz1nO2g76zvsO+07'
+      'bzxwPHE8YTpiOuU65jrnOmk7ajtrO1s5XDnfOeA54TljOmQ6ZTpNN0430TfSN9M3XTle'
+      'OV85RzZINss2zDbNNk83UDdRN0E1QjXFNcY1xzVJNko2SzY7NDw0vzTANME0QzVENUU1'
+      'NTM2M7kzujO9Mz00PjRBNDEyMjK1MrYytzI5MzozOzMrMSwxrzGwMbExMzI0MjUyJTAm'
+      'MKkwqjCrMC0xLjEvMR8vIC+jL6QvpS8nMCgwKTAZLhounS6eLp8uIS8iLyMvCywMLI8s'
+      'kCyRLBsuHC4dLgUrBiuJK4oriysNLA4sDyz/KQAqgyqEKoUqBysIKwkr+Sj6KH0pfil/'
+      'KQEqAioDKvMn9Cd3KHgoeyj7KPwo/yjvJvAmcyd0J3Un9yf4J/kn6SXqJW0mbiZvJvEm'
+      '8ibzJuMk5CRnJWglaSXrJewl7SXdI94jYSRiJGMk5STmJOck1yLYIlsjXCNdI98j4CPh'
+      'I8kgyiBNIU4hTyHZItoi2yLDH8QfRyBIIEkgyyDMIM0gvR6+HkEfQh9DH8Ufxh/HH7cd'
+      'uB07HjwePR6/HsAewR6xHLIcNR02HTkduR26Hb0drRuuGzEcMhwzHLUcthy3HKcaqBor'
+      'GywbLRuvG7AbsRuhGaIZJRomGicaqRqqGqsamxicGB8ZIBkhGaMZpBmlGZUXlhcZGBoY'
+      'GxidGJ4YnxiHFYgVCxYMFg0WlxeYF5kXgRSCFAUVBhUHFYkVihWLFXsTfBP/EwAUARSD'
+      'FIQUhRR1EnYS+RL6EvsSfRN+E38TbxFwEfMR9BH3EXcSeBJ7EmsQbBDvEPAQ8RBzEXQR'
+      'dRFlD2YP6Q/qD+sPbRBuEG8QXw5gDuMO5A7lDmcPaA9pD1kNWg3dDd4N3w1hDmIOYw5T'
+      'DFQM1wzYDNkMWw1cDV0NRQpGCskKygrLClUMVgxXDD8JQAnDCcQJxQlHCkgKSQo5CDoI'
+      'vQi+CL8IQQlCCUMJMwc0B7cHuAe5BzsIPAg9CMAIwQhECUUJRgnICckJygnGCccJSgpL'
+      'CkwKzgrPCtAKzArNClgMWQxaDNwM3QzeDNoM2wxeDV8NYA3iDeMN5A3gDeENZA5lDmYO'
+      '6A7pDuoO5g7nDmoPaw9sD+4P7w/wD+wP7Q9wEHEQchD0EPUQ9hDyEPMQdhF3EXgR+hH7'
+      'EfwR+BH5EXwSfRJ+EgATARMCE/wS/xKAE4MThBMEFAcUCBQCFAMUhhSHFIgUChULFQwV'
+      'CBUJFYwVjRWOFRAWERYSFg4WDxaaF5sXnBceGB8YIBgcGB0YoBihGKIYJBklGSYZIhkj'
+      'GaYZpxmoGSoaKxosGigaKRqsGq0arhowGzEbMhsuGy8bshuzG7QbNhw3HDgcNBw1HLgc'
+      'uRy6HDwdPR0+HTodOx2+Hb8dwB1CHkMeRB4+HkEewh7FHsYeRh9JH0ofRB9FH8gfyR/K'
+      'H0wgTSBOIEogSyDOIM8g0CBSIVMhVCFQIVEh3CLdIt4iYCNhI2IjXiNfI+Ij4yPkI2Yk'
+      'ZyRoJGQkZSToJOkk6iRsJW0lbiVqJWsl7iXvJfAlciZzJnQmcCZxJvQm9Sb2JngneSd6'
+      'J3Yndyf6J/sn/Cd+KH8ogCh8KH0oACkBKQIphCmFKYYpgCmDKQQqByoIKogqiyqMKoYq'
+      'hyoKKwsrDCuOK48rkCuMK40rECwRLBIslCyVLJYskiyTLB4uHy4gLqIuoy6kLqAuoS4k'
+      'LyUvJi+oL6kvqi+mL6cvKjArMCwwrjCvMLAwrDCtMDAxMTEyMbQxtTG2MbIxszE2Mjcy'
+      'ODK6MrsyvDK4MrkyPDM9Mz4zwDPBM8IzvjO/M0I0QzRENMY0xzTINMI0xTRGNUk1SjXK'
+      'Nc01zjXINck1TDZNNk420DbRNtI2zjbPNlI3UzdUN9Y31zfYN9Q31TdgOWE5YjnkOeU5'
+      '5jniOeM5ZjpnOmg66jrrOuw66DrpOmw7bTtuO/A78TvyO+477ztyPHM8dDz2PPc8+Dz0'
+      'PPU8eD15PXo9/D39Pf49+j37PX4+fz6APgI/Az8EPwA/AT+EP4U/hj8IQAlACkAEQAdA'
+      'iECLQIxADEEPQRBBCkELQY5Bj0GQQRJCE0IUQhBCEUKUQpVClkIYQxlDGkOTQZRBF0IY'
+      'QhlCm0KcQp1CjUCOQBFBEkETQZVBlkGXQYc/iD8LQAxADUCPQJBAkUCBPoI+BT8GPwc/'
+      'iT+KP4s/ez18Pf89AD4BPoM+hD6FPnU8djz5PPo8+zx9PX49fz1vO3A78zv0O/U7dzx4'
+      'PHk8aTpqOu067jrvOnE7cjtzO2M5ZDnnOeg56TlrOmw6bTpVN1Y32TfaN903ZTlmOWk5'
+      'UTZSNtU21jbXNlk3WjdbN0s1TDXPNdA10TVTNlQ2VTZFNEY0yTTKNMs0TTVONU81PzNA'
+      'M8MzxDPFM0c0SDRJNDkyOjK9Mr4yvzJBM0IzQzMzMTQxtzG4MbkxOzI8Mj0yLTAuMLEw'
+      'sjCzMDUxNjE3MScvKC+rL6wvrS8vMDAwMTAhLiIupS6mLqcuKS8qLysvEywULJcsmCyb'
+      'LCMuJC4nLg8rECuTK5QrlSsXLBgsGSwJKgoqjSqOKo8qESsSKxMrAykEKYcpiCmJKQsq'
+      'DCoNKv0n/ieBKIIogygFKQYpByn3Jvgmeyd8J30n/ycAKAEo8SXyJXUmdiZ3Jvkm+ib7'
+      'Jusk7CRvJXAlcSXzJfQl9SXlI+YjaSRqJGsk7STuJO8k3yLgImMjZCNlI+cj6CPpI9Eg'
+      '0iBVIVYhWSHhIuIi5SLNH84fUSBSIFMg1SDWINcgxx7IHksfTB9NH88f0B/RH8Edwh1F'
+      'HkYeRx7JHsoeyx67HLwcPx1AHUEdwx3EHcUdtRu2GzkcOhw7HL0cvhy/HK8asBozGzQb'
+      'NRu3G7gbuRupGaoZLRouGi8asRqyGrMaoxikGCcZKBkpGasZrBmtGZ0XnhchGCIYIxil'
+      'GKYYpxiPFZAVExYUFhcWnxegF6MXixSMFA8VEBURFZMVlBWVFYUThhMJFAoUCxSNFI4U'
+      'jxR/EoASAxMEEwUThxOIE4kTeRF6Ef0R/hH/EYESghKDEnMQdBD3EPgQ+RB7EXwRfRFt'
+      'D24P8Q/yD/MPdRB2EHcQZw5oDusO7A7tDm8PcA9xD2ENYg3lDeYN5w1pDmoOaw5bDFwM'
+      '3wzgDOEMYw1kDWUN6A3pDWwObQ5uDvAO8Q7yDu4O7w5yD3MPdA/2D/cP+A/0D/UPeBB5'
+      'EHoQ/BD9EP4Q+hD7EH4RfxGAEQISAxIEEgASARKEEoUShhIIEwkTChMGEwcTihOLE4wT'
+      'DhQPFBAUDBQNFJAUkRSSFBQVFRUWFRIVExWWFZcVmBUaFhsWHBYYFhkWpBelF6YXKBgp'
+      'GCoYJBgnGKgYqxisGCwZLxkwGSoZKxmuGa8ZsBkyGjMaNBowGjEatBq1GrYaOBs5Gzob'
+      'Nhs3G7obuxu8Gz4cPxxAHDwcPRzAHMEcwhxEHUUdRh1CHUMdxh3HHcgdSh5LHkweSB5J'
+      'HswezR7OHlAfUR9SH04fTx/SH9Mf1B9WIFcgWCBUIFUg2CDZINogXCFdIV4hWiFbIeYi'
+      '5yLoImojayNsI2YjaSPqI+0j7iNuJHEkciRsJG0k8CTxJPIkdCV1JXYlciVzJfYl9yX4'
+      'JXomeyZ8JngmeSb8Jv0m/iaAJ4Engid+J38nAigDKAQohiiHKIgohCiFKAgpCSkKKYwp'
+      'jSmOKYopiykOKg8qECqSKpMqlCqQKpEqFCsVKxYrmCuZK5orliuXKxosGywcLJ4snyyg'
+      'LJwsnSwoLikuKi6sLq0uri6oLqsuLC8vLzAvsC+zL7Qvri+vLzIwMzA0MLYwtzC4MLQw'
+      'tTA4MTkxOjG8Mb0xvjG6MbsxPjI/MkAywjLDMsQywDLBMkQzRTNGM8gzyTPKM8YzxzNK'
+      'NEs0TDTONM800DTMNM00UDVRNVI11DXVNdY10jXTNVY2VzZYNto22zbcNtg22TZcN103'
+      'XjfgN+E34jfeN983ajlrOWw57jnvOfA56jntOW46cTpyOvI69Tr2OvA68Tp0O3U7djv4'
+      'O/k7+jv2O/c7ejx7PHw8/jz/PAA9/Dz9PIA9gT2CPQQ+BT4GPgI+Az6GPoc+iD4KPws/'
+      'DD8IPwk/jD+NP44/EEARQBJADkAPQJJAk0CUQBZBF0EYQRRBFUGYQZlBmkEcQh1CHkIa'
+      'QhtCnkKfQqBCIkMjQyRDm0GcQR9CIEIhQqNCpEKlQpVAlkAZQRpBG0GdQZ5Bn0GPP5A/'
+      'E0AUQBVAl0CYQJlAiT6KPg0/Dj8PP5E/kj+TP4M9hD0HPgg+CT6LPow+jT59PH48AT0C'
+      'PQU9hT2GPYk9eTt6O/07/jv/O4E8gjyDPHM6dDr3Ovg6+Tp7O3w7fTttOW458TnyOfM5'
+      'dTp2Onc6XzdgN+M35DflN285cDlxOVk2WjbdNt423zZhN2I3YzdTNVQ11zXYNdk1WzZc'
+      'Nl02TTRONNE00jTTNFU1VjVXNUczSDPLM8wzzTNPNFA0UTRBMkIyxTLGMscySTNKM0sz'
+      'OzE8Mb8xwDHDMUMyRDJHMjcwODC7MLwwvTA/MUAxQTExLzIvtS+2L7cvOTA6MDswKy4s'
+      'Lq8usC6xLjMvNC81Lx0sHiyhLKIsoywtLi4uLy4XKxgrmyucK50rHywgLCEsESoSKpUq'
+      'liqXKhkrGisbKwspDCmPKZApkSkTKhQqFSoFKAYoiSiKKIsoDSkOKQ8p/yYAJ4MnhCeF'
+      'JwcoCCgJKPkl+iV9Jn4mgSYBJwInBSf1JPYkeSV6JXsl/SX+Jf8l7yPwI3MkdCR1JPck'
+      '+CT5JOki6iJtI24jbyPxI/Ij8yPbINwgXyFgIWEh6yLsIu0i1R/WH1kgWiBbIN0g3iDf'
+      'IM8e0B5TH1QfVR/XH9gf2R/JHcodTR5OHk8e0R7SHtMewxzEHEcdSB1JHcsdzB3NHb0b'
+      'vhtBHEIcQxzFHMYcxxy3GrgaOxs8Gz8bvxvAG8Mbsxm0GTcaOBo5GrsavBq9Gq0Yrhgx'
+      'GTIZMxm1GbYZtxmnF6gXKxgsGC0YrxiwGLEYmRWaFR0WHhYfFqkXqherF5MUlBQXFRgV'
+      'GRWbFZwVnRWNE44TERQSFBMUlRSWFJcUhxKIEgsTDBMNE48TkBORE4ERghEFEgYSBxKJ'
+      'EooSixJ7EHwQ/xAAEQERgxGEEYURCBIJEowSjRKOEhATERMSEw4TDxOSE5MTlBMWFBcU'
+      'GBQUFBUUmBSZFJoUHBUdFR4VGhUbFZ4VnxWgFSIWIxYkFiAWIRasF60XrhcwGDEYMhgu'
+      'GC8YshizGLQYNhk3GTgZNBk1GbgZuRm6GTwaPRo+GjoaOxq+Gr8awBpCG0MbRBtAG0Eb'
+      'xBvFG8YbSBxJHEocRBxHHMgcyxzMHEwdTx1QHUodSx3OHc8d0B1SHlMeVB5QHlEe1B7V'
+      'HtYeWB9ZH1ofVh9XH9of2x/cH14gXyBgIFwgXSDgIOEg4iBkIWUhZiFiIWMh7iLvIvAi'
+      'ciNzI3QjcCNxI/Qj9SP2I3gkeSR6JHYkdyT6JPsk/CR+JX8lgCV8JX0lACYBJgImhCaF'
+      'JoYmgiaDJgYnBycIJ4oniyeMJ4YniScKKA0oDiiOKJEokiiMKI0oECkRKRIplCmVKZYp'
+      'kimTKRYqFyoYKpoqmyqcKpgqmSocKx0rHiugK6EroiueK58rIiwjLCQspiynLKgspCyl'
+      'LDAuMS4yLrQutS62LrIusy42LzcvOC+6L7svvC+4L7kvPDA9MD4wwDDBMMIwvjC/MEIx'
+      'QzFEMcYxxzHIMcQxxTFIMkkySjLMMs0yzjLIMssyTDNPM1Az0DPTM9QzzjPPM1I0UzRU'
+      'NNY01zTYNNQ01TRYNVk1WjXcNd013jXaNds1XjZfNmA24jbjNuQ24DbhNmQ3ZTdmN+g3'
+      '6TfqN+Y35zdyOXM5dDn2Ofc5+Dn0OfU5eDp5Ono6/Dr9Ov46+jr7On47fzuAOwI8AzwE'
+      'PAA8ATyEPIU8hjwIPQk9Cj0GPQc9ij2LPYw9Dj4PPhA+Cj4NPo4+kT6SPhI/FT8WPxA/'
+      'ET+UP5U/lj8YQBlAGkAWQBdAmkCbQJxAHkEfQSBBHEEdQaBBoUGiQSRCJUImQiJCI0Km'
+      'QqdCqEIqQytDLEOjQaRBJ0IoQilCq0KsQq1CnUCeQCFBIkElQaVBpkGpQZk/mj8dQB5A'
+      'H0ChQKJAo0CTPpQ+Fz8YPxk/mz+cP50/jT2OPRE+Ej4TPpU+lj6XPoc8iDwLPQw9DT2P'
+      'PZA9kT2BO4I7BTwGPAc8iTyKPIs8ezp8Ov86ADsBO4M7hDuFO3U5djn5Ofo5+zl9On46'
+      'fzpnN2g36zfsN+03dzl4OXk5YTZiNuU25jbnNmk3ajdrN1s1XDXfNeA14zVjNmQ2ZzZX'
+      'NFg02zTcNN00XzVgNWE1UTNSM9Uz1jPXM1k0WjRbNEsyTDLPMtAy0TJTM1QzVTNFMUYx'
+      'yTHKMcsxTTJOMk8yPzBAMMMwxDDFMEcxSDFJMTkvOi+9L74vvy9BMEIwQzAzLjQuty64'
+      'LrkuOy88Lz0vJSwmLKksqiyrLDUuNi43Lh8rICujK6QrpSsnLCgsKSwZKhoqnSqeKqEq'
+      'ISsiKyUrFSkWKZkpmimbKR0qHiofKg8oECiTKJQolSgXKRgpGSkJJwonjSeOJ48nESgS'
+      'KBMoAyYEJocmiCaJJgsnDCcNJ/0k/iSBJYIlgyUFJgYmByb3I/gjeyR8JH0k/yQAJQEl'
+      '8SLyInUjdiN3I/kj+iP7I+Mg5CBnIWghaSHzIvQi9SLdH94fYSBiIGMg5SDmIOcg1x7Y'
+      'HlsfXB9fH98f4B/jH9Md1B1XHlgeWR7bHtwe3R7NHM4cUR1SHVMd1R3WHdcdxxvIG0sc'
+      'TBxNHM8c0BzRHMEawhpFG0YbRxvJG8obyxu7GbwZPxpAGkEawxrEGsUatRi2GDkZOhk7'
+      'Gb0Zvhm/Ga8XsBczGDQYNRi3GLgYuRihFaIVJRYmFicWsReyF7MXmxScFB8VIBUhFaMV'
+      'pBWlFSgWKRa0F7UXthc4GDkYOhg2GDcYuhi7GLwYPhk/GUAZPBk9GcAZwRnCGUQaRRpG'
+      'GkIaQxrGGscayBpKG0sbTBtIG0kbzBvNG84bUBxRHFIcThxPHNIc0xzUHFYdVx1YHVQd'
+      'VR3YHdkd2h1cHl0eXh5aHlse3h7fHuAeYh9jH2QfYB9hH+Qf5R/mH2ggaSBqIGQgZyDo'
+      'IOsg7CBsIW8hcCFqIWsh9iL3IvgieiN7I3wjeCN5I/wj/SP+I4AkgSSCJH4kfyQCJQMl'
+      'BCWGJYcliCWEJYUlCCYJJgomjCaNJo4miiaLJg4nDycQJ5InkyeUJ5AnkScUKBUoFiiY'
+      'KJkomiiWKJcoGikbKRwpnimfKaApnCmdKSAqISoiKqQqpSqmKqIqoyomKycrKCuqK6sr'
+      'rCumK6krKiwtLC4sriyxLLIsrCytLDguOS46LrwuvS6+Lrouuy4+Lz8vQC/CL8MvxC/A'
+      'L8EvRDBFMEYwyDDJMMowxjDHMEoxSzFMMc4xzzHQMcwxzTFQMlEyUjLUMtUy1jLSMtMy'
+      'VjNXM1gz2jPbM9wz2DPZM1w0XTReNOA04TTiNN403zRiNWM1ZDXmNec16DXkNeU1aDZp'
+      'Nmo27DbtNu426DbrNmw3bzdwN/A38zf0N+437zd6OXs5fDn+Of85ADr8Of05gDqBOoI6'
+      'BDsFOwY7AjsDO4Y7hzuIOwo8CzwMPAg8CTyMPI08jjwQPRE9Ej0OPQ89kj2TPZQ9Fj4X'
+      'Phg+FD4VPpg+mT6aPhw/HT8ePxo/Gz+eP58/oD8iQCNAJEAgQCFApEClQKZAKEEpQSpB'
+      'JkEnQapBq0GsQS5CL0IwQipCLUKuQrFCskIyQzVDNkOtQa5BMUIyQjNCtUK2QrdCp0Co'
+      'QCtBLEEtQa9BsEGxQaE/oj8lQCZAJ0CpQKpAq0CbPpw+Hz8gPyE/oz+kP6U/lT2WPRk+'
+      'Gj4bPp0+nj6fPo88kDwTPRQ9FT2XPZg9mT2JO4o7DTwOPA88kTySPJM8gzqEOgc7CDsL'
+      'O4s7jDuPO385gDkDOgQ6BTqHOog6iTpxN3I39Tf2N/c3gTmCOYM5azZsNu828DbxNnM3'
+      'dDd1N2U1ZjXpNeo16zVtNm42bzZfNGA04zTkNOU0ZzVoNWk1WTNaM90z3jPfM2E0YjRj'
+      'NFMyVDLXMtgy2TJbM1wzXTNNMU4x0THSMdMxVTJWMlcyRzBIMMswzDDNME8xUDFRMUEv'
+      'Qi/FL8YvyS9JMEowTTA9Lj4uwS7CLsMuRS9GL0cvLywwLLMstCy1LD8uQC5BLikrKiut'
+      'K64rrysxLDIsMywjKiQqpyqoKqkqKyssKy0rHSkeKaEpoimjKSUqJionKhcoGCibKJwo'
+      'nSgfKSApISkRJxInlSeWJ5cnGSgaKBsoCyYMJo8mkCaRJhMnFCcVJwUlBiWJJYoliyUN'
+      'Jg4mDyb/IwAkgySEJIckByUIJQsl+yL8In8jgCOBIwMkBCQFJO0g7iBxIXIhcyH9Iv4i'
+      '/yLnH+gfayBsIG0g7yDwIPEg4R7iHmUfZh9nH+kf6h/rH9sd3B1fHmAeYR7jHuQe5R7V'
+      'HNYcWR1aHVsd3R3eHd8dzxvQG1McVBxVHNcc2BzZHMkayhpNG04bTxvRG9Ib0xvDGcQZ'
+      'RxpIGkkayxrMGs0aUBtRG9Qb1RvWG1gcWRxaHFYcVxzaHNsc3BxeHV8dYB1cHV0d4B3h'
+      'HeIdZB5lHmYeYh5jHuYe5x7oHmofax9sH2gfaR/sH+0f7h9wIHEgciBuIG8g8iDzIPQg'
+      'diF3IXghdCF1IQAjASMCI4QjhSOGI4IjgyMGJAckCCSKJIskjCSIJIkkDCUNJQ4lkCWR'
+      'JZIljCWPJRAmEyYUJpQmlyaYJpImkyYWJxcnGCeaJ5snnCeYJ5knHCgdKB4ooCihKKIo'
+      'niifKCIpIykkKaYppymoKaQppSkoKikqKiqsKq0qriqqKqsqLisvKzArsiuzK7QrsCux'
+      'KzQsNSw2LLgsuSy6LLYstyxCLkMuRC7GLscuyC7ELsUuSC9JL0ovzC/NL84vyi/LL04w'
+      'TzBQMNIw0zDUMM4w0TBSMVUxVjHWMdkx2jHUMdUxWDJZMloy3DLdMt4y2jLbMl4zXzNg'
+      'M+Iz4zPkM+Az4TNkNGU0ZjToNOk06jTmNOc0ajVrNWw17jXvNfA17DXtNXA2cTZyNvQ2'
+      '9Tb2NvI28zZ2N3c3eDf6N/s3/Df4N/k3hDmFOYY5CDoJOgo6BjoHOoo6izqMOg47DzsQ'
+      'Oww7DTuQO5E7kjsUPBU8FjwQPBM8lDyXPJg8GD0bPRw9Fj0XPZo9mz2cPR4+Hz4gPhw+'
+      'HT6gPqE+oj4kPyU/Jj8iPyM/pj+nP6g/KkArQCxAKEApQKxArUCuQDBBMUEyQS5BL0Gy'
+      'QbNBtEE2QjdCOEI0QjVCuEK5QrpCPEM9Qz5DtUG2QTlCOkI7Qr1CvkK/Qq9AsEAzQTRB'
+      'NUG3QbhBuUGpP6o/LUAuQC9AsUCyQLNAoz6kPic/KD8rP6s/rD+vP589oD0jPiQ+JT6n'
+      'Pqg+qT6ZPJo8HT0ePR89oT2iPaM9kzuUOxc8GDwZPJs8nDydPI06jjoROxI7EzuVO5Y7'
+      'lzuHOYg5CzoMOg06jzqQOpE6eTd6N/03/jf/N4k5ijmLOXM2dDb3Nvg2+TZ7N3w3fTdt'
+      'NW418TXyNfM1dTZ2Nnc2ZzRoNOs07DTtNG81cDVxNWEzYjPlM+Yz6TNpNGo0bTRdMl4y'
+      '4TLiMuMyZTNmM2czVzFYMdsx3DHdMV8yYDJhMlEwUjDVMNYw1zBZMVoxWzFLL0wvzy/Q'
+      'L9EvUzBUMFUwRS5GLskuyi7LLk0vTi9PLzcsOCy7LLwsvSxHLkguSS4xKzIrtSu2K7cr'
+      'OSw6LDssKyosKq8qsCqxKjMrNCs1KyUpJimpKaopqyktKi4qLyofKCAooyikKKcoJyko'
+      'KSspGyccJ58noCehJyMoJCglKBUmFiaZJpommyYdJx4nHycPJRAlkyWUJZUlFyYYJhkm'
+      'CSQKJI0kjiSPJBElEiUTJQMjBCOHI4gjiSMLJAwkDST1IPYgeSF6IXshBSMGIwcj7x/w'
+      'H3MgdCB1IPcg+CD5IOke6h5tH24fbx/xH/If8x/jHeQdZx5oHmke6x7sHu0ecB9xH/Qf'
+      '9R/2H3ggeSB6IHYgdyD6IPsg/CB+IX8hgCF8IX0hCCMJIwojjCONI44jiiOLIw4kDyQQ'
+      'JJIkkySUJJAkkSQUJRUlFiWYJZklmiWWJZclGiYbJhwmniafJqAmnCadJiAnISciJ6Qn'
+      'pSemJ6InoycmKCcoKCiqKKsorCioKKkoLCktKS4psCmxKbIprCmvKTAqMyo0KrQqtyq4'
+      'KrIqsyo2KzcrOCu6K7srvCu4K7krPCw9LD4swCzBLMIsviy/LEouSy5MLs4uzy7QLswu'
+      'zS5QL1EvUi/UL9Uv1i/SL9MvVjBXMFgw2jDbMNww2DDZMFwxXTFeMeAx4THiMd4x3zFi'
+      'MmMyZDLmMucy6DLkMuUyaDNpM2oz7DPtM+4z6jPrM240bzRwNPI08zT0NO408TRyNXU1'
+      'djX2Nfk1+jX0NfU1eDZ5Nno2/Db9Nv42+jb7Nn43fzeANwI4AzgEOAA4ATiMOY05jjkQ'
+      'OhE6EjoOOg86kjqTOpQ6FjsXOxg7FDsVO5g7mTuaOxw8HTwePBo8GzyePJ88oDwiPSM9'
+      'JD0gPSE9pD2lPaY9KD4pPio+Jj4nPqo+qz6sPi4/Lz8wPyw/LT+wP7E/sj80QDVANkAw'
+      'QDNAtEC3QLhAOEE7QTxBNkE3QbpBu0G8QT5CP0JAQjxCPULAQsFCwkJEQ0VDRkO/QcBB'
+      'Q0JEQkVCx0LIQslCuUC6QD1BPkE/QcFBwkHDQbM/tD83QDhAOUC7QLxAvUCtPq4+MT8y'
+      'PzM/tT+2P7c/pz2oPSs+LD4tPq8+sD6xPqE8ojwlPSY9Jz2pPao9qz2bO5w7HzwgPCE8'
+      'ozykPKU8lTqWOhk7GjsbO507njufO485kDkTOhQ6FTqXOpg6mTqBN4I3BTgGOAk4kTmS'
+      'OZU5fTZ+NgE3AjcDN4U3hjeHN3c1eDX7Nfw1/TV/NoA2gTZxNHI09TT2NPc0eTV6NXs1'
+      'azNsM+8z8DPxM3M0dDR1NGUyZjLpMuoy6zJtM24zbzNfMWAx4zHkMeUxZzJoMmkyWTBa'
+      'MN0w3jDfMGExYjFjMVMvVC/XL9gv2S9bMFwwXTBNLk4u0S7SLtMuVS9WL1cvPyxALMMs'
+      'xCzHLE8uUC5TLjsrPCu/K8ArwStDLEQsRSw1KjYquSq6KrsqPSs+Kz8rLykwKbMptCm1'
+      'KTcqOCo5KikoKiitKK4orygxKTIpMykjJyQnpyeoJ6knKygsKC0oHSYeJqEmoiajJiUn'
+      'JicnJxclGCWbJZwlnSUfJiAmISYRJBIklSSWJJckGSUaJRslCyMMI48jkCORIxMkFCQV'
+      'JJgkmSQcJR0lHiWgJaEloiWeJZ8lIiYjJiQmpianJqgmpCalJignKScqJ6wnrSeuJ6on'
+      'qycuKC8oMCiyKLMotCiwKLEoNCk1KTYpuCm5Kboptim3KToqOyo8Kr4qvyrAKrwqvSpA'
+      'K0ErQivEK8UrxivCK8MrRixHLEgsyizLLMwsyCzJLFQuVS5WLtgu2S7aLtQu1y5YL1sv'
+      'XC/cL98v4C/aL9svXjBfMGAw4jDjMOQw4DDhMGQxZTFmMegx6THqMeYx5zFqMmsybDLu'
+      'Mu8y8DLsMu0ycDNxM3Iz9DP1M/Yz8jPzM3Y0dzR4NPo0+zT8NPg0+TR8NX01fjUANgE2'
+      'Ajb+Nf81gjaDNoQ2BjcHNwg3BDcFN4g3iTeKNww4DTgOOAo4CziWOZc5mDkaOhs6HDoW'
+      'Ohk6mjqdOp46HjshOyI7HDsdO6A7oTuiOyQ8JTwmPCI8IzymPKc8qDwqPSs9LD0oPSk9'
+      'rD2tPa49MD4xPjI+Lj4vPrI+sz60PjY/Nz84PzQ/NT+4P7k/uj88QD1APkA6QDtAvkC/'
+      'QMBAQkFDQURBQEFBQcRBxUHGQUhCSUJKQkZCR0LKQstCzEJOQ09DUEPHQchBS0JMQk1C'
+      'z0LQQtFCwUDCQEVBRkFHQclBykHLQbs/vD8/QEBAQUDDQMRAxUC1PrY+OT86Pzs/vT++'
+      'P78/rz2wPTM+ND41Prc+uD65Pqk8qjwtPS49MT2xPbI9tT2lO6Y7KTwqPCs8rTyuPK88'
+      'nzqgOiM7JDslO6c7qDupO5k5mjkdOh46HzqhOqI6ozqLN4w3DzgQOBE4mzmcOZ05hTaG'
+      'Ngk3CjcLN403jjePN381gDUDNgQ2BTaHNog2iTZ5NHo0/TT+NP80gTWCNYM1czN0M/cz'
+      '+DP5M3s0fDR9NG0ybjLxMvIy8zJ1M3YzdzNnMWgx6zHsMe8xbzJwMnMyYzBkMOcw6DDp'
+      'MGsxbDFtMV0vXi/hL+Iv4y9lMGYwZzBXLlgu2y7cLt0uXy9gL2EvSSxKLM0szizPLFku'
+      'Wi5bLkMrRCvHK8gryStLLEwsTSw9Kj4qwSrCKsMqRStGK0crNyk4KbspvCm9KT8qQCpB'
+      'KjEoMii1KLYotyg5KTopOykrJywnryewJ7EnMyg0KDUouCi5KDwpPSk+KcApwSnCKb4p'
+      'vylCKkMqRCrGKscqyCrEKsUqSCtJK0orzCvNK84ryivLK04sTyxQLNIs0yzULNAs0Sxc'
+      'Ll0uXi7gLuEu4i7eLt8uYi9jL2Qv5i/nL+gv5C/lL2gwaTBqMOww7TDuMOow6zBuMW8x'
+      'cDHyMfMx9DHwMfExdDJ1MnYy+DL5Mvoy9DL3MngzezN8M/wz/zMANPoz+zN+NH80gDQC'
+      'NQM1BDUANQE1hDWFNYY1CDYJNgo2BjYHNoo2izaMNg43DzcQNww3DTeQN5E3kjcUOBU4'
+      'FjgSOBM4njmfOaA5IjojOiQ6IDohOqQ6pTqmOig7KTsqOyY7JzuqO6s7rDsuPC88MDws'
+      'PC08sDyxPLI8ND01PTY9Mj0zPbY9tz24PTo+Oz48PjY+OT66Pr0+vj4+P0E/Qj88Pz0/'
+      'wD/BP8I/REBFQEZAQkBDQMZAx0DIQEpBS0FMQUhBSUHMQc1BzkFQQlFCUkJOQk9C0kLT'
+      'QtRCVkNXQ1hDz0HQQVNCVEJVQtdC2ELZQslAykBNQU5BUUHRQdJB1UHFP8Y/SUBKQEtA'
+      'zUDOQM9Avz7APkM/RD9FP8c/yD/JP7k9uj09Pj4+Pz7BPsI+wz6zPLQ8Nz04PTk9uz28'
+      'Pb09rTuuOzE8MjwzPLU8tjy3PKc6qDorOyw7LTuvO7A7sTuhOaI5JTomOic6qTqqOqs6'
+      'kzeUNxc4GDgZOKM5pDmlOY02jjYRNxI3EzeVN5Y3lzeHNYg1CzYMNg82jzaQNpM2gzSE'
+      'NAc1CDUJNYs1jDWNNX0zfjMBNAI0AzSFNIY0hzR3Mngy+zL8Mv0yfzOAM4EzcTFyMfUx'
+      '9jH3MXkyejJ7MmswbDDvMPAw8TBzMXQxdTFlL2Yv6S/qL+svbTBuMG8wXy5gLuMu5C7l'
+      'LmcvaC9pL1EsUizVLNYs1yxhLmIuYy5LK0wrzyvQK9ErUyxULFUs2CzZLGQuZS5mLugu'
+      '6S7qLuYu5y5qL2svbC/uL+8v8C/sL+0vcDBxMHIw9DD1MPYw8jDzMHYxdzF4Mfox+zH8'
+      'Mfgx+TF8Mn0yfjIAMwEzAjP+Mv8ygjODM4QzBjQHNAg0BDQFNIg0iTSKNAw1DTUONQo1'
+      'CzWONY81kDUSNhM2FDYQNhE2lDaVNpY2GDcZNxo3FDcXN5g3mzecNxw4HzggOBo4Gzim'
+      'Oac5qDkqOis6LDooOik6rDqtOq46MDsxOzI7LjsvO7I7szu0OzY8Nzw4PDQ8NTy4PLk8'
+      'ujw8PT09Pj06PTs9vj2/PcA9Qj5DPkQ+QD5BPsQ+xT7GPkg/ST9KP0Y/Rz/KP8s/zD9O'
+      'QE9AUEBMQE1A0EDRQNJAVEFVQVZBUkFTQdZB10HYQVpCW0JcQlZCWULaQt1C3kJeQ2FD'
+      'YkPZQdpBXUJeQl9C4ULiQuNC00DUQFdBWEFZQdtB3EHdQc0/zj9RQFJAU0DVQNZA10DH'
+      'Psg+Sz9MP00/zz/QP9E/wT3CPUU+Rj5HPsk+yj7LPrs8vDw/PUA9QT3DPcQ9xT21O7Y7'
+      'OTw6PDs8vTy+PL88rzqwOjM7NDs3O7c7uDu7O6s5rDkvOjA6MTqzOrQ6tTqdN543ITgi'
+      'OCM4rTmuOa85lzaYNhs3HDcdN583oDehN5E1kjUVNhY2FzaZNpo2mzaLNIw0DzUQNRE1'
+      'kzWUNZU1hTOGMwk0CjQLNI00jjSPNH8ygDIDMwQzBTOHM4gziTN5MXox/TH+Mf8xgTKC'
+      'MoMyczB0MPcw+DD5MHsxfDF9MQAyATKEMoUyhjIIMwkzCjMGMwczijOLM4wzDjQPNBA0'
+      'DDQNNJA0kTSSNBQ1FTUWNRI1EzWWNZc1mDUaNhs2HDYYNhk2nDadNp42IDchNyI3Hjcf'
+      'N6I3ozekNyY4JzgoOCQ4JTiwObE5sjk0OjU6NjoyOjM6tjq3Org6Ojs7Ozw7ODs5O7w7'
+      'vTu+O0A8QTxCPDw8PzzAPMM8xDxEPUc9SD1CPUM9xj3HPcg9Sj5LPkw+SD5JPsw+zT7O'
+      'PlA/UT9SP04/Tz/SP9M/1D9WQFdAWEBUQFVA2EDZQNpAXEFdQV5BWkFbQd5B30HgQWJC'
+      'Y0JkQmBCYULkQuVC5kJoQ2lDakPhQeJBZUJmQmdC6ULqQutC20DcQF9BYEFhQeNB5EHl'
+      'QdU/1j9ZQFpAW0DdQN5A30DPPtA+Uz9UP1c/1z/YP9s/yz3MPU8+UD5RPtM+1D7VPsU8'
+      'xjxJPUo9Sz3NPc49zz2/O8A7QzxEPEU8xzzIPMk8uTq6Oj07Pjs/O8E7wjvDO7M5tDk3'
+      'Ojg6OTq7Orw6vTqlN6Y3KTgqOCs4tTm2Obc5nzagNiM3JDclN6c3qDepN5k1mjUdNh42'
+      'HzahNqI2ozaTNJQ0FzUYNRk1mzWcNZ01IDYhNqQ2pTamNig3KTcqNyY3JzeqN6s3rDcu'
+      'OC84MDgsOC04uDm5Obo5PDo9Oj46Ojo7Or46vzrAOkI7QztEO0A7QTvEO8U7xjtIPEk8'
+      'SjxGPEc8yjzLPMw8Tj1PPVA9TD1NPdA90T3SPVQ+VT5WPlI+Uz7WPtc+2D5aP1s/XD9Y'
+      'P1k/3D/dP94/YEBhQGJAXEBfQOBA40DkQGRBZ0FoQWJBY0HmQedB6EFqQmtCbEJoQmlC'
+      '7ELtQu5CcENxQ3JD60HsQW9CcEJxQvNC9EL1QuVA5kBpQWpBa0HtQe5B70HfP+A/Y0Bk'
+      'QGVA50DoQOlA2T7aPl0/Xj9fP+E/4j/jP9M91D1XPlg+WT7bPtw+3T7NPM48UT1SPVM9'
+      '1T3WPdc9xzvIO0s8TDxNPM880DzRPME6wjpFO0Y7RzvJO8o7yzu7Obw5PzpAOkE6wzrE'
+      'OsU6SDtJO8w7zTvOO1A8UTxSPE48TzzSPNM81DxWPVc9WD1UPVU92D3ZPdo9XD5dPl4+'
+      'Wj5bPt4+3z7gPmI/Yz9kP2A/YT/kP+U/5j9oQGlAakBmQGdA6kDrQOxAbkFvQXBBbEFt'
+      'QfBB8UHyQXRCdUJ2QnJCc0L2QvdC+EJ6Q3tDfEPzQfRBd0J4QnlC+0L8Qv1C7UDuQHFB'
+      'ckFzQfVB9kH3Qec/6D9rQGxAbUDvQPBA8UDhPuI+ZT9mP2c/6T/qP+s/2z3cPV8+YD5h'
+      'PuM+5D7lPmg/aT/sP+0/7j9wQHFAckBuQG9A8kDzQPRAdkF3QXhBdEF1QfhB+UH6QXxC'
+      'fUJ+QnpCe0L+Qv9CAEOCQ4NDhEP7QfxBf0KAQoFCA0MEQwVD');
+
+  /// Data Matrix position of each codeword bit in the symbol
+  static final dataMatrixPlacement144x144 = _unpackUint16(
+      'fQR+BA0FDgVBAp0FngXRApEAkgAhASIBIwGxAbIBswFXT1hP50/oT+lPkwCUAJUA6k/r'
+      'T5YAlwCYACYBJwEoASQBJQG0AbUBtgFEAkUCRgJCAkMC0gLTAtQCYgNjA2QDLgZhA74G'
+      '8QPyA04HgQSCBP0I/giNCY4JwQYdCh4KUQcRBRIFoQWiBaMFMQYyBjMG8wP0A4MEhASF'
+      'BBMFFAUVBdUC1gJlA2YDZwP1A/YD9wO3AbgBRwJIAkkC1wLYAtkCmQCaACkBKgErAbkB'
+      'ugG7AV9PYE/vT/BP8U+bAJwAnQDyT/NPngCfAKAALgEvATABLAEtAbwBvQG+AUwCTQJO'
+      'AkoCSwLaAtsC3AJqA2sDbANoA2kD+AP5A/oDiASJBIoEhgSHBBYFFwUYBaYFpwWoBaQF'
+      'pQU0BjUGNgbEBsUGxgbCBsMGUgdTB1QH4gfjB+QHrgrhBz4LcQhyCM4LAQkCCZ0Ong4t'
+      'Dy4PQQu9D74P0QuRCZIJIQoiCiMKsQqyCrMKcwh0CAMJBAkFCZMJlAmVCVUHVgflB+YH'
+      '5wd1CHYIdwg3BjgGxwbIBskGVwdYB1kHGQUaBakFqgWrBTkGOgY7BvsD/AOLBIwEjQQb'
+      'BRwFHQXdAt4CbQNuA28D/QP+A/8DvwHAAU8CUAJRAt8C4ALhAqEAogAxATIBMwHBAcIB'
+      'wwFpT2pP+U/6T/tPowCkAKUA/E/9T6YAqQCqADYBOQE6ATQBNQHEAcUBxgFUAlUCVgJS'
+      'AlMC4gLjAuQCcgNzA3QDcANxAwAEAQQCBJAEkQSSBI4EjwQeBR8FIAWuBa8FsAWsBa0F'
+      'PAY9Bj4GzAbNBs4GygbLBloHWwdcB+oH6wfsB+gH6Qd4CHkIeggICQkJCgkGCQcJlgmX'
+      'CZgJJgonCigKJAolCrQKtQq2CkQLRQtGC0ILQwvSC9ML1AtiDGMMZAxOEGEM3hARDhIO'
+      'bhGhDqIOHRMeE60TrhPhED0UPhRxETEPMg/BD8IPww9REFIQUxATDhQOow6kDqUOMw80'
+      'DzUP1QvWC2UMZgxnDBUOFg4XDrcKuApHC0gLSQvXC9gL2QuZCZoJKQoqCisKuQq6CrsK'
+      'ewh8CAsJDAkNCZsJnAmdCV0HXgftB+4H7wd9CH4Ifwg/BkAGzwbQBtEGXwdgB2EHIQUi'
+      'BbEFsgWzBUEGQgZDBgMEBASTBJQElQQjBSQFJQXlAuYCdQN2A3kDBQQGBAkEyQHKAVkC'
+      'WgJbAukC6gLrAqsArAA7ATwBPQHLAcwBzQFxT3JPAVACUANQrQCuAK8ABFAFULAAsQCy'
+      'AEABQQFCAT4BPwHOAc8B0AFeAl8CYAJcAl0C7ALtAu4CfAN9A34DegN7AwoECwQMBJoE'
+      'mwScBJYEmQQmBSkFKgW2BbkFugW0BbUFRAZFBkYG1AbVBtYG0gbTBmIHYwdkB/IH8wf0'
+      'B/AH8QeACIEIgggQCREJEgkOCQ8JngmfCaAJLgovCjAKLAotCrwKvQq+CkwLTQtOC0oL'
+      'SwvaC9sL3AtqDGsMbAxoDGkMGA4ZDhoOqA6pDqoOpg6nDjYPNw84D8YPxw/ID8QPxQ9U'
+      'EFUQVhDkEOUQ5hDiEOMQchFzEXQRAhIDEgQSzhQBEl4VkRKSEu4VIRMiE50XnhctGC4Y'
+      'YRW9GL4Y8RWxE7ITQRRCFEMU0RTSFNMUkxKUEiMTJBMlE7MTtBO1E3URdhEFEgYSBxKV'
+      'EpYSlxJXEFgQ5xDoEOkQdxF4EXkROQ86D8kPyg/LD1kQWhBbEBsOHA6rDqwOrQ47DzwP'
+      'PQ/dC94LbQxuDG8MHQ4eDh8OvwrACk8LUAtRC98L4AvhC6EJogkxCjIKMwrBCsIKwwqD'
+      'CIQIEwkUCRUJowmkCaUJZQdmB/UH9gf5B4UIhgiJCEkGSgbZBtoG2wZpB2oHawcrBSwF'
+      'uwW8Bb0FSwZMBk0GDQQOBJ0EngSfBC0FLgUvBe8C8AJ/A4ADgQMPBBAEEQTRAdIBYQJi'
+      'AmMC8QLyAvMCswC0AEMBRAFFAdMB1AHVAXlPek8JUApQC1C1ALYAtwAMUA1QuAC5ALoA'
+      'SAFJAUoBRgFHAdYB1wHYAWYCZwJoAmQCZQL0AvUC9gKEA4UDhgOCA4MDEgQTBBQEogSj'
+      'BKQEoAShBDAFMQUyBcAFwQXCBb4FvwVOBk8GUAbeBt8G4AbcBt0GbAdtB24H/Af9B/4H'
+      '+gf7B4oIiwiMCBoJGwkcCRYJGQmmCakJqgk2CjkKOgo0CjUKxArFCsYKVAtVC1YLUgtT'
+      'C+IL4wvkC3IMcwx0DHAMcQwgDiEOIg6wDrEOsg6uDq8OPg8/D0APzg/PD9APzA/ND1wQ'
+      'XRBeEOwQ7RDuEOoQ6xB6EXsRfBEKEgsSDBIIEgkSmBKZEpoSKBMpEyoTJhMnE7YTtxO4'
+      'E0YURxRIFEQURRTUFNUU1hRkFWUVZhViFWMV8hXzFfQVghaDFoQWThmBFt4ZERcSF24a'
+      'oReiFz0dPh3NHc4d4RldHl4ekRsxGDIYwRjCGMMYURlSGVMZExcUF6MXpBelFzMYNBg1'
+      'GPUV9hWFFoYWhxYVFxYXFxfXFNgUZxVoFWkV9xX4FfkVuRO6E0kUShRLFNkU2hTbFJsS'
+      'nBIrEywTLRO7E7wTvRN9EX4RDRIOEg8SnRKeEp8SXxBgEO8Q8BDxEH8RgBGBEUEPQg/R'
+      'D9IP0w9hEGIQYxAjDiQOsw60DrUOQw9ED0UP5QvmC3UMdgx5DCUOJg4pDskKygpZC1oL'
+      'WwvpC+oL6wurCawJOwo8Cj0KywrMCs0KjQiOCB0JHgkfCa0JrgmvCW8HcAf/BwAIAQiP'
+      'CJAIkQhRBlIG4QbiBuMGcQdyB3MHMwU0BcMFxAXFBVMGVAZVBhUEFgSlBKYEpwQ1BTYF'
+      'NwX3AvgChwOIA4kDFwQYBBkE2QHaAWkCagJrAvkC+gL7ArsAvABLAUwBTQHbAdwB3QGD'
+      'T4RPE1AUUBVQvQC+AMEAFlAXUMIAwwDEAFIBUwFUAU4BUQHeAeEB4gFuAnECcgJsAm0C'
+      '/AL9Av4CjAONA44DigOLAxoEGwQcBKoEqwSsBKgEqQQ4BTkFOgXIBckFygXGBccFVgZX'
+      'BlgG5gbnBugG5AblBnQHdQd2BwQIBQgGCAIIAwiSCJMIlAgiCSMJJAkgCSEJsAmxCbIJ'
+      'QApBCkIKPgo/Cs4KzwrQCl4LXwtgC1wLXQvsC+0L7gt8DH0Mfgx6DHsMKg4rDiwOug67'
+      'DrwOtg65DkYPSQ9KD9YP2Q/aD9QP1Q9kEGUQZhD0EPUQ9hDyEPMQghGDEYQREhITEhQS'
+      'EBIREqASoRKiEjATMRMyEy4TLxO+E78TwBNOFE8UUBRMFE0U3BTdFN4UbBVtFW4VahVr'
+      'FfoV+xX8FYoWixaMFogWiRYYFxkXGheoF6kXqhemF6cXNhg3GDgYxhjHGMgYxBjFGFQZ'
+      'VRlWGeQZ5RnmGeIZ4xmSG5MblBsiHCMcJBzuHiEcfh+xHLIcDiBBHUIdvSG+IU0iTiKB'
+      'H90i3iIRINEd0h1hHmIeYx7xHvIe8x6zHLQcQx1EHUUd0x3UHdUdlRuWGyUcJhwnHLUc'
+      'thy3HFcZWBnnGegZ6RmXG5gbmRs5GDoYyRjKGMsYWRlaGVsZGxccF6sXrBetFzsYPBg9'
+      'GP0V/hWNFo4WjxYdFx4XHxffFOAUbxVwFXEV/xUAFgEWwRPCE1EUUhRTFOEU4hTjFKMS'
+      'pBIzEzQTNRPDE8QTxROFEYYRFRIWEhkSpRKmEqkSaRBqEPkQ+hD7EIkRihGLEUsPTA/b'
+      'D9wP3Q9rEGwQbRAtDi4OvQ6+Dr8OTQ9OD08P7wvwC38MgAyBDC8OMA4xDtEK0gphC2IL'
+      'YwvxC/IL8wuzCbQJQwpECkUK0wrUCtUKlQiWCCUJJgknCbUJtgm3CXcHeAcHCAgICQiX'
+      'CJgImQhZBloG6QbqBusGeQd6B3sHOwU8BcsFzAXNBVsGXAZdBh0EHgStBK4EsQQ9BT4F'
+      'QQUBAwIDkQOSA5MDIQQiBCME4wHkAXMCdAJ1AgMDBAMFA8UAxgBVAVYBVwHlAeYB5wGL'
+      'T4xPG1AcUB1QxwDIAMkAHlAfUMoAywDMAFoBWwFcAVgBWQHoAekB6gF4AnkCegJ2AncC'
+      'BgMHAwgDlgOXA5gDlAOVAyQEJQQmBLQEtQS2BLIEswRCBUMFRAXSBdMF1AXOBdEFXgZh'
+      'BmIG7gbxBvIG7AbtBnwHfQd+BwwIDQgOCAoICwiaCJsInAgqCSsJLAkoCSkJuAm5CboJ'
+      'SApJCkoKRgpHCtYK1wrYCmYLZwtoC2QLZQv0C/UL9guEDIUMhgyCDIMMMg4zDjQOwg7D'
+      'DsQOwA7BDlAPUQ9SD+AP4Q/iD94P3w9uEG8QcBD+EP8QABH8EP0QjBGNEY4RHBIdEh4S'
+      'GhIbEqoSqxKsEjoTOxM8EzYTORPGE8kTyhNWFFkUWhRUFFUU5BTlFOYUdBV1FXYVchVz'
+      'FQIWAxYEFpIWkxaUFpAWkRYgFyEXIhewF7EXsheuF68XPhg/GEAYzhjPGNAYzBjNGFwZ'
+      'XRleGewZ7RnuGeoZ6xmaG5sbnBsqHCscLBwoHCkcuBy5HLocSB1JHUodRh1HHdYd1x3Y'
+      'HWYeZx5oHmQeZR70HvUe9h6EH4Ufhh+CH4MfEiATIBQgoiCjIKQgbiOhIP4jMSEyIY4k'
+      'wSHCIT0mPibNJs4mASRdJ14nkSRRIlIi4SLiIuMicSNyI3MjMyE0IcMhxCHFIVMiVCJV'
+      'IhUgFiClIKYgpyA1ITYhNyH3Hvgehx+IH4kfFyAYIBkg2R3aHWkeah5rHvke+h77Hrsc'
+      'vBxLHUwdTR3bHdwd3R2dG54bLRwuHC8cvRy+HL8cXxlgGe8Z8BnxGZ8boBuhG0EYQhjR'
+      'GNIY0xhhGWIZYxkjFyQXsxe0F7UXQxhEGEUYBRYGFpUWlhaZFiUXJhcpF+kU6hR5FXoV'
+      'exUJFgoWCxbLE8wTWxRcFF0U6xTsFO0UrRKuEj0TPhM/E80TzhPPE48RkBEfEiASIRKv'
+      'ErASsRJxEHIQARECEQMRkRGSEZMRUw9UD+MP5A/lD3MQdBB1EDUONg7FDsYOxw5VD1YP'
+      'Vw/3C/gLhwyIDIkMNw44DjkO2QraCmkLagtrC/kL+gv7C7sJvAlLCkwKTQrbCtwK3Qqd'
+      'CJ4ILQkuCTEJvQm+CcEJgQeCBxEIEggTCKEIogijCGMGZAbzBvQG9QaDB4QHhQdFBUYF'
+      '1QXWBdcFZQZmBmcGJwQoBLcEuAS5BEcFSAVJBQkDCgOZA5oDmwMpBCoEKwTrAewBewJ8'
+      'An0CCwMMAw0DzQDOAF0BXgFfAe0B7gHvAZNPlE8jUCRQJVDPANAA0QAmUClQ0gDTANQA'
+      'YgFjAWQBYAFhAfAB8QHyAYACgQKCAn4CfwIOAw8DEAOeA58DoAOcA50DLAQtBC4EvAS9'
+      'BL4EugS7BEoFSwVMBdoF2wXcBdgF2QVoBmkGagb4BvkG+gb2BvcGhgeHB4gHFggXCBgI'
+      'FAgVCKQIpQimCDQJNQk2CTIJMwnCCcMJxAlSClMKVApOClEK3grhCuIKbgtxC3ILbAtt'
+      'C/wL/Qv+C4wMjQyODIoMiww6DjsOPA7KDssOzA7IDskOWA9ZD1oP6A/pD+oP5g/nD3YQ'
+      'dxB4EAYRBxEIEQQRBRGUEZURlhEkEiUSJhIiEiMSshKzErQSQhNDE0QTQBNBE9AT0RPS'
+      'E2AUYRRiFF4UXxTuFO8U8BR+FX8VgBV8FX0VDBYNFg4WnBadFp4WmhabFioXKxcsF7oX'
+      'uxe8F7YXuRdGGEkYShjWGNkY2hjUGNUYZBllGWYZ9Bn1GfYZ8hnzGaIboxukGzIcMxw0'
+      'HDAcMRzAHMEcwhxQHVEdUh1OHU8d3h3fHeAdbh5vHnAebB5tHvwe/R7+HowfjR+OH4of'
+      'ix8aIBsgHCCqIKsgrCCoIKkgOCE5ITohyCHJIcohxiHHIVYiVyJYIuYi5yLoIuQi5SJ0'
+      'I3UjdiMEJAUkBiQCJAMkkiSTJJQkIiUjJSQl7ichJZ4psSWyJS4qQSZCJt0r3ittLG4s'
+      'oSn9LP4sMSrRJtImYSdiJ2MnESkSKRMpsyW0JUMmRCZFJtMm1CbVJpUkliQlJSYlJyW1'
+      'JbYltyV3I3gjByQIJAkklySYJJkkWSJaIuki6iLrInkjeiN7IzshPCHLIcwhzSFbIlwi'
+      'XSIdIB4grSCuIK8gPSE+IT8h/x4AH48fkB+RHx8gICAhIOEd4h1xHnIecx4BHwIfAx/D'
+      'HMQcUx1UHVUd4x3kHeUdpRumGzUcNhw5HMUcxhzJHGkZahn5GfoZ+xmpG6obqxtLGEwY'
+      '2xjcGN0YaxlsGW0ZLRcuF70Xvhe/F00YThhPGA8WEBafFqAWoRYvFzAXMRfxFPIUgRWC'
+      'FYMVERYSFhMW0xPUE2MUZBRlFPMU9BT1FLUSthJFE0YTRxPVE9YT1xOXEZgRJxIoEikS'
+      'txK4ErkSeRB6EAkRChELEZkRmhGbEVsPXA/rD+wP7Q97EHwQfRA9Dj4OzQ7ODtEOXQ9e'
+      'D2EPAQwCDJEMkgyTDEEOQg5DDuMK5ApzC3QLdQsDDAQMBQzFCcYJVQpWClcK5QrmCucK'
+      'pwioCDcJOAk5CccJyAnJCYkHigcZCBoIGwipCKoIqwhrBmwG+wb8Bv0GiweMB40HTQVO'
+      'Bd0F3gXfBW0GbgZvBi8EMAS/BMAEwQRPBVAFUQURAxIDoQOiA6MDMQQyBDME8wH0AYMC'
+      'hAKFAhMDFAMVA9UA1gBlAWYBaQH1AfYB+QGdT55PLVAuUC9Q2QDaANsAMFAxUNwA3QDe'
+      'AGwBbQFuAWoBawH6AfsB/AGKAosCjAKGAokCFgMZAxoDpgOpA6oDpAOlAzQENQQ2BMQE'
+      'xQTGBMIEwwRSBVMFVAXiBeMF5AXgBeEFcAZxBnIGAAcBBwIH/gb/Bo4HjweQBx4IHwgg'
+      'CBwIHQisCK0Irgg8CT0JPgk6CTsJygnLCcwJWgpbClwKWApZCugK6QrqCngLeQt6C3YL'
+      'dwsGDAcMCAyWDJcMmAyUDJUMRA5FDkYO1A7VDtYO0g7TDmIPYw9kD/IP8w/0D+4P8Q9+'
+      'EIEQghAOEREREhEMEQ0RnBGdEZ4RLBItEi4SKhIrEroSuxK8EkoTSxNME0gTSRPYE9kT'
+      '2hNoFGkUahRmFGcU9hT3FPgUhhWHFYgVhBWFFRQWFRYWFqQWpRamFqIWoxYyFzMXNBfC'
+      'F8MXxBfAF8EXUBhRGFIY4BjhGOIY3hjfGG4ZbxlwGf4Z/xkAGvwZ/RmsG60brhs8HD0c'
+      'Phw6HDscyhzLHMwcWh1bHVwdVh1ZHeYd6R3qHXYeeR56HnQedR4EHwUfBh+UH5Uflh+S'
+      'H5MfIiAjICQgsiCzILQgsCCxIEAhQSFCIdAh0SHSIc4hzyFeIl8iYCLuIu8i8CLsIu0i'
+      'fCN9I34jDCQNJA4kCiQLJJokmyScJColKyUsJSglKSW4JbkluiVIJkkmSiZGJkcm1ibX'
+      'JtgmZidnJ2gnZCdlJxQpFSkWKaQppSmmKaIpoykyKjMqNCrCKsMqxCqOLcEqHi5RK1Ir'
+      'ri7hK+IrXTBeMO0w7jAhLn0xfjGxLnEsciwBLQItAy2RLZItky1TK1Qr4yvkK+Urcyx0'
+      'LHUsNSo2KsUqxirHKlUrVitXKxcpGCmnKagpqSk3KjgqOSrZJtomaSdqJ2snGSkaKRsp'
+      'uyW8JUsmTCZNJtsm3CbdJp0kniQtJS4lLyW9Jb4lvyV/I4AjDyQQJBEknySgJKEkYSJi'
+      'IvEi8iLzIoEjgiODI0MhRCHTIdQh1SFjImQiZSIlICYgtSC2ILkgRSFGIUkhCR8KH5kf'
+      'mh+bHykgKiArIOsd7B17HnwefR4LHwwfDR/NHM4cXR1eHV8d7R3uHe8drxuwGz8cQBxB'
+      'HM8c0BzRHHEZchkBGgIaAxqxG7IbsxtTGFQY4xjkGOUYcxl0GXUZNRc2F8UXxhfHF1UY'
+      'VhhXGBcWGBanFqgWqRY3FzgXORf5FPoUiRWKFYsVGRYaFhsW2xPcE2sUbBRtFPsU/BT9'
+      'FL0SvhJNE04TURPdE94T4ROhEaIRMRIyEjMSwRLCEsMSgxCEEBMRFBEVEaMRpBGlEWUP'
+      'Zg/1D/YP9w+FEIYQhxBHDkgO1w7YDtkOZw9oD2kPCQwKDJkMmgybDEkOSg5LDusK7Ap7'
+      'C3wLfQsLDAwMDQzNCc4JXQpeCl8K7QruCu8KrwiwCD8JQAlBCc8J0AnRCZEHkgchCCII'
+      'IwixCLIIswhzBnQGAwcEBwUHkweUB5UHVQVWBeUF5gXpBXUGdgZ5BjkEOgTJBMoEywRZ'
+      'BVoFWwUbAxwDqwOsA60DOwQ8BD0E/QH+AY0CjgKPAh0DHgMfA98A4ABvAXABcQH/AQAC'
+      'AQKlT6ZPNVA2UDdQ4QDiAOMAOFA5UOQA5QDmAHQBdQF2AXIBcwECAgMCBAKSApMClAKQ'
+      'ApECIAMhAyIDsAOxA7IDrgOvAz4EPwRABM4EzwTQBMwEzQRcBV0FXgXsBe0F7gXqBesF'
+      'egZ7BnwGCgcLBwwHBgcJB5YHmQeaByYIKQgqCCQIJQi0CLUItghECUUJRglCCUMJ0gnT'
+      'CdQJYgpjCmQKYAphCvAK8QryCoALgQuCC34LfwsODA8MEAyeDJ8MoAycDJ0MTA5NDk4O'
+      '3A7dDt4O2g7bDmoPaw9sD/oP+w/8D/gP+Q+IEIkQihAYERkRGhEWERcRphGnEagRNhI3'
+      'EjgSNBI1EsQSxRLGElQTVRNWE1ITUxPiE+MT5BNyFHMUdBRuFHEU/hQBFQIVjhWRFZIV'
+      'jBWNFRwWHRYeFqwWrRauFqoWqxY6FzsXPBfKF8sXzBfIF8kXWBhZGFoY6BjpGOoY5hjn'
+      'GHYZdxl4GQYaBxoIGgQaBRq0G7UbthtEHEUcRhxCHEMc0hzTHNQcYh1jHWQdYB1hHfAd'
+      '8R3yHYAegR6CHn4efx4OHw8fEB+eH58foB+cH50fLCAtIC4gvCC9IL4guiC7IEohSyFM'
+      'Idoh2yHcIdYh2SFmImkiaiL2Ivki+iL0IvUihCOFI4YjFCQVJBYkEiQTJKIkoySkJDIl'
+      'MyU0JTAlMSXAJcElwiVQJlEmUiZOJk8m3ibfJuAmbidvJ3AnbCdtJxwpHSkeKawprSmu'
+      'Kaopqyk6KjsqPCrKKssqzCrIKskqWCtZK1or6CvpK+or5ivnK3Ysdyx4LAYtBy0ILQQt'
+      'BS2ULZUtli0kLiUuJi4iLiMusi6zLrQuQi9DL0QvDjJBL54y0S/SLy4zYTBiMN003jRt'
+      'NW41oTIdNx43MTPxMPIwgTGCMYMxETISMhMy0y/UL2MwZDBlMPMw9DD1MLUuti5FL0Yv'
+      'Ry/VL9Yv1y+XLZgtJy4oLikuty64LrkueSx6LAktCi0LLZktmi2bLVsrXCvrK+wr7St7'
+      'LHwsfSw9Kj4qzSrOKs8qXSteK18rHykgKa8psCmxKT8qQCpBKuEm4iZxJ3IncychKSIp'
+      'IynDJcQlUyZUJlUm4ybkJuUmpSSmJDUlNiU5JcUlxiXJJYkjiiMZJBokGySpJKokqyRr'
+      'Imwi+yL8Iv0iiyOMI40jTSFOId0h3iHfIW0ibiJvIi8gMCC/IMAgwSBPIVAhUSERHxIf'
+      'oR+iH6MfMSAyIDMg8x30HYMehB6FHhMfFB8VH9Uc1hxlHWYdZx31HfYd9x23G7gbRxxI'
+      'HEkc1xzYHNkceRl6GQkaChoLGrkbuhu7G1sYXBjrGOwY7Rh7GXwZfRk9Fz4XzRfOF9EX'
+      'XRheGGEYIRYiFrEWshazFkEXQhdDFwMVBBWTFZQVlRUjFiQWJRblE+YTdRR2FHcUBRUG'
+      'FQcVxxLIElcTWBNZE+cT6BPpE6kRqhE5EjoSOxLJEsoSyxKLEIwQGxEcER0RqxGsEa0R'
+      'bQ9uD/0P/g//D40QjhCPEE8OUA7fDuAO4Q5vD3APcQ8RDBIMoQyiDKMMUQ5SDlMO8wr0'
+      'CoMLhAuFCxMMFAwVDNUJ1gllCmYKaQr1CvYK+Qq5CLoISQlKCUsJ2QnaCdsJmwecBysI'
+      'LAgtCLsIvAi9CH0GfgYNBw4HDwedB54HnwdfBWAF7wXwBfEFfwaABoEGQQRCBNEE0gTT'
+      'BGEFYgVjBSMDJAOzA7QDtQNDBEQERQQFAgYClQKWApcCJQMmAycD5wDoAHcBeAF5AQcC'
+      'CAIJAq1Prk89UD5QQVDpAOoA6wBCUENQ7ADtAO4AfAF9AX4BegF7AQoCCwIMApoCmwKc'
+      'ApgCmQIoAykDKgO4A7kDugO2A7cDRgRHBEgE1gTXBNgE1ATVBGQFZQVmBfQF9QX2BfIF'
+      '8wWCBoMGhAYSBxMHFAcQBxEHoAehB6IHMAgxCDIILggvCL4IvwjACE4JTwlQCUwJTQnc'
+      'Cd0J3glsCm0KbgpqCmsK+gr7CvwKiguLC4wLhguJCxYMGQwaDKYMqQyqDKQMpQxUDlUO'
+      'Vg7kDuUO5g7iDuMOcg9zD3QPAhADEAQQABABEJAQkRCSECARIREiER4RHxGuEa8RsBE+'
+      'Ej8SQBI8Ej0SzBLNEs4SXBNdE14TWhNbE+oT6xPsE3oUexR8FHgUeRQIFQkVChWYFZkV'
+      'mhWWFZcVJhYnFigWtha3FrgWtBa1FkQXRRdGF9QX1RfWF9IX0xdiGGMYZBjyGPMY9Bju'
+      'GPEYfhmBGYIZDhoRGhIaDBoNGrwbvRu+G0wcTRxOHEocSxzaHNsc3BxqHWsdbB1oHWkd'
+      '+B35HfodiB6JHooehh6HHhYfFx8YH6Yfpx+oH6QfpR80IDUgNiDEIMUgxiDCIMMgUiFT'
+      'IVQh4iHjIeQh4CHhIXAicSJyIgAjASMCI/4i/yKOI48jkCMeJB8kICQcJB0krCStJK4k'
+      'PCU9JT4lOiU7JcolyyXMJVomWyZcJlYmWSbmJukm6iZ2J3kneid0J3UnJCklKSYptCm1'
+      'KbYpsimzKUIqQypEKtIq0yrUKtAq0SpgK2ErYivwK/Er8ivuK+8rfix/LIAsDi0PLRAt'
+      'DC0NLZwtnS2eLSwuLS4uLiouKy66LrsuvC5KL0svTC9IL0kv2C/ZL9ovaDBpMGowZjBn'
+      'MPYw9zD4MIYxhzGIMYQxhTEUMhUyFjKkMqUypjKiMqMyMjMzMzQzwjPDM8QzrjfBMz44'
+      'UTRSNM444TTiNH06fjoNOw47QTidO5470TiRNpI2ITciNyM3sTeyN7M3UzRUNOM05DTl'
+      'NJM2lDaVNjUzNjPFM8YzxzNVNFY0VzQXMhgypzKoMqkyNzM4Mzkz+TD6MIkxijGLMRky'
+      'GjIbMtsv3C9rMGwwbTD7MPww/TC9Lr4uTS9OL08v3S/eL98vny2gLS8uMC4xLr8uwC7B'
+      'LoEsgiwRLRItEy2hLaItoy1jK2Qr8yv0K/UrgyyELIUsRSpGKtUq1irZKmUrZitpKykp'
+      'Kim5KbopuylJKkoqSyrrJuwmeyd8J30nKyksKS0pzSXOJV0mXiZfJu0m7ibvJq8ksCQ/'
+      'JUAlQSXPJdAl0SWRI5IjISQiJCMksSSyJLMkcyJ0IgMjBCMFI5MjlCOVI1UhViHlIeYh'
+      '5yF1InYidyI3IDggxyDIIMkgVyFYIVkhGR8aH6kfqh+rHzkgOiA7IPsd/B2LHowejR4b'
+      'HxwfHR/dHN4cbR1uHXEd/R3+HQEewRvCG1EcUhxTHOEc4hzjHIMZhBkTGhQaFRrDG8Qb'
+      'xRtlGGYY9Rj2GPcYhRmGGYcZRxdIF9cX2BfZF2cYaBhpGCkWKha5FroWuxZJF0oXSxcL'
+      'FQwVmxWcFZ0VKxYsFi0W7RPuE30UfhR/FA0VDhUPFc8S0BJfE2ATYRPvE/AT8ROxEbIR'
+      'QRJCEkMS0RLSEtMSkxCUECMRJBElEbMRtBG1EXUPdg8FEAYQCRCVEJYQmRBZDloO6Q7q'
+      'DusOeQ96D3sPGwwcDKsMrAytDFsOXA5dDv0K/gqNC44LjwsdDB4MHwzfCeAJbwpwCnEK'
+      '/woACwELwQjCCFEJUglTCeEJ4gnjCaMHpAczCDQINQjDCMQIxQiFBoYGFQcWBxcHpQem'
+      'B6cHZwVoBfcF+AX5BYcGiAaJBkkESgTZBNoE2wRpBWoFawUrAywDuwO8A70DSwRMBE0E'
+      'DQIOAp0CngKhAi0DLgMxA/EA8gCBAYIBgwERAhICEwK3T7hPR1BIUElQ8wD0APUASlBL'
+      'UPYA9wD4AIYBhwGIAYQBhQEUAhUCFgKkAqUCpgKiAqMCMgMzAzQDwgPDA8QDvgPBA04E'
+      'UQRSBN4E4QTiBNwE3QRsBW0FbgX8Bf0F/gX6BfsFigaLBowGGgcbBxwHGAcZB6gHqQeq'
+      'BzgIOQg6CDYINwjGCMcIyAhWCVcJWAlUCVUJ5AnlCeYJdAp1CnYKcgpzCgILAwsEC5IL'
+      'kwuUC5ALkQsgDCEMIgywDLEMsgyuDK8MXg5fDmAO7g7vDvAO7A7tDnwPfQ9+DwwQDRAO'
+      'EAoQCxCaEJsQnBAqESsRLBEmESkRthG5EboRRhJJEkoSRBJFEtQS1RLWEmQTZRNmE2IT'
+      'YxPyE/MT9BOCFIMUhBSAFIEUEBURFRIVoBWhFaIVnhWfFS4WLxYwFr4WvxbAFrwWvRZM'
+      'F00XThfcF90X3hfaF9sXahhrGGwY+hj7GPwY+Bj5GIgZiRmKGRgaGRoaGhYaFxrGG8cb'
+      'yBtWHFccWBxUHFUc5BzlHOYcdB11HXYdch1zHQIeAx4EHpIekx6UHo4ekR4eHyEfIh+u'
+      'H7Efsh+sH60fPCA9ID4gzCDNIM4gyiDLIFohWyFcIeoh6yHsIegh6SF4InkieiIIIwkj'
+      'CiMGIwcjliOXI5gjJiQnJCgkJCQlJLQktSS2JEQlRSVGJUIlQyXSJdMl1CViJmMmZCZg'
+      'JmEm8CbxJvImgCeBJ4Infid/Jy4pLykwKb4pvynAKbwpvSlMKk0qTircKt0q3iraKtsq'
+      'aitrK2wr+iv7K/wr9iv5K4YsiSyKLBYtGS0aLRQtFS2kLaUtpi00LjUuNi4yLjMuwi7D'
+      'LsQuUi9TL1QvUC9RL+Av4S/iL3AwcTByMG4wbzD+MP8wADGOMY8xkDGMMY0xHDIdMh4y'
+      'rDKtMq4yqjKrMjozOzM8M8ozyzPMM8gzyTNYNFk0WjToNOk06jTmNOc0ljaXNpg2Jjcn'
+      'Nyg3JDclN7Q3tTe2N0Q4RThGOEI4QzjSONM41DhiOWM5ZDkuPGE5vjzxOfI5Tj2BOoI6'
+      '/T7+Po0/jj/BPB1AHkBRPRE7EjuhO6I7ozsxPDI8MzzzOfQ5gzqEOoU6EzsUOxU71TjW'
+      'OGU5ZjlnOfU59jn3Obc3uDdHOEg4STjXONg42TiZNpo2KTcqNys3uTe6N7s3WzRcNOs0'
+      '7DTtNJs2nDadNj0zPjPNM84zzzNdNF40XzQfMiAyrzKwMrEyPzNAM0EzATECMZExkjGT'
+      'MSEyIjIjMuMv5C9zMHQwdTADMQQxBTHFLsYuVS9WL1kv5S/mL+kvqS2qLTkuOi47Lsku'
+      'yi7LLossjCwbLRwtHS2rLawtrS1tK24r/Sv+K/8rjSyOLI8sTypQKt8q4CrhKm8rcCtx'
+      'KzEpMinBKcIpwylRKlIqUyrzJvQmgyeEJ4UnMyk0KTUp1SXWJWUmZiZnJvUm9ib3Jrck'
+      'uCRHJUglSSXXJdgl2SWZI5ojKSQqJCskuSS6JLskeyJ8IgsjDCMNI5sjnCOdI10hXiHt'
+      'Ie4h8SF9In4igSJBIEIg0SDSINMgYSFiIWMhIx8kH7MftB+1H0MgRCBFIAUeBh6VHpYe'
+      'lx4lHyYfJx/nHOgcdx14HXkdBx4IHgkeyRvKG1kcWhxbHOkc6hzrHIsZjBkbGhwaHRrL'
+      'G8wbzRttGG4Y/Rj+GP8YjRmOGY8ZTxdQF98X4BfhF28YcBhxGDEWMhbBFsIWwxZRF1IX'
+      'UxcTFRQVoxWkFaUVMxY0FjUW9RP2E4UUhhSJFBUVFhUZFdkS2hJpE2oTaxP5E/oT+xO7'
+      'EbwRSxJMEk0S2xLcEt0SnRCeEC0RLhEvEb0RvhG/EX8PgA8PEBAQERCfEKAQoRBhDmIO'
+      '8Q7yDvMOgQ+CD4MPIwwkDLMMtAy1DGMOZA5lDgULBguVC5YLlwslDCYMJwznCegJdwp4'
+      'CnkKBwsICwkLyQjKCFkJWglbCekJ6gnrCasHrAc7CDwIPQjLCMwIzQiNBo4GHQceByEH'
+      'rQeuB7EHcQVyBQEGAgYDBpEGkgaTBlMEVATjBOQE5QRzBXQFdQU1AzYDxQPGA8cDVQRW'
+      'BFcEFwIYAqcCqAKpAjcDOAM5A/kA+gCJAYoBiwEZAhoCGwK/T8BPT1BQUFFQ+wD8AP0A'
+      'UlBTUP4A/wAAAY4BjwGQAYwBjQEcAh0CHgKsAq0CrgKqAqsCOgM7AzwDygPLA8wDyAPJ'
+      'A1gEWQRaBOgE6QTqBOYE5wR2BXcFeAUGBgcGCAYEBgUGlAaVBpYGJAclByYHIgcjB7IH'
+      'swe0B0IIQwhECD4IQQjOCNEI0gheCWEJYglcCV0J7AntCe4JfAp9Cn4Kegp7CgoLCwsM'
+      'C5oLmwucC5gLmQsoDCkMKgy4DLkMugy2DLcMZg5nDmgO9g73DvgO9A71DoQPhQ+GDxQQ'
+      'FRAWEBIQExCiEKMQpBAyETMRNBEwETERwBHBEcIRUBJRElISThJPEt4S3xLgEm4TbxNw'
+      'E2wTbRP8E/0T/hOMFI0UjhSKFIsUGhUbFRwVqhWrFawVphWpFTYWORY6FsYWyRbKFsQW'
+      'xRZUF1UXVhfkF+UX5hfiF+MXchhzGHQYAhkDGQQZABkBGZAZkRmSGSAaIRoiGh4aHxrO'
+      'G88b0BteHF8cYBxcHF0c7BztHO4cfB19HX4deh17HQoeCx4MHpoemx6cHpgemR4oHykf'
+      'Kh+4H7kfuh+2H7cfRiBHIEgg1iDXINgg1CDVIGQhZSFmIfQh9SH2IfIh8yGCIoMihCIS'
+      'IxMjFCMOIxEjniOhI6IjLiQxJDIkLCQtJLwkvSS+JEwlTSVOJUolSyXaJdsl3CVqJmsm'
+      'bCZoJmkm+Cb5JvomiCeJJ4onhieHJzYpNyk4KcYpxynIKcQpxSlUKlUqVirkKuUq5iri'
+      'KuMqcitzK3QrAiwDLAQsACwBLJAskSySLCAtIS0iLR4tHy2uLa8tsC0+Lj8uQC48Lj0u'
+      'zC7NLs4uXC9dL14vWi9bL+ov6y/sL3owezB8MHYweTAGMQkxCjGWMZkxmjGUMZUxJDIl'
+      'MiYytDK1MrYysjKzMkIzQzNEM9Iz0zPUM9Az0TNgNGE0YjTwNPE08jTuNO80njafNqA2'
+      'LjcvNzA3LDctN7w3vTe+N0w4TThOOEo4SzjaONs43DhqOWs5bDloOWk5+Dn5Ofo5iDqJ'
+      'Ooo6hjqHOhY7FzsYO6Y7pzuoO6Q7pTs0PDU8NjzEPMU8xjzCPMM8Uj1TPVQ94j3jPeQ9'
+      'rkDhPT5BcT5yPs5BAT8CP51EnkQtRS5FQUG9Rb5F0UGRP5I/IUAiQCNAsUCyQLNAcz50'
+      'PgM/BD8FP5M/lD+VP1U9Vj3lPeY95z11PnY+dz43PDg8xzzIPMk8Vz1YPVk9GTsaO6k7'
+      'qjurOzk8Ojw7PPs5/DmLOow6jTobOxw7HTvdON44bTluOW85/Tn+Of85vzfAN084UDhR'
+      'ON844DjhOKE2ojYxNzI3MzfBN8I3wzdjNGQ08zT0NPU0ozakNqU2RTNGM9Uz1jPZM2U0'
+      'ZjRpNCkyKjK5MroyuzJJM0ozSzMLMQwxmzGcMZ0xKzIsMi0y7S/uL30wfjB/MA0xDjEP'
+      'Mc8u0C5fL2AvYS/vL/Av8S+xLbItQS5CLkMu0S7SLtMukyyULCMtJC0lLbMttC21LXUr'
+      'disFLAYsByyVLJYslyxXKlgq5yroKukqdyt4K3krOSk6KckpyinLKVkqWipbKvsm/CaL'
+      'J4wnjSc7KTwpPSndJd4lbSZuJnEm/Sb+JgEnwSTCJFElUiVTJeEl4iXjJaMjpCMzJDQk'
+      'NSTDJMQkxSSFIoYiFSMWIxcjpSOmI6cjZyFoIfch+CH5IYciiCKJIkkgSiDZINog2yBp'
+      'IWohayErHywfux+8H70fSyBMIE0gDR4OHp0enh6fHi0fLh8vH+8c8Bx/HYAdgR0PHhAe'
+      'ER7RG9IbYRxiHGMc8RzyHPMckxmUGSMaJBolGtMb1BvVG3UYdhgFGQYZCRmVGZYZmRlZ'
+      'F1oX6RfqF+sXeRh6GHsYOxY8FssWzBbNFlsXXBddFx0VHhWtFa4VrxU9Fj4WPxb/EwAU'
+      'jxSQFJEUHxUgFSEV4RLiEnETchNzEwEUAhQDFMMRxBFTElQSVRLjEuQS5RKlEKYQNRE2'
+      'ETcRxRHGEccRhw+IDxcQGBAZEKcQqBCpEGkOag75DvoO+w6JD4oPiw8rDCwMuwy8DL0M'
+      'aw5sDm0ODQsOC50LnguhCy0MLgwxDPEJ8gmBCoIKgwoRCxILEwvTCNQIYwlkCWUJ8wn0'
+      'CfUJtQe2B0UIRghHCNUI1gjXCJcGmAYnBygHKQe3B7gHuQd5BXoFCQYKBgsGmQaaBpsG'
+      'WwRcBOsE7ATtBHsFfAV9BT0DPgPNA84DzwNdBF4EXwQfAiACrwKwArECPwNAA0EDAQEC'
+      'AZEBkgGTASECIgIjAslPyk9ZUFpQW1ADAQQBBQFcUF1QBgEJAQoBlgGZAZoBlAGVASQC'
+      'JQImArQCtQK2ArICswJCA0MDRAPSA9MD1APQA9EDYARhBGIE8ATxBPIE7gTvBH4FfwWA'
+      'BQ4GDwYQBgwGDQacBp0GngYsBy0HLgcqBysHuge7B7wHSghLCEwISAhJCNgI2QjaCGgJ'
+      'aQlqCWYJZwn2CfcJ+AmGCocKiAqECoUKFAsVCxYLpAulC6YLogujCzIMMww0DMIMwwzE'
+      'DL4MwQxuDnEOcg7+DgEPAg/8Dv0OjA+ND44PHBAdEB4QGhAbEKoQqxCsEDoROxE8ETgR'
+      'ORHIEckRyhFYElkSWhJWElcS5hLnEugSdhN3E3gTdBN1EwQUBRQGFJQUlRSWFJIUkxQi'
+      'FSMVJBWyFbMVtBWwFbEVQBZBFkIW0BbRFtIWzhbPFl4XXxdgF+4X7xfwF+wX7Rd8GH0Y'
+      'fhgMGQ0ZDhkKGQsZmhmbGZwZKhorGiwaJhopGtYb2RvaG2YcaRxqHGQcZRz0HPUc9hyE'
+      'HYUdhh2CHYMdEh4THhQeoh6jHqQeoB6hHjAfMR8yH8AfwR/CH74fvx9OIE8gUCDeIN8g'
+      '4CDcIN0gbCFtIW4h/CH9If4h+iH7IYoiiyKMIhojGyMcIxgjGSOoI6kjqiM4JDkkOiQ2'
+      'JDckxiTHJMgkViVXJVglVCVVJeQl5SXmJXQmdSZ2JnImcyYCJwMnBCeSJ5MnlCeOJ5En'
+      'PilBKUIpzinRKdIpzCnNKVwqXSpeKuwq7SruKuoq6yp6K3srfCsKLAssDCwILAksmCyZ'
+      'LJosKC0pLSotJi0nLbYtty24LUYuRy5ILkQuRS7ULtUu1i5kL2UvZi9iL2Mv8i/zL/Qv'
+      'gjCDMIQwgDCBMBAxETESMaAxoTGiMZ4xnzEuMi8yMDK+Mr8ywDK8Mr0yTDNNM04z3DPd'
+      'M94z2jPbM2o0azRsNPo0+zT8NPY0+TSmNqk2qjY2Nzk3Ojc0NzU3xDfFN8Y3VDhVOFY4'
+      'UjhTOOI44zjkOHI5czl0OXA5cTkAOgE6AjqQOpE6kjqOOo86HjsfOyA7rjuvO7A7rDut'
+      'Ozw8PTw+PMw8zTzOPMo8yzxaPVs9XD3qPes97D3oPek9eD55Pno+CD8JPwo/Bj8HP5Y/'
+      'lz+YPyZAJ0AoQCRAJUC0QLVAtkBEQUVBRkFCQUNB0kHTQdRBYkJjQmRCTkZhQt5GEUQS'
+      'RG5HoUSiRB1JHkmtSa5J4UY9Sj5KcUcxRTJFwUXCRcNFUUZSRlNGE0QURKNEpESlRDNF'
+      'NEU1RdVB1kFlQmZCZ0IVRBZEF0S3QLhAR0FIQUlB10HYQdlBmT+aPylAKkArQLlAukC7'
+      'QHs+fD4LPww/DT+bP5w/nT9dPV497T3uPe89fT5+Pn8+PzxAPM880DzRPF89YD1hPSE7'
+      'IjuxO7I7sztBPEI8QzwDOgQ6kzqUOpU6IzskOyU75TjmOHU5djl5OQU6BjoJOsk3yjdZ'
+      'OFo4WzjpOOo46zirNqw2Ozc8Nz03yzfMN803bTRuNP00/jT/NK02rjavNk8zUDPfM+Az'
+      '4TNvNHA0cTQxMjIywTLCMsMyUTNSM1MzEzEUMaMxpDGlMTMyNDI1MvUv9i+FMIYwhzAV'
+      'MRYxFzHXLtguZy9oL2kv9y/4L/kvuS26LUkuSi5LLtku2i7bLpssnCwrLSwtLS27Lbwt'
+      'vS19K34rDSwOLBEsnSyeLKEsYSpiKvEq8irzKoErgiuDK0MpRCnTKdQp1SljKmQqZSoF'
+      'JwYnlSeWJ5cnRSlGKUcp5yXoJXcmeCZ5JgcnCCcJJ8kkyiRZJVolWyXpJeol6yWrI6wj'
+      'OyQ8JD0kyyTMJM0kjSKOIh0jHiMfI60jriOvI28hcCH/IQAiASKPIpAikSJRIFIg4SDi'
+      'IOMgcSFyIXMhMx80H8MfxB/FH1MgVCBVIBUeFh6lHqYeqR41HzYfOR/5HPociR2KHYsd'
+      'GR4aHhse2xvcG2scbBxtHPsc/Bz9HJ0ZnhktGi4aLxrdG94b3xt/GIAYDxkQGREZnxmg'
+      'GaEZYRdiF/EX8hfzF4EYghiDGEMWRBbTFtQW1RZjF2QXZRclFSYVtRW2FbcVRRZGFkcW'
+      'BxQIFJcUmBSZFCcVKBUpFekS6hJ5E3oTexMJFAoUCxTLEcwRWxJcEl0S6xLsEu0SrRCu'
+      'ED0RPhFBEc0RzhHREZEPkg8hECIQIxCxELIQsxBzDnQOAw8EDwUPkw+UD5UPNQw2DMUM'
+      'xgzHDHUOdg53DhcLGAunC6gLqQs3DDgMOQz5CfoJiQqKCosKGQsaCxsL2wjcCGsJbAlt'
+      'CfsJ/An9Cb0HvgdNCE4ITwjdCN4I3wifBqAGLwcwBzEHvwfAB8EHgQWCBREGEgYTBqEG'
+      'ogajBmMEZATzBPQE9QSDBYQFhQVFA0YD1QPWA9kDZQRmBGkEKQIqArkCugK7AkkDSgNL'
+      'AwsBDAGbAZwBnQErAiwCLQLRT9JPYVBiUGNQDQEOAQ8BZFBlUBABEQESAaABoQGiAZ4B'
+      'nwEuAi8CMAK+Ar8CwAK8Ar0CTANNA04D3APdA94D2gPbA2oEawRsBPoE+wT8BPYE+QSG'
+      'BYkFigUWBhkGGgYUBhUGpAalBqYGNAc1BzYHMgczB8IHwwfEB1IIUwhUCFAIUQjgCOEI'
+      '4ghwCXEJcgluCW8J/gn/CQAKjgqPCpAKjAqNChwLHQseC6wLrQuuC6oLqws6DDsMPAzK'
+      'DMsMzAzIDMkMeA55DnoOCA8JDwoPBg8HD5YPlw+YDyYQJxAoECQQJRC0ELUQthBEEUUR'
+      'RhFCEUMR0hHTEdQRYhJjEmQSXhJhEu4S8RLyEn4TgROCE3wTfRMMFA0UDhScFJ0UnhSa'
+      'FJsUKhUrFSwVuhW7FbwVuBW5FUgWSRZKFtgW2RbaFtYW1xZmF2cXaBf2F/cX+Bf0F/UX'
+      'hBiFGIYYFBkVGRYZEhkTGaIZoxmkGTIaMxo0GjAaMRrgG+Eb4htwHHEcchxuHG8c/hz/'
+      'HAAdjh2PHZAdjB2NHRweHR4eHqwerR6uHqoeqx46HzsfPB/KH8sfzB/GH8kfViBZIFog'
+      '5iDpIOog5CDlIHQhdSF2IQQiBSIGIgIiAyKSIpMilCIiIyMjJCMgIyEjsCOxI7IjQCRB'
+      'JEIkPiQ/JM4kzyTQJF4lXyVgJVwlXSXsJe0l7iV8Jn0mfiZ6JnsmCicLJwwnmiebJ5wn'
+      'mCeZJ0gpSSlKKdgp2SnaKdYp1ylmKmcqaCr2Kvcq+Cr0KvUqhCuFK4YrFCwVLBYsEiwT'
+      'LKIsoyykLDItMy00LS4tMS2+LcEtwi1OLlEuUi5MLk0u3C7dLt4ubC9tL24vai9rL/ov'
+      '+y/8L4owizCMMIgwiTAYMRkxGjGoMakxqjGmMacxNjI3MjgyxjLHMsgyxDLFMlQzVTNW'
+      'M+Qz5TPmM+Iz4zNyNHM0dDQCNQM1BDUANQE1sDaxNrI2QDdBN0I3Pjc/N843zzfQN144'
+      'XzhgOFw4XTjsOO047jh8OX05fjl6OXs5CjoLOgw6mjqbOpw6ljqZOiY7KTsqO7Y7uTu6'
+      'O7Q7tTtEPEU8RjzUPNU81jzSPNM8Yj1jPWQ98j3zPfQ98D3xPYA+gT6CPhA/ET8SPw4/'
+      'Dz+eP58/oD8uQC9AMEAsQC1AvEC9QL5ATEFNQU5BSkFLQdpB20HcQWpCa0JsQmhCaUIY'
+      'RBlEGkSoRKlEqkSmRKdENkU3RThFxkXHRchFxEXFRVRGVUZWRuRG5UbmRuJG40ZyR3NH'
+      'dEcCSANIBEjOSgFIXkuRSJJI7kshSSJJnU2eTS1OLk5hS71Ovk7xS7FJsklBSkJKQ0rR'
+      'StJK00qTSJRII0kkSSVJs0m0SbVJdUd2RwVIBkgHSJVIlkiXSFdGWEbnRuhG6UZ3R3hH'
+      'eUc5RTpFyUXKRctFWUZaRltGG0QcRKtErEStRDtFPEU9Rd1B3kFtQm5Cb0IdRB5EH0S/'
+      'QMBAT0FQQVFB30HgQeFBoT+iPzFAMkAzQMFAwkDDQIM+hD4TPxQ/FT+jP6Q/pT9lPWY9'
+      '9T32Pfk9hT6GPok+STxKPNk82jzbPGk9aj1rPSs7LDu7O7w7vTtLPEw8TTwNOg46nTqe'
+      'Op86LTsuOy877zjwOH85gDmBOQ86EDoROtE30jdhOGI4YzjxOPI48zizNrQ2QzdEN0U3'
+      '0zfUN9U3dTR2NAU1BjUHNbU2tja3NlczWDPnM+gz6TN3NHg0eTQ5MjoyyTLKMssyWTNa'
+      'M1szGzEcMasxrDGtMTsyPDI9Mv0v/i+NMI4wkTAdMR4xITHhLuIucS9yL3MvATACMAMw'
+      'wy3ELVMuVC5VLuMu5C7lLqUspiw1LTYtNy3FLcYtxy2HK4grFywYLBkspyyoLKksaSpq'
+      'Kvkq+ir7KokriiuLK0spTCnbKdwp3SlrKmwqbSoNJw4nnSeeJ58nTSlOKU8p7yXwJX8m'
+      'gCaBJg8nECcRJ9Ek0iRhJWIlYyXxJfIl8yWzI7QjQyREJEUk0yTUJNUklSKWIiUjJiMp'
+      'I7UjtiO5I3kheiEJIgoiCyKZIpoimyJbIFwg6yDsIO0geyF8IX0hPR8+H80fzh/PH10g'
+      'XiBfIB8eIB6vHrAesR4/H0AfQR8BHQIdkR2SHZMdIR4iHiMe4xvkG3McdBx1HAMdBB0F'
+      'HaUZphk1GjYaNxrlG+Yb5xuHGIgYFxkYGRkZpxmoGakZaRdqF/kX+hf7F4kYihiLGEsW'
+      'TBbbFtwW3RZrF2wXbRctFS4VvRW+FcEVTRZOFlEWERQSFKEUohSjFDEVMhUzFfMS9BKD'
+      'E4QThRMTFBQUFRTVEdYRZRJmEmcS9RL2EvcStxC4EEcRSBFJEdcR2BHZEZkPmg8pECoQ'
+      'KxC5ELoQuxB7DnwOCw8MDw0Pmw+cD50PPQw+DM0MzgzPDH0Ofg5/Dh8LIAuvC7ALsQs/'
+      'DEAMQQwBCgIKkQqSCpMKIQsiCyML4wjkCHMJdAl1CQMKBAoFCsUHxgdVCFYIWQjlCOYI'
+      '6QipBqoGOQc6BzsHyQfKB8sHiwWMBRsGHAYdBqsGrAatBm0EbgT9BP4E/wSNBY4FjwVP'
+      'A1AD3wPgA+EDbwRwBHEEMQIyAsECwgLDAlEDUgNTAxMBFAGjAaQBpQEzAjQCNQLZT9pP'
+      'aVBqUGtQFQEWARcBbFBtUBgBGQEaAagBqQGqAaYBpwE2AjcCOALGAscCyALEAsUCVANV'
+      'A1YD5APlA+YD4gPjA3IEcwR0BAIFAwUEBQAFAQWQBZEFkgUgBiEGIgYeBh8GrgavBrAG'
+      'Pgc/B0AHPAc9B8wHzQfOB1wIXQheCFoIWwjqCOsI7Ah6CXsJfAl2CXkJBgoJCgoKlgqZ'
+      'CpoKlAqVCiQLJQsmC7QLtQu2C7ILswtCDEMMRAzSDNMM1AzQDNEMgA6BDoIOEA8RDxIP'
+      'Dg8PD54Pnw+gDy4QLxAwECwQLRC8EL0QvhBMEU0RThFKEUsR2hHbEdwRahJrEmwSaBJp'
+      'EvgS+RL6EogTiROKE4YThxMWFBcUGBSmFKcUqBSkFKUUNBU1FTYVxBXFFcYVwhXDFVIW'
+      'UxZUFuIW4xbkFt4W4RZuF3EXchf+FwEYAhj8F/0XjBiNGI4YHBkdGR4ZGhkbGaoZqxms'
+      'GToaOxo8GjgaORroG+kb6ht4HHkcehx2HHccBh0HHQgdlh2XHZgdlB2VHSQeJR4mHrQe'
+      'tR62HrIesx5CH0MfRB/SH9Mf1B/QH9EfYCBhIGIg8CDxIPIg7iDvIH4hfyGAIQ4iDyIQ'
+      'IgwiDSKcIp0iniIsIy0jLiMqIysjuiO7I7wjSiRLJEwkRiRJJNYk2STaJGYlaSVqJWQl'
+      'ZSX0JfUl9iWEJoUmhiaCJoMmEicTJxQnoiejJ6QnoCehJ1ApUSlSKeAp4SniKd4p3ylu'
+      'Km8qcCr+Kv8qACv8Kv0qjCuNK44rHCwdLB4sGiwbLKosqyysLDotOy08LTgtOS3ILckt'
+      'yi1YLlkuWi5WLlcu5i7nLugudi93L3gvdC91LwQwBTAGMJQwlTCWMJIwkzAiMSMxJDGy'
+      'MbMxtDGuMbExPjJBMkIyzjLRMtIyzDLNMlwzXTNeM+wz7TPuM+oz6zN6NHs0fDQKNQs1'
+      'DDUINQk1uDa5Nro2SDdJN0o3RjdHN9Y31zfYN2Y4ZzhoOGQ4ZTj0OPU49jiEOYU5hjmC'
+      'OYM5EjoTOhQ6ojqjOqQ6oDqhOjA7MTsyO8A7wTvCO747vztOPE88UDzePN884DzcPN08'
+      'bD1tPW49/D39Pf49+j37PYo+iz6MPho/Gz8cPxY/GT+mP6k/qj82QDlAOkA0QDVAxEDF'
+      'QMZAVEFVQVZBUkFTQeJB40HkQXJCc0J0QnBCcUIgRCFEIkSwRLFEskSuRK9EPkU/RUBF'
+      'zkXPRdBFzEXNRVxGXUZeRuxG7UbuRupG60Z6R3tHfEcKSAtIDEgISAlImEiZSJpIKEkp'
+      'SSpJJkknSbZJt0m4SUZKR0pISkRKRUrUStVK1kpkS2VLZktiS2NL8kvzS/RLgkyDTIRM'
+      'Tk+BTN5PEU0STW5QoU2iTeFP4k/jTx0BHgGuAT4CzgIxTjJOwU7CTsNOUU9ST1NPE00U'
+      'TaNNpE2lTTNONE41TvVL9kuFTIZMh0wVTRZNF03XSthKZ0toS2lL90v4S/lLuUm6SUlK'
+      'SkpLStlK2krbSptInEgrSSxJLUm7SbxJvUl9R35HDUgOSA9InUieSJ9IX0ZgRu9G8Ebx'
+      'Rn9HgEeBR0FFQkXRRdJF00VhRmJGY0YjRCREs0S0RLVEQ0VERUVF5UHmQXVCdkJ5QiVE'
+      'JkQpRMlAykBZQVpBW0HpQepB60GrP6w/O0A8QD1Ay0DMQM1AjT6OPh0/Hj8fP60/rj+v'
+      'P289cD3/PQA+AT6PPpA+kT5RPFI84TziPOM8cT1yPXM9Mzs0O8M7xDvFO1M8VDxVPBU6'
+      'FjqlOqY6pzo1OzY7Nzv3OPg4hzmIOYk5FzoYOhk62TfaN2k4ajhrOPk4+jj7OLs2vDZL'
+      'N0w3TTfbN9w33Td9NH40DTUONRE1vTa+NsE2YTNiM/Ez8jPzM4E0gjSDNEMyRDLTMtQy'
+      '1TJjM2QzZTMlMSYxtTG2MbcxRTJGMkcyBzAIMJcwmDCZMCcxKDEpMeku6i55L3ovey8J'
+      'MAowCzDLLcwtWy5cLl0u6y7sLu0urSyuLD0tPi0/Lc0tzi3PLY8rkCsfLCAsISyvLLAs'
+      'sSxxKnIqASsCKwMrkSuSK5MrUylUKeMp5CnlKXMqdCp1KhUnFielJ6YnqSdVKVYpWSn5'
+      'JfoliSaKJosmGScaJxsn2yTcJGslbCVtJfsl/CX9Jb0jviNNJE4kTyTdJN4k3ySfIqAi'
+      'LyMwIzEjvyPAI8EjgSGCIREiEiITIqEioiKjImMgZCDzIPQg9SCDIYQhhSFFH0Yf1R/W'
+      'H9cfZSBmIGcgJx4oHrceuB65HkcfSB9JHwkdCh2ZHZodmx0pHioeKx7rG+wbexx8HH0c'
+      'Cx0MHQ0drRmuGT0aPhpBGu0b7hvxG5EYkhghGSIZIxmxGbIZsxlzF3QXAxgEGAUYkxiU'
+      'GJUYVRZWFuUW5hbnFnUXdhd3FzcVOBXHFcgVyRVXFlgWWRYZFBoUqRSqFKsUORU6FTsV'
+      '+xL8EosTjBONExsUHBQdFN0R3hFtEm4SbxL9Ev4S/xK/EMAQTxFQEVER3xHgEeERoQ+i'
+      'DzEQMhAzEMEQwhDDEIMOhA4TDxQPFQ+jD6QPpQ9FDEYM1QzWDNkMhQ6GDokOKQsqC7kL'
+      'ugu7C0kMSgxLDAsKDAqbCpwKnQorCywLLQvtCO4IfQl+CX8JDQoOCg8KzwfQB18IYAhh'
+      'CO8I8AjxCLEGsgZBB0IHQwfRB9IH0weTBZQFIwYkBiUGswa0BrUGdQR2BAUFBgUHBZUF'
+      'lgWXBVcDWAPnA+gD6QN3BHgEeQQ5AjoCyQLKAssCWQNaA1sDGwEcAasBrAGtATsCPAI9'
+      'AswCzQJcA10DXgPsA+0D7gPqA+sDegR7BHwECgULBQwFCAUJBZgFmQWaBSgGKQYqBiYG'
+      'Jwa2BrcGuAZGB0cHSAdEB0UH1AfVB9YHZAhlCGYIYghjCPII8wj0CIIJgwmECYAJgQkQ'
+      'ChEKEgqgCqEKogqeCp8KLgsvCzALvgu/C8ALvAu9C0wMTQxODNwM3QzeDNoM2wyKDosO'
+      'jA4aDxsPHA8WDxkPpg+pD6oPNhA5EDoQNBA1EMQQxRDGEFQRVRFWEVIRUxHiEeMR5BFy'
+      'EnMSdBJwEnESABMBEwITkBORE5ITjhOPEx4UHxQgFK4UrxSwFKwUrRQ8FT0VPhXMFc0V'
+      'zhXKFcsVWhZbFlwW6hbrFuwW6BbpFngXeRd6FwgYCRgKGAYYBxiWGJcYmBgmGScZKBkk'
+      'GSUZtBm1GbYZRBpFGkYaQhpDGvIb8xv0G4IcgxyEHH4cgRwOHREdEh2eHaEdoh2cHZ0d'
+      'LB4tHi4evB69Hr4euh67HkofSx9MH9of2x/cH9gf2R9oIGkgaiD4IPkg+iD2IPcghiGH'
+      'IYghFiIXIhgiFCIVIqQipSKmIjQjNSM2IzIjMyPCI8MjxCNSJFMkVCRQJFEk4CThJOIk'
+      'cCVxJXIlbiVvJf4l/yUAJo4mjyaQJowmjSYcJx0nHiesJ60nrieqJ6snWilbKVwp6inr'
+      'Kewp5inpKXYqeSp6KgYrCSsKKwQrBSuUK5UrliskLCUsJiwiLCMssiyzLLQsQi1DLUQt'
+      'QC1BLdAt0S3SLWAuYS5iLl4uXy7uLu8u8C5+L38vgC98L30vDDANMA4wnDCdMJ4wmjCb'
+      'MCoxKzEsMboxuzG8MbgxuTFIMkkySjLYMtky2jLWMtcyZjNnM2gz9jP3M/gz9DP1M4Q0'
+      'hTSGNBQ1FTUWNRI1EzXCNsM2xDZSN1M3VDdON1E33jfhN+I3bjhxOHI4bDhtOPw4/Tj+'
+      'OIw5jTmOOYo5izkaOhs6HDqqOqs6rDqoOqk6ODs5Ozo7yDvJO8o7xjvHO1Y8VzxYPOY8'
+      '5zzoPOQ85Tx0PXU9dj0EPgU+Bj4CPgM+kj6TPpQ+Ij8jPyQ/ID8hP7A/sT+yP0BAQUBC'
+      'QD5AP0DOQM9A0EBeQV9BYEFcQV1B7EHtQe5BfEJ9Qn5CekJ7QipEK0QsRLpEu0S8RLZE'
+      'uURGRUlFSkXWRdlF2kXURdVFZEZlRmZG9Eb1RvZG8kbzRoJHg0eERxJIE0gUSBBIEUig'
+      'SKFIokgwSTFJMkkuSS9Jvkm/ScBJTkpPSlBKTEpNStxK3UreSmxLbUtuS2pLa0v6S/tL'
+      '/EuKTItMjEyITIlMGE0ZTRpNqE2pTapNpk2nTTZON044TsZOx07ITsROxU5UT1VPVk/k'
+      'T+VP5k85TjpOyU7KTstOWU9aT1tPG00cTatNrE2tTTtOPE49Tv1L/kuNTI5Mj0wdTR5N'
+      'H03fSuBKb0twS3FL/0sATAFMwUnCSVFKUkpTSuFK4krjSqNIpEgzSTRJNUnDScRJxUmF'
+      'R4ZHFUgWSBlIpUimSKlIaUZqRvlG+kb7RolHikeLR0tFTEXbRdxF3UVrRmxGbUYtRC5E'
+      'vUS+RL9ETUVORU9F70HwQX9CgEKBQi9EMEQxRNFA0kBhQWJBY0HxQfJB80GzP7Q/Q0BE'
+      'QEVA00DUQNVAlT6WPiU/Jj8nP7U/tj+3P3c9eD0HPgg+CT6XPpg+mT5ZPFo86TzqPOs8'
+      'eT16PXs9Ozs8O8s7zDvNO1s8XDxdPB06HjqtOq46sTo9Oz47QTsBOQI5kTmSOZM5IToi'
+      'OiM64zfkN3M4dDh1OAM5BDkFOcU2xjZVN1Y3VzflN+Y35zeHNIg0FzUYNRk1xzbINsk2'
+      'aTNqM/kz+jP7M4k0ijSLNEsyTDLbMtwy3TJrM2wzbTMtMS4xvTG+Mb8xTTJOMk8yDzAQ'
+      'MJ8woDChMC8xMDExMfEu8i6BL4Ivgy8RMBIwEzDTLdQtYy5kLmUu8y70LvUutSy2LEUt'
+      'Ri1JLdUt1i3ZLZkrmispLCosKyy5LLosuyx7KnwqCysMKw0rmyucK50rXSleKe0p7inv'
+      'KX0qfip/Kh8nICevJ7AnsSdfKWApYSkBJgImkSaSJpMmISciJyMn4yTkJHMldCV1JQMm'
+      'BCYFJsUjxiNVJFYkVyTlJOYk5ySnIqgiNyM4IzkjxyPII8kjiSGKIRkiGiIbIqkiqiKr'
+      'ImsgbCD7IPwg/SCLIYwhjSFNH04f3R/eH+EfbSBuIHEgMR4yHsEewh7DHlEfUh9THxMd'
+      'FB2jHaQdpR0zHjQeNR71G/YbhRyGHIccFR0WHRcdtxm4GUcaSBpJGvcb+Bv5G5kYmhgp'
+      'GSoZKxm5GboZuxl7F3wXCxgMGA0YmxicGJ0YXRZeFu0W7hbvFn0Xfhd/Fz8VQBXPFdAV'
+      '0RVfFmAWYRYhFCIUsRSyFLMUQRVCFUMVAxMEE5MTlBOVEyMUJBQlFOUR5hF1EnYSeRIF'
+      'EwYTCRPJEMoQWRFaEVsR6RHqEesRqw+sDzsQPBA9EMsQzBDNEI0Ojg4dDx4PHw+tD64P'
+      'rw9PDFAM3wzgDOEMjw6QDpEOMQsyC8ELwgvDC1EMUgxTDBMKFAqjCqQKpQozCzQLNQv1'
+      'CPYIhQmGCYcJFQoWChcK1wfYB2cIaAhpCPcI+Aj5CLkGugZJB0oHSwfZB9oH2webBZwF'
+      'KwYsBi0Guwa8Br0GTAdNB9wH3QfeB2wIbQhuCGoIawj6CPsI/AiKCYsJjAmICYkJGAoZ'
+      'ChoKqAqpCqoKpgqnCjYLNws4C8YLxwvIC8QLxQtUDFUMVgzkDOUM5gziDOMMkg6TDpQO'
+      'Ig8jDyQPIA8hD7APsQ+yD0AQQRBCED4QPxDOEM8Q0BBeEV8RYBFcEV0R7BHtEe4RfBJ9'
+      'En4SehJ7EgoTCxMME5oTmxOcE5YTmRMmFCkUKhS2FLkUuhS0FLUURBVFFUYV1BXVFdYV'
+      '0hXTFWIWYxZkFvIW8xb0FvAW8RaAF4EXghcQGBEYEhgOGA8YnhifGKAYLhkvGTAZLBkt'
+      'GbwZvRm+GUwaTRpOGkoaSxr6G/sb/BuKHIscjByIHIkcGB0ZHRodqB2pHaodph2nHTYe'
+      'Nx44HsYexx7IHsQexR5UH1UfVh/kH+Uf5h/iH+MfciBzIHQgAiEDIQQh/iABIY4hkSGS'
+      'IR4iISIiIhwiHSKsIq0iriI8Iz0jPiM6IzsjyiPLI8wjWiRbJFwkWCRZJOgk6STqJHgl'
+      'eSV6JXYldyUGJgcmCCaWJpcmmCaUJpUmJCclJyYntCe1J7YnsiezJ2IpYylkKfIp8yn0'
+      'KfAp8SmAKoEqgioQKxErEisOKw8rniufK6ArLiwvLDAsLCwtLLwsvSy+LEwtTS1OLUot'
+      'Sy3aLdst3C1qLmsubC5mLmku9i75Lvouhi+JL4ovhC+FLxQwFTAWMKQwpTCmMKIwozAy'
+      'MTMxNDHCMcMxxDHAMcExUDJRMlIy4DLhMuIy3jLfMm4zbzNwM/4z/zMANPwz/TOMNI00'
+      'jjQcNR01HjUaNRs1yjbLNsw2WjdbN1w3WDdZN+g36TfqN3g4eTh6OHY4dzgGOQc5CDmW'
+      'OZc5mDmUOZU5JDolOiY6tDq1OrY6sjqzOkI7QztEO9I70zvUO8470TtePGE8YjzuPPE8'
+      '8jzsPO08fD19PX49DD4NPg4+Cj4LPpo+mz6cPio/Kz8sPyg/KT+4P7k/uj9IQElASkBG'
+      'QEdA1kDXQNhAZkFnQWhBZEFlQfRB9UH2QYRChUKGQoJCg0IyRDNENETCRMNExETARMFE'
+      'UEVRRVJF4EXhReJF3kXfRW5Gb0ZwRv5G/0YAR/xG/UaMR41HjkccSB1IHkgaSBtIqkir'
+      'SKxIOkk7STxJNkk5ScZJyUnKSVZKWUpaSlRKVUrkSuVK5kp0S3VLdktyS3NLAkwDTARM'
+      'kkyTTJRMkEyRTCBNIU0iTbBNsU2yTa5Nr00+Tj9OQE7OTs9O0E7MTs1OXE9dT15P7E/t'
+      'T+5PQU5CTtFO0k7TTmFPYk9jTyNNJE2zTbRNtU1DTkRORU4FTAZMlUyWTJlMJU0mTSlN'
+      '6UrqSnlLekt7SwlMCkwLTMtJzElbSlxKXUrrSuxK7UqtSK5IPUk+ST9JzUnOSc9Jj0eQ'
+      'Rx9IIEghSK9IsEixSHFGckYBRwJHA0eRR5JHk0dTRVRF40XkReVFc0Z0RnVGNUQ2RMVE'
+      'xkTHRFVFVkVXRfdB+EGHQohCiUI3RDhEOUTZQNpAaUFqQWtB+UH6QftBuz+8P0tATEBN'
+      'QNtA3EDdQJ0+nj4tPy4/MT+9P74/wT+BPYI9ET4SPhM+oT6iPqM+YzxkPPM89Dz1PIM9'
+      'hD2FPUU7RjvVO9Y71ztlPGY8ZzwnOig6tzq4Ork6RztIO0k7CTkKOZk5mjmbOSk6Kjor'
+      'Ous37Dd7OHw4fTgLOQw5DTnNNs42XTdeN1837TfuN+83jzSQNB81IDUhNc820DbRNnEz'
+      'cjMBNAI0AzSRNJI0kzRTMlQy4zLkMuUyczN0M3UzNTE2McUxxjHJMVUyVjJZMhkwGjCp'
+      'MKowqzA5MToxOzH7Lvwuiy+ML40vGzAcMB0w3S3eLW0ubi5vLv0u/i7/Lr8swCxPLVAt'
+      'US3fLeAt4S2hK6IrMSwyLDMswSzCLMMsgyqEKhMrFCsVK6MrpCulK2UpZin1KfYp9ymF'
+      'KoYqhyonJygntye4J7knZyloKWkpCSYKJpkmmiabJiknKicrJ+sk7CR7JXwlfSULJgwm'
+      'DSbNI84jXSReJGEk7STuJPEksSKyIkEjQiNDI9Ej0iPTI5MhlCEjIiQiJSKzIrQitSJ1'
+      'IHYgBSEGIQchlSGWIZchVx9YH+cf6B/pH3cgeCB5IDkeOh7JHsoeyx5ZH1ofWx8bHRwd'
+      'qx2sHa0dOx48Hj0e/Rv+G40cjhyPHB0dHh0fHb8ZwBlPGlAaURr/GwAcARyhGKIYMRky'
+      'GTMZwRnCGcMZgxeEFxMYFBgVGKMYpBilGGUWZhb1FvYW+RaFF4YXiRdJFUoV2RXaFdsV'
+      'aRZqFmsWKxQsFLsUvBS9FEsVTBVNFQ0TDhOdE54TnxMtFC4ULxTvEfARfxKAEoESDxMQ'
+      'ExET0RDSEGERYhFjEfER8hHzEbMPtA9DEEQQRRDTENQQ1RCVDpYOJQ8mDycPtQ+2D7cP'
+      'VwxYDOcM6AzpDJcOmA6ZDjkLOgvJC8oLywtZDFoMWwwbChwKqwqsCq0KOws8Cz0LzAvN'
+      'C1wMXQxeDOwM7QzuDOoM6wyaDpsOnA4qDysPLA8oDykPuA+5D7oPSBBJEEoQRhBHENYQ'
+      '1xDYEGYRZxFoEWQRZRH0EfUR9hGEEoUShhKCEoMSEhMTExQTohOjE6QToBOhEzAUMRQy'
+      'FMAUwRTCFL4UvxROFU8VUBXeFd8V4BXcFd0VbBZtFm4W/Bb9Fv4W+hb7FooXixeMFxoY'
+      'GxgcGBYYGRimGKkYqhg2GTkZOhk0GTUZxBnFGcYZVBpVGlYaUhpTGgIcAxwEHJIckxyU'
+      'HJAckRwgHSEdIh2wHbEdsh2uHa8dPh4/HkAezh7PHtAezB7NHlwfXR9eH+wf7R/uH+of'
+      '6x96IHsgfCAKIQshDCEIIQkhmCGZIZohKCIpIioiJiInIrYityK4IkYjRyNII0QjRSPU'
+      'I9Uj1iNkJGUkZiRiJGMk8iTzJPQkgiWDJYQlfiWBJQ4mESYSJp4moSaiJpwmnSYsJy0n'
+      'Lie8J70nvie6J7snailrKWwp+in7Kfwp+Cn5KYgqiSqKKhgrGSsaKxYrFyumK6crqCs2'
+      'LDcsOCw0LDUsxCzFLMYsVC1VLVYtUi1TLeIt4y3kLXIucy50LnAucS4ALwEvAi+QL5Ev'
+      'ki+OL48vHjAfMCAwrjCvMLAwrDCtMDwxPTE+McwxzTHOMcoxyzFaMlsyXDLqMusy7DLm'
+      'MukydjN5M3ozBjQJNAo0BDQFNJQ0lTSWNCQ1JTUmNSI1IzXSNtM21DZiN2M3ZDdgN2E3'
+      '8DfxN/I3gDiBOII4fjh/OA45DzkQOZ45nzmgOZw5nTksOi06Ljq8Or06vjq6Ors6SjtL'
+      'O0w72jvbO9w72DvZO2g8aTxqPPg8+Tz6PPY89zyGPYc9iD0WPhc+GD4UPhU+pD6lPqY+'
+      'ND81PzY/Mj8zP8I/wz/EP1JAU0BUQE5AUUDeQOFA4kBuQXFBckFsQW1B/EH9Qf5BjEKN'
+      'Qo5CikKLQjpEO0Q8RMpEy0TMRMhEyURYRVlFWkXoRelF6kXmRedFdkZ3RnhGBkcHRwhH'
+      'BEcFR5RHlUeWRyRIJUgmSCJII0iySLNItEhCSUNJRElASUFJ0EnRSdJJYEphSmJKXkpf'
+      'Su5K70rwSn5Lf0uAS3xLfUsMTA1MDkycTJ1MnkyaTJtMKk0rTSxNuk27TbxNtk25TUZO'
+      'SU5KTtZO2U7aTtRO1U5kT2VPZk/0T/VP9k9LTkxO207cTt1Oa09sT21PLU0uTb1Nvk2/'
+      'TU1OTk5PTg9MEEyfTKBMoUwvTTBNMU3xSvJKgUuCS4NLEUwSTBNM00nUSWNKZEplSvNK'
+      '9Er1SrVItkhFSUZJR0nVSdZJ10mXR5hHJ0goSClIt0i4SLlIeUZ6RglHCkcLR5lHmkeb'
+      'R1tFXEXrRexF7UV7RnxGfUY9RD5EzUTORNFEXUVeRWFFAUICQpFCkkKTQkFEQkRDRONA'
+      '5EBzQXRBdUEDQgRCBULFP8Y/VUBWQFdA5UDmQOdApz6oPjc/OD85P8c/yD/JP4k9ij0Z'
+      'Pho+Gz6pPqo+qz5rPGw8+zz8PP08iz2MPY09TTtOO9073jvfO208bjxvPC86MDq/OsA6'
+      'wTpPO1A7UTsRORI5oTmiOaM5MToyOjM68zf0N4M4hDiFOBM5FDkVOdU21jZlN2Y3aTf1'
+      'N/Y3+TeZNJo0KTUqNSs12TbaNts2ezN8Mws0DDQNNJs0nDSdNF0yXjLtMu4y7zJ9M34z'
+      'fzM/MUAxzzHQMdExXzJgMmEyITAiMLEwsjCzMEExQjFDMQMvBC+TL5QvlS8jMCQwJTDl'
+      'LeYtdS52LncuBS8GLwcvxyzILFctWC1ZLect6C3pLakrqis5LDosOyzJLMosyyyLKowq'
+      'GyscKx0rqyusK60rbSluKf0p/ikBKo0qjiqRKjEnMifBJ8InwydxKXIpcykTJhQmoyak'
+      'JqUmMyc0JzUn9ST2JIUlhiWHJRUmFiYXJtcj2CNnJGgkaST3JPgk+SS5IroiSSNKI0sj'
+      '2SPaI9sjmyGcISsiLCItIrsivCK9In0gfiANIQ4hDyGdIZ4hnyFfH2Af7x/wH/EffyCA'
+      'IIEgQR5CHtEe0h7THmEfYh9jHyMdJB2zHbQdtR1DHkQeRR4FHAYclRyWHJkcJR0mHSkd'
+      'yRnKGVkaWhpbGgkcChwLHKsYrBg7GTwZPRnLGcwZzRmNF44XHRgeGB8YrRiuGK8YbxZw'
+      'Fv8WABcBF48XkBeRF1EVUhXhFeIV4xVxFnIWcxYzFDQUwxTEFMUUUxVUFVUVFRMWE6UT'
+      'phOnEzUUNhQ3FPcR+BGHEogSiRIXExgTGRPZENoQaRFqEWsR+RH6EfsRuw+8D0sQTBBN'
+      'ENsQ3BDdEGwRbRH8Ef0R/hGMEo0SjhKKEosSGhMbExwTqhOrE6wTqBOpEzgUORQ6FMgU'
+      'yRTKFMYUxxRWFVcVWBXmFecV6BXkFeUVdBZ1FnYWBBcFFwYXAhcDF5IXkxeUFyIYIxgk'
+      'GCAYIRiwGLEYshhAGUEZQhk+GT8ZzhnPGdAZXhpfGmAaXBpdGgwcDRwOHJwcnRyeHJoc'
+      'mxwqHSsdLB26HbsdvB22HbkdRh5JHkoe1h7ZHtoe1B7VHmQfZR9mH/Qf9R/2H/If8x+C'
+      'IIMghCASIRMhFCEQIREhoCGhIaIhMCIxIjIiLiIvIr4ivyLAIk4jTyNQI0wjTSPcI90j'
+      '3iNsJG0kbiRqJGsk+iT7JPwkiiWLJYwliCWJJRgmGSYaJqgmqSaqJqYmpyY2JzcnOCfG'
+      'J8cnyCfEJ8UndCl1KXYpBCoFKgYqAioDKpIqkyqUKiIrIyskKx4rISuuK7Ersis+LEEs'
+      'Qiw8LD0szCzNLM4sXC1dLV4tWi1bLeot6y3sLXouey58LngueS4ILwkvCi+YL5kvmi+W'
+      'L5cvJjAnMCgwtjC3MLgwtDC1MEQxRTFGMdQx1THWMdIx0zFiMmMyZDLyMvMy9DLwMvEy'
+      'gDOBM4IzEDQRNBI0DjQPNJ40nzSgNC41LzUwNSw1LTXcNt023jZsN203bjdqN2s3+jf7'
+      'N/w3ijiLOIw4hjiJOBY5GTkaOaY5qTmqOaQ5pTk0OjU6NjrEOsU6xjrCOsM6UjtTO1Q7'
+      '4jvjO+Q74DvhO3A8cTxyPAA9AT0CPf48/zyOPY89kD0ePh8+ID4cPh0+rD6tPq4+PD89'
+      'Pz4/Oj87P8o/yz/MP1pAW0BcQFhAWUDoQOlA6kB4QXlBekF2QXdBBkIHQghClkKXQphC'
+      'lEKVQkRERURGRNRE1UTWRNJE00RiRWNFZEXyRfNF9EXuRfFFfkaBRoJGDkcRRxJHDEcN'
+      'R5xHnUeeRyxILUguSCpIK0i6SLtIvEhKSUtJTElISUlJ2EnZSdpJaEppSmpKZkpnSvZK'
+      '90r4SoZLh0uIS4RLhUsUTBVMFkykTKVMpkyiTKNMMk0zTTRNwk3DTcRNwE3BTVBOUU5S'
+      'TuBO4U7iTt5O305uT29PcE/+T/9PAFBTTlRO407kTuVOc090T3VPNU02TcVNxk3HTVVO'
+      'Vk5XThdMGEynTKhMqUw3TThNOU35SvpKiUuKS4tLGUwaTBtM20ncSWtKbEptSvtK/Er9'
+      'Sr1IvkhNSU5JUUndSd5J4UmhR6JHMUgySDNIwUjCSMNIg0aERhNHFEcVR6NHpEelR2VF'
+      'ZkX1RfZF90WFRoZGh0ZHREhE10TYRNlEZ0VoRWlFCUIKQplCmkKbQklESkRLROtA7EB7'
+      'QXxBfUELQgxCDULNP84/XUBeQF9A7UDuQO9Arz6wPj8/QD9BP88/0D/RP5E9kj0hPiI+'
+      'Iz6xPrI+sz5zPHQ8Az0EPQU9kz2UPZU9VTtWO+U75jvpO3U8djx5PDk6OjrJOso6yzpZ'
+      'O1o7WzsbORw5qzmsOa05Ozo8Oj06/Tf+N404jjiPOB05HjkfOd824DZvN3A3cTf/NwA4'
+      'ATihNKI0MTUyNTM14TbiNuM2gzOEMxM0FDQVNKM0pDSlNGUyZjL1MvYy9zKFM4YzhzNH'
+      'MUgx1zHYMdkxZzJoMmkyKTAqMLkwujC7MEkxSjFLMQsvDC+bL5wvnS8rMCwwLTDtLe4t'
+      'fS5+LoEuDS8OLxEv0SzSLGEtYi1jLfEt8i3zLbMrtCtDLEQsRSzTLNQs1SyVKpYqJSsm'
+      'KycrtSu2K7crdyl4KQcqCCoJKpcqmCqZKjknOifJJ8onyyd5KXopeykbJhwmqyasJq0m'
+      'Oyc8Jz0n/ST+JI0ljiWPJR0mHiYfJt8j4CNvJHAkcST/JAAlASXBIsIiUSNSI1Mj4SPi'
+      'I+MjoyGkITMiNCI1IsMixCLFIoUghiAVIRYhGSGlIaYhqSFpH2of+R/6H/sfiSCKIIsg'
+      'Sx5MHtse3B7dHmsfbB9tHy0dLh29Hb4dvx1NHk4eTx4PHBAcnxygHKEcLx0wHTEd0RnS'
+      'GWEaYhpjGhEcEhwTHLMYtBhDGUQZRRnTGdQZ1RmVF5YXJRgmGCcYtRi2GLcYdxZ4FgcX'
+      'CBcJF5cXmBeZF1kVWhXpFeoV6xV5FnoWexY7FDwUyxTMFM0UWxVcFV0V7BXtFXwWfRZ+'
+      'FgwXDRcOFwoXCxeaF5sXnBcqGCsYLBgoGCkYuBi5GLoYSBlJGUoZRhlHGdYZ1xnYGWYa'
+      'ZxpoGmQaZRoUHBUcFhykHKUcphyiHKMcMh0zHTQdwh3DHcQdwB3BHVAeUR5SHuAe4R7i'
+      'Ht4e3x5uH28fcB/+H/8fACD8H/0fjCCNII4gHCEdIR4hGiEbIaohqyGsIToiOyI8IjYi'
+      'OSLGIskiyiJWI1kjWiNUI1Uj5CPlI+YjdCR1JHYkciRzJAIlAyUEJZIlkyWUJZAlkSUg'
+      'JiEmIiawJrEmsiauJq8mPic/J0AnzifPJ9AnzCfNJ3wpfSl+KQwqDSoOKgoqCyqaKpsq'
+      'nCoqKysrLCsoKykruCu5K7orSCxJLEosRixHLNYs1yzYLGYtZy1oLWQtZS30LfUt9i2E'
+      'LoUuhi6CLoMuEi8TLxQvoi+jL6Qvni+hLy4wMTAyML4wwTDCMLwwvTBMMU0xTjHcMd0x'
+      '3jHaMdsxajJrMmwy+jL7Mvwy+DL5MogziTOKMxg0GTQaNBY0FzSmNKc0qDQ2NTc1ODU0'
+      'NTU15DblNuY2dDd1N3Y3cjdzNwI4AzgEOJI4kziUOJA4kTggOSE5IjmwObE5sjmuOa85'
+      'Pjo/OkA6zjrPOtA6zDrNOlw7XTteO+w77TvuO+o76zt6PHs8fDwKPQs9DD0GPQk9lj2Z'
+      'PZo9Jj4pPio+JD4lPrQ+tT62PkQ/RT9GP0I/Qz/SP9M/1D9iQGNAZEBgQGFA8EDxQPJA'
+      'gEGBQYJBfkF/QQ5CD0IQQp5Cn0KgQpxCnUJMRE1ETkTcRN1E3kTaRNtEakVrRWxF+kX7'
+      'RfxF+EX5RYhGiUaKRhhHGUcaRxZHF0emR6dHqEc2SDdIOEg0SDVIxEjFSMZIVElVSVZJ'
+      'UklTSeJJ40nkSXJKc0p0Sm5KcUr+SgFLAkuOS5FLkkuMS41LHEwdTB5MrEytTK5Mqkyr'
+      'TDpNO008TcpNy03MTchNyU1YTllOWk7oTulO6k7mTudOdk93T3hPBlAHUAhQW05cTutO'
+      '7E7tTntPfE99Tz1NPk3NTc5N0U1dTl5OYU4hTCJMsUyyTLNMQU1CTUNNA0sES5NLlEuV'
+      'SyNMJEwlTOVJ5kl1SnZKd0oFSwZLB0vHSMhIV0lYSVlJ50noSelJqUeqRzlIOkg7SMlI'
+      'ykjLSItGjEYbRxxHHUerR6xHrUdtRW5F/UX+Rf9FjUaORo9GT0RQRN9E4EThRG9FcEVx'
+      'RRFCEkKhQqJCo0JRRFJEU0TzQPRAg0GEQYVBE0IUQhVC1T/WP2VAZkBpQPVA9kD5QLk+'
+      'uj5JP0o/Sz/ZP9o/2z+bPZw9Kz4sPi0+uz68Pr0+fTx+PA09Dj0PPZ09nj2fPV87YDvv'
+      'O/A78Tt/PIA8gTxBOkI60TrSOtM6YTtiO2M7IzkkObM5tDm1OUM6RDpFOgU4BjiVOJY4'
+      'lzglOSY5JznnNug2dzd4N3k3BzgIOAk4qTSqNDk1OjU7Nek26jbrNoszjDMbNBw0HTSr'
+      'NKw0rTRtMm4y/TL+MgEzjTOOM5EzUTFSMeEx4jHjMXEycjJzMjMwNDDDMMQwxTBTMVQx'
+      'VTEVLxYvpS+mL6cvNTA2MDcw9y34LYcuiC6JLhcvGC8ZL9ks2ixpLWotay35Lfot+y27'
+      'K7wrSyxMLE0s2yzcLN0snSqeKi0rLisvK70rviu/K38pgCkPKhAqESqfKqAqoSpBJ0In'
+      '0SfSJ9MngSmCKYMpIyYkJrMmtCa1JkMnRCdFJwUlBiWVJZYlmSUlJiYmKSbpI+ojeSR6'
+      'JHskCSUKJQslyyLMIlsjXCNdI+sj7CPtI60hriE9Ij4iPyLNIs4izyKPIJAgHyEgISEh'
+      'ryGwIbEhcR9yHwEgAiADIJEgkiCTIFMeVB7jHuQe5R5zH3QfdR81HTYdxR3GHccdVR5W'
+      'HlceFxwYHKccqBypHDcdOB05HdkZ2hlpGmoaaxoZHBocGxy7GLwYSxlMGU0Z2xncGd0Z'
+      'bBptGhwcHRweHKwcrRyuHKocqxw6HTsdPB3KHcsdzB3IHckdWB5ZHloe6B7pHuoe5h7n'
+      'HnYfdx94HwYgByAIIAQgBSCUIJUgliAkISUhJiEiISMhsiGzIbQhQiJDIkQiQCJBItAi'
+      '0SLSImAjYSNiI14jXyPuI+8j8CN+JH8kgCR8JH0kDCUNJQ4lnCWdJZ4lmiWbJSomKyYs'
+      'Jromuya8JrYmuSZGJ0knSifWJ9kn2ifUJ9UnhCmFKYYpFCoVKhYqEioTKqIqoyqkKjIr'
+      'Mys0KzArMSvAK8ErwitQLFEsUixOLE8s3izfLOAsbi1vLXAtbC1tLfwt/S3+LYwujS6O'
+      'Loouiy4aLxsvHC+qL6svrC+oL6kvODA5MDowyDDJMMowxjDHMFYxVzFYMeYx5zHoMeQx'
+      '5TF0MnUydjIEMwUzBjMCMwMzkjOTM5QzIjQjNCQ0HjQhNK40sTSyND41QTVCNTw1PTXs'
+      'Nu027jZ8N303fjd6N3s3CjgLOAw4mjibOJw4mDiZOCg5KTkqObg5uTm6ObY5tzlGOkc6'
+      'SDrWOtc62DrUOtU6ZDtlO2Y79Dv1O/Y78jvzO4I8gzyEPBI9Ez0UPRA9ET2gPaE9oj0w'
+      'PjE+Mj4uPi8+vj6/PsA+Tj9PP1A/TD9NP9w/3T/eP2xAbUBuQGpAa0D6QPtA/ECKQYtB'
+      'jEGGQYlBFkIZQhpCpkKpQqpCpEKlQlREVURWRORE5UTmROJE40RyRXNFdEUCRgNGBEYA'
+      'RgFGkEaRRpJGIEchRyJHHkcfR65Hr0ewRz5IP0hASDxIPUjMSM1IzkhcSV1JXklaSVtJ'
+      '6knrSexJekp7SnxKeEp5SghLCUsKS5hLmUuaS5ZLl0smTCdMKEy2TLdMuEy0TLVMRE1F'
+      'TUZN1E3VTdZN0k3TTWJOY05kTvJO8070Tu5O8U5+T4FPgk8OUBFQElBlTmZO9U72TvdO'
+      'hU+GT4dPR01ITddN2E3ZTWdOaE5pTilMKky5TLpMu0xJTUpNS00LSwxLm0ucS51LK0ws'
+      'TC1M7UnuSX1Kfkp/Sg1LDksPS89I0EhfSWBJYUnvSfBJ8UmxR7JHQUhCSENI0UjSSNNI'
+      'k0aURiNHJEclR7NHtEe1R3VFdkUFRgZGCUaVRpZGmUZZRFpE6UTqROtEeUV6RXtFG0Ic'
+      'QqtCrEKtQltEXERdRP1A/kCNQY5Bj0EdQh5CH0LfP+A/b0BwQHFA/0AAQQFBwT7CPlE/'
+      'Uj9TP+E/4j/jP6M9pD0zPjQ+NT7DPsQ+xT6FPIY8FT0WPRc9pT2mPac9ZztoO/c7+Dv5'
+      'O4c8iDyJPEk6SjrZOto62zppO2o7azsrOSw5uzm8Ob05SzpMOk06DTgOOJ04njihOC05'
+      'LjkxOfE28jaBN4I3gzcROBI4EzizNLQ0QzVENUU18zb0NvU2lTOWMyU0JjQnNLU0tjS3'
+      'NHcyeDIHMwgzCTOXM5gzmTNZMVox6THqMesxeTJ6MnsyOzA8MMswzDDNMFsxXDFdMR0v'
+      'Hi+tL64vry89MD4wPzD/LQAujy6QLpEuHy8gLyEv4SziLHEtci1zLQEuAi4DLsMrxCtT'
+      'LFQsVSzjLOQs5SylKqYqNSs2KzkrxSvGK8kriSmKKRkqGiobKqkqqiqrKksnTCfbJ9wn'
+      '3SeLKYwpjSktJi4mvSa+Jr8mTSdOJ08nDyUQJZ8loCWhJS8mMCYxJvEj8iOBJIIkgyQR'
+      'JRIlEyXTItQiYyNkI2Uj8yP0I/UjtSG2IUUiRiJHItUi1iLXIpcgmCAnISghKSG3Ibgh'
+      'uSF5H3ofCSAKIAsgmSCaIJsgWx5cHuse7B7tHnsffB99HwwgDSCcIJ0gniAsIS0hLiEq'
+      'ISshuiG7IbwhSiJLIkwiSCJJItgi2SLaImgjaSNqI2YjZyP2I/cj+COGJIckiCSEJIUk'
+      'FCUVJRYlpCWlJaYloiWjJTImMyY0JsImwybEJsAmwSZQJ1EnUifgJ+En4ifeJ98njimP'
+      'KZApHiofKiAqHCodKqwqrSquKjwrPSs+KzorOyvKK8srzCtaLFssXCxWLFks5izpLOos'
+      'di15LXotdC11LQQuBS4GLpQulS6WLpIuky4iLyMvJC+yL7MvtC+wL7EvQDBBMEIw0DDR'
+      'MNIwzjDPMF4xXzFgMe4x7zHwMewx7TF8Mn0yfjIMMw0zDjMKMwszmjObM5wzKjQrNCw0'
+      'KDQpNLg0uTS6NEg1STVKNUY1RzX2Nvc2+DaGN4c3iDeEN4U3FDgVOBY4pDilOKY4ojij'
+      'ODI5Mzk0OcI5wznEOb45wTlOOlE6UjreOuE64jrcOt06bDttO247/Dv9O/47+jv7O4o8'
+      'izyMPBo9Gz0cPRg9GT2oPak9qj04Pjk+Oj42Pjc+xj7HPsg+Vj9XP1g/VD9VP+Q/5T/m'
+      'P3RAdUB2QHJAc0ACQQNBBEGSQZNBlEGQQZFBIEIhQiJCsEKxQrJCrkKvQl5EX0RgRO5E'
+      '70TwROxE7UR8RX1FfkUMRg1GDkYKRgtGmkabRpxGKkcrRyxHJkcpR7ZHuUe6R0ZISUhK'
+      'SERIRUjUSNVI1khkSWVJZkliSWNJ8knzSfRJgkqDSoRKgEqBShBLEUsSS6BLoUuiS55L'
+      'n0suTC9MMEy+TL9MwEy8TL1MTE1NTU5N3E3dTd5N2k3bTWpOa05sTvpO+078TvhO+U6I'
+      'T4lPik8YUBlQGlBtTm5O/U7+Tv9OjU+OT49PT01QTd9N4E3hTW9OcE5xTjFMMkzBTMJM'
+      'w0xRTVJNU00TSxRLo0ukS6VLM0w0TDVM9Un2SYVKhkqJShVLFksZS9lI2khpSWpJa0n5'
+      'SfpJ+0m7R7xHS0hMSE1I20jcSN1InUaeRi1HLkcvR71Hvke/R39FgEUPRhBGEUafRqBG'
+      'oUZhRGJE8UTyRPNEgUWCRYNFI0IkQrNCtEK1QmNEZERlRAVBBkGVQZZBl0ElQiZCJ0Ln'
+      'P+g/d0B4QHlAB0EIQQlByT7KPlk/Wj9bP+k/6j/rP6s9rD07Pjw+PT7LPsw+zT6NPI48'
+      'HT0ePSE9rT2uPbE9cTtyOwE8AjwDPJE8kjyTPFM6VDrjOuQ65TpzO3Q7dTs1OTY5xTnG'
+      'Occ5VTpWOlc6FzgYOKc4qDipODc5ODk5Ofk2+jaJN4o3izcZOBo4Gzi7NLw0SzVMNU01'
+      '+zb8Nv02nTOeMy00LjQvNL00vjS/NH8ygDIPMxAzETOfM6AzoTNhMWIx8THyMfMxgTKC'
+      'MoMyQzBEMNMw1DDVMGMxZDFlMSUvJi+1L7YvuS9FMEYwSTAJLgoumS6aLpsuKS8qLysv'
+      '6yzsLHstfC19LQsuDC4NLs0rzitdLF4sXyztLO4s7yyvKrAqPytAK0ErzyvQK9ErkSmS'
+      'KSEqIiojKrEqsiqzKlMnVCfjJ+Qn5SeTKZQplSk1JjYmxSbGJscmVSdWJ1cnFyUYJacl'
+      'qCWpJTcmOCY5Jvkj+iOJJIokiyQZJRolGyXbItwiayNsI20j+yP8I/0jjCSNJBwlHSUe'
+      'JawlrSWuJaolqyU6JjsmPCbKJssmzCbIJskmWCdZJ1on6CfpJ+on5ifnJ5YplymYKSYq'
+      'JyooKiQqJSq0KrUqtipEK0UrRitCK0Mr0ivTK9QrYixjLGQsYCxhLPAs8SzyLIAtgS2C'
+      'LX4tfy0OLg8uEC6eLp8uoC6cLp0uLC8tLy4vvC+9L74vui+7L0owSzBMMNow2zDcMNYw'
+      '2TBmMWkxajH2Mfkx+jH0MfUxhDKFMoYyFDMVMxYzEjMTM6IzozOkMzI0MzQ0NDA0MTTA'
+      'NME0wjRQNVE1UjVONU81/jb/NgA3jjePN5A3jDeNNxw4HTgeOKw4rTiuOKo4qzg6OTs5'
+      'PDnKOcs5zDnIOck5WDpZOlo66DrpOuo65jrnOnY7dzt4OwY8BzwIPAQ8BTyUPJU8ljwk'
+      'PSU9Jj0iPSM9sj2zPbQ9Qj5DPkQ+Pj5BPs4+0T7SPl4/YT9iP1w/XT/sP+0/7j98QH1A'
+      'fkB6QHtACkELQQxBmkGbQZxBmEGZQShCKUIqQrhCuUK6QrZCt0JmRGdEaET2RPdE+ET0'
+      'RPVEhEWFRYZFFEYVRhZGEkYTRqJGo0akRjJHM0c0RzBHMUfAR8FHwkdQSFFIUkhOSE9I'
+      '3kjfSOBIbklvSXBJbEltSfxJ/Un+SYxKjUqOSopKi0oaSxtLHEuqS6tLrEumS6lLNkw5'
+      'TDpMxkzJTMpMxEzFTFRNVU1WTeRN5U3mTeJN401yTnNOdE4CTwNPBE8ATwFPkE+RT5JP'
+      'IFAhUCJQdU52TgVPBk8JT5VPlk+ZT1lNWk3pTepN6015TnpOe047TDxMy0zMTM1MW01c'
+      'TV1NHUseS61LrkuvSz1MPkw/TP9JAEqPSpBKkUofSyBLIUvhSOJIcUlySXNJAUoCSgNK'
+      'w0fER1NIVEhVSONI5EjlSKVGpkY1RzZHN0fFR8ZHx0eHRYhFF0YYRhlGp0aoRqlGaURq'
+      'RPlE+kT7RIlFikWLRStCLEK7QrxCvUJrRGxEbUQNQQ5BnUGeQaFBLUIuQjFC8T/yP4FA'
+      'gkCDQBFBEkETQdM+1D5jP2Q/ZT/zP/Q/9T+1PbY9RT5GPkc+1T7WPtc+lzyYPCc9KD0p'
+      'Pbc9uD25PXk7ejsJPAo8CzyZPJo8mzxbOlw66zrsOu06ezt8O307PTk+Oc05zjnPOV06'
+      'XjpfOh84IDivOLA4sTg/OUA5QTkBNwI3kTeSN5M3ITgiOCM4wzTENFM1VDVVNQM3BDcF'
+      'N6UzpjM1NDY0OTTFNMY0yTSJMooyGTMaMxszqTOqM6szazFsMfsx/DH9MYsyjDKNMk0w'
+      'TjDdMN4w3zBtMW4xbzEvLzAvvy/AL8EvTzBQMFEwES4SLqEuoi6jLjEvMi8zL/Ms9CyD'
+      'LYQthS0TLhQuFS7VK9YrZSxmLGcs9Sz2LPcstyq4KkcrSCtJK9cr2CvZK5kpmikpKioq'
+      'Kyq5KroquypbJ1wn6yfsJ+0nmymcKZ0pLCotKrwqvSq+KkwrTStOK0orSyvaK9sr3Ctq'
+      'LGssbCxoLGks+Cz5LPosiC2JLYothi2HLRYuFy4YLqYupy6oLqQupS40LzUvNi/EL8Uv'
+      'xi/CL8MvUjBTMFQw4jDjMOQw4DDhMHAxcTFyMQAyATICMv4x/zGOMo8ykDIeMx8zIDMc'
+      'Mx0zrDOtM64zPDQ9ND40OjQ7NMo0yzTMNFo1WzVcNVY1WTUGNwk3CjeWN5k3mjeUN5U3'
+      'JDglOCY4tDi1OLY4sjizOEI5QzlEOdI50znUOdA50TlgOmE6YjrwOvE68jruOu86fjt/'
+      'O4A7DjwPPBA8DDwNPJw8nTyePCw9LT0uPSo9Kz26Pbs9vD1KPks+TD5IPkk+2D7ZPto+'
+      'aD9pP2o/Zj9nP/Y/9z/4P4ZAh0CIQIRAhUAUQRVBFkGkQaVBpkGiQaNBMkIzQjRCwkLD'
+      'QsRCvkLBQm5EcURyRP5EAUUCRfxE/USMRY1FjkUcRh1GHkYaRhtGqkarRqxGOkc7RzxH'
+      'OEc5R8hHyUfKR1hIWUhaSFZIV0jmSOdI6Eh2SXdJeEl0SXVJBEoFSgZKlEqVSpZKkkqT'
+      'SiJLI0skS7JLs0u0S7BLsUtATEFMQkzQTNFM0kzOTM9MXk1fTWBN7k3vTfBN7E3tTXxO'
+      'fU5+TgxPDU8OTwpPC0+aT5tPnE8qUCtQLFB/ToBOD08QTxFPn0+gT6FPYU1iTfFN8k3z'
+      'TYFOgk6DTkNMREzTTNRM1UxjTWRNZU0lSyZLtUu2S7dLRUxGTEdMB0oISpdKmEqZSidL'
+      'KEspS+lI6kh5SXpJe0kJSgpKC0rLR8xHW0hcSF1I60jsSO1IrUauRj1HPkdBR81HzkfR'
+      'R5FFkkUhRiJGI0axRrJGs0ZzRHREA0UERQVFk0WURZVFNUI2QsVCxkLHQnVEdkR3RBdB'
+      'GEGnQahBqUE3QjhCOUL5P/o/iUCKQItAGUEaQRtB2z7cPms/bD9tP/s//D/9P709vj1N'
+      'Pk4+Tz7dPt4+3z6fPKA8Lz0wPTE9vz3APcE9gTuCOxE8EjwTPKE8ojyjPGM6ZDrzOvQ6'
+      '9TqDO4Q7hTtFOUY51TnWOdk5ZTpmOmk6KTgqOLk4uji7OEk5SjlLOQs3DDebN5w3nTcr'
+      'OCw4LTjNNM40XTVeNV81DTcONw83rzOwMz80QDRBNM800DTRNJEykjIhMyIzIzOxM7Iz'
+      'szNzMXQxAzIEMgUykzKUMpUyVTBWMOUw5jDnMHUxdjF3MTcvOC/HL8gvyS9XMFgwWTAZ'
+      'LhouqS6qLqsuOS86Lzsv+yz8LIstjC2NLRsuHC4dLqwurS48Lz0vPi/ML80vzi/KL8sv'
+      'WjBbMFww6jDrMOww6DDpMHgxeTF6MQgyCTIKMgYyBzKWMpcymDImMyczKDMkMyUztDO1'
+      'M7YzRDRFNEY0QjRDNNI00zTUNGI1YzVkNWA1YTUQNxE3EjegN6E3ojeeN583LjgvODA4'
+      'vji/OMA4vDi9OEw5TTlOOdw53TneOdo52zlqOms6bDr6Ovs6/Dr2Ovk6hjuJO4o7FjwZ'
+      'PBo8FDwVPKQ8pTymPDQ9NT02PTI9Mz3CPcM9xD1SPlM+VD5QPlE+4D7hPuI+cD9xP3I/'
+      'bj9vP/4//z8AQI5Aj0CQQIxAjUAcQR1BHkGsQa1BrkGqQatBOkI7QjxCykLLQsxCyELJ'
+      'QnhEeUR6RAhFCUUKRQZFB0WWRZdFmEUmRidGKEYkRiVGtEa1RrZGREdFR0ZHQkdDR9JH'
+      '00fUR2JIY0hkSF5IYUjuSPFI8kh+SYFJgkl8SX1JDEoNSg5KnEqdSp5KmkqbSipLK0ss'
+      'S7pLu0u8S7hLuUtITElMSkzYTNlM2kzWTNdMZk1nTWhN9k33TfhN9E31TYROhU6GThRP'
+      'FU8WTxJPE0+iT6NPpE8yUDNQNFCHTohOF08YTxlPp0+oT6lPaU1qTflN+k37TYlOik6L'
+      'TktMTEzbTNxM3UxrTWxNbU0tSy5LvUu+S8FLTUxOTFFMEUoSSqFKokqjSjFLMkszS/NI'
+      '9EiDSYRJhUkTShRKFUrVR9ZHZUhmSGdI9Uj2SPdIt0a4RkdHSEdJR9dH2EfZR5lFmkUp'
+      'RipGK0a5RrpGu0Z7RHxEC0UMRQ1Fm0WcRZ1FPUI+Qs1CzkLPQn1EfkR/RB9BIEGvQbBB'
+      'sUE/QkBCQUIBQAJAkUCSQJNAIUEiQSNB4z7kPnM/dD91PwNABEAFQMU9xj1VPlY+WT7l'
+      'PuY+6T6pPKo8OT06PTs9yT3KPcs9izuMOxs8HDwdPKs8rDytPG06bjr9Ov46/zqNO447'
+      'jztPOVA53zngOeE5bzpwOnE6MTgyOME4wjjDOFE5UjlTORM3FDejN6Q3pTczODQ4NTjV'
+      'NNY0ZTVmNWc1FTcWNxc3tzO4M0c0SDRJNNc02DTZNJkymjIpMyozKzO5M7ozuzN7MXwx'
+      'CzIMMg0ymzKcMp0yLDMtM7wzvTO+M0w0TTRONEo0SzTaNNs03DRqNWs1bDVoNWk1GDcZ'
+      'Nxo3qDepN6o3pjenNzY4Nzg4OMY4xzjIOMQ4xThUOVU5VjnkOeU55jniOeM5cjpzOnQ6'
+      'AjsDOwQ7ADsBO5A7kTuSOyA8ITwiPB48HzyuPK88sDw+PT89QD08PT09zD3NPc49XD5d'
+      'Pl4+Wj5bPuo+6z7sPno/ez98P3Y/eT8GQAlACkCWQJlAmkCUQJVAJEElQSZBtEG1QbZB'
+      'skGzQUJCQ0JEQtJC00LUQtBC0UKARIFEgkQQRRFFEkUORQ9FnkWfRaBFLkYvRjBGLEYt'
+      'RrxGvUa+RkxHTUdOR0pHS0faR9tH3EdqSGtIbEhoSGlI+Ej5SPpIiEmJSYpJhkmHSRZK'
+      'F0oYSqZKp0qoSqRKpUo0SzVLNkvES8VLxkvCS8NLUkxTTFRM4kzjTORM3kzhTG5NcU1y'
+      'Tf5NAU4CTvxN/U2MTo1Ojk4cTx1PHk8aTxtPqk+rT6xPOlA7UDxQkU6STiFPIk8jT7FP'
+      'sk+zT3NNdE0DTgROBU6TTpROlU5VTFZM5UzmTOdMdU12TXdNN0s4S8dLyEvJS1dMWExZ'
+      'TBlKGkqpSqpKq0o5SzpLO0v7SPxIi0mMSY1JG0ocSh1K3UfeR21IbkhvSP1I/kj/SL9G'
+      'wEZPR1BHUUffR+BH4UehRaJFMUYyRjNGwUbCRsNGg0SERBNFFEUVRaNFpEWlRUVCRkLV'
+      'QtZC2UKFRIZEiUQpQSpBuUG6QbtBSUJKQktCC0AMQJtAnECdQCtBLEEtQe0+7j59P34/'
+      'fz8NQA5AD0DPPdA9Xz5gPmE+7z7wPvE+sTyyPEE9Qj1DPdE90j3TPZM7lDsjPCQ8JTyz'
+      'PLQ8tTx1OnY6BTsGOwc7lTuWO5c7VzlYOec56DnpOXc6eDp5Ojk4OjjJOMo4yzhZOVo5'
+      'WzkbNxw3qzesN603Ozg8OD04zDjNOFw5XTleOew57TnuOeo56zl6Ons6fDoKOws7DDsI'
+      'Owk7mDuZO5o7KDwpPCo8JjwnPLY8tzy4PEY9Rz1IPUQ9RT3UPdU91j1kPmU+Zj5iPmM+'
+      '8j7zPvQ+gj+DP4Q/gD+BPxBAEUASQKBAoUCiQJ5An0AuQS9BMEG+Qb9BwEG8Qb1BTEJN'
+      'Qk5C3ELdQt5C2kLbQopEi0SMRBpFG0UcRRZFGUWmRalFqkU2RjlGOkY0RjVGxEbFRsZG'
+      'VEdVR1ZHUkdTR+JH40fkR3JIc0h0SHBIcUgASQFJAkmQSZFJkkmOSY9JHkofSiBKrkqv'
+      'SrBKrEqtSjxLPUs+S8xLzUvOS8pLy0taTFtMXEzqTOtM7EzoTOlMeE15TXpNCE4JTgpO'
+      'Bk4HTpZOl06YTiZPJ08oTyRPJU+0T7VPtk9EUEVQRlCZTppOKU8qTytPuU+6T7tPe018'
+      'TQtODE4NTptOnE6dTl1MXkztTO5M70x9TX5Nf00/S0BLz0vQS9FLX0xgTGFMIUoiSrFK'
+      'skqzSkFLQktDSwNJBEmTSZRJlUkjSiRKJUrlR+ZHdUh2SHlIBUkGSQlJyUbKRllHWkdb'
+      'R+lH6kfrR6tFrEU7RjxGPUbLRsxGzUaNRI5EHUUeRR9FrUWuRa9FT0JQQt9C4ELhQo9E'
+      'kESRRDFBMkHBQcJBw0FRQlJCU0ITQBRAo0CkQKVAM0E0QTVB9T72PoU/hj+HPxVAFkAX'
+      'QNc92D1nPmg+aT73Pvg++T65PLo8ST1KPUs92T3aPds9mzucOys8LDwtPLs8vDy9PEw9'
+      'TT3cPd093j1sPm0+bj5qPms++j77Pvw+ij+LP4w/iD+JPxhAGUAaQKhAqUCqQKZAp0A2'
+      'QTdBOEHGQcdByEHEQcVBVEJVQlZC5ELlQuZC4kLjQpJEk0SURCJFI0UkRSBFIUWwRbFF'
+      'skVARkFGQkY+Rj9GzkbPRtBGXkdfR2BHXEddR+xH7UfuR3xIfUh+SHpIe0gKSQtJDEma'
+      'SZtJnEmWSZlJJkopSipKtkq5SrpKtEq1SkRLRUtGS9RL1UvWS9JL00tiTGNMZEzyTPNM'
+      '9EzwTPFMgE2BTYJNEE4RThJODk4PTp5On06gTi5PL08wTyxPLU+8T71Pvk9MUE1QTlCh'
+      'TqJOMU8yTzNPwU/CT8NPg02ETRNOFE4VTqNOpE6lTmVMZkz1TPZM+UyFTYZNiU1JS0pL'
+      '2UvaS9tLaUxqTGtMK0osSrtKvEq9SktLTEtNSw1JDkmdSZ5Jn0ktSi5KL0rvR/BHf0iA'
+      'SIFID0kQSRFJ0UbSRmFHYkdjR/FH8kfzR7NFtEVDRkRGRUbTRtRG1UaVRJZEJUUmRSdF'
+      'tUW2RbdFV0JYQudC6ELpQpdEmESZRDlBOkHJQcpBy0FZQlpCW0IbQBxAq0CsQK1AO0E8'
+      'QT1BzEHNQVxCXUJeQuxC7ULuQupC60KaRJtEnEQqRStFLEUoRSlFuEW5RbpFSEZJRkpG'
+      'RkZHRtZG10bYRmZHZ0doR2RHZUf0R/VH9keESIVIhkiCSINIEkkTSRRJokmjSaRJoEmh'
+      'STBKMUoySsBKwUrCSr5Kv0pOS09LUEveS99L4EvcS91LbExtTG5M/Ez9TP5M+kz7TIpN'
+      'i02MTRpOG04cThZOGU6mTqlOqk42TzlPOk80TzVPxE/FT8ZPVFBVUFZQq06sTjtPPE89'
+      'T8tPzE/NT41Njk0dTh5OH06tTq5Or05vTHBM/0wATQFNj02QTZFNUUtSS+FL4kvjS3FM'
+      'ckxzTDNKNErDSsRKxUpTS1RLVUsVSRZJpUmmSadJNUo2SjdK90f4R4dIiEiJSBdJGEkZ'
+      'SdlG2kZpR2pHa0f5R/pH+0e7RbxFS0ZMRk1G20bcRt1GbEdtR/xH/Uf+R4xIjUiOSIpI'
+      'i0gaSRtJHEmqSatJrEmoSalJOEo5SjpKyErJSspKxkrHSlZLV0tYS+ZL50voS+RL5Ut0'
+      'THVMdkwETQVNBk0CTQNNkk2TTZRNIk4jTiROIE4hTrBOsU6yTkBPQU9CTz5PP0/OT89P'
+      '0E9eUF9QYFCzTrROQ09ET0VP00/UT9VPlU2WTSVOJk4nTrVOtk63TndMeEwHTQhNCU2X'
+      'TZhNmU1ZS1pL6UvqS+tLeUx6THtMO0o8SstKzErNSltLXEtdS+xL7Ut8TH1MfkwMTQ1N'
+      'Dk0KTQtNmk2bTZxNKk4rTixOKE4pTrhOuU66TkhPSU9KT0ZPR0/WT9dP2E9mUGdQaFC7'
+      'TrxOS09MT01P20/cT91P');
+
+  /// Data Matrix bit positions, in the order of [dataMatrixSizes]
+  static final dataMatrixPlacement = <List<int> Function()>[
+    () => dataMatrixPlacement10x10,
+    () => dataMatrixPlacement12x12,
+    () => dataMatrixPlacement14x14,
+    () => dataMatrixPlacement16x16,
+    () => dataMatrixPlacement18x18,
+    () => dataMatrixPlacement20x20,
+    () => dataMatrixPlacement22x22,
+    () => dataMatrixPlacement24x24,
+    () => dataMatrixPlacement26x26,
+    () => dataMatrixPlacement32x32,
+    () => dataMatrixPlacement36x36,
+    () => dataMatrixPlacement40x40,
+    () => dataMatrixPlacement44x44,
+    () => dataMatrixPlacement48x48,
+    () => dataMatrixPlacement52x52,
+    () => dataMatrixPlacement64x64,
+    () => dataMatrixPlacement72x72,
+    () => dataMatrixPlacement80x80,
+    () => dataMatrixPlacement88x88,
+    () => dataMatrixPlacement96x96,
+    () => dataMatrixPlacement104x104,
+    () => dataMatrixPlacement120x120,
+    () => dataMatrixPlacement132x132,
+    () => dataMatrixPlacement144x144,
+  ];
+
+  /// Decode a table packed by build_maps.py
+  static Uint16List _unpackUint16(String data) {
+    final bytes = ByteData.sublistView(base64.decode(data));
+    final result = Uint16List(bytes.lengthInBytes ~/ 2);
+    for (var i = 0; i < result.length; i++) {
+      result[i] = bytes.getUint16(i * 2, Endian.little);
+    }
+    return result;
+  }
+}
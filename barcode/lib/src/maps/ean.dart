@@ -0,0 +1,278 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash 4dd4eab69737e577
+// Content hash 7918a4f581c34a09
+
+// ignore_for_file: public_member_api_docs
+
+class EanMaps {
+  /// EAN 13 conversion bits
+  static const ean = <int, List<int>>{
+    0x30: <int>[0x58, 0x72, 0x27],
+    0x31: <int>[0x4c, 0x66, 0x33],
+    0x32: <int>[0x64, 0x6c, 0x1b],
+    0x33: <int>[0x5e, 0x42, 0x21],
+    0x34: <int>[0x62, 0x5c, 0x1d],
+    0x35: <int>[0x46, 0x4e, 0x39],
+    0x36: <int>[0x7a, 0x50, 0x5],
+    0x37: <int>[0x6e, 0x44, 0x11],
+    0x38: <int>[0x76, 0x48, 0x9],
+    0x39: <int>[0x68, 0x74, 0x17],
+  };
+
+  /// EAN 13 first digit
+  static const eanFirst = <int, int>{
+    0x30: 0x0, // LLLLLL
+    0x31: 0x34, // LLGLGG
+    0x32: 0x2c, // LLGGLG
+    0x33: 0x1c, // LLGGGL
+    0x34: 0x32, // LGLLGG
+    0x35: 0x26, // LGGLLG
+    0x36: 0xe, // LGGGLL
+    0x37: 0x2a, // LGLGLG
+    0x38: 0x1a, // LGLGGL
+    0x39: 0x16, // LGGLGL
+  };
+
+  /// EAN 5 checksum
+  static const ean5Checksum = <int, int>{
+    0x30: 0x3, // GGLLL
+    0x31: 0x5, // GLGLL
+    0x32: 0x9, // GLLGL
+    0x33: 0x11, // GLLLG
+    0x34: 0x6, // LGGLL
+    0x35: 0xc, // LLGGL
+    0x36: 0x18, // LLLGG
+    0x37: 0xa, // LGLGL
+    0x38: 0x12, // LGLLG
+    0x39: 0x14, // LLGLG
+  };
+
+  /// UPC-A to UPC-E conversion
+  static const upce = <int, int>{
+    0x30: 0x38, // EEEOOO | OOOEEE
+    0x31: 0x34, // EEOEOO | OOEOEE
+    0x32: 0x2c, // EEOOEO | OOEEOE
+    0x33: 0x1c, // EEOOOE | OOEEEO
+    0x34: 0x32, // EOEEOO | OEOOEE
+    0x35: 0x26, // EOOEEO | OEEOOE
+    0x36: 0xe, // EOOOEE | OEEEOO
+    0x37: 0x2a, // EOEOEO | OEOEOE
+    0x38: 0x1a, // EOEOOE | OEOEEO
+    0x39: 0x16, // EOOEOE | OEEOEO
+  };
+
+  /// EAN misc bits
+  static const eanStartEnd = 0x5;
+  static const eanCenter = 0xa;
+  static const eanEndUpcE = 0x2a;
+  static const eanStartEan2 = 0x1a;
+  static const eanCenterEan2 = 0x2;
+
+  /// EAN L-code bar widths, indexed by code unit
+  static const eanLRuns = <List<int>>[
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[0, 3, 2, 1, 1, 0], // "0"
+    <int>[0, 2, 2, 2, 1, 0], // "1"
+    <int>[0, 2, 1, 2, 2, 0], // "2"
+    <int>[0, 1, 4, 1, 1, 0], // "3"
+    <int>[0, 1, 1, 3, 2, 0], // "4"
+    <int>[0, 1, 2, 3, 1, 0], // "5"
+    <int>[0, 1, 1, 1, 4, 0], // "6"
+    <int>[0, 1, 3, 1, 2, 0], // "7"
+    <int>[0, 1, 2, 1, 3, 0], // "8"
+    <int>[0, 3, 1, 1, 2, 0], // "9"
+  ];
+
+  /// EAN G-code bar widths, indexed by code unit
+  static const eanGRuns = <List<int>>[
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[0, 1, 1, 2, 3, 0], // "0"
+    <int>[0, 1, 2, 2, 2, 0], // "1"
+    <int>[0, 2, 2, 1, 2, 0], // "2"
+    <int>[0, 1, 1, 4, 1, 0], // "3"
+    <int>[0, 2, 3, 1, 1, 0], // "4"
+    <int>[0, 1, 3, 2, 1, 0], // "5"
+    <int>[0, 4, 1, 1, 1, 0], // "6"
+    <int>[0, 2, 1, 3, 1, 0], // "7"
+    <int>[0, 3, 1, 2, 1, 0], // "8"
+    <int>[0, 2, 1, 1, 3, 0], // "9"
+  ];
+
+  /// EAN R-code bar widths, indexed by code unit
+  static const eanRRuns = <List<int>>[
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[3, 2, 1, 1], // "0"
+    <int>[2, 2, 2, 1], // "1"
+    <int>[2, 1, 2, 2], // "2"
+    <int>[1, 4, 1, 1], // "3"
+    <int>[1, 1, 3, 2], // "4"
+    <int>[1, 2, 3, 1], // "5"
+    <int>[1, 1, 1, 4], // "6"
+    <int>[1, 3, 1, 2], // "7"
+    <int>[1, 2, 1, 3], // "8"
+    <int>[3, 1, 1, 2], // "9"
+  ];
+
+  /// EAN misc bar widths
+  static const eanStartEndRuns = <int>[1, 1, 1, 0];
+  static const eanCenterRuns = <int>[0, 1, 1, 1, 1, 1];
+  static const eanEndUpcERuns = <int>[0, 1, 1, 1, 1, 1, 1, 0];
+  static const eanStartEan2Runs = <int>[0, 1, 1, 1, 2, 0];
+  static const eanCenterEan2Runs = <int>[0, 1, 1, 0];
+}
@@ -0,0 +1,283 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash f36b1d1ac2bc9195
+// Content hash 950ace96a99253ad
+
+// ignore_for_file: public_member_api_docs
+
+import 'dart:convert';
+import 'dart:typed_data';
+
+import 'common.dart';
+
+class ItfMaps {
+  static const noCode = CommonMaps.noCode;
+
+  /// ITF conversion bits
+  static const itf = <int, int>{
+    0x30: 0xc, // "0"
+    0x31: 0x11, // "1"
+    0x32: 0x12, // "2"
+    0x33: 0x3, // "3"
+    0x34: 0x14, // "4"
+    0x35: 0x5, // "5"
+    0x36: 0x6, // "6"
+    0x37: 0x18, // "7"
+    0x38: 0x9, // "8"
+    0x39: 0xa, // "9"
+  };
+
+  /// ITF misc bits
+  static const itfStart = 0x5;
+  static const itfEnd = 0x17;
+
+  /// ITF conversion bits, indexed by code unit
+  static const itfTable = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xc, // "0"
+    0x11, // "1"
+    0x12, // "2"
+    0x3, // "3"
+    0x14, // "4"
+    0x5, // "5"
+    0x6, // "6"
+    0x18, // "7"
+    0x9, // "8"
+    0xa, // "9"
+  ];
+
+  /// ITF bar widths of one color, indexed by code unit
+  static const itfRuns = <List<int>>[
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[],
+    <int>[1, 1, 3, 3, 1], // "0"
+    <int>[3, 1, 1, 1, 3], // "1"
+    <int>[1, 3, 1, 1, 3], // "2"
+    <int>[3, 3, 1, 1, 1], // "3"
+    <int>[1, 1, 3, 1, 3], // "4"
+    <int>[3, 1, 3, 1, 1], // "5"
+    <int>[1, 3, 3, 1, 1], // "6"
+    <int>[1, 1, 1, 3, 3], // "7"
+    <int>[3, 1, 1, 3, 1], // "8"
+    <int>[1, 3, 1, 3, 1], // "9"
+  ];
+
+  /// ITF misc bar widths
+  static const itfStartRuns = <int>[1, 1, 1, 1];
+  static const itfEndRuns = <int>[3, 1, 1, 0];
+
+  /// ITF digit values, indexed by code unit
+  static const itfValue = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x0, // "0"
+    0x1, // "1"
+    0x2, // "2"
+    0x3, // "3"
+    0x4, // "4"
+    0x5, // "5"
+    0x6, // "6"
+    0x7, // "7"
+    0x8, // "8"
+    0x9, // "9"
+  ];
+
+  /// ITF conversion bits of the digit pairs, indexed by value
+  static const itfPairs = <int>[
+    0x11c75, 0x5dd1, 0x5dc5, 0x17711, 0x5c75, 0x171d1, 0x171c5, 0x4775, // 0
+    0x11dd1, 0x11dc5, 0x1c457, 0x7547, 0x7517, 0x1d447, 0x7457, 0x1d147, // 8
+    0x1d117, 0x7157, 0x1c547, 0x1c517, 0x1c45d, 0x7571, 0x751d, 0x1d471, // 16
+    0x745d, 0x1d171, 0x1d11d, 0x715d, 0x1c571, 0x1c51d, 0x11177, 0x55c7, // 24
+    0x5477, 0x151c7, 0x5177, 0x145c7, 0x14477, 0x4577, 0x115c7, 0x11477, // 32
+    0x1c475, 0x75d1, 0x75c5, 0x1d711, 0x7475, 0x1d1d1, 0x1d1c5, 0x7175, // 40
+    0x1c5d1, 0x1c5c5, 0x111d7, 0x5747, 0x5717, 0x15c47, 0x51d7, 0x14747, // 48
+    0x14717, 0x45d7, 0x11747, 0x11717, 0x111dd, 0x5771, 0x571d, 0x15c71, // 56
+    0x51dd, 0x14771, 0x1471d, 0x45dd, 0x11771, 0x1171d, 0x1c715, 0x7751, // 64
+    0x7745, 0x1dd11, 0x7715, 0x1dc51, 0x1dc45, 0x71d5, 0x1c751, 0x1c745, // 72
+    0x11c57, 0x5d47, 0x5d17, 0x17447, 0x5c57, 0x17147, 0x17117, 0x4757, // 80
+    0x11d47, 0x11d17, 0x11c5d, 0x5d71, 0x5d1d, 0x17471, 0x5c5d, 0x17171, // 88
+    0x1711d, 0x475d, 0x11d71, 0x11d1d, // 96
+  ];
+
+  /// ITF bar and space widths of the digit pairs, indexed by
+  /// value * 10
+  static final itfPairRuns = _unpackUint8(
+      'AQEBAQMDAwMBAQEDAQEDAQMBAQMBAQEDAwEDAQEDAQMBAwMBAwEBAQEBAQEDAwMBAQMB'
+      'AwEBAwMDAQEBAQEBAwMDAwEBAQEBAQEDAQMDAQMBAwEBAwEDAwEBAQEBAwMBAwMBAQMB'
+      'AQEBAwEDAwEDAwEBAQEBAQMDAwEBAwEBAQEDAwMDAQMBAQEBAwEDAQEBAQMBAQMDAwMB'
+      'AQEDAQEDAQMBAQMBAwEBAwEDAQEBAQEBAwMDAwMBAQEBAQMDAQMBAQMBAQEDAwEBAQMB'
+      'AQMBAwMBAQMDAQEBAQEDAwEBAwMBAQEBAwMBAwMDAQEBAQMBAQEDAQEDAQEDAwEDAwEB'
+      'AwEBAwEBAQMDAQMBAQMBAQEDAQEBAQMDAwEDAwEBAQEDAwEBAQMDAQEBAwMBAwEDAQED'
+      'AQMBAQMDAwEBAQEBAQMDAQMDAQEBAQEDAwMDAwEBAQEBAQMBAwEBAwEBAQMDAwMBAQMB'
+      'AQEBAwEDAwEDAQEBAQMBAwEBAQEDAQMDAwMBAQEBAwEBAwEDAwEBAQMBAQEBAQEDAwED'
+      'AwEBAwEBAwEBAQMDAQEBAwMBAQEDAwEDAQMDAQEBAwEBAQEBAwMBAQMDAQMBAQMDAQED'
+      'AQEBAQMDAwEBAwEBAQEBAwEBAwMDAQMBAQMBAQMDAQEBAQMDAQEDAwEDAQEBAwMBAwEB'
+      'AwMBAQMBAQEBAwMBAQMDAQEBAQMDAwEDAwEBAQEBAwEBAQMDAQEBAwMDAQEDAwEBAQED'
+      'AQEDAwMBAQEBAwEBAQMBAQMBAwMDAQEDAQEDAQEDAQEDAwEBAwEBAQEDAQMDAQMBAQED'
+      'AwEDAQEBAQMBAQMDAwEBAQEDAQMDAwMBAQEBAQEBAwEDAwEBAQMBAwMBAwMBAQEBAQED'
+      'AwMDAQEBAQEBAwEDAQEDAQMBAwMBAwEBAwEBAQEDAwMBAQMBAQEBAQEBAwMDAwEBAwEB'
+      'AQEDAQMDAQEBAwEBAwEDAwEDAQMBAQMBAwEBAQEBAQMDAQMDAQMBAQEDAwEDAQEBAQMB'
+      'AwMBAwEBAQEBAQEDAwMDAQMBAQEBAwMDAQEBAQMBAQMDAwEDAQEBAQMDAwEBAwMBAQEB'
+      'AwEBAwMBAQMBAQMBAQMDAwEDAQEDAQEBAwEBAQEDAwEBAwMDAQEBAwMBAQEDAQEDAQMD'
+      'AQEBAwEBAQEBAwMBAwMDAQEBAQMDAQEDAQEDAQEDAwEBAQEDAQEDAwMBAQEDAwEBAQMB'
+      'AQMBAQMDAQEDAQEDAQMDAwEBAwEBAQEBAwEBAwMBAQMBAwMBAQMDAQEBAQEDAwEDAwEB'
+      'AQEBAwEBAQMDAQMBAwMBAQEDAwEBAQEDAwEBAwMBAQ==');
+
+  /// Decode a table packed by build_maps.py
+  static Uint8List _unpackUint8(String data) {
+    return base64.decode(data);
+  }
+}
@@ -0,0 +1,489 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash 56bdc9df093df36b
+// Content hash 9d270f4dca0d831c
+
+// ignore_for_file: public_member_api_docs
+
+import 'dart:convert';
+import 'dart:typed_data';
+
+class Pdf417Maps {
+  /// PDF417 codeword modules, indexed by cluster * 929 + value
+  static final pdf417Codewords = _unpackInt32(
+      'wNUBAPDqAQB89QEA4NQBAHjqAQA+9QEAwKgBAHDUAQBgqAEAQFABADCoAQAgUAEAwK0B'
+      'APDWAQB86wEA4KwBAHjWAQA+6wEAwFgBAHCsAQBgWAEAwF0BAPCuAQB81wEA4FwBAHiu'
+      'AQA+1wEAcFwBADyuAQDwXgEAfK8BAHheAQA+rwEAfF8BAPr1AQDg0gEAeOkBAL70AQDA'
+      'pAEAcNIBADzpAQBgpAEAONIBAEBIAQAwpAEAHNIBACBIAQAYpAEAEEgBAOCmAQB40wEA'
+      'vukBAMBMAQBwpgEAPNMBAGBMAQA4pgEAHtMBADBMAQAcpgEA4E4BAHinAQC+0wEAcE4B'
+      'ADynAQA4TgEAHqcBAHhPAQC+pwEAPE8BAB5PAQDAogEAcNEBALzoAQBgogEAONEBAJ7o'
+      'AQBARAEAMKIBABzRAQAgRAEAGKIBABBEAQAIRAEAwEYBAHCjAQC80QEAYEYBADijAQCe'
+      '0QEAMEYBAByjAQAYRgEADEYBAHBHAQC8owEAOEcBAJ6jAQAcRwEAvEcBAGChAQC40AEA'
+      'XugBAEBCAQAwoQEAnNABACBCAQAYoQEAjtABABBCAQAMoQEACEIBAAahAQBgQwEAuKEB'
+      'AN7QAQAwQwEAnKEBABhDAQCOoQEADEMBAAZDAQDeoQEAjkMBAEBBAQCwoAEAXNABACBB'
+      'AQCYoAEATtABABBBAQCMoAEACEEBAIagAQAEQQEAsEEBAJhBAQCMQQEAoEABAC7QAQBM'
+      'oAEARqABAIJAAQDgygEAeOUBAL7yAQDAlAEAcMoBADzlAQBglAEAOMoBAB7lAQBAKAEA'
+      'MJQBACAoAQDglgEAeMsBAL7lAQDALAEAcJYBADzLAQBgLAEAOJYBADAsAQAYLAEA4C4B'
+      'AHiXAQC+ywEAcC4BADyXAQA4LgEAHC4BAHgvAQC+lwEAPC8BAL4vAQDA2gEAcO0BALz2'
+      'AQBg2gEAOO0BAJ72AQBAtAEAMNoBABztAQAgtAEAGNoBAA7tAQAQtAEADNoBAMCSAQBw'
+      'yQEAvOQBAMC2AQBgkgEAOMkBAJ7kAQBgtgEAONsBAJ7tAQBAbAEAICQBABiSAQAOyQEA'
+      'IGwBABi2AQAQbAEAwCYBAHCTAQC8yQEAwG4BAGAmAQA4kwEAnskBAGBuAQA4twEAntsB'
+      'ADBuAQAYJgEAGG4BAHAnAQC8kwEAcG8BADgnAQCekwEAOG8BAJ63AQAcbwEAvCcBALxv'
+      'AQCeJwEAnm8BAGDZAQC47AEAXvYBAECyAQAw2QEAnOwBACCyAQAY2QEAjuwBABCyAQAM'
+      '2QEACLIBAASyAQBgkQEAuMgBAF7kAQBgswEAMJEBAJzIAQBAZgEAICIBAJzZAQCOyAEA'
+      'IGYBABAiAQAMkQEAEGYBAAyzAQAGkQEABCIBAGAjAQC4kQEA3sgBAGBnAQAwIwEAnJEB'
+      'ADBnAQCcswEAjpEBABhnAQAMIwEABiMBALgjAQDekQEAuGcBAJwjAQCcZwEAjiMBAI5n'
+      'AQDeZwEAQLEBALDYAQBc7AEAILEBAJjYAQBO7AEAELEBAIzYAQAIsQEAhtgBAASxAQAC'
+      'sQEAQCEBALCQAQBcyAEAQGMBACAhAQCYkAEATsgBACBjAQCYsQEAztgBABBjAQAIIQEA'
+      'hpABAAhjAQCGsQEABGMBALAhAQDckAEAsGMBAJghAQDOkAEAmGMBAM6xAQCMYwEAhiEB'
+      'AIZjAQDcYwEAzmMBAKCwAQBY2AEALuwBAJCwAQBM2AEAiLABAEbYAQCEsAEAgrABAKAg'
+      'AQBYkAEALsgBAKBhAQCQIAEATJABAJBhAQDMsAEARpABAIhhAQCEIAEAhGEBAIIgAQDY'
+      'IAEA2GEBAMxhAQDGYQEALNgBACbYAQBCsAEALJABAEggAQDIYAEAxGABAMJgAQDAigEA'
+      'cMUBALziAQBgigEAOMUBAEAUAQAwigEAHMUBACAUAQAYigEAEBQBAAgUAQDAFgEAcIsB'
+      'ALzFAQBgFgEAOIsBAJ7FAQAwFgEAHIsBABgWAQAMFgEAcBcBALyLAQA4FwEAnosBABwX'
+      'AQC8FwEAnhcBAGDNAQC45gEAXvMBAECaAQAwzQEAnOYBACCaAQAYzQEAjuYBABCaAQAM'
+      'zQEACJoBAAbNAQBgiQEAuMQBAF7iAQBgmwEAMIkBAJzEAQBANgEAIBIBAJzNAQCOxAEA'
+      'IDYBABibAQAMiQEAEDYBAAgSAQAINgEAYBMBALiJAQDexAEAYDcBADATAQDezQEAMDcB'
+      'AJybAQCOiQEAGDcBAAwTAQAMNwEAuBMBAN6JAQC4NwEAnBMBAJw3AQCOEwEA3hMBAN43'
+      'AQBA3QEAsO4BAFz3AQAg3QEAmO4BAE73AQAQ3QEAjO4BAAjdAQCG7gEABN0BAECZAQCw'
+      'zAEAXOYBAEC7AQAgmQEA3O4BAE7mAQAguwEAmN0BAM7uAQAQuwEACJkBAIbMAQAIuwEA'
+      'ht0BAAKZAQBAEQEAsIgBAFzEAQBAMwEAIBEBAJiIAQBOxAEAQHcBACAzAQCYmQEAzswB'
+      'ACB3AQCYuwEAzt0BAIaIAQAQdwEACDMBAIaZAQAIdwEAAhEBALARAQDciAEAsDMBAJgR'
+      'AQDOiAEAsHcBAJgzAQDOmQEAmHcBAM67AQCGEQEAhjMBANwRAQDcMwEAzhEBANx3AQDO'
+      'MwEAoNwBAFjuAQAu9wEAkNwBAEzuAQCI3AEARu4BAITcAQCC3AEAoJgBAFjMAQAu5gEA'
+      'oLkBAJCYAQBu7gEAkLkBAMzcAQBGzAEAiLkBAISYAQCEuQEAgpgBAIK5AQCgEAEAWIgB'
+      'AC7EAQCgMQEAkBABAEyIAQCgcwEAkDEBAMyYAQBGiAEAkHMBAMy5AQCEEAEAiHMBAIQx'
+      'AQCCEAEAgjEBANgQAQBuiAEA2DEBAMwQAQDYcwEAzDEBAMYQAQDMcwEAxjEBAO4QAQDu'
+      'cwEAUNwBACzuAQBI3AEAJu4BAETcAQBC3AEAUJgBACzMAQDQuAEASJgBACbMAQDIuAEA'
+      'ZtwBAMS4AQBCmAEAwrgBAFAQAQAsiAEA0DABAEgQAQAmiAEA0HEBAMgwAQBmmAEAyHEB'
+      'AOa4AQBCEAEAxHEBAMIwAQDCcQEA7DABAOxxAQDmcQEAFu4BACLcAQAWzAEAJJgBACKY'
+      'AQAoEAEAaDABAOhwAQAiEAEAYjABAGCFAQBACgEAMIUBACAKAQAYhQEAjsIBABAKAQAM'
+      'hQEACAoBAAaFAQBgCwEAuIUBAN7CAQAwCwEAnIUBABgLAQCOhQEADAsBAAYLAQC4CwEA'
+      '3oUBAJwLAQCOCwEA3gsBAECNAQCwxgEAXOMBACCNAQCYxgEAEI0BAIzGAQAIjQEAhsYB'
+      'AASNAQBACQEAsIQBAFzCAQBAGwEAIAkBANzGAQBOwgEAIBsBAJiNAQDOxgEAEBsBAAgJ'
+      'AQCGhAEACBsBAIaNAQACCQEAsAkBANyEAQCwGwEAmAkBAM6EAQCYGwEAzo0BAIwbAQCG'
+      'CQEA3AkBANwbAQDOCQEAzhsBAKDOAQBY5wEArvMBAJDOAQBM5wEAiM4BAEbnAQCEzgEA'
+      'gs4BAKCMAQBYxgEAoJ0BAJCMAQBMxgEAkJ0BAMzOAQBGxgEAiJ0BAISMAQCEnQEAgowB'
+      'AIKdAQCgCAEAWIQBAKAZAQCQCAEAbsYBAKA7AQCQGQEAzIwBAEaEAQCQOwEAzJ0BAIQI'
+      'AQCIOwEAhBkBAIIIAQCCGQEA2AgBAG6EAQDYGQEAzAgBANg7AQDMGQEAxggBAMw7AQDG'
+      'GQEA7ggBAO4ZAQDuOwEAUO8BAKz3AQBI7wEApvcBAETvAQBC7wEAUM4BACznAQDQ3gEA'
+      'bO8BACbnAQDI3gEAZu8BAMTeAQBCzgEAwt4BAFCMAQAsxgEA0JwBAEiMAQAmxgEA0L0B'
+      'AMicAQBmzgEAyL0BAObeAQBCjAEAxL0BAMKcAQDCvQEAUAgBACyEAQDQGAEASAgBACaE'
+      'AQDQOQEAyBgBAGaMAQDQewEAyDkBAOacAQBCCAEAyHsBAOa9AQDCGAEAxHsBAGwIAQDs'
+      'GAEAZggBAOw5AQDmGAEA7HsBAOY5AQDmewEAKO8BAJb3AQAk7wEAIu8BACjOAQAW5wEA'
+      'aN4BADbvAQBk3gEAIs4BAGLeAQAojAEAFsYBAGicAQAkjAEA6LwBAGScAQAijAEA5LwB'
+      'AGKcAQDivAEAKAgBABaEAQBoGAEANowBAOg4AQBkGAEAIggBAOh5AQDkOAEAYhgBAOR5'
+      'AQDiOAEA4nkBAHYYAQD2eQEAEu8BADTeAQAy3gEANJwBAHS8AQByvAEANBgBAHQ4AQD0'
+      'eAEA8ngBAEAFAQAgBQEAmIIBABAFAQAIBQEABAUBALAFAQCYBQEAjAUBAIYFAQDcBQEA'
+      'zgUBAKCGAQCQhgEATMMBAIiGAQBGwwEAhIYBAIKGAQCgBAEAWIIBAKANAQDYhgEATIIB'
+      'AJANAQDMhgEAiA0BAMaGAQCEDQEAggQBAIINAQDYBAEAboIBANgNAQDuhgEAzA0BAMYE'
+      'AQDGDQEA7gQBAO4NAQBQxwEASMcBAETHAQBCxwEAUIYBANCOAQBsxwEAJsMBAMiOAQBm'
+      'xwEAxI4BAEKGAQDCjgEAUAQBANAMAQBIBAEAJoIBANAdAQDIDAEARAQBAMgdAQDEDAEA'
+      'QgQBAMQdAQDCDAEAbAQBAOwMAQBmBAEA7B0BAOYMAQDmHQEAqOcBAKTnAQCi5wEAKMcB'
+      'AGjPAQC25wEAZM8BACLHAQBizwEAKIYBABbDAQBojgEANscBAOieAQBkjgEAIoYBAOSe'
+      'AQBijgEA4p4BACgEAQAWggEAaAwBADaGAQDoHAEAZAwBACIEAQDoPQEA5BwBAGIMAQDk'
+      'PQEA4hwBADYEAQB2DAEA9hwBAPY9AQDU9wEA0vcBAJTnAQC07wEAkucBALLvAQAUxwEA'
+      'NM8BABLHAQB03wEAMs8BAHLfAQAUhgEANI4BABKGAQB0ngEAMo4BAPS+AQBg9QEAuPoB'
+      'AEDqAQAw9QEAnPoBACDqAQAY9QEAjvoBABDqAQAM9QEACOoBAAb1AQAE6gEAYOsBALj1'
+      'AQDe+gEAQNYBADDrAQCc9QEAINYBABjrAQCO9QEAENYBAAzrAQAI1gEABusBAATWAQBg'
+      '1wEAuOsBAN71AQBArgEAMNcBAJzrAQAgrgEAGNcBAI7rAQAQrgEADNcBAAiuAQAG1wEA'
+      'BK4BAGCvAQC41wEA3usBAEBeAQAwrwEAnNcBACBeAQAYrwEAjtcBABBeAQAMrwEACF4B'
+      'AAavAQBgXwEAuK8BAN7XAQAwXwEAnK8BABhfAQCOrwEADF8BALhfAQDerwEAnF8BAI5f'
+      'AQBA6QEAsPQBAFz6AQAg6QEAmPQBAE76AQAQ6QEAjPQBAAjpAQCG9AEABOkBAALpAQBA'
+      '0wEAsOkBANz0AQAg0wEAmOkBAM70AQAQ0wEAjOkBAAjTAQCG6QEABNMBAALTAQBApwEA'
+      'sNMBANzpAQAgpwEAmNMBAM7pAQAQpwEAjNMBAAinAQCG0wEABKcBAAKnAQBATwEAsKcB'
+      'ANzTAQAgTwEAmKcBAM7TAQAQTwEAjKcBAAhPAQCGpwEABE8BALBPAQDcpwEAmE8BAM6n'
+      'AQCMTwEAhk8BANxPAQDOTwEAoOgBAFj0AQAu+gEAkOgBAEz0AQCI6AEARvQBAIToAQCC'
+      '6AEAoNEBANjoAQBu9AEAkNEBAMzoAQCI0QEAxugBAITRAQCC0QEAoKMBANjRAQDu6AEA'
+      'kKMBAMzRAQCIowEAxtEBAISjAQCCowEAoEcBANijAQDu0QEAkEcBAMyjAQCIRwEAxqMB'
+      'AIRHAQCCRwEA2EcBAO6jAQDMRwEAxkcBAO5HAQBQ6AEALPQBAEjoAQAm9AEAROgBAELo'
+      'AQDQ0AEAbOgBAMjQAQBm6AEAxNABAMLQAQDQoQEA7NABAMihAQDm0AEAxKEBAMKhAQDQ'
+      'QwEA7KEBAMhDAQDmoQEAxEMBAMJDAQDsQwEA5kMBACjoAQAW9AEAJOgBACLoAQBo0AEA'
+      'NugBAGTQAQBi0AEA6KABAHbQAQDkoAEA4qABAOhBAQD2oAEA5EEBAOJBAQAU6AEAEugB'
+      'ADTQAQAy0AEAdKABAHKgAQBA5QEAsPIBAFz5AQAg5QEAmPIBAE75AQAQ5QEAjPIBAAjl'
+      'AQCG8gEABOUBAALlAQBAywEAsOUBANzyAQAgywEAmOUBAM7yAQAQywEAjOUBAAjLAQCG'
+      '5QEABMsBAALLAQBAlwEAsMsBANzlAQAglwEAmMsBAM7lAQAQlwEAjMsBAAiXAQCGywEA'
+      'BJcBAAKXAQBALwEAsJcBANzLAQAgLwEAmJcBAM7LAQAQLwEAjJcBAAgvAQCGlwEABC8B'
+      'ALAvAQDclwEAmC8BAM6XAQCMLwEAhi8BANwvAQDOLwEAoPYBAFj7AQDwawEAkPYBAEz7'
+      'AQD4aQEAiPYBAEb7AQD8aAEAhPYBAIL2AQCg5AEAWPIBAC75AQCg7QEAkOQBAG77AQCQ'
+      '7QEAzPYBAEbyAQCI7QEAhOQBAITtAQCC5AEAgu0BAKDJAQDY5AEAbvIBAKDbAQCQyQEA'
+      'zOQBAJDbAQDM7QEAxuQBAIjbAQCEyQEAhNsBAILJAQCC2wEAoJMBANjJAQDu5AEAoLcB'
+      'AJCTAQDMyQEAkLcBAMzbAQDGyQEAiLcBAISTAQCEtwEAgpMBAIK3AQCgJwEA2JMBAO7J'
+      'AQCgbwEAkCcBAMyTAQCQbwEAzLcBAMaTAQCIbwEAhCcBAIRvAQCCJwEA2CcBAO6TAQDY'
+      'bwEAzCcBAMxvAQDGJwEAxm8BAO4nAQBQ9gEALPsBAPhlAQBI9gEAJvsBAPxkAQBE9gEA'
+      'fmQBAEL2AQBQ5AEALPIBANDsAQBI5AEAJvIBAMjsAQBm9gEAxOwBAELkAQDC7AEA0MgB'
+      'AGzkAQDQ2QEAyMgBAGbkAQDI2QEA5uwBAMTZAQDCyAEAwtkBANCRAQDsyAEA0LMBAMiR'
+      'AQDmyAEAyLMBAObZAQDEswEAwpEBAMKzAQDQIwEA7JEBANBnAQDIIwEA5pEBAMhnAQDm'
+      'swEAxGcBAMIjAQDCZwEA7CMBAOxnAQDmIwEA5mcBACj2AQAW+wEA/GIBACT2AQB+YgEA'
+      'IvYBACjkAQAW8gEAaOwBADb2AQBk7AEAIuQBAGLsAQBoyAEANuQBAOjYAQBkyAEA5NgB'
+      'AGLIAQDi2AEA6JABAHbIAQDosQEA9tgBAOSxAQDikAEA4rEBAOghAQD2kAEA6GMBAOQh'
+      'AQDkYwEA4iEBAOJjAQD2IQEA9mMBABT2AQB+YQEAEvYBABTkAQA07AEAEuQBADLsAQA0'
+      'yAEAdNgBADLIAQBy2AEAdJABAPSwAQBykAEA8rABAPQgAQD0YQEA8iABAPJhAQAK9gEA'
+      'CuQBABrsAQAayAEAOtgBADqQAQB6sAEAoOIBAFjxAQCu+AEAkOIBAEzxAQCI4gEARvEB'
+      'AITiAQCC4gEAoMUBANjiAQBu8QEAkMUBAMziAQCIxQEAxuIBAITFAQCCxQEAoIsBANjF'
+      'AQDu4gEAkIsBAMzFAQCIiwEAxsUBAISLAQCCiwEAoBcBANiLAQDuxQEAkBcBAMyLAQCI'
+      'FwEAxosBAIQXAQCCFwEA2BcBAO6LAQDMFwEAxhcBAO4XAQBQ8wEArPkBAPg1AQBI8wEA'
+      'pvkBAPw0AQBE8wEAfjQBAELzAQBQ4gEALPEBANDmAQBI4gEAJvEBAMjmAQBm8wEAxOYB'
+      'AELiAQDC5gEA0MQBAGziAQDQzQEAyMQBAGbiAQDIzQEA5uYBAMTNAQDCxAEAws0BANCJ'
+      'AQDsxAEA0JsBAMiJAQDmxAEAyJsBAObNAQDEmwEAwokBAMKbAQDQEwEA7IkBANA3AQDI'
+      'EwEA5okBAMg3AQDmmwEAxDcBAMITAQDCNwEA7BMBAOw3AQDmEwEA5jcBAKj7AQDwdQEA'
+      '/LoBAKT7AQD4dAEAfroBAKL7AQB8dAEAPnQBACjzAQCW+QEA/DIBAGj3AQC2+wEA/HYB'
+      'AH4yAQBk9wEAIvMBAH52AQBi9wEAKOIBABbxAQBo5gEAJOIBAOjuAQB29wEAIuIBAOTu'
+      'AQBi5gEA4u4BAGjEAQA24gEA6MwBAGTEAQDo3QEA5MwBAGLEAQDk3QEA4swBAOLdAQDo'
+      'iAEAdsQBAOiZAQDkiAEA6LsBAOSZAQDiiAEA5LsBAOKZAQDiuwEA6BEBAPaIAQDoMwEA'
+      '5BEBAOh3AQDkMwEA4hEBAOR3AQDiMwEA4ncBAPYRAQD2MwEAlPsBAPhyAQB+uQEAkvsB'
+      'AHxyAQA+cgEAFPMBAH4xAQA09wEAEvMBAH5zAQAy9wEAFOIBADTmAQAS4gEAdO4BADLm'
+      'AQBy7gEANMQBAHTMAQAyxAEA9NwBAHLMAQDy3AEAdIgBAPSYAQByiAEA9LkBAPKYAQDy'
+      'uQEA9BABAPQxAQDyEAEA9HMBAPIxAQDycwEAivsBAHxxAQA+cQEACvMBABr3AQAK4gEA'
+      'GuYBADruAQAaxAEAOswBAHrcAQA6iAEAepgBAPq4AQB6EAEA+jABAPpxAQC+cAEAUOEB'
+      'AKzwAQBI4QEApvABAEThAQBC4QEA0MIBAGzhAQDIwgEAZuEBAMTCAQDCwgEA0IUBAOzC'
+      'AQDIhQEA5sIBAMSFAQDChQEA0AsBAOyFAQDICwEA5oUBAMQLAQDCCwEA7AsBAOYLAQCo'
+      '8QEA1vgBAPwaAQCk8QEAfhoBAKLxAQAo4QEAlvABAGjjAQAk4QEAZOMBACLhAQBi4wEA'
+      'aMIBADbhAQDoxgEAZMIBAOTGAQBiwgEA4sYBAOiEAQB2wgEA6I0BAOSEAQDkjQEA4oQB'
+      'AOKNAQDoCQEA9oQBAOgbAQDkCQEA5BsBAOIJAQDiGwEA9gkBAPYbAQDU+QEA+DoBAH6d'
+      'AQDS+QEAfDoBAD46AQCU8QEAfhkBALTzAQCS8QEAfjsBALLzAQAU4QEANOMBABLhAQB0'
+      '5wEAMuMBAHLnAQA0wgEAdMYBADLCAQD0zgEAcsYBAPLOAQB0hAEA9IwBAHKEAQD0nQEA'
+      '8owBAPKdAQD0CAEA9BkBAPIIAQD0OwEA8hkBAPI7AQDwegEAfL0BAHh6AQA+vQEAPHoB'
+      'AB56AQDK+QEAfDkBANr7AQB8ewEAPjkBAD57AQCK8QEAmvMBALr3AQAK4QEAGuMBADrn'
+      'AQB67wEAGsIBADrGAQB6zgEA+t4BADqEAQB6jAEA+pwBAPq9AQB6CAEA+hgBAPo5AQB4'
+      'eQEAvrwBADx5AQAeeQEAvjgBAL55AQC8eAEAnngBAF54AQCo4AEApOABAKLgAQBowQEA'
+      'tuABAGTBAQBiwQEA6IIBAHbBAQDkggEA4oIBAOgFAQD2ggEA5AUBAOIFAQD2BQEA1PAB'
+      'AH4NAQDS8AEAlOABALThAQCS4AEAsuEBADTBAQB0wwEAMsEBAHLDAQB0ggEA9IYBAHKC'
+      'AQDyhgEA9AQBAPQNAQDyBAEA8g0BAOr4AQB8HQEAPh0BAMrwAQDa8QEAiuABAJrhAQC6'
+      '4wEAGsEBADrDAQB6xwEAOoIBAHqGAQD6jgEAegQBAPoMAQD6HQEAeD0BAL6eAQA8PQEA'
+      'Hj0BAL4cAQC+PQEAcH0BALy+AQA4fQEAnr4BABx9AQAOfQEAvDwBALx9AQCePAEAnn0B'
+      'ALh8AQBevgEAnHwBAI58AQBePAEA3nwBAFx8AQBOfAEALnwBALTAAQCywAEAdIEBAHKB'
+      'AQD0AgEA8gIBANrgAQCawAEAusEBADqBAQB6gwEAegIBAPoGAQC+DgEAvB4BAJ4eAQC4'
+      'PgEAXp8BAJw+AQCOPgEAXh4BAN4+AQCwfgEAXL8BAJh+AQBOvwEAjH4BAIZ+AQBcPgEA'
+      '3H4BAE4+AQDOfgEAWH4BAC6/AQBMfgEARn4BAC4+AQBufgEALH4BACZ+AQBeDwEAXB8B'
+      'AE4fAQBYPwEArp8BAEw/AQBGPwEALh8BAG4/AQAsPwEAJj8BAOCrAQD41QEAwFMBAPCp'
+      'AQD81AEA4FEBAPioAQB+1AEA8FABAHyoAQB4UAEA0PoBAOBbAQD4rQEAyPoBAPBZAQD8'
+      'rAEAxPoBAPhYAQB+rAEAwvoBAHxYAQDQ9QEA7PoBAPhdAQDI9QEA5voBAPxcAQDE9QEA'
+      'flwBAML1AQDQ6wEA7PUBAMjrAQDm9QEAxOsBAMLrAQDQ1wEA7OsBAMjXAQDm6wEAxNcB'
+      'AMLXAQDQrwEA7NcBAMivAQDm1wEAxK8BAMBLAQDwpQEA/NIBAOBJAQD4pAEAftIBAPBI'
+      'AQB8pAEAeEgBAD6kAQA8SAEAaPoBAPBNAQD8pgEAZPoBAPhMAQB+pgEAYvoBAHxMAQA+'
+      'TAEA6PQBAHb6AQD8TgEA5PQBAH5OAQDi9AEA6OkBAPb0AQDk6QEA4ukBAOjTAQD26QEA'
+      '5NMBAOLTAQDopwEA9tMBAOSnAQDipwEA4EUBAPiiAQB+0QEA8EQBAHyiAQB4RAEAPqIB'
+      'ADxEAQAeRAEANPoBAPhGAQB+owEAMvoBAHxGAQA+RgEAdPQBAH5HAQBy9AEA9OgBAPLo'
+      'AQD00QEA8tEBAPSjAQDyowEA8EIBAHyhAQB4QgEAPqEBADxCAQAeQgEAGvoBAHxDAQA+'
+      'QwEAOvQBAHroAQD60AEAeEEBAL6gAQA8QQEAHkEBAL5BAQC8QAEAnkABAMArAQDwlQEA'
+      '/MoBAOApAQD4lAEAfsoBAPAoAQB8lAEAeCgBAD6UAQA8KAEAaPkBAPAtAQD8lgEAZPkB'
+      'APgsAQB+lgEAYvkBAHwsAQA+LAEA6PIBAHb5AQD8LgEA5PIBAH4uAQDi8gEA6OUBAPby'
+      'AQDk5QEA4uUBAOjLAQD25QEA5MsBAOLLAQDolwEA9ssBAOSXAQDilwEA4LUBAPjaAQB+'
+      '7QEAwGkBAPC0AQB82gEA4GgBAHi0AQA+2gEAcGgBADy0AQA4aAEAHrQBABxoAQDgJQEA'
+      '+JIBAH7JAQDgbQEA8CQBAHySAQDwbAEAfLYBAD6SAQB4bAEAPCQBADxsAQAeJAEAHmwB'
+      'ADT5AQD4JgEAfpMBAHT7AQAy+QEA+G4BAHwmAQBy+wEAfG4BAD4mAQA+bgEAdPIBAH4n'
+      'AQD09gEAcvIBAH5vAQDy9gEA9OQBAPTtAQDy5AEA8u0BAPTJAQD02wEA8skBAPLbAQD0'
+      'kwEA8pMBAMBlAQDwsgEAfNkBAOBkAQB4sgEAPtkBAHBkAQA8sgEAOGQBAB6yAQAcZAEA'
+      'DmQBAPAiAQB8kQEA8GYBAHgiAQA+kQEAeGYBAD6zAQA8ZgEAHiIBAB5mAQAa+QEAfCMB'
+      'ADr7AQB8ZwEAPiMBAD5nAQA68gEAevYBAHrkAQD67AEA+sgBAPrZAQD6kQEA4GIBAHix'
+      'AQC+2AEAcGIBADyxAQA4YgEAHrEBABxiAQAOYgEAeCEBAL6QAQB4YwEAPCEBADxjAQAe'
+      'IQEAHmMBAL4hAQC+YwEAcGEBALywAQA4YQEAnrABABxhAQAOYQEAvCABALxhAQCeIAEA'
+      'nmEBALhgAQBesAEAnGABAI5gAQBeIAEA3mABAFxgAQBOYAEA4BUBAPiKAQB+xQEA8BQB'
+      'AHyKAQB4FAEAPooBADwUAQAeFAEAtPgBAPgWAQB+iwEAsvgBAHwWAQA+FgEAdPEBAH4X'
+      'AQBy8QEA9OIBAPLiAQD0xQEA8sUBAPSLAQDyiwEAwDUBAPCaAQB8zQEA4DQBAHiaAQA+'
+      'zQEAcDQBADyaAQA4NAEAHpoBABw0AQAONAEA8BIBAHyJAQDwNgEAeBIBAD6JAQB4NgEA'
+      'PpsBADw2AQAeEgEAHjYBAJr4AQB8EwEAuvkBAHw3AQA+EwEAPjcBADrxAQB68wEAeuIB'
+      'APrmAQD6xAEA+s0BAPqJAQDgugEAeN0BAL7uAQDAdAEAcLoBADzdAQBgdAEAOLoBAB7d'
+      'AQAwdAEAHLoBABh0AQAOugEADHQBAOAyAQB4mQEAvswBAOB2AQBwMgEAPJkBAHB2AQA8'
+      'uwEAHpkBADh2AQAcMgEAHHYBAA4yAQAOdgEAeBEBAL6IAQB4MwEAPBEBAHh3AQA8MwEA'
+      'HhEBADx3AQAeMwEAHncBAL4RAQC+MwEAvncBAMByAQBwuQEAvNwBAGByAQA4uQEAntwB'
+      'ADByAQAcuQEAGHIBAA65AQAMcgEABnIBAHAxAQC8mAEAcHMBADgxAQCemAEAOHMBAJ65'
+      'AQAccwEADjEBAA5zAQC8EAEAvDEBAJ4QAQC8cwEAnjEBAJ5zAQBgcQEAuLgBAF7cAQAw'
+      'cQEAnLgBABhxAQCOuAEADHEBAAZxAQC4MAEAXpgBALhxAQCcMAEAnHEBAI4wAQCOcQEA'
+      'XhABAN4wAQDecQEAsHABAFy4AQCYcAEATrgBAIxwAQCGcAEAXDABANxwAQBOMAEAznAB'
+      'AFhwAQAuuAEATHABAEZwAQAuMAEAbnABACxwAQAmcAEA8AoBAHyFAQB4CgEAPoUBADwK'
+      'AQAeCgEAfAsBAD4LAQC68AEAeuEBAPrCAQD6hQEA4BoBAHiNAQC+xgEAcBoBADyNAQA4'
+      'GgEAHo0BABwaAQAOGgEAeAkBAL6EAQB4GwEAPAkBADwbAQAeCQEAHhsBAL4JAQC+GwEA'
+      'wDoBAHCdAQC8zgEAYDoBADidAQCezgEAMDoBABydAQAYOgEADp0BAAw6AQAGOgEAcBkB'
+      'ALyMAQBwOwEAOBkBAJ6MAQA4OwEAHBkBABw7AQAOGQEADjsBALwIAQC8GQEAnggBALw7'
+      'AQCeGQEAnjsBAGC9AQC43gEAXu8BAEB6AQAwvQEAnN4BACB6AQAYvQEAjt4BABB6AQAM'
+      'vQEACHoBAAa9AQAEegEAYDkBALicAQBezgEAYHsBADA5AQCcnAEAMHsBAJy9AQCOnAEA'
+      'GHsBAAw5AQAMewEABjkBAAZ7AQC4GAEAXowBALg5AQCcGAEAuHsBAJw5AQCOGAEAnHsB'
+      'AI45AQCOewEAXggBAN4YAQDeOQEA3nsBAEB5AQCwvAEAXN4BACB5AQCYvAEATt4BABB5'
+      'AQCMvAEACHkBAIa8AQAEeQEAAnkBALA4AQBcnAEAsHkBAJg4AQBOnAEAmHkBAM68AQCM'
+      'eQEAhjgBAIZ5AQBcGAEA3DgBAE4YAQDceQEAzjgBAM55AQCgeAEAWLwBAC7eAQCQeAEA'
+      'TLwBAIh4AQBGvAEAhHgBAIJ4AQBYOAEALpwBANh4AQBMOAEAzHgBAEY4AQDGeAEALhgB'
+      'AG44AQDueAEAUHgBACy8AQBIeAEAJrwBAER4AQBCeAEALDgBAGx4AQAmOAEAZngBACh4'
+      'AQAWvAEAJHgBACJ4AQAWOAEANngBAHgFAQC+ggEAPAUBAB4FAQC+BQEAcA0BALyGAQA4'
+      'DQEAnoYBABwNAQAODQEAvAQBALwNAQCeBAEAng0BAGAdAQC4jgEAXscBADAdAQCcjgEA'
+      'GB0BAI6OAQAMHQEABh0BALgMAQBehgEAuB0BAJwMAQCcHQEAjgwBAI4dAQBeBAEA3gwB'
+      'AN4dAQBAPQEAsJ4BAFzPAQAgPQEAmJ4BAE7PAQAQPQEAjJ4BAAg9AQCGngEABD0BAAI9'
+      'AQCwHAEAXI4BALA9AQCYHAEATo4BAJg9AQDOngEAjD0BAIYcAQCGPQEAXAwBANwcAQBO'
+      'DAEA3D0BAM4cAQDOPQEAoL4BAFjfAQCu7wEAkL4BAEzfAQCIvgEARt8BAIS+AQCCvgEA'
+      'oDwBAFieAQAuzwEAoH0BAJA8AQBMngEAkH0BAMy+AQBGngEAiH0BAIQ8AQCEfQEAgjwB'
+      'AIJ9AQBYHAEALo4BANg8AQBMHAEA2H0BAMw8AQBGHAEAzH0BAMY8AQDGfQEALgwBAG4c'
+      'AQDuPAEA7n0BAFC+AQAs3wEASL4BACbfAQBEvgEAQr4BAFA8AQAsngEA0HwBAEg8AQAm'
+      'ngEAyHwBAGa+AQDEfAEAQjwBAMJ8AQAsHAEAbDwBACYcAQDsfAEAZjwBAOZ8AQAovgEA'
+      'Ft8BACS+AQAivgEAKDwBABaeAQBofAEAJDwBAGR8AQAiPAEAYnwBABYcAQA2PAEAdnwB'
+      'ABS+AQASvgEAFDwBADR8AQASPAEAMnwBALwCAQCeAgEAuAYBAF6DAQCcBgEAjgYBAF4C'
+      'AQDeBgEAsA4BAFyHAQCYDgEATocBAIwOAQCGDgEAXAYBANwOAQBOBgEAzg4BAKAeAQBY'
+      'jwEArscBAJAeAQBMjwEAiB4BAEaPAQCEHgEAgh4BAFgOAQAuhwEA2B4BAG6PAQDMHgEA'
+      'Rg4BAMYeAQAuBgEAbg4BAO4eAQBQnwEArM8BAEifAQCmzwEARJ8BAEKfAQBQHgEALI8B'
+      'ANA+AQBsnwEAJo8BAMg+AQBEHgEAxD4BAEIeAQDCPgEALA4BAGweAQAmDgEA7D4BAGYe'
+      'AQDmPgEAqN8BANbvAQCk3wEAot8BACifAQCWzwEAaL8BACSfAQBkvwEAIp8BAGK/AQAo'
+      'HgEAFo8BAGg+AQAkHgEA6H4BAGQ+AQAiHgEA5H4BAGI+AQDifgEAFg4BADYeAQB2PgEA'
+      '9n4BAJTfAQCS3wEAFJ8BADS/AQASnwEAMr8BABQeAQA0PgEAEh4BAHR+AQAyPgEAcn4B'
+      'AIrfAQAKnwEAGr8BAAoeAQAaPgEAOn4BAFwDAQBOAwEAWAcBAK6DAQBMBwEARgcBAC4D'
+      'AQBuBwEAUA8BAKyHAQBIDwEApocBAEQPAQBCDwEALAcBAGwPAQAmBwEAZg8BAKiPAQDW'
+      'xwEApI8BAKKPAQAoDwEAlocBAGgfAQC2jwEAZB8BACIPAQBiHwEAFgcBADYPAQB2HwEA'
+      '1M8BANLPAQCUjwEAtJ8BAJKPAQCynwEAFA8BADQfAQASDwEAdD8BADIfAQByPwEAys8B'
+      'AIqPAQCanwEACg8BABofAQA6PwEArAMBAKYDAQCoBwEA1oMBAKQHAQCiBwEAlgMBALYH'
+      'AQDUhwEA0ocBAJQHAQC0DwEAkgcBALIPAQDqxwEA');
+
+  /// PDF417 codeword bar and space widths, three bits each starting
+  /// with the first bar in the low bits, indexed by
+  /// cluster * 929 + value
+  static final pdf417Runs = _unpackInt32(
+      'S5LMAEySkABNklQASxKtAEwScQBNEjUASpLJAEuSjQBKEqoASZLGAEqSigBJEqcASqLM'
+      'AEuikABMolQASiKtAEsicQBMIjUASaLJAEqijQBJIqoASbLMAEqykABLslQASTKtAEoy'
+      'cQBLMjUASbKNAEqyUQBJwpAASsJUAElCcQBKQjUASdJUAE3iJABLlKwATJRwAE2UNABK'
+      'FMkASxSNAEwUUQBKlKkAS5RtAEkUxgBKFIoASxROAEmUpgBKlGoASRSHAEqkrABLpHAA'
+      'TKQ0AEkkyQBKJI0ASyRRAEmkqQBKpG0AS6QxAEkkigBKJE4ASbSsAEq0cABLtDQASTSN'
+      'AEo0UQBJtG0ASrQxAEnEcABKxDQASURRAEnEMQBKlsgAS5aMAEyWUABKFqkASxZtAEwW'
+      'MQBJlsUASpaJAEuWTQBJFqYAShZqAEmWhgBJFmcASabIAEqmjABLplAASSapAEombQBL'
+      'JjEASaaJAEqmTQBJJmoASaZKAEm2jABKtlAASTZtAEo2MQBJtk0AScZQAEqYqABLmGwA'
+      'TJgwAEkYxQBKGIkASxhNAEmYpQBKmGkAS5gtAEkYhgBKGEoASZhmAEqYKgBJqKgASqhs'
+      'AEuoMABJKIkASihNAEmoaQBKqC0ASShKAEmoKgBKuDAASbgtAEmaxABKmogAS5pMAEka'
+      'pQBKGmkASxotAEmahQBKmkkASRpmAEoaKgBJmkYASaqIAEkqaQBJqkkASZykAEucLABK'
+      'HEkASpwpAEmcJgBTkqwAVJJwAFWSNABSEskAUxKNAFQSUQBSkqkAU5JtAFSSMQBREsYA'
+      'UhKKAFGSpgBSoqwAU6JwAFSiNABRIskAUiKNAFMiUQBRoqkAUqJtAFEiigBRomoAUbKs'
+      'AFKycABTsjQAUTKNAFIyUQBRsm0AUTJOAFHCcABSwjQAUUJRAFHSNACLksgAjJKMAI2S'
+      'UACLEqkAjBJtAI0SMQCKksUAi5KJAIySTQCKEqYAixJqAIwSLgCKkoYAi5JKAFKUyABT'
+      'lIwAVJRQAIqiyABSFKkAUxRtAFQUMQCKIqkAiyJtAIwiMQCJosUAURSmAFIUagBTFC4A'
+      'iSKmAIoiagCJooYAUaTIAFKkjABTpFAAibLIAFEkqQBSJG0AUyQxAIkyqQCKMm0AizIx'
+      'AImyiQBRJGoAiTJqAFG0jABStFAAicKMAFE0bQBSNDEAiUJtAIpCMQCJwk0AUcRQAInS'
+      'UABRRDEAiVIxAIuUqACMlGwAjZQwAIoUxQCLFIkAjBRNAIqUpQCLlGkAjJQtAIoUhgCL'
+      'FEoAipRmAIoURwBSlqgAU5ZsAFSWMACKpKgAUhaJAFMWTQCJJMUAUZalAIskTQBTli0A'
+      'iaSlAFEWhgBSFkoAiSSGAIokSgBSlioAURZHAFGmqABSpmwAU6YwAIm0qABRJokAUiZN'
+      'AIk0iQCKNE0AUqYtAIm0aQBRJkoAUaYqAFG2bABStjAAicRsAFE2TQCJRE0AUbYtAInE'
+      'LQCJ1DAAipbEAIuWiACMlkwAihalAIsWaQCMFi0AipaFAIuWSQCKFmYAixYqAIqWRgCK'
+      'FicAUZjEAFKYiABTmEwAiabEAFEYpQBSGGkAUxgtAIkmpQCKJmkAiyYtAImmhQBRGGYA'
+      'UhgqAIkmZgCKJioAiaZGAFGoiABSqEwAibaIAFEoaQBSKC0AiTZpAIo2LQCJtkkAUSgq'
+      'AIk2KgCJxkwAiUYtAIqYpACLmGgAjJgsAIoYhQCLGEkAiphlAIuYKQCKGEYAipgmAFGa'
+      'pABSmmgAU5osAImopABRGoUAUhpJAIkohQCKKEkAUpopAImoZQBRGkYAiShGAFGaJgBR'
+      'qmgAibhoAIk4SQCJuCkAi5pIAIsaKQCKGiYAUpxIAFEcZQCJKmUAiapFAIkqJgBaksgA'
+      'W5KMAFySUABaEqkAWxJtAFmSxQBakokAW5JNAFkSpgBaEmoAWZKGAFkSZwBZosgAWqKM'
+      'AFuiUABZIqkAWiJtAFsiMQBZookAWqJNAFkiagBZokoAWbKMAFqyUABZMm0AWjIxAFmy'
+      'TQBZwlAAWUIxAJOSqACUkmwAlZIwAJISxQCTEokAlBJNAJKSpQCTkmkAlJItAJIShgCT'
+      'EkoAkpJmAJOSKgBalKgAW5RsAFyUMACSoqgAWhSJAFsUTQCRIsUAWZSlAJMiTQBblC0A'
+      'kaKlAJKiaQBaFEoAkSKGAFmUZgCRomYAWaSoAFqkbABbpDAAkbKoAFkkiQCTsjAAkTKJ'
+      'AJIyTQBapC0AkbJpAFkkSgCRMkoAWbRsAFq0MACRwmwAWTRNAJFCTQBZtC0AWcQwAJHS'
+      'MADLksQAzJKIAM2STADLEqUAzBJpAM0SLQDLkoUAzJJJAMsSZgDMEioAy5JGAJKUxACT'
+      'lIgAlJRMAMqixACSFKUAzKJMAJQULQDKIqUAyyJpAMwiLQDKooUAkhRmAJMUKgDKImYA'
+      'yyIqAJIUJwBZlsQAWpaIAFuWTACRpMQAWRalAFoWaQBbFi0AybLEAJEkpQCSJGkAkyQt'
+      'AMkypQDKMmkAyzItAFoWKgDJsoUAkSRmAJIkKgDJMmYAWRYnAFmmiABapkwAkbSIAFkm'
+      'aQBaJi0AycKIAJE0aQCSNC0AyUJpAMpCLQBZJioAkTQqAFm2TACRxEwAWTYtAMnSTACR'
+      'RC0Ay5SkAMyUaADNlCwAyxSFAMwUSQDLlGUAzJQpAMsURgDLlCYAkpakAJOWaACUliwA'
+      'yqSkAJIWhQDMpCwAyiSFAMskSQCTlikAyqRlAJIWRgDKJEYAkpYmAMqkJgBZmKQAWpho'
+      'AFuYLACRpqQAWRiFAFoYSQDJtKQAkSaFAJImSQBamCkAyTSFAMo0SQBZGEYAybRlAJEm'
+      'RgBZmCYAkaYmAFmoaABaqCwAkbZoAFkoSQDJxGgAkTZJAFmoKQDJREkAkbYpAFm4LADJ'
+      '1CwAy5aEAMyWSADLFmUAzBYpAMuWRQDLFiYAkpiEAJOYSADKpoQAkhhlAJMYKQDKJmUA'
+      'yyYpAMqmRQCSGCYAyiYmAFmahABamkgAkaiEAFkaZQBaGikAybaEAJEoZQCSKCkAyTZl'
+      'AMo2KQBZGiYAybZFAJEoJgDJNiYAkbhIAMnGSADJRikAzJgoAMuYJQCTmigAkhpFAJKa'
+      'JQBZnGQAkapkAMm4ZABZnCUAkaolAGKSqABhEsUAYhKJAGGSpQBikmkAY5ItAGEShgBi'
+      'EkoAYZJmAGKSKgBhoqgAYqJsAGOiMABhIokAYiJNAGGiaQBioi0AYSJKAGGiKgBhsmwA'
+      'YrIwAGEyTQBhsi0AYcIwAJqSxACbkogAnJJMAJoSpQCbEmkAmpKFAJuSSQCaEmYAmxIq'
+      'AJqSRgBhlMQAYpSIAGOUTACZosQAYRSlAJuiTABjFC0AmSKlAJoiaQCbIi0AmaKFAGEU'
+      'ZgBiFCoAmSJmAJoiKgBhFCcAYaSIAGKkTACZsogAYSRpAGIkLQCZMmkAmjItAJmySQBh'
+      'JCoAYbRMAJnCTABhNC0AmUItANOSpADUkmgA1ZIsANMShQDUEkkA05JlANSSKQDTEkYA'
+      '05ImAJqUpACblGgA0qKkAJoUhQCbFEkA0iKFANMiSQCblCkA0qJlAJoURgDSIkYAmpQm'
+      'ANKiJgBhlqQAYpZoAJmkpABhFoUAm6QsANGypACZJIUAmiRJAGKWKQDRMoUA0jJJAGEW'
+      'RgDRsmUAmSRGAGGWJgCZpCYAYaZoAGKmLACZtGgAYSZJANHCaACZNEkAYaYpANFCSQCZ'
+      'tCkAYbYsAJnELADR0iwADJOEAA2TSAAME2UADRMpAAyTRQAMEyYA05SEANSUSAALo4QA'
+      'DKNIANQUKQALI2UADCMpAAujRQDTFCYACyMmAJqWhACblkgA0qSEAJoWZQCbFikACrOE'
+      'ANIkZQDTJCkACjNlAAszKQCaFiYACrNFANIkJgAKMyYAYZiEAGKYSACZpoQAYRhlAGIY'
+      'KQDRtIQAmSZlAJomKQAJw4QA0TRlANI0KQBhGCYACUNlAApDKQCZJiYACcNFAGGoSACZ'
+      'tkgAYSgpANHESACZNikACdNIANFEKQAJUykADJVkAA2VKAAMFUUADJUlANOWZADUligA'
+      'C6VkAAylKAALJUUA05YlAAulJQCamGQAm5goANKmZACaGEUACrVkANImRQCamCUACjVF'
+      'ANKmJQAKtSUAYZpkAGKaKACZqGQAmqgoANG2ZACZKEUAYZolAAnFZADRNkUAmaglAAlF'
+      'RQDRtiUACcUlAJm4KAAJ1SgADBclAAunRAALJyUA0qhEAAq3RAAKNyUAmapEANG4RAAJ'
+      'x0QACUclAGmSxABpEqUAahJpAGmShQBpEmYAaZJGAGmiiABpImkAaaJJAGkiKgBpskwA'
+      'aTItAKKSpACiEoUAoxJJAKKSZQCjkikAohJGAKKSJgBplKQAapRoAKGipACiomgAahRJ'
+      'AKEihQCiIkkAoaJlAKKiKQChIkYAaZQmAKGiJgBppGgAaqQsAKGyaACisiwAoTJJAGmk'
+      'KQChsikAabQsAKHCLADbkoQA2xJlANuSRQDbEiYAopSEANqihADbokgAoxQpANoiZQDb'
+      'IikA2qJFAKIUJgDaIiYAaZaEAKGkhABpFmUAahYpANmyhAChJGUAaZZFANkyZQChpEUA'
+      'aRYmANmyRQChJCYAaaZIAKG0SABpJikA2cJIAKE0KQDZQikAFJNkABQTRQAUkyUA25Rk'
+      'ABOjZAAUoygAEyNFANuUJQAToyUAopZkAKOWKADapGQA26QoABKzZADaJEUAopYlABIz'
+      'RQDapCUAErMlAGmYZABqmCgAoaZkAKKmKADZtGQAoSZFAGmYJQARw2QA2TRFAKGmJQAR'
+      'Q0UA2bQlAGmoKAChtigA2cQoABHTKABNk0QATRMlABSVRABMo0QAFBUlAEwjJQDblkQA'
+      'E6VEANsWJQBLs0QAEyUlAEszJQCimEQA2qZEAKIYJQAStUQA2iYlAErDRABNkqgATpJs'
+      'AEwSxQBNEokAThJNAEySpQBNkmkATpItAEwShgBNEkoATJJmAE2SKgBMEkcATKKoAE2i'
+      'bABOojAASyLFAEwiiQBNIk0AS6KlAEyiaQBNoi0ASyKGAEwiSgBLomYATKIqAEsiRwBL'
+      'sqgATLJsAE2yMABKMsUASzKJAEwyTQBKsqUAS7JpAEyyLQBKMoYASzJKAEqyZgBLsioA'
+      'SjJHAErCqABLwmwATMIwAElCxQBKQokAS0JNAEnCpQBKwmkAS8ItAElChgBKQkoAScJm'
+      'AErCKgBJ0qgAStJsAEvSMABJUokASlJNAEnSaQBK0i0ASVJKAEnibABK4jAASWJNAEni'
+      'LQBMlMQATZSIAE6UTABMFKUATRRpAE4ULQBMlIUATZRJAEwUZgBNFCoATJRGAEwUJwBL'
+      'pMQATKSIAE2kTABLJKUATCRpAE0kLQBLpIUATKRJAEskZgBMJCoAS6RGAEskJwBKtMQA'
+      'S7SIAEy0TABKNKUASzRpAEw0LQBKtIUAS7RJAEo0ZgBLNCoASrRGAEo0JwBJxMQASsSI'
+      'AEvETABJRKUASkRpAEtELQBJxIUASsRJAElEZgBKRCoAScRGAEnUiABK1EwASVRpAEpU'
+      'LQBJ1EkASVQqAEnkTABJZC0ATJakAE2WaABOliwATBaFAE0WSQBMlmUATZYpAEwWRgBM'
+      'liYAS6akAEymaABNpiwASyaFAEwmSQBLpmUATKYpAEsmRgBLpiYASrakAEu2aABMtiwA'
+      'SjaFAEs2SQBKtmUAS7YpAEo2RgBKtiYAScakAErGaABLxiwASUaFAEpGSQBJxmUASsYp'
+      'AElGRgBJxiYASdZoAErWLABJVkkASdYpAEnmLABMmIQATZhIAEwYZQBNGCkATJhFAEwY'
+      'JgBLqIQATKhIAEsoZQBMKCkAS6hFAEsoJgBKuIQAS7hIAEo4ZQBLOCkASrhFAEo4JgBJ'
+      'yIQASshIAElIZQBKSCkASchFAElIJgBJ2EgASVgpAEyaZABNmigATBpFAEyaJQBLqmQA'
+      'TKooAEsqRQBLqiUASrpkAEu6KABKOkUASrolAEnKZABKyigASUpFAEnKJQBMnEQATBwl'
+      'AEusRABLLCUASrxEAEo8JQBUksQAVZKIAFaSTABUEqUAVRJpAFYSLQBUkoUAVZJJAFQS'
+      'ZgBVEioAVJJGAFQSJwBTosQAVKKIAFWiTABTIqUAVCJpAFUiLQBTooUAVKJJAFMiZgBU'
+      'IioAU6JGAFMiJwBSssQAU7KIAFSyTABSMqUAUzJpAFQyLQBSsoUAU7JJAFIyZgBTMioA'
+      'UrJGAFIyJwBRwsQAUsKIAFPCTABRQqUAUkJpAFNCLQBRwoUAUsJJAFFCZgBSQioAUcJG'
+      'AFHSiABS0kwAUVJpAFJSLQBR0kkAUVIqAFHiTABRYi0AjZKkAI6SaACJkpgAjRKFAI4S'
+      'SQCJEnkAjZJlAI6SKQCJklkAjRJGAI2SJgBUlKQAVZRoAFaULACMoqQAVBSFAI6iLACM'
+      'IoUAjSJJAFWUKQCMomUAVBRGAIwiRgBUlCYAjKImAFOkpABUpGgAVaQsAIuypABTJIUA'
+      'VCRJAIsyhQCMMkkAVKQpAIuyZQBTJEYAizJGAFOkJgCLsiYAUrSkAFO0aABUtCwAisKk'
+      'AFI0hQBTNEkAikKFAItCSQBTtCkAisJlAFI0RgCKQkYAUrQmAIrCJgBRxKQAUsRoAFPE'
+      'LACJ0qQAUUSFAFJESQCJUoUAilJJAFLEKQCJ0mUAUURGAIlSRgBRxCYAUdRoAFLULACJ'
+      '4mgAUVRJAIliSQBR1CkAieIpAFHkLACNlIQAjpRIAImUeACNFGUAjhQpAIkUWQCNlEUA'
+      'iZQ5AI0UJgBUloQAVZZIAIykhABUFmUAVRYpAIwkZQCNJCkAjKRFAFQWJgCMJCYAU6aE'
+      'AFSmSACLtIQAUyZlAFQmKQCLNGUAjDQpAIu0RQBTJiYAizQmAFK2hABTtkgAisSEAFI2'
+      'ZQBTNikAikRlAItEKQCKxEUAUjYmAIpEJgBRxoQAUsZIAInUhABRRmUAUkYpAIlUZQCK'
+      'VCkAidRFAFFGJgCJVCYAUdZIAInkSABRVikAiWQpAI2WZACOligAiZZYAI0WRQCJFjkA'
+      'jZYlAFSYZABVmCgAjKZkAI2mKACMJkUAVJglAIymJQBTqGQAVKgoAIu2ZABTKEUAizZF'
+      'AFOoJQCLtiUAUrhkAFO4KACKxmQAi8YoAIpGRQBSuCUAisYlAFHIZABSyCgAidZkAFFI'
+      'RQCJVkUAUcglAInWJQBR2CgAieYoAI2YRACJmDgAjRglAFSaRACMqEQAVBolAIwoJQBT'
+      'qkQAi7hEAFMqJQCLOCUAUrpEAIrIRABSOiUAikglAFHKRACJ2EQAUUolAIlYJQCNmiQA'
+      'VJwkAIyqJABTrCQAi7okAFK8JACKyiQAXJKkAF2SaABekiwAXBKFAF0SSQBckmUAXZIp'
+      'AFwSRgBckiYAW6KkAFyiaABdoiwAWyKFAFwiSQBbomUAXKIpAFsiRgBboiYAWrKkAFuy'
+      'aABcsiwAWjKFAFsySQBasmUAW7IpAFoyRgBasiYAWcKkAFrCaABbwiwAWUKFAFpCSQBZ'
+      'wmUAWsIpAFlCRgBZwiYAWdJoAFrSLABZUkkAWdIpAFniLACVkoQAlpJIAJGSeACVEmUA'
+      'lhIpAJESWQCVkkUAkZI5AJUSJgBclIQAXZRIAJSihABcFGUAXRQpAJQiZQCVIikAlKJF'
+      'AFwUJgCUIiYAW6SEAFykSACTsoQAWyRlAFwkKQCTMmUAlDIpAJOyRQBbJCYAkzImAFq0'
+      'hABbtEgAksKEAFo0ZQBbNCkAkkJlAJNCKQCSwkUAWjQmAJJCJgBZxIQAWsRIAJHShABZ'
+      'RGUAWkQpAJFSZQCSUikAkdJFAFlEJgCRUiYAWdRIAJHiSABZVCkAkWIpAM6SZADJkpQA'
+      'ypJYAM4SRQDJEnUAyhI5AM6SJQDJklUAyRI2AJWUZACWlCgAkZRYAM2iZADOoigAyaJY'
+      'AJEUOQDNIkUAlZQlAMkiOQDNoiUAXJZkAF2WKACUpGQAXBZFAMyyZADNsigAXJYlAMwy'
+      'RQCUpCUAzLIlAFumZABcpigAk7RkAFsmRQDLwmQAkzRFAFumJQDLQkUAk7QlAMvCJQBa'
+      'tmQAW7YoAJLEZABaNkUAytJkAJJERQBatiUAylJFAJLEJQDK0iUAWcZkAFrGKACR1GQA'
+      'WUZFAMniZACRVEUAWcYlAMliRQCR1CUAyeIlAFnWKACR5CgAzpREAMmUdADKlDgAzhQl'
+      'AMkUVQDJlDUAlZZEAJGWOADNpEQAlRYlAMmkOADNJCUAXJhEAJSmRABcGCUAzLREAJQm'
+      'JQDMNCUAW6hEAJO2RABbKCUAy8REAJM2JQDLRCUAWrhEAJLGRABaOCUAytREAJJGJQDK'
+      'VCUAWchEAJHWRABZSCUAyeREAJFWJQDJZCUAzpYkAMmWVADJFjUAlZgkAM2mJABcmiQA'
+      'lKgkAMy2JABbqiQAk7gkAMvGJABauiQAksgkAMrWJABZyiQAkdgkAMnmJADJmDQAZJKE'
+      'AGWSSABkEmUAZRIpAGSSRQBkEiYAY6KEAGSiSABjImUAZCIpAGOiRQBjIiYAYrKEAGOy'
+      'SABiMmUAYzIpAGKyRQBiMiYAYcKEAGLCSABhQmUAYkIpAGHCRQBhQiYAYdJIAGFSKQCd'
+      'kmQAnpIoAJmSWACdEkUAmRI5AJ2SJQBklGQAZZQoAJyiZABkFEUAnCJFAGSUJQCcoiUA'
+      'Y6RkAGSkKACbsmQAYyRFAJsyRQBjpCUAm7IlAGK0ZABjtCgAmsJkAGI0RQCaQkUAYrQl'
+      'AJrCJQBhxGQAYsQoAJnSZABhREUAmVJFAGHEJQCZ0iUAYdQoAJniKADWkkQA0ZJ0ANKS'
+      'OADWEiUA0RJVANGSNQCdlEQAmZQ4ANWiRACdFCUA0aI4ANUiJQBklkQAnKREAGQWJQDU'
+      'skQAnCQlANQyJQBjpkQAm7REAGMmJQDTwkQAmzQlANNCJQBitkQAmsREAGI2JQDS0kQA'
+      'mkQlANJSJQBhxkQAmdREAGFGJQDR4kQAmVQlANFiJQAJk5AACpNUAAkTcQAKEzUACZNR'
+      'AAkTMgDWlCQA0ZRUAA6jJAAJo1QA0RQ1AAkjNQCdliQA1aQkAA2zJABkmCQAnKYkANS0'
+      'JAAMwyQAY6gkAJu2JADTxCQAC9MkAGK4JACaxiQA0tQkAArjJABhyCQAmdYkANHkJAAJ'
+      'lXAACpU0AAkVUQAJlTEA0ZY0AAmlNAAJl1AACRcxAAmZMABskmQAbBJFAGySJQBromQA'
+      'bKIoAGsiRQBroiUAarJkAGuyKABqMkUAarIlAGnCZABqwigAaUJFAGnCJQBp0igApZJE'
+      'AKGSOAClEiUAbJREAKSiRABsFCUApCIlAGukRACjskQAayQlAKMyJQBqtEQAosJEAGo0'
+      'JQCiQiUAacREAKHSRABpRCUAoVIlAN6SJADZklQA2RI1AKWUJADdoiQAbJYkAKSkJADc'
+      'siQAa6YkAKO0JADbwiQAarYkAKLEJADa0iQAacYkAKHUJADZ4iQAEZNwABKTNAARE1EA'
+      'EZMxANmUNAARozQASZOMAEqTUABJE20AShMxAEmTTQBJEy4AEZVQAEmjUAARFTEASSMx'
+      'AEmVbABKlTAASRVNAEmVLQARlzAASaUwAEmXTABJFy0ASZksAHOiRABzIiUAcrJEAHIy'
+      'JQBxwkQAcUIlAKyiJABzpCQAq7IkAHK0JACqwiQAccQkAKnSJADhkjQAGZNQABkTMQBR'
+      'k2wAUpMwAFETTQBRky0AGZUwAFGjMACJk4gAipNMAIkTaQCKEy0AiZNJAIkTKgBRlUwA'
+      'iaNMAFEVLQCJIy0AiZVoAIqVLACJFUkAiZUpAFGXLACJpSwAiZdIAIkXKQAhkzAAWZNM'
+      'AFkTLQCRk2gAkpMsAJETSQCRkykAWZUsAJGjLACRlUgAkRUpAEqStABLkngASRLRAEoS'
+      'lQBLElkASZKxAEqSdQBLkjkASRKSAEoSVgBJknIATqKEAEmitABKongATiJlAEkilQBK'
+      'IlkATqJFAEmidQBKojkATiImAEkiVgBNsoQATrJIAEmyeABNMmUATjIpAEkyWQBNskUA'
+      'SbI5AE0yJgBMwoQATcJIAExCZQBNQikATMJFAExCJgBL0oQATNJIAEtSZQBMUikAS9JF'
+      'AEtSJgBK4oQAS+JIAEpiZQBLYikASuJFAEmU0ABKlJQAS5RYAEkUsQBKFHUASxQ5AEmU'
+      'kQBKlFUASRRyAEoUNgBJlFIATqRkAEmklABKpFgATiRFAEkkdQBKJDkATqQlAEmkVQBJ'
+      'JDYATbRkAE60KABJtFgATTRFAEk0OQBNtCUATMRkAE3EKABMREUATMQlAEvUZABM1CgA'
+      'S1RFAEvUJQBK5GQAS+QoAEpkRQBK5CUASZawAEqWdABLljgASRaRAEoWVQBJlnEASpY1'
+      'AEkWUgBJljIATqZEAEmmdABKpjgATiYlAEkmVQBJpjUATbZEAEm2OABNNiUATMZEAExG'
+      'JQBL1kQAS1YlAErmRABKZiUASZiQAEqYVABJGHEAShg1AEmYUQBJGDIATqgkAEmoVABJ'
+      'KDUATbgkAEzIJABL2CQASZpwAEqaNABJGlEASZoxAEmqNABJnFAASRwxAFGS0ABSkpQA'
+      'U5JYAFESsQBSEnUAUxI5AFGSkQBSklUAURJyAFISNgBRklIAVqJkAFGilABSolgAViJF'
+      'AFEidQBSIjkAVqIlAFGiVQBRIjYAVbJkAFayKABRslgAVTJFAFEyOQBVsiUAVMJkAFXC'
+      'KABUQkUAVMIlAFPSZABU0igAU1JFAFPSJQBS4mQAU+IoAFJiRQBS4iUAipKwAIuSdACM'
+      'kjgAiRLNAIoSkQCLElUAiZKtAIqScQCLkjUAiRKOAIoSUgCJkm4AipIyAIkSTwBRlLAA'
+      'UpR0AFOUOACJorAAURSRAFIUVQCJIpEAiiJVAFKUNQCJonEAURRSAIkiUgBRlDIAiaIy'
+      'AFakRABRpHQAUqQ4AI6yRABWJCUAibJ0AFEkVQCOMiUAiTJVAFGkNQCJsjUAVbREAFG0'
+      'OACNwkQAVTQlAInCOACNQiUAVMREAIzSRABURCUAjFIlAFPURACL4kQAU1QlAItiJQBS'
+      '5EQAUmQlAImUzACKlJAAi5RUAIkUrQCKFHEAixQ1AImUjQCKlFEAiRRuAIoUMgCJlE4A'
+      'iRQvAFGWkABSllQAiaSQAFEWcQBSFjUAiSRxAIokNQCJpFEAURYyAIkkMgBWpiQAUaZU'
+      'AI60JACJtFQAUSY1AIk0NQBVtiQAjcQkAFTGJACM1CQAU9YkAIvkJABS5iQAiZasAIqW'
+      'cACLljQAiRaNAIoWUQCJlm0AipYxAIkWTgCJli4AUZhwAFKYNACJpnAAURhRAIkmUQBR'
+      'mDEAiaYxAFGoNACJtjQAiZiMAIqYUACJGG0AihgxAImYTQCJGC4AUZpQAImoUABRGjEA'
+      'iSgxAImabACKmjAAiRpNAImaLQBRnDAAiaowAImcTACJHC0AWZKwAFqSdABbkjgAWRKR'
+      'AFoSVQBZknEAWpI1AFkSUgBZkjIAXqJEAFmidABaojgAXiIlAFkiVQBZojUAXbJEAFmy'
+      'OABdMiUAXMJEAFxCJQBb0kQAW1IlAFriRABaYiUAkZLMAJKSkACTklQAkRKtAJIScQCT'
+      'EjUAkZKNAJKSUQCREm4AkhIyAJGSTgCREi8AWZSQAFqUVACRopAAWRRxAFoUNQCRInEA'
+      'kiI1AJGiUQBZFDIAkSIyAF6kJABZpFQAlrIkAJGyVABZJDUAkTI1AF20JACVwiQAXMQk'
+      'AJTSJABb1CQAk+IkAFrkJADKkqwAy5JwAMySNADJEskAyhKNAMsSUQDJkqkAypJtAMuS'
+      'MQDJEooAyhJOAMmSagDKki4AyRJLAJGUrACSlHAAk5Q0AMmirACRFI0AkhRRAMkijQDK'
+      'IlEAkpQxAMmibQCRFE4AySJOAJGULgDJoi4AWZZwAFqWNACRpHAAWRZRAMmycACRJFEA'
+      'WZYxAMkyUQCRpDEAybIxAFmmNACRtDQAycI0AMmUyADKlIwAy5RQAMkUqQDKFG0AyxQx'
+      'AMmUiQDKlE0AyRRqAMoULgDJlEoAyRQrAJGWjACSllAAyaSMAJEWbQCSFjEAySRtAMok'
+      'MQDJpE0AkRYuAMkkLgBZmFAAkaZQAFkYMQDJtFAAkSYxAMk0MQDJlqgAypZsAMuWMADJ'
+      'FokAyhZNAMmWaQDKli0AyRZKAMmWKgCRmGwAkpgwAMmmbACRGE0AySZNAJGYLQDJpi0A'
+      'WZowAJGoMADJtjAAyZiIAMqYTADJGGkAyhgtAMmYSQDJGCoAkZpMAMmoTACRGi0AySgt'
+      'AMmaaADKmiwAyRpJAMmaKQCRnCwAyaosAMmcSADJHCkAYZKQAGKSVABhEnEAYhI1AGGS'
+      'UQBhEjIAYaJUAGEiNQBlsiQAZMIkAGPSJABi4iQAmZKsAJqScACbkjQAmRKNAJoSUQCZ'
+      'km0AmpIxAJkSTgCZki4AYZRwAGKUNACZonAAYRRRAJkiUQBhlDEAmaIxAGGkNACZsjQA'
+      '0ZLIANKSjADTklAA0RKpANISbQDTEjEA0ZKJANKSTQDREmoA0hIuANGSSgDREisAmZSM'
+      'AJqUUADRoowAmRRtAJoUMQDRIm0AmZRNANGiTQCZFC4A0SIuAGGWUACZpFAAYRYxANGy'
+      'UACZJDEA0TIxAAqTqAALk2wADJMwAAkTxQAKE4kACxNNAAmTpQAKk2kAC5MtAAkThgAK'
+      'E0oACZNmAAqTKgAJE0cA0ZSoANKUbADTlDAACaOoANEUiQDSFE0ACSOJAAojTQDSlC0A'
+      'CaNpANEUSgAJI0oA0ZQqAAmjKgCZlmwAmpYwANGkbACZFk0ACbNsANEkTQCZli0ACTNN'
+      'ANGkLQAJsy0AYZgwAJmmMADRtDAACcMwAAmVxAAKlYgAC5VMAAkVpQAKFWkACxUtAAmV'
+      'hQAKlUkACRVmAAoVKgAJlUYACRUnANGWiADSlkwACaWIANEWaQDSFi0ACSVpAAolLQAJ'
+      'pUkA0RYqAAklKgCZmEwA0aZMAJkYLQAJtUwA0SYtAAk1LQAJl6QACpdoAAuXLAAJF4UA'
+      'ChdJAAmXZQAKlykACRdGAAmXJgDRmGgA0pgsAAmnaADRGEkACSdJANGYKQAJpykAmZos'
+      'ANGoLAAJtywACZmEAAqZSAAJGWUAChkpAAmZRQAJGSYA0ZpIAAmpSADRGikACSkpAAmb'
+      'ZAAKmygACRtFAAmbJQDRnCgACasoAGmScABqkjQAaRJRAGmSMQBpojQAoZKMAKKSUACh'
+      'Em0AohIxAKGSTQChEi4AaZRQAKGiUABpFDEAoSIxANmSqADakmwA25IwANkSiQDaEk0A'
+      '2ZJpANqSLQDZEkoA2ZIqAKGUbACilDAA2aJsAKEUTQDZIk0AoZQtANmiLQBpljAAoaQw'
+      'ANmyMAARk8QAEpOIABOTTAARE6UAEhNpABMTLQARk4UAEpNJABETZgASEyoAEZNGABET'
+      'JwDZlIgA2pRMABGjiADZFGkA2hQtABEjaQASIy0AEaNJANkUKgARIyoAoZZMANmkTACh'
+      'Fi0AEbNMANkkLQARMy0ASpOkAEuTaABMkywAShOFAEsTSQBKk2UAS5MpAEoTRgBKkyYA'
+      'EZWkABKVaAATlSwASaOkABEVhQASFUkASSOFAEojSQASlSkASaNlABEVRgBJI0YAEZUm'
+      'AEmjJgDZlmgA2pYsABGlaADZFkkASbNoABElSQDZlikASTNJABGlKQBJsykAoZgsANmm'
+      'LAARtSwAScMsAEqVhABLlUgAShVlAEsVKQBKlUUAShUmABGXhAASl0gASaWEABEXZQAS'
+      'FykASSVlAEolKQBJpUUAERcmAEklJgDZmEgAEadIANkYKQBJtUgAEScpAEk1KQBKl2QA'
+      'S5coAEoXRQBKlyUAEZlkABKZKABJp2QAERlFAEknRQARmSUASaclANmaKAARqSgASbco'
+      'AEqZRABKGSUAEZtEAEmpRAARGyUASSklAHGSUABxEjEAqZJsAKqSMACpEk0AqZItAHGU'
+      'MACpojAA4ZKIAOKSTADhEmkA4hItAOGSSQDhEioAqZRMAOGiTACpFC0A4SItABmTpAAa'
+      'k2gAG5MsABkThQAaE0kAGZNlABqTKQAZE0YAGZMmAOGUaADilCwAGaNoABqjLAAZI0kA'
+      '4ZQpABmjKQCpliwA4aQsABmzLABSk4QAU5NIAFITZQBTEykAUpNFAFITJgAZlYQAGpVI'
+      'AFGjhABSo0gAGhUpAFEjZQAZlUUAUaNFABkVJgBRIyYA4ZZIABmlSADhFikAUbNIABkl'
+      'KQBRMykAi5NkAIyTKACLE0UAi5MlAFKVZABTlSgAiqNkAFIVRQCKI0UAUpUlAIqjJQAZ'
+      'l2QAGpcoAFGlZAAZF0UAibNkAFElRQAZlyUAiTNFAFGlJQCJsyUA4ZgoABmnKABRtSgA'
+      'icMoAIuVRACLFSUAUpdEAIqlRABSFyUAiiUlABmZRABRp0QAGRklAIm1RABRJyUAiTUl'
+      'AIuXJABSmSQAiqckABmbJABRqSQAibckALGSTACxEi0A6ZJoAOqSLADpEkkA6ZIpALGU'
+      'LADpoiwAIZOEACKTSAAhE2UAIhMpACGTRQAhEyYA6ZRIACGjSADpFCkAISMpAFqTZABb'
+      'kygAWhNFAFqTJQAhlWQAIpUoAFmjZABaoygAWSNFACGVJQBZoyUA6ZYoACGlKABZsygA'
+      'k5NEAJMTJQBalUQAkqNEAFoVJQCSIyUAIZdEAFmlRAAhFyUAkbNEAFklJQCRMyUAk5Uk'
+      'AFqXJACSpSQAIZkkAFmnJACRtSQA8ZJIAPESKQApk2QAKpMoACkTRQApkyUA8ZQoACmj'
+      'KABik0QAYhMlACmVRABho0QAKRUlAGEjJQCbkyQA');
+
+  /// PDF417 start and stop bar widths
+  static const pdf417StartRuns = <int>[8, 1, 1, 1, 1, 1, 1, 3];
+  static const pdf417StopRuns = <int>[7, 1, 1, 3, 1, 1, 1, 2, 1, 0];
+
+  /// PDF417 row indicator values: 0 rowsLeft, 1 rowsRight, 2 level, 3 columns
+  static const pdf417LeftIndicator = <int>[0, 2, 3];
+  static const pdf417RightIndicator = <int>[3, 1, 2];
+
+  /// Decode a table packed by build_maps.py
+  static Int32List _unpackInt32(String data) {
+    final bytes = ByteData.sublistView(base64.decode(data));
+    final result = Int32List(bytes.lengthInBytes ~/ 4);
+    for (var i = 0; i < result.length; i++) {
+      result[i] = bytes.getInt32(i * 4, Endian.little);
+    }
+    return result;
+  }
+}
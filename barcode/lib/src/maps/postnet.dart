@@ -0,0 +1,105 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash d48b9adcef7afbd3
+// Content hash 1208a1e370ce1891
+
+// ignore_for_file: public_member_api_docs
+
+import 'common.dart';
+
+class PostnetMaps {
+  static const noCode = CommonMaps.noCode;
+
+  /// POSTNET conversion bits
+  static const postnet = <int, int>{
+    0x30: 0x2af, // "0" => FFDDD
+    0x31: 0x3ea, // "1" => DDDFF
+    0x32: 0x3ba, // "2" => DDFDF
+    0x33: 0x2fa, // "3" => DDFFD
+    0x34: 0x3ae, // "4" => DFDDF
+    0x35: 0x2ee, // "5" => DFDFD
+    0x36: 0x2be, // "6" => DFFDD
+    0x37: 0x3ab, // "7" => FDDDF
+    0x38: 0x2eb, // "8" => FDDFD
+    0x39: 0xbb, // "9" => FDFD
+  };
+  /// POSTNET misc bits
+  static const postnetLen = 5;
+  static const postnetStartStop = 0x3; // F
+
+  /// POSTNET conversion bits, indexed by code unit
+  static const postnetTable = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x2af, // "0"
+    0x3ea, // "1"
+    0x3ba, // "2"
+    0x2fa, // "3"
+    0x3ae, // "4"
+    0x2ee, // "5"
+    0x2be, // "6"
+    0x3ab, // "7"
+    0x2eb, // "8"
+    0xbb, // "9"
+  ];
+}
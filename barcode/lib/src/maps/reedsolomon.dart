@@ -0,0 +1,619 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash 5ca72d7b7de26f4d
+// Content hash 67d54d6df5b89fb9
+
+// ignore_for_file: public_member_api_docs
+
+import 'dart:convert';
+import 'dart:typed_data';
+
+class ReedSolomonMaps {
+  /// Galois field GF(16) antilog table, primitive polynomial 0x13
+  static const gf16ALog = <int>[
+    0x1, 0x2, 0x4, 0x8, 0x3, 0x6, 0xc, 0xb, // 0
+    0x5, 0xa, 0x7, 0xe, 0xf, 0xd, 0x9, 0x1, // 8
+  ];
+
+  /// Galois field GF(16) log table
+  static const gf16Log = <int>[
+    0x0, 0xf, 0x1, 0x4, 0x2, 0x8, 0x5, 0xa, // 0
+    0x3, 0xe, 0x9, 0x7, 0x6, 0xd, 0xb, 0xc, // 8
+  ];
+
+  /// Reed-Solomon generator polynomials in GF(16), indexed by degree
+  static const gf16Generators = <int, List<int>>{
+    5: <int>[
+      0x1, 0xb, 0x4, 0x6, 0x2, 0x1, // 0
+    ],
+    6: <int>[
+      0x1, 0x7, 0x9, 0x3, 0xc, 0xa, 0xc, // 0
+    ],
+  };
+
+  /// Galois field GF(64) antilog table, primitive polynomial 0x43
+  static const gf64ALog = <int>[
+    0x1, 0x2, 0x4, 0x8, 0x10, 0x20, 0x3, 0x6, // 0
+    0xc, 0x18, 0x30, 0x23, 0x5, 0xa, 0x14, 0x28, // 8
+    0x13, 0x26, 0xf, 0x1e, 0x3c, 0x3b, 0x35, 0x29, // 16
+    0x11, 0x22, 0x7, 0xe, 0x1c, 0x38, 0x33, 0x25, // 24
+    0x9, 0x12, 0x24, 0xb, 0x16, 0x2c, 0x1b, 0x36, // 32
+    0x2f, 0x1d, 0x3a, 0x37, 0x2d, 0x19, 0x32, 0x27, // 40
+    0xd, 0x1a, 0x34, 0x2b, 0x15, 0x2a, 0x17, 0x2e, // 48
+    0x1f, 0x3e, 0x3f, 0x3d, 0x39, 0x31, 0x21, 0x1, // 56
+  ];
+
+  /// Galois field GF(64) log table
+  static const gf64Log = <int>[
+    0x0, 0x3f, 0x1, 0x6, 0x2, 0xc, 0x7, 0x1a, // 0
+    0x3, 0x20, 0xd, 0x23, 0x8, 0x30, 0x1b, 0x12, // 8
+    0x4, 0x18, 0x21, 0x10, 0xe, 0x34, 0x24, 0x36, // 16
+    0x9, 0x2d, 0x31, 0x26, 0x1c, 0x29, 0x13, 0x38, // 24
+    0x5, 0x3e, 0x19, 0xb, 0x22, 0x1f, 0x11, 0x2f, // 32
+    0xf, 0x17, 0x35, 0x33, 0x25, 0x2c, 0x37, 0x28, // 40
+    0xa, 0x3d, 0x2e, 0x1e, 0x32, 0x16, 0x27, 0x2b, // 48
+    0x1d, 0x3c, 0x2a, 0x15, 0x14, 0x3b, 0x39, 0x3a, // 56
+  ];
+
+  /// Galois field GF(256) antilog table, primitive polynomial 0x12d
+  static final gf256ALog = _unpackUint8(
+      'AQIECBAgQIAtWrRFijly5OXn4+v725sbNmzYnRcuXLhdulmySZIJEiRIkA0aNGjQjTdu'
+      '3JUHDhw4cODt98Ore/bBr3Pm4e/zy7tbtkGCKVKkZcq5X75RomnSiT9+/NWHI0aMNWrU'
+      'hSdOnBUqVKh9+tmfEyZMmB06dOj914MrVqx16vnfkwsWLFiwTZoZMmTIvVeuceLp/9OL'
+      'O3bs9ceja9aBL168Vap58sm/U6Zhwql//tGPM2bMtUeOMWLEpWfOsU+eESJEiD169MWn'
+      'Y8ahb96RDx48ePDNt0OGIUKEJUqUBQoUKFCgbdqZHz58+N2XAwYMGDBgwK137vHPs0uW'
+      'AQ==');
+
+  /// Galois field GF(256) log table
+  static final gf256Log = _unpackUint8(
+      'AP8B8ALh8TUDJuKF8is20gTDJ3LjaoYc84wsFzd20+oF28RgKN5zZ+ROa32HCB2i9LqN'
+      'tC1jGDE4DXeZ1MfrWwZM3NnFC2G4KSTf/XSKaMHlVk+rbKV+kYgiCUoeIKNU9a27zI5R'
+      'tb4uWGSfGecyzzmTDkN4gJr41afIP+xuXLAHoU183WbaX8ZaDJhiMLmzKtElhOA0/u91'
+      '6YsWaRvCcebOV55QvazLba+mPn/3kkKJwCP8CrdL2B9TIUmkkFWq9kGuPbzKzZ2PqVJI'
+      'tte/+y+yWZdlXqB7GnDoFTPu0IM6RZQSDxBEEXmVgRObO/lG1vqoR8mcQDztgm8UXXqx'
+      'lg==');
+
+  /// Reed-Solomon generator polynomials in GF(256), indexed by degree
+  static const gf256Generators = <int, List<int>>{
+    5: <int>[
+      0x1, 0x3e, 0x6f, 0xf, 0x30, 0xe4, // 0
+    ],
+    7: <int>[
+      0x1, 0xfe, 0x5c, 0xf0, 0x86, 0x90, 0x44, 0x17, // 0
+    ],
+    10: <int>[
+      0x1, 0x3d, 0x6e, 0xff, 0x74, 0xf8, 0xdf, 0xa6, // 0
+      0xb9, 0x18, 0x1c, // 8
+    ],
+    12: <int>[
+      0x1, 0xf2, 0x64, 0xb2, 0x61, 0xd5, 0x8e, 0x2a, // 0
+      0x3d, 0x5b, 0x9e, 0x99, 0x29, // 8
+    ],
+    14: <int>[
+      0x1, 0xb9, 0x53, 0xba, 0x12, 0x2d, 0x8a, 0x77, // 0
+      0x9d, 0x9, 0x5f, 0xfc, 0xc0, 0x61, 0x9c, // 8
+    ],
+    18: <int>[
+      0x1, 0xbc, 0x5a, 0x30, 0xe1, 0xfe, 0x5e, 0x81, // 0
+      0x6d, 0xd5, 0xf1, 0x3d, 0x42, 0x4b, 0xbc, 0x27, // 8
+      0x64, 0xc3, 0x53, // 16
+    ],
+    20: <int>[
+      0x1, 0xac, 0xba, 0xae, 0x1b, 0x52, 0x6c, 0x4f, // 0
+      0xfd, 0x91, 0x99, 0xa0, 0xbc, 0x2, 0xa8, 0x47, // 8
+      0xe9, 0x9, 0xf4, 0xc3, 0xf, // 16
+    ],
+    24: <int>[
+      0x1, 0xc1, 0x32, 0x60, 0xb8, 0xb5, 0xc, 0x7c, // 0
+      0xfe, 0xac, 0x5, 0x15, 0x9b, 0xdf, 0xfb, 0xc5, // 8
+      0x9b, 0x15, 0xb0, 0x27, 0x6d, 0xcd, 0x58, 0xbe, // 16
+      0x34, // 24
+    ],
+    28: <int>[
+      0x1, 0xff, 0x5d, 0xa8, 0xe9, 0x97, 0x78, 0x88, // 0
+      0x8d, 0xd5, 0x6e, 0x8a, 0x11, 0x79, 0xf9, 0x22, // 8
+      0x4b, 0x35, 0xaa, 0x97, 0x25, 0xae, 0x67, 0x60, // 16
+      0x47, 0x61, 0x2b, 0xe7, 0xd3, // 24
+    ],
+    36: <int>[
+      0x1, 0x70, 0x51, 0x62, 0xe1, 0x19, 0x3b, 0xb8, // 0
+      0xaf, 0x2c, 0x73, 0x77, 0x5f, 0x89, 0x65, 0x21, // 8
+      0x44, 0x4, 0x2, 0x12, 0xe5, 0xb6, 0x50, 0xfb, // 16
+      0xdc, 0xb3, 0x54, 0x78, 0x66, 0xb5, 0xa2, 0xfa, // 24
+      0x82, 0xda, 0xf2, 0x7f, 0xf5, // 32
+    ],
+    42: <int>[
+      0x1, 0x5, 0x9, 0x5, 0xe2, 0xb1, 0x96, 0x32, // 0
+      0x45, 0xca, 0xf8, 0x65, 0x36, 0x39, 0xfd, 0x1, // 8
+      0x15, 0x79, 0x39, 0x6f, 0xd6, 0x69, 0xa7, 0x9, // 16
+      0x64, 0x5f, 0xaf, 0x8, 0xf2, 0x85, 0xf5, 0x2, // 24
+      0x7a, 0x69, 0xf7, 0x99, 0x16, 0x26, 0x13, 0x1f, // 32
+      0x89, 0xc1, 0x4d, // 40
+    ],
+    48: <int>[
+      0x1, 0x13, 0xe1, 0xfd, 0x5c, 0xd5, 0x45, 0xaf, // 0
+      0xa0, 0x93, 0xbb, 0x57, 0xb0, 0x2c, 0x52, 0xf0, // 8
+      0xba, 0x8a, 0x42, 0x64, 0x78, 0x58, 0x83, 0xcd, // 16
+      0xaa, 0x5a, 0x25, 0x17, 0x76, 0x93, 0x10, 0x6a, // 24
+      0xbf, 0x57, 0xed, 0xbc, 0xcd, 0xe7, 0xee, 0x85, // 32
+      0xee, 0x16, 0x75, 0x20, 0x60, 0xdf, 0xac, 0x84, // 40
+      0xf5, // 48
+    ],
+    56: <int>[
+      0x1, 0x2e, 0x8f, 0x35, 0xe9, 0x6b, 0xcb, 0x2b, // 0
+      0x9b, 0x1c, 0xf7, 0x43, 0x7f, 0xf5, 0x89, 0xd, // 8
+      0xa4, 0xcf, 0x3e, 0x75, 0xc9, 0x96, 0x16, 0xee, // 16
+      0x90, 0xe8, 0x1d, 0xcb, 0x75, 0xea, 0xda, 0x92, // 24
+      0xe4, 0x36, 0x84, 0xc8, 0x26, 0xdf, 0x24, 0x9f, // 32
+      0x96, 0xeb, 0xd7, 0xc0, 0xe6, 0xaa, 0xaf, 0x1d, // 40
+      0x64, 0xd0, 0xdc, 0x11, 0xc, 0xee, 0xdf, 0x9, // 48
+      0xaf, // 56
+    ],
+    62: <int>[
+      0x1, 0xcc, 0xb, 0x2f, 0x56, 0x7c, 0xe0, 0xa6, // 0
+      0x5e, 0x7, 0xe8, 0x6b, 0x4, 0xaa, 0xb0, 0x1f, // 8
+      0xa3, 0x11, 0xbc, 0x82, 0x28, 0xa, 0x57, 0x3f, // 16
+      0x33, 0xda, 0x1b, 0x6, 0x93, 0x2c, 0xa1, 0x47, // 24
+      0x72, 0x40, 0xaf, 0xdd, 0xb9, 0x6a, 0xfa, 0xbe, // 32
+      0xc5, 0x3f, 0xf5, 0xe6, 0x86, 0x70, 0xb9, 0x25, // 40
+      0xc4, 0x6c, 0x8f, 0xbd, 0xc9, 0xbc, 0xca, 0x76, // 48
+      0x27, 0xd2, 0x90, 0x32, 0xa9, 0x5d, 0xf2, // 56
+    ],
+    68: <int>[
+      0x1, 0xba, 0x52, 0x67, 0x60, 0x3f, 0x84, 0x99, // 0
+      0x6c, 0x36, 0x40, 0xbd, 0xd3, 0xe8, 0x31, 0x19, // 8
+      0xac, 0x34, 0x3b, 0xf1, 0xb5, 0xef, 0xdf, 0x88, // 16
+      0xe7, 0xd2, 0x60, 0xe8, 0xdc, 0x19, 0xb3, 0xa7, // 24
+      0xca, 0xb9, 0x99, 0x8b, 0x42, 0xec, 0xe3, 0xa0, // 32
+      0xf, 0xd5, 0x5d, 0x7a, 0x44, 0xb1, 0x9e, 0xc5, // 40
+      0xea, 0xb4, 0xf8, 0x88, 0xd5, 0x7f, 0x49, 0x24, // 48
+      0x9a, 0xf4, 0x93, 0x21, 0x59, 0x38, 0x9f, 0x95, // 56
+      0xfb, 0x59, 0xad, 0xe4, 0xdc, // 64
+    ],
+  };
+
+  /// Galois field GF(1024) antilog table, primitive polynomial 0x409
+  static final gf1024ALog = _unpackUint16(
+      'AQACAAQACAAQACAAQACAAAABAAIJABIAJABIAJAAIAFAAokAEgEkAkEAggAEAQgCGQAy'
+      'AGQAyACQASADSQKbADYBbALRAKIBRAOBAgsBFgIlAEoAlAAoAVACqQBSAaQCQQGCAg0B'
+      'GgI9AHoA9ADoAdADqQNbA78CdwHuAtUBqgNdA7MCbwHeArUBagPdArMBZgPFAoMBBgMF'
+      'AgMABgAMABgAMABgAMAAgAEAAwkCGwA2AGwA2ACwAWADyQKbATYDZQLDAIYBDAMRAisA'
+      'VgCsAFgBsAJpAdICrQFaA70CcwHmAsUBigMdAzMCbwDeALwBeAP5AvsB9gPlA8MDjwMX'
+      'AycCRwCOABwBOAJ5APIA5AHIA5kDOwN/AvcA7gHcA7EDawPfArcBbgPVAqMBRgOFAgMB'
+      'BgIFAAoAFAAoAFAAoABAAYACCQESAi0AWgC0AGgB0AKpAVIDrQJTAaYCRQGKAh0BOgJ9'
+      'APoA9AHoA9kDuwN/A/cC5wHOA5UDIwNPApcALgFcArEAYgHEAoEBAgMNAhMAJgBMAJgA'
+      'MAFgAskAkgEkA0ECiwAWASwCUQCiAEQBiAIZATICbQDaALQBaAPZArsBdgPlAsMBhgMF'
+      'AwMCDwAeADwAeADwAOABwAOJAxsDPwJ3AO4A3AG4A3kD+wL/Af4D9QPjA88DlwMnA0cC'
+      'hwAOARwCMQBiAMQAiAEQAykCWwC2AGwB2AK5AXID7QLTAaYDRQODAg8BHgI1AGoA1ACo'
+      'AVADqQJbAbYCZQHKAp0BOgN9AvMA5gHMA5EDKwNfArcAbgHcArEBYgPNApMBJgNFAoMA'
+      'BgEMAhEAIgBEAIgAEAEgAkkAkgAkAUgCmQAyAWQCwQCCAQQDAQILABYALABYALAAYAHA'
+      'AokBEgMtAlMApgBMAZgCOQFyAu0A2gG0A2EDywKfAT4DdQLjAMYBjAMRAysCXwC+AHwB'
+      '+AL5AfID7QPTA68DVwOnAkcBjgIVASoCXQC6AHQB6ALZAbIDbQPTAq8BXgO1AmMBxgKF'
+      'AQoDHQIzAGYAzACYATADaQLbALYBbAPRAqsBVgOlAkMBhgIFAQoCHQA6AHQA6ADQAaAD'
+      'SQObAj8BfgL1AOoB1AOhA0sDnwI3AW4C1QCqAVQDoQJLAZYCJQFKAp0AOgF0AuEAwgGE'
+      'AwEDCwIfAD4AfAD4APAB4APJA5sDPwN3AucAzgGcAzEDawLfAL4BfAPxAusB1gOlA0MD'
+      'jwIXAS4CVQCqAFQBqAJZAbICbQHaAr0BegP9AvMB5gPFA4MDDwMXAicATgCcADgBcALp'
+      'ANIBpANBA4sCHwE+AnUA6gDUAagDWQO7An8B/gL1AeoD3QOzA28D1wKnAU4DlQIjAUYC'
+      'hQAKARQCIQBCAIQACAEQAikAUgCkAEgBkAIpAVICrQBaAbQCYQHCAo0BGgM9AnMA5gDM'
+      'AZgDOQN7Av8A/gH8A/ED6wPfA7cDZwPHAocBDgMVAiMARgCMABgBMAJpANIApAFIA5kC'
+      'OwF2AuUAygGUAyEDSwKfAD4BfALxAOIBxAOBAwsDHwI3AG4A3AC4AXAD6QLbAbYDZQPD'
+      'Ao8BHgM1AmMAxgCMARgDOQJ7APYA7AHYA7kDewP/AvcB7gPVA6MDTwOXAicBTgKVACoB'
+      'VAKhAEIBhAIBAQICDQAaADQAaADQAKABQAOJAhsBNgJlAMoAlAEoA1kCuwB2AewC0QGi'
+      'A00DkwIvAV4CtQBqAdQCoQFCA40CEwEmAkUAigAUASgCWQCyAGQByAKZATIDbQLTAKYB'
+      'TAORAisBVgKlAEoBlAIhAUICjQAaATQCYQDCAIQBCAMZAjsAdgDsANgBsANpA9sCvwF+'
+      'A/UC4wHGA4UDAwMPAhcALgBcALgAcAHgAskBkgMtA1MCrwBeAbwCcQHiAs0BmgM9A3MC'
+      '7wDeAbwDcQPrAt8BvgN1A+MCzwGeAzUDYwLPAJ4BPANxAusA1gGsA1EDqwJfAb4CdQHq'
+      'At0BugN9A/MC7wHeA7UDYwPPApcBLgNVAqMARgGMAhEBIgJNAJoANAFoAtkAsgFkA8EC'
+      'iwEWAyUCQwCGAAwBGAI5AHIA5ADIAZADKQNbAr8AfgH8AvEB4gPNA5MDLwNXAqcATgGc'
+      'AjEBYgLNAJoBNANhAssAlgEsA1ECqwBWAawCUQGiAk0BmgI9AXoC/QD6AfQD4QPLA58D'
+      'NwNnAscAjgEcAzECawDWAKwBWAO5AnsB9gLlAcoDnQMzA28C1wCuAVwDsQJrAdYCpQFK'
+      'A50CMwFmAsUAigEUAyECSwCWACwBWAK5AHIB5ALBAYIDDQMTAi8AXgC8AHgB8ALpAdID'
+      'rQNTA68CVwGuAlUBqgJdAboCfQH6Av0B+gP9A/MD7wPXA6cDRwOHAgcBDgIVACoAVACo'
+      'AFABoAJJAZICLQFaAr0AegH0AuEBwgONAxMDLwJXAK4AXAG4AnkB8gLtAdoDvQNzA+8C'
+      '1wGuA1UDowJPAZ4CNQFqAt0AugF0A+ECywGWAyUDQwKPAB4BPAJxAOIAxAGIAxkDOwJ/'
+      'AP4A/AH4A/kD+wP/A/cD5wPHA4cDBwMHAgcADgAcADgAcADgAMABgAMJAxsCPwB+APwA'
+      '+AHwA+kD2wO/A3cD5wLHAY4DFQMjAk8AngA8AXgC+QDyAeQDwQOLAx8DNwJnAM4AnAE4'
+      'A3kC+wD2AewD0QOrA18DtwJnAc4ClQEqA10CswBmAcwCkQEiA00CkwAmAUwCkQAiAUQC'
+      'gQACAQQCAQA=');
+
+  /// Galois field GF(1024) log table
+  static final gf1024Log = _unpackUint16(
+      'AAD/AwEATQACAJoATgC8AwMACgCbAEUBTwBqAr0D5wAEADQBCwDIAJwAeQNGAbcCUAAY'
+      'AGsCVwC+A5IB6AC0AQUAAQI1AScCDAAoAMkA3wGdAAYCegNlAEcBpAC4AlwDUQACARkA'
+      'gQFsAhUBWABBAr8DBAOTAagC6QA0ALUBxgMGABQAAgIAAzYBigIoAoEADQA6ASkAUQPK'
+      'APUC4AHUA54A1QAHAk8BewPOAWYAiwNIAY4CpQAIAbkCcQFdA2IBUgCjAgMBTgIaAHQC'
+      'ggHfA20CLAIWATYDWQDbAEICdQDAA6kDBQMVApQB6wGpAvEA6gCFADUAUwK2AbIAxwOv'
+      'AwcA/AMVADEBAwL+AQED/wA3AREAiwLSACkCoAKCAKYDDgD5AzsB9gMqAGICUgO/AMsA'
+      'PgH2Ah8A4QGsAdUDOAKfAGUC1gDwAggCmwJQARQDfAMtAM8BIQNnAA0CjAPBAkkBwgCP'
+      'AvADpgCCAgkBKAG6AlUDcgF5Al4DgwNjAQsDUwBBAaQCYQAEAU0DTwIyAxsAzgB1Ah0D'
+      'gwEZA+AD1wJuAiIALQKVAhcBpAE3A0IDWgD5AtwAhwFDAp4DdgDDAcEDrwGqA10BBgMz'
+      'AhYCvgGVAeQB7AHbAqoCVQHyAMoC6wA7AoYAIgE2AJwBVAKMALcB2AOzAOQDyAMqA7AD'
+      'GwIIAGgC/QOYABYAkAEyAXcDBAKiAP8BJgACAzIAAAETATgB8wISAIgCjAJvAdMAzAEq'
+      'AtkAoQJyAoMAsACnA+kBDwCeAvoD/AE8AaoB9wNgAisACwJjApkCUwOBA8AAgALMABcD'
+      'PwFLA/cCnAMgAKIB4gFTAa0BMQLWAygDOQKaAaAAMABmAo4B1wCuAPECbQEJAn8DnAKo'
+      'AVEBJgMVA5oDfQMkAy4ArADQAWgDIgNmA2gA0gEOAhsBjQNqA8IC4AJKARACwwB8AZAC'
+      'HQHxA+sDpwBqAIMCRgMKAdQBKQFCALsCxAJWA28AcwHiAnoCPABfA48DhAM7A2QBbAMM'
+      'A/EBVADFAEIBSgClAn4BYgAkAgUBTAFOA/0CUAISAjMDSwIcAPMDzwAuAXYC7QMeA+0C'
+      'hAGSAhoDXgDhAx8B2AJaAW8ChQIjAJUALgJIA5YC+QEYAakApQGLATgDbABDA3kBWwAr'
+      'AfoCRwDdAEQAiAGSAEQCDAGfA+AAdwDWAcQBrwLCA1gDsAHjAKsDcQBeAdADBwO9AjQC'
+      'ogMXAsYCvwHTApYBfALlAQ8B7QE+ANwClgOrAnUBVgFHAvMA5ALLAs8C7ACGAzwCsgKH'
+      'AD0DIwG6ADcAYQOdAccBVQKRA40A6AK4AQ4D2QPZAbQA8wHlA1oCyQNmASsDegCxA24D'
+      'HAL3AAkARAFpAuYA/gNMAJkAuwMXAFYAkQGzATMBxwB4A7YCBQJkAKMAWwMAAiYCJwDe'
+      'AQMDpwIzAMUDAQGAARQBQAI5AVAD9ALTAxMA/wKJAoAAjQIHAXABYQHUAE4BzQGKAysC'
+      'NQPaAHQAogJNAnMC3gOEAFICsQCuA6gDFALqAfAAEADRAJ8CpQP7AzAB/QH+AD0BHgCr'
+      'ATcC+AP1A2ECvgAsACADDALAAmQC7wKaAhMDVAN4AoIDCgPBAO8DgQInAc0AHAMYA9YC'
+      'QAFgAEwDMQP4AoYBnQPCASEAlAKjAUED4wHaAlQByQKuAVwBMgK9AdcD4wMpAxoCOgIh'
+      'AZsBiwChACUAMQASAWcClwCPAXYD2ABxAq8A6AHyAocCbgHLAQoCmAKAA38CnQL7AakB'
+      'XwJSATACJwOZARYDSgObA6EBfgOnASUDmQMvAI0BrQBsAdEBGgFpA98CIwOrAGcDZQNp'
+      'AEUD0wFBAA8CewEcAeoDjgM6A2sD8AHDAm4A4QI7AEsB/AIRAkoCxABJAH0BIwKRAl0A'
+      'HgFZAfIDLQHsA+wCqACKAWsAeAGEApQARwP4AQsB3wDVAa4CKgFGAEMAkQC8AqEDxQLS'
+      'AlcD4gBwAM8DdAFGAuMCzgJ7Ag4BPQCVA2ADxgGQA+cChQOxAjwDuQBlAXkAbQP2AA0D'
+      '2AHyAVkCVQCyAcYAtQJDAeUASwC6A6YCxAN/AT8CYwBaAyUC3QEGAWABTQGJA08D0gP+'
+      'An8AUQKtAxMC7wA0A3MATALdAx0ANgL0A70A0ACkAy8B/QB3AgkD7gMmAR8DvwLuAhID'
+      'hQHBAZMCQAMbA9UCXwAwA+IDGQIgAYoA2QLIAlsBvAFwAucBhgLKASQAEQGWAHUDLwKY'
+      'AUkDoAGXAn4C+gFeAhkB3gKqAGQDpgGYA4wBawE5A+8BbQA6AEQDQAB6AekDXABYASwB'
+      '6wL7AkkCSAAiAt4ArQJFAJAAiQF3AZMA9wFFAs0CDQGUA6AD0QLhAM4DeAD1ANcBWALF'
+      'AeYCsAK4AMMDPgJZA9wBsQG0AuQAuQOsA+4AcgDcA18BiAPRA34ACAMlAb4CEQM1ArwA'
+      'owP8ABgCiQDHArsBwAE/A9QCLwOXAZ8BfQJdAuYByQEQAXQD7gE5AD8A6APdAmMDlwNq'
+      'AawCjwB2AfYBVwHqAkgCIQL0AFcC5QK3AMwCkwPQAs0D7QDbA4cDfQA9AtsBswK4A4gA'
+      'ugE+Ay4DJAEQA7sA+wA4AOcDYgNpAZ4BXALIAXMDVgK2AJIDzAOOAPUB6QIgArkBLQMP'
+      'A/oA2gN8ANoBtwO1AMsD9AEfAuYDaAFbAnIDygMeAmcBcQMsA/kAewC2A7IDswNvA7QD'
+      'HQJwA/gAtQM=');
+
+  /// Galois field GF(4096) antilog table, primitive polynomial 0x1069
+  static final gf4096ALog = _unpackUint16(
+      'AQACAAQACAAQACAAQACAAAABAAIABAAIaQDSAKQBSAOQBiANKQo7BHYIhQAKARQCKARQ'
+      'CMkAkgEkA0gGkAxJCfsC9gXsC7EHYg+tDjMNDwp3BO4ItQFqA9QGqA05CxsGNgwFCGMA'
+      'xgCMARgDMAZgDKkIOwF2AuwE2AnZA7IHZA+hDisNPwoXBC4INQBqANQAqAFQA6AGQA3p'
+      'CrsFdguFBgoNfQqTBCYJJQJKBJQIQQGCAgQFCAp5BPIIjQEaAzQGaAy5CBsBNgJsBNgI'
+      '2QGyA2QHyA75DZsLXwe+DhUNQwrvBN4J1QOqB1QPwQ7rDb8LFwcuDjUMAwhvAN4AvAF4'
+      'A/AG4A2pCzsHdg6FDGMJrwJeBbwKEQUiCi0EWgjdALoBdAPoBtANyQv7B/YPhQ9jD68O'
+      'Nw0HCmcEzgj1AeoD1AeoDzkPGw5fDNcIxwGOAxwHOA4ZDFsI3wC+AXwD+AbwDYkLewf2'
+      'DoUNYwuvBl4N1QrDBYYLZQfKDv0NkwtPB54OVQ3DCu8F3gvVB6oPPQ8TDk8M9wiHAQ4D'
+      'HAY4DBkIWwC2AGwB2AKwBWALqQZSDc0K8wXmC6UHSg/9DpMNTwv3Bu4NtQsDBwYOZQyj'
+      'CC8BXgK8BHgJmQIyBWQKoQRCCe0C2gW0CwEHAg5tDLMIDwEeAjwEeAiZADIBZALIBJAJ'
+      'SQOSBiQNIQorBFYIxQCKARQDKAZQDMkI+wH2A+wH2A/ZD9sP3w/XD8cP5w+nDycPJw4n'
+      'DCcIJwBOAJwAOAFwAuAEwAnpA9IHpA8hDysOPwwXCEcAjgAcATgCcATgCKkBUgOkBkgN'
+      '+QqbBTYLBQYKDH0IkwAmAUwCmAQwCQkCEgQkCCEAQgCEAAgBEAIgBEAI6QDSAaQDSAeQ'
+      'DkkN+wqfBT4LFQYqDD0IEwAmAEwAmAAwAWACwASACWkD0gakDSELKwZWDMUI4wHGA4wH'
+      'GA9ZDtsM3wnXA64HXA/RDssN/wuXBy4PNQ4DDG8ItwBuAdwCuAVwC4kGEg1NCvME5gml'
+      'A0oHlA5BDesKvwV+C5UGKg09ChMEJgglAEoAlAAoAVACoARACekC0gWkCyEHQg7tDLMJ'
+      'DwMeBjwMEQhLAJYALAFYArAEYAmpAlIFpAohBUIK7QTaCd0Dugd0D4EOaw2/ChcFLgo1'
+      'BGoIvQB6AfQC6AXQC8kHkg9ND/MOjw13C4cGDg11CoMEBgllAsoElAlBA4IGBA1hCqsE'
+      'VgnFAooFFAtBBoIMbQmzAmYFzArxBeILrQdaD90O0w3PC/cH7g+1DwMPbw63DAcJZwLO'
+      'BJwJUQOiBkQN4QqrBVYLxQaKDX0LkwYmDSUKIwRGCOUAygGUAygHUA7JDPsJnwM+B3wO'
+      'kQxLCf8C/gX8C5EHIg8tDjMMDwh3AO4A3AG4A3AH4A6pDTsLHwY+DBUIQwCGAAwBGAIw'
+      'BGAIqQBSAaQCSAWQCkkFkgpNBZoKXQW6Ch0FOgodBDoIHQA6AHQA6ADQAaADQAeADmkN'
+      'uwofBT4KFQQqCD0AegD0AOgB0AOgB0AP6Q67DR8LVwauDDUJAwIGBAwIcQDiAMQBiAMQ'
+      'ByAOKQw7CB8APgB8APgA8AHgA8AHgA9pD7sOHw1XCscEjgl1A+oG1A3BC+sH1g/FD+MP'
+      'rw83DwcOZwynCCcBTgKcBDgJGQIyBGQIoQBCAYQCCAUQCkkEkghNAZoCNAVoCrkEcgmN'
+      'AhoFNAoBBAIIbQDaALQBaAPQBqANKQs7BnYMhQhjAcYCjAUYC1kGsgwNCXMC5gTMCfED'
+      '4gfED+EPqw8/DxcORwznCKcBTgOcBjgNGQpbBLYIBQEKAhQEKAg5AHIA5ADIAZADIAdA'
+      'DukMuwkfAz4GfAyRCEsBlgIsBVgK2QSyCQ0DGgY0DAEIawDWAKwBWAOwBmANqQo7BXYK'
+      'hQQKCX0C+gT0CYEDAgcEDmEMqwg/AX4C/AT4CZkDMgdkDqEMKwk/An4E/AiRASIDRAaI'
+      'DHkJmwI2BWwKsQRiCa0CWgW0CgEFAgptBNoI3QG6A3QH6A65DRsLXwa+DBUJQwKGBAwJ'
+      'cQLiBMQJ4QPCB4QPYQ+rDj8NFwpHBI4IdQHqAtQFqAs5B3IOjQxzCY8CHgU8ChEEIggt'
+      'AFoAtABoAdACoAVAC+kG0g3NC/MH5g+lDyMPLw43DAcIZwDOAJwBOANwBuAMqQk7A3YG'
+      '7AyxCQsDFgYsDDEICwAWACwAWACwAGABwAKABQALaQbSDM0J8wPmB8wP8Q+LD38Plw5H'
+      'DecKpwVOC/UG6g29CxMHJg4lDCMILwBeALwAeAHwAuAFwAvpB9IPzQ/zD48Pdw+HDmcN'
+      'pwonBU4K9QTqCb0Degf0DoENawu/Bn4NlQpDBYYKZQXKCv0F+gudBzoPHQ5TDM8I9wHu'
+      'A9wHuA8ZD1sO3wzXCccDjgccD1EOywz/CZcDLgdcDtEMywn/A/4H/A+RD0sP/w6XDUcL'
+      '5wbODfULgwcGD2UOowwvCTcCbgTcCNEBogNEB4gOeQ2bCl8FvgoVBSoKPQR6CJ0AOgF0'
+      'AugE0AnJA5IHJA8hDisMPwgXAC4AXAC4AHAB4ALABYALaQfSDs0N8wuPBx4PVQ7DDO8J'
+      'twNuB9wO0Q3LC/8H/g+VD0MP7w63DQcLZwbODPUJgwMGBwwOcQyLCH8B/gL8BfgLmQcy'
+      'Dw0OcwyPCHcB7gLcBbgLGQcyDg0McwiPAB4BPAJ4BPAIiQESAyQGSAz5CJsBNgNsBtgM'
+      '2QnbA7YHbA+xDgsNfwqXBC4JNQJqBNQIwQGCAwQHCA55DJsIXwG+AnwF+AqZBTILDQYa'
+      'DF0I0wCmAUwDmAYwDQkKewT2CIUBCgMUBigMOQgbADYAbADYALABYAPABoANaQu7BnYN'
+      'hQpjBcYK5QXKC/0H+g+dD1MPzw73DYcLZwfODvUNgwtvB94O1Q3DC+8H3g/VD8MP7w+3'
+      'DwcPZw6nDCcJJwJOBJwIUQGiAkQFiAp5BfIKjQUaC10GugwdCVMCpgRMCfEC4gXEC+EH'
+      'wg/tD7MPDw93DocMZwmnAk4FnApRBaIKLQVaCt0EugkdAzoGdAyBCGsB1gKsBVgL2Qay'
+      'DQ0LcwbmDKUJIwNGBowMcQmLAhYFLAoxBGIIrQBaAbQCaAXQCskFkgtNB5oOXQ3TCs8F'
+      'ngtVB6oOPQ0TCk8EnghVAaoCVAWoCjkFcgqNBBoJXQK6BHQJgQICBQQKYQTCCO0B2gO0'
+      'B2gPuQ4bDV8K1wSuCTUDagbUDMEJ6wPWB6wPMQ8LDn8MlwhHAY4CHAU4ChkEMggNABoA'
+      'NABoANAAoAFAA4AGAA1pCrsEdgmFAgoFFApBBIIIbQHaArQFaAu5BnINjQpzBeYKpQVK'
+      'C/0G+g2dC1MHpg4lDSMKLwReCNUAqgFUA6gGUA3JCvsF9guFBwoPfQ6TDE8J9wLuBdwL'
+      '0QeiDy0PMw4PDHcIhwAOARwCOARwCIkAEgEkAkgEkAhJAZICJAVICvkE8gmNAxoHNA4B'
+      'DGsIvwB+AfwC+AXwC4kHEg9NDvMMjwl3A+4G3A3RC8sHlg9FD+MOrw03CwcGDgx1CIMA'
+      'BgEMAhgEMAgJABIAJABIAJAAIAFAAoAEAAlpAtIEpAkhA0IGhAxhCasCVgWsCjEFYgqt'
+      'BFoJ3QK6BXQLgQYCDW0KswRmCaUCSgWUCkEFggptBdoK3QW6Cx0HOg4dDFMIzwCeATwD'
+      'eAbwDIkJewP2BuwNsQsLBxYORQzjCK8BXgO8BngNmQpbBbYKBQUKCn0E+gidAToDdAbo'
+      'DLkJGwM2BmwMsQgLARYCLARYCNkAsgFkA8gGkA1JC/sG9g2FC2MHxg7lDaMLLwdeDtUM'
+      'wwnvA94HvA8RD0sO/wyXCUcDjgYcDVEKywSWCUUDigYUDUEK6wTWCcUDigcUD0EO6wy/'
+      'CRcDLgZcDNEIywGWAywHWA7ZDNsJ3wO+B3wPkQ5LDf8KlwUuCzUGagy9CBMBJgJMBJgI'
+      'WQGyAmQFyAr5BfILjQcaD10O0wzPCfcD7gfcD9EPyw//D5cPRw/nDqcNJwsnBk4M9QiD'
+      'AQYDDAYYDFkI2wC2AWwD2AawDQkLewb2DIUJYwPGBowNcQuLBhYNRQrjBMYJ5QPKB5QP'
+      'QQ/rDr8NFwtHBo4MdQmDAgYFDApxBOIIrQFaA7QGaA25ChsFNgoFBAoIfQD6APQB6APQ'
+      'B6APKQ87Dh8MVwjHAI4BHAM4BnAMiQh7AfYC7AXYC9kHsg8ND3MOjwx3CYcCDgUcClEE'
+      'oggtAVoCtARoCbkCcgXkCqEFQgvtBtoN3QvTB6YPJQ8jDi8MNwgHAA4AHAA4AHAA4ADA'
+      'AYADAAcADmkMuwgfAT4CfAT4CJkBMgNkBsgM+QmbAzYHbA6xDAsJfwL+BPwJkQMiB0QO'
+      '4QyrCT8Dfgb8DJEJSwOWBiwNMQoLBBYIRQCKABQBKAJQBKAIKQFSAqQESAn5AvIF5Auh'
+      'B0IP7Q6zDQ8LdwbuDLUJAwMGBgwMcQiLABYBLAJYBLAICQESAiQESAj5APIB5APIB5AP'
+      'SQ/7Dp8NVwvHBo4NdQuDBgYNZQqjBEYJ5QLKBZQLQQeCDm0NswoPBR4KVQSqCD0BegL0'
+      'BOgJuQNyB+QOoQ0rCz8GfgyVCEMBhgIMBRgKWQSyCA0BGgI0BGgIuQByAeQCyAWQC0kH'
+      'kg5NDfMKjwUeC1UGqgw9CRMCJgRMCPEA4gHEA4gHEA9JDvsMnwlXA64GXA3RCssFlgtF'
+      'B4oOfQ2TCk8FngpVBaoKPQV6Cp0EOgkdAjoEdAiBAAIBBAIIBBAISQCSACQBSAKQBCAJ'
+      'KQJSBKQIIQFCAoQECAl5AvIE5AmhA0IHhA5hDasKPwV+CpUEKgk9AnoE9AiBAQIDBAYI'
+      'DHkImwA2AWwC2ASwCQkDEgYkDCEIKwBWAKwAWAGwAmAFwArpBdILzQeaD10P0w7PDfcL'
+      'hwcOD3UOgwxvCbcCbgXcCtEFogstB1oO3QzTCc8Dngc8DxEOSwz/CJcBLgNcBrgMGQlb'
+      'ArYEbAmxAmIFxArhBcIL7QfaD90P0w/PD/cPhw9nD6cOJw0nCicETgj1AOoB1AOoB1AP'
+      'yQ77DZ8LVweuDjUNAwpvBN4I1QGqA1QHqA45DRsKXwS+CBUBKgJUBKgIOQFyAuQEyAn5'
+      'A/IH5A+hDysPPw4XDEcI5wDOAZwDOAdwDokMewmfAj4FfAqRBCIJLQJaBLQIAQECAgQE'
+      'CAh5APIA5AHIA5AHIA8pDjsMHwhXAK4AXAG4AnAF4AqpBVILzQaaDV0L0wamDSULIwZG'
+      'DOUIowFGA4wGGA1ZCtsEtgkFAwoGFAxBCOsA1gGsA1gHsA4JDXsKnwQ+CRUCKgRUCMEA'
+      'ggEEAwgGEAxJCPsA9gHsA9gHsA8JD3sOnwxXCccCjgUcC1EGogwtCTMCZgTMCPEB4gPE'
+      'B4gPeQ+bDl8N1wrHBY4LdQfqDr0NEwtPBp4MVQnDAoYFDAtxBuIMrQkzA2YGzAzxCYsD'
+      'FgcsDjEMCwh/AP4A/AH4A/AH4A+pDzsPHw5XDMcI5wHOA5wHOA8ZDlsM3wjXAa4DXAe4'
+      'DhkNWwrfBL4JFQMqBlQMwQjrAdYDrAdYD9kO2w3fC9cHrg81DwMObwy3CAcBDgIcBDgI'
+      'GQAyAGQAyACQASADQAaADGkJuwJ2BewKsQViC60GWg3dCtMFpgslB0oO/QyTCU8DngY8'
+      'DREKSwSWCEUBigIUBSgKOQRyCI0AGgE0AmgE0AjJAZIDJAdIDvkMmwlfA74GfA2RCksF'
+      'lgpFBYoKfQX6Cp0FOgsdBjoMHQhTAKYATAGYAjAFYAqpBFIJzQKaBTQLAQYCDG0IswBm'
+      'AcwCmAUwCwkGEgxNCPMA5gHMA5gHMA8JDnsMnwhXAa4CXAW4ChkFMgoNBBoIXQC6AHQB'
+      '6ALQBaALKQdSDs0M8wmPAx4HPA4RDEsI/wD+AfwD+AfwD4kPew+fDlcNxwrnBc4L9Qfq'
+      'D70PEw9PDvcMhwlnA84GnA1RC8sGlg1FC+MGxg3lC6MHRg/lDqMNLws3Bm4MtQgDAQYC'
+      'DAQYCFkAsgBkAcgCkAUgCykGUgzNCPMB5gPMB5gPWQ/bDt8N1wvHB44PdQ+DDm8NtwoH'
+      'BQ4KdQTqCL0BegP0BugNuQsbBzYOBQxjCK8AXgG8AngF8AqJBRILTQaaDF0J0wKmBUwL'
+      '8QbiDa0LMwdmDqUMIwkvAl4EvAgRASICRASICHkB8gLkBcgL+QfyD40Pcw+PDncNhwpn'
+      'Bc4K9QXqC70Heg+dDlMNzwr3Be4LtQdqD70OEw1PCvcE7gm1A2oH1A7BDesLvwd+D5UO'
+      'Qw3vCrcFbgu1BmoNvQoTBSYKJQRKCP0A+gH0A+gH0A/JD/sPnw9XD8cO5w2nCycHTg71'
+      'DIMJbwPeBrwNEQtLBpYMRQnjAsYFjAtxB+IOrQ0zCw8GHgxVCMMAhgEMAxgGMAwJCHsA'
+      '9gDsAdgDsAdgD6kOOw0fClcErgg1AWoC1ASoCTkDcgbkDKEJKwNWBqwMMQkLAhYELAgx'
+      'AGIAxACIARADIAZADOkIuwF2A+wG2A3ZC9sHtg8FD2MOrww3CQcCDgQcCFEAogBEAYgC'
+      'EAUgCikEUgjNAJoBNANoBtAMyQn7A/YH7A+xDwsPfw6XDEcJ5wLOBZwLUQeiDi0NMwoP'
+      'BB4IVQCqAFQBqAJQBaAKKQVSCs0EmgldA7oGdA2BCmsF1grFBYoLfQf6Dp0NUwvPBp4N'
+      'VQvDBoYNZQujBkYN5QqjBUYL5QbKDf0LkwcmDyUOIwwvCDcAbgDcALgBcAPgBsAN6Qu7'
+      'B3YPhQ5jDa8KNwVuCrUEagm9AnoF9AqBBQILbQbaDN0J0wOmB0wP8Q6LDX8LlwYuDTUK'
+      'AwQGCGUAygCUASgDUAagDCkJOwJ2BOwIsQFiA8QGiA15C5sGNg0FCmMExgjlAcoDlAco'
+      'DzkOGwxfCNcArgFcA7gGcA2JCnsF9gqFBQoLfQb6DJ0JUwOmBkwN8QqLBRYLRQaKDH0J'
+      'kwImBUwK8QTiCa0DWge0DgENawq/BH4JlQIqBVQKwQSCCW0D2ga0DQELawbWDMUJ4wPG'
+      'B4wPcQ+LDn8NlwpHBY4KdQXqCr0FegudBjoNHQpTBKYIJQFKApQEKAk5AnIE5AihAUID'
+      'hAYIDXkKmwQ2CQUCCgQUCEEAggAEAQgCEAQgCCkAUgCkAEgBkAIgBUAK6QTSCc0Dmgc0'
+      'DwEOawy/CBcBLgJcBLgIGQEyAmQEyAj5AfID5AfID/kPmw9fD9cOxw3nC6cHTg/1DoMN'
+      'bwu3Bm4NtQoDBQYKZQTKCP0B+gP0B+gPuQ8bD18O1wzHCecDzgecD1EPyw7/DZcLRweO'
+      'DnUNgwpvBd4K1QWqCz0Heg6dDFMJzwKeBTwLEQYiDC0IMwBmAMwAmAEwA2AGwAzpCbsD'
+      'dgfsDrENCwt/Bv4MlQlDA4YGDA1xCosEFglFAooEFAlBAoIEBAlhAsIEhAlhA8IGhA1h'
+      'C6sGVg3FCuMFxgvlB8oP/Q+TD08P9w6HDWcLpwZODfUKgwUGC2UGygz9CZMDJgdMDvEM'
+      'iwl/A/4G/A2RC0sHlg5FDeMKrwVeC9UGqg09CxMGJgwlCCMARgCMABgBMAJgBMAI6QHS'
+      'A6QHSA/5DpsNXwvXBq4NNQsDBgYMZQijAEYBjAIYBTAKCQQSCE0AmgA0AWgC0ASgCSkD'
+      'UgakDCEJKwJWBKwIMQFiAsQEiAl5A/IG5A2hCysHVg7FDOMJrwNeB7wOEQ1LCv8E/gmV'
+      'AyoHVA7BDOsJvwN+B/wOkQ1LC/8G/g2VC0MHhg5lDaMKLwVeCtUEqgk9A3oG9AyBCWsD'
+      '1gasDTELCwYWDEUI4wDGAYwDGAcwDgkMewifAD4BfAL4BPAJiQMSByQOIQwrCD8AfgD8'
+      'APgB8APgB8AP6Q+7Dx8PVw7HDOcJpwNOB5wOUQ3LCv8F/guVByoPPQ4TDE8I9wDuAdwD'
+      'uAdwD4kOew2fClcFrgo1BWoKvQR6CZ0COgV0CoEEAgltAtoEtAkBAwIGBAxhCKsAVgGs'
+      'AlgFsAoJBRIKTQSaCF0BugJ0BegKuQVyC40GGg1dCtMEpgklA0oGlAxBCesC1gWsCzEH'
+      'Yg6tDDMJDwIeBDwIEQAiAEQAiAAQASACQASACGkB0gKkBUgL+QbyDY0LcwfmDqUNIwsv'
+      'Bl4M1QjDAYYDDAcYDlkM2wjfAb4DfAf4DpkNWwvfBr4NFQtDBoYMZQmjAkYFjApxBeIK'
+      'rQVaC90Gug0dC1MGpgwlCSMCRgSMCHEB4gLEBYgLeQfyDo0NcwuPBh4NVQrDBIYJZQPK'
+      'BpQNQQvrBtYNxQvjB8YP5Q+jDy8PNw4HDGcIpwBOAZwCOAVwCokEEglNApoENAkBAgIE'
+      'BAhhAMIAhAEIAxAGIAwpCDsAdgDsANgBsANgB8AO6Q27Cx8HPg4VDEMI7wDeAbwDeAfw'
+      'DokNewufBj4NFQpDBIYIZQHKApQFKAs5BnIMjQhzAeYCzAWYC1kHsg4NDXMKjwQeCVUC'
+      'qgRUCcECggUEC2EGwgztCbMDZgfMDvENiwt/B/4OlQ1DC+8G3g3VC8MHhg9lD6MOLw03'
+      'CgcEDgh1AOoA1AGoA1AHoA4pDTsKHwQ+CBUAKgBUAKgAUAGgAkAFgAppBdIKzQWaC10H'
+      'ug4dDVMKzwSeCVUDqgZUDcEK6wXWC8UHig99D5MOTw33CocFDgt1BuoMvQkTAyYGTAzx'
+      'CIsBFgMsBlgM2QjbAbYDbAfYDtkN2wvfB74PFQ9DDu8MtwkHAw4GHAxRCMsAlgEsA1gG'
+      'sAwJCXsC9gTsCbEDYgfEDuENqws/B34OlQxDCe8C3gW8CxEHIg4tDDMIDwAeADwAeADw'
+      'AOABwAOABwAPaQ67DB8JVwKuBFwJ0QKiBUQL4QbCDe0LswdmD6UOIw0vCjcEbgi1AGoB'
+      '1AKoBVALyQaSDU0L8wbmDaULIwdGDuUMowkvA14GvAwRCUsClgQsCTECYgTECOEBwgOE'
+      'BwgPeQ6bDF8J1wKuBVwL0QaiDS0LMwZmDKUIIwFGAowEGAlZArIEZAmhAkIFhAphBcIK'
+      '7QXaC90Hug8dD1MOzwz3CYcDDgccDlEMywj/Af4D/Af4D5kPWw/fDtcNxwvnB84P9Q+D'
+      'D28Ptw4HDWcKpwROCfUC6gXUC8EHgg9tD7MODw13CocEDgl1AuoE1AnBA4IHBA9hDqsM'
+      'PwkXAi4EXAjRAKIBRAOIBhANSQr7BPYJhQMKBxQOQQzrCL8BfgP8BvgNmQtbB7YOBQ1j'
+      'Cq8EXgnVAqoFVAvBBoINbQuzBmYNpQojBUYK5QTKCf0D+gf0D4EPaw+/DhcNRwrnBM4J'
+      '9QPqB9QPwQ/rD78PFw9HDucMpwknA04GnAxRCcsClgUsCzEGYgytCDMBZgLMBJgJWQOy'
+      'BmQNoQorBVYKxQSKCX0D+gb0DYELawfWDsUN4wuvB14P1Q7DDe8LtwduD7UOAw1vCrcE'
+      'bgm1AmoF1ArBBYILbQfaDt0N0wvPB54PVQ/DDu8NtwsHBw4OdQyDCG8B3gK8BXgLmQYy'
+      'DQ0KcwTmCKUBSgOUBigNOQobBDYIBQAKABQAKABQAKAAQAGAAgAFAAppBNIIzQGaAzQH'
+      'aA65DBsJXwK+BHwJkQIiBUQK4QTCCe0D2ge0DwEPaw6/DBcJRwKOBBwJUQKiBEQJ4QLC'
+      'BYQLYQfCDu0NswsPBx4OVQzDCO8B3gO8B3gPmQ5bDd8K1wWuCzUHag69DBMJTwKeBDwJ'
+      'EQIiBEQI4QDCAYQDCAcQDkkM+wifAT4DfAb4DJkJWwO2BmwNsQoLBRYKRQSKCH0B+gL0'
+      'BegLuQdyD40Ocw2PCncF7gq1BWoLvQZ6DZ0KUwWmCiUFSgr9BPoJnQM6B3QOgQxrCb8C'
+      'fgX8CpEFIgstBloM3QjTAaYDTAeYDlkN2wrfBb4LFQcqDj0MEwhPAJ4APAF4AvAE4Amp'
+      'A1IHpA4hDSsKPwR+CJUAKgFUAqgEUAnJApIFJAshBkIM7QizAWYDzAaYDVkL2wa2DQUL'
+      'YwbGDOUJowNGB4wOcQ2LCn8F/gqVBSoLPQZ6DJ0IUwGmAkwFmApZBbIKDQUaCl0Euggd'
+      'AToCdAToCLkBcgPkBsgN+QubBzYPBQ5jDK8INwFuAtwEuAkZAzIGZAyhCCsBVgKsBFgJ'
+      '2QKyBWQLoQZCDe0KswVmC6UGSg39CpMFJgslBkoM/QiTASYDTAaYDFkJ2wK2BWwLsQZi'
+      'Da0KMwVmCqUESgn9AvoF9AuBBwIPbQ6zDA8JdwLuBNwJ0QOiB0QP4Q6rDT8LFwYuDDUI'
+      'AwAGAAwAGAAwAGAAwACAAQADAAYADGkIuwB2AewC2AWwCwkHEg5NDPMIjwEeAzwGeAyZ'
+      'CFsBtgJsBdgK2QWyCw0HGg5dDNMIzwGeAzwHeA6ZDFsJ3wK+BXwLkQYiDS0KMwRmCKUA'
+      'SgGUAigFUArJBJIJTQOaBjQNAQprBNYIxQGKAxQHKA45DBsIXwC+AHwB+ALwBeALqQdS'
+      'D80O8w2PC3cH7g61DQMLbwbeDNUJwwOGBwwPcQ6LDH8JlwIuBVwK0QSiCS0DWga0DAEJ'
+      'awLWBKwJMQNiBsQM4QmrA1YHrA4xDQsKfwT+CJUBKgNUBqgMOQkbAjYEbAixAGIBxAKI'
+      'BRALSQaSDE0J8wLmBcwL8QfiD60PMw8PDncMhwhnAc4CnAU4CxkGMgwNCHMA5gDMAZgD'
+      'MAdgDqkMOwkfAj4EfAiRACIBRAKIBBAJSQKSBCQJIQJCBIQIYQHCAoQFCAt5BvIMjQlz'
+      'A+YGzA3xC4sHFg9FDuMMrwk3A24G3AzRCcsDlgcsDzEOCwx/CJcALgFcArgEcAmJAhIF'
+      'JAohBEII7QDaAbQDaAfQDskN+wufBz4PFQ5DDO8ItwFuA9wGuA0ZC1sGtgwFCWMCxgSM'
+      'CXED4gbEDeELqwdWD8UO4w2vCzcHbg61DAMJbwLeBLwJEQMiBkQM4QirAVYDrAZYDdkK'
+      '2wW2CwUHCg59DJMITwGeAjwFeAqZBDIJDQIaBDQIAQA=');
+
+  /// Galois field GF(4096) log table
+  static final gf4096Log = _unpackUint16(
+      'AAD/DwEA8Q4CAOMN8g5ABgMAMgXkDTYD8w7GBEEG1QwEAMcLMwVTAeUNgAw3A7gD9A4r'
+      'CMcEJARCBigC1gxOAgUAQAHICwYLNAWKAVQBGgHmDWoKgQwdBzgDFgO5A1QD9Q52CSwI'
+      'uQrIBEUAJQTUCUMGqgIpAi8M1ww2Ak8CcgsGAGQKQQETAskLbAYHCygBNQXzBosBnAFV'
+      'ASELGwFrDucNjAlrCmgIggyrCR4HnAc5A8YIFwPPALoDjghVAzYP9g4oDHcJMgAtCPgJ'
+      'ugonA8kEDABGAMECJgSCAtUJfABEBkYCqwKGDyoCdgwwDAgC2AyTBzcCXAlQAg8Gcwv8'
+      'BwcA7gZlCi0FQgEVABQCAQXKCwYFbQaFBggLTggpAe4DNgWRD/QGOAGMAXgOnQG2D1YB'
+      '+gAiCxQHHAGtA2wOaAvoDXACjQkaC2wKIw9pCBsMgwwZAqwJpQsfB4kEnQfqCDoDbQ/H'
+      'CHYIGAPxDNAAdAG7A8AGjwj9DlYDswE3DxYF9w7EBykMVgl4CQUBMwAZBi4IGgD5CbwM'
+      'uwqUCSgDXgXKBF0NDQAXBEcA6wTCAhMKJwSEBYMC5QXWCY4AfQCrAEUGKA5HAmELrAL0'
+      'AYcPgAcrAkcBdwy4BzEMwA8JAjwM2QzRBpQHfgg4AloHXQmLC1ECjgYQBsoHdAs1Cf0H'
+      'nQgIAI8H7wbCCGYKpgIuBScIQwGKBhYAgAUVArwGAgX2AMsLAQkHBcMFbgZwB4YGeQoJ'
+      'C30KTwhiACoBpA7vA0wGNwX8BpIPGg31BlMKOQFpAo0BcgZ5DroOngEuBrcP5gBXAS4L'
+      '+wCgDSMLZwkVB7IOHQF0B64DOQBtDqoGaQvUAukNVwBxArYGjglICBsLwARtCgsFJA+3'
+      'AmoIdwIcDPYPhAxQBBoCmg6tCZwEpguGCCAHxwWKBAsPngeuC+sIDgQ7A5wPbg+MAsgI'
+      'SAx3CH8PGQPPC/IMdgTRANcEdQHTDbwD/wvBBk8MkAgJA/4O5gNXAwUJtAEfBjgPPA4X'
+      'Bd0D+A4PB8UH4AUqDB8EVwnKAHkJ8wMGAacMNABdABoGBg8vCOACGwDODvoJZQ+9DEAH'
+      'vApQBpUJ+AMpA3cFXwUvDssEWgpeDa0HDgDcDRgEnwJIAC4B7ATrD8MCBgYUCmwFKAQC'
+      'CoUFgw6EAioA5gXMD9cJqA6PAH4JfgDhCKwAag1GBggEKQ7dC0gCMA9iC6UArQJTCPUB'
+      'sgWID+8NgQcVDywCoQNIAV8OeAxoB7kHDggyDGYAwQ+sDAoC8QI9DOML2gwKDdIGYgGV'
+      'BwwKfwgHCDkCDQtbBxoIXgmsBIwLFQ5SAtwHjwbPCBEGnQDLB3sDdQuBCjYJCwH+B5cK'
+      'nggzDQkAJQyQB0MC8AZhCsMIiQlnCj0BpwJzCS8F/A8oCMQLRAElDosGzgYXAMEHgQVa'
+      'DRYCbQK9BmoPAwXrBvcAjg/MC5kPAgn8CwgFVADEBU0Ebwb5BnEHKwuHBowHegr+CAoL'
+      'Bw1+CtkHUAgFBGMAngMrAVcKpQ7/CfADDAdNBt0COAXSCv0G+gKTD88KGw0EDvYGlg9U'
+      'CgQNOgEiDGoCIg6OAQcOcwZbBHoOWQy7DuEMnwEeDS8GRQe4D6QE5wD1DVgB1QovC9QP'
+      '/ADDAaEN4wEkCzsFaAlXDxYHnguzDuQPHgH9AnUHkwKvA1ENOgDlDm4OAAerBsIMagvM'
+      'AtUCWgbqDacEWAABBnIC0gS3BikGjwm7D0kIhAQcC30CwQQRA24K+A0MBSkKJQ81CrgC'
+      'Tg9rCOoAeALlAh0MmQv3D4cHhQwhDVEE7wsbAlEFmw5pBK4JogGdBEIFpwvqAocIhwAh'
+      'B0gHyAXSAYsEwA0MDzEHnwcyBq8LNAjsCOUJDwRXDjwDXAydD+0Hbw/MAY0C0wfJCH0O'
+      'SQyaDXgIcAiAD7MKGgPkDNAL9AjzDHUNdwQRDdIAvg7YBNMOdgFJBdQNGw+9AwoOAAxM'
+      'CcIGnwZQDKIJkQiRAQoDvQv/Du8A5wPODFgDXgQGCXUPtQFGDSAG+AQ5D3YGPQ4gABgF'
+      '3Q7eAwAC+Q6hCxAHgQbGB7QH4QW4DCsMGQcgBDIDWAm9AssAmAF6CecP9AOjDAcBFgio'
+      'DK4FNQC2Dl4AfAUbBnIEBw+zAjAIPgXhAoAEHAC5C88Olg37CScLZg9vCb4MUw9BBwAN'
+      'vQpaD1EG8weWCbUE+QOsDyoDawl4BS4DYAVWCzAOYgbMBMYBWwrJCl8NogWuB5wFDwD/'
+      'AN0NZgYZBCoPoAJCCEkA5gEvASAK7QSSDOwP2QbEAqQNBwY0DhUKtQltBVkIKQTYCgMK'
+      '7gWGBQwMhA6wCIUCWwErAFoL5wU6Cs0PRQnYCdcPqQ6jD5AAXAJ/CSAFfwAyC+IIZAWt'
+      'AKwNaw32CkcGzwIJBNgDKg5lDd4LLg1JAm0LMQ/3B2MLEQWmAJgIrgJdBlQI8Qr2AUEL'
+      'swWJA4kP2ALwDVUGggdSDhYP+wEtAgMHogOODkkBfgFgDn8LeQxxDmkHXg+6By4KDwg6'
+      'CzMMxQxnAGIMwg8iCa0MyQMLAq4G8gLBCj4MaAPkC0YL2wxUDQsNSA/TBqgFYwGDA5YH'
+      'sgMNCrAPgAhzCggIOgc6AugODgvtCVwHcgAbCGkBXwk9AK0E/QONC6kBFg64BVMCAAPd'
+      'B0EKkAb3BdAIoAoSBiEBngC5BMwH/Q18A5UFdguWAoIKQgM3CYwNDAHSBf8HeAeYCpoJ'
+      'nwiCDTQNjgMKAIACJgz2CZEHDQZEAnQM8QYfC2IKagbECIwIigmpCWgKFAM+AYgBqAI0'
+      'AnQJQwAwBcQE/Q/hDSkIJgLFC34MRQG+DyYO8gGMBjMJzwZYBxgAkgnCBwMBggWMAFsN'
+      '6QQXAocEbgIhD74GsQFrD+8MBAVMCOwGEwD4AKsDjw92Ds0L1QSaD0YMAwk6Dv0LBwMJ'
+      'BXUCVQBGCMUFrAtOBJoEcAYsBvoGUQpyB6gGLAtlCYgGugaNB6QCewqiDv8IbgcLC6oE'
+      'CA0KCn8KlQraB5sAUQjtDQYELg9kAO8CnwNmBywBBAZYCtoNpg7fCAAKKADxA1sADQcd'
+      'BE4GdQXeAmMPOQWcC9MKwQH+BsoC+wJPDZQPIAzQCs0KHA2iBAUOVwz3BooHlw9SAFUK'
+      'CgcFDQMEOwH6DyMMXwprAukGIw6/B48B7QAIDp0GdAbbDlwERA17Dm4IWgzKAbwORwXi'
+      'DHMNoAHoAh8NTwUwBuMJRge+DbkPewKlBNAE6ACXC/YNMwpZATgK1goKDDALqg3VD1oC'
+      '/QAoD8QBoAWiDbMJ5AGQDCULUQ88BbcLaQlUC1gPswQXB7sCnwuyB7QOcATlDxQIHwH7'
+      'Df4C9QV2B4ANlAKKDbADcQpSDaYFOwCnAeYOcABvDiwKAQd8AawGZgPDDCAJawsPBc0C'
+      'Yw3WAlAOWwY/C+sN7QKoBJMKWQBzBQIG3QhzAqoL0wQ4DrgGoA4qBqYGkAmKALwPMQlK'
+      'CKkDhQSvAR0Ligh+AgsGwgQkAhIDMgJvCqUB+Q1+DQ0FTg4qCmQDJg+xCTYKqA25Am4E'
+      'Tw9SC2wIRQXrANkOeQKVC+YC4QkeDKAEmgvIAvgP5waIBwgHhgxUBSINcANSBF8I8AtI'
+      'ChwCHgJSBV0InA4gAmoE4wavCWwEowFMDp4E5QZDBZMLqAueDusCcQWICCICiACnAyIH'
+      'JA1JBzAEyQVyA9MBEAmMBIgMwQ25CQ0PVgUyB6sKoAfyCzMG3gSwC0oKNQhFDu0IVATm'
+      'CRkKEARhCFgOkw49A+gJXQzsCp4PGwruB54McA/vCM0BJAqOAlYE1AfJBsoIWg5+DskO'
+      'SgyVDpsNvgV5CBIEcQgzAYEPYwi0Ck4BGwM1BuUMygnRC+AE9QhLA/QMogd2DeoBeAT0'
+      'CxIN/grTADcIvw7EDtkERw7UDiwJdwGyC0oFTQDVDUwKHA+DAb4Dww0LDrgAAQy7CU0J'
+      '5AfDBo4EoAbdBlEMigyjCZQEkgg0B5IBPAgLA60KvgscDgAPDw/wAPAP6ANYBc8MZQ5Z'
+      'A0sHXwTfCgcJMgR2D6cItgEkB0cNlgwhBiYN+QTCADoP1QF3BtgAPg4SCSEAGQkZBcsF'
+      '3g7xBN8DdAMBAoQL+g5zCKILFwsRBzUBggYqBccHewi1B14L4gUUBLkMUwksDLYKGgcD'
+      'CyEEUAEzA+4OWQmDD74CLwDMAGUImQEQAnsJgA7oD6oH9QPLDqQM3QUIAcwIFwhfAakM'
+      'XA6vBdoLNgCdDbcOFw1fAMAFfQW/CBwGTAxzBIkCCA+XDrQCswYxCM8BPwXsC+ICJgqB'
+      'BP4FHQByD7oLSQnQDvEIlw3qB/wJ1gcoC/kLZw/LBnAJQAK/DJACVA/RD0IHWAQBDfcC'
+      'vgpfDFsPiw5SBu4K9AfVA5cJPwO2BD4K+gPqCa0PRQ8rA/AHbAl9BHkFoAwvA34GYQWg'
+      'D1cL6wUxDh0KYwbGCs0ETAXHAZoGXApPAMoKvgFgDXkBowXyBa8HtAudBQcMEAAeDwAB'
+      '7wHeDYUBZwbzCRoE1w0rDwcKoQJOCkMIQwxKAMEO5wHHCTABxg4hCukK7gTVAJMM3Art'
+      'DzkI2ga1AMUC1g6lDXsNCAYuCTUOkAoWCtsEtgktBG4FSQ5aCG0DKgR4DdkKxAkECuwB'
+      '7wWXBocF9gwNDLQIhQ6kB7EIwQmGAhQNXAGnBywAAAtbCxQL6AV6BDsKiA7OD/YLRgnp'
+      'C9kJ5wzYD7cIqg7MCaQPlgORAB0DXQIQDIAJNwYhBWsMgAD3CDML+QzjCE0DZQXfAK4A'
+      '0wutDYoFbA3iBPcKSwtIBvIA0ALiAAoE8g/ZA88NKw4CD2YNaAXfCxEPLw0RDkoC0Qxu'
+      'C1ADMg9nDvgHeABkC+oDEgXmCKcAWgWZCDgMrwKUAV4G/AxVCD4I8gpBCfcBlAhCCzYL'
+      'tAU2B4oDkQWKD8AL2QL6CPENHg5WBuAPgwcNA1MOgwAXD68K/AHKDC4CogYEB04LowPf'
+      'Bo8OpwpKAcUGfwH6CmEOkASAC74AegylCXIO5QRqB5YEXw9iB7sHUwwvCm8NEAiMDDsL'
+      'bAA0DA0OxgyNBWgAugBjDDsEww/AAyMJsA2uDMUNygM/BAwCTwmvBtYL8wLmB8IKQQ8/'
+      'DAMMaQOxAOULvQlHC2cM3AzgDlUNmQMMDfMESQ8sB9QGGwWpBacPZAHNBYQDxAOXBwMC'
+      'swPPCQ4KhguxD28BgQjhA3QKrQ4JCHYDOwfHDzsCeQbpDroIDwvaAO4JiwpdBzwPcwDb'
+      'DxwI1wFqAbQNYAkjAD4A6gyuBBsJ/gO5DY4LQA6qAdwJFw4UCbkFJwlUAkkNAQNuDN4H'
+      'mAxCCtcIkQa4AfgFJAXRCCYHoQrJDRMG+wQiAToGnwDEALoEIQjNByMG/g2DCX0DKA2W'
+      'BbIMdwthBJcCEwyDCuEKQwM8DTgJWwONDWACDQFNB9MFQwQACHgPeQcgA5kKqQibCdwB'
+      'oAgJCYMNlAA1DTQEjwPOAwsAwAKBAnsAJwwxAPcJJgOSB1sJDgb7B0UChQ91DAcC8gab'
+      'ASALag5jChICawYnAcUIzgCNCDUPiwlnCKoJmwdpChwHFQNTAz8BBQuJARkBqQIuDDUC'
+      'cQt1CbgKRADTCTEFNQPFBNQM/g/wDuINPwYqCCMEJwJNAsYLUgF/DLcDRgG3B78POwwn'
+      'DmAL8wF/B40GyQc0CZwI0AZ9CFkHigsZALsMkwldBcMHVQkEARgGgwXkBY0AqgBcDRYE'
+      '6gQSChgCpAuIBOkIbwIZCyIPGgy/BvwOsgEVBWwPdQjwDHMBBQWEBk0I7QPtBiwFFAAA'
+      'BfkAEwesA2cLkA83AXcOtQ/OC3UE1gTSDZsPiwJHDH4PBAkeBjsO3AP+C04MCAPlAwoF'
+      'tgJ2AvUPVgC1BkcIvwTGBQoPrQsNBE8EmQ6bBIUIcQa5Di0G5QD7BhkNUgpoAnMHOACp'
+      'BtMCLQufDWYJsQ6JBn8Fuwb1AI4HwQilAiYIfAphAKMOSwYACcIFbwd4CgwLGQirBBQO'
+      'CQ1hAQsKBgiACgoBlgoyDdsHzgicAHoDUgixBe4NFA8HBNwLLw+kAGUAqwzwAuILoANe'
+      'DmcHDQgtAeoPBQZrBVkKrAfbDZ4Cpw59CeAIaQ0BCoIOKQDLD/IDpgxcAAUPDgffBR4E'
+      'yQBPBvcDdgUuDt8CzQ5kDz8HOgVWD50L4w/UCtMPwgHiAf8GwQzLAlkG/AKSAlAN5A6V'
+      'DwMNIQwhDtEK+QLOCgMOHQ1EB6ME9A0GDloEWAzgDPgGKguLB/0ImA/7C1MATARWCv4J'
+      'CwfcAgYN2AcEBJ0DPAFyCfsPwwskDEICYAqICWwCaQ/qBo0PJA7NBsAHWQ2QAbwL7gDN'
+      'DAkOSwmeBqEJdQYfANwO/wFdBHQPRQ33BHwOmQ1vCLIKWwzsB8sB0ge9DtIOSAUaD+MM'
+      '8wh0DRANoQFBBekChgAgDe4LUAVoBDEGMwjkCVYORwfRAb8NMAe6D4MEfAIQA6YEAAbR'
+      'BCgG6QDkApgLhgf3DSgKNApND1oBWQs5CkQJ1wrtBQsMrwgxC2MFqw31CtYPog9bAh8F'
+      '/gBlBikPQQjFAcgKoQWbBaMNMw60CVgI5QEfCpEM2AYmC24JUg//DD0FfwS4C5UNagkt'
+      'A1ULYQZZD/IHtASrDxgHMQO8ApcBoAuABrMHtwy1DnsFcQSyAuYPogwVCK0FIAG4BPwN'
+      'lAX/AkAK9gWfCncHmQmBDY0DlQJBA4sN0QWxA68Pcgo5B1MNRw+nBYIDPAD8A6gBtwXn'
+      'DuwJcQBoAXAOXQ8tCjkLAgeNDn0BfgutBsAKZwNFC8QMYQwhCcgDbAv2BxAFlwjOAtcD'
+      'ZA0tDdcCVAZRDvoBXAbwCkALiAPsDS0P7gJlB6kECQqUCpoAWgAcBHQFYg8DBtkN3ggn'
+      'AHQCRQirC5kE1ARFDDkOBgO5BqMCoQ5tBysGUAqnBmQJkQkCAYsA6AS9D/EBMglXB0sI'
+      'EgCqA3UOhgQgD7AB7gweC2kGiwioCX8C9QkMBnMMwwTgDSUCfQwTA4cBMwJCAHAKpQWm'
+      'AW8A+g30BX8NiQ0OBWINTw4+CysKewFlAx8JJw+fBbIJjww3CgkMqQ1ZAroCsQdvBBMI'
+      'UA+2C1MLsgRtCMkBRgVyDewAnAbaDkMNegLPBJYLMgrnAk4F4gm9DR8MzAqhBFYMmwvA'
+      'AckCTg35D14K6Aa+B4kHUQAJBwIEhwy4CVUFqgojDS8EcQMPCVMEGApgCJIO8QvdBEkK'
+      'RA4dAlwIHwLiBlMFbwNeCEcKnQ5wBSECpgNrBEsO5AaSC7AJpw1tBFELpAF9DU0OYwOf'
+      'BMcC5gYHB0QF2A6UC+AJqQs3Dp8OpQbsApIKcgXcCIkICgYjAjECiQAwCagDrgEjB5UM'
+      'JQ3BAEoH3goxBKYIygXwBHMDgwvUAdcAEQkYCY0E3AaJDJMEwg23ALoJ4wcOD+8PVwVk'
+      'DjMHOwisChsOoQfpAfML/Qo0BskJ3wRKA7ELTABLCoIBNgjDDkYOKwnuCCMKVQTIBucJ'
+      '6woaCp0MEQQyAWIITQFZDsgOlA69BT4DPQrpCUQPXgyKDu0K1AOfD+oFHArFCu8HfASf'
+      'DH0GcQ9ICfAI6QfOAesLJQr9BY8C0A9XBPYC1Qf4C8oGPwLLCF4BWw7ZC38OqQfKDtwF'
+      'SwyIApYOsgacDRYNvwW+CHoIXQsTBFIJcggWCzQBKQWCDy4AZAgPArUKAgtPAe0OHAMP'
+      'DDYGagzmDLYIywmVA9ILiQXhBEoL9gj4DEwD3gD1DLMIowfACXcNwwnrAZYGeQSHDvUL'
+      '6AsTDaYH/woTC9QA2wo4CLQAwA7GCcUO6AraBCwESA5sA9UOeg0tCY8KeAHxBbMLBgxL'
+      'BZkGTgC9AdYNBgpNCkIMHQ/uAYQB8gm/A68NxA0+BAwOjAW5ADoEAgywALwJZgxOCdUL'
+      '5QdAD8QG+QqPBL0AoQZNC94GpgpSDG4NiwxrAKQJ5ASVBGEHkwg1CzUHkAWTAfsMPQhA'
+      'CQwDggCuCskMvwv5CB0O3w8BD2cFEA8QDvEA4QDxD84N6QPlCFkFNwzQDE8DZg53AFoD'
+      'XwJMB0IEYAQSDOAKOw0ICZMAMwTNA3cPHwOoCNsBtwEjBSUHyA1IDW0MlwzWCCIGggkn'
+      'DbEM+gQ5BsMAIAg7D9oP1gGzDXgGuQjZAIoKPw7bCRMJJgkiAOkMGgm4DRoFpg/MBcMD'
+      '3w6YA/IEKwfgA6wOdQPGDwICzgmFC24B+w4UBXQIcgGjC+gIGAsZDBIHZgs2AbQPgwbs'
+      'AysF/wTIB5sIfAiJC7YHOgxfC34H4wWpABUEEQq6DFwFVAkXBi0McAu3CtIJGwdSAwQL'
+      'GAEiBEwCUQG2AzQD0wzvDj4GWgn6B4QPBgK/AnoAMAAlA80ANA9mCJoHmgFpDhECJgF8'
+      'CWgNgQ7KD+kPagWrB50C9gMtDswOPgelDAQP3gXIAAkBMQ3NCHkDGAgTDmABBQiqDOEL'
+      'XQ4MCLAFEw/bC6MANwDSAp4NsA64DuQAGA1nAmAASgbBBXcKfgX0AMAIJQgdBtsDTQzk'
+      'A3QE0Q2KAn0PCQ8MBJgOhAi1AvQPtAa+BDIIVQ7QAS8HQAWFAO0LZwTjAoUHJwpMD4IE'
+      'DwP/BScGHgD+AXMP9gS7C8wMSgmgCdEOGQ/yCA8NmA2xCusH0Qf9CdsC1wecAykL/Aj6'
+      'C0sEaA+MD8wGWA1xCcILQQKHCcAMWAaRAuMOVQ/iD9IP4QFDB/MNWQTfDAINIA74AgIO'
+      'vwpEC2AMxwNcDzgLjA59C1MG+QHvCocD9QeWCNYDLA2YCYwDQAPQBbcEkwU/Cp4K+wO2'
+      'BesJZwGuDzgHRg+BAywDYAbxB6oPbQn+DH4ElA16BbECoQysBTADlgF/BrYMYgX0CqEP'
+      'HgVYC0MJ7AWuCDIOVwgeCtcGZAZACMcKmgXOBDEKTQW8DcgBcQ2bBkINXQq9B1AAAQTL'
+      'ClUMvwFNDWENPQt6AR4JpAVuAPMFiA2wBxIItQuxBJ4FjgwIDFgCEQB0Dh8P7QwBAecE'
+      '8AFWB98NfAyGAUEAaAanCfQJcgwbBGEP2A0mACwPZAcICpkAogJsB08KYwlECJgERAwF'
+      'A0sAgQHCDioJ6AH8CsgJSQMxAUwBxw68BSIKxwbqCpwM7wSCC9YAFwmUDMAA3QqlCO4P'
+      'Yw46CBoO2waSBLYA4gfGAgYH1w7fCaYNUAt8DWIDCQYwAi8JrQE2DqQGkQrbCBcKkQ7c'
+      'BEMOtwmpCi4EDglvBaUDSg6RC1sI4QZuA0YKKwRrA3kNjgraCrMAxQnnCgUKQQztAfEJ'
+      '8AUFDJgGvAGIBUkL9wzdAA4MaQy1CJQDhg7nC6UHEguyCL8JwgmVBocCsQYVDb0IXQHY'
+      'C6gH2wUtAA4CAQvsDlwLUQkVCygF6QXECnsEfAY8CkMPiQ7TA88P9QL3Cz4CRwnoB+oL'
+      '/AXaCSUJ6Ay3DdkPsg24CIkKqw7FD80JbQGlD8IDlwMqB5IAzAMeA9oBXgJBBBEMOg2B'
+      'CbAMOAYfCCIFxw1sDNUIgQDIDPgI3g80C48F+gw/CeQINgxOA3YAZgUPDuAAzQ2vAGUM'
+      '1As/D64NPQSLBTkEbQ1qAOMEYAf4CrwATAulCkkGdgrzACQI0QKvDuMAZgILBIMI8w+9'
+      'BNoD4wPQDXwPLA49BwMPxwBnDckPaQWcAuALCwgSD6IAMA14AxIOBAhLArUD0gw9Bm8L'
+      '0QlRAxcBMw+ZB2gOJQH5BwUCeQAkA2ULsw/rA/4EEwVxAecIGAyoABAKWwUWBpoIiAs5'
+      'DH0HsAKrBZUBtQxfBqkP/QyTDVYI1gY/CJkF8wodBUIJrQj4AYYDlQgrDUMLxgM3C3wL'
+      'tQVmATcHgAOLA88FkgWdCosPVw3BC4YJ2gKbA/sISgTyDd4MHw4BDlcG4g7hD+ABhAdL'
+      'Dw4DJgZUDi4HhABmBBgPDg2wCtAH/QH1BMsMnwkvAqwBowbaCAUH3glPC2EDpAOQC+AG'
+      'RQqQDkIOqAoNCUsBuwXGBpsMgAEpCfsKSANiDhkOkQThB4ELFgm/AKQIewxAAKYJcQxz'
+      'DuwM5gRVB2sHYgmXBAQDYA8lAGMHmAC8BwAEVAxMDTAKuw1wDUENEQiwBI0MVwI8Cx0J'
+      'bQCHDTUMdQAODswNxwzdD44FPglpAF8HuwCkCmQMPg88BDgExA9sAcEDKQckCbYNsQ2I'
+      'Cq8MHgjGDdQIywPZAUAEOQ0NAusOUAknBbAGvAjXC9oF9AI9AucH+wXDCnsGQg/SA0AM'
+      '8AkEDLsBagONCrIA5grmCxELvgmUBkgL3ABoDJMD3QwADuEO3wFWDYUJmgNJBA0Nzwf0'
+      'BJ4JSg8lBi0HZQTVBpgFHAWsCKoFtAyoD5INZQF/A84FnAqFAyoNxQN7C5gHJAEEAiMD'
+      'tAM8BtAJFgEPChUGhwt8B7IP/QRwARcMggi8BOIDew91CiMIrg5lAgoIoQB3AwMIPAfG'
+      'AMgPmwI8AvoFegbRA+oOJgW7CNkFEAuTBtsAkgPvCboBjArlCl4Howo9DzcEdADLDdwP'
+      'PQkdCNMI2AE4DWsBKAe1DYcKYQkDAyQAlwA/AHAM6wxUB68EVgIcCYYN/wNLDboNQA2P'
+      'C0QKQQ4MCasB2QjdCWADGA7gBxUJowi6BZoMKAlHA1UChQ1KDT8NAgOWAG8MUwffB6II'
+      'mQxGA0MKCwnYCF8DkgaRA7kB5Ar5BdADJQXYBdIINw0nB4YKogo2BMoNPAkUBnsH/AQW'
+      'DCMBIgM7BhUBoAACCMUAmgK7BHoPIghkAs4HnQkkBmQE/w3eAYQJSAR+A5sKKQ16C5cF'
+      'qwizDJENeAuPDWIERgSYAmICFAwTAYQKOgniCtYFRANdAz0NUQc5CdUFXANQB44NRQRh'
+      'AhIBDgEPAU4HEAHUBU8HRAQRAQEImQJ5D2MCegcVDCEDFAGaCnkLqgiQDZwJYwTdAUcE'
+      'oQhFAwoJXgOEDT4NlQBSBzYNhQo1BDsJkAPjCs8D1wU=');
+
+  /// Decode a table packed by build_maps.py
+  static Uint8List _unpackUint8(String data) {
+    return base64.decode(data);
+  }
+
+  /// Decode a table packed by build_maps.py
+  static Uint16List _unpackUint16(String data) {
+    final bytes = ByteData.sublistView(base64.decode(data));
+    final result = Uint16List(bytes.lengthInBytes ~/ 2);
+    for (var i = 0; i < result.length; i++) {
+      result[i] = bytes.getUint16(i * 2, Endian.little);
+    }
+    return result;
+  }
+}
@@ -0,0 +1,300 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash 913a61fcd74b5e6c
+// Content hash 5f9acbf4e124e6d4
+
+// ignore_for_file: public_member_api_docs
+
+import 'common.dart';
+
+class Rm4sccMaps {
+  static const noCode = CommonMaps.noCode;
+
+  /// RM4SCC conversion bits
+  static const rm4scc = <int, int>{
+    0x30: 0xf0, // "0" => TTFF
+    0x31: 0xd8, // "1" => TDAF
+    0x32: 0x78, // "2" => TDFA
+    0x33: 0xd2, // "3" => DTAF
+    0x34: 0x72, // "4" => DTFA
+    0x35: 0x5a, // "5" => DDAA
+    0x36: 0xe4, // "6" => TADF
+    0x37: 0xcc, // "7" => TFTF
+    0x38: 0x6c, // "8" => TFDA
+    0x39: 0xc6, // "9" => DATF
+    0x41: 0x66, // "A" => DADA
+    0x42: 0x4e, // "B" => DFTA
+    0x43: 0xb4, // "C" => TAFD
+    0x44: 0x9c, // "D" => TFAD
+    0x45: 0x3c, // "E" => TFFT
+    0x46: 0x96, // "F" => DAAD
+    0x47: 0x36, // "G" => DAFT
+    0x48: 0x1e, // "H" => DFAT
+    0x49: 0xe1, // "I" => ATDF
+    0x4a: 0xc9, // "J" => ADTF
+    0x4b: 0x69, // "K" => ADDA
+    0x4c: 0xc3, // "L" => FTTF
+    0x4d: 0x63, // "M" => FTDA
+    0x4e: 0x4b, // "N" => FDTA
+    0x4f: 0xb1, // "O" => ATFD
+    0x50: 0x99, // "P" => ADAD
+    0x51: 0x39, // "Q" => ADFT
+    0x52: 0x93, // "R" => FTAD
+    0x53: 0x33, // "S" => FTFT
+    0x54: 0x1b, // "T" => FDAT
+    0x55: 0xa5, // "U" => AADD
+    0x56: 0x8d, // "V" => AFTD
+    0x57: 0x2d, // "W" => AFDT
+    0x58: 0x87, // "X" => FATD
+    0x59: 0x27, // "Y" => FADT
+    0x5a: 0xf, // "Z" => FFTT
+  };
+  /// RM4SCC misc bits
+  static const rm4sccLen = 4;
+  static const rm4sccStart = 0x1; // A
+  static const rm4sccStop = 0x3; // F
+
+  /// RM4SCC conversion bits, indexed by code unit
+  static const rm4sccTable = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xf0, // "0"
+    0xd8, // "1"
+    0x78, // "2"
+    0xd2, // "3"
+    0x72, // "4"
+    0x5a, // "5"
+    0xe4, // "6"
+    0xcc, // "7"
+    0x6c, // "8"
+    0xc6, // "9"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x66, // "A"
+    0x4e, // "B"
+    0xb4, // "C"
+    0x9c, // "D"
+    0x3c, // "E"
+    0x96, // "F"
+    0x36, // "G"
+    0x1e, // "H"
+    0xe1, // "I"
+    0xc9, // "J"
+    0x69, // "K"
+    0xc3, // "L"
+    0x63, // "M"
+    0x4b, // "N"
+    0xb1, // "O"
+    0x99, // "P"
+    0x39, // "Q"
+    0x93, // "R"
+    0x33, // "S"
+    0x1b, // "T"
+    0xa5, // "U"
+    0x8d, // "V"
+    0x2d, // "W"
+    0x87, // "X"
+    0x27, // "Y"
+    0xf, // "Z"
+  ];
+
+  /// RM4SCC checksum values, indexed by code unit
+  static const rm4sccValue = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x0, // "0"
+    0x1, // "1"
+    0x2, // "2"
+    0x3, // "3"
+    0x4, // "4"
+    0x5, // "5"
+    0x6, // "6"
+    0x7, // "7"
+    0x8, // "8"
+    0x9, // "9"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xa, // "A"
+    0xb, // "B"
+    0xc, // "C"
+    0xd, // "D"
+    0xe, // "E"
+    0xf, // "F"
+    0x10, // "G"
+    0x11, // "H"
+    0x12, // "I"
+    0x13, // "J"
+    0x14, // "K"
+    0x15, // "L"
+    0x16, // "M"
+    0x17, // "N"
+    0x18, // "O"
+    0x19, // "P"
+    0x1a, // "Q"
+    0x1b, // "R"
+    0x1c, // "S"
+    0x1d, // "T"
+    0x1e, // "U"
+    0x1f, // "V"
+    0x20, // "W"
+    0x21, // "X"
+    0x22, // "Y"
+    0x23, // "Z"
+  ];
+
+  /// RM4SCC conversion bits, indexed by checksum value
+  static const rm4sccSymbol = <int>[
+    0xf0, // "0"
+    0xd8, // "1"
+    0x78, // "2"
+    0xd2, // "3"
+    0x72, // "4"
+    0x5a, // "5"
+    0xe4, // "6"
+    0xcc, // "7"
+    0x6c, // "8"
+    0xc6, // "9"
+    0x66, // "A"
+    0x4e, // "B"
+    0xb4, // "C"
+    0x9c, // "D"
+    0x3c, // "E"
+    0x96, // "F"
+    0x36, // "G"
+    0x1e, // "H"
+    0xe1, // "I"
+    0xc9, // "J"
+    0x69, // "K"
+    0xc3, // "L"
+    0x63, // "M"
+    0x4b, // "N"
+    0xb1, // "O"
+    0x99, // "P"
+    0x39, // "Q"
+    0x93, // "R"
+    0x33, // "S"
+    0x1b, // "T"
+    0xa5, // "U"
+    0x8d, // "V"
+    0x2d, // "W"
+    0x87, // "X"
+    0x27, // "Y"
+    0xf, // "Z"
+  ];
+}
@@ -0,0 +1,535 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+// Generated by build_maps.py, source hash b186ca8f9c60a5f0
+// Content hash 8f98268ab643bdc4
+
+// ignore_for_file: public_member_api_docs
+
+import 'common.dart';
+
+class TelepenMaps {
+  static const noCode = CommonMaps.noCode;
+
+  /// Telepen conversion bits
+  static const telepen = <int>[
+    0x7777, // '\x00'
+    0x5ddd, // '\x01'
+    0x5dc7, // '\x02'
+    0x7775, // '\x03'
+    0x5dd7, // '\x04'
+    0x771d, // '\x05'
+    0x7711, // '\x06'
+    0x5dd5, // '\x07'
+    0x5c77, // '\x08'
+    0x775d, // '\t'
+    0x7747, // '\n'
+    0x5c75, // '\x0b'
+    0x7757, // '\x0c'
+    0x5c45, // '\r'
+    0x5c51, // '\x0e'
+    0x7755, // '\x0f'
+    0x5d77, // '\x10'
+    0x71dd, // '\x11'
+    0x71c7, // '\x12'
+    0x5d75, // '\x13'
+    0x71d7, // '\x14'
+    0x5d1d, // '\x15'
+    0x5d11, // '\x16'
+    0x71d5, // '\x17'
+    0x7117, // '\x18'
+    0x5d5d, // '\x19'
+    0x5d47, // '\x1a'
+    0x7115, // '\x1b'
+    0x5d57, // '\x1c'
+    0x7145, // '\x1d'
+    0x7151, // '\x1e'
+    0x5d55, // '\x1f'
+    0x4777, // ' '
+    0x75dd, // '!'
+    0x75c7, // '"'
+    0x4775, // '#'
+    0x75d7, // '$'
+    0x471d, // '%'
+    0x4711, // '&'
+    0x75d5, // "'"
+    0x7477, // '('
+    0x475d, // ')'
+    0x4747, // '*'
+    0x7475, // '+'
+    0x4757, // ','
+    0x7445, // '-'
+    0x7451, // '.'
+    0x4755, // '/'
+    0x7577, // '0'
+    0x445d, // '1'
+    0x4447, // '2'
+    0x7575, // '3'
+    0x4457, // '4'
+    0x751d, // '5'
+    0x7511, // '6'
+    0x4455, // '7'
+    0x4517, // '8'
+    0x755d, // '9'
+    0x7547, // ':'
+    0x4515, // ';'
+    0x7557, // '<'
+    0x4545, // '='
+    0x4551, // '>'
+    0x7555, // '?'
+    0x5777, // '@'
+    0x1ddd, // 'A'
+    0x1dc7, // 'B'
+    0x5775, // 'C'
+    0x1dd7, // 'D'
+    0x571d, // 'E'
+    0x5711, // 'F'
+    0x1dd5, // 'G'
+    0x1c77, // 'H'
+    0x575d, // 'I'
+    0x5747, // 'J'
+    0x1c75, // 'K'
+    0x5757, // 'L'
+    0x1c45, // 'M'
+    0x1c51, // 'N'
+    0x5755, // 'O'
+    0x1d77, // 'P'
+    0x51dd, // 'Q'
+    0x51c7, // 'R'
+    0x1d75, // 'S'
+    0x51d7, // 'T'
+    0x1d1d, // 'U'
+    0x1d11, // 'V'
+    0x51d5, // 'W'
+    0x5117, // 'X'
+    0x1d5d, // 'Y'
+    0x1d47, // 'Z'
+    0x5115, // '['
+    0x1d57, // '\\'
+    0x5145, // ']'
+    0x5151, // '^'
+    0x1d55, // '_'
+    0x1177, // '`'
+    0x55dd, // 'a'
+    0x55c7, // 'b'
+    0x1175, // 'c'
+    0x55d7, // 'd'
+    0x111d, // 'e'
+    0x1111, // 'f'
+    0x55d5, // 'g'
+    0x5477, // 'h'
+    0x115d, // 'i'
+    0x1147, // 'j'
+    0x5475, // 'k'
+    0x1157, // 'l'
+    0x5445, // 'm'
+    0x5451, // 'n'
+    0x1155, // 'o'
+    0x5577, // 'p'
+    0x145d, // 'q'
+    0x1447, // 'r'
+    0x5575, // 's'
+    0x1457, // 't'
+    0x551d, // 'u'
+    0x5511, // 'v'
+    0x1455, // 'w'
+    0x1517, // 'x'
+    0x555d, // 'y'
+    0x5547, // 'z'
+    0x1515, // '{'
+    0x5557, // '|'
+    0x1545, // '}'
+    0x1551, // '~'
+    0x5555, // '\x7f'
+  ];
+
+  /// Telepen misc bits
+  static const telepenStart = 0x1d55; // "_"
+  static const telepenEnd = 0x5547; // "z"
+  static const telepenLen = 16;
+
+  /// Telepen bar widths, indexed by code unit
+  static const telepenRuns = <List<int>>[
+    <int>[3, 1, 3, 1, 3, 1, 3, 1], // '\x00'
+    <int>[1, 1, 3, 1, 3, 1, 3, 1, 1, 1], // '\x01'
+    <int>[3, 3, 3, 1, 3, 1, 1, 1], // '\x02'
+    <int>[1, 1, 1, 1, 3, 1, 3, 1, 3, 1], // '\x03'
+    <int>[3, 1, 1, 1, 3, 1, 3, 1, 1, 1], // '\x04'
+    <int>[1, 1, 3, 3, 3, 1, 3, 1], // '\x05'
+    <int>[1, 3, 1, 3, 3, 1, 3, 1], // '\x06'
+    <int>[1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 1], // '\x07'
+    <int>[3, 1, 3, 3, 3, 1, 1, 1], // '\x08'
+    <int>[1, 1, 3, 1, 1, 1, 3, 1, 3, 1], // '\t'
+    <int>[3, 3, 1, 1, 3, 1, 3, 1], // '\n'
+    <int>[1, 1, 1, 1, 3, 3, 3, 1, 1, 1], // '\x0b'
+    <int>[3, 1, 1, 1, 1, 1, 3, 1, 3, 1], // '\x0c'
+    <int>[1, 1, 1, 3, 1, 3, 3, 1, 1, 1], // '\r'
+    <int>[1, 3, 1, 1, 1, 3, 3, 1, 1, 1], // '\x0e'
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1], // '\x0f'
+    <int>[3, 1, 3, 1, 1, 1, 3, 1, 1, 1], // '\x10'
+    <int>[1, 1, 3, 1, 3, 3, 3, 1], // '\x11'
+    <int>[3, 3, 3, 3, 3, 1], // '\x12'
+    <int>[1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 1, 1], // '\x13'
+    <int>[3, 1, 1, 1, 3, 3, 3, 1], // '\x14'
+    <int>[1, 1, 3, 3, 1, 1, 3, 1, 1, 1], // '\x15'
+    <int>[1, 3, 1, 3, 1, 1, 3, 1, 1, 1], // '\x16'
+    <int>[1, 1, 1, 1, 1, 1, 3, 3, 3, 1], // '\x17'
+    <int>[3, 1, 1, 3, 1, 3, 3, 1], // '\x18'
+    <int>[1, 1, 3, 1, 1, 1, 1, 1, 3, 1, 1, 1], // '\x19'
+    <int>[3, 3, 1, 1, 1, 1, 3, 1, 1, 1], // '\x1a'
+    <int>[1, 1, 1, 1, 1, 3, 1, 3, 3, 1], // '\x1b'
+    <int>[3, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1], // '\x1c'
+    <int>[1, 1, 1, 3, 1, 1, 1, 3, 3, 1], // '\x1d'
+    <int>[1, 3, 1, 1, 1, 1, 1, 3, 3, 1], // '\x1e'
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1], // '\x1f'
+    <int>[3, 1, 3, 1, 3, 3, 1, 1], // ' '
+    <int>[1, 1, 3, 1, 3, 1, 1, 1, 3, 1], // '!'
+    <int>[3, 3, 3, 1, 1, 1, 3, 1], // '"'
+    <int>[1, 1, 1, 1, 3, 1, 3, 3, 1, 1], // '#'
+    <int>[3, 1, 1, 1, 3, 1, 1, 1, 3, 1], // '$'
+    <int>[1, 1, 3, 3, 3, 3, 1, 1], // '%'
+    <int>[1, 3, 1, 3, 3, 3, 1, 1], // '&'
+    <int>[1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1], // "'"
+    <int>[3, 1, 3, 3, 1, 1, 3, 1], // '('
+    <int>[1, 1, 3, 1, 1, 1, 3, 3, 1, 1], // ')'
+    <int>[3, 3, 1, 1, 3, 3, 1, 1], // '*'
+    <int>[1, 1, 1, 1, 3, 3, 1, 1, 3, 1], // '+'
+    <int>[3, 1, 1, 1, 1, 1, 3, 3, 1, 1], // ','
+    <int>[1, 1, 1, 3, 1, 3, 1, 1, 3, 1], // '-'
+    <int>[1, 3, 1, 1, 1, 3, 1, 1, 3, 1], // '.'
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 3, 3, 1, 1], // '/'
+    <int>[3, 1, 3, 1, 1, 1, 1, 1, 3, 1], // '0'
+    <int>[1, 1, 3, 1, 1, 3, 1, 3, 1, 1], // '1'
+    <int>[3, 3, 1, 3, 1, 3, 1, 1], // '2'
+    <int>[1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 3, 1], // '3'
+    <int>[3, 1, 1, 1, 1, 3, 1, 3, 1, 1], // '4'
+    <int>[1, 1, 3, 3, 1, 1, 1, 1, 3, 1], // '5'
+    <int>[1, 3, 1, 3, 1, 1, 1, 1, 3, 1], // '6'
+    <int>[1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1], // '7'
+    <int>[3, 1, 1, 3, 1, 1, 1, 3, 1, 1], // '8'
+    <int>[1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 3, 1], // '9'
+    <int>[3, 3, 1, 1, 1, 1, 1, 1, 3, 1], // ':'
+    <int>[1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 1], // ';'
+    <int>[3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1], // '<'
+    <int>[1, 1, 1, 3, 1, 1, 1, 1, 1, 3, 1, 1], // '='
+    <int>[1, 3, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1], // '>'
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1], // '?'
+    <int>[3, 1, 3, 1, 3, 1, 1, 1, 1, 1], // '@'
+    <int>[1, 1, 3, 1, 3, 1, 3, 3], // 'A'
+    <int>[3, 3, 3, 1, 3, 3], // 'B'
+    <int>[1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1], // 'C'
+    <int>[3, 1, 1, 1, 3, 1, 3, 3], // 'D'
+    <int>[1, 1, 3, 3, 3, 1, 1, 1, 1, 1], // 'E'
+    <int>[1, 3, 1, 3, 3, 1, 1, 1, 1, 1], // 'F'
+    <int>[1, 1, 1, 1, 1, 1, 3, 1, 3, 3], // 'G'
+    <int>[3, 1, 3, 3, 3, 3], // 'H'
+    <int>[1, 1, 3, 1, 1, 1, 3, 1, 1, 1, 1, 1], // 'I'
+    <int>[3, 3, 1, 1, 3, 1, 1, 1, 1, 1], // 'J'
+    <int>[1, 1, 1, 1, 3, 3, 3, 3], // 'K'
+    <int>[3, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1], // 'L'
+    <int>[1, 1, 1, 3, 1, 3, 3, 3], // 'M'
+    <int>[1, 3, 1, 1, 1, 3, 3, 3], // 'N'
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1], // 'O'
+    <int>[3, 1, 3, 1, 1, 1, 3, 3], // 'P'
+    <int>[1, 1, 3, 1, 3, 3, 1, 1, 1, 1], // 'Q'
+    <int>[3, 3, 3, 3, 1, 1, 1, 1], // 'R'
+    <int>[1, 1, 1, 1, 3, 1, 1, 1, 3, 3], // 'S'
+    <int>[3, 1, 1, 1, 3, 3, 1, 1, 1, 1], // 'T'
+    <int>[1, 1, 3, 3, 1, 1, 3, 3], // 'U'
+    <int>[1, 3, 1, 3, 1, 1, 3, 3], // 'V'
+    <int>[1, 1, 1, 1, 1, 1, 3, 3, 1, 1, 1, 1], // 'W'
+    <int>[3, 1, 1, 3, 1, 3, 1, 1, 1, 1], // 'X'
+    <int>[1, 1, 3, 1, 1, 1, 1, 1, 3, 3], // 'Y'
+    <int>[3, 3, 1, 1, 1, 1, 3, 3], // 'Z'
+    <int>[1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1], // '['
+    <int>[3, 1, 1, 1, 1, 1, 1, 1, 3, 3], // '\\'
+    <int>[1, 1, 1, 3, 1, 1, 1, 3, 1, 1, 1, 1], // ']'
+    <int>[1, 3, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1], // '^'
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 3], // '_'
+    <int>[3, 1, 3, 1, 1, 3, 1, 3], // '`'
+    <int>[1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1], // 'a'
+    <int>[3, 3, 3, 1, 1, 1, 1, 1, 1, 1], // 'b'
+    <int>[1, 1, 1, 1, 3, 1, 1, 3, 1, 3], // 'c'
+    <int>[3, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1], // 'd'
+    <int>[1, 1, 3, 3, 1, 3, 1, 3], // 'e'
+    <int>[1, 3, 1, 3, 1, 3, 1, 3], // 'f'
+    <int>[1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1], // 'g'
+    <int>[3, 1, 3, 3, 1, 1, 1, 1, 1, 1], // 'h'
+    <int>[1, 1, 3, 1, 1, 1, 1, 3, 1, 3], // 'i'
+    <int>[3, 3, 1, 1, 1, 3, 1, 3], // 'j'
+    <int>[1, 1, 1, 1, 3, 3, 1, 1, 1, 1, 1, 1], // 'k'
+    <int>[3, 1, 1, 1, 1, 1, 1, 3, 1, 3], // 'l'
+    <int>[1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1], // 'm'
+    <int>[1, 3, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1], // 'n'
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3], // 'o'
+    <int>[3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1], // 'p'
+    <int>[1, 1, 3, 1, 1, 3, 1, 1, 1, 3], // 'q'
+    <int>[3, 3, 1, 3, 1, 1, 1, 3], // 'r'
+    <int>[1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1], // 's'
+    <int>[3, 1, 1, 1, 1, 3, 1, 1, 1, 3], // 't'
+    <int>[1, 1, 3, 3, 1, 1, 1, 1, 1, 1, 1, 1], // 'u'
+    <int>[1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1], // 'v'
+    <int>[1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 3], // 'w'
+    <int>[3, 1, 1, 3, 1, 1, 1, 1, 1, 3], // 'x'
+    <int>[1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], // 'y'
+    <int>[3, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], // 'z'
+    <int>[1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 3], // '{'
+    <int>[3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], // '|'
+    <int>[1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 3], // '}'
+    <int>[1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3], // '~'
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], // '\x7f'
+  ];
+
+  /// Telepen misc bar widths
+  static const telepenStartRuns = <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 3];
+  static const telepenEndRuns = <int>[3, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1];
+
+  /// Telepen character switching between the ASCII and numeric modes
+  static const telepenSwitch = 0x10; // DLE
+
+  /// Telepen shortest runs of digits switched to the numeric mode, at
+  /// the end and in the middle of the data
+  static const telepenNumericEnd = 4;
+  static const telepenNumericMiddle = 6;
+
+  /// Telepen numeric values of the digits and "X", indexed by code
+  /// unit
+  static const telepenDigit = <int>[
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0x0, // "0"
+    0x1, // "1"
+    0x2, // "2"
+    0x3, // "3"
+    0x4, // "4"
+    0x5, // "5"
+    0x6, // "6"
+    0x7, // "7"
+    0x8, // "8"
+    0x9, // "9"
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    noCode,
+    0xa, // "X"
+  ];
+
+  /// Telepen numeric checksum values of the pairs, indexed by
+  /// first digit * 11 + second digit
+  static const telepenPairValue = <int>[
+    0x1b, 0x1c, 0x1d, 0x1e, 0x1f, 0x20, 0x21, 0x22, // 0
+    0x23, 0x24, 0x11, 0x25, 0x26, 0x27, 0x28, 0x29, // 8
+    0x2a, 0x2b, 0x2c, 0x2d, 0x2e, 0x12, 0x2f, 0x30, // 16
+    0x31, 0x32, 0x33, 0x34, 0x35, 0x36, 0x37, 0x38, // 24
+    0x13, 0x39, 0x3a, 0x3b, 0x3c, 0x3d, 0x3e, 0x3f, // 32
+    0x40, 0x41, 0x42, 0x14, 0x43, 0x44, 0x45, 0x46, // 40
+    0x47, 0x48, 0x49, 0x4a, 0x4b, 0x4c, 0x15, 0x4d, // 48
+    0x4e, 0x4f, 0x50, 0x51, 0x52, 0x53, 0x54, 0x55, // 56
+    0x56, 0x16, 0x57, 0x58, 0x59, 0x5a, 0x5b, 0x5c, // 64
+    0x5d, 0x5e, 0x5f, 0x60, 0x17, 0x61, 0x62, 0x63, // 72
+    0x64, 0x65, 0x66, 0x67, 0x68, 0x69, 0x6a, 0x18, // 80
+    0x6b, 0x6c, 0x6d, 0x6e, 0x6f, 0x70, 0x71, 0x72, // 88
+    0x73, 0x74, 0x19, 0x75, 0x76, 0x77, 0x78, 0x79, // 96
+    0x7a, 0x7b, 0x7c, 0x7d, 0x7e, 0x1a, // 104
+  ];
+
+  /// Telepen numeric bar widths of the pairs, indexed by first digit
+  /// * 11 + second digit
+  static const telepenPairRuns = <List<int>>[
+    <int>[1, 1, 1, 1, 1, 3, 1, 3, 3, 1], // "00"
+    <int>[3, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1], // "01"
+    <int>[1, 1, 1, 3, 1, 1, 1, 3, 3, 1], // "02"
+    <int>[1, 3, 1, 1, 1, 1, 1, 3, 3, 1], // "03"
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1], // "04"
+    <int>[3, 1, 3, 1, 3, 3, 1, 1], // "05"
+    <int>[1, 1, 3, 1, 3, 1, 1, 1, 3, 1], // "06"
+    <int>[3, 3, 3, 1, 1, 1, 3, 1], // "07"
+    <int>[1, 1, 1, 1, 3, 1, 3, 3, 1, 1], // "08"
+    <int>[3, 1, 1, 1, 3, 1, 1, 1, 3, 1], // "09"
+    <int>[1, 1, 3, 1, 3, 3, 3, 1], // "0X"
+    <int>[1, 1, 3, 3, 3, 3, 1, 1], // "10"
+    <int>[1, 3, 1, 3, 3, 3, 1, 1], // "11"
+    <int>[1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1], // "12"
+    <int>[3, 1, 3, 3, 1, 1, 3, 1], // "13"
+    <int>[1, 1, 3, 1, 1, 1, 3, 3, 1, 1], // "14"
+    <int>[3, 3, 1, 1, 3, 3, 1, 1], // "15"
+    <int>[1, 1, 1, 1, 3, 3, 1, 1, 3, 1], // "16"
+    <int>[3, 1, 1, 1, 1, 1, 3, 3, 1, 1], // "17"
+    <int>[1, 1, 1, 3, 1, 3, 1, 1, 3, 1], // "18"
+    <int>[1, 3, 1, 1, 1, 3, 1, 1, 3, 1], // "19"
+    <int>[3, 3, 3, 3, 3, 1], // "1X"
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 3, 3, 1, 1], // "20"
+    <int>[3, 1, 3, 1, 1, 1, 1, 1, 3, 1], // "21"
+    <int>[1, 1, 3, 1, 1, 3, 1, 3, 1, 1], // "22"
+    <int>[3, 3, 1, 3, 1, 3, 1, 1], // "23"
+    <int>[1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 3, 1], // "24"
+    <int>[3, 1, 1, 1, 1, 3, 1, 3, 1, 1], // "25"
+    <int>[1, 1, 3, 3, 1, 1, 1, 1, 3, 1], // "26"
+    <int>[1, 3, 1, 3, 1, 1, 1, 1, 3, 1], // "27"
+    <int>[1, 1, 1, 1, 1, 1, 1, 3, 1, 3, 1, 1], // "28"
+    <int>[3, 1, 1, 3, 1, 1, 1, 3, 1, 1], // "29"
+    <int>[1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 1, 1], // "2X"
+    <int>[1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 3, 1], // "30"
+    <int>[3, 3, 1, 1, 1, 1, 1, 1, 3, 1], // "31"
+    <int>[1, 1, 1, 1, 1, 3, 1, 1, 1, 3, 1, 1], // "32"
+    <int>[3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1], // "33"
+    <int>[1, 1, 1, 3, 1, 1, 1, 1, 1, 3, 1, 1], // "34"
+    <int>[1, 3, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1], // "35"
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1], // "36"
+    <int>[3, 1, 3, 1, 3, 1, 1, 1, 1, 1], // "37"
+    <int>[1, 1, 3, 1, 3, 1, 3, 3], // "38"
+    <int>[3, 3, 3, 1, 3, 3], // "39"
+    <int>[3, 1, 1, 1, 3, 3, 3, 1], // "3X"
+    <int>[1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1], // "40"
+    <int>[3, 1, 1, 1, 3, 1, 3, 3], // "41"
+    <int>[1, 1, 3, 3, 3, 1, 1, 1, 1, 1], // "42"
+    <int>[1, 3, 1, 3, 3, 1, 1, 1, 1, 1], // "43"
+    <int>[1, 1, 1, 1, 1, 1, 3, 1, 3, 3], // "44"
+    <int>[3, 1, 3, 3, 3, 3], // "45"
+    <int>[1, 1, 3, 1, 1, 1, 3, 1, 1, 1, 1, 1], // "46"
+    <int>[3, 3, 1, 1, 3, 1, 1, 1, 1, 1], // "47"
+    <int>[1, 1, 1, 1, 3, 3, 3, 3], // "48"
+    <int>[3, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1], // "49"
+    <int>[1, 1, 3, 3, 1, 1, 3, 1, 1, 1], // "4X"
+    <int>[1, 1, 1, 3, 1, 3, 3, 3], // "50"
+    <int>[1, 3, 1, 1, 1, 3, 3, 3], // "51"
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1], // "52"
+    <int>[3, 1, 3, 1, 1, 1, 3, 3], // "53"
+    <int>[1, 1, 3, 1, 3, 3, 1, 1, 1, 1], // "54"
+    <int>[3, 3, 3, 3, 1, 1, 1, 1], // "55"
+    <int>[1, 1, 1, 1, 3, 1, 1, 1, 3, 3], // "56"
+    <int>[3, 1, 1, 1, 3, 3, 1, 1, 1, 1], // "57"
+    <int>[1, 1, 3, 3, 1, 1, 3, 3], // "58"
+    <int>[1, 3, 1, 3, 1, 1, 3, 3], // "59"
+    <int>[1, 3, 1, 3, 1, 1, 3, 1, 1, 1], // "5X"
+    <int>[1, 1, 1, 1, 1, 1, 3, 3, 1, 1, 1, 1], // "60"
+    <int>[3, 1, 1, 3, 1, 3, 1, 1, 1, 1], // "61"
+    <int>[1, 1, 3, 1, 1, 1, 1, 1, 3, 3], // "62"
+    <int>[3, 3, 1, 1, 1, 1, 3, 3], // "63"
+    <int>[1, 1, 1, 1, 1, 3, 1, 3, 1, 1, 1, 1], // "64"
+    <int>[3, 1, 1, 1, 1, 1, 1, 1, 3, 3], // "65"
+    <int>[1, 1, 1, 3, 1, 1, 1, 3, 1, 1, 1, 1], // "66"
+    <int>[1, 3, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1], // "67"
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 3], // "68"
+    <int>[3, 1, 3, 1, 1, 3, 1, 3], // "69"
+    <int>[1, 1, 1, 1, 1, 1, 3, 3, 3, 1], // "6X"
+    <int>[1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1], // "70"
+    <int>[3, 3, 3, 1, 1, 1, 1, 1, 1, 1], // "71"
+    <int>[1, 1, 1, 1, 3, 1, 1, 3, 1, 3], // "72"
+    <int>[3, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1], // "73"
+    <int>[1, 1, 3, 3, 1, 3, 1, 3], // "74"
+    <int>[1, 3, 1, 3, 1, 3, 1, 3], // "75"
+    <int>[1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1], // "76"
+    <int>[3, 1, 3, 3, 1, 1, 1, 1, 1, 1], // "77"
+    <int>[1, 1, 3, 1, 1, 1, 1, 3, 1, 3], // "78"
+    <int>[3, 3, 1, 1, 1, 3, 1, 3], // "79"
+    <int>[3, 1, 1, 3, 1, 3, 3, 1], // "7X"
+    <int>[1, 1, 1, 1, 3, 3, 1, 1, 1, 1, 1, 1], // "80"
+    <int>[3, 1, 1, 1, 1, 1, 1, 3, 1, 3], // "81"
+    <int>[1, 1, 1, 3, 1, 3, 1, 1, 1, 1, 1, 1], // "82"
+    <int>[1, 3, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1], // "83"
+    <int>[1, 1, 1, 1, 1, 1, 1, 1, 1, 3, 1, 3], // "84"
+    <int>[3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1], // "85"
+    <int>[1, 1, 3, 1, 1, 3, 1, 1, 1, 3], // "86"
+    <int>[3, 3, 1, 3, 1, 1, 1, 3], // "87"
+    <int>[1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1], // "88"
+    <int>[3, 1, 1, 1, 1, 3, 1, 1, 1, 3], // "89"
+    <int>[1, 1, 3, 1, 1, 1, 1, 1, 3, 1, 1, 1], // "8X"
+    <int>[1, 1, 3, 3, 1, 1, 1, 1, 1, 1, 1, 1], // "90"
+    <int>[1, 3, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1], // "91"
+    <int>[1, 1, 1, 1, 1, 1, 1, 3, 1, 1, 1, 3], // "92"
+    <int>[3, 1, 1, 3, 1, 1, 1, 1, 1, 3], // "93"
+    <int>[1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], // "94"
+    <int>[3, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], // "95"
+    <int>[1, 1, 1, 1, 1, 3, 1, 1, 1, 1, 1, 3], // "96"
+    <int>[3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1, 1], // "97"
+    <int>[1, 1, 1, 3, 1, 1, 1, 1, 1, 1, 1, 3], // "98"
+    <int>[1, 3, 1, 1, 1, 1, 1, 1, 1, 1, 1, 3], // "99"
+    <int>[3, 3, 1, 1, 1, 1, 3, 1, 1, 1], // "9X"
+  ];
+}
@@ -19,6 +19,7 @@ import 'dart:typed_data';
 
 import 'barcode_2d.dart';
 import 'barcode_exception.dart';
+import 'maps/pdf417.dart';
 import 'pdf417_codewords.dart';
 
 /// Error correction levels
@@ -74,6 +75,10 @@ class BarcodePDF417 extends Barcode2D {
   /// Error recovery level
   final Pdf417SecurityLevel securityLevel;
 
+  @override
+  List<Object?> get cacheKey =>
+      [...super.cacheKey, securityLevel, moduleHeight, preferredRatio];
+
   @override
   Barcode2DMatrix convert(Uint8List data) {
     final dataWords = _highlevelEncode(data);
@@ -90,42 +95,41 @@ class BarcodePDF417 extends Barcode2D {
     final codeWords =
         _encodeData(dataWords.toList(), dim.columns, securityLevel);
 
-    final grid = <List<int>>[];
-    for (var i = 0; i < codeWords.length; i += dim.columns) {
-      grid.add(codeWords.sublist(i, min(i + dim.columns, codeWords.length)));
-    }
+    // Values of the row indicators, see Pdf417Maps.pdf417LeftIndicator
+    final indicators = <int>[
+      (dim.rows - 3) ~/ 3,
+      (dim.rows - 1) ~/ 3,
+      securityLevel.index * 3 + (dim.rows - 1) % 3,
+      dim.columns - 1,
+    ];
 
-    final codes = <List<int>>[];
+    final width = (dim.columns + 4) * 17 + 1;
+    final rows = (codeWords.length + dim.columns - 1) ~/ dim.columns;
+    final pixels = List<bool>.filled(width * rows, false);
 
-    var rowNum = 0;
-    for (final row in grid) {
-      final table = rowNum % 3;
-      final rowCodes = <int>[];
+    for (var row = 0; row < rows; row++) {
+      final cluster = row % 3;
+      final base = 30 * (row ~/ 3);
 
-      rowCodes.add(start_word);
-      rowCodes.add(_getCodeword(table,
-          _getLeftCodeWord(rowNum, dim.rows, dim.columns, securityLevel)));
+      var offset = _drawRuns(pixels, row * width, Pdf417Maps.pdf417StartRuns);
+      offset = _drawCodeword(pixels, offset, cluster,
+          base + indicators[Pdf417Maps.pdf417LeftIndicator[cluster]]);
 
-      for (final word in row) {
-        rowCodes.add(_getCodeword(table, word));
+      final end = min((row + 1) * dim.columns, codeWords.length);
+      for (var i = row * dim.columns; i < end; i++) {
+        offset = _drawCodeword(pixels, offset, cluster, codeWords[i]);
       }
 
-      rowCodes.add(_getCodeword(table,
-          _getRightCodeWord(rowNum, dim.rows, dim.columns, securityLevel)));
-      rowCodes.add(stop_word);
-
-      codes.add(rowCodes);
-
-      rowNum++;
+      offset = _drawCodeword(pixels, offset, cluster,
+          base + indicators[Pdf417Maps.pdf417RightIndicator[cluster]]);
+      _drawRuns(pixels, offset, Pdf417Maps.pdf417StopRuns);
     }
 
-    final width = (dim.columns + 4) * 17 + 1;
-
     return Barcode2DMatrix(
       width,
       dim.rows,
       moduleHeight,
-      _renderBarcode(codes),
+      pixels,
     );
   }
 
@@ -156,50 +160,6 @@ class BarcodePDF417 extends Barcode2D {
     return dataWords;
   }
 
-  int _getLeftCodeWord(
-      int rowNum, int rows, int columns, Pdf417SecurityLevel securityLevel) {
-    final tableId = rowNum % 3;
-
-    late int x;
-
-    switch (tableId) {
-      case 0:
-        x = (rows - 3) ~/ 3;
-        break;
-      case 1:
-        x = securityLevel.index * 3;
-        x += (rows - 1) % 3;
-        break;
-      case 2:
-        x = columns - 1;
-        break;
-    }
-
-    return 30 * (rowNum ~/ 3) + x;
-  }
-
-  int _getRightCodeWord(
-      int rowNum, int rows, int columns, Pdf417SecurityLevel securityLevel) {
-    final tableId = rowNum % 3;
-
-    late int x;
-
-    switch (tableId) {
-      case 0:
-        x = columns - 1;
-        break;
-      case 1:
-        x = (rows - 1) ~/ 3;
-        break;
-      case 2:
-        x = securityLevel.index * 3;
-        x += (rows - 1) % 3;
-        break;
-    }
-
-    return 30 * (rowNum ~/ 3) + x;
-  }
-
   Iterable<int> _getPadding(int dataCount, int ecCount, int columns) sync* {
     final totalCount = dataCount + ecCount + 1;
     final mod = totalCount % columns;
@@ -210,25 +170,27 @@ class BarcodePDF417 extends Barcode2D {
     }
   }
 
-  Iterable<bool> _addBits(int b, int count) sync* {
-    for (var i = count - 1; i >= 0; i--) {
-      yield ((b >> i) & 1) == 1;
+  /// Draw the bars of a codeword from its three-bit widths, returns the
+  /// position of the next codeword
+  int _drawCodeword(List<bool> pixels, int offset, int cluster, int value) {
+    var runs = Pdf417Maps.pdf417Runs[cluster * 929 + value];
+    while (runs != 0) {
+      final bar = runs & 7;
+      pixels.fillRange(offset, offset + bar, true);
+      offset += bar + ((runs >> 3) & 7);
+      runs >>= 6;
     }
+    return offset;
   }
 
-  Iterable<bool> _renderBarcode(List<List<int>> codes) sync* {
-    for (final row in codes) {
-      final lastIdx = row.length - 1;
-      var i = 0;
-      for (final col in row) {
-        if (i == lastIdx) {
-          yield* _addBits(col, 18);
-        } else {
-          yield* _addBits(col, 17);
-        }
-        i++;
-      }
+  /// Draw the bars of a start or stop pattern, returns the position of the
+  /// next codeword
+  int _drawRuns(List<bool> pixels, int offset, List<int> runs) {
+    for (var i = 0; i < runs.length; i += 2) {
+      pixels.fillRange(offset, offset + runs[i], true);
+      offset += runs[i] + runs[i + 1];
     }
+    return offset;
   }
 
   int _calculateNumberOfRows(int m, int k, int c) {
@@ -321,10 +283,6 @@ class BarcodePDF417 extends Barcode2D {
     return ecWords;
   }
 
-  int _getCodeword(int tableId, int word) {
-    return codewords[tableId][word];
-  }
-
   int _determineConsecutiveDigitCount(Iterable<int> data) {
     var cnt = 0;
     for (final r in data) {
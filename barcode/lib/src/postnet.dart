@@ -14,9 +14,8 @@
  * limitations under the License.
  */
 
-import '../barcode.dart';
 import 'barcode_hm.dart';
-import 'barcode_maps.dart';
+import 'maps/postnet.dart';
 
 /// POSTNET Barcode
 ///
@@ -27,33 +26,30 @@ class BarcodePostnet extends BarcodeHM {
   const BarcodePostnet() : super(tracker: 0);
 
   @override
-  Iterable<int> get charSet => [45, ...BarcodeMaps.postnet.keys];
+  Iterable<int> get charSet =>
+      [45, ...tableCharSet(PostnetMaps.postnetTable)];
 
   @override
   String get name => 'POSTNET';
 
   @override
   Iterable<BarcodeHMBar> convertHM(String data) sync* {
-    yield fromBits(BarcodeMaps.postnetStartStop);
+    yield fromBits(PostnetMaps.postnetStartStop);
 
     var sum = 0;
     for (final codeUnit in data.codeUnits) {
       if (codeUnit == 45) {
         continue;
       }
-      final code = BarcodeMaps.postnet[codeUnit];
-      if (code == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(codeUnit)}" to $name');
-      }
-      yield* addHW(code, BarcodeMaps.postnetLen);
+      final code = lookup(PostnetMaps.postnetTable, codeUnit);
+      yield* addHW(code, PostnetMaps.postnetLen);
 
       sum += codeUnit - 0x30;
     }
 
     final crc = (10 - (sum % 10)) % 10;
-    yield* addHW(BarcodeMaps.postnet[crc + 0x30]!, BarcodeMaps.postnetLen);
+    yield* addHW(PostnetMaps.postnetTable[crc + 0x30], PostnetMaps.postnetLen);
 
-    yield fromBits(BarcodeMaps.postnetStartStop);
+    yield fromBits(PostnetMaps.postnetStartStop);
   }
 }
@@ -53,6 +53,10 @@ class BarcodeQR extends Barcode2D {
   /// The QR Code Correction Level
   final BarcodeQRCorrectionLevel errorCorrectLevel;
 
+  @override
+  List<Object?> get cacheKey =>
+      [...super.cacheKey, typeNumber, errorCorrectLevel];
+
   @override
   Barcode2DMatrix convert(Uint8List data) {
     final errorLevel = QrErrorCorrectLevel.levels[errorCorrectLevel.index];
@@ -17,18 +17,26 @@
 // ignore_for_file: public_member_api_docs
 
 import 'barcode_exception.dart';
+import 'maps/reedsolomon.dart';
 
 class ReedSolomonEncoder {
-  ReedSolomonEncoder(this.gf) {
-    polynomes = <GFPoly>[
-      GFPoly(gf, <int>[1])
-    ];
-  }
+  ReedSolomonEncoder(this.gf);
 
-  GaloisField gf;
-  late List<GFPoly> polynomes;
+  final GaloisField gf;
+
+  // Generator polynomials computed at runtime, shared by all the encoders
+  // using the same Galois field
+  static final _polynomes = <GaloisField, List<GFPoly>>{};
 
   GFPoly getPolynomial(int degree) {
+    final generator = gf.generators[degree];
+    if (generator != null) {
+      return GFPoly(gf, generator);
+    }
+
+    final polynomes =
+        _polynomes.putIfAbsent(gf, () => <GFPoly>[GFPoly(gf, <int>[1])]);
+
     if (degree >= polynomes.length) {
       var last = polynomes[polynomes.length - 1];
       for (var d = polynomes.length; d <= degree; d++) {
@@ -41,24 +49,44 @@ class ReedSolomonEncoder {
     return polynomes[degree];
   }
 
+  // Computes the remainder of the division of data by the generator
+  // polynomial, using a shift register
   List<int> encode(List<int> data, int eccCount) {
-    final generator = getPolynomial(eccCount);
-    var info = GFPoly(gf, data);
-    info = info.multByMonominal(eccCount, 1);
-    final remainder = info.divide(generator)[1];
-
     final result = List<int>.filled(eccCount, 0);
-    final numZero = eccCount - remainder.coefficients.length;
-    result.setAll(numZero, remainder.coefficients);
+    if (eccCount == 0) {
+      return result;
+    }
+
+    final generator = getPolynomial(eccCount).coefficients;
+    final aLogTbl = gf.aLogTbl;
+    final logTbl = gf.logTbl;
+    final order = gf.size - 1;
+
+    for (final value in data) {
+      final factor = value ^ result[0];
+      result.setRange(0, eccCount - 1, result, 1);
+      result[eccCount - 1] = 0;
+
+      if (factor != 0) {
+        final logFactor = logTbl[factor];
+        for (var i = 0; i < eccCount; i++) {
+          final coefficient = generator[i + 1];
+          if (coefficient != 0) {
+            result[i] ^= aLogTbl[(logTbl[coefficient] + logFactor) % order];
+          }
+        }
+      }
+    }
+
     return result;
   }
 }
 
 class GaloisField {
   // Creates a new galois field
-  GaloisField(int pp, this.size, this.base) {
-    aLogTbl = List<int>.filled(size, 0);
-    logTbl = List<int>.filled(size, 0);
+  factory GaloisField(int pp, int size, int base) {
+    final aLogTbl = List<int>.filled(size, 0);
+    final logTbl = List<int>.filled(size, 0);
 
     var x = 1;
     for (var i = 0; i < size; i++) {
@@ -72,12 +100,42 @@ class GaloisField {
     for (var i = 0; i < size; i++) {
       logTbl[aLogTbl[i]] = i;
     }
+
+    return GaloisField.tables(size, base, aLogTbl, logTbl);
   }
 
-  int size;
-  int base;
-  late List<int> aLogTbl;
-  late List<int> logTbl;
+  // Creates a galois field from precomputed tables
+  const GaloisField.tables(
+    this.size,
+    this.base,
+    this.aLogTbl,
+    this.logTbl, [
+    this.generators = const <int, List<int>>{},
+  ]);
+
+  // Galois fields precomputed by build_maps.py
+  static final gf16 = GaloisField.tables(16, 1, ReedSolomonMaps.gf16ALog,
+      ReedSolomonMaps.gf16Log, ReedSolomonMaps.gf16Generators);
+
+  static final gf64 = GaloisField.tables(
+      64, 1, ReedSolomonMaps.gf64ALog, ReedSolomonMaps.gf64Log);
+
+  static final gf256 = GaloisField.tables(256, 1, ReedSolomonMaps.gf256ALog,
+      ReedSolomonMaps.gf256Log, ReedSolomonMaps.gf256Generators);
+
+  static final gf1024 = GaloisField.tables(
+      1024, 1, ReedSolomonMaps.gf1024ALog, ReedSolomonMaps.gf1024Log);
+
+  static final gf4096 = GaloisField.tables(
+      4096, 1, ReedSolomonMaps.gf4096ALog, ReedSolomonMaps.gf4096Log);
+
+  final int size;
+  final int base;
+  final List<int> aLogTbl;
+  final List<int> logTbl;
+
+  // Precomputed generator polynomials, indexed by degree
+  final Map<int, List<int>> generators;
 
   GFPoly zero() {
     return GFPoly(this, <int>[0]);
@@ -14,9 +14,8 @@
  * limitations under the License.
  */
 
-import '../barcode.dart';
 import 'barcode_hm.dart';
-import 'barcode_maps.dart';
+import 'maps/rm4scc.dart';
 
 /// RM4SCC Barcode
 ///
@@ -28,35 +27,30 @@ class BarcodeRm4scc extends BarcodeHM {
   const BarcodeRm4scc();
 
   @override
-  Iterable<int> get charSet => BarcodeMaps.rm4scc.keys;
+  Iterable<int> get charSet => tableCharSet(Rm4sccMaps.rm4sccTable);
 
   @override
   String get name => 'RM4SCC';
 
   @override
   Iterable<BarcodeHMBar> convertHM(String data) sync* {
-    yield fromBits(BarcodeMaps.rm4sccStart);
+    yield fromBits(Rm4sccMaps.rm4sccStart);
 
     var sumTop = 0;
     var sumBottom = 0;
-    final keys = BarcodeMaps.rm4scc.keys.toList();
 
     for (final codeUnit in data.codeUnits) {
-      final code = BarcodeMaps.rm4scc[codeUnit];
-      if (code == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(codeUnit)}" to $name');
-      }
-      yield* addHW(code, BarcodeMaps.rm4sccLen);
-
-      final index = keys.indexOf(codeUnit);
+      final code = lookup(Rm4sccMaps.rm4sccTable, codeUnit);
+      yield* addHW(code, Rm4sccMaps.rm4sccLen);
+
+      final index = Rm4sccMaps.rm4sccValue[codeUnit];
       sumTop += (index ~/ 6 + 1) % 6;
       sumBottom += (index + 1) % 6;
     }
 
     final crc = ((sumTop - 1) % 6) * 6 + (sumBottom - 1) % 6;
-    yield* addHW(BarcodeMaps.rm4scc[keys[crc]]!, BarcodeMaps.rm4sccLen);
+    yield* addHW(Rm4sccMaps.rm4sccSymbol[crc], Rm4sccMaps.rm4sccLen);
 
-    yield fromBits(BarcodeMaps.rm4sccStop);
+    yield fromBits(Rm4sccMaps.rm4sccStop);
   }
 }
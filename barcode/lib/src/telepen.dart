@@ -14,9 +14,11 @@
  * limitations under the License.
  */
 
+import 'dart:typed_data';
+
 import 'barcode_1d.dart';
 import 'barcode_exception.dart';
-import 'barcode_maps.dart';
+import 'maps/telepen.dart';
 
 /// Telepen Barcode
 ///
@@ -25,29 +27,97 @@ import 'barcode_maps.dart';
 /// only two different widths for bars and spaces.
 class BarcodeTelepen extends Barcode1D {
   /// Create a Telepen Barcode
-  const BarcodeTelepen();
+  const BarcodeTelepen([this.numeric = false, this.switchNumeric = false])
+      : assert(!numeric || !switchNumeric,
+            'The numeric mode has no ASCII characters to switch from');
+
+  /// Encode the digits by pairs, one symbol each. "X" can stand for the
+  /// second digit of a pair.
+  final bool numeric;
+
+  /// Encode the runs of digits of the ASCII data by pairs, switching to the
+  /// numeric mode and back with DLE characters
+  final bool switchNumeric;
+
+  @override
+  List<Object?> get cacheKey => [...super.cacheKey, numeric, switchNumeric];
 
   @override
-  Iterable<int> get charSet => Iterable<int>.generate(128);
+  Iterable<int> get charSet => numeric
+      ? tableCharSet(TelepenMaps.telepenDigit)
+      : Iterable<int>.generate(128);
 
   @override
   String get name => 'Telepen';
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) =>
+      convertSymbols(data).expand((runs) => runs);
+
+  @override
+  Iterable<List<int>> convertSymbols(String data) sync* {
     // Start
-    yield* add(BarcodeMaps.telepenStart, BarcodeMaps.telepenLen);
+    yield TelepenMaps.telepenStartRuns;
 
     var checksum = 0;
 
-    for (var code in data.codeUnits) {
-      if (code >= BarcodeMaps.telepen.length) {
+    if (numeric) {
+      final cu = data.codeUnits;
+      if (cu.length.isOdd) {
         throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
+            '$name numeric can only encode an even number of digits, "X" '
+            'can complete the last pair');
+      }
+      for (var i = 0; i < cu.length; i += 2) {
+        final pair = _pair(cu[i], cu[i + 1]);
+        yield TelepenMaps.telepenPairRuns[pair];
+        checksum += TelepenMaps.telepenPairValue[pair];
+      }
+    } else {
+      final cu = data.codeUnits;
+      var i = 0;
+      while (i < cu.length) {
+        var end = i;
+        while (end < cu.length && _isDigit(cu[end])) {
+          end++;
+        }
+
+        final shortest = end == cu.length
+            ? TelepenMaps.telepenNumericEnd
+            : TelepenMaps.telepenNumericMiddle;
+        if (!switchNumeric || end - i < shortest) {
+          // One ASCII character, or all the digits of a short run
+          end = end == i ? i + 1 : end;
+          for (; i < end; i++) {
+            yield lookupRuns(TelepenMaps.telepenRuns, cu[i]);
+            checksum += cu[i];
+          }
+          continue;
+        }
+
+        // The first digit of an odd run stays in the ASCII mode
+        if ((end - i).isOdd) {
+          yield TelepenMaps.telepenRuns[cu[i]];
+          checksum += cu[i];
+          i++;
+        }
+
+        yield TelepenMaps.telepenRuns[TelepenMaps.telepenSwitch];
+        checksum += TelepenMaps.telepenSwitch;
+        for (; i < end; i += 2) {
+          final pair = _pair(cu[i], cu[i + 1]);
+          yield TelepenMaps.telepenPairRuns[pair];
+          checksum += TelepenMaps.telepenPairValue[pair];
+        }
+
+        if (end < cu.length) {
+          yield TelepenMaps.telepenRuns[TelepenMaps.telepenSwitch];
+          checksum += TelepenMaps.telepenSwitch;
+        }
       }
-      final codeValue = BarcodeMaps.telepen[code];
-      yield* add(codeValue, BarcodeMaps.telepenLen);
-      checksum += code;
     }
 
     // Checksum
@@ -55,9 +125,48 @@ class BarcodeTelepen extends Barcode1D {
     if (checksum == 127) {
       checksum = 0;
     }
-    yield* add(BarcodeMaps.telepen[checksum], BarcodeMaps.telepenLen);
+    yield TelepenMaps.telepenRuns[checksum];
 
     // Stop
-    yield* add(BarcodeMaps.telepenEnd, BarcodeMaps.telepenLen);
+    yield TelepenMaps.telepenEndRuns;
+  }
+
+  static bool _isDigit(int code) => code >= 0x30 && code <= 0x39;
+
+  /// The index of the pair of digits [high] and [low] in the numeric tables
+  int _pair(int high, int low) {
+    final value = lookup(TelepenMaps.telepenDigit, high);
+    if (value >= 10) {
+      throw BarcodeException(
+          '$name numeric can only encode "X" as the second digit of a pair');
+    }
+    return value * 11 + lookup(TelepenMaps.telepenDigit, low);
+  }
+
+  @override
+  void verifyBytes(Uint8List data) {
+    super.verifyBytes(data);
+
+    if (numeric) {
+      if (data.length.isOdd) {
+        throw BarcodeException(
+            '$name numeric can only encode an even number of digits, "X" '
+            'can complete the last pair');
+      }
+
+      // The first digits of the pairs
+      for (var i = 0; i < data.length; i += 2) {
+        if (data[i] == 0x58) {
+          throw BarcodeException(
+              '$name numeric can only encode "X" as the second digit of a '
+              'pair');
+        }
+      }
+    }
+
+    if (switchNumeric && data.contains(TelepenMaps.telepenSwitch)) {
+      throw BarcodeException(
+          '$name can\'t encode DLE when switching to the numeric mode');
+    }
   }
 }
@@ -17,10 +17,9 @@
 import 'dart:convert';
 import 'dart:typed_data';
 
-import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'barcode_operations.dart';
 import 'ean.dart';
+import 'maps/ean.dart';
 
 /// UPC-A Barcode
 ///
@@ -49,31 +48,27 @@ class BarcodeUpcA extends BarcodeEan {
   }
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) sync* {
     data = checkLength(data, maxLength);
 
     // Start
-    yield* add(BarcodeMaps.eanStartEnd, 3);
+    yield* EanMaps.eanStartEndRuns;
 
     var index = 0;
     for (var code in data.codeUnits) {
-      final codes = BarcodeMaps.ean[code];
-
-      if (codes == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
-      }
-
       if (index == 6) {
-        yield* add(BarcodeMaps.eanCenter, 5);
+        yield* EanMaps.eanCenterRuns;
       }
 
-      yield* add(codes[index < 6 ? 0 : 2], 7);
+      yield* digitRuns(code, index < 6 ? 0 : 2);
       index++;
     }
 
     // Stop
-    yield* add(BarcodeMaps.eanStartEnd, 3);
+    yield* EanMaps.eanStartEndRuns;
   }
 
   @override
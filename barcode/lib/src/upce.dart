@@ -18,9 +18,9 @@ import 'dart:convert';
 import 'dart:typed_data';
 
 import 'barcode_exception.dart';
-import 'barcode_maps.dart';
 import 'barcode_operations.dart';
 import 'ean.dart';
+import 'maps/ean.dart';
 import 'upca.dart';
 
 /// UPC-E Barcode
@@ -39,6 +39,9 @@ class BarcodeUpcE extends BarcodeEan {
   /// Fallback to UPC-A if the code cannot be converted to UPC-E
   final bool fallback;
 
+  @override
+  List<Object?> get cacheKey => [...super.cacheKey, fallback];
+
   @override
   String get name => 'UPC E';
 
@@ -199,7 +202,10 @@ class BarcodeUpcE extends BarcodeEan {
   }
 
   @override
-  Iterable<bool> convert(String data) sync* {
+  Iterable<bool> convert(String data) => expandRuns(convertRuns(data));
+
+  @override
+  Iterable<int> convertRuns(String data) sync* {
     if (data.length <= 8) {
       // Try to convert UPC-E to UPC-A
       data = upceToUpca(data);
@@ -213,33 +219,26 @@ class BarcodeUpcE extends BarcodeEan {
       data = upcaToUpce(data);
     } on BarcodeException {
       if (fallback) {
-        yield* const BarcodeUpcA().convert(data);
+        yield* const BarcodeUpcA().convertRuns(data);
         return;
       }
       rethrow;
     }
 
     // Start
-    yield* add(BarcodeMaps.eanStartEnd, 3);
+    yield* EanMaps.eanStartEndRuns;
 
-    final parityRow = BarcodeMaps.upce[last];
+    final parityRow = EanMaps.upce[last];
     final parity = first == 0x30 ? parityRow : parityRow! ^ 0x3f;
 
     var index = 0;
     for (var code in data.codeUnits) {
-      final codes = BarcodeMaps.ean[code];
-
-      if (codes == null) {
-        throw BarcodeException(
-            'Unable to encode "${String.fromCharCode(code)}" to $name Barcode');
-      }
-
-      yield* add(codes[(parity! >> index) & 1 == 0 ? 1 : 0], 7);
+      yield* digitRuns(code, (parity! >> index) & 1 == 0 ? 1 : 0);
       index++;
     }
 
     // Stop
-    yield* add(BarcodeMaps.eanEndUpcE, 6);
+    yield* EanMaps.eanEndUpcERuns;
   }
 
   @override
@@ -57,6 +57,14 @@ void main() {
     expect(bc.toSvg('0'), matchesGoldenString('aztec/manual.svg'));
   });
 
+  test('Barcode Aztec layers', () {
+    expect(Barcode.aztec(userSpecifiedLayers: 32).toSvg('0'), isNotEmpty);
+    expect(() => Barcode.aztec(userSpecifiedLayers: 33).toSvg('0'),
+        throwsA(const TypeMatcher<BarcodeException>()));
+    expect(() => Barcode.aztec(userSpecifiedLayers: 1).toSvg('0' * 100),
+        throwsA(const TypeMatcher<BarcodeException>()));
+  });
+
   test('Barcode Aztec limits', () {
     final bc = Barcode.aztec();
     if (bc is! Barcode2D) {
@@ -0,0 +1,87 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'dart:convert';
+
+import 'package:barcode/barcode.dart';
+import 'package:test/test.dart';
+
+void main() {
+  test('BarcodeCache hits and misses', () {
+    final cache = BarcodeCache();
+    final bc = Barcode.code128();
+
+    final svg = cache.toSvg(bc, 'SKU-1234');
+    expect(svg, equals(bc.toSvg('SKU-1234')));
+    expect(cache.toSvg(bc, 'SKU-1234'), same(svg));
+    expect(cache.toSvg(bc, 'SKU-1234', width: 300), isNot(same(svg)));
+    expect(cache.toSvgBytes(bc, utf8.encoder.convert('SKU-1234')),
+        equals(svg));
+
+    final elements = cache.make(bc, 'SKU-1234', width: 200, height: 80);
+    expect(elements.length,
+        equals(bc.make('SKU-1234', width: 200, height: 80).length));
+    expect(cache.make(bc, 'SKU-1234', width: 200, height: 80),
+        same(elements));
+    expect(
+        cache.makeBytes(bc, utf8.encoder.convert('SKU-1234'),
+            width: 200, height: 80),
+        isNot(same(elements)));
+
+    expect(cache.hits, equals(2));
+    expect(cache.misses, equals(5));
+    expect(cache.length, equals(5));
+
+    // Another instance with the same options shares the results
+    expect(cache.toSvg(Barcode.code128(), 'SKU-1234'), same(svg));
+    expect(cache.hits, equals(3));
+
+    // Other options have their own results
+    cache.toSvg(Barcode.code128(useCode128C: false), 'SKU-1234');
+    expect(cache.misses, equals(6));
+    expect(cache.length, equals(6));
+  });
+
+  test('BarcodeCache eviction', () {
+    final cache = BarcodeCache(maxEntries: 2);
+    final bc = Barcode.ean13();
+
+    cache.toSvg(bc, '590123412345');
+    cache.toSvg(bc, '400638133393');
+    cache.toSvg(bc, '590123412345');
+    cache.toSvg(bc, '978020137962');
+    expect(cache.length, equals(2));
+    expect(cache.evictions, equals(1));
+
+    // The least recently used result was evicted
+    cache.toSvg(bc, '590123412345');
+    expect(cache.hits, equals(2));
+    cache.toSvg(bc, '400638133393');
+    expect(cache.misses, equals(4));
+
+    final small = BarcodeCache(maxSize: 1000);
+    small.toSvg(bc, '590123412345');
+    expect(small.length, equals(0));
+    expect(small.size, equals(0));
+  });
+
+  test('BarcodeCache errors', () {
+    final cache = BarcodeCache();
+    expect(() => cache.toSvg(Barcode.ean13(), 'ABC'),
+        throwsA(const TypeMatcher<BarcodeException>()));
+    expect(cache.length, equals(0));
+  });
+}
@@ -38,7 +38,7 @@ void main() {
 
       expect(
         bc.shortestCode('098x1234567y23'.codeUnits),
-        equals(<int>[105, 9, 100, 24, 88, 99, 12, 34, 56, 100, 23, 89, 18, 19]),
+        equals(<int>[104, 16, 25, 24, 88, 99, 12, 34, 56, 100, 23, 89, 18, 19]),
       );
 
       expect(
@@ -73,7 +73,12 @@ void main() {
 
       expect(
         bc.shortestCode('HELLO12312312312'.codeUnits),
-        equals(<int>[103, 40, 37, 44, 44, 47, 99, 12, 31, 23, 12, 31, 101, 18]),
+        equals(<int>[103, 40, 37, 44, 44, 47, 17, 99, 23, 12, 31, 23, 12]),
+      );
+
+      expect(
+        bc.shortestCode('hello\nworld'.codeUnits),
+        equals(<int>[104, 72, 69, 76, 76, 79, 98, 74, 87, 79, 82, 76, 68]),
       );
     }
   });
@@ -100,6 +105,22 @@ void main() {
     }
   });
 
+  test('Barcode CODE 128 C', () {
+    final bc = Barcode.code128(useCode128A: false, useCode128B: false);
+
+    if (bc is BarcodeCode128) {
+      expect(
+        bc.shortestCode('4218'.codeUnits),
+        equals(<int>[105, 42, 18]),
+      );
+
+      expect(
+        () => bc.shortestCode('421'.codeUnits),
+        throwsA(const TypeMatcher<BarcodeException>()),
+      );
+    }
+  });
+
   test('Barcode Code-128 with FNC', () {
     final bc = Barcode.gs128();
     if (bc is BarcodeCode128) {
@@ -117,7 +138,7 @@ void main() {
         bc.shortestCode(
             '${BarcodeCode128Fnc.fnc1}301${BarcodeCode128Fnc.fnc1}92'
                 .codeUnits),
-        equals(<int>[103, 102, 19, 16, 17, 99, 102, 92]),
+        equals(<int>[103, 102, 19, 99, 1, 102, 92]),
       );
       expect(
         bc.shortestCode(
@@ -129,7 +150,7 @@ void main() {
         bc.shortestCode(
             '${BarcodeCode128Fnc.fnc1}3B10${BarcodeCode128Fnc.fnc1}92'
                 .codeUnits),
-        equals(<int>[103, 102, 19, 34, 17, 16, 99, 102, 92]),
+        equals(<int>[103, 102, 19, 34, 99, 10, 102, 92]),
       );
 
       expect(
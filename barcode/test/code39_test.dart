@@ -91,4 +91,31 @@ void main() {
     expect(textElements.first.text, '*');
     expect(textElements.last.text, '*');
   });
+
+  test('Barcode CODE 39 full ASCII', () {
+    final bc = Barcode.code39(fullAscii: true);
+    if (bc is! Barcode1D) {
+      throw Exception('bc is not a Barcode1D');
+    }
+
+    expect(bc.toHex('0'), equals('da529b6a4b'));
+    expect(bc.toHex('a'), equals('dad2524b4a6d9'));
+    expect(bc.toHex('a'), equals((Barcode.code39() as Barcode1D).toHex('+A')));
+    expect(bc.toHex('\x00\x7f'), equals('da52b64a52ab2c49b525'));
+    expect(() => bc.make('Léo', width: 1, height: 1),
+        throwsA(const TypeMatcher<BarcodeException>()));
+  });
+
+  test('Barcode CODE 39 full ASCII text', () {
+    final bc = Barcode.code39(fullAscii: true);
+    final elements = bc.make('a-b',
+        width: 100, height: 100, drawText: true, fontHeight: 1, textPadding: 1);
+
+    final textElements = elements.whereType<BarcodeText>().toList();
+
+    // Each character is drawn under its two symbols
+    expect(textElements.map((e) => e.text), equals(['*', 'a', '-', 'b', '*']));
+    expect(textElements[1].width, equals(textElements[2].width * 2));
+    expect(textElements[4].left, equals(textElements[0].width * 6));
+  });
 }
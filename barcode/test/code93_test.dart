@@ -115,4 +115,22 @@ void main() {
       equals('bdb2d5291b3559d1d24922956e143559d3d225cb66c9d42b'),
     );
   });
+
+  test('Barcode CODE 93 full ASCII', () {
+    final bc = Barcode.code93(fullAscii: true);
+    if (bc is! Barcode1D) {
+      throw Exception('bc is not a Barcode1D');
+    }
+
+    expect(Barcode.code93(fullAscii: true), same(bc));
+    expect(Barcode.code93(), same(const BarcodeCode93(false)));
+
+    expect(bc.toHex('0'), equals('bd52a448d12b'));
+    expect(bc.toHex('a'), equals('bd5a94885aa657'));
+    expect(bc.toHex('\x00\x7f'), equals('bd6a846a5abb65ed5e1'));
+    expect(
+      () => bc.make('Léo', width: 1, height: 1),
+      throwsA(const TypeMatcher<BarcodeException>()),
+    );
+  });
 }
@@ -15,6 +15,8 @@
  */
 
 import 'package:barcode/barcode.dart';
+import 'package:barcode/src/barcode_maps.dart';
+import 'package:barcode/src/reedsolomon.dart';
 import 'package:test/test.dart';
 
 void main() {
@@ -46,4 +48,115 @@ void main() {
     final bc = Barcode.code128();
     bc.toSvg('12345');
   });
+
+  test('BarcodeSvg scaled', () {
+    final bc = Barcode.code128();
+    final svg = bc.toSvg('12345', scaled: true);
+    expect(svg, contains('scale('));
+    expect('z'.allMatches(svg).length,
+        equals('z'.allMatches(bc.toSvg('12345')).length));
+
+    // The bars of different heights are drawn one by one
+    final ean = Barcode.ean13();
+    expect(ean.toSvg('590123412345', scaled: true),
+        equals(ean.toSvg('590123412345')));
+  });
+
+  test('BarcodeSvg sink', () {
+    final codes = <Barcode, String>{
+      Barcode.code128(): '12345',
+      Barcode.ean13(): '590123412345',
+      Barcode.qrCode(): 'Hello World',
+      Barcode.dataMatrix(): 'Hello World',
+    };
+
+    codes.forEach((bc, data) {
+      for (final scaled in [false, true]) {
+        final sink = StringBuffer();
+        bc.writeSvg(sink, data, scaled: scaled);
+        expect(sink.toString(), equals(bc.toSvg(data, scaled: scaled)));
+      }
+    });
+
+    // Nothing is written for invalid data
+    final sink = StringBuffer();
+    expect(() => Barcode.ean13().writeSvg(sink, 'ABC'),
+        throwsA(const TypeMatcher<BarcodeException>()));
+    expect(sink.isEmpty, isTrue);
+  });
+
+  test('BarcodeMaps dense tables', () {
+    void check(Map<int, int> map, List<int> table) {
+      for (var code = 0; code < table.length; code++) {
+        expect(table[code], equals(map[code] ?? BarcodeMaps.noCode));
+      }
+      expect(map.keys.where((int k) => k >= table.length), isEmpty);
+    }
+
+    check(BarcodeMaps.code39, BarcodeMaps.code39Table);
+    check(BarcodeMaps.itf, BarcodeMaps.itfTable);
+    check(BarcodeMaps.codabar, BarcodeMaps.codabarTable);
+    check(BarcodeMaps.rm4scc, BarcodeMaps.rm4sccTable);
+    check(BarcodeMaps.postnet, BarcodeMaps.postnetTable);
+    check(BarcodeMaps.code128, BarcodeMaps.code128Symbol);
+    check(BarcodeMaps.code128A, BarcodeMaps.code128ATable);
+    check(BarcodeMaps.code128B, BarcodeMaps.code128BTable);
+  });
+
+  test('BarcodeMaps run-length tables', () {
+    void check(Map<int, int> map, List<List<int>> table, int length) {
+      for (final code in map.keys) {
+        final bits = map[code]!;
+        var color = true;
+        var index = 0;
+        for (final run in table[code]) {
+          for (var i = 0; i < run; i++) {
+            expect((bits >> index++) & 1 == 1, equals(color));
+          }
+          color = !color;
+        }
+        expect(index, equals(length));
+      }
+    }
+
+    check(BarcodeMaps.code39, BarcodeMaps.code39Runs, BarcodeMaps.code39Len);
+    check(BarcodeMaps.code93Symbol.asMap(), BarcodeMaps.code93Runs,
+        BarcodeMaps.code93Len);
+    check(
+        BarcodeMaps.code128Symbol
+            .sublist(0, BarcodeMaps.code128Stop + 1)
+            .asMap(),
+        BarcodeMaps.code128Runs,
+        BarcodeMaps.code128Len);
+    check(BarcodeMaps.telepen.asMap(), BarcodeMaps.telepenRuns,
+        BarcodeMaps.telepenLen);
+  });
+
+  test('BarcodeMaps facade', () {
+    expect(BarcodeMaps.noCode, equals(CommonMaps.noCode));
+    expect(BarcodeMaps.code39Table, same(Code39Maps.code39Table));
+    expect(BarcodeMaps.code128ATable, same(Code128Maps.code128ATable));
+    expect(BarcodeMaps.eanLRuns, same(EanMaps.eanLRuns));
+    expect(BarcodeMaps.gf256Log, same(ReedSolomonMaps.gf256Log));
+  });
+
+  test('Precomputed Galois fields', () {
+    void check(GaloisField gf, int pp) {
+      final field = GaloisField(pp, gf.size, gf.base);
+      expect(gf.aLogTbl, equals(field.aLogTbl));
+      expect(gf.logTbl, equals(field.logTbl));
+
+      final rs = ReedSolomonEncoder(field);
+      for (final degree in gf.generators.keys) {
+        expect(gf.generators[degree],
+            equals(rs.getPolynomial(degree).coefficients));
+      }
+    }
+
+    check(GaloisField.gf16, 0x13);
+    check(GaloisField.gf64, 0x43);
+    check(GaloisField.gf256, 0x12d);
+    check(GaloisField.gf1024, 0x409);
+    check(GaloisField.gf4096, 0x1069);
+  });
 }
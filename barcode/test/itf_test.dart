@@ -34,6 +34,24 @@ void main() {
     expect(bc.toHex('56'), equals('5d71745'));
   });
 
+  test('Barcode ITF pairs', () {
+    for (var pair = 0; pair < 100; pair++) {
+      // Expand the widths to modules, the first module in the low bit
+      var modules = 0;
+      var length = 0;
+      for (var i = 0; i < 10; i++) {
+        final width = BarcodeMaps.itfPairRuns[pair * 10 + i];
+        if (i % 2 == 0) {
+          modules |= ((1 << width) - 1) << length;
+        }
+        length += width;
+      }
+
+      expect(length, equals(18));
+      expect(modules, equals(BarcodeMaps.itfPairs[pair]));
+    }
+  });
+
   test('Barcode ITF limits', () {
     final bc = Barcode.itf();
     expect(bc.charSet, equals([48, 49, 50, 51, 52, 53, 54, 55, 56, 57]));
@@ -0,0 +1,66 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'dart:convert';
+
+import 'package:barcode/barcode.dart';
+import 'package:test/test.dart';
+
+void main() {
+  tearDown(() => Barcode.listener = null);
+
+  test('BarcodeListener stages', () {
+    final statistics = BarcodeStatistics();
+    Barcode.listener = statistics;
+
+    final bc = Barcode.code128();
+    final svg = bc.toSvg('SKU-1234');
+    expect(bc.isValid('SKU-1234'), isTrue);
+
+    final name = bc.name;
+    expect(statistics.names, equals([name]));
+
+    // Symbols of 11 modules and the termination bar
+    final convert = statistics.stage(name, BarcodeStage.convert)!;
+    expect(convert.calls, equals(1));
+    expect(convert.count % 11, equals(2));
+    expect(statistics.stage(name, BarcodeStage.bars)!.count, greaterThan(0));
+    expect(statistics.stage(name, BarcodeStage.text)!.count, equals(1));
+    expect(statistics.stage(name, BarcodeStage.svg)!.count,
+        equals(utf8.encode(svg).length));
+    expect(statistics.stage(name, BarcodeStage.verify)!.calls, equals(1));
+
+    // A scaled drawing falling back to the recipe reports each stage once
+    final ean = Barcode.ean13();
+    ean.toSvg('590123412345', scaled: true);
+    expect(statistics.stage(ean.name, BarcodeStage.convert)!.calls, equals(1));
+    expect(statistics.stage(ean.name, BarcodeStage.bars)!.calls, equals(1));
+
+    Barcode.qrCode().make('HELLO', width: 200, height: 200);
+    expect(statistics.stage('QR-Code', BarcodeStage.convert)!.count,
+        greaterThan(0));
+    expect(statistics.stage('QR-Code', BarcodeStage.text), isNull);
+  });
+
+  test('BarcodeListener disabled', () {
+    final statistics = BarcodeStatistics();
+    Barcode.listener = statistics;
+    Barcode.listener = null;
+
+    Barcode.code39().toSvg('HELLO');
+    expect(statistics.names, isEmpty);
+  });
+}
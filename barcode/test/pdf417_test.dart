@@ -0,0 +1,64 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'dart:convert';
+
+import 'package:barcode/barcode.dart';
+import 'package:barcode/src/barcode_2d.dart';
+import 'package:test/test.dart';
+
+void main() {
+  test('Barcode PDF417 tables', () {
+    for (var i = 0; i < 3 * 929; i++) {
+      // Expand the widths to modules
+      var runs = BarcodeMaps.pdf417Runs[i];
+      var modules = 0;
+      var count = 0;
+      while (runs != 0) {
+        final bar = runs & 7;
+        final space = (runs >> 3) & 7;
+        modules = ((modules << bar | ((1 << bar) - 1)) << space);
+        count += bar + space;
+        runs >>= 6;
+      }
+
+      expect(count, equals(17));
+      expect(modules, equals(BarcodeMaps.pdf417Codewords[i]));
+    }
+  });
+
+  test('Barcode PDF417 rows', () {
+    final bc = Barcode.pdf417();
+    if (bc is! Barcode2D) {
+      throw Exception('bc is not a Barcode2D');
+    }
+
+    final matrix = bc.convert(utf8.encoder.convert('Hello World ' * 10));
+    final pixels = matrix.pixels.toList();
+    expect(pixels.length, equals(matrix.width * matrix.height));
+
+    const start = '11111111010101000';
+    const stop = '111111101000101001';
+    for (var y = 0; y < matrix.height; y++) {
+      final row = pixels
+          .sublist(y * matrix.width, (y + 1) * matrix.width)
+          .map((e) => e ? '1' : '0')
+          .join();
+      expect(row, startsWith(start));
+      expect(row, endsWith(stop));
+    }
+  });
+}
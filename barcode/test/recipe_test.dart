@@ -0,0 +1,64 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'package:barcode/barcode.dart';
+import 'package:test/test.dart';
+
+void main() {
+  test('BarcodeRecipe matches the drawing operations', () {
+    final codes = <Barcode, String>{
+      Barcode.code128(): 'SKU-1234',
+      Barcode.itf14(): '1540014128876',
+      Barcode.rm4scc(): 'SN34RD1A',
+      Barcode.qrCode(): 'HELLO WORLD',
+      Barcode.dataMatrix(): 'Hello World',
+    };
+
+    codes.forEach((bc, data) {
+      final recipe = bc.makeRecipe(data,
+          width: 200, height: 80, drawText: true, fontHeight: 10);
+      final elements =
+          bc.make(data, width: 200, height: 80, drawText: true, fontHeight: 10);
+
+      final bars = elements.whereType<BarcodeBar>().toList();
+      expect(recipe.length, equals(bars.length));
+      for (var i = 0; i < bars.length; i++) {
+        expect(recipe.left(i), equals(bars[i].left));
+        expect(recipe.top(i), equals(bars[i].top));
+        expect(recipe.width(i), equals(bars[i].width));
+        expect(recipe.height(i), equals(bars[i].height));
+        expect(recipe.isBlack(i), equals(bars[i].black));
+      }
+
+      expect(recipe.texts.map((e) => e.text),
+          equals(elements.whereType<BarcodeText>().map((e) => e.text)));
+    });
+  });
+
+  test('BarcodeRecipe from elements', () {
+    final bc = Barcode.ean13();
+    final elements = bc.make('590123412345', width: 200, height: 80);
+    final recipe = BarcodeRecipe.fromElements(elements);
+    expect(recipe.elements.length, equals(elements.length));
+
+    expect(
+        () => BarcodeRecipe.fromElements([
+              const BarcodePath(
+                  left: 0, top: 0, width: 1, height: 1, modules: 1, path: '')
+            ]),
+        throwsArgumentError);
+  });
+}
@@ -0,0 +1,80 @@
+/*
+ * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+ *
+ * Licensed under the Apache License, Version 2.0 (the "License");
+ * you may not use this file except in compliance with the License.
+ * You may obtain a copy of the License at
+ *
+ *     http://www.apache.org/licenses/LICENSE-2.0
+ *
+ * Unless required by applicable law or agreed to in writing, software
+ * distributed under the License is distributed on an "AS IS" BASIS,
+ * WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+ * See the License for the specific language governing permissions and
+ * limitations under the License.
+ */
+
+import 'package:barcode/barcode.dart';
+import 'package:test/test.dart';
+
+void main() {
+  test('Barcode makeSymbols', () {
+    final bc = Barcode.code128();
+    final symbols = bc
+        .makeSymbols('SKU-1234', width: 200, height: 80)!
+        .whereType<BarcodeSymbols>()
+        .single;
+    final bars = bc
+        .make('SKU-1234', width: 200, height: 80)
+        .whereType<BarcodeBar>()
+        .toList();
+
+    expect(symbols.left, equals(bars.first.left));
+    expect(symbols.width,
+        closeTo(bars.fold<double>(0, (w, bar) => w + bar.width), 1e-9));
+    expect(symbols.height, equals(bars.first.height));
+    expect(symbols.paths.length, equals(symbols.offsets.length));
+
+    // Drawn symbol by symbol
+    expect(Barcode.code39().makeSymbols('ABC', width: 200, height: 80)!,
+        isNotEmpty);
+    expect(
+        Barcode.qrCode().makeSymbols('ABC', width: 200, height: 200), isNull);
+    expect(
+        Barcode.itf14().makeSymbols('1540014128876', width: 200, height: 80),
+        isNull);
+  });
+
+  test('BarcodeSheet', () {
+    final sheet = BarcodeSheet(columns: 4, labelWidth: 200, labelHeight: 80);
+    for (var i = 0; i < 10; i++) {
+      sheet.add(Barcode.code128(), 'SKU-${1000 + i}');
+      sheet.add(Barcode.itf14(drawBorder: false), '154001412887$i');
+    }
+    sheet.add(Barcode.qrCode(), 'HELLO');
+
+    expect(sheet.length, equals(21));
+    expect(sheet.width, equals(800));
+    expect(sheet.height, equals(6 * 80));
+
+    final svg = sheet.toSvg();
+    expect(svg, startsWith('<svg '));
+    expect(svg, endsWith('</svg>'));
+    expect(svg, contains('<defs>'));
+    expect(svg, contains('SKU-1009'));
+
+    final defs = '<path id='.allMatches(svg).length;
+    final uses = '<use '.allMatches(svg).length;
+    expect(defs, lessThan(uses));
+
+    // The ids of two sheets of the same page are told apart
+    final other = BarcodeSheet(idPrefix: 'other-')
+      ..add(Barcode.code128(), 'SKU-1000');
+    expect(other.toSvg(), contains('<path id="other-0"'));
+    expect(other.toSvg(), contains('xlink:href="#other-0"'));
+
+    expect(() => sheet.add(Barcode.ean13(), 'ABC'),
+        throwsA(const TypeMatcher<BarcodeException>()));
+    expect(sheet.length, equals(21));
+  });
+}
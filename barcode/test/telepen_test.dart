@@ -16,6 +16,7 @@
 
 import 'package:barcode/barcode.dart';
 import 'package:barcode/src/barcode_1d.dart';
+import 'package:barcode/src/telepen.dart';
 import 'package:test/test.dart';
 
 void main() {
@@ -28,6 +29,49 @@ void main() {
     expect(bc.toHex('z'), 'aae2eeb8aae2b8aa');
   });
 
+  test('Barcode Telepen numeric', () {
+    final bc = Barcode.telepen(numeric: true);
+    if (bc is! Barcode1D) {
+      throw Exception('bc is not a Barcode1D');
+    }
+
+    // Each pair is the character of value pair + 27, "X" pairs digit + 17
+    const ascii = BarcodeTelepen();
+    expect(bc.toHex('1234'), equals(ascii.toHex('\x27\x3d')));
+    expect(bc.toHex('012X'), equals(ascii.toHex('\x1c\x13')));
+    expect(bc.toHex('1X'), equals(ascii.toHex('\x12')));
+    expect(bc.convert('9' * 20).length, equals(ascii.convert('9' * 10).length));
+
+    expect(bc.isValid('012X'), isTrue);
+    expect(bc.isValid('1X23'), isFalse);
+    expect(bc.isValid('123'), isFalse);
+    expect(() => bc.toHex('123'),
+        throwsA(const TypeMatcher<BarcodeException>()));
+    expect(bc.isValid('12A'), isFalse);
+    expect(bc.charSet, equals('0123456789X'.codeUnits));
+  });
+
+  test('Barcode Telepen switch numeric', () {
+    final bc = Barcode.telepen(switchNumeric: true);
+    if (bc is! Barcode1D) {
+      throw Exception('bc is not a Barcode1D');
+    }
+
+    // The runs of digits are switched with DLE, the checksum of the values
+    // is the one of the ASCII characters
+    const ascii = BarcodeTelepen();
+    expect(bc.toHex('AB123456'), equals(ascii.toHex('AB\x10\x27\x3d\x53')));
+    expect(bc.toHex('A1234567B'),
+        equals(ascii.toHex('A1\x10\x32\x48\x5e\x10B')));
+
+    // The short runs stay in the ASCII mode
+    expect(bc.toHex('AB123'), equals(ascii.toHex('AB123')));
+    expect(bc.toHex('A12345B'), equals(ascii.toHex('A12345B')));
+
+    expect(bc.isValid('A\x10B'), isFalse);
+    expect(Barcode.telepen(switchNumeric: true), same(bc));
+  });
+
   test('Barcode Telepen limits', () {
     final bc = Barcode.telepen();
     if (bc is! Barcode1D) {
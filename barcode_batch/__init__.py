@@ -0,0 +1,33 @@
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Batch barcode encoder using the tables of build_maps.py.
+
+    >>> from barcode_batch import encode
+    >>> batch = encode('ean13', ['590123412345', '400638133393'])
+    >>> batch[0]          # the modules of the first barcode
+    >>> batch.packed()    # all the barcodes, 8 modules per byte
+    >>> from barcode_batch.decode import verify
+    >>> verify('ean13', ['590123412345', '400638133393'], batch)
+
+The package is used from the root of the repository, next to
+build_maps.py and check_digits.py. Run it as a module to generate the
+label files of a CSV or JSONL list of barcodes:
+
+    python3 -m barcode_batch labels.csv --output labels.zip
+"""
+
+from .encoder import SYMBOLOGIES, Batch, encode
+
+__all__ = ['SYMBOLOGIES', 'Batch', 'encode']
@@ -0,0 +1,76 @@
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generate the SVG, PNG or PBM files of the barcodes of a CSV or JSONL file.
+
+    python3 -m barcode_batch labels.csv --output labels.zip --format png
+"""
+
+import argparse
+import sys
+
+from . import labels
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        prog='python3 -m barcode_batch',
+        description='Generate the barcodes of a CSV or JSONL file, with '
+        'the symbology and data columns or keys, and the optional name and '
+        'options')
+    parser.add_argument('file', nargs='?', type=argparse.FileType('r'),
+                        default=sys.stdin)
+    parser.add_argument('--input', choices=sorted(labels.READERS),
+                        help='input format, from the file extension by '
+                        'default')
+    parser.add_argument('--output', default='.',
+                        help='output directory, or .zip, .tar, .tgz archive')
+    parser.add_argument('--format', choices=labels.FORMATS, default='svg')
+    parser.add_argument('--jobs', type=int, help='number of processes')
+    parser.add_argument('--chunk', type=int, default=labels.CHUNK_SIZE,
+                        help='number of barcodes encoded by a process at '
+                        'once')
+    parser.add_argument('--width', type=float, default=200,
+                        help='width of the SVG files')
+    parser.add_argument('--height', type=float, default=80,
+                        help='height of the SVG files')
+    parser.add_argument('--module', type=int, default=2,
+                        help='width of a module of the PNG and PBM files, '
+                        'in pixels')
+    parser.add_argument('--bar-height', type=int, default=80,
+                        help='height of the bars of the PNG and PBM files, '
+                        'in pixels')
+    parser.add_argument('--quiet', type=int, default=0,
+                        help='number of white modules on each side of the '
+                        'PNG and PBM files')
+    parser.add_argument('--dpi', type=int,
+                        help='resolution stored in the PNG files')
+    parser.add_argument('--verify', action='store_true',
+                        help='decode each barcode and compare it to its data')
+    args = parser.parse_args()
+
+    reader = args.input or ('jsonl' if args.file.name.endswith('.jsonl')
+                            else 'csv')
+    output = labels.writer(args.output)
+    errors = 0
+    try:
+        for name, error in labels.generate(
+                labels.READERS[reader](args.file), output, args.format,
+                args.jobs, args.chunk, width=args.width, height=args.height,
+                module=args.module, bar_height=args.bar_height,
+                quiet=args.quiet, dpi=args.dpi, verify=args.verify):
+            print(f'{name}: {error}', file=sys.stderr)
+            errors += 1
+    finally:
+        output.close()
+    sys.exit(1 if errors else 0)
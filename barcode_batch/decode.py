@@ -0,0 +1,471 @@
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Decode the modules of a barcode back to its data.
+
+The modules are cut in symbols, each symbol is packed to an integer and
+looked up in the inverse alphabets of tables.py, then the check digits are
+verified. A row of modules can be read from a scanline of a rendered
+image with scanline, and the bar types of a height modulated barcode with
+hm_scan. The data is returned as encoded: with the printable check
+digits, and the Code 128 function characters as code units.
+"""
+
+import numpy as np
+
+import build_maps
+import check_digits
+
+from . import tables
+from .encoder import code128_adapt, upce_to_upca
+
+
+def trim(row):
+    """The modules from the first bar to the last one"""
+    row = np.asarray(row, dtype=np.uint8)
+    bars = np.flatnonzero(row)
+    if not len(bars):
+        raise ValueError('No barcode found')
+    return row[bars[0]:bars[-1] + 1]
+
+
+def pad(row, width):
+    """Add the white modules after the last bar to complete a symbol of
+    width modules"""
+    return np.concatenate((row, np.zeros(-len(row) % width, np.uint8)))
+
+
+def lookup(table, blocks, bits=1):
+    """Symbol index of each row of blocks, using an inverse alphabet"""
+    keys, indexes = table
+    packed = tables.pack(blocks, bits)
+    position = np.minimum(np.searchsorted(keys, packed), len(keys) - 1)
+    found = keys[position] == packed
+    if not found.all():
+        raise ValueError(f'Unknown symbol {np.argmin(found)}')
+    return indexes[position]
+
+
+def symbols(row, table, width, bits=1):
+    """Symbol indexes of a row of fixed width symbols"""
+    if len(row) % width:
+        raise ValueError(f'The barcode is not a multiple of {width} modules')
+    return lookup(table, row.reshape(-1, width), bits)
+
+
+def expect(modules, symbols, index):
+    """Check that the modules are the symbol index of an alphabet"""
+    pattern, widths = symbols
+    if not np.array_equal(modules, pattern[index, :widths[index]]):
+        raise ValueError('Invalid start or stop pattern')
+
+
+def start_stop(values, start, stop=None):
+    """The values between the start and stop symbols"""
+    stop = start if stop is None else stop
+    if len(values) < 2 or values[0] != start or values[-1] != stop:
+        raise ValueError('Invalid start or stop character')
+    return values[1:-1]
+
+
+def code39(row):
+    values = symbols(pad(trim(row), 13), tables.CODE39_DECODE, 13)
+    values = start_stop(values, tables.CODE39_START_STOP)
+    if (values == tables.CODE39_START_STOP).any():
+        raise ValueError('Invalid start or stop character')
+    chars = list(build_maps.C39)
+    return ''.join(chars[value] for value in values)
+
+
+def code93(row):
+    """Code 93, the full ASCII shifts are decoded"""
+    row = trim(row)
+    values = symbols(row[:-1], tables.CODE93_DECODE, 9)
+    values = start_stop(values, tables.CODE93_START_STOP)
+    if len(values) < 2:
+        raise ValueError('No Code 93 check characters')
+    if (check_digits.mod47_values(values[None, :-2])[0] != values[-2:]).any():
+        raise ValueError('Wrong checksum')
+    chars = list(build_maps.C93)
+    text = []
+    data = iter(values[:-2])
+    for value in data:
+        if value < len(chars):
+            text.append(chars[value])
+            continue
+        pair = (value, next(data, -1))
+        if pair not in tables.CODE93_ASCII_PAIRS:
+            raise ValueError('Invalid Code 93 shift')
+        text.append(chr(tables.CODE93_ASCII_PAIRS[pair]))
+    return ''.join(text)
+
+
+def code128_text(values):
+    """Code units of the Code 128 values, from the start symbol"""
+    code_set = tables.CODE128_START.index(values[0])
+    shifted = None
+    text = []
+    for value in values[1:]:
+        name = build_maps.C128[value][code_set if shifted is None
+                                      else shifted]
+        shifted = None
+        if name in ('CodeA', 'CodeB', 'CodeC'):
+            code_set = 'ABC'.index(name[-1])
+        elif name in ('ShiftA', 'ShiftB'):
+            shifted = 'AB'.index(name[-1])
+        elif len(name) == 1 or code_set == 2 and name.isdigit():
+            text.append(name)
+        else:
+            text.append(chr(build_maps.C128_NAMES[name]))
+    return ''.join(text)
+
+
+def code128(row):
+    row = trim(row)
+    expect(row[-13:], tables.CODE128, tables.CODE128_STOP)
+    values = symbols(row[:-13], tables.CODE128_DECODE, 11)
+    if len(values) < 2 or values[0] not in tables.CODE128_START:
+        raise ValueError('Invalid start character')
+    if check_digits.mod103(values[None, :-1])[0] != values[-1]:
+        raise ValueError('Wrong checksum')
+    return code128_text(values[:-1])
+
+
+def ean_digits(row, count, sets):
+    """Digits of count EAN symbols, and their set: 0 L, 1 G, 2 R. sets
+    are the allowed sets"""
+    values = symbols(row[:count * 7], tables.EAN_DECODE, 7)
+    digit_sets = values // 10
+    if not np.isin(digit_sets, sets).all():
+        raise ValueError('Wrong EAN digit set')
+    return values % 10, digit_sets
+
+
+def ean_guard(row, index):
+    """Check an EAN guard and return the modules after it"""
+    width = tables.EAN[1][index]
+    expect(row[:width], tables.EAN, index)
+    return row[width:]
+
+
+def gs1_text(digits):
+    """Text of the digits of a GS1 code, checking the last one"""
+    if check_digits.mod10(digits[None, :-1])[0] != digits[-1]:
+        raise ValueError('Wrong check digit')
+    return ''.join(str(digit) for digit in digits)
+
+
+def ean_halves(row, count):
+    """Digits and sets of the two halves of a EAN 13, EAN 8 or UPC-A"""
+    row = ean_guard(trim(row), tables.EAN_START_END)
+    left, left_sets = ean_digits(row, count, (0, 1))
+    row = ean_guard(row[count * 7:], tables.EAN_CENTER)
+    right, _ = ean_digits(row, count, (2,))
+    ean_guard(row[count * 7:], tables.EAN_START_END)
+    if len(row) != count * 7 + 3:
+        raise ValueError('Wrong number of EAN digits')
+    return left, left_sets, right
+
+
+def ean13(row):
+    left, sets, right = ean_halves(row, 6)
+    first = np.flatnonzero((tables.EAN13_PARITY == sets).all(axis=1))
+    if not len(first):
+        raise ValueError('Wrong EAN 13 parity')
+    return gs1_text(np.concatenate((first[:1], left, right)))
+
+
+def ean8(row):
+    left, sets, right = ean_halves(row, 4)
+    if sets.any():
+        raise ValueError('Wrong EAN 8 parity')
+    return gs1_text(np.concatenate((left, right)))
+
+
+def upca(row):
+    left, sets, right = ean_halves(row, 6)
+    if sets.any():
+        raise ValueError('Wrong UPC-A parity')
+    return gs1_text(np.concatenate((left, right)))
+
+
+def upce(row):
+    """UPC-E, the 8 digits. The codes encoded as UPC-A are returned as
+    UPC-A"""
+    row = trim(row)
+    if len(row) != 51:
+        return upca(row)
+    row = ean_guard(row, tables.EAN_START_END)
+    digits, sets = ean_digits(row, 6, (0, 1))
+    ean_guard(row[42:], tables.EAN_END_UPCE)
+    odd = np.array(sets == 0, dtype=np.intp)
+    for system in (0, 1):
+        checks = np.flatnonzero((tables.UPCE_PARITY ^ system == odd)
+                                .all(axis=1))
+        if len(checks):
+            text = f'{system}{"".join(map(str, digits))}{checks[0]}'
+            gs1_text(np.frombuffer(upce_to_upca(text).encode(), np.uint8)
+                     - 0x30)
+            return text
+    raise ValueError('Wrong UPC-E parity')
+
+
+def supplement(row):
+    """The modules of an EAN 2 or EAN 5 supplement, that start with a
+    space"""
+    return np.concatenate(([0], trim(row))).astype(np.uint8)
+
+
+def ean2(row):
+    row = ean_guard(supplement(row), tables.EAN_START_EAN2)
+    first, first_set = ean_digits(row, 1, (0, 1))
+    row = ean_guard(row[7:], tables.EAN_CENTER_EAN2)
+    second, second_set = ean_digits(row, 1, (0, 1))
+    if len(row) != 7:
+        raise ValueError('Wrong number of EAN 2 digits')
+    value = first[0] * 10 + second[0]
+    if value % 4 != first_set[0] * 2 + second_set[0]:
+        raise ValueError('Wrong EAN 2 parity')
+    return f'{value:02d}'
+
+
+def ean5(row):
+    row = ean_guard(supplement(row), tables.EAN_START_EAN2)
+    digits, sets = [], []
+    for index in range(5):
+        if index:
+            row = ean_guard(row, tables.EAN_CENTER_EAN2)
+        digit, digit_set = ean_digits(row, 1, (0, 1))
+        digits.append(digit[0])
+        sets.append(digit_set[0])
+        row = row[7:]
+    if len(row):
+        raise ValueError('Wrong number of EAN 5 digits')
+    checksum = (np.array(digits) @ (3, 9, 3, 9, 3)) % 10
+    if not np.array_equal(tables.EAN5_PARITY[checksum], sets):
+        raise ValueError('Wrong EAN 5 parity')
+    return ''.join(map(str, digits))
+
+
+def itf(row):
+    """ITF, the digits without checking a check digit"""
+    row = trim(row)
+    expect(row[:4], tables.ITF, tables.ITF_START)
+    expect(row[-5:], tables.ITF, tables.ITF_END)
+    pairs = symbols(row[4:-5], tables.ITF_DECODE, 18)
+    if (pairs >= 100).any():
+        raise ValueError('Invalid start or stop pattern')
+    return ''.join(f'{pair:02d}' for pair in pairs)
+
+
+def itf14(row):
+    text = itf(row)
+    if len(text) != 14:
+        raise ValueError('Wrong number of ITF-14 digits')
+    return gs1_text(np.frombuffer(text.encode(), np.uint8) - 0x30)
+
+
+def itf16(row):
+    text = itf(row)
+    if len(text) != 16:
+        raise ValueError('Wrong number of ITF-16 digits')
+    return gs1_text(np.frombuffer(text.encode(), np.uint8) - 0x30)
+
+
+def telepen(row, numeric=False):
+    """Telepen, the pairs of the numeric mode decoded to digits. The data
+    starts in the numeric mode with numeric, a DLE switches the mode, and
+    can't be told from a DLE of the ASCII data"""
+    values = symbols(pad(trim(row), 16), tables.TELEPEN_DECODE, 16)
+    values = start_stop(values, tables.TELEPEN_START, tables.TELEPEN_END)
+    if not len(values) or -values[:-1].sum() % 127 != values[-1]:
+        raise ValueError('Wrong checksum')
+    text = []
+    for value in values[:-1]:
+        if value == build_maps.TELEPEN_SWITCH:
+            numeric = not numeric
+        elif numeric:
+            if value not in tables.TELEPEN_PAIR_DIGITS:
+                raise ValueError(f'Invalid Telepen numeric value {value}')
+            text.append(tables.TELEPEN_PAIR_DIGITS[value])
+        else:
+            text.append(chr(value))
+    return ''.join(text)
+
+
+def codabar(row):
+    """Codabar, with the start and stop characters"""
+    row = pad(trim(row), len(trim(row)) + 1)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(row)) + 1))
+    if len(starts) % 8:
+        raise ValueError('Wrong number of Codabar bars')
+    bounds = np.append(starts[0::8], len(row))
+    values = np.array([lookup(tables.CODABAR_DECODE,
+                              row[None, start:end])[0]
+                       for start, end in zip(bounds[:-1], bounds[1:])])
+    text = ''.join(tables.CODABAR_CHARS[value] for value in values)
+    if (len(text) < 2 or text[0] not in 'ABCD' or text[-1] not in 'ABCD'
+            or any(char in 'ABCD' for char in text[1:-1])):
+        raise ValueError('Invalid start or stop character')
+    return text
+
+
+def rm4scc(row):
+    """RM4SCC, from the bar types"""
+    row = np.asarray(row, dtype=np.uint8)
+    if len(row) < 2 or row[0] != 1 or row[-1] != 3:
+        raise ValueError('Invalid start or stop bar')
+    values = symbols(row[1:-1], tables.RM4SCC_DECODE, 4, bits=2)
+    if not len(values):
+        raise ValueError('No RM4SCC character')
+    text = ''.join(build_maps.RM4SCC_CHARS[value] for value in values[:-1])
+    if check_digits.rm4scc([text])[0] != values[-1]:
+        raise ValueError('Wrong checksum')
+    return text
+
+
+def postnet(row):
+    """POSTNET, from the bar types"""
+    row = np.asarray(row, dtype=np.uint8)
+    if len(row) < 2 or row[0] != 3 or row[-1] != 3:
+        raise ValueError('Invalid start or stop bar')
+    values = symbols(row[1:-1], tables.POSTNET_DECODE, 5, bits=2)
+    if not len(values) or -values[:-1].sum() % 10 != values[-1]:
+        raise ValueError('Wrong checksum')
+    return ''.join(map(str, values[:-1]))
+
+
+# The decoders, named like the encoders
+DECODERS = {
+    'code39': code39,
+    'code93': code93,
+    'code128': code128,
+    'gs128': code128,
+    'itf': itf,
+    'itf14': itf14,
+    'itf16': itf16,
+    'ean13': ean13,
+    'ean8': ean8,
+    'ean5': ean5,
+    'ean2': ean2,
+    'upca': upca,
+    'upce': upce,
+    'telepen': telepen,
+    'codabar': codabar,
+    'rm4scc': rm4scc,
+    'postnet': postnet,
+}
+
+
+def decode(symbology, row, numeric=False):
+    """Data of a barcode from its modules, raises ValueError if it can't
+    be decoded. With numeric, the Telepen data starts in the numeric
+    mode"""
+    if symbology not in DECODERS:
+        raise ValueError(f'Unknown symbology "{symbology}"')
+    if symbology == 'telepen':
+        return telepen(row, numeric)
+    return DECODERS[symbology](row)
+
+
+def scanline(pixels, threshold=None):
+    """Modules of a 1D barcode from a row of pixels: booleans, True for
+    black, or gray levels darker than threshold. The module width is the
+    narrowest bar or space"""
+    pixels = np.asarray(pixels)
+    if pixels.dtype != bool:
+        if threshold is None:
+            threshold = (int(pixels.min()) + int(pixels.max())) / 2
+        pixels = pixels < threshold
+    row = trim(pixels)
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(row)) + 1))
+    runs = np.diff(np.append(starts, len(row)))
+    counts = np.maximum(np.rint(runs / runs.min()).astype(np.intp), 1)
+    return np.repeat(row[starts], counts)
+
+
+def hm_scan(image, threshold=None):
+    """Bar types of a height modulated barcode from its image: booleans,
+    True for black, or gray levels darker than threshold. The bars are
+    found on the middle row, their types from the top and bottom rows"""
+    image = np.asarray(image)
+    if image.dtype != bool:
+        if threshold is None:
+            threshold = (int(image.min()) + int(image.max())) / 2
+        image = image < threshold
+    rows = np.flatnonzero(image.any(axis=1))
+    if not len(rows):
+        raise ValueError('No barcode found')
+    image = image[rows[0]:rows[-1] + 1]
+    middle = image[len(image) // 2]
+    edges = np.diff(np.concatenate(([0], middle.astype(np.int8), [0])))
+    bars = np.flatnonzero(edges == 1)
+    return (image[0, bars] | image[-1, bars].astype(np.uint8) << 1).astype(
+        np.uint8)
+
+
+def check_digit(code):
+    """GS1 check digit of a code given without it"""
+    digits = check_digits.values([code], check_digits.DIGIT_VALUES)
+    return str(check_digits.mod10(digits)[0])
+
+
+def expected(symbology, code, add_checksum=False, zero_prepend=False,
+             fixed_length=None, gs1=False, escapes=False,
+             explicit_start_stop=False, start='A', stop='B', full_ascii=False,
+             **options):
+    """The decoded data of a code encoded with the options. The GS1 codes
+    can be given with or without their check digit, the UPC-E codes are
+    expanded to UPC-A, and the Code 39 full ASCII codes are not decoded"""
+    if symbology in ('code128', 'gs128'):
+        return code128_adapt(code, gs1 or symbology == 'gs128', escapes)
+    if symbology == 'postnet':
+        return code.replace('-', '')
+    if symbology == 'code39' and full_ascii:
+        return ''.join(tables.CODE39_ASCII[ord(char)] for char in code)
+    if symbology == 'codabar':
+        if explicit_start_stop:
+            return (tables.CODABAR_START_STOP.get(code[0], code[0]) +
+                    code[1:-1] +
+                    tables.CODABAR_START_STOP.get(code[-1], code[-1]))
+        return start + code + stop
+
+    lengths = dict(ean13=13, ean8=8, upca=12, upce=12, itf14=14, itf16=16,
+                   itf=fixed_length)
+    if symbology == 'upce' and len(code) <= 8:
+        code = upce_to_upca(code)
+    if lengths.get(symbology) is not None:
+        return code if len(code) == lengths[symbology] else (
+            code + check_digit(code))
+    if symbology == 'itf':
+        if zero_prepend and (len(code) % 2 != 0) != add_checksum:
+            code = '0' + code
+        return code + check_digit(code) if add_checksum else code
+    return code
+
+
+def verify(symbology, codes, rows, **options):
+    """Decode the rows of modules of a list of codes encoded with the
+    options, as a Batch or a list of arrays. Returns a boolean array, True
+    for the rows decoded to their code"""
+    result = np.zeros(len(codes), dtype=bool)
+    for index, (code, row) in enumerate(zip(codes, rows)):
+        try:
+            text = decode(symbology, row, options.get('numeric', False))
+            if symbology == 'upce' and len(text) == 8:
+                text = upce_to_upca(text)
+            result[index] = text == expected(symbology, code, **options)
+        except ValueError:
+            pass
+    return result
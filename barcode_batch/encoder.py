@@ -0,0 +1,596 @@
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Encode lists of strings to barcode modules.
+
+The codes of a batch are converted at once: the characters are translated
+to symbol indexes with the lookup tables of check_digits.py, the check
+digits are computed with its array functions, then the modules of all the
+symbols are copied to a single array. The result is the same as the
+convert method of the Dart barcodes, module for module.
+"""
+
+import re
+
+import numpy as np
+
+import build_maps
+import check_digits
+from check_digits import DIGIT_VALUES, values
+
+from . import tables
+
+
+class Batch:
+    """The modules of a list of barcodes, one row per barcode, padded with
+    zeros. bits is the number of bits of a module: 1 for the 1D barcodes,
+    2 for the bar types of the height modulated barcodes"""
+
+    def __init__(self, modules, widths, bits=1):
+        self.modules = modules
+        self.widths = widths
+        self.bits = bits
+
+    def __len__(self):
+        return len(self.widths)
+
+    def __getitem__(self, index):
+        return self.modules[index, :self.widths[index]]
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def packed(self):
+        """The modules packed into bytes, most significant bit first, one
+        row per barcode. A bar type uses two bits"""
+        modules = self.modules
+        if self.bits > 1:
+            count, width = modules.shape
+            shifts = np.arange(self.bits - 1, -1, -1, dtype=np.uint8)
+            modules = (modules[:, :, None] >> shifts) & 1
+            modules = modules.reshape(count, width * self.bits)
+        return np.packbits(modules, axis=1)
+
+
+def symbol_rows(count, *parts):
+    """Concatenate the symbols of count barcodes. A part is a symbol index
+    for all the barcodes, an array of one index per barcode, or a 2D array
+    of indexes, -1 for no symbol"""
+    columns = []
+    for part in parts:
+        part = np.asarray(part, dtype=np.intp)
+        if part.ndim == 0:
+            part = np.full((count, 1), part)
+        elif part.ndim == 1:
+            part = part[:, None]
+        columns.append(part)
+    return np.concatenate(columns, axis=1)
+
+
+def ragged(rows):
+    """Convert a list of lists of symbol indexes to a 2D array, padded
+    with -1"""
+    result = np.full((len(rows), max(map(len, rows), default=0)), -1,
+                     dtype=np.intp)
+    for index, row in enumerate(rows):
+        result[index, :len(row)] = row
+    return result
+
+
+def assemble(symbols, alphabet, bits=1):
+    """Copy the modules of the symbols of each barcode to a Batch"""
+    modules, widths = alphabet
+    valid = symbols >= 0
+    lengths = np.where(valid, widths[symbols], 0)
+    ends = np.cumsum(lengths, axis=1)
+    total = ends[:, -1] if ends.shape[1] else np.zeros(len(ends), np.intp)
+    result = np.zeros((len(symbols), int(total.max(initial=0))),
+                      dtype=np.uint8)
+
+    rows, cols = np.nonzero(valid)
+    index = symbols[rows, cols]
+    span = np.arange(modules.shape[1])
+    mask = span < widths[index][:, None]
+    positions = (ends - lengths)[rows, cols][:, None] + span
+    rows = np.broadcast_to(rows[:, None], mask.shape)
+    result[rows[mask], positions[mask]] = modules[index][mask]
+    return Batch(result, total, bits)
+
+
+def ascii_chars(codes, table):
+    """Expand the characters of the codes to their full ASCII encoding"""
+    for code in codes:
+        for char in code:
+            if ord(char) >= len(table):
+                raise ValueError(f'Unable to encode "{char}" in "{code}"')
+    return [[table[ord(char)] for char in code] for code in codes]
+
+
+def code39(codes, full_ascii=False):
+    """Code 39, without check digit. With full_ascii, the ASCII characters
+    that are not in Code 39 are encoded with two symbols"""
+    if full_ascii:
+        codes = [''.join(chars)
+                 for chars in ascii_chars(codes, tables.CODE39_ASCII)]
+    data = values(codes, tables.CODE39_VALUES)
+    return assemble(symbol_rows(len(codes), tables.CODE39_START_STOP, data,
+                                tables.CODE39_START_STOP), tables.CODE39)
+
+
+def code93(codes, full_ascii=False):
+    """Code 93, with the C and K check characters. With full_ascii, the
+    ASCII characters that are not in Code 93 are encoded with a shift"""
+    if full_ascii:
+        rows = [sum(chars, ()) for chars in ascii_chars(codes,
+                                                         tables.CODE93_ASCII)]
+        data = ragged(rows)
+        checks = check_digits.mod47_values(
+            ragged([row[::-1] for row in rows])[:, ::-1])
+    else:
+        data = values(codes, check_digits.CODE93_VALUES)
+        checks = check_digits.mod47(codes)
+    return assemble(symbol_rows(len(codes), tables.CODE93_START_STOP, data,
+                                checks, tables.CODE93_START_STOP,
+                                tables.CODE93_TERMINATION), tables.CODE93)
+
+
+def code128_adapt(code, gs1=False, escapes=False):
+    """Insert the function characters: FNC1 at the GS1 application
+    identifiers in parenthesis, and {1} to {4} escapes"""
+    if gs1:
+        code = re.sub(r'\((.+?)\)',
+                      lambda match: tables.CODE128_FNC[0] + match.group(1),
+                      code)
+    if escapes:
+        code = re.sub(r'{[1-4]}',
+                      lambda match: tables.CODE128_FNC[int(match.group(0)[1])
+                                                       - 1], code)
+    return code
+
+
+def code128_shortest(code, classes):
+    """Shortest list of Code 128 values, starting with the start symbol,
+    using a mix of the sets enabled by classes"""
+    set_a, set_b, set_c = range(3)
+    data = [ord(char) for char in code]
+    if not data:
+        return []
+
+    # Number of characters consumed by one symbol of each set at each
+    # position, 0 if the set can't encode the character
+    code_classes = []
+    for char, unit in zip(code, data):
+        code_class = tables.CODE128_CLASSES.get(unit, 0) & classes
+        if code_class == 0:
+            raise ValueError(f'Unable to encode "{char}" in "{code}"')
+        code_classes.append(code_class)
+
+    steps = []
+    for index, code_class in enumerate(code_classes):
+        step = [int(code_class & tables.CODE128_CLASS_A != 0),
+                int(code_class & tables.CODE128_CLASS_B != 0),
+                int(code_class & tables.CODE128_CLASS_C != 0)]
+        if (not step[set_c] and code_class & tables.CODE128_CLASS_DIGIT
+                and index + 1 < len(data)
+                and code_classes[index + 1] & tables.CODE128_CLASS_DIGIT):
+            step[set_c] = 2
+        steps.append(step)
+
+    # Minimal cost to encode the data after each position, for each
+    # current set
+    symbol = build_maps.C128_SYMBOL_COST
+    shift = build_maps.C128_SHIFT_COST
+    switch = build_maps.C128_SWITCH_COST
+    unreachable = float('inf')
+    costs = [[unreachable] * 3 for _ in range(len(data))] + [[0] * 3]
+
+    def cost(index, current, target):
+        # Cost to encode the data from index with a symbol of target
+        step = steps[index][target]
+        if not step:
+            return unreachable
+        return (costs[index + step][target] + symbol +
+                (0 if target == current else switch))
+
+    for index in range(len(data) - 1, -1, -1):
+        for current in range(3):
+            best = min(cost(index, current, target) for target in range(3))
+            if current != set_c:
+                other = set_b if current == set_a else set_a
+                if steps[index][other]:
+                    best = min(best, costs[index + 1][current] + symbol +
+                               shift)
+            costs[index][current] = best
+
+    def value(index, code_set):
+        if code_set == set_c and steps[index][set_c] == 2:
+            pair = (data[index] - 0x30) * 10 + data[index + 1] - 0x30
+            return tables.CODE128_SETS[set_c][pair]
+        return tables.CODE128_SETS[code_set][data[index]]
+
+    # The sets to try, in order of preference, when several encodings have
+    # the same length
+    preferred = (set_c, set_a, set_b)
+
+    current = -1
+    best = unreachable
+    for target in preferred:
+        step = steps[0][target]
+        if step and costs[step][target] < best:
+            current = target
+            best = costs[step][target]
+    if current < 0:
+        raise ValueError(f'Unable to encode "{code}"')
+
+    result = [tables.CODE128_START[current]]
+
+    # Follow the path of minimal cost
+    index = 0
+    while index < len(data):
+        for target in preferred:
+            if cost(index, current, target) == costs[index][current]:
+                if target != current:
+                    result.append(tables.CODE128_LATCH[current][target])
+                result.append(value(index, target))
+                index += steps[index][target]
+                current = target
+                break
+        else:
+            # Shift one character to the other set
+            result.append(tables.CODE128_SHIFT)
+            result.append(value(index, set_b if current == set_a else set_a))
+            index += 1
+
+    return result
+
+
+def code128_values(codes, use_a=True, use_b=True, use_c=True, gs1=False,
+                   escapes=False):
+    """Code 128 values of the shortest encoding of each code using the
+    sets A, B and C enabled, starting with the start symbol, padded with
+    -1"""
+    classes = ((tables.CODE128_CLASS_A if use_a else 0) |
+               (tables.CODE128_CLASS_B if use_b else 0) |
+               (tables.CODE128_CLASS_C | tables.CODE128_CLASS_DIGIT
+                if use_c else 0))
+    return ragged([code128_shortest(code128_adapt(code, gs1, escapes),
+                                    classes) for code in codes])
+
+
+def code128(codes, use_a=True, use_b=True, use_c=True, gs1=False,
+            escapes=False):
+    """Code 128, the shortest encoding using the sets A, B and C enabled"""
+    data = code128_values(codes, use_a, use_b, use_c, gs1, escapes)
+    checks = check_digits.mod103(np.maximum(data, 0))
+    return assemble(symbol_rows(len(codes), data, checks,
+                                tables.CODE128_STOP), tables.CODE128)
+
+
+def gs128(codes, **options):
+    """GS1-128, the application identifiers are given in parenthesis"""
+    return code128(codes, gs1=True, **options)
+
+
+def gs1_digits(codes, length):
+    """Digits of the GS1 codes of length digits. The check digit is
+    computed for the codes given without it, verified for the others"""
+    for code in codes:
+        if len(code) not in (length - 1, length):
+            raise ValueError(f'"{code}" is not {length} digits')
+
+    digits = values([code[:length - 1] for code in codes], DIGIT_VALUES)
+    checks = check_digits.mod10(digits)
+    given = np.array([ord(code[-1]) - 0x30 if len(code) == length else -1
+                      for code in codes], dtype=np.intp)
+    wrong = np.flatnonzero((given >= 0) & (given != checks))
+    if len(wrong):
+        code = codes[wrong[0]]
+        raise ValueError(f'The checksum of "{code}" should be '
+                         f'"{checks[wrong[0]]}"')
+    return np.concatenate((digits.reshape(len(codes), length - 1),
+                           checks[:, None]), axis=1)
+
+
+def ean13(codes):
+    """EAN 13, the check digit is added if missing"""
+    digits = gs1_digits(codes, 13)
+    parity = tables.EAN13_PARITY[digits[:, 0]]
+    return assemble(symbol_rows(
+        len(codes), tables.EAN_START_END,
+        tables.EAN_L + digits[:, 1:7] + (tables.EAN_G - tables.EAN_L) * parity,
+        tables.EAN_CENTER, tables.EAN_R + digits[:, 7:],
+        tables.EAN_START_END), tables.EAN)
+
+
+def ean8(codes):
+    """EAN 8, the check digit is added if missing"""
+    digits = gs1_digits(codes, 8)
+    return assemble(symbol_rows(
+        len(codes), tables.EAN_START_END, tables.EAN_L + digits[:, :4],
+        tables.EAN_CENTER, tables.EAN_R + digits[:, 4:],
+        tables.EAN_START_END), tables.EAN)
+
+
+def upca_rows(digits):
+    """Symbols of UPC-A codes, from their 12 digits"""
+    return symbol_rows(
+        len(digits), tables.EAN_START_END, tables.EAN_L + digits[:, :6],
+        tables.EAN_CENTER, tables.EAN_R + digits[:, 6:],
+        tables.EAN_START_END)
+
+
+def upca(codes):
+    """UPC-A, the check digit is added if missing"""
+    return assemble(upca_rows(gs1_digits(codes, 12)), tables.EAN)
+
+
+def ean2(codes):
+    """EAN 2 supplement"""
+    digits = check_digits.fixed_digits(codes, 2).reshape(len(codes), 2)
+    pattern = (digits[:, 0] * 10 + digits[:, 1]) % 4
+    sets = (tables.EAN_G - tables.EAN_L) * np.stack(
+        (pattern >> 1, pattern & 1), axis=1)
+    symbols = tables.EAN_L + digits + sets
+    return assemble(symbol_rows(
+        len(codes), tables.EAN_START_EAN2, symbols[:, 0],
+        tables.EAN_CENTER_EAN2, symbols[:, 1]), tables.EAN)
+
+
+def ean5(codes):
+    """EAN 5 supplement"""
+    digits = check_digits.fixed_digits(codes, 5).reshape(len(codes), 5)
+    checksum = (digits.astype(np.int64) @ (3, 9, 3, 9, 3)) % 10
+    parity = tables.EAN5_PARITY[checksum]
+    symbols = np.full((len(codes), 9), tables.EAN_CENTER_EAN2, dtype=np.intp)
+    symbols[:, 0::2] = (tables.EAN_L + digits +
+                        (tables.EAN_G - tables.EAN_L) * parity)
+    return assemble(symbol_rows(len(codes), tables.EAN_START_EAN2, symbols),
+                    tables.EAN)
+
+
+def upce_to_upca(code):
+    """Expand a UPC-E code of 6 to 8 digits to UPC-A, without the check
+    digit if it was not given"""
+    if not re.fullmatch(r'\d{6,8}', code):
+        raise ValueError(f'Unable to convert "{code}" to UPC-A')
+
+    first, check = '0', ''
+    if len(code) >= 7:
+        first, check = code[0], code[7:]
+        code = code[1:7]
+    if first not in '01':
+        raise ValueError(f'Unable to convert "{code}" to UPC-A')
+
+    if code[5] in '012':
+        manufacturer, product = code[:2] + code[5] + '00', '00' + code[2:5]
+    elif code[5] == '3':
+        manufacturer, product = code[:3] + '00', '000' + code[3:5]
+    elif code[5] == '4':
+        manufacturer, product = code[:4] + '0', '0000' + code[4]
+    else:
+        manufacturer, product = code[:5], '0000' + code[5]
+    return first + manufacturer + product + check
+
+
+def upca_to_upce(code):
+    """The 6 UPC-E digits of a 12 digits UPC-A code, None if it can't be
+    converted"""
+    if not re.fullmatch(r'[01]\d{11}', code):
+        return None
+
+    manufacturer, product = code[1:6], int(code[6:11])
+    if manufacturer[-3:] in ('000', '100', '200') and product <= 999:
+        return manufacturer[:2] + code[8:11] + manufacturer[2]
+    if manufacturer[-2:] == '00' and product <= 99:
+        return manufacturer[:3] + code[9:11] + '3'
+    if manufacturer[-1] == '0' and product <= 9:
+        return manufacturer[:4] + code[10] + '4'
+    if manufacturer[-1] != '0' and 5 <= product <= 9:
+        return manufacturer + code[10]
+    return None
+
+
+def upce(codes, fallback=False):
+    """UPC-E, given as UPC-E or UPC-A codes. With fallback, the codes that
+    can't be converted to UPC-E are encoded as UPC-A"""
+    digits = gs1_digits([upce_to_upca(code) if len(code) <= 8 else code
+                         for code in codes], 12)
+    upcas = [row.tobytes().decode()
+             for row in (digits + 0x30).astype(np.uint8)]
+    converted = [upca_to_upce(code) for code in upcas]
+    short = np.array([code is not None for code in converted], dtype=bool)
+    if not fallback and not short.all():
+        code = upcas[np.flatnonzero(~short)[0]]
+        raise ValueError(f'Unable to convert "{code}" to UPC-E')
+
+    upces = values([code for code in converted if code is not None],
+                   DIGIT_VALUES).reshape(int(short.sum()), 6)
+    parity = tables.UPCE_PARITY[digits[short, 11]] ^ digits[short, :1]
+    symbols = upces + (tables.EAN_G - tables.EAN_L) * (1 - parity)
+
+    result = np.full((len(codes), 15 if not short.all() else 8), -1,
+                     dtype=np.intp)
+    result[short, :8] = symbol_rows(len(upces), tables.EAN_START_END,
+                                    symbols, tables.EAN_END_UPCE)
+    if not short.all():
+        result[~short] = upca_rows(digits[~short])
+    return assemble(result, tables.EAN)
+
+
+def itf(codes, add_checksum=False, zero_prepend=False, fixed_length=None):
+    """Interleaved 2 of 5, an even number of digits. fixed_length codes get
+    their check digit added if missing"""
+    if fixed_length is not None:
+        return assemble(itf_rows(gs1_digits(codes, fixed_length)), tables.ITF)
+
+    if zero_prepend:
+        codes = ['0' + code if (len(code) % 2 != 0) != add_checksum else code
+                 for code in codes]
+    if add_checksum:
+        digits = values(codes, DIGIT_VALUES, right=True)
+        checks = check_digits.mod10(np.maximum(digits, 0))
+        codes = [code + str(check) for code, check in zip(codes, checks)]
+    for code in codes:
+        if len(code) % 2 != 0:
+            raise ValueError(f'"{code}" is not an even number of digits')
+    return assemble(itf_rows(values(codes, DIGIT_VALUES)), tables.ITF)
+
+
+def itf_rows(digits):
+    """Symbols of ITF codes, from their digits padded with -1"""
+    pairs = np.where(digits[:, 0::2] >= 0,
+                     digits[:, 0::2] * 10 + digits[:, 1::2], -1)
+    return symbol_rows(len(digits), tables.ITF_START, pairs, tables.ITF_END)
+
+
+def itf14(codes):
+    """ITF-14, the check digit is added if missing"""
+    return itf(codes, True, True, 14)
+
+
+def itf16(codes):
+    """ITF-16, the check digit is added if missing"""
+    return itf(codes, True, True, 16)
+
+
+def telepen_pairs(code):
+    """The Telepen characters of a numeric code, "X" can complete the last
+    pair"""
+    if len(code) % 2:
+        raise ValueError(f'"{code}" has an odd number of digits')
+    pairs = [code[i:i + 2] for i in range(0, len(code), 2)]
+    for pair in pairs:
+        if pair not in tables.TELEPEN_PAIRS:
+            raise ValueError(f'Unable to encode "{pair}" in "{code}"')
+    return [tables.TELEPEN_PAIRS[pair] for pair in pairs]
+
+
+def telepen_switch(code):
+    """The Telepen characters of an ASCII code, the runs of digits long
+    enough being encoded by pairs between DLE characters"""
+    for char in code:
+        if ord(char) >= 128:
+            raise ValueError(f'Unable to encode "{char}" in "{code}"')
+    if chr(build_maps.TELEPEN_SWITCH) in code:
+        raise ValueError(f'Unable to encode DLE in "{code}" when switching '
+                         'to the numeric mode')
+
+    result = []
+    index = 0
+    for match in re.finditer('[0-9]+', code):
+        start, end = match.span()
+        shortest = (build_maps.TELEPEN_NUMERIC_END if end == len(code)
+                    else build_maps.TELEPEN_NUMERIC_MIDDLE)
+        if end - start < shortest:
+            continue
+        # The first digit of an odd run stays in the ASCII mode
+        start += (end - start) % 2
+        result.extend(map(ord, code[index:start]))
+        result.append(build_maps.TELEPEN_SWITCH)
+        result.extend(telepen_pairs(code[start:end]))
+        if end < len(code):
+            result.append(build_maps.TELEPEN_SWITCH)
+        index = end
+    result.extend(map(ord, code[index:]))
+    return result
+
+
+def telepen(codes, numeric=False, switch_numeric=False):
+    """Telepen, full ASCII. With numeric, the digits are encoded by pairs,
+    with switch_numeric, the runs of digits of the ASCII codes"""
+    if numeric and switch_numeric:
+        raise ValueError('The numeric mode has no ASCII characters to '
+                         'switch from')
+    if numeric:
+        data = ragged([telepen_pairs(code) for code in codes])
+    elif switch_numeric:
+        data = ragged([telepen_switch(code) for code in codes])
+    else:
+        data = values(codes, tables.TELEPEN_VALUES)
+    checks = -np.maximum(data, 0).sum(axis=1, dtype=np.int64) % 127
+    return assemble(symbol_rows(len(codes), tables.TELEPEN_START, data, checks,
+                                tables.TELEPEN_END), tables.TELEPEN)
+
+
+def codabar(codes, start='A', stop='B', explicit_start_stop=False):
+    """Codabar, with start and stop characters A to D. With
+    explicit_start_stop they are the first and last characters of the codes,
+    where T, N, * and E can stand for A, B, C and D"""
+    if explicit_start_stop:
+        for code in codes:
+            if len(code) < 2:
+                raise ValueError(f'"{code}" has no start and stop characters')
+        starts = [tables.CODABAR_START_STOP.get(code[0], code[0])
+                  for code in codes]
+        stops = [tables.CODABAR_START_STOP.get(code[-1], code[-1])
+                 for code in codes]
+        codes = [code[1:-1] for code in codes]
+    else:
+        starts = [start] * len(codes)
+        stops = [stop] * len(codes)
+
+    starts = values(starts, tables.CODABAR_VALUES).reshape(-1)
+    stops = values(stops, tables.CODABAR_VALUES).reshape(-1)
+    data = values(codes, tables.CODABAR_DATA_VALUES)
+    return assemble(symbol_rows(len(codes), starts, data,
+                                stops + tables.CODABAR_STOP), tables.CODABAR)
+
+
+def rm4scc(codes):
+    """RM4SCC, the modules are bar types"""
+    data = values(codes, check_digits.RM4SCC_VALUES)
+    checks = check_digits.rm4scc(codes)
+    return assemble(symbol_rows(len(codes), tables.RM4SCC_START, data, checks,
+                                tables.RM4SCC_STOP), tables.RM4SCC, bits=2)
+
+
+def postnet(codes):
+    """POSTNET, the dashes are ignored, the modules are bar types"""
+    codes = [code.replace('-', '') for code in codes]
+    data = values(codes, DIGIT_VALUES)
+    checks = -np.maximum(data, 0).sum(axis=1, dtype=np.int64) % 10
+    return assemble(symbol_rows(len(codes), tables.POSTNET_START_STOP, data,
+                                checks, tables.POSTNET_START_STOP),
+                    tables.POSTNET, bits=2)
+
+
+# The encoders, named like the Dart Barcode constructors
+SYMBOLOGIES = {
+    'code39': code39,
+    'code93': code93,
+    'code128': code128,
+    'gs128': gs128,
+    'itf': itf,
+    'itf14': itf14,
+    'itf16': itf16,
+    'ean13': ean13,
+    'ean8': ean8,
+    'ean5': ean5,
+    'ean2': ean2,
+    'upca': upca,
+    'upce': upce,
+    'telepen': telepen,
+    'codabar': codabar,
+    'rm4scc': rm4scc,
+    'postnet': postnet,
+}
+
+
+def encode(symbology, codes, **options):
+    """Encode a list of strings with the symbology, the options are the
+    keyword arguments of its encoder. Returns a Batch"""
+    if symbology not in SYMBOLOGIES:
+        raise ValueError(f'Unknown symbology "{symbology}"')
+    return SYMBOLOGIES[symbology](list(codes), **options)
@@ -0,0 +1,259 @@
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generate the label files of a list of barcodes across processes.
+
+The rows are read from a CSV or JSONL file with the symbology, the data,
+an optional file name and the options of the encoder. They are split in
+chunks, each chunk is encoded and rendered by a worker process, one batch
+per symbology and options, and the files are written in the order of the
+rows, to a directory or an archive. Only a few chunks are pending at any
+time, so the memory used doesn't depend on the number of rows.
+"""
+
+import collections
+import csv
+import io
+import json
+import multiprocessing
+import os
+import tarfile
+import zipfile
+
+from . import decode, render
+from .encoder import encode
+
+# Default number of rows encoded by a worker at once
+CHUNK_SIZE = 1000
+
+# The output file formats
+FORMATS = ('svg', 'png', 'pbm')
+
+
+class Label:
+    """A barcode to generate: the symbology, the data, the name of the
+    output file without extension, and the options of the encoder"""
+
+    def __init__(self, symbology, data, name, options=None):
+        self.symbology = symbology
+        self.data = data
+        self.name = name
+        self.options = options or {}
+
+
+def option(value):
+    """Value of an option given in a CSV column: JSON if possible, else
+    the string itself"""
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
+def read_csv(file):
+    """Labels of a CSV file with a header: the symbology and data columns,
+    an optional name column, the other columns are options. An options
+    column can give a JSON object"""
+    for index, row in enumerate(csv.DictReader(file)):
+        symbology = row.pop('symbology')
+        data = row.pop('data')
+        name = row.pop('name', None) or f'{index:07d}'
+        options = json.loads(row.pop('options', None) or '{}')
+        options.update((key, option(value)) for key, value in row.items()
+                       if value)
+        yield Label(symbology, data, name, options)
+
+
+def read_jsonl(file):
+    """Labels of a JSONL file, one object per line with the symbology,
+    data, name and options keys, the name and options being optional"""
+    for index, line in enumerate(filter(str.strip, file)):
+        row = json.loads(line)
+        yield Label(row['symbology'], row['data'],
+                    row.get('name') or f'{index:07d}', row.get('options'))
+
+
+READERS = {
+    'csv': read_csv,
+    'jsonl': read_jsonl,
+}
+
+
+def chunks(labels, size):
+    """Split an iterable of labels into lists of size labels"""
+    chunk = []
+    for label in labels:
+        chunk.append(label)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def encode_labels(labels):
+    """Encode a list of labels of the same symbology and options. Returns
+    one (modules, bits, error) tuple per label"""
+    label = labels[0]
+    try:
+        batch = encode(label.symbology, [item.data for item in labels],
+                       **label.options)
+        return [(modules, batch.bits, None) for modules in batch]
+    except (ValueError, TypeError) as e:
+        if len(labels) == 1:
+            return [(None, 0, str(e))]
+    # Find the labels that can't be encoded
+    return [encode_labels([item])[0] for item in labels]
+
+
+def render_chunk(chunk, file_format, settings):
+    """Encode and render a chunk of labels, in a worker process. Returns
+    one (file name, content, error) tuple per label"""
+    groups = collections.defaultdict(list)
+    for index, label in enumerate(chunk):
+        key = (label.symbology, json.dumps(label.options, sort_keys=True))
+        groups[key].append(index)
+
+    encoded = [None] * len(chunk)
+    for indexes in groups.values():
+        results = encode_labels([chunk[index] for index in indexes])
+        for index, result in zip(indexes, results):
+            encoded[index] = result
+
+    files = []
+    for label, (modules, bits, error) in zip(chunk, encoded):
+        name = f'{label.name}.{file_format}'
+        if error is None and settings['verify'] and not decode.verify(
+                label.symbology, [label.data], [modules],
+                **label.options)[0]:
+            error = 'The barcode does not decode to its data'
+        if error is not None:
+            files.append((name, None, error))
+        elif file_format == 'svg':
+            files.append((name, render.svg(
+                modules, bits, settings['width'],
+                settings['height']).encode(), None))
+        else:
+            image = render.raster(modules, bits, settings['module'],
+                                  settings['bar_height'],
+                                  quiet=settings['quiet'])
+            files.append((name, render.pbm(image) if file_format == 'pbm'
+                          else render.png(image, settings['dpi']), None))
+    return files
+
+
+def safe_name(name):
+    """Check that a file name stays inside the output directory"""
+    parts = name.replace('\\', '/').split('/')
+    if name.startswith('/') or '..' in parts or '' in parts:
+        raise ValueError(f'Invalid file name "{name}"')
+    return name
+
+
+class DirectoryWriter:
+    """Write the files to a directory"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, name, content):
+        path = os.path.join(self.path, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+
+    def close(self):
+        pass
+
+
+class ZipWriter:
+    """Write the files to a zip archive, the SVG files compressed"""
+
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path, 'w')
+
+    def write(self, name, content):
+        compression = (zipfile.ZIP_DEFLATED if name.endswith('.svg')
+                       else zipfile.ZIP_STORED)
+        self.archive.writestr(name, content, compress_type=compression)
+
+    def close(self):
+        self.archive.close()
+
+
+class TarWriter:
+    """Write the files to a tar archive, compressed if the path ends
+    with .gz"""
+
+    def __init__(self, path):
+        mode = 'w:gz' if path.endswith(('.gz', '.tgz')) else 'w'
+        self.archive = tarfile.open(path, mode)
+
+    def write(self, name, content):
+        info = tarfile.TarInfo(name)
+        info.size = len(content)
+        self.archive.addfile(info, io.BytesIO(content))
+
+    def close(self):
+        self.archive.close()
+
+
+def writer(path):
+    """The writer of an output path: an archive for the .zip, .tar, .tgz
+    and .tar.gz files, else a directory"""
+    if path.endswith('.zip'):
+        return ZipWriter(path)
+    if path.endswith(('.tar', '.tgz', '.tar.gz')):
+        return TarWriter(path)
+    return DirectoryWriter(path)
+
+
+def generate(labels, output, file_format='svg', jobs=None,
+             chunk_size=CHUNK_SIZE, **settings):
+    """Render an iterable of labels to the output writer using a pool of
+    jobs processes. The settings are the width and height of the SVG
+    files, the module width and bar height in pixels of the PNG and PBM
+    files with the number of quiet modules on each side, the resolution
+    stored in the PNG files, and verify to decode each barcode and
+    compare it to its data.
+    Yields the (file name, error) of the labels that can't be encoded"""
+    if file_format not in FORMATS:
+        raise ValueError(f'Unknown file format "{file_format}"')
+    settings = dict(dict(width=200, height=80, module=2, bar_height=80,
+                         quiet=0, dpi=None, verify=False),
+                    **settings)
+    jobs = jobs or os.cpu_count() or 1
+
+    with multiprocessing.Pool(jobs) as pool:
+        pending = collections.deque()
+        source = chunks(labels, chunk_size)
+        while True:
+            # Keep two chunks per process queued
+            while len(pending) < jobs * 2:
+                chunk = next(source, None)
+                if chunk is None:
+                    break
+                pending.append(pool.apply_async(
+                    render_chunk, (chunk, file_format, settings)))
+            if not pending:
+                break
+            for name, content, error in pending.popleft().get():
+                try:
+                    name = safe_name(name)
+                except ValueError as e:
+                    content, error = None, str(e)
+                if error is None:
+                    output.write(name, content)
+                else:
+                    yield name, error
@@ -0,0 +1,191 @@
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Render the modules of a barcode to SVG, PBM or PNG.
+
+The SVG output is the same as the Dart toSvg method with drawText set to
+false. The PBM and PNG images are black and white, one bit per pixel,
+built from a Raster: each distinct line of pixels is packed into bytes
+once, from the modules, and written as many times as it is repeated,
+instead of drawing the bars one rectangle at a time.
+"""
+
+import struct
+import zlib
+
+import numpy as np
+
+# Height of the tracker of the height modulated barcodes, relative to the
+# height of the full bars, as the Dart BarcodeHM default
+TRACKER = 0.3
+
+
+def number(value):
+    """Format a number like the Dart SVG output"""
+    return f'{value:.5f}'
+
+
+def bars(row):
+    """Start and length of the runs of black modules of a 1D barcode"""
+    edges = np.diff(np.concatenate(([0], row.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    return starts, np.flatnonzero(edges == -1) - starts
+
+
+def hm_bars(row, height, tracker=TRACKER):
+    """Top and height of each bar of a height modulated barcode, from its
+    bar types: 0 tracker, 1 ascender, 2 descender, 3 full"""
+    size = height * tracker
+    middle = height / 2 - size / 2
+    long = height / 2 + size / 2
+    tops = np.array([middle, 0, middle, 0])
+    heights = np.array([size, long, long, height])
+    return tops[row], heights[row]
+
+
+def svg(row, bits=1, width=200, height=80, color=0x000000):
+    """SVG document of a barcode, row is its modules, or its bar types if
+    bits is 2"""
+    path = []
+    if len(row) and bits == 1:
+        line_width = width / len(row)
+        for start, count in zip(*bars(row)):
+            path.append(f'M {number(start * line_width)} {number(0)} '
+                        f'h {number(count * line_width)} '
+                        f'v {number(height)} '
+                        f'h {number(-(count * line_width))} z ')
+    elif len(row):
+        line_width = width / (len(row) * 2 - 1)
+        for index, (top, bar_height) in enumerate(zip(*hm_bars(row, height))):
+            path.append(f'M {number(index * 2 * line_width)} {number(top)} '
+                        f'h {number(line_width)} '
+                        f'v {number(bar_height)} '
+                        f'h {number(-line_width)} z ')
+
+    fill = f'#{color & 0xffffff:06x}'
+    return (f'<svg viewBox="{number(0)} {number(0)} {number(width)} '
+            f'{number(height)}" xmlns="http://www.w3.org/2000/svg">'
+            f'<path d="{"".join(path)}" style="fill: {fill}"/>'
+            f'<text style="fill: {fill}; font-family: &quot;monospace&quot;; '
+            f'font-size: {number(height * 0.2)}px" x="{number(0)}" '
+            f'y="{number(0)}"></text></svg>')
+
+
+class Raster:
+    """A 1 bit image: its distinct lines of pixels packed into bytes, most
+    significant bit first, 1 for black, and the number of consecutive rows
+    of each line"""
+
+    def __init__(self, width, lines, counts):
+        self.width = width
+        self.lines = lines
+        self.counts = counts
+
+    @property
+    def height(self):
+        return int(self.counts.sum())
+
+    @classmethod
+    def from_image(cls, image):
+        """Raster of a 2D boolean array, True for black"""
+        image = np.asarray(image, dtype=bool)
+        changes = np.flatnonzero((image[1:] != image[:-1]).any(axis=1)) + 1
+        starts = np.concatenate(([0], changes)).astype(np.intp)
+        counts = np.diff(np.append(starts, len(image)))
+        return cls(image.shape[1], np.packbits(image[starts], axis=1),
+                   counts)
+
+    def image(self):
+        """The raster as a 2D boolean array, True for black"""
+        line = np.unpackbits(self.lines, axis=1, count=self.width)
+        return np.repeat(line.astype(bool), self.counts, axis=0)
+
+    def rows(self, invert=False):
+        """The packed lines as bytes, with their number of rows"""
+        lines = np.invert(self.lines) if invert else self.lines
+        for line, count in zip(lines, self.counts):
+            yield line.tobytes(), int(count)
+
+
+def raster(row, bits=1, module=2, height=80, tracker=TRACKER, quiet=0):
+    """Raster of a 1D barcode, row is its modules, or its bar types if bits
+    is 2. Each module is module pixels wide, with quiet modules of white
+    on both sides"""
+    margin = np.zeros(quiet, dtype=bool)
+    if bits == 1:
+        line = np.repeat(np.concatenate((margin, row.astype(bool), margin)),
+                         module)
+        return Raster(len(line), np.packbits(line)[None],
+                      np.array([height]))
+
+    # A height modulated bar is followed by a gap of the same width
+    size = round(height * tracker)
+    top = (height - size) // 2
+    zones = np.array([(0, 1, 0), (1, 1, 0), (0, 1, 1), (1, 1, 1)], dtype=bool)
+    bands = np.zeros((3, len(row) * 2), dtype=bool)
+    bands[:, 0::2] = zones[row].T
+    margins = np.zeros((3, quiet), dtype=bool)
+    bands = np.concatenate((margins, bands[:, :-1], margins), axis=1)
+    bands = np.repeat(bands, module, axis=1)
+    return Raster(bands.shape[1], np.packbits(bands, axis=1),
+                  np.array([top, size, height - top - size]))
+
+
+def matrix(modules, module=4, quiet=0):
+    """Raster of a 2D barcode, modules is a 2D boolean array, True for
+    black, like the QR-Code and Data Matrix. Each module is a square of
+    module pixels, with quiet modules of white around"""
+    modules = np.pad(np.asarray(modules, dtype=bool), quiet)
+    lines = np.packbits(np.repeat(modules, module, axis=1), axis=1)
+    return Raster(modules.shape[1] * module, lines,
+                  np.full(len(modules), module))
+
+
+def pixels(row, bits=1, module=2, height=80, tracker=TRACKER):
+    """Image of a barcode as a 2D boolean array, True for black. Each
+    module is module pixels wide"""
+    return raster(row, bits, module, height, tracker).image()
+
+
+def pbm(image):
+    """Binary PBM file of a Raster"""
+    header = f'P4\n{image.width} {image.height}\n'.encode()
+    return header + b''.join(line * count for line, count in image.rows())
+
+
+def png_chunk(kind, data):
+    """A PNG chunk with its length and CRC"""
+    chunk = kind + data
+    return (struct.pack('>I', len(data)) + chunk +
+            struct.pack('>I', zlib.crc32(chunk) & 0xffffffff))
+
+
+def png(image, dpi=None):
+    """PNG file of a Raster, 1 bit grayscale. The resolution is stored if
+    dpi is given, for the printers"""
+    compressor = zlib.compressobj()
+    data = [compressor.compress((b'\0' + line) * count)
+            for line, count in image.rows(invert=True)]
+    data.append(compressor.flush())
+    physical = b''
+    if dpi:
+        # Pixels per meter, on both axes
+        ppm = round(dpi / 0.0254)
+        physical = png_chunk(b'pHYs', struct.pack('>IIB', ppm, ppm, 1))
+    return (b'\x89PNG\r\n\x1a\n' +
+            png_chunk(b'IHDR', struct.pack('>IIBBBBB', image.width,
+                                           image.height, 1, 0, 0, 0, 0)) +
+            physical +
+            png_chunk(b'IDAT', b''.join(data)) +
+            png_chunk(b'IEND', b''))
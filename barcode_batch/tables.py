@@ -0,0 +1,261 @@
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Symbol tables of the 1D and height modulated barcodes, as NumPy arrays.
+
+Each symbology has an alphabet of symbols: the characters followed by the
+start, stop and separator patterns. An alphabet is a pair of arrays, the
+modules of each symbol padded to the widest one, and the width of each
+symbol. The modules are 0 or 1 for the 1D barcodes, and the bar types
+(0 tracker, 1 ascender, 2 descender, 3 full) for the height modulated
+ones. The symbols are built from the tables of build_maps.py, so that the
+barcodes are the same as the Dart ones.
+"""
+
+import numpy as np
+
+import build_maps
+from check_digits import value_table
+
+
+def alphabet(symbols):
+    """Convert a list of symbols, strings of modules or lists of bars, to
+    the modules and widths arrays"""
+    symbols = [[int(module) for module in symbol] for symbol in symbols]
+    widths = np.array([len(symbol) for symbol in symbols], dtype=np.intp)
+    modules = np.zeros((len(symbols), widths.max()), dtype=np.uint8)
+    for index, symbol in enumerate(symbols):
+        modules[index, :len(symbol)] = symbol
+    return modules, widths
+
+
+# Code 39: the characters in the order of C39, then the start and stop
+# character, each followed by a narrow space
+CODE39 = alphabet([v + '0' for v in build_maps.C39.values()] +
+                  [build_maps.C39_MISC['StartStop'] + '0'])
+CODE39_VALUES = value_table(build_maps.C39)
+CODE39_START_STOP = len(build_maps.C39)
+
+# Code 39 full ASCII: the characters encoding each ASCII code
+CODE39_ASCII = tuple(build_maps.full_ascii(code, build_maps.C39_PLAIN)
+                     for code in range(0x80))
+
+# Code 93: the symbols in the order of their checksum values, the shifts
+# included, then the start and stop character and the termination bar
+CODE93 = alphabet(list(build_maps.C93.values()) +
+                  list(build_maps.C93_MISC.values())[:4] +
+                  [build_maps.C93_MISC['StartStop'], '1'])
+CODE93_START_STOP = len(build_maps.C93) + 4
+CODE93_TERMINATION = CODE93_START_STOP + 1
+
+
+def code93_ascii(chars):
+    """Code 93 values of the full ASCII characters of a code: a character,
+    or a shift and a character"""
+    c93 = list(build_maps.C93)
+    if len(chars) == 1:
+        return (c93.index(chars),)
+    return (len(c93) + build_maps.C93_SHIFTS.index(chars[0]),
+            c93.index(chars[1]))
+
+
+# Code 93 full ASCII: the values encoding each ASCII code, and the ASCII
+# code of each pair of shift and character values
+CODE93_ASCII = tuple(code93_ascii(build_maps.full_ascii(
+    code, build_maps.C93_PLAIN)) for code in range(0x80))
+CODE93_ASCII_PAIRS = {symbols: code
+                      for code, symbols in enumerate(CODE93_ASCII)
+                      if len(symbols) == 2}
+
+# Code 128: the symbols in the order of their values, the start symbols of
+# the sets A, B and C, then the stop symbol with the termination bar
+CODE128 = alphabet([row[3] for row in build_maps.C128] +
+                   [build_maps.C128_MISC[f'StartCode{n}'] for n in 'ABC'] +
+                   [build_maps.C128_MISC['StopPattern']])
+CODE128_START = tuple(len(build_maps.C128) + index for index in range(3))
+CODE128_STOP = len(build_maps.C128) + 3
+
+# Code 128 values of the sets A, B and C, and the sets of each code unit
+CODE128_SETS = tuple(build_maps.code128_values(col) for col in range(3))
+CODE128_CLASSES = build_maps.code128_classes()
+CODE128_CLASS_A = 1
+CODE128_CLASS_B = 2
+CODE128_CLASS_C = 4
+CODE128_CLASS_DIGIT = 8
+
+
+def code128_value(col, name):
+    """Value of a named symbol of the set A (0), B (1) or C (2)"""
+    return next(value for value, row in enumerate(build_maps.C128)
+                if row[col] == name)
+
+
+# Code 128 values to switch from a set (row) to another (column), and to
+# shift one character between the sets A and B
+CODE128_LATCH = tuple(
+    tuple(None if a == b else code128_value(a, f'Code{n}')
+          for b, n in enumerate('ABC'))
+    for a in range(3))
+CODE128_SHIFT = code128_value(0, 'ShiftB')
+
+# Code units of the function characters, as used by the Dart library
+CODE128_FNC = tuple(chr(build_maps.C128_NAMES[f'FNC{n}'])
+                    for n in range(1, 5))
+
+# EAN: the L, G and R codes of the digits, then the guards in the order of
+# EAN_MISC
+EAN = alphabet([row[col] for col in (1, 2, 3)
+                for row in build_maps.EAN_DIGITS] +
+               list(build_maps.EAN_MISC.values()))
+EAN_L = 0
+EAN_G = 10
+EAN_R = 20
+(EAN_START_END, EAN_CENTER, EAN_END_UPCE, EAN_START_EAN2,
+ EAN_CENTER_EAN2) = range(30, 30 + len(build_maps.EAN_MISC))
+
+
+def parity(patterns, letter):
+    """Parity bits of each pattern, 1 where the pattern has letter"""
+    return np.array([[int(k == letter) for k in pattern.strip()]
+                     for pattern in patterns], dtype=np.intp)
+
+
+# EAN 13 G-code positions of the first group for each first digit, EAN 5
+# G-code positions for each checksum, and UPC-E odd parity positions for
+# each check digit
+EAN13_PARITY = parity((row[1] for row in build_maps.EAN_FIRST), 'G')
+EAN5_PARITY = parity((row[2] for row in build_maps.EAN_FIRST), 'G')
+UPCE_PARITY = parity((row[1] for row in build_maps.EAN_UPCE), 'O')
+
+
+def itf_pair(bars, spaces):
+    """Modules of a pair of ITF digits, the bars of the first interleaved
+    with the spaces of the second"""
+    widths = {'0': 1, '1': 3}
+    return ''.join('1' * widths[b] + '0' * widths[s]
+                   for b, s in zip(build_maps.ITF[bars],
+                                   build_maps.ITF[spaces]))
+
+
+# ITF: the 100 pairs of digits, then the start and end patterns
+ITF = alphabet([itf_pair(str(pair // 10), str(pair % 10))
+                for pair in range(100)] +
+               [build_maps.ITF_MISC['Start'], build_maps.ITF_MISC['End']])
+ITF_START = 100
+ITF_END = 101
+
+# Telepen: the 128 ASCII characters, the start and stop are characters
+TELEPEN = alphabet(build_maps.TELEPEN[:128])
+TELEPEN_VALUES = np.where(np.arange(256) < 128, np.arange(256), -1)
+TELEPEN_START = ord(build_maps.TELEPEN_MISC['Start'])
+TELEPEN_END = ord(build_maps.TELEPEN_MISC['End'])
+
+# Telepen numeric: the character encoding each pair of digits, "X" standing
+# for a missing second digit
+TELEPEN_PAIRS = {high + low: build_maps.telepen_pair(
+    int(high), build_maps.TELEPEN_DIGITS.index(low))
+    for high in build_maps.TELEPEN_DIGITS[:10]
+    for low in build_maps.TELEPEN_DIGITS}
+TELEPEN_PAIR_DIGITS = {value: pair for pair, value in TELEPEN_PAIRS.items()}
+
+# Codabar: the characters followed by a narrow space, then the same
+# characters without the space, for the stop character
+CODABAR_CHARS = ''.join(build_maps.CODABAR)
+CODABAR = alphabet([build_maps.codabar_modules(v) + '0'
+                    for v in build_maps.CODABAR.values()] +
+                   [build_maps.codabar_modules(v)
+                    for v in build_maps.CODABAR.values()])
+CODABAR_VALUES = value_table(CODABAR_CHARS)
+CODABAR_DATA_VALUES = np.where(np.arange(256) <= 0x40, CODABAR_VALUES, -1)
+CODABAR_STOP = len(CODABAR_CHARS)
+
+# Codabar start and stop characters that can be given in the data, and
+# the character they stand for
+CODABAR_START_STOP = {'T': 'A', 'N': 'B', '*': 'C', 'E': 'D'}
+
+
+def rm4scc_bars(value):
+    """Bars of an RM4SCC character, from its row and column"""
+    top = build_maps.RM4SCC_BITS[value // 6]
+    bottom = build_maps.RM4SCC_BITS[value % 6]
+    return [int(t) | int(b) << 1 for t, b in zip(top, bottom)]
+
+
+# RM4SCC: the characters in the order of their checksum values, then the
+# start (ascender) and stop (full) bars
+RM4SCC = alphabet([rm4scc_bars(value)
+                   for value in range(len(build_maps.RM4SCC_CHARS))] +
+                  [[1], [3]])
+RM4SCC_START = len(build_maps.RM4SCC_CHARS)
+RM4SCC_STOP = RM4SCC_START + 1
+
+# Number of bars of a POSTNET digit
+POSTNET_LEN = 5
+
+
+def postnet_bars(v):
+    """Bars of a POSTNET digit. Like the Dart library, a digit always has
+    POSTNET_LEN bars, a shorter pattern ends with tracker bars"""
+    bars = [3 if bar == '1' else 2 for bar in v]
+    return bars + [0] * (POSTNET_LEN - len(bars))
+
+
+# POSTNET: the digits, then the start and stop full bar
+POSTNET = alphabet([postnet_bars(v) for v in build_maps.POSTNET.values()] +
+                   [[3]])
+POSTNET_START_STOP = len(build_maps.POSTNET)
+
+
+def pack(modules, bits=1):
+    """Pack each row of a 2D array of modules to an integer key, most
+    significant module first, after a leading 1 so that the keys of
+    patterns of different widths are different"""
+    count, width = modules.shape
+    if width * bits > 62:
+        raise ValueError(f'Unable to pack {width} modules')
+    weights = np.left_shift(1, bits * np.arange(width - 1, -1, -1,
+                                                dtype=np.int64))
+    return (modules.astype(np.int64) @ weights) | (1 << (width * bits))
+
+
+def inverse(symbols, bits=1, exclude=()):
+    """Inverse of an alphabet: the sorted keys of the packed symbols and
+    the index of the symbol of each key. The symbols in exclude are not
+    decoded"""
+    modules, widths = symbols
+    keys = []
+    for index, width in enumerate(widths):
+        if index not in exclude:
+            keys.append(int(pack(modules[index:index + 1, :width], bits)[0]))
+    indexes = np.array([index for index in range(len(widths))
+                        if index not in exclude], dtype=np.intp)
+    keys = np.array(keys, dtype=np.int64)
+    order = np.argsort(keys, kind='stable')
+    if (np.diff(keys[order]) == 0).any():
+        raise ValueError('The symbols are not unique')
+    return keys[order], indexes[order]
+
+
+# Inverse alphabets, to decode the symbols from their modules. The Codabar
+# symbols are decoded with their narrow space, the last one included
+CODE39_DECODE = inverse(CODE39)
+CODE93_DECODE = inverse(CODE93, exclude=(CODE93_TERMINATION,))
+CODE128_DECODE = inverse(CODE128)
+EAN_DECODE = inverse(EAN, exclude=range(EAN_START_END, len(EAN[1])))
+ITF_DECODE = inverse(ITF)
+TELEPEN_DECODE = inverse(TELEPEN)
+CODABAR_DECODE = inverse(CODABAR, exclude=range(CODABAR_STOP,
+                                                 len(CODABAR[1])))
+RM4SCC_DECODE = inverse(RM4SCC, bits=2, exclude=(RM4SCC_START, RM4SCC_STOP))
+POSTNET_DECODE = inverse(POSTNET, bits=2, exclude=(POSTNET_START_STOP,))
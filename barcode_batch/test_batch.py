@@ -0,0 +1,163 @@
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare the batch encoder with the images of the Dart barcodes.
+
+The images of img/ are generated by barcode/example/main.dart, the bars of
+their path are converted back to modules and compared with the encoder
+output for the same data. Run from the root of the repository:
+
+    python3 -m pytest barcode_batch
+"""
+
+import os
+import re
+
+import numpy as np
+import pytest
+
+import check_digits
+from barcode_batch import SYMBOLOGIES, encode
+from barcode_batch.decode import verify
+
+IMAGES = os.path.join(os.path.dirname(__file__), os.pardir, 'img')
+
+RECT = re.compile(r'M ([\d.]+) ([\d.]+) h ([\d.]+) v ([\d.]+)')
+
+# The data of barcode/example/main.dart: image, symbology, data, options
+EXAMPLES = (
+    ('code-39', 'code39', 'CODE 39', {}),
+    ('code-93', 'code93', 'CODE 93', {}),
+    ('code-128a', 'code128', 'BARCODE\t128', dict(use_b=False, use_c=False)),
+    ('code-128b', 'code128', 'Barcode 128', dict(use_a=False, use_c=False)),
+    ('code-128c', 'code128', '0123456789', dict(use_a=False, use_b=False)),
+    ('gs1-128', 'gs128', '(420)22345(56780000000001)', {}),
+    ('itf-14', 'itf14', '1540014128876', {}),
+    ('itf-16', 'itf16', '154001412887678', {}),
+    ('ean-13', 'ean13', '590123412345', {}),
+    ('ean-8', 'ean8', '9638507', {}),
+    ('ean-2', 'ean2', '05', {}),
+    ('ean-5', 'ean5', '52495', {}),
+    ('isbn', 'ean13', '978316148410', {}),
+    ('upc-a', 'upca', '98765432109', {}),
+    ('upc-e', 'upce', '06510000432', {}),
+    ('telepen', 'telepen', 'Telepen', {}),
+    ('codabar', 'codabar', 'A1234-5678B', dict(explicit_start_stop=True)),
+    ('itf', 'itf', '987234', {}),
+    ('rm4scc', 'rm4scc', 'RM4SCC', {}),
+    ('postnet', 'postnet', '55555-1237', {}),
+)
+
+# The ITF-14 and ITF-16 images have a border around the bars
+BORDERS = ('itf-14', 'itf-16')
+
+
+def rects(image):
+    """Left, top, width and height of the rectangles of an image"""
+    with open(os.path.join(IMAGES, f'{image}.svg')) as f:
+        return np.array(RECT.findall(f.read()), dtype=float)
+
+
+def runs(row):
+    """Start and length of the bars of a row of modules"""
+    edges = np.diff(np.concatenate(([0], row.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    return starts, np.flatnonzero(edges == -1) - starts
+
+
+def bar_types(bars):
+    """Bar types of the rectangles of a height modulated barcode: 0
+    tracker, 1 ascender, 2 descender, 3 full"""
+    tops, heights = bars[:, 1], bars[:, 3]
+    bottoms = tops + heights
+    full = bottoms.max()
+    return ((tops == 0) + np.isclose(bottoms, full) * 2).astype(np.uint8)
+
+
+@pytest.mark.parametrize('image, symbology, data, options', EXAMPLES,
+                         ids=[example[0] for example in EXAMPLES])
+def test_images(image, symbology, data, options):
+    batch = encode(symbology, [data], **options)
+    row = batch[0]
+    bars = rects(image)
+
+    if batch.bits == 2:
+        assert np.array_equal(bar_types(bars), row)
+        return
+
+    # The horizontal rectangles are the top and bottom of the border
+    bars = bars[bars[:, 2] < bars[:, 3]]
+    if image in BORDERS:
+        bars = bars[np.argsort(bars[:, 0])][1:-1]
+
+    starts, lengths = runs(row)
+    assert len(bars) == len(starts)
+    left, widths = bars[:, 0] - bars[0, 0], bars[:, 2]
+    module = (left[-1] + widths[-1]) / (starts[-1] + lengths[-1] - starts[0])
+    assert np.array_equal(np.rint(left / module), starts - starts[0])
+    assert np.array_equal(np.rint(widths / module), lengths)
+
+
+@pytest.mark.parametrize('symbology, code', (
+    ('ean13', '4006381333931'),
+    ('ean8', '96385074'),
+    ('upca', '987654321098'),
+    ('upce', '01234565'),
+    ('itf14', '15400141288763'),
+    ('code93', 'TEST93+6'),
+    ('rm4scc', 'BX11LT1AI'),
+))
+def test_check_digits(symbology, code):
+    size = check_digits.CHECK_LENGTHS.get(symbology, 1)
+    assert check_digits.complete(symbology, [code[:-size]]) == [code]
+    assert check_digits.validate(symbology, [code]).all()
+
+    wrong = code[:-1] + ('0' if code[-1] != '0' else '1')
+    assert not check_digits.validate(symbology, [wrong]).any()
+
+
+def test_check_values():
+    assert check_digits.check_digits('code93', ['TEST93']).tolist() == [
+        [41, 6]]
+    assert check_digits.check_digits('rm4scc', ['BX11LT1A']).tolist() == [
+        check_digits.CHECK_CHARS['rm4scc'].index('I')]
+
+    checks = check_digits.check_digits('code128', ['Barcode 128',
+                                                   '0123456789'])
+    assert checks.tolist() == [90, 73]
+
+
+# Data of each symbology, and of their options
+ROUND_TRIPS = [(symbology, data, options)
+               for _, symbology, data, options in EXAMPLES] + [
+    ('code39', 'Code 39 full ASCII', dict(full_ascii=True)),
+    ('code93', 'Code 93 full ASCII', dict(full_ascii=True)),
+    ('code128', '{1}Escapes{4}', dict(escapes=True)),
+    ('itf', '98723', dict(add_checksum=True, zero_prepend=True)),
+    ('upce', '0123456', dict(fallback=True)),
+    ('telepen', 'Telepen\n', {}),
+    ('telepen', '0123456789', dict(numeric=True)),
+    ('telepen', 'AB123456CD12345', dict(switch_numeric=True)),
+    ('codabar', '1234-5678', dict(start='C', stop='D')),
+]
+
+
+def test_round_trip_coverage():
+    assert {symbology for symbology, _, _ in ROUND_TRIPS} == set(SYMBOLOGIES)
+
+
+@pytest.mark.parametrize('symbology, data, options', ROUND_TRIPS)
+def test_round_trip(symbology, data, options):
+    batch = encode(symbology, [data, data], **options)
+    assert verify(symbology, [data, data], batch, **options).all()
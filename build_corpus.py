@@ -0,0 +1,159 @@
+#!/bin/env python3
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Generate the benchmark corpora of every symbology.
+
+Each corpus is a list of codes valid for one BarcodeType, drawn from the
+character sets of build_maps.py: short and long codes, numeric-heavy and
+mixed-set CODE 128 codes, and codes at the maximum length of the 2D
+symbologies. The random generator of a corpus is seeded from its name and
+the --seed option, so the same command always writes the same file. The
+file has one JSON object per line, read by barcode/benchmark/benchmark.dart:
+
+    {"name": "code128-mixed", "type": "Code128", "data": ["...", ...]}
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+
+import build_maps
+
+DIGITS = string.digits
+PRINTABLE = ''.join(map(chr, range(0x20, 0x7f)))
+ASCII = ''.join(map(chr, range(0x80)))
+CODABAR_DATA = ''.join(c for c in build_maps.CODABAR if c not in 'ABCD')
+AZTEC_UPPER = ''.join(map(chr, build_maps.AZTEC_CHARS['Upper'][1:]))
+
+# Maximum number of characters of the 2D symbologies, as their maxLength
+QR_MAX = 2953
+PDF417_MAX = 990
+DATAMATRIX_MAX = 1559
+AZTEC_MAX = 2335
+
+
+def text(rng, chars, low, high=None):
+    """A random string of low to high characters"""
+    return ''.join(rng.choices(chars, k=rng.randint(low, high or low)))
+
+
+def code128_mixed(rng):
+    """A CODE 128 code alternating digit runs, lower case letters and
+    control characters, to exercise the set switching"""
+    parts = []
+    for _ in range(rng.randint(2, 6)):
+        parts.append(rng.choice((
+            lambda: text(rng, DIGITS, 4, 12),
+            lambda: text(rng, string.ascii_lowercase, 1, 6),
+            lambda: text(rng, ''.join(map(chr, range(1, 0x20))), 1, 3),
+        ))())
+    return ''.join(parts)
+
+
+def gs128(rng):
+    """A GS1-128 code with a GTIN, a date and a batch number"""
+    return (f'(01){text(rng, DIGITS, 14)}(17){text(rng, DIGITS, 6)}'
+            f'(10){text(rng, string.ascii_uppercase + DIGITS, 1, 20)}')
+
+
+def datamatrix_max(rng):
+    """Printable characters filling a 144x144 Data Matrix, the digit pairs
+    taking a single codeword"""
+    return text(rng, PRINTABLE, DATAMATRIX_MAX - 9)
+
+
+# Corpora: name, BarcodeType, relative number of codes, code generator
+CORPORA = (
+    ('code39-short', 'Code39', 1,
+     lambda r: text(r, build_maps.C39_PLAIN, 1, 8)),
+    ('code39-long', 'Code39', 1,
+     lambda r: text(r, build_maps.C39_PLAIN, 20, 40)),
+    ('code93-short', 'Code93', 1,
+     lambda r: text(r, build_maps.C93_PLAIN, 1, 8)),
+    ('code93-long', 'Code93', 1,
+     lambda r: text(r, build_maps.C93_PLAIN, 20, 40)),
+    ('code128-numeric', 'Code128', 1, lambda r: text(r, DIGITS, 10, 40)),
+    ('code128-text', 'Code128', 1, lambda r: text(r, PRINTABLE, 5, 30)),
+    ('code128-mixed', 'Code128', 1, code128_mixed),
+    ('gs128', 'GS128', 1, gs128),
+    ('itf', 'Itf', 1, lambda r: text(r, DIGITS, 2 * r.randint(1, 15))),
+    ('itf14', 'CodeITF14', 1, lambda r: text(r, DIGITS, 13)),
+    ('itf16', 'CodeITF16', 1, lambda r: text(r, DIGITS, 15)),
+    ('ean13', 'CodeEAN13', 1, lambda r: text(r, DIGITS, 12)),
+    ('ean8', 'CodeEAN8', 1, lambda r: text(r, DIGITS, 7)),
+    ('ean5', 'CodeEAN5', 1, lambda r: text(r, DIGITS, 5)),
+    ('ean2', 'CodeEAN2', 1, lambda r: text(r, DIGITS, 2)),
+    ('isbn', 'CodeISBN', 1, lambda r: '978' + text(r, DIGITS, 9)),
+    ('upca', 'CodeUPCA', 1, lambda r: text(r, DIGITS, 11)),
+    ('upce', 'CodeUPCE', 1, lambda r: text(r, DIGITS, 6)),
+    ('telepen-short', 'Telepen', 1, lambda r: text(r, ASCII, 1, 8)),
+    ('telepen-long', 'Telepen', 1, lambda r: text(r, ASCII, 20, 40)),
+    ('codabar', 'Codabar', 1, lambda r: text(r, CODABAR_DATA, 1, 20)),
+    ('rm4scc', 'Rm4scc', 1,
+     lambda r: text(r, ''.join(build_maps.RM4SCC_CHARS), 5, 12)),
+    ('postnet', 'Postnet', 1,
+     lambda r: text(r, DIGITS, r.choice((5, 9, 11)))),
+    ('qrcode-short', 'QrCode', 1, lambda r: text(r, PRINTABLE, 10, 100)),
+    ('qrcode-max', 'QrCode', 0.02, lambda r: text(r, PRINTABLE, QR_MAX)),
+    ('qrcode-numeric-max', 'QrCode', 0.02, lambda r: text(r, DIGITS, QR_MAX)),
+    ('pdf417-short', 'PDF417', 0.2, lambda r: text(r, PRINTABLE, 10, 100)),
+    ('pdf417-max', 'PDF417', 0.02,
+     lambda r: text(r, string.ascii_uppercase + ' ', PDF417_MAX)),
+    ('pdf417-numeric-max', 'PDF417', 0.02,
+     lambda r: text(r, DIGITS, PDF417_MAX)),
+    ('datamatrix-short', 'DataMatrix', 0.2,
+     lambda r: text(r, PRINTABLE, 10, 100)),
+    ('datamatrix-max', 'DataMatrix', 0.02, datamatrix_max),
+    ('datamatrix-numeric-max', 'DataMatrix', 0.02,
+     lambda r: text(r, DIGITS, DATAMATRIX_MAX)),
+    ('aztec-short', 'Aztec', 0.2, lambda r: text(r, PRINTABLE, 10, 100)),
+    ('aztec-max', 'Aztec', 0.02, lambda r: text(r, AZTEC_UPPER, AZTEC_MAX)),
+    ('aztec-numeric-max', 'Aztec', 0.02,
+     lambda r: text(r, DIGITS, AZTEC_MAX)),
+)
+
+
+def corpus(name, kind, size, generator, count, seed):
+    """The corpus of a symbology, at least one code"""
+    rng = random.Random(f'{seed}:{name}')
+    data = [generator(rng) for _ in range(max(1, round(count * size)))]
+    return {'name': name, 'type': kind, 'data': data}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Generate the seeded benchmark corpora of every '
+        'symbology')
+    parser.add_argument('--output', metavar='FILE',
+                        default=os.path.join(os.path.dirname(__file__),
+                                             'barcode', 'benchmark',
+                                             'corpus.jsonl'),
+                        help='JSONL file of the corpora')
+    parser.add_argument('--count', type=int, default=1000,
+                        help='number of codes of the 1D corpora, the 2D '
+                        'ones having fewer')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--only', metavar='NAME', action='append',
+                        help='generate only this corpus, can be repeated')
+    args = parser.parse_args()
+
+    with open(args.output, 'w') as f:
+        for name, kind, size, generator in CORPORA:
+            if args.only and name not in args.only:
+                continue
+            f.write(json.dumps(corpus(name, kind, size, generator,
+                                      args.count, args.seed)) + '\n')
@@ -13,26 +13,191 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import argparse
+import base64
+import contextlib
+import dis
+import hashlib
+import heapq
+import inspect
+import io
+import linecache
+import os
+import re
+import struct
+import sys
+
+NO_CODE = -1
+
+# Tables with at least this number of entries are packed into a base64
+# string, decoded on first use, unless --plain is given
+PACK_THRESHOLD = 200
+PACK = True
+
+# Typed lists used to store the packed tables: struct format, Dart type
+PACK_TYPES = (
+    ('B', 'Uint8'),
+    ('b', 'Int8'),
+    ('H', 'Uint16'),
+    ('h', 'Int16'),
+    ('i', 'Int32'),
+)
+
+
+# Typed lists used by the packed tables printed so far
+PACK_USED = set()
+
+# Globals changed while printing, not part of the source of a table
+STATE = {'PACK_USED'}
+
+# Maximum length of the lines of the generated files, as dart format
+LINE_LENGTH = 80
+
+
+def label(i, names=None):
+    """Comment printed in front of the entry i of a dense table"""
+    if names is not None:
+        return names[i]
+    if 0x20 <= i < 0x7f:
+        return f'"{chr(i)}"'
+    return hex(i)
+
+
+def pack(name, values):
+    """Print a list of numbers as a base64 string of little-endian
+    integers, using the smallest type that fits all the values"""
+    for fmt, dart in PACK_TYPES:
+        size = struct.calcsize(fmt)
+        low = -(1 << (size * 8 - 1)) if fmt.islower() else 0
+        if low <= min(values) and max(values) < low + (1 << (size * 8)):
+            break
+    PACK_USED.add(fmt)
+    data = base64.b64encode(struct.pack(f'<{len(values)}{fmt}', *values))
+    data = data.decode('ascii')
+    print(f'static final {name} = _unpack{dart}(')
+    for i in range(0, len(data), 68):
+        end = ');' if i + 68 >= len(data) else ''
+        print(f"'{data[i:i + 68]}'{end}")
+    print('')
+
+
+def packed(name, values):
+    """Returns True if the table has been printed in packed form"""
+    if not PACK or len(values) < PACK_THRESHOLD:
+        return False
+    pack(name, values)
+    return True
+
+
+def dense(name, table, names=None):
+    """Print a list indexed by code unit, the missing entries are set
+    to noCode to mark the characters that can't be encoded"""
+    if packed(name, [table.get(i, NO_CODE) for i in range(max(table) + 1)]):
+        return
+    print(f'static const {name} = <int>[')
+    for i in range(max(table) + 1):
+        if i not in table:
+            print('noCode,')
+            continue
+        print(f'{hex(table[i])}, // {label(i, names)}')
+    print('];\n')
+
+
+def run_lengths(bits):
+    """Convert a string of modules to bar widths, alternating black and
+    white. The list starts with a black bar and ends with a white space,
+    possibly zero width, so that the symbols can be concatenated"""
+    runs = [0]
+    color = '1'
+    for b in bits:
+        if b != color:
+            runs.append(0)
+            color = b
+        runs[-1] += 1
+    if len(runs) % 2 != 0:
+        runs.append(0)
+    return runs
+
+
+def runs(name, bits):
+    """Print the bar widths of a single symbol"""
+    print(f'static const {name} = <int>{run_lengths(bits)};')
+
+
+def dense_lists(name, table, names=None):
+    """Print a list of lists indexed by code unit, the characters that
+    can't be encoded have an empty list"""
+    print(f'static const {name} = <List<int>>[')
+    for i in range(max(table) + 1):
+        if i not in table:
+            print('<int>[],')
+            continue
+        print(f'<int>{table[i]}, // {label(i, names)}')
+    print('];\n')
+
+
+def dense_runs(name, table, names=None):
+    """Print the bar widths of a table of symbols indexed by code unit"""
+    dense_lists(name, {k: run_lengths(v) for k, v in table.items()}, names)
+
+
+# Code 39 characters and their modules, in the order of their values
+C39 = {
+    '0': '101001101101', '1': '110100101011', '2': '101100101011', '3': '110110010101',
+    '4': '101001101011', '5': '110100110101', '6': '101100110101', '7': '101001011011',
+    '8': '110100101101', '9': '101100101101', 'A': '110101001011', 'B': '101101001011',
+    'C': '110110100101', 'D': '101011001011', 'E': '110101100101', 'F': '101101100101',
+    'G': '101010011011', 'H': '110101001101', 'I': '101101001101', 'J': '101011001101',
+    'K': '110101010011', 'L': '101101010011', 'M': '110110101001', 'N': '101011010011',
+    'O': '110101101001', 'P': '101101101001', 'Q': '101010110011', 'R': '110101011001',
+    'S': '101101011001', 'T': '101011011001', 'U': '110010101011', 'V': '100110101011',
+    'W': '110011010101', 'X': '100101101011', 'Y': '110010110101', 'Z': '100110110101',
+    '-': '100101011011', '.': '110010101101', ' ': '100110101101', '$': '100100100101',
+    '/': '100100101001', '+': '100101001001', '%': '101001001001',
+}
+
+
+# Code 39 start and stop modules
+C39_MISC = {
+    'StartStop': '100101101101',
+}
+
+
+def full_ascii(code, plain):
+    """Characters of an ASCII code in the Code 39 and Code 93 full ASCII
+    modes: the character itself if it is in plain, else a shift ($, %, /
+    or +) followed by a letter"""
+    char = chr(code)
+    if char in plain:
+        return char
+    if code == 0:
+        return '%U'
+    if code < 0x1b:
+        return '$' + chr(0x40 + code)
+    if code < 0x20:
+        return '%' + chr(0x41 + code - 0x1b)
+    if code < 0x30:
+        return '/' + chr(0x41 + code - 0x21)
+    if code == 0x3a:
+        return '/Z'
+    if code < 0x40:
+        return '%' + chr(0x46 + code - 0x3b)
+    if code == 0x40:
+        return '%V'
+    if code < 0x60:
+        return '%' + chr(0x4b + code - 0x5b)
+    if code == 0x60:
+        return '%W'
+    if code < 0x7b:
+        return '+' + chr(code - 0x20)
+    return '%' + chr(0x50 + code - 0x7b)
+
+
+# Code 39 characters encoded as themselves in full ASCII mode
+C39_PLAIN = '0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ -.'
 
-def code39():
-    C39 = {
-        '0': '101001101101', '1': '110100101011', '2': '101100101011', '3': '110110010101',
-        '4': '101001101011', '5': '110100110101', '6': '101100110101', '7': '101001011011',
-        '8': '110100101101', '9': '101100101101', 'A': '110101001011', 'B': '101101001011',
-        'C': '110110100101', 'D': '101011001011', 'E': '110101100101', 'F': '101101100101',
-        'G': '101010011011', 'H': '110101001101', 'I': '101101001101', 'J': '101011001101',
-        'K': '110101010011', 'L': '101101010011', 'M': '110110101001', 'N': '101011010011',
-        'O': '110101101001', 'P': '101101101001', 'Q': '101010110011', 'R': '110101011001',
-        'S': '101101011001', 'T': '101011011001', 'U': '110010101011', 'V': '100110101011',
-        'W': '110011010101', 'X': '100101101011', 'Y': '110010110101', 'Z': '100110110101',
-        '-': '100101011011', '.': '110010101101', ' ': '100110101101', '$': '100100100101',
-        '/': '100100101001', '+': '100101001001', '%': '101001001001',
-    }
-
-    misc = {
-        'StartStop': '100101101101',
-    }
 
+def code39():
     print('/// Code 39 conversion bits')
     print('static const code39 = <int, int>{')
     for k, v in C39.items():
@@ -40,170 +205,280 @@ def code39():
     print('};\n')
 
     print('/// Code 39 misc bits')
-    for name in misc:
+    for name in C39_MISC:
         print(
-            f'static const code39{name} = {hex(int(misc[name][::-1], 2))};')
-    print(f'static const int code39Len = 13;')
+            f'static const code39{name} = {hex(int(C39_MISC[name][::-1], 2))};')
+    print(f'static const int code39Len = 13;\n')
 
+    print('/// Code 39 conversion bits, indexed by code unit')
+    dense('code39Table', {ord(k): int(v[::-1], 2) for k, v in C39.items()})
+
+    print('/// Code 39 bar widths, indexed by code unit')
+    dense_runs('code39Runs', {ord(k): v + '0' for k, v in C39.items()})
+
+    print('/// Code 39 misc bar widths')
+    for name in C39_MISC:
+        runs(f'code39{name}Runs', C39_MISC[name] + '0')
+    print('')
+
+    expansion = {i: full_ascii(i, C39_PLAIN) for i in range(0x80)}
+    print('/// Code 39 full ASCII bar widths of the one or two symbols,')
+    print('/// indexed by code unit')
+    dense_runs('code39AsciiRuns', {i: ''.join(C39[c] + '0' for c in v)
+                                   for i, v in expansion.items()})
+
+    print('/// Code 39 full ASCII number of symbols, indexed by code unit')
+    dense('code39AsciiLen', {i: len(v) for i, v in expansion.items()})
+
+
+# Code 93 characters and their modules, in the order of their values
+C93 = {
+    '0': '100010100',    '1': '101001000',    '2': '101000100',    '3': '101000010',    '4': '100101000',
+    '5': '100100100',    '6': '100100010',    '7': '101010000',    '8': '100010010',    '9': '100001010',
+    'A': '110101000',    'B': '110100100',    'C': '110100010',    'D': '110010100',    'E': '110010010',
+    'F': '110001010',    'G': '101101000',    'H': '101100100',    'I': '101100010',    'J': '100110100',
+    'K': '100011010',    'L': '101011000',    'M': '101001100',    'N': '101000110',    'O': '100101100',
+    'P': '100010110',    'Q': '110110100',    'R': '110110010',    'S': '110101100',    'T': '110100110',
+    'U': '110010110',    'V': '110011010',    'W': '101101100',    'X': '101100110',    'Y': '100110110',
+    'Z': '100111010',    '-': '100101110',    '.': '111010100',    ' ': '111010010',    '$': '111001010',
+    '/': '101101110',    '+': '101110110',    '%': '110101110',
+}
 
-def code93():
-    C93 = {
-        '0': '100010100',    '1': '101001000',    '2': '101000100',    '3': '101000010',    '4': '100101000',
-        '5': '100100100',    '6': '100100010',    '7': '101010000',    '8': '100010010',    '9': '100001010',
-        'A': '110101000',    'B': '110100100',    'C': '110100010',    'D': '110010100',    'E': '110010010',
-        'F': '110001010',    'G': '101101000',    'H': '101100100',    'I': '101100010',    'J': '100110100',
-        'K': '100011010',    'L': '101011000',    'M': '101001100',    'N': '101000110',    'O': '100101100',
-        'P': '100010110',    'Q': '110110100',    'R': '110110010',    'S': '110101100',    'T': '110100110',
-        'U': '110010110',    'V': '110011010',    'W': '101101100',    'X': '101100110',    'Y': '100110110',
-        'Z': '100111010',    '-': '100101110',    '.': '111010100',    ' ': '111010010',    '$': '111001010',
-        '/': '101101110',    '+': '101110110',    '%': '110101110',
-    }
-
-    misc = {
-        'Dollar': '100100110',
-        'Percent': '111011010',
-        'Slash': '111010110',
-        'Plus': '100110010',
-        'StartStop': '101011110',
-        'ReverseStop': '101111010',
-    }
 
+# Code 93 special symbols, the first four are shifts with a value
+C93_MISC = {
+    'Dollar': '100100110',
+    'Percent': '111011010',
+    'Slash': '111010110',
+    'Plus': '100110010',
+    'StartStop': '101011110',
+    'ReverseStop': '101111010',
+}
+
+
+# Code 93 characters encoded as themselves in full ASCII mode, and the
+# characters standing for the shifts, in the order of C93_MISC
+C93_PLAIN = C39_PLAIN + '$%+/'
+C93_SHIFTS = '$%/+'
+
+
+def code93():
     print('/// Code 93 conversion bits')
     print('static const code93 = <int, int>{')
     for k, v in C93.items():
         print(f'{hex(ord(k))}: {hex(int(v[::-1], 2))}, // {k}')
     i = -1
-    for name in misc:
+    for name in C93_MISC:
         print(f'{i}: code93{name},')
         i -= 1
     print('};\n')
 
     print('/// Code 93 misc bits')
-    for name in misc:
+    for name in C93_MISC:
         print(
-            f'static const code93{name} = {hex(int(misc[name][::-1], 2))};')
-    print(f'static const code93Len = 9;')
+            f'static const code93{name} = {hex(int(C93_MISC[name][::-1], 2))};')
+    print(f'static const code93Len = 9;\n')
 
+    print('/// Code 93 conversion bits, indexed by code unit')
+    dense('code93Table', {ord(k): int(v[::-1], 2) for k, v in C93.items()})
+
+    print('/// Code 93 checksum values, indexed by code unit')
+    dense('code93Value', {ord(k): i for i, k in enumerate(C93)})
+
+    symbols = list(C93.values()) + [C93_MISC[name] for name in C93_MISC][:4]
+    names = list(f'"{k}"' for k in C93) + list(C93_MISC)[:4]
+    print('/// Code 93 conversion bits, indexed by checksum value')
+    dense('code93Symbol', {i: int(v[::-1], 2)
+          for i, v in enumerate(symbols)}, names)
+
+    print('/// Code 93 bar widths, indexed by checksum value')
+    dense_runs('code93Runs', dict(enumerate(symbols)), names)
+
+    print('/// Code 93 misc bar widths')
+    for name in C93_MISC:
+        runs(f'code93{name}Runs', C93_MISC[name])
+    print('')
+
+    def ascii_values(chars):
+        # A shift has the value following the characters
+        if len(chars) == 1:
+            return [list(C93).index(chars)]
+        return [len(C93) + C93_SHIFTS.index(chars[0]),
+                list(C93).index(chars[1])]
+
+    values = {i: ascii_values(full_ascii(i, C93_PLAIN)) for i in range(0x80)}
+    print('/// Code 93 full ASCII checksum values of the one or two symbols,')
+    print('/// indexed by code unit')
+    dense_lists('code93AsciiValues', values)
+
+    print('/// Code 93 full ASCII bar widths of the one or two symbols,')
+    print('/// indexed by code unit')
+    dense_runs('code93AsciiRuns', {i: ''.join(symbols[k] for k in v)
+                                   for i, v in values.items()})
+
+
+# Code 128 set A, set B and set C characters and their modules,
+# in the order of their values
+C128 = (
+    (' ', ' ', '00', '11011001100',),    ('!', '!', '01', '11001101100',),
+    ('"', '"', '02', '11001100110',),    ('#', '#', '03', '10010011000',),
+    ('$', '$', '04', '10010001100',),    ('%', '%', '05', '10001001100',),
+    ('&', '&', '06', '10011001000',),    (r"'", r"'", '07', '10011000100',),
+    ('(', '(', '08', '10001100100',),    (')', ')', '09', '11001001000',),
+    ('*', '*', '10', '11001000100',),    ('+', '+', '11', '11000100100',),
+    (',', ',', '12', '10110011100',),    ('-', '-', '13', '10011011100',),
+    ('.', '.', '14', '10011001110',),    ('/', '/', '15', '10111001100',),
+    ('0', '0', '16', '10011101100',),    ('1', '1', '17', '10011100110',),
+    ('2', '2', '18', '11001110010',),    ('3', '3', '19', '11001011100',),
+    ('4', '4', '20', '11001001110',),    ('5', '5', '21', '11011100100',),
+    ('6', '6', '22', '11001110100',),    ('7', '7', '23', '11101101110',),
+    ('8', '8', '24', '11101001100',),    ('9', '9', '25', '11100101100',),
+    (':', ':', '26', '11100100110',),    (';', ';', '27', '11101100100',),
+    ('<', '<', '28', '11100110100',),    ('=', '=', '29', '11100110010',),
+    ('>', '>', '30', '11011011000',),    ('?', '?', '31', '11011000110',),
+    ('@', '@', '32', '11000110110',),    ('A', 'A', '33', '10100011000',),
+    ('B', 'B', '34', '10001011000',),    ('C', 'C', '35', '10001000110',),
+    ('D', 'D', '36', '10110001000',),    ('E', 'E', '37', '10001101000',),
+    ('F', 'F', '38', '10001100010',),    ('G', 'G', '39', '11010001000',),
+    ('H', 'H', '40', '11000101000',),    ('I', 'I', '41', '11000100010',),
+    ('J', 'J', '42', '10110111000',),    ('K', 'K', '43', '10110001110',),
+    ('L', 'L', '44', '10001101110',),    ('M', 'M', '45', '10111011000',),
+    ('N', 'N', '46', '10111000110',),    ('O', 'O', '47', '10001110110',),
+    ('P', 'P', '48', '11101110110',),    ('Q', 'Q', '49', '11010001110',),
+    ('R', 'R', '50', '11000101110',),    ('S', 'S', '51', '11011101000',),
+    ('T', 'T', '52', '11011100010',),    ('U', 'U', '53', '11011101110',),
+    ('V', 'V', '54', '11101011000',),    ('W', 'W', '55', '11101000110',),
+    ('X', 'X', '56', '11100010110',),    ('Y', 'Y', '57', '11101101000',),
+    ('Z', 'Z', '58', '11101100010',),    ('[', '[', '59', '11100011010',),
+    ('\\', '\\', '60', '11101111010',),  (']', ']', '61', '11001000010',),
+    ('^', '^', '62', '11110001010',),    ('_', '_', '63', '10100110000',),
+    ('NUL', '`', '64', '10100001100',),  ('SOH', 'a', '65', '10010110000',),
+    ('STX', 'b', '66', '10010000110',),  ('ETX', 'c', '67', '10000101100',),
+    ('EOT', 'd', '68', '10000100110',),  ('ENQ', 'e', '69', '10110010000',),
+    ('ACK', 'f', '70', '10110000100',),  ('BEL', 'g', '71', '10011010000',),
+    ('BS', 'h', '72', '10011000010',),   ('HT', 'i', '73', '10000110100',),
+    ('LF', 'j', '74', '10000110010',),   ('VT', 'k', '75', '11000010010',),
+    ('FF', 'l', '76', '11001010000',),   ('CR', 'm', '77', '11110111010',),
+    ('SO', 'n', '78', '11000010100',),   ('SI', 'o', '79', '10001111010',),
+    ('DLE', 'p', '80', '10100111100',),  ('DC1', 'q', '81', '10010111100',),
+    ('DC2', 'r', '82', '10010011110',),  ('DC3', 's', '83', '10111100100',),
+    ('DC4', 't', '84', '10011110100',),  ('NAK', 'u', '85', '10011110010',),
+    ('SYN', 'v', '86', '11110100100',),  ('ETB', 'w', '87', '11110010100',),
+    ('CAN', 'x', '88', '11110010010',),  ('EM', 'y', '89', '11011011110',),
+    ('SUB', 'z', '90', '11011110110',),
+    ('ESC', '{', '91', '11110110110',),
+    ('FS', '|', '92', '10101111000',),    ('GS', '}', '93', '10100011110',),
+    ('RS', '~', '94', '10001011110',),    ('US', 'DEL', '95', '10111101000',),
+    ('FNC3', 'FNC3', '96', '10111100010',),
+    ('FNC2', 'FNC2', '97', '11110101000',),
+    ('ShiftB', 'ShiftA', '98', '11110100010',),
+    ('CodeC', 'CodeC', '99', '10111011110',),
+    ('CodeB', 'FNC4', 'CodeB', '10111101110',),
+    ('FNC4', 'CodeA', 'CodeA', '11101011110', 	),
+    ('FNC1', 'FNC1', 'FNC1', '11110101110',),
+)
+
+
+# Code 128 code units of the named characters of C128
+C128_NAMES = {
+    'NUL': 0x00,
+    'SOH': 0x01,
+    'STX': 0x02,
+    'ETX': 0x03,
+    'EOT': 0x04,
+    'ENQ': 0x05,
+    'ACK': 0x06,
+    'BEL': 0x07,
+    'BS': 0x08,
+    'HT': 0x09,
+    'LF': 0x0A,
+    'VT': 0x0B,
+    'FF': 0x0C,
+    'CR': 0x0D,
+    'SO': 0x0E,
+    'SI': 0x0F,
+    'DLE': 0x10,
+    'DC1': 0x11,
+    'DC2': 0x12,
+    'DC3': 0x13,
+    'DC4': 0x14,
+    'NAK': 0x15,
+    'SYN': 0x16,
+    'ETB': 0x17,
+    'CAN': 0x18,
+    'EM': 0x19,
+    'SUB': 0x1A,
+    'ESC': 0x1B,
+    'FS': 0x1C,
+    'GS': 0x1D,
+    'RS': 0x1E,
+    'US': 0x1F,
+    'DEL': 0x7F,
+    'FNC1': 0xfa,
+    'FNC2': 0xfb,
+    'FNC3': 0xfc,
+    'FNC4': 0xfd,
+    'ShiftA': -5,
+    'ShiftB': -6,
+    'CodeA': -7,
+    'CodeB': -8,
+    'CodeC': -9,
+}
+
+
+# Code 128 start and stop modules
+C128_MISC = {
+    'StartCodeA': '11010000100',
+    'StartCodeB': '11010010000',
+    'StartCodeC': '11010011100',
+    'Stop': '11000111010',
+    'ReverseStop': '11010111000',
+    'StopPattern': '1100011101011',
+}
+
+
+# The costs are in quarters of symbols, a switch costs an extra quarter
+# and a shift an extra half, so that the shortest encoding with the
+# fewest switches is selected.
+C128_SYMBOL_COST = 4
+C128_SHIFT_COST = 6
+C128_SWITCH_COST = 5
+
+
+def code128_values(col):
+    """Code 128 values of set A (0), B (1) or C (2), indexed by code unit,
+    or by pair of digits for set C"""
+    table = {}
+    for i, row in enumerate(C128):
+        k = row[col]
+        if col == 2:
+            r = int(k) if len(k) == 2 else C128_NAMES[k]
+        else:
+            r = ord(k) if len(k) == 1 else C128_NAMES[k]
+        if r >= 0:
+            table[r] = i
+    return table
 
-def code128():
-    C128 = (
-        (' ', ' ', '00', '11011001100',),    ('!', '!', '01', '11001101100',),
-        ('"', '"', '02', '11001100110',),    ('#', '#', '03', '10010011000',),
-        ('$', '$', '04', '10010001100',),    ('%', '%', '05', '10001001100',),
-        ('&', '&', '06', '10011001000',),    (r"'", r"'", '07', '10011000100',),
-        ('(', '(', '08', '10001100100',),    (')', ')', '09', '11001001000',),
-        ('*', '*', '10', '11001000100',),    ('+', '+', '11', '11000100100',),
-        (',', ',', '12', '10110011100',),    ('-', '-', '13', '10011011100',),
-        ('.', '.', '14', '10011001110',),    ('/', '/', '15', '10111001100',),
-        ('0', '0', '16', '10011101100',),    ('1', '1', '17', '10011100110',),
-        ('2', '2', '18', '11001110010',),    ('3', '3', '19', '11001011100',),
-        ('4', '4', '20', '11001001110',),    ('5', '5', '21', '11011100100',),
-        ('6', '6', '22', '11001110100',),    ('7', '7', '23', '11101101110',),
-        ('8', '8', '24', '11101001100',),    ('9', '9', '25', '11100101100',),
-        (':', ':', '26', '11100100110',),    (';', ';', '27', '11101100100',),
-        ('<', '<', '28', '11100110100',),    ('=', '=', '29', '11100110010',),
-        ('>', '>', '30', '11011011000',),    ('?', '?', '31', '11011000110',),
-        ('@', '@', '32', '11000110110',),    ('A', 'A', '33', '10100011000',),
-        ('B', 'B', '34', '10001011000',),    ('C', 'C', '35', '10001000110',),
-        ('D', 'D', '36', '10110001000',),    ('E', 'E', '37', '10001101000',),
-        ('F', 'F', '38', '10001100010',),    ('G', 'G', '39', '11010001000',),
-        ('H', 'H', '40', '11000101000',),    ('I', 'I', '41', '11000100010',),
-        ('J', 'J', '42', '10110111000',),    ('K', 'K', '43', '10110001110',),
-        ('L', 'L', '44', '10001101110',),    ('M', 'M', '45', '10111011000',),
-        ('N', 'N', '46', '10111000110',),    ('O', 'O', '47', '10001110110',),
-        ('P', 'P', '48', '11101110110',),    ('Q', 'Q', '49', '11010001110',),
-        ('R', 'R', '50', '11000101110',),    ('S', 'S', '51', '11011101000',),
-        ('T', 'T', '52', '11011100010',),    ('U', 'U', '53', '11011101110',),
-        ('V', 'V', '54', '11101011000',),    ('W', 'W', '55', '11101000110',),
-        ('X', 'X', '56', '11100010110',),    ('Y', 'Y', '57', '11101101000',),
-        ('Z', 'Z', '58', '11101100010',),    ('[', '[', '59', '11100011010',),
-        ('\\', '\\', '60', '11101111010',),  (']', ']', '61', '11001000010',),
-        ('^', '^', '62', '11110001010',),    ('_', '_', '63', '10100110000',),
-        ('NUL', '`', '64', '10100001100',),  ('SOH', 'a', '65', '10010110000',),
-        ('STX', 'b', '66', '10010000110',),  ('ETX', 'c', '67', '10000101100',),
-        ('EOT', 'd', '68', '10000100110',),  ('ENQ', 'e', '69', '10110010000',),
-        ('ACK', 'f', '70', '10110000100',),  ('BEL', 'g', '71', '10011010000',),
-        ('BS', 'h', '72', '10011000010',),   ('HT', 'i', '73', '10000110100',),
-        ('LF', 'j', '74', '10000110010',),   ('VT', 'k', '75', '11000010010',),
-        ('FF', 'l', '76', '11001010000',),   ('CR', 'm', '77', '11110111010',),
-        ('SO', 'n', '78', '11000010100',),   ('SI', 'o', '79', '10001111010',),
-        ('DLE', 'p', '80', '10100111100',),  ('DC1', 'q', '81', '10010111100',),
-        ('DC2', 'r', '82', '10010011110',),  ('DC3', 's', '83', '10111100100',),
-        ('DC4', 't', '84', '10011110100',),  ('NAK', 'u', '85', '10011110010',),
-        ('SYN', 'v', '86', '11110100100',),  ('ETB', 'w', '87', '11110010100',),
-        ('CAN', 'x', '88', '11110010010',),  ('EM', 'y', '89', '11011011110',),
-        ('SUB', 'z', '90', '11011110110',),
-        ('ESC', '{', '91', '11110110110',),
-        ('FS', '|', '92', '10101111000',),    ('GS', '}', '93', '10100011110',),
-        ('RS', '~', '94', '10001011110',),    ('US', 'DEL', '95', '10111101000',),
-        ('FNC3', 'FNC3', '96', '10111100010',),
-        ('FNC2', 'FNC2', '97', '11110101000',),
-        ('ShiftB', 'ShiftA', '98', '11110100010',),
-        ('CodeC', 'CodeC', '99', '10111011110',),
-        ('CodeB', 'FNC4', 'CodeB', '10111101110',),
-        ('FNC4', 'CodeA', 'CodeA', '11101011110', 	),
-        ('FNC1', 'FNC1', 'FNC1', '11110101110',),
-    )
 
-    misc = {
-        'StartCodeA': '11010000100',
-        'StartCodeB': '11010010000',
-        'StartCodeC': '11010011100',
-        'Stop': '11000111010',
-        'ReverseStop': '11010111000',
-        'StopPattern': '1100011101011',
-    }
-
-    names = {
-        'NUL': 0x00,
-        'SOH': 0x01,
-        'STX': 0x02,
-        'ETX': 0x03,
-        'EOT': 0x04,
-        'ENQ': 0x05,
-        'ACK': 0x06,
-        'BEL': 0x07,
-        'BS': 0x08,
-        'HT': 0x09,
-        'LF': 0x0A,
-        'VT': 0x0B,
-        'FF': 0x0C,
-        'CR': 0x0D,
-        'SO': 0x0E,
-        'SI': 0x0F,
-        'DLE': 0x10,
-        'DC1': 0x11,
-        'DC2': 0x12,
-        'DC3': 0x13,
-        'DC4': 0x14,
-        'NAK': 0x15,
-        'SYN': 0x16,
-        'ETB': 0x17,
-        'CAN': 0x18,
-        'EM': 0x19,
-        'SUB': 0x1A,
-        'ESC': 0x1B,
-        'FS': 0x1C,
-        'GS': 0x1D,
-        'RS': 0x1E,
-        'US': 0x1F,
-        'DEL': 0x7F,
-        'FNC1': 0xfa,
-        'FNC2': 0xfb,
-        'FNC3': 0xfc,
-        'FNC4': 0xfd,
-        'ShiftA': -5,
-        'ShiftB': -6,
-        'CodeA': -7,
-        'CodeB': -8,
-        'CodeC': -9,
-    }
+def code128_classes():
+    """Code 128 sets that can encode a code unit: 1 for A, 2 for B, 4 for C
+    and 8 for the digits that can be paired in set C"""
+    classes = {}
+    for col, bit in ((0, 1), (1, 2)):
+        for r in code128_values(col):
+            classes[r] = classes.get(r, 0) | bit
+    for r in range(0x30, 0x3a):
+        classes[r] |= 8
+    classes[C128_NAMES['FNC1']] |= 4
+    return classes
 
+
+def code128():
     print('/// Code 128 A')
     print('static const code128A = <int, int>{')
     i = 0
     for a, b, c, v in C128:
-        r = ord(a) if len(a) == 1 else names[a]
+        r = ord(a) if len(a) == 1 else C128_NAMES[a]
         if r >= 0 and r < 0xf0:
             print(f'{hex(r)}: {hex(i)}, // {a}')
         else:
@@ -215,7 +490,7 @@ def code128():
     print('static const code128B = <int, int>{')
     i = 0
     for a, b, c, v in C128:
-        r = ord(b) if len(b) == 1 else names[b]
+        r = ord(b) if len(b) == 1 else C128_NAMES[b]
         if r >= 0 and r < 0xf0:
             print(f'{hex(r)}: {hex(i)}, // {b}')
         else:
@@ -227,7 +502,7 @@ def code128():
     print('static const code128C = <int, int>{')
     i = 0
     for a, b, c, v in C128:
-        r = int(c) if len(c) == 2 else names[c]
+        r = int(c) if len(c) == 2 else C128_NAMES[c]
         if r >= 0 and r < 0xf0:
             print(f'{hex(r)}: {hex(i)}, // {c}')
         else:
@@ -241,83 +516,168 @@ def code128():
     for a, b, c, v in C128:
         print(f'{hex(i)}: {hex(int(v[::-1], 2))}, // {a} | {b} | {c}')
         i += 1
-    for name in misc:
-        print(f'code128{name}: {hex(int(misc[name][::-1], 2))},')
+    for name in C128_MISC:
+        print(f'code128{name}: {hex(int(C128_MISC[name][::-1], 2))},')
     print('};\n')
 
     print('/// Code 128 misc bits')
-    for name in misc:
+    for name in C128_MISC:
         print(f'static const code128{name} = {hex(i)};')
         i += 1
-    for name in names:
-        if names[name] < 0:
-            print(f'static const code128{name} = {names[name]};')
-        elif names[name] > 0xf0:
-            print(f'static const code128{name} = {hex(names[name])};')
-            print(f'static const code128{name}String = \'\\u{{{format(names[name], "x")}}}\';')
-    print(f'static const code128Len = 11;')
+    for name in C128_NAMES:
+        if C128_NAMES[name] < 0:
+            print(f'static const code128{name} = {C128_NAMES[name]};')
+        elif C128_NAMES[name] > 0xf0:
+            print(f'static const code128{name} = {hex(C128_NAMES[name])};')
+            print(f'static const code128{name}String = \'\\u{{{format(C128_NAMES[name], "x")}}}\';')
+    print(f'static const code128Len = 11;\n')
 
+    for n, col in (('A', 0), ('B', 1)):
+        labels = {}
+        for row in C128:
+            k = row[col]
+            r = ord(k) if len(k) == 1 else C128_NAMES[k]
+            labels[r] = k if len(k) > 1 else f'"{k}"'
+        print(f'/// Code 128 {n} values, indexed by code unit')
+        dense(f'code128{n}Table', code128_values(col), labels)
 
-def ean13():
-    misc = {
-        'StartEnd': '101',
-        'Center': '01010',
-        'EndUpcE': '010101',
-        'StartEan2': '01011',
-        'CenterEan2': '01',
-    }
-
-    digits = (
-        # Digit, L-code, G-code ,R-code
-        ('0', '0001101', '0100111', '1110010'),
-        ('1', '0011001', '0110011', '1100110'),
-        ('2', '0010011', '0011011', '1101100'),
-        ('3', '0111101', '0100001', '1000010'),
-        ('4', '0100011', '0011101', '1011100'),
-        ('5', '0110001', '0111001', '1001110'),
-        ('6', '0101111', '0000101', '1010000'),
-        ('7', '0111011', '0010001', '1000100'),
-        ('8', '0110111', '0001001', '1001000'),
-        ('9', '0001011', '0010111', '1110100'),
-    )
+    labels = {int(k) if len(k) == 2 else C128_NAMES[k]: k
+              for k in (row[2] for row in C128)}
+    print('/// Code 128 C values, indexed by pair of digits')
+    dense('code128CTable', code128_values(2), labels)
 
-    first = (
-        # First digit, First group of 6 digits, ean-5
-        ('0', 'LLLLLL', 'GGLLL'),
-        ('1', 'LLGLGG', 'GLGLL'),
-        ('2', 'LLGGLG', 'GLLGL'),
-        ('3', 'LLGGGL', 'GLLLG'),
-        ('4', 'LGLLGG', 'LGGLL'),
-        ('5', 'LGGLLG', 'LLGGL'),
-        ('6', 'LGGGLL', 'LLLGG'),
-        ('7', 'LGLGLG', 'LGLGL'),
-        ('8', 'LGLGGL', 'LGLLG'),
-        ('9', 'LGGLGL', 'LLGLG'),
-    )
+    symbols = [row[3] for row in C128] + list(C128_MISC.values())
+    labels = [' | '.join(row[:3]) for row in C128] + list(C128_MISC)
+    print('/// Code 128 conversion bits, indexed by value')
+    dense('code128Symbol', {i: int(v[::-1], 2)
+          for i, v in enumerate(symbols)}, labels)
+
+    print('/// Code 128 bar widths, indexed by value')
+    dense_runs('code128Runs', dict(enumerate(symbols)), labels)
+
+    classes = code128_classes()
+
+    print('/// Code 128 character classes')
+    print('static const code128ClassA = 1;')
+    print('static const code128ClassB = 2;')
+    print('static const code128ClassC = 4;')
+    print('static const code128ClassDigit = 8;\n')
+
+    labels = {}
+    for i in range(max(classes) + 1):
+        c = classes.setdefault(i, 0)
+        k = ' | '.join(n for n, bit in (('A', 1), ('B', 2), ('C', 4),
+                                         ('Digit', 8)) if c & bit)
+        labels[i] = f'{label(i)}{" => " + k if k else ""}'
+    print('/// Code 128 sets that can encode a code unit, using the classes above')
+    dense('code128Class', classes, labels)
+
+    sets = ('A', 'B', 'C')
+    codes = {}
+    for col, n in enumerate(sets):
+        for i, row in enumerate(C128):
+            codes[(col, row[col])] = i
+
+    print('/// Code 128 set indexes')
+    for i, n in enumerate(sets):
+        print(f'static const code128Set{n} = {i};')
+    print('')
+
+    print('/// Code 128 start values, indexed by set')
+    print('static const code128Start = <int>[')
+    for n in sets:
+        print(f'code128StartCode{n},')
+    print('];\n')
+
+    print('/// Code 128 values to switch from a set (row) to another (column)')
+    print('static const code128Latch = <int>[')
+    for i, a in enumerate(sets):
+        print(', '.join('noCode' if a == b else hex(codes[(i, f'Code{b}')])
+                        for b in sets) + f', // from {a}')
+    print('];\n')
+
+    print('/// Code 128 cost of one symbol')
+    print(f'static const code128SymbolCost = {C128_SYMBOL_COST};\n')
+    print('/// Code 128 cost of a shift to encode one character from the other')
+    print('/// set, between A and B')
+    print(f'static const code128ShiftCost = {C128_SHIFT_COST};\n')
+    print('/// Code 128 cost to switch from a set (row) to another (column)')
+    print('static const code128SwitchCost = <int>[')
+    for a in sets:
+        print(', '.join('0' if a == b else str(C128_SWITCH_COST)
+                        for b in sets) + f', // from {a}')
+    print('];')
 
-    upce = (
-        ('0', 'EEEOOO', 'OOOEEE'),
-        ('1', 'EEOEOO', 'OOEOEE'),
-        ('2', 'EEOOEO', 'OOEEOE'),
-        ('3', 'EEOOOE', 'OOEEEO'),
-        ('4', 'EOEEOO', 'OEOOEE'),
-        ('5', 'EOOEEO', 'OEEOOE'),
-        ('6', 'EOOOEE', 'OEEEOO'),
-        ('7', 'EOEOEO', 'OEOEOE'),
-        ('8', 'EOEOOE', 'OEOEEO'),
-        ('9', 'EOOEOE', 'OEEOEO '),
-    )
 
+# EAN guard modules
+EAN_MISC = {
+    'StartEnd': '101',
+    'Center': '01010',
+    'EndUpcE': '010101',
+    'StartEan2': '01011',
+    'CenterEan2': '01',
+}
+
+
+# EAN digits and their L, G and R modules
+EAN_DIGITS = (
+    # Digit, L-code, G-code ,R-code
+    ('0', '0001101', '0100111', '1110010'),
+    ('1', '0011001', '0110011', '1100110'),
+    ('2', '0010011', '0011011', '1101100'),
+    ('3', '0111101', '0100001', '1000010'),
+    ('4', '0100011', '0011101', '1011100'),
+    ('5', '0110001', '0111001', '1001110'),
+    ('6', '0101111', '0000101', '1010000'),
+    ('7', '0111011', '0010001', '1000100'),
+    ('8', '0110111', '0001001', '1001000'),
+    ('9', '0001011', '0010111', '1110100'),
+)
+
+
+# EAN 13 parity of the first group for the first digit, and EAN 5
+# parity for the checksum
+EAN_FIRST = (
+    # First digit, First group of 6 EAN_DIGITS, ean-5
+    ('0', 'LLLLLL', 'GGLLL'),
+    ('1', 'LLGLGG', 'GLGLL'),
+    ('2', 'LLGGLG', 'GLLGL'),
+    ('3', 'LLGGGL', 'GLLLG'),
+    ('4', 'LGLLGG', 'LGGLL'),
+    ('5', 'LGGLLG', 'LLGGL'),
+    ('6', 'LGGGLL', 'LLLGG'),
+    ('7', 'LGLGLG', 'LGLGL'),
+    ('8', 'LGLGGL', 'LGLLG'),
+    ('9', 'LGGLGL', 'LLGLG'),
+)
+
+
+# UPC-E parity for the check digit, number system 0 and 1
+EAN_UPCE = (
+    ('0', 'EEEOOO', 'OOOEEE'),
+    ('1', 'EEOEOO', 'OOEOEE'),
+    ('2', 'EEOOEO', 'OOEEOE'),
+    ('3', 'EEOOOE', 'OOEEEO'),
+    ('4', 'EOEEOO', 'OEOOEE'),
+    ('5', 'EOOEEO', 'OEEOOE'),
+    ('6', 'EOOOEE', 'OEEEOO'),
+    ('7', 'EOEOEO', 'OEOEOE'),
+    ('8', 'EOEOOE', 'OEOEEO'),
+    ('9', 'EOOEOE', 'OEEOEO '),
+)
+
+
+def ean13():
     print('/// EAN 13 conversion bits')
     print('static const ean = <int, List<int>>{')
-    for d, l, g, r in digits:
+    for d, l, g, r in EAN_DIGITS:
         print(
             f'{hex(ord(d))}: <int>[{hex(int(l[::-1], 2))}, {hex(int(g[::-1], 2))}, {hex(int(r[::-1], 2))}],')
     print('};\n')
 
     print('/// EAN 13 first digit')
     print('static const eanFirst = <int, int>{')
-    for d, f, s in first:
+    for d, f, s in EAN_FIRST:
         v = 0
         i = 0
         for k in f:
@@ -328,7 +688,7 @@ def ean13():
 
     print('/// EAN 5 checksum')
     print('static const ean5Checksum = <int, int>{')
-    for d, f, s in first:
+    for d, f, s in EAN_FIRST:
         v = 0
         i = 0
         for k in s:
@@ -339,7 +699,7 @@ def ean13():
 
     print('/// UPC-A to UPC-E conversion')
     print('static const upce = <int, int>{')
-    for d, f, s in upce:
+    for d, f, s in EAN_UPCE:
         v = 0
         i = 0
         for k in f:
@@ -349,186 +709,253 @@ def ean13():
     print('};\n')
 
     print('/// EAN misc bits')
-    for name in misc:
-        print(f'static const ean{name} = {hex(int(misc[name][::-1], 2))};')
+    for name in EAN_MISC:
+        print(f'static const ean{name} = {hex(int(EAN_MISC[name][::-1], 2))};')
+    print('')
 
+    for n, col in (('L', 1), ('G', 2), ('R', 3)):
+        print(f'/// EAN {n}-code bar widths, indexed by code unit')
+        dense_runs(f'ean{n}Runs', {ord(row[0]): row[col] for row in EAN_DIGITS})
+
+    print('/// EAN misc bar widths')
+    for name in EAN_MISC:
+        runs(f'ean{name}Runs', EAN_MISC[name])
+
+
+# ITF digits and their wide (1) and narrow (0) elements
+ITF = {
+    '0': '00110',
+    '1': '10001',
+    '2': '01001',
+    '3': '11000',
+    '4': '00101',
+    '5': '10100',
+    '6': '01100',
+    '7': '00011',
+    '8': '10010',
+    '9': '01010',
+}
 
-def itf():
-    data = {
-        '0': '00110',
-        '1': '10001',
-        '2': '01001',
-        '3': '11000',
-        '4': '00101',
-        '5': '10100',
-        '6': '01100',
-        '7': '00011',
-        '8': '10010',
-        '9': '01010',
-    }
-
-    misc = {
-        'Start': '1010',
-        'End': '11101',
-    }
 
+# ITF start and end modules
+ITF_MISC = {
+    'Start': '1010',
+    'End': '11101',
+}
+
+
+def itf():
     print('/// ITF conversion bits')
     print('static const itf = <int, int>{')
-    for k, v in data.items():
+    for k, v in ITF.items():
         print(
             f'{hex(ord(k))}: {hex(int(v[::-1], 2))}, // "{k}"')
     print('};\n')
 
     print('/// ITF misc bits')
-    for name in misc:
-        print(f'static const itf{name} = {hex(int(misc[name][::-1], 2))};')
+    for name in ITF_MISC:
+        print(f'static const itf{name} = {hex(int(ITF_MISC[name][::-1], 2))};')
+    print('')
 
+    print('/// ITF conversion bits, indexed by code unit')
+    dense('itfTable', {ord(k): int(v[::-1], 2) for k, v in ITF.items()})
+
+    print('/// ITF bar widths of one color, indexed by code unit')
+    dense_lists('itfRuns', {ord(k): [3 if b == '1' else 1 for b in v]
+                for k, v in ITF.items()})
+
+    print('/// ITF misc bar widths')
+    for name in ITF_MISC:
+        runs(f'itf{name}Runs', ITF_MISC[name])
+    print('')
+
+    print('/// ITF digit values, indexed by code unit')
+    dense('itfValue', {ord(k): int(k) for k in ITF})
+
+    # The bars of the first digit interleaved with the spaces of the second
+    pairs = [''.join(b + s for b, s in zip(ITF[a], ITF[b]))
+             for a in ITF for b in ITF]
+
+    def modules(pair):
+        return ''.join(('1' if i % 2 == 0 else '0') * (3 if w == '1' else 1)
+                       for i, w in enumerate(pair))
+
+    print('/// ITF conversion bits of the digit pairs, indexed by value')
+    table('itfPairs', [int(modules(v)[::-1], 2) for v in pairs])
+
+    print('/// ITF bar and space widths of the digit pairs, indexed by')
+    print('/// value * 10')
+    table('itfPairRuns', [3 if w == '1' else 1 for v in pairs for w in v])
+
+
+# Telepen modules, indexed by ASCII code
+TELEPEN = [
+    "1110111011101110",
+    "1011101110111010",
+    "1110001110111010",
+    "1010111011101110",
+    "1110101110111010",
+    "1011100011101110",
+    "1000100011101110",
+    "1010101110111010",
+    "1110111000111010",
+    "1011101011101110",
+    "1110001011101110",
+    "1010111000111010",
+    "1110101011101110",
+    "1010001000111010",
+    "1000101000111010",
+    "1010101011101110",
+    "1110111010111010",
+    "1011101110001110",
+    "1110001110001110",
+    "1010111010111010",
+    "1110101110001110",
+    "1011100010111010",
+    "1000100010111010",
+    "1010101110001110",
+    "1110100010001110",
+    "1011101010111010",
+    "1110001010111010",
+    "1010100010001110",
+    "1110101010111010",
+    "1010001010001110",
+    "1000101010001110",
+    "1010101010111010",
+    "1110111011100010",
+    "1011101110101110",
+    "1110001110101110",
+    "1010111011100010",
+    "1110101110101110",
+    "1011100011100010",
+    "1000100011100010",
+    "1010101110101110",
+    "1110111000101110",
+    "1011101011100010",
+    "1110001011100010",
+    "1010111000101110",
+    "1110101011100010",
+    "1010001000101110",
+    "1000101000101110",
+    "1010101011100010",
+    "1110111010101110",
+    "1011101000100010",
+    "1110001000100010",
+    "1010111010101110",
+    "1110101000100010",
+    "1011100010101110",
+    "1000100010101110",
+    "1010101000100010",
+    "1110100010100010",
+    "1011101010101110",
+    "1110001010101110",
+    "1010100010100010",
+    "1110101010101110",
+    "1010001010100010",
+    "1000101010100010",
+    "1010101010101110",
+    "1110111011101010",
+    "1011101110111000",
+    "1110001110111000",
+    "1010111011101010",
+    "1110101110111000",
+    "1011100011101010",
+    "1000100011101010",
+    "1010101110111000",
+    "1110111000111000",
+    "1011101011101010",
+    "1110001011101010",
+    "1010111000111000",
+    "1110101011101010",
+    "1010001000111000",
+    "1000101000111000",
+    "1010101011101010",
+    "1110111010111000",
+    "1011101110001010",
+    "1110001110001010",
+    "1010111010111000",
+    "1110101110001010",
+    "1011100010111000",
+    "1000100010111000",
+    "1010101110001010",
+    "1110100010001010",
+    "1011101010111000",
+    "1110001010111000",
+    "1010100010001010",
+    "1110101010111000",
+    "1010001010001010",
+    "1000101010001010",
+    "1010101010111000",
+    "1110111010001000",
+    "1011101110101010",
+    "1110001110101010",
+    "1010111010001000",
+    "1110101110101010",
+    "1011100010001000",
+    "1000100010001000",
+    "1010101110101010",
+    "1110111000101010",
+    "1011101010001000",
+    "1110001010001000",
+    "1010111000101010",
+    "1110101010001000",
+    "1010001000101010",
+    "1000101000101010",
+    "1010101010001000",
+    "1110111010101010",
+    "1011101000101000",
+    "1110001000101000",
+    "1010111010101010",
+    "1110101000101000",
+    "1011100010101010",
+    "1000100010101010",
+    "1010101000101000",
+    "1110100010101000",
+    "1011101010101010",
+    "1110001010101010",
+    "1010100010101000",
+    "1110101010101010",
+    "1010001010101000",
+    "1000101010101000",
+    "1010101010101010",
+    "1010101011101000",
+    "1110100010101010",
+    "1010101110101000",
+    "1110101000101010",
+]
+
+
+# Telepen start and end characters
+TELEPEN_MISC = {
+    'Start': '_',
+    'End': 'z',
+}
+
+
+# Telepen numeric digits, "X" standing for a missing second digit
+TELEPEN_DIGITS = '0123456789X'
+
+# Telepen DLE, switching between the ASCII and the numeric modes
+TELEPEN_SWITCH = 0x10
+
+# Shortest runs of digits worth switching to the numeric mode, before the
+# end of the data and in the middle of it
+TELEPEN_NUMERIC_END = 4
+TELEPEN_NUMERIC_MIDDLE = 6
 
-def telepen():
-    data = [
-        "1110111011101110",
-        "1011101110111010",
-        "1110001110111010",
-        "1010111011101110",
-        "1110101110111010",
-        "1011100011101110",
-        "1000100011101110",
-        "1010101110111010",
-        "1110111000111010",
-        "1011101011101110",
-        "1110001011101110",
-        "1010111000111010",
-        "1110101011101110",
-        "1010001000111010",
-        "1000101000111010",
-        "1010101011101110",
-        "1110111010111010",
-        "1011101110001110",
-        "1110001110001110",
-        "1010111010111010",
-        "1110101110001110",
-        "1011100010111010",
-        "1000100010111010",
-        "1010101110001110",
-        "1110100010001110",
-        "1011101010111010",
-        "1110001010111010",
-        "1010100010001110",
-        "1110101010111010",
-        "1010001010001110",
-        "1000101010001110",
-        "1010101010111010",
-        "1110111011100010",
-        "1011101110101110",
-        "1110001110101110",
-        "1010111011100010",
-        "1110101110101110",
-        "1011100011100010",
-        "1000100011100010",
-        "1010101110101110",
-        "1110111000101110",
-        "1011101011100010",
-        "1110001011100010",
-        "1010111000101110",
-        "1110101011100010",
-        "1010001000101110",
-        "1000101000101110",
-        "1010101011100010",
-        "1110111010101110",
-        "1011101000100010",
-        "1110001000100010",
-        "1010111010101110",
-        "1110101000100010",
-        "1011100010101110",
-        "1000100010101110",
-        "1010101000100010",
-        "1110100010100010",
-        "1011101010101110",
-        "1110001010101110",
-        "1010100010100010",
-        "1110101010101110",
-        "1010001010100010",
-        "1000101010100010",
-        "1010101010101110",
-        "1110111011101010",
-        "1011101110111000",
-        "1110001110111000",
-        "1010111011101010",
-        "1110101110111000",
-        "1011100011101010",
-        "1000100011101010",
-        "1010101110111000",
-        "1110111000111000",
-        "1011101011101010",
-        "1110001011101010",
-        "1010111000111000",
-        "1110101011101010",
-        "1010001000111000",
-        "1000101000111000",
-        "1010101011101010",
-        "1110111010111000",
-        "1011101110001010",
-        "1110001110001010",
-        "1010111010111000",
-        "1110101110001010",
-        "1011100010111000",
-        "1000100010111000",
-        "1010101110001010",
-        "1110100010001010",
-        "1011101010111000",
-        "1110001010111000",
-        "1010100010001010",
-        "1110101010111000",
-        "1010001010001010",
-        "1000101010001010",
-        "1010101010111000",
-        "1110111010001000",
-        "1011101110101010",
-        "1110001110101010",
-        "1010111010001000",
-        "1110101110101010",
-        "1011100010001000",
-        "1000100010001000",
-        "1010101110101010",
-        "1110111000101010",
-        "1011101010001000",
-        "1110001010001000",
-        "1010111000101010",
-        "1110101010001000",
-        "1010001000101010",
-        "1000101000101010",
-        "1010101010001000",
-        "1110111010101010",
-        "1011101000101000",
-        "1110001000101000",
-        "1010111010101010",
-        "1110101000101000",
-        "1011100010101010",
-        "1000100010101010",
-        "1010101000101000",
-        "1110100010101000",
-        "1011101010101010",
-        "1110001010101010",
-        "1010100010101000",
-        "1110101010101010",
-        "1010001010101000",
-        "1000101010101000",
-        "1010101010101010",
-        "1010101011101000",
-        "1110100010101010",
-        "1010101110101000",
-        "1110101000101010",
-    ]
 
-    misc = {
-        'Start': '_',
-        'End': 'z',
-    }
+def telepen_pair(high, low):
+    """The Telepen character encoding a pair of digits in numeric mode"""
+    if low == 10:
+        return high + 17
+    return high * 10 + low + 27
 
+
+def telepen():
     print('/// Telepen conversion bits')
     print('static const telepen = <int>[')
     n = 0
-    for v in data:
+    for v in TELEPEN:
         c = hex(int(''.join(reversed(v)), 2))
         print(f'{c}, // {repr(chr(n))}')
         n += 1
@@ -538,37 +965,91 @@ def telepen():
     print('];\n')
 
     print('/// Telepen misc bits')
-    for name in misc:
-        c = hex(int(''.join(reversed(data[ord(misc[name])])), 2))
+    for name in TELEPEN_MISC:
+        c = hex(int(''.join(reversed(TELEPEN[ord(TELEPEN_MISC[name])])), 2))
         print(
-            f'static const telepen{name} = {c}; // "{misc[name]}"')
-    print(f'static const telepenLen = 16;')
+            f'static const telepen{name} = {c}; // "{TELEPEN_MISC[name]}"')
+    print(f'static const telepenLen = 16;\n')
 
+    print('/// Telepen bar widths, indexed by code unit')
+    dense_runs('telepenRuns', dict(enumerate(TELEPEN[:128])),
+               [repr(chr(n)) for n in range(128)])
 
-def codabar():
-    data = {
-        "0": "001 0001",
-        "1": "001 0010",
-        "4": "001 0100",
-        "5": "001 1000",
-        "2": "010 0001",
-        "-": "010 0010",
-        "$": "010 0100",
-        "9": "010 1000",
-        "6": "100 0001",
-        "7": "100 0010",
-        "8": "100 0100",
-        "3": "100 1000",
-        ".": "000 1110",
-        "/": "000 1101",
-        ":": "000 1011",
-        "+": "000 0111",
-        "C": "011 0001",
-        "D": "011 0010",
-        "A": "011 0100",
-        "B": "110 0001",
-    }
+    print('/// Telepen misc bar widths')
+    for name in TELEPEN_MISC:
+        runs(f'telepen{name}Runs', TELEPEN[ord(TELEPEN_MISC[name])])
+    print('')
+
+    print('/// Telepen character switching between the ASCII and numeric modes')
+    print(f'static const telepenSwitch = {hex(TELEPEN_SWITCH)}; // DLE')
+    print('')
+    print('/// Telepen shortest runs of digits switched to the numeric mode, at')
+    print('/// the end and in the middle of the data')
+    print(f'static const telepenNumericEnd = {TELEPEN_NUMERIC_END};')
+    print(f'static const telepenNumericMiddle = {TELEPEN_NUMERIC_MIDDLE};')
+    print('')
+
+    print('/// Telepen numeric values of the digits and "X", indexed by code')
+    print('/// unit')
+    dense('telepenDigit', {ord(c): i for i, c in enumerate(TELEPEN_DIGITS)})
+
+    pairs = [(high, low) for high in range(10)
+             for low in range(len(TELEPEN_DIGITS))]
+    names = [f'"{TELEPEN_DIGITS[high]}{TELEPEN_DIGITS[low]}"'
+             for high, low in pairs]
+
+    print('/// Telepen numeric checksum values of the pairs, indexed by')
+    print(f'/// first digit * {len(TELEPEN_DIGITS)} + second digit')
+    table('telepenPairValue', [telepen_pair(*p) for p in pairs])
+
+    print('/// Telepen numeric bar widths of the pairs, indexed by first digit')
+    print(f'/// * {len(TELEPEN_DIGITS)} + second digit')
+    dense_runs('telepenPairRuns', {i: TELEPEN[telepen_pair(*p)]
+                                   for i, p in enumerate(pairs)}, names)
+
+
+# Codabar characters, their wide spaces and wide bars
+CODABAR = {
+    "0": "001 0001",
+    "1": "001 0010",
+    "4": "001 0100",
+    "5": "001 1000",
+    "2": "010 0001",
+    "-": "010 0010",
+    "$": "010 0100",
+    "9": "010 1000",
+    "6": "100 0001",
+    "7": "100 0010",
+    "8": "100 0100",
+    "3": "100 1000",
+    ".": "000 1110",
+    "/": "000 1101",
+    ":": "000 1011",
+    "+": "000 0111",
+    "C": "011 0001",
+    "D": "011 0010",
+    "A": "011 0100",
+    "B": "110 0001",
+}
+
+
+def codabar_modules(v):
+    """Modules of a Codabar character, from its wide spaces and bars"""
+    c = ''
+    s = v[:3]
+    b = v[4:]
+    for i in range(4):
+        c += '1'
+        if b[i] == '1':
+            c += '1'
+        if i < 3:
+            c += '0'
+            if s[i] == '1':
+                c += '0'
+    return c
 
+
+def codabar():
     misc = [
         "A",
         "B",
@@ -580,18 +1061,8 @@ def codabar():
 
     print('/// Codabar conversion bits')
     print('static const codabar = <int, int>{')
-    for k, v in data.items():
-        c = ''
-        s = v[:3]
-        b = v[4:]
-        for i in range(4):
-            c += '1'
-            if b[i] == '1':
-                c += '1'
-            if i < 3:
-                c += '0'
-                if s[i] == '1':
-                    c += '0'
+    for k, v in CODABAR.items():
+        c = codabar_modules(v)
         r = ''.join(reversed(c))
         bars[k] = r
         print(f'{hex(ord(k))}: {hex(int(r, 2))}, // "{k}" => "{c}"')
@@ -600,21 +1071,37 @@ def codabar():
     print('static const codabarLen = <int, int>{')
     for k, v in bars.items():
         print(f'{hex(ord(k))}: {len(v)}, // "{k}"')
-    print('};')
+    print('};\n')
+
+    print('/// Codabar conversion bits, indexed by code unit')
+    dense('codabarTable', {ord(k): int(v, 2) for k, v in bars.items()})
+
+    print('/// Codabar bits count, indexed by code unit')
+    dense('codabarLenTable', {ord(k): len(v) for k, v in bars.items()})
+
+    print('/// Codabar bar widths, indexed by code unit')
+    dense_runs('codabarRuns', {ord(k): v[::-1] for k, v in bars.items()})
+
+
+# RM4SCC bars of a row or a column
+RM4SCC_BITS = ('0011', '0101', '0110', '1001', '1010', '1100')
+
+
+# RM4SCC characters, in the order of their checksum values
+RM4SCC_CHARS = ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "A", "B", "C", "D", "E", "F",
+                "G", "H", "I", "J", "K", "L", "M", "N", "O", "P", "Q", "R", "S", "T", "U", "V",
+                "W", "X", "Y", "Z")
 
 
 def rm4scc():
-    bits = ('0011', '0101', '0110', '1001', '1010', '1100')
-    chars = ("0", "1", "2", "3", "4", "5", "6", "7", "8", "9", "A", "B", "C", "D", "E", "F",
-             "G", "H", "I", "J", "K", "L", "M", "N", "O", "P", "Q", "R", "S", "T", "U", "V",
-             "W", "X", "Y", "Z")
+    table = {}
 
     print('/// RM4SCC conversion bits')
     print('static const rm4scc = <int, int>{')
-    for i, k in enumerate(chars):
+    for i, k in enumerate(RM4SCC_CHARS):
         v = ''
-        t = bits[i//6]
-        b = bits[i % 6]
+        t = RM4SCC_BITS[i//6]
+        b = RM4SCC_BITS[i % 6]
         o = 0
         n = 0
         for j in range(4):
@@ -631,38 +1118,53 @@ def rm4scc():
                 v += 'F'
                 o += 0b11 << n
             n += 2
+        table[ord(k)] = o
         print(f'{hex(ord(k))}: {hex(o)}, // "{k}" => {v}')
     print('};')
 
     print('/// RM4SCC misc bits')
     print('static const rm4sccLen = 4;')
     print(f'static const rm4sccStart = {hex(0b01)}; // A')
-    print(f'static const rm4sccStop = {hex(0b11)}; // F')
+    print(f'static const rm4sccStop = {hex(0b11)}; // F\n')
+
+    print('/// RM4SCC conversion bits, indexed by code unit')
+    dense('rm4sccTable', table)
+
+    print('/// RM4SCC checksum values, indexed by code unit')
+    dense('rm4sccValue', {ord(k): i for i, k in enumerate(RM4SCC_CHARS)})
+
+    print('/// RM4SCC conversion bits, indexed by checksum value')
+    dense('rm4sccSymbol', {i: table[ord(k)] for i, k in enumerate(RM4SCC_CHARS)},
+          [f'"{k}"' for k in RM4SCC_CHARS])
+
+
+# POSTNET digits and their full (1) and half (0) bars
+POSTNET = {
+    "0": "11000",
+    "1": "00011",
+    "2": "00101",
+    "3": "00110",
+    "4": "01001",
+    "5": "01010",
+    "6": "01100",
+    "7": "10001",
+    "8": "10010",
+    "9": "1010",
+}
 
 
 def postnet():
-    data = {
-        "0": "11000",
-        "1": "00011",
-        "2": "00101",
-        "3": "00110",
-        "4": "01001",
-        "5": "01010",
-        "6": "01100",
-        "7": "10001",
-        "8": "10010",
-        "9": "1010",
-    }
+    table = {}
 
     print('/// POSTNET conversion bits')
     print('static const postnet = <int, int>{')
-    for k in data.keys():
+    for k in POSTNET.keys():
         v = ''
         # t = bits[i//6]
         # b = bits[i % 6]
         o = 0
         n = 0
-        for j in data[k]:
+        for j in POSTNET[k]:
             if j == '0':
                 v += 'D'
                 o += 0b10 << n
@@ -670,15 +1172,857 @@ def postnet():
                 v += 'F'
                 o += 0b11 << n
             n += 2
+        table[ord(k)] = o
         print(f'{hex(ord(k))}: {hex(o)}, // "{k}" => {v}')
     print('};')
 
     print('/// POSTNET misc bits')
     print('static const postnetLen = 5;')
-    print(f'static const postnetStartStop = {hex(0b11)}; // F')
+    print(f'static const postnetStartStop = {hex(0b11)}; // F\n')
 
+    print('/// POSTNET conversion bits, indexed by code unit')
+    dense('postnetTable', table)
 
-if __name__ == '__main__':
+
+# Data Matrix ECC 200 square symbols: rows, columns, regions vertically,
+# regions horizontally, error correction codewords, interleaved blocks
+DATAMATRIX_SIZES = (
+    (10, 10, 1, 1, 5, 1),
+    (12, 12, 1, 1, 7, 1),
+    (14, 14, 1, 1, 10, 1),
+    (16, 16, 1, 1, 12, 1),
+    (18, 18, 1, 1, 14, 1),
+    (20, 20, 1, 1, 18, 1),
+    (22, 22, 1, 1, 20, 1),
+    (24, 24, 1, 1, 24, 1),
+    (26, 26, 1, 1, 28, 1),
+    (32, 32, 2, 2, 36, 1),
+    (36, 36, 2, 2, 42, 1),
+    (40, 40, 2, 2, 48, 1),
+    (44, 44, 2, 2, 56, 1),
+    (48, 48, 2, 2, 68, 1),
+    (52, 52, 2, 2, 84, 2),
+    (64, 64, 4, 4, 112, 2),
+    (72, 72, 4, 4, 144, 4),
+    (80, 80, 4, 4, 192, 4),
+    (88, 88, 4, 4, 224, 4),
+    (96, 96, 4, 4, 272, 4),
+    (104, 104, 4, 4, 336, 6),
+    (120, 120, 6, 6, 408, 6),
+    (132, 132, 6, 6, 496, 8),
+    (144, 144, 6, 6, 620, 10),
+)
+
+
+def datamatrix_placement(rows, columns, regions_v, regions_h):
+    """Position in the symbol of each bit of the codewords, most
+    significant bit first, using the ECC 200 placement algorithm. The
+    positions of the modules left over in the bottom right corner, set to
+    black, are appended after the codewords"""
+    region_rows = (rows - regions_v * 2) // regions_v
+    region_columns = (columns - regions_h * 2) // regions_h
+    nrow = region_rows * regions_v
+    ncol = region_columns * regions_h
+    placement = {}
+
+    def module(row, col, bit):
+        if row < 0:
+            row += nrow
+            col += 4 - ((nrow + 4) % 8)
+        if col < 0:
+            col += ncol
+            row += 4 - ((ncol + 4) % 8)
+        assert (row, col) not in placement
+        placement[(row, col)] = bit
+
+    def utah(row, col, cw):
+        for i, (r, c) in enumerate(((-2, -2), (-2, -1), (-1, -2), (-1, -1),
+                                    (-1, 0), (0, -2), (0, -1), (0, 0))):
+            module(row + r, col + c, cw * 8 + i)
+
+    def corner(cw, modules):
+        for i, (r, c) in enumerate(modules):
+            module(r % nrow, c % ncol, cw * 8 + i)
+
+    corner1 = ((-1, 0), (-1, 1), (-1, 2), (0, -2), (0, -1), (1, -1),
+               (2, -1), (3, -1))
+    corner2 = ((-3, 0), (-2, 0), (-1, 0), (0, -4), (0, -3), (0, -2),
+               (0, -1), (1, -1))
+    corner3 = ((-3, 0), (-2, 0), (-1, 0), (0, -2), (0, -1), (1, -1),
+               (2, -1), (3, -1))
+    corner4 = ((-1, 0), (-1, -1), (0, -3), (0, -2), (0, -1), (1, -3),
+               (1, -2), (1, -1))
+
+    cw = 0
+    row = 4
+    col = 0
+    while row < nrow or col < ncol:
+        if row == nrow and col == 0:
+            corner(cw, corner1)
+            cw += 1
+        if row == nrow - 2 and col == 0 and ncol % 4 != 0:
+            corner(cw, corner2)
+            cw += 1
+        if row == nrow - 2 and col == 0 and ncol % 8 == 4:
+            corner(cw, corner3)
+            cw += 1
+        if row == nrow + 4 and col == 2 and ncol % 8 == 0:
+            corner(cw, corner4)
+            cw += 1
+
+        while True:
+            if row < nrow and col >= 0 and (row, col) not in placement:
+                utah(row, col, cw)
+                cw += 1
+            row -= 2
+            col += 2
+            if row < 0 or col >= ncol:
+                break
+        row += 1
+        col += 3
+
+        while True:
+            if row >= 0 and col < ncol and (row, col) not in placement:
+                utah(row, col, cw)
+                cw += 1
+            row += 2
+            col -= 2
+            if row >= nrow or col < 0:
+                break
+        row += 3
+        col += 1
+
+    bits = cw * 8
+    if (nrow - 1, ncol - 1) not in placement:
+        module(nrow - 1, ncol - 1, bits)
+        module(nrow - 2, ncol - 2, bits + 1)
+
+    # Move the modules of the mapping matrix into their data region
+    result = [0] * len(placement)
+    for (row, col), bit in placement.items():
+        row = row // region_rows * (region_rows + 2) + row % region_rows + 1
+        col = (col // region_columns * (region_columns + 2) +
+               col % region_columns + 1)
+        result[bit] = row * columns + col
+    return cw, result
+
+
+def datamatrix():
+    print('/// Data Matrix symbol sizes: rows, columns, regions vertically, '
+          'regions')
+    print('/// horizontally, data codewords, error correction codewords and '
+          'blocks')
+    print('static const dataMatrixSizes = <List<int>>[')
+    placements = []
+    for rows, columns, regions_v, regions_h, ecc, blocks in DATAMATRIX_SIZES:
+        codewords, placement = datamatrix_placement(
+            rows, columns, regions_v, regions_h)
+        assert ecc % blocks == 0
+        placements.append((f'dataMatrixPlacement{rows}x{columns}', placement))
+        print(f'<int>[{rows}, {columns}, {regions_v}, {regions_h}, '
+              f'{codewords - ecc}, {ecc}, {blocks}],')
+    print('];\n')
+
+    for name, placement in placements:
+        print('/// Data Matrix position of each codeword bit in the symbol')
+        table(name, placement)
+
+    print('/// Data Matrix bit positions, in the order of [dataMatrixSizes]')
+    print('static final dataMatrixPlacement = <List<int> Function()>[')
+    for name, _ in placements:
+        print(f'() => {name},')
+    print('];\n')
+
+
+# Aztec encoding modes, in the order of their indexes, and the number of
+# bits of their codes
+AZTEC_MODES = ('Upper', 'Lower', 'Digit', 'Mixed', 'Punct')
+AZTEC_MODE_BITS = (5, 5, 4, 5, 5)
+
+# Aztec code units of the values of each mode, None for the values that are
+# not characters. The code unit 0 has the value 0 of the mixed mode, which
+# is never output, and the punct value 7 is a second 0x27, the value 12
+# being used.
+AZTEC_CHARS = {
+    'Upper': [None, 0x20] + list(range(0x41, 0x5b)),
+    'Lower': [None, 0x20] + list(range(0x61, 0x7b)),
+    'Digit': [None, 0x20] + list(range(0x30, 0x3a)) + [0x2c, 0x2e],
+    'Mixed': [0, 0x20] + list(range(1, 14)) + list(range(27, 32)) +
+    [0x40, 0x5c, 0x5e, 0x5f, 0x60, 0x7c, 0x7e, 0x7f],
+    'Punct': [None, 0x0d, None, None, None, None, 0x21, 0x27, 0x23, 0x24,
+              0x25, 0x26, 0x27, 0x28, 0x29, 0x2a, 0x2b, 0x2c, 0x2d, 0x2e,
+              0x2f, 0x3a, 0x3b, 0x3c, 0x3d, 0x3e, 0x3f, 0x5b, 0x5d, 0x7b,
+              0x7d],
+}
+
+# Aztec latch codes from a mode to another, the other latches go through
+# intermediate modes
+AZTEC_LATCH = {
+    ('Upper', 'Lower'): 28,
+    ('Upper', 'Mixed'): 29,
+    ('Upper', 'Digit'): 30,
+    ('Lower', 'Mixed'): 29,
+    ('Lower', 'Digit'): 30,
+    ('Digit', 'Upper'): 14,
+    ('Mixed', 'Lower'): 28,
+    ('Mixed', 'Upper'): 29,
+    ('Mixed', 'Punct'): 30,
+    ('Punct', 'Upper'): 31,
+}
+
+# Aztec shift codes to output a single character of another mode, the
+# binary shift excepted
+AZTEC_SHIFT = {
+    ('Upper', 'Punct'): 0,
+    ('Lower', 'Punct'): 0,
+    ('Lower', 'Upper'): 28,
+    ('Digit', 'Punct'): 0,
+    ('Digit', 'Upper'): 15,
+    ('Mixed', 'Punct'): 0,
+}
+
+# Aztec special pairs of characters of the punct mode
+AZTEC_PAIRS = {
+    (0x0d, 0x0a): 2,
+    (0x2e, 0x20): 3,
+    (0x2c, 0x20): 4,
+    (0x3a, 0x20): 5,
+}
+
+# Aztec number of layers of the compact and full symbols, and maximum
+# number of data words given by the size of the mode message
+AZTEC_COMPACT_LAYERS = 4
+AZTEC_FULL_LAYERS = 32
+AZTEC_COMPACT_WORDS = 64
+AZTEC_FULL_WORDS = 2048
+
+
+def aztec_latches(source):
+    """Shortest sequence of latches from the mode source to each mode, as
+    (bits, value) indexed by target. On a tie, the path through the modes
+    listed first in AZTEC_MODES is used"""
+    queue = [(0, (), source, 0)]
+    result = {}
+    while queue:
+        bits, path, mode, value = heapq.heappop(queue)
+        if mode in result:
+            continue
+        result[mode] = (bits, value)
+        for (a, b), code in AZTEC_LATCH.items():
+            if a == mode and b not in result:
+                size = AZTEC_MODE_BITS[AZTEC_MODES.index(mode)]
+                heapq.heappush(queue, (
+                    bits + size, path + (AZTEC_MODES.index(b),), b,
+                    (value << size) + code))
+    return result
+
+
+def aztec_size(compact, layers):
+    """Aztec symbol size: word size, number of bits, size without and
+    with the reference grid, maximum number of data words"""
+    word_size = 6 if layers <= 2 else 8 if layers <= 8 else \
+        10 if layers <= 22 else 12
+    if compact:
+        bits = (88 + 16 * layers) * layers
+        base = 11 + layers * 4
+        return word_size, bits, base, base, AZTEC_COMPACT_WORDS
+    bits = (112 + 16 * layers) * layers
+    base = 14 + layers * 4
+    size = base + 1 + 2 * ((base // 2 - 1) // 15)
+    return word_size, bits, base, size, AZTEC_FULL_WORDS
+
+
+def aztec():
+    print('/// Aztec encoding modes')
+    for i, mode in enumerate(AZTEC_MODES):
+        print(f'static const aztecMode{mode} = {i};')
+    print('')
+
+    print('/// Aztec number of bits of the codes, indexed by mode')
+    print(f'static const aztecModeBits = <int>{list(AZTEC_MODE_BITS)};\n')
+
+    for mode, chars in AZTEC_CHARS.items():
+        table = {}
+        for value, char in enumerate(chars):
+            if char is not None:
+                table[char] = value
+        print(f'/// Aztec {mode.lower()} mode values, indexed by code unit')
+        dense(f'aztec{mode}', table)
+
+    print('/// Aztec values of the modes, indexed by mode')
+    print('static const aztecChars = <List<int>>[')
+    for mode in AZTEC_MODES:
+        print(f'aztec{mode},')
+    print('];\n')
+
+    latches = [aztec_latches(mode) for mode in AZTEC_MODES]
+    print('/// Aztec codes to latch from a mode (row) to another (column)')
+    print('static const aztecLatch = <int>[')
+    for a, latch in zip(AZTEC_MODES, latches):
+        print(', '.join(hex(latch[b][1]) for b in AZTEC_MODES) +
+              f', // from {a}')
+    print('];\n')
+
+    print('/// Aztec number of bits of the latch codes')
+    print('static const aztecLatchCost = <int>[')
+    for a, latch in zip(AZTEC_MODES, latches):
+        print(', '.join(str(latch[b][0]) for b in AZTEC_MODES) +
+              f', // from {a}')
+    print('];\n')
+
+    print('/// Aztec codes to shift from a mode (row) to another (column)')
+    print('static const aztecShift = <int>[')
+    for a in AZTEC_MODES:
+        print(', '.join(str(AZTEC_SHIFT[(a, b)]) if (a, b) in AZTEC_SHIFT
+                        else 'noCode' for b in AZTEC_MODES) + f', // from {a}')
+    print('];\n')
+
+    print('/// Aztec number of bits of a shift and the shifted character')
+    print('static const aztecShiftCost = <int>[')
+    for i, a in enumerate(AZTEC_MODES):
+        print(', '.join(str(AZTEC_MODE_BITS[i] + AZTEC_MODE_BITS[j])
+                        if (a, b) in AZTEC_SHIFT else 'noCode'
+                        for j, b in enumerate(AZTEC_MODES)) + f', // from {a}')
+    print('];\n')
+
+    print('/// Aztec punct values of the special pairs of characters, indexed')
+    print('/// by the first and second code units')
+    print('static const aztecPairs = <int, int>{')
+    for (a, b), value in AZTEC_PAIRS.items():
+        print(f'{hex(a << 8 | b)}: {value}, // {label(a)} {label(b)}')
+    print('};\n')
+
+    print(f'static const aztecCompactLayers = {AZTEC_COMPACT_LAYERS};')
+    print(f'static const aztecFullLayers = {AZTEC_FULL_LAYERS};\n')
+
+    print('/// Aztec symbol sizes, the compact ones first: compact, layers, '
+          'word size,')
+    print('/// bits, matrix size without and with the reference grid, '
+          'maximum data words')
+    print('static const aztecSizes = <List<int>>[')
+    for compact, count in ((1, AZTEC_COMPACT_LAYERS), (0, AZTEC_FULL_LAYERS)):
+        for layers in range(1, count + 1):
+            row = ', '.join(str(v) for v in aztec_size(compact, layers))
+            print(f'<int>[{compact}, {layers}, {row}],')
+    print('];\n')
+
+
+# PDF417 codewords of the clusters 0, 3 and 6 used by the rows, as
+# 17 modules starting with a bar, indexed by codeword value
+PDF417_CLUSTERS = (
+    (
+        0x1d5c0, 0x1eaf0, 0x1f57c, 0x1d4e0, 0x1ea78, 0x1f53e, 0x1a8c0, 0x1d470,
+        0x1a860, 0x15040, 0x1a830, 0x15020, 0x1adc0, 0x1d6f0, 0x1eb7c, 0x1ace0,
+        0x1d678, 0x1eb3e, 0x158c0, 0x1ac70, 0x15860, 0x15dc0, 0x1aef0, 0x1d77c,
+        0x15ce0, 0x1ae78, 0x1d73e, 0x15c70, 0x1ae3c, 0x15ef0, 0x1af7c, 0x15e78,
+        0x1af3e, 0x15f7c, 0x1f5fa, 0x1d2e0, 0x1e978, 0x1f4be, 0x1a4c0, 0x1d270,
+        0x1e93c, 0x1a460, 0x1d238, 0x14840, 0x1a430, 0x1d21c, 0x14820, 0x1a418,
+        0x14810, 0x1a6e0, 0x1d378, 0x1e9be, 0x14cc0, 0x1a670, 0x1d33c, 0x14c60,
+        0x1a638, 0x1d31e, 0x14c30, 0x1a61c, 0x14ee0, 0x1a778, 0x1d3be, 0x14e70,
+        0x1a73c, 0x14e38, 0x1a71e, 0x14f78, 0x1a7be, 0x14f3c, 0x14f1e, 0x1a2c0,
+        0x1d170, 0x1e8bc, 0x1a260, 0x1d138, 0x1e89e, 0x14440, 0x1a230, 0x1d11c,
+        0x14420, 0x1a218, 0x14410, 0x14408, 0x146c0, 0x1a370, 0x1d1bc, 0x14660,
+        0x1a338, 0x1d19e, 0x14630, 0x1a31c, 0x14618, 0x1460c, 0x14770, 0x1a3bc,
+        0x14738, 0x1a39e, 0x1471c, 0x147bc, 0x1a160, 0x1d0b8, 0x1e85e, 0x14240,
+        0x1a130, 0x1d09c, 0x14220, 0x1a118, 0x1d08e, 0x14210, 0x1a10c, 0x14208,
+        0x1a106, 0x14360, 0x1a1b8, 0x1d0de, 0x14330, 0x1a19c, 0x14318, 0x1a18e,
+        0x1430c, 0x14306, 0x1a1de, 0x1438e, 0x14140, 0x1a0b0, 0x1d05c, 0x14120,
+        0x1a098, 0x1d04e, 0x14110, 0x1a08c, 0x14108, 0x1a086, 0x14104, 0x141b0,
+        0x14198, 0x1418c, 0x140a0, 0x1d02e, 0x1a04c, 0x1a046, 0x14082, 0x1cae0,
+        0x1e578, 0x1f2be, 0x194c0, 0x1ca70, 0x1e53c, 0x19460, 0x1ca38, 0x1e51e,
+        0x12840, 0x19430, 0x12820, 0x196e0, 0x1cb78, 0x1e5be, 0x12cc0, 0x19670,
+        0x1cb3c, 0x12c60, 0x19638, 0x12c30, 0x12c18, 0x12ee0, 0x19778, 0x1cbbe,
+        0x12e70, 0x1973c, 0x12e38, 0x12e1c, 0x12f78, 0x197be, 0x12f3c, 0x12fbe,
+        0x1dac0, 0x1ed70, 0x1f6bc, 0x1da60, 0x1ed38, 0x1f69e, 0x1b440, 0x1da30,
+        0x1ed1c, 0x1b420, 0x1da18, 0x1ed0e, 0x1b410, 0x1da0c, 0x192c0, 0x1c970,
+        0x1e4bc, 0x1b6c0, 0x19260, 0x1c938, 0x1e49e, 0x1b660, 0x1db38, 0x1ed9e,
+        0x16c40, 0x12420, 0x19218, 0x1c90e, 0x16c20, 0x1b618, 0x16c10, 0x126c0,
+        0x19370, 0x1c9bc, 0x16ec0, 0x12660, 0x19338, 0x1c99e, 0x16e60, 0x1b738,
+        0x1db9e, 0x16e30, 0x12618, 0x16e18, 0x12770, 0x193bc, 0x16f70, 0x12738,
+        0x1939e, 0x16f38, 0x1b79e, 0x16f1c, 0x127bc, 0x16fbc, 0x1279e, 0x16f9e,
+        0x1d960, 0x1ecb8, 0x1f65e, 0x1b240, 0x1d930, 0x1ec9c, 0x1b220, 0x1d918,
+        0x1ec8e, 0x1b210, 0x1d90c, 0x1b208, 0x1b204, 0x19160, 0x1c8b8, 0x1e45e,
+        0x1b360, 0x19130, 0x1c89c, 0x16640, 0x12220, 0x1d99c, 0x1c88e, 0x16620,
+        0x12210, 0x1910c, 0x16610, 0x1b30c, 0x19106, 0x12204, 0x12360, 0x191b8,
+        0x1c8de, 0x16760, 0x12330, 0x1919c, 0x16730, 0x1b39c, 0x1918e, 0x16718,
+        0x1230c, 0x12306, 0x123b8, 0x191de, 0x167b8, 0x1239c, 0x1679c, 0x1238e,
+        0x1678e, 0x167de, 0x1b140, 0x1d8b0, 0x1ec5c, 0x1b120, 0x1d898, 0x1ec4e,
+        0x1b110, 0x1d88c, 0x1b108, 0x1d886, 0x1b104, 0x1b102, 0x12140, 0x190b0,
+        0x1c85c, 0x16340, 0x12120, 0x19098, 0x1c84e, 0x16320, 0x1b198, 0x1d8ce,
+        0x16310, 0x12108, 0x19086, 0x16308, 0x1b186, 0x16304, 0x121b0, 0x190dc,
+        0x163b0, 0x12198, 0x190ce, 0x16398, 0x1b1ce, 0x1638c, 0x12186, 0x16386,
+        0x163dc, 0x163ce, 0x1b0a0, 0x1d858, 0x1ec2e, 0x1b090, 0x1d84c, 0x1b088,
+        0x1d846, 0x1b084, 0x1b082, 0x120a0, 0x19058, 0x1c82e, 0x161a0, 0x12090,
+        0x1904c, 0x16190, 0x1b0cc, 0x19046, 0x16188, 0x12084, 0x16184, 0x12082,
+        0x120d8, 0x161d8, 0x161cc, 0x161c6, 0x1d82c, 0x1d826, 0x1b042, 0x1902c,
+        0x12048, 0x160c8, 0x160c4, 0x160c2, 0x18ac0, 0x1c570, 0x1e2bc, 0x18a60,
+        0x1c538, 0x11440, 0x18a30, 0x1c51c, 0x11420, 0x18a18, 0x11410, 0x11408,
+        0x116c0, 0x18b70, 0x1c5bc, 0x11660, 0x18b38, 0x1c59e, 0x11630, 0x18b1c,
+        0x11618, 0x1160c, 0x11770, 0x18bbc, 0x11738, 0x18b9e, 0x1171c, 0x117bc,
+        0x1179e, 0x1cd60, 0x1e6b8, 0x1f35e, 0x19a40, 0x1cd30, 0x1e69c, 0x19a20,
+        0x1cd18, 0x1e68e, 0x19a10, 0x1cd0c, 0x19a08, 0x1cd06, 0x18960, 0x1c4b8,
+        0x1e25e, 0x19b60, 0x18930, 0x1c49c, 0x13640, 0x11220, 0x1cd9c, 0x1c48e,
+        0x13620, 0x19b18, 0x1890c, 0x13610, 0x11208, 0x13608, 0x11360, 0x189b8,
+        0x1c4de, 0x13760, 0x11330, 0x1cdde, 0x13730, 0x19b9c, 0x1898e, 0x13718,
+        0x1130c, 0x1370c, 0x113b8, 0x189de, 0x137b8, 0x1139c, 0x1379c, 0x1138e,
+        0x113de, 0x137de, 0x1dd40, 0x1eeb0, 0x1f75c, 0x1dd20, 0x1ee98, 0x1f74e,
+        0x1dd10, 0x1ee8c, 0x1dd08, 0x1ee86, 0x1dd04, 0x19940, 0x1ccb0, 0x1e65c,
+        0x1bb40, 0x19920, 0x1eedc, 0x1e64e, 0x1bb20, 0x1dd98, 0x1eece, 0x1bb10,
+        0x19908, 0x1cc86, 0x1bb08, 0x1dd86, 0x19902, 0x11140, 0x188b0, 0x1c45c,
+        0x13340, 0x11120, 0x18898, 0x1c44e, 0x17740, 0x13320, 0x19998, 0x1ccce,
+        0x17720, 0x1bb98, 0x1ddce, 0x18886, 0x17710, 0x13308, 0x19986, 0x17708,
+        0x11102, 0x111b0, 0x188dc, 0x133b0, 0x11198, 0x188ce, 0x177b0, 0x13398,
+        0x199ce, 0x17798, 0x1bbce, 0x11186, 0x13386, 0x111dc, 0x133dc, 0x111ce,
+        0x177dc, 0x133ce, 0x1dca0, 0x1ee58, 0x1f72e, 0x1dc90, 0x1ee4c, 0x1dc88,
+        0x1ee46, 0x1dc84, 0x1dc82, 0x198a0, 0x1cc58, 0x1e62e, 0x1b9a0, 0x19890,
+        0x1ee6e, 0x1b990, 0x1dccc, 0x1cc46, 0x1b988, 0x19884, 0x1b984, 0x19882,
+        0x1b982, 0x110a0, 0x18858, 0x1c42e, 0x131a0, 0x11090, 0x1884c, 0x173a0,
+        0x13190, 0x198cc, 0x18846, 0x17390, 0x1b9cc, 0x11084, 0x17388, 0x13184,
+        0x11082, 0x13182, 0x110d8, 0x1886e, 0x131d8, 0x110cc, 0x173d8, 0x131cc,
+        0x110c6, 0x173cc, 0x131c6, 0x110ee, 0x173ee, 0x1dc50, 0x1ee2c, 0x1dc48,
+        0x1ee26, 0x1dc44, 0x1dc42, 0x19850, 0x1cc2c, 0x1b8d0, 0x19848, 0x1cc26,
+        0x1b8c8, 0x1dc66, 0x1b8c4, 0x19842, 0x1b8c2, 0x11050, 0x1882c, 0x130d0,
+        0x11048, 0x18826, 0x171d0, 0x130c8, 0x19866, 0x171c8, 0x1b8e6, 0x11042,
+        0x171c4, 0x130c2, 0x171c2, 0x130ec, 0x171ec, 0x171e6, 0x1ee16, 0x1dc22,
+        0x1cc16, 0x19824, 0x19822, 0x11028, 0x13068, 0x170e8, 0x11022, 0x13062,
+        0x18560, 0x10a40, 0x18530, 0x10a20, 0x18518, 0x1c28e, 0x10a10, 0x1850c,
+        0x10a08, 0x18506, 0x10b60, 0x185b8, 0x1c2de, 0x10b30, 0x1859c, 0x10b18,
+        0x1858e, 0x10b0c, 0x10b06, 0x10bb8, 0x185de, 0x10b9c, 0x10b8e, 0x10bde,
+        0x18d40, 0x1c6b0, 0x1e35c, 0x18d20, 0x1c698, 0x18d10, 0x1c68c, 0x18d08,
+        0x1c686, 0x18d04, 0x10940, 0x184b0, 0x1c25c, 0x11b40, 0x10920, 0x1c6dc,
+        0x1c24e, 0x11b20, 0x18d98, 0x1c6ce, 0x11b10, 0x10908, 0x18486, 0x11b08,
+        0x18d86, 0x10902, 0x109b0, 0x184dc, 0x11bb0, 0x10998, 0x184ce, 0x11b98,
+        0x18dce, 0x11b8c, 0x10986, 0x109dc, 0x11bdc, 0x109ce, 0x11bce, 0x1cea0,
+        0x1e758, 0x1f3ae, 0x1ce90, 0x1e74c, 0x1ce88, 0x1e746, 0x1ce84, 0x1ce82,
+        0x18ca0, 0x1c658, 0x19da0, 0x18c90, 0x1c64c, 0x19d90, 0x1cecc, 0x1c646,
+        0x19d88, 0x18c84, 0x19d84, 0x18c82, 0x19d82, 0x108a0, 0x18458, 0x119a0,
+        0x10890, 0x1c66e, 0x13ba0, 0x11990, 0x18ccc, 0x18446, 0x13b90, 0x19dcc,
+        0x10884, 0x13b88, 0x11984, 0x10882, 0x11982, 0x108d8, 0x1846e, 0x119d8,
+        0x108cc, 0x13bd8, 0x119cc, 0x108c6, 0x13bcc, 0x119c6, 0x108ee, 0x119ee,
+        0x13bee, 0x1ef50, 0x1f7ac, 0x1ef48, 0x1f7a6, 0x1ef44, 0x1ef42, 0x1ce50,
+        0x1e72c, 0x1ded0, 0x1ef6c, 0x1e726, 0x1dec8, 0x1ef66, 0x1dec4, 0x1ce42,
+        0x1dec2, 0x18c50, 0x1c62c, 0x19cd0, 0x18c48, 0x1c626, 0x1bdd0, 0x19cc8,
+        0x1ce66, 0x1bdc8, 0x1dee6, 0x18c42, 0x1bdc4, 0x19cc2, 0x1bdc2, 0x10850,
+        0x1842c, 0x118d0, 0x10848, 0x18426, 0x139d0, 0x118c8, 0x18c66, 0x17bd0,
+        0x139c8, 0x19ce6, 0x10842, 0x17bc8, 0x1bde6, 0x118c2, 0x17bc4, 0x1086c,
+        0x118ec, 0x10866, 0x139ec, 0x118e6, 0x17bec, 0x139e6, 0x17be6, 0x1ef28,
+        0x1f796, 0x1ef24, 0x1ef22, 0x1ce28, 0x1e716, 0x1de68, 0x1ef36, 0x1de64,
+        0x1ce22, 0x1de62, 0x18c28, 0x1c616, 0x19c68, 0x18c24, 0x1bce8, 0x19c64,
+        0x18c22, 0x1bce4, 0x19c62, 0x1bce2, 0x10828, 0x18416, 0x11868, 0x18c36,
+        0x138e8, 0x11864, 0x10822, 0x179e8, 0x138e4, 0x11862, 0x179e4, 0x138e2,
+        0x179e2, 0x11876, 0x179f6, 0x1ef12, 0x1de34, 0x1de32, 0x19c34, 0x1bc74,
+        0x1bc72, 0x11834, 0x13874, 0x178f4, 0x178f2, 0x10540, 0x10520, 0x18298,
+        0x10510, 0x10508, 0x10504, 0x105b0, 0x10598, 0x1058c, 0x10586, 0x105dc,
+        0x105ce, 0x186a0, 0x18690, 0x1c34c, 0x18688, 0x1c346, 0x18684, 0x18682,
+        0x104a0, 0x18258, 0x10da0, 0x186d8, 0x1824c, 0x10d90, 0x186cc, 0x10d88,
+        0x186c6, 0x10d84, 0x10482, 0x10d82, 0x104d8, 0x1826e, 0x10dd8, 0x186ee,
+        0x10dcc, 0x104c6, 0x10dc6, 0x104ee, 0x10dee, 0x1c750, 0x1c748, 0x1c744,
+        0x1c742, 0x18650, 0x18ed0, 0x1c76c, 0x1c326, 0x18ec8, 0x1c766, 0x18ec4,
+        0x18642, 0x18ec2, 0x10450, 0x10cd0, 0x10448, 0x18226, 0x11dd0, 0x10cc8,
+        0x10444, 0x11dc8, 0x10cc4, 0x10442, 0x11dc4, 0x10cc2, 0x1046c, 0x10cec,
+        0x10466, 0x11dec, 0x10ce6, 0x11de6, 0x1e7a8, 0x1e7a4, 0x1e7a2, 0x1c728,
+        0x1cf68, 0x1e7b6, 0x1cf64, 0x1c722, 0x1cf62, 0x18628, 0x1c316, 0x18e68,
+        0x1c736, 0x19ee8, 0x18e64, 0x18622, 0x19ee4, 0x18e62, 0x19ee2, 0x10428,
+        0x18216, 0x10c68, 0x18636, 0x11ce8, 0x10c64, 0x10422, 0x13de8, 0x11ce4,
+        0x10c62, 0x13de4, 0x11ce2, 0x10436, 0x10c76, 0x11cf6, 0x13df6, 0x1f7d4,
+        0x1f7d2, 0x1e794, 0x1efb4, 0x1e792, 0x1efb2, 0x1c714, 0x1cf34, 0x1c712,
+        0x1df74, 0x1cf32, 0x1df72, 0x18614, 0x18e34, 0x18612, 0x19e74, 0x18e32,
+        0x1bef4,
+    ),
+    (
+        0x1f560, 0x1fab8, 0x1ea40, 0x1f530, 0x1fa9c, 0x1ea20, 0x1f518, 0x1fa8e,
+        0x1ea10, 0x1f50c, 0x1ea08, 0x1f506, 0x1ea04, 0x1eb60, 0x1f5b8, 0x1fade,
+        0x1d640, 0x1eb30, 0x1f59c, 0x1d620, 0x1eb18, 0x1f58e, 0x1d610, 0x1eb0c,
+        0x1d608, 0x1eb06, 0x1d604, 0x1d760, 0x1ebb8, 0x1f5de, 0x1ae40, 0x1d730,
+        0x1eb9c, 0x1ae20, 0x1d718, 0x1eb8e, 0x1ae10, 0x1d70c, 0x1ae08, 0x1d706,
+        0x1ae04, 0x1af60, 0x1d7b8, 0x1ebde, 0x15e40, 0x1af30, 0x1d79c, 0x15e20,
+        0x1af18, 0x1d78e, 0x15e10, 0x1af0c, 0x15e08, 0x1af06, 0x15f60, 0x1afb8,
+        0x1d7de, 0x15f30, 0x1af9c, 0x15f18, 0x1af8e, 0x15f0c, 0x15fb8, 0x1afde,
+        0x15f9c, 0x15f8e, 0x1e940, 0x1f4b0, 0x1fa5c, 0x1e920, 0x1f498, 0x1fa4e,
+        0x1e910, 0x1f48c, 0x1e908, 0x1f486, 0x1e904, 0x1e902, 0x1d340, 0x1e9b0,
+        0x1f4dc, 0x1d320, 0x1e998, 0x1f4ce, 0x1d310, 0x1e98c, 0x1d308, 0x1e986,
+        0x1d304, 0x1d302, 0x1a740, 0x1d3b0, 0x1e9dc, 0x1a720, 0x1d398, 0x1e9ce,
+        0x1a710, 0x1d38c, 0x1a708, 0x1d386, 0x1a704, 0x1a702, 0x14f40, 0x1a7b0,
+        0x1d3dc, 0x14f20, 0x1a798, 0x1d3ce, 0x14f10, 0x1a78c, 0x14f08, 0x1a786,
+        0x14f04, 0x14fb0, 0x1a7dc, 0x14f98, 0x1a7ce, 0x14f8c, 0x14f86, 0x14fdc,
+        0x14fce, 0x1e8a0, 0x1f458, 0x1fa2e, 0x1e890, 0x1f44c, 0x1e888, 0x1f446,
+        0x1e884, 0x1e882, 0x1d1a0, 0x1e8d8, 0x1f46e, 0x1d190, 0x1e8cc, 0x1d188,
+        0x1e8c6, 0x1d184, 0x1d182, 0x1a3a0, 0x1d1d8, 0x1e8ee, 0x1a390, 0x1d1cc,
+        0x1a388, 0x1d1c6, 0x1a384, 0x1a382, 0x147a0, 0x1a3d8, 0x1d1ee, 0x14790,
+        0x1a3cc, 0x14788, 0x1a3c6, 0x14784, 0x14782, 0x147d8, 0x1a3ee, 0x147cc,
+        0x147c6, 0x147ee, 0x1e850, 0x1f42c, 0x1e848, 0x1f426, 0x1e844, 0x1e842,
+        0x1d0d0, 0x1e86c, 0x1d0c8, 0x1e866, 0x1d0c4, 0x1d0c2, 0x1a1d0, 0x1d0ec,
+        0x1a1c8, 0x1d0e6, 0x1a1c4, 0x1a1c2, 0x143d0, 0x1a1ec, 0x143c8, 0x1a1e6,
+        0x143c4, 0x143c2, 0x143ec, 0x143e6, 0x1e828, 0x1f416, 0x1e824, 0x1e822,
+        0x1d068, 0x1e836, 0x1d064, 0x1d062, 0x1a0e8, 0x1d076, 0x1a0e4, 0x1a0e2,
+        0x141e8, 0x1a0f6, 0x141e4, 0x141e2, 0x1e814, 0x1e812, 0x1d034, 0x1d032,
+        0x1a074, 0x1a072, 0x1e540, 0x1f2b0, 0x1f95c, 0x1e520, 0x1f298, 0x1f94e,
+        0x1e510, 0x1f28c, 0x1e508, 0x1f286, 0x1e504, 0x1e502, 0x1cb40, 0x1e5b0,
+        0x1f2dc, 0x1cb20, 0x1e598, 0x1f2ce, 0x1cb10, 0x1e58c, 0x1cb08, 0x1e586,
+        0x1cb04, 0x1cb02, 0x19740, 0x1cbb0, 0x1e5dc, 0x19720, 0x1cb98, 0x1e5ce,
+        0x19710, 0x1cb8c, 0x19708, 0x1cb86, 0x19704, 0x19702, 0x12f40, 0x197b0,
+        0x1cbdc, 0x12f20, 0x19798, 0x1cbce, 0x12f10, 0x1978c, 0x12f08, 0x19786,
+        0x12f04, 0x12fb0, 0x197dc, 0x12f98, 0x197ce, 0x12f8c, 0x12f86, 0x12fdc,
+        0x12fce, 0x1f6a0, 0x1fb58, 0x16bf0, 0x1f690, 0x1fb4c, 0x169f8, 0x1f688,
+        0x1fb46, 0x168fc, 0x1f684, 0x1f682, 0x1e4a0, 0x1f258, 0x1f92e, 0x1eda0,
+        0x1e490, 0x1fb6e, 0x1ed90, 0x1f6cc, 0x1f246, 0x1ed88, 0x1e484, 0x1ed84,
+        0x1e482, 0x1ed82, 0x1c9a0, 0x1e4d8, 0x1f26e, 0x1dba0, 0x1c990, 0x1e4cc,
+        0x1db90, 0x1edcc, 0x1e4c6, 0x1db88, 0x1c984, 0x1db84, 0x1c982, 0x1db82,
+        0x193a0, 0x1c9d8, 0x1e4ee, 0x1b7a0, 0x19390, 0x1c9cc, 0x1b790, 0x1dbcc,
+        0x1c9c6, 0x1b788, 0x19384, 0x1b784, 0x19382, 0x1b782, 0x127a0, 0x193d8,
+        0x1c9ee, 0x16fa0, 0x12790, 0x193cc, 0x16f90, 0x1b7cc, 0x193c6, 0x16f88,
+        0x12784, 0x16f84, 0x12782, 0x127d8, 0x193ee, 0x16fd8, 0x127cc, 0x16fcc,
+        0x127c6, 0x16fc6, 0x127ee, 0x1f650, 0x1fb2c, 0x165f8, 0x1f648, 0x1fb26,
+        0x164fc, 0x1f644, 0x1647e, 0x1f642, 0x1e450, 0x1f22c, 0x1ecd0, 0x1e448,
+        0x1f226, 0x1ecc8, 0x1f666, 0x1ecc4, 0x1e442, 0x1ecc2, 0x1c8d0, 0x1e46c,
+        0x1d9d0, 0x1c8c8, 0x1e466, 0x1d9c8, 0x1ece6, 0x1d9c4, 0x1c8c2, 0x1d9c2,
+        0x191d0, 0x1c8ec, 0x1b3d0, 0x191c8, 0x1c8e6, 0x1b3c8, 0x1d9e6, 0x1b3c4,
+        0x191c2, 0x1b3c2, 0x123d0, 0x191ec, 0x167d0, 0x123c8, 0x191e6, 0x167c8,
+        0x1b3e6, 0x167c4, 0x123c2, 0x167c2, 0x123ec, 0x167ec, 0x123e6, 0x167e6,
+        0x1f628, 0x1fb16, 0x162fc, 0x1f624, 0x1627e, 0x1f622, 0x1e428, 0x1f216,
+        0x1ec68, 0x1f636, 0x1ec64, 0x1e422, 0x1ec62, 0x1c868, 0x1e436, 0x1d8e8,
+        0x1c864, 0x1d8e4, 0x1c862, 0x1d8e2, 0x190e8, 0x1c876, 0x1b1e8, 0x1d8f6,
+        0x1b1e4, 0x190e2, 0x1b1e2, 0x121e8, 0x190f6, 0x163e8, 0x121e4, 0x163e4,
+        0x121e2, 0x163e2, 0x121f6, 0x163f6, 0x1f614, 0x1617e, 0x1f612, 0x1e414,
+        0x1ec34, 0x1e412, 0x1ec32, 0x1c834, 0x1d874, 0x1c832, 0x1d872, 0x19074,
+        0x1b0f4, 0x19072, 0x1b0f2, 0x120f4, 0x161f4, 0x120f2, 0x161f2, 0x1f60a,
+        0x1e40a, 0x1ec1a, 0x1c81a, 0x1d83a, 0x1903a, 0x1b07a, 0x1e2a0, 0x1f158,
+        0x1f8ae, 0x1e290, 0x1f14c, 0x1e288, 0x1f146, 0x1e284, 0x1e282, 0x1c5a0,
+        0x1e2d8, 0x1f16e, 0x1c590, 0x1e2cc, 0x1c588, 0x1e2c6, 0x1c584, 0x1c582,
+        0x18ba0, 0x1c5d8, 0x1e2ee, 0x18b90, 0x1c5cc, 0x18b88, 0x1c5c6, 0x18b84,
+        0x18b82, 0x117a0, 0x18bd8, 0x1c5ee, 0x11790, 0x18bcc, 0x11788, 0x18bc6,
+        0x11784, 0x11782, 0x117d8, 0x18bee, 0x117cc, 0x117c6, 0x117ee, 0x1f350,
+        0x1f9ac, 0x135f8, 0x1f348, 0x1f9a6, 0x134fc, 0x1f344, 0x1347e, 0x1f342,
+        0x1e250, 0x1f12c, 0x1e6d0, 0x1e248, 0x1f126, 0x1e6c8, 0x1f366, 0x1e6c4,
+        0x1e242, 0x1e6c2, 0x1c4d0, 0x1e26c, 0x1cdd0, 0x1c4c8, 0x1e266, 0x1cdc8,
+        0x1e6e6, 0x1cdc4, 0x1c4c2, 0x1cdc2, 0x189d0, 0x1c4ec, 0x19bd0, 0x189c8,
+        0x1c4e6, 0x19bc8, 0x1cde6, 0x19bc4, 0x189c2, 0x19bc2, 0x113d0, 0x189ec,
+        0x137d0, 0x113c8, 0x189e6, 0x137c8, 0x19be6, 0x137c4, 0x113c2, 0x137c2,
+        0x113ec, 0x137ec, 0x113e6, 0x137e6, 0x1fba8, 0x175f0, 0x1bafc, 0x1fba4,
+        0x174f8, 0x1ba7e, 0x1fba2, 0x1747c, 0x1743e, 0x1f328, 0x1f996, 0x132fc,
+        0x1f768, 0x1fbb6, 0x176fc, 0x1327e, 0x1f764, 0x1f322, 0x1767e, 0x1f762,
+        0x1e228, 0x1f116, 0x1e668, 0x1e224, 0x1eee8, 0x1f776, 0x1e222, 0x1eee4,
+        0x1e662, 0x1eee2, 0x1c468, 0x1e236, 0x1cce8, 0x1c464, 0x1dde8, 0x1cce4,
+        0x1c462, 0x1dde4, 0x1cce2, 0x1dde2, 0x188e8, 0x1c476, 0x199e8, 0x188e4,
+        0x1bbe8, 0x199e4, 0x188e2, 0x1bbe4, 0x199e2, 0x1bbe2, 0x111e8, 0x188f6,
+        0x133e8, 0x111e4, 0x177e8, 0x133e4, 0x111e2, 0x177e4, 0x133e2, 0x177e2,
+        0x111f6, 0x133f6, 0x1fb94, 0x172f8, 0x1b97e, 0x1fb92, 0x1727c, 0x1723e,
+        0x1f314, 0x1317e, 0x1f734, 0x1f312, 0x1737e, 0x1f732, 0x1e214, 0x1e634,
+        0x1e212, 0x1ee74, 0x1e632, 0x1ee72, 0x1c434, 0x1cc74, 0x1c432, 0x1dcf4,
+        0x1cc72, 0x1dcf2, 0x18874, 0x198f4, 0x18872, 0x1b9f4, 0x198f2, 0x1b9f2,
+        0x110f4, 0x131f4, 0x110f2, 0x173f4, 0x131f2, 0x173f2, 0x1fb8a, 0x1717c,
+        0x1713e, 0x1f30a, 0x1f71a, 0x1e20a, 0x1e61a, 0x1ee3a, 0x1c41a, 0x1cc3a,
+        0x1dc7a, 0x1883a, 0x1987a, 0x1b8fa, 0x1107a, 0x130fa, 0x171fa, 0x170be,
+        0x1e150, 0x1f0ac, 0x1e148, 0x1f0a6, 0x1e144, 0x1e142, 0x1c2d0, 0x1e16c,
+        0x1c2c8, 0x1e166, 0x1c2c4, 0x1c2c2, 0x185d0, 0x1c2ec, 0x185c8, 0x1c2e6,
+        0x185c4, 0x185c2, 0x10bd0, 0x185ec, 0x10bc8, 0x185e6, 0x10bc4, 0x10bc2,
+        0x10bec, 0x10be6, 0x1f1a8, 0x1f8d6, 0x11afc, 0x1f1a4, 0x11a7e, 0x1f1a2,
+        0x1e128, 0x1f096, 0x1e368, 0x1e124, 0x1e364, 0x1e122, 0x1e362, 0x1c268,
+        0x1e136, 0x1c6e8, 0x1c264, 0x1c6e4, 0x1c262, 0x1c6e2, 0x184e8, 0x1c276,
+        0x18de8, 0x184e4, 0x18de4, 0x184e2, 0x18de2, 0x109e8, 0x184f6, 0x11be8,
+        0x109e4, 0x11be4, 0x109e2, 0x11be2, 0x109f6, 0x11bf6, 0x1f9d4, 0x13af8,
+        0x19d7e, 0x1f9d2, 0x13a7c, 0x13a3e, 0x1f194, 0x1197e, 0x1f3b4, 0x1f192,
+        0x13b7e, 0x1f3b2, 0x1e114, 0x1e334, 0x1e112, 0x1e774, 0x1e332, 0x1e772,
+        0x1c234, 0x1c674, 0x1c232, 0x1cef4, 0x1c672, 0x1cef2, 0x18474, 0x18cf4,
+        0x18472, 0x19df4, 0x18cf2, 0x19df2, 0x108f4, 0x119f4, 0x108f2, 0x13bf4,
+        0x119f2, 0x13bf2, 0x17af0, 0x1bd7c, 0x17a78, 0x1bd3e, 0x17a3c, 0x17a1e,
+        0x1f9ca, 0x1397c, 0x1fbda, 0x17b7c, 0x1393e, 0x17b3e, 0x1f18a, 0x1f39a,
+        0x1f7ba, 0x1e10a, 0x1e31a, 0x1e73a, 0x1ef7a, 0x1c21a, 0x1c63a, 0x1ce7a,
+        0x1defa, 0x1843a, 0x18c7a, 0x19cfa, 0x1bdfa, 0x1087a, 0x118fa, 0x139fa,
+        0x17978, 0x1bcbe, 0x1793c, 0x1791e, 0x138be, 0x179be, 0x178bc, 0x1789e,
+        0x1785e, 0x1e0a8, 0x1e0a4, 0x1e0a2, 0x1c168, 0x1e0b6, 0x1c164, 0x1c162,
+        0x182e8, 0x1c176, 0x182e4, 0x182e2, 0x105e8, 0x182f6, 0x105e4, 0x105e2,
+        0x105f6, 0x1f0d4, 0x10d7e, 0x1f0d2, 0x1e094, 0x1e1b4, 0x1e092, 0x1e1b2,
+        0x1c134, 0x1c374, 0x1c132, 0x1c372, 0x18274, 0x186f4, 0x18272, 0x186f2,
+        0x104f4, 0x10df4, 0x104f2, 0x10df2, 0x1f8ea, 0x11d7c, 0x11d3e, 0x1f0ca,
+        0x1f1da, 0x1e08a, 0x1e19a, 0x1e3ba, 0x1c11a, 0x1c33a, 0x1c77a, 0x1823a,
+        0x1867a, 0x18efa, 0x1047a, 0x10cfa, 0x11dfa, 0x13d78, 0x19ebe, 0x13d3c,
+        0x13d1e, 0x11cbe, 0x13dbe, 0x17d70, 0x1bebc, 0x17d38, 0x1be9e, 0x17d1c,
+        0x17d0e, 0x13cbc, 0x17dbc, 0x13c9e, 0x17d9e, 0x17cb8, 0x1be5e, 0x17c9c,
+        0x17c8e, 0x13c5e, 0x17cde, 0x17c5c, 0x17c4e, 0x17c2e, 0x1c0b4, 0x1c0b2,
+        0x18174, 0x18172, 0x102f4, 0x102f2, 0x1e0da, 0x1c09a, 0x1c1ba, 0x1813a,
+        0x1837a, 0x1027a, 0x106fa, 0x10ebe, 0x11ebc, 0x11e9e, 0x13eb8, 0x19f5e,
+        0x13e9c, 0x13e8e, 0x11e5e, 0x13ede, 0x17eb0, 0x1bf5c, 0x17e98, 0x1bf4e,
+        0x17e8c, 0x17e86, 0x13e5c, 0x17edc, 0x13e4e, 0x17ece, 0x17e58, 0x1bf2e,
+        0x17e4c, 0x17e46, 0x13e2e, 0x17e6e, 0x17e2c, 0x17e26, 0x10f5e, 0x11f5c,
+        0x11f4e, 0x13f58, 0x19fae, 0x13f4c, 0x13f46, 0x11f2e, 0x13f6e, 0x13f2c,
+        0x13f26,
+    ),
+    (
+        0x1abe0, 0x1d5f8, 0x153c0, 0x1a9f0, 0x1d4fc, 0x151e0, 0x1a8f8, 0x1d47e,
+        0x150f0, 0x1a87c, 0x15078, 0x1fad0, 0x15be0, 0x1adf8, 0x1fac8, 0x159f0,
+        0x1acfc, 0x1fac4, 0x158f8, 0x1ac7e, 0x1fac2, 0x1587c, 0x1f5d0, 0x1faec,
+        0x15df8, 0x1f5c8, 0x1fae6, 0x15cfc, 0x1f5c4, 0x15c7e, 0x1f5c2, 0x1ebd0,
+        0x1f5ec, 0x1ebc8, 0x1f5e6, 0x1ebc4, 0x1ebc2, 0x1d7d0, 0x1ebec, 0x1d7c8,
+        0x1ebe6, 0x1d7c4, 0x1d7c2, 0x1afd0, 0x1d7ec, 0x1afc8, 0x1d7e6, 0x1afc4,
+        0x14bc0, 0x1a5f0, 0x1d2fc, 0x149e0, 0x1a4f8, 0x1d27e, 0x148f0, 0x1a47c,
+        0x14878, 0x1a43e, 0x1483c, 0x1fa68, 0x14df0, 0x1a6fc, 0x1fa64, 0x14cf8,
+        0x1a67e, 0x1fa62, 0x14c7c, 0x14c3e, 0x1f4e8, 0x1fa76, 0x14efc, 0x1f4e4,
+        0x14e7e, 0x1f4e2, 0x1e9e8, 0x1f4f6, 0x1e9e4, 0x1e9e2, 0x1d3e8, 0x1e9f6,
+        0x1d3e4, 0x1d3e2, 0x1a7e8, 0x1d3f6, 0x1a7e4, 0x1a7e2, 0x145e0, 0x1a2f8,
+        0x1d17e, 0x144f0, 0x1a27c, 0x14478, 0x1a23e, 0x1443c, 0x1441e, 0x1fa34,
+        0x146f8, 0x1a37e, 0x1fa32, 0x1467c, 0x1463e, 0x1f474, 0x1477e, 0x1f472,
+        0x1e8f4, 0x1e8f2, 0x1d1f4, 0x1d1f2, 0x1a3f4, 0x1a3f2, 0x142f0, 0x1a17c,
+        0x14278, 0x1a13e, 0x1423c, 0x1421e, 0x1fa1a, 0x1437c, 0x1433e, 0x1f43a,
+        0x1e87a, 0x1d0fa, 0x14178, 0x1a0be, 0x1413c, 0x1411e, 0x141be, 0x140bc,
+        0x1409e, 0x12bc0, 0x195f0, 0x1cafc, 0x129e0, 0x194f8, 0x1ca7e, 0x128f0,
+        0x1947c, 0x12878, 0x1943e, 0x1283c, 0x1f968, 0x12df0, 0x196fc, 0x1f964,
+        0x12cf8, 0x1967e, 0x1f962, 0x12c7c, 0x12c3e, 0x1f2e8, 0x1f976, 0x12efc,
+        0x1f2e4, 0x12e7e, 0x1f2e2, 0x1e5e8, 0x1f2f6, 0x1e5e4, 0x1e5e2, 0x1cbe8,
+        0x1e5f6, 0x1cbe4, 0x1cbe2, 0x197e8, 0x1cbf6, 0x197e4, 0x197e2, 0x1b5e0,
+        0x1daf8, 0x1ed7e, 0x169c0, 0x1b4f0, 0x1da7c, 0x168e0, 0x1b478, 0x1da3e,
+        0x16870, 0x1b43c, 0x16838, 0x1b41e, 0x1681c, 0x125e0, 0x192f8, 0x1c97e,
+        0x16de0, 0x124f0, 0x1927c, 0x16cf0, 0x1b67c, 0x1923e, 0x16c78, 0x1243c,
+        0x16c3c, 0x1241e, 0x16c1e, 0x1f934, 0x126f8, 0x1937e, 0x1fb74, 0x1f932,
+        0x16ef8, 0x1267c, 0x1fb72, 0x16e7c, 0x1263e, 0x16e3e, 0x1f274, 0x1277e,
+        0x1f6f4, 0x1f272, 0x16f7e, 0x1f6f2, 0x1e4f4, 0x1edf4, 0x1e4f2, 0x1edf2,
+        0x1c9f4, 0x1dbf4, 0x1c9f2, 0x1dbf2, 0x193f4, 0x193f2, 0x165c0, 0x1b2f0,
+        0x1d97c, 0x164e0, 0x1b278, 0x1d93e, 0x16470, 0x1b23c, 0x16438, 0x1b21e,
+        0x1641c, 0x1640e, 0x122f0, 0x1917c, 0x166f0, 0x12278, 0x1913e, 0x16678,
+        0x1b33e, 0x1663c, 0x1221e, 0x1661e, 0x1f91a, 0x1237c, 0x1fb3a, 0x1677c,
+        0x1233e, 0x1673e, 0x1f23a, 0x1f67a, 0x1e47a, 0x1ecfa, 0x1c8fa, 0x1d9fa,
+        0x191fa, 0x162e0, 0x1b178, 0x1d8be, 0x16270, 0x1b13c, 0x16238, 0x1b11e,
+        0x1621c, 0x1620e, 0x12178, 0x190be, 0x16378, 0x1213c, 0x1633c, 0x1211e,
+        0x1631e, 0x121be, 0x163be, 0x16170, 0x1b0bc, 0x16138, 0x1b09e, 0x1611c,
+        0x1610e, 0x120bc, 0x161bc, 0x1209e, 0x1619e, 0x160b8, 0x1b05e, 0x1609c,
+        0x1608e, 0x1205e, 0x160de, 0x1605c, 0x1604e, 0x115e0, 0x18af8, 0x1c57e,
+        0x114f0, 0x18a7c, 0x11478, 0x18a3e, 0x1143c, 0x1141e, 0x1f8b4, 0x116f8,
+        0x18b7e, 0x1f8b2, 0x1167c, 0x1163e, 0x1f174, 0x1177e, 0x1f172, 0x1e2f4,
+        0x1e2f2, 0x1c5f4, 0x1c5f2, 0x18bf4, 0x18bf2, 0x135c0, 0x19af0, 0x1cd7c,
+        0x134e0, 0x19a78, 0x1cd3e, 0x13470, 0x19a3c, 0x13438, 0x19a1e, 0x1341c,
+        0x1340e, 0x112f0, 0x1897c, 0x136f0, 0x11278, 0x1893e, 0x13678, 0x19b3e,
+        0x1363c, 0x1121e, 0x1361e, 0x1f89a, 0x1137c, 0x1f9ba, 0x1377c, 0x1133e,
+        0x1373e, 0x1f13a, 0x1f37a, 0x1e27a, 0x1e6fa, 0x1c4fa, 0x1cdfa, 0x189fa,
+        0x1bae0, 0x1dd78, 0x1eebe, 0x174c0, 0x1ba70, 0x1dd3c, 0x17460, 0x1ba38,
+        0x1dd1e, 0x17430, 0x1ba1c, 0x17418, 0x1ba0e, 0x1740c, 0x132e0, 0x19978,
+        0x1ccbe, 0x176e0, 0x13270, 0x1993c, 0x17670, 0x1bb3c, 0x1991e, 0x17638,
+        0x1321c, 0x1761c, 0x1320e, 0x1760e, 0x11178, 0x188be, 0x13378, 0x1113c,
+        0x17778, 0x1333c, 0x1111e, 0x1773c, 0x1331e, 0x1771e, 0x111be, 0x133be,
+        0x177be, 0x172c0, 0x1b970, 0x1dcbc, 0x17260, 0x1b938, 0x1dc9e, 0x17230,
+        0x1b91c, 0x17218, 0x1b90e, 0x1720c, 0x17206, 0x13170, 0x198bc, 0x17370,
+        0x13138, 0x1989e, 0x17338, 0x1b99e, 0x1731c, 0x1310e, 0x1730e, 0x110bc,
+        0x131bc, 0x1109e, 0x173bc, 0x1319e, 0x1739e, 0x17160, 0x1b8b8, 0x1dc5e,
+        0x17130, 0x1b89c, 0x17118, 0x1b88e, 0x1710c, 0x17106, 0x130b8, 0x1985e,
+        0x171b8, 0x1309c, 0x1719c, 0x1308e, 0x1718e, 0x1105e, 0x130de, 0x171de,
+        0x170b0, 0x1b85c, 0x17098, 0x1b84e, 0x1708c, 0x17086, 0x1305c, 0x170dc,
+        0x1304e, 0x170ce, 0x17058, 0x1b82e, 0x1704c, 0x17046, 0x1302e, 0x1706e,
+        0x1702c, 0x17026, 0x10af0, 0x1857c, 0x10a78, 0x1853e, 0x10a3c, 0x10a1e,
+        0x10b7c, 0x10b3e, 0x1f0ba, 0x1e17a, 0x1c2fa, 0x185fa, 0x11ae0, 0x18d78,
+        0x1c6be, 0x11a70, 0x18d3c, 0x11a38, 0x18d1e, 0x11a1c, 0x11a0e, 0x10978,
+        0x184be, 0x11b78, 0x1093c, 0x11b3c, 0x1091e, 0x11b1e, 0x109be, 0x11bbe,
+        0x13ac0, 0x19d70, 0x1cebc, 0x13a60, 0x19d38, 0x1ce9e, 0x13a30, 0x19d1c,
+        0x13a18, 0x19d0e, 0x13a0c, 0x13a06, 0x11970, 0x18cbc, 0x13b70, 0x11938,
+        0x18c9e, 0x13b38, 0x1191c, 0x13b1c, 0x1190e, 0x13b0e, 0x108bc, 0x119bc,
+        0x1089e, 0x13bbc, 0x1199e, 0x13b9e, 0x1bd60, 0x1deb8, 0x1ef5e, 0x17a40,
+        0x1bd30, 0x1de9c, 0x17a20, 0x1bd18, 0x1de8e, 0x17a10, 0x1bd0c, 0x17a08,
+        0x1bd06, 0x17a04, 0x13960, 0x19cb8, 0x1ce5e, 0x17b60, 0x13930, 0x19c9c,
+        0x17b30, 0x1bd9c, 0x19c8e, 0x17b18, 0x1390c, 0x17b0c, 0x13906, 0x17b06,
+        0x118b8, 0x18c5e, 0x139b8, 0x1189c, 0x17bb8, 0x1399c, 0x1188e, 0x17b9c,
+        0x1398e, 0x17b8e, 0x1085e, 0x118de, 0x139de, 0x17bde, 0x17940, 0x1bcb0,
+        0x1de5c, 0x17920, 0x1bc98, 0x1de4e, 0x17910, 0x1bc8c, 0x17908, 0x1bc86,
+        0x17904, 0x17902, 0x138b0, 0x19c5c, 0x179b0, 0x13898, 0x19c4e, 0x17998,
+        0x1bcce, 0x1798c, 0x13886, 0x17986, 0x1185c, 0x138dc, 0x1184e, 0x179dc,
+        0x138ce, 0x179ce, 0x178a0, 0x1bc58, 0x1de2e, 0x17890, 0x1bc4c, 0x17888,
+        0x1bc46, 0x17884, 0x17882, 0x13858, 0x19c2e, 0x178d8, 0x1384c, 0x178cc,
+        0x13846, 0x178c6, 0x1182e, 0x1386e, 0x178ee, 0x17850, 0x1bc2c, 0x17848,
+        0x1bc26, 0x17844, 0x17842, 0x1382c, 0x1786c, 0x13826, 0x17866, 0x17828,
+        0x1bc16, 0x17824, 0x17822, 0x13816, 0x17836, 0x10578, 0x182be, 0x1053c,
+        0x1051e, 0x105be, 0x10d70, 0x186bc, 0x10d38, 0x1869e, 0x10d1c, 0x10d0e,
+        0x104bc, 0x10dbc, 0x1049e, 0x10d9e, 0x11d60, 0x18eb8, 0x1c75e, 0x11d30,
+        0x18e9c, 0x11d18, 0x18e8e, 0x11d0c, 0x11d06, 0x10cb8, 0x1865e, 0x11db8,
+        0x10c9c, 0x11d9c, 0x10c8e, 0x11d8e, 0x1045e, 0x10cde, 0x11dde, 0x13d40,
+        0x19eb0, 0x1cf5c, 0x13d20, 0x19e98, 0x1cf4e, 0x13d10, 0x19e8c, 0x13d08,
+        0x19e86, 0x13d04, 0x13d02, 0x11cb0, 0x18e5c, 0x13db0, 0x11c98, 0x18e4e,
+        0x13d98, 0x19ece, 0x13d8c, 0x11c86, 0x13d86, 0x10c5c, 0x11cdc, 0x10c4e,
+        0x13ddc, 0x11cce, 0x13dce, 0x1bea0, 0x1df58, 0x1efae, 0x1be90, 0x1df4c,
+        0x1be88, 0x1df46, 0x1be84, 0x1be82, 0x13ca0, 0x19e58, 0x1cf2e, 0x17da0,
+        0x13c90, 0x19e4c, 0x17d90, 0x1becc, 0x19e46, 0x17d88, 0x13c84, 0x17d84,
+        0x13c82, 0x17d82, 0x11c58, 0x18e2e, 0x13cd8, 0x11c4c, 0x17dd8, 0x13ccc,
+        0x11c46, 0x17dcc, 0x13cc6, 0x17dc6, 0x10c2e, 0x11c6e, 0x13cee, 0x17dee,
+        0x1be50, 0x1df2c, 0x1be48, 0x1df26, 0x1be44, 0x1be42, 0x13c50, 0x19e2c,
+        0x17cd0, 0x13c48, 0x19e26, 0x17cc8, 0x1be66, 0x17cc4, 0x13c42, 0x17cc2,
+        0x11c2c, 0x13c6c, 0x11c26, 0x17cec, 0x13c66, 0x17ce6, 0x1be28, 0x1df16,
+        0x1be24, 0x1be22, 0x13c28, 0x19e16, 0x17c68, 0x13c24, 0x17c64, 0x13c22,
+        0x17c62, 0x11c16, 0x13c36, 0x17c76, 0x1be14, 0x1be12, 0x13c14, 0x17c34,
+        0x13c12, 0x17c32, 0x102bc, 0x1029e, 0x106b8, 0x1835e, 0x1069c, 0x1068e,
+        0x1025e, 0x106de, 0x10eb0, 0x1875c, 0x10e98, 0x1874e, 0x10e8c, 0x10e86,
+        0x1065c, 0x10edc, 0x1064e, 0x10ece, 0x11ea0, 0x18f58, 0x1c7ae, 0x11e90,
+        0x18f4c, 0x11e88, 0x18f46, 0x11e84, 0x11e82, 0x10e58, 0x1872e, 0x11ed8,
+        0x18f6e, 0x11ecc, 0x10e46, 0x11ec6, 0x1062e, 0x10e6e, 0x11eee, 0x19f50,
+        0x1cfac, 0x19f48, 0x1cfa6, 0x19f44, 0x19f42, 0x11e50, 0x18f2c, 0x13ed0,
+        0x19f6c, 0x18f26, 0x13ec8, 0x11e44, 0x13ec4, 0x11e42, 0x13ec2, 0x10e2c,
+        0x11e6c, 0x10e26, 0x13eec, 0x11e66, 0x13ee6, 0x1dfa8, 0x1efd6, 0x1dfa4,
+        0x1dfa2, 0x19f28, 0x1cf96, 0x1bf68, 0x19f24, 0x1bf64, 0x19f22, 0x1bf62,
+        0x11e28, 0x18f16, 0x13e68, 0x11e24, 0x17ee8, 0x13e64, 0x11e22, 0x17ee4,
+        0x13e62, 0x17ee2, 0x10e16, 0x11e36, 0x13e76, 0x17ef6, 0x1df94, 0x1df92,
+        0x19f14, 0x1bf34, 0x19f12, 0x1bf32, 0x11e14, 0x13e34, 0x11e12, 0x17e74,
+        0x13e32, 0x17e72, 0x1df8a, 0x19f0a, 0x1bf1a, 0x11e0a, 0x13e1a, 0x17e3a,
+        0x1035c, 0x1034e, 0x10758, 0x183ae, 0x1074c, 0x10746, 0x1032e, 0x1076e,
+        0x10f50, 0x187ac, 0x10f48, 0x187a6, 0x10f44, 0x10f42, 0x1072c, 0x10f6c,
+        0x10726, 0x10f66, 0x18fa8, 0x1c7d6, 0x18fa4, 0x18fa2, 0x10f28, 0x18796,
+        0x11f68, 0x18fb6, 0x11f64, 0x10f22, 0x11f62, 0x10716, 0x10f36, 0x11f76,
+        0x1cfd4, 0x1cfd2, 0x18f94, 0x19fb4, 0x18f92, 0x19fb2, 0x10f14, 0x11f34,
+        0x10f12, 0x13f74, 0x11f32, 0x13f72, 0x1cfca, 0x18f8a, 0x19f9a, 0x10f0a,
+        0x11f1a, 0x13f3a, 0x103ac, 0x103a6, 0x107a8, 0x183d6, 0x107a4, 0x107a2,
+        0x10396, 0x107b6, 0x187d4, 0x187d2, 0x10794, 0x10fb4, 0x10792, 0x10fb2,
+        0x1c7ea,
+    ),
+)
+
+# PDF417 start and stop patterns, the stop pattern has an extra bar
+PDF417_START = 0x1fea8
+PDF417_STOP = 0x3fa29
+
+# Values of the row indicators: left row count, right row count, security
+# level and column count, as computed by BarcodePDF417
+PDF417_INDICATORS = ('rowsLeft', 'rowsRight', 'level', 'columns')
+
+# Row indicator values on the left and on the right of a row, by cluster
+PDF417_LEFT = ('rowsLeft', 'level', 'columns')
+PDF417_RIGHT = ('columns', 'rowsRight', 'level')
+
+
+def pdf417_runs(modules):
+    """The four bar and four space widths of a codeword, three bits each
+    starting with the first bar in the low bits"""
+    widths = run_lengths(format(modules, '017b'))
+    assert len(widths) == 8 and max(widths) <= 6
+    return sum(w << (i * 3) for i, w in enumerate(widths))
+
+
+def pdf417():
+    for cluster, codewords in enumerate(PDF417_CLUSTERS):
+        for modules in codewords:
+            w = run_lengths(format(modules, '017b'))
+            assert (w[0] - w[2] + w[4] - w[6] + 9) % 9 == cluster * 3
+
+    print('/// PDF417 codeword modules, indexed by cluster * 929 + value')
+    table('pdf417Codewords', [m for c in PDF417_CLUSTERS for m in c])
+
+    print('/// PDF417 codeword bar and space widths, three bits each starting')
+    print('/// with the first bar in the low bits, indexed by')
+    print('/// cluster * 929 + value')
+    table('pdf417Runs', [pdf417_runs(m) for c in PDF417_CLUSTERS for m in c])
+
+    print('/// PDF417 start and stop bar widths')
+    runs('pdf417StartRuns', format(PDF417_START, '017b'))
+    runs('pdf417StopRuns', format(PDF417_STOP, '018b'))
+    print('')
+
+    print('/// PDF417 row indicator values: '
+          + ', '.join(f'{i} {n}' for i, n in enumerate(PDF417_INDICATORS)))
+    print('static const pdf417LeftIndicator = <int>'
+          f'{[PDF417_INDICATORS.index(n) for n in PDF417_LEFT]};')
+    print('static const pdf417RightIndicator = <int>'
+          f'{[PDF417_INDICATORS.index(n) for n in PDF417_RIGHT]};')
+
+
+def table(name, values, per_line=8):
+    """Print a list of numbers, per_line values on each line"""
+    if packed(name, values):
+        return
+    print(f'static const {name} = <int>[')
+    for i in range(0, len(values), per_line):
+        row = ', '.join(hex(v) for v in values[i:i + per_line])
+        print(f'{row}, // {i}')
+    print('];\n')
+
+
+def galois_field(pp, size):
+    """Antilog and log tables of the Galois field GF(size) using the
+    primitive polynomial pp, in the same way as GaloisField in
+    reedsolomon.dart"""
+    alog = []
+    x = 1
+    for i in range(size):
+        alog.append(x)
+        x *= 2
+        if x >= size:
+            x = (x ^ pp) & (size - 1)
+    log = [0] * size
+    for i in range(size):
+        log[alog[i]] = i
+    return alog, log
+
+
+def generator_polynomial(alog, log, size, base, degree):
+    """Reed-Solomon generator polynomial of degree, highest degree first,
+    as computed by ReedSolomonEncoder.getPolynomial"""
+    def mul(a, b):
+        if a == 0 or b == 0:
+            return 0
+        return alog[(log[a] + log[b]) % (size - 1)]
+
+    poly = [1]
+    for d in range(1, degree + 1):
+        factor = alog[d - 1 + base]
+        product = poly + [0]
+        for i, c in enumerate(poly):
+            product[i + 1] ^= mul(c, factor)
+        poly = product
+    return poly
+
+
+def reedsolomon():
+    fields = (
+        # size, primitive polynomial, error correction counts
+        (16, 0x13, (5, 6)),  # Aztec mode message
+        (64, 0x43, ()),
+        (256, 0x12d, (5, 7, 10, 12, 14, 18, 20, 24,
+                      28, 36, 42, 48, 56, 62, 68)),  # Datamatrix
+        (1024, 0x409, ()),
+        (4096, 0x1069, ()),
+    )
+
+    for size, pp, degrees in fields:
+        alog, log = galois_field(pp, size)
+        print(f'/// Galois field GF({size}) antilog table, '
+              f'primitive polynomial {hex(pp)}')
+        table(f'gf{size}ALog', alog)
+        print(f'/// Galois field GF({size}) log table')
+        table(f'gf{size}Log', log)
+
+        if not degrees:
+            continue
+
+        print(f'/// Reed-Solomon generator polynomials in GF({size}), '
+              'indexed by degree')
+        print(f'static const gf{size}Generators = <int, List<int>>{{')
+        for degree in degrees:
+            poly = generator_polynomial(alog, log, size, 1, degree)
+            print(f'{degree}: <int>[')
+            for i in range(0, len(poly), 8):
+                row = ', '.join(hex(v) for v in poly[i:i + 8])
+                print(f'{row}, // {i}')
+            print('],')
+        print('};\n')
+
+
+def unpack():
+    """Print the functions used to decode the packed tables"""
+    for fmt, dart in PACK_TYPES:
+        if fmt not in PACK_USED:
+            continue
+        size = struct.calcsize(fmt)
+        print(f'/// Decode a table packed by build_maps.py')
+        print(f'static {dart}List _unpack{dart}(String data) {{')
+        if fmt == 'B':
+            print('return base64.decode(data);')
+        elif size == 1:
+            print(f'return {dart}List.sublistView(base64.decode(data));')
+        else:
+            print('final bytes = ByteData.sublistView(base64.decode(data));')
+            print(f'final result = {dart}List(bytes.lengthInBytes ~/ {size});')
+            print('for (var i = 0; i < result.length; i++) {')
+            print(f'result[i] = bytes.get{dart}(i * {size}, Endian.little);')
+            print('}')
+            print('return result;')
+        print('}\n')
+
+
+def header(digest):
+    """Print the license, the source hash and the lint settings of a
+    generated file"""
     print('/*')
     print(' * Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>')
     print(' *')
@@ -695,18 +2039,269 @@ if __name__ == '__main__':
     print(' * limitations under the License.')
     print(' */')
     print('')
+    print(f'// Generated by build_maps.py, source hash {digest}')
+    print('')
     print('// ignore_for_file: public_member_api_docs')
     print('')
-    print('class BarcodeMaps {')
 
-    code39()
-    code93()
-    code128()
-    ean13()
-    itf()
-    telepen()
-    codabar()
-    rm4scc()
-    postnet()
 
+def common(digest):
+    """Print the module shared by all the tables"""
+    header(digest)
+    print('class CommonMaps {')
+    print('/// Marks the characters that can\'t be encoded in the dense tables')
+    print(f'static const noCode = {NO_CODE};')
+    print('}')
+
+
+def module(digest, name, section):
+    """Print the tables of a symbology in their own class, returns the
+    names of the tables"""
+    PACK_USED.clear()
+    body = io.StringIO()
+    with contextlib.redirect_stdout(body):
+        section()
+        if PACK:
+            print('')
+            unpack()
+    body = body.getvalue()
+    uses_no_code = re.search(r'\bnoCode\b', body) is not None
+
+    header(digest)
+    if PACK_USED:
+        print("import 'dart:convert';")
+        print("import 'dart:typed_data';")
+        print('')
+    if uses_no_code:
+        print("import 'common.dart';")
+        print('')
+    print(f'class {name} {{')
+    if uses_no_code:
+        print('static const noCode = CommonMaps.noCode;\n')
+    print(body)
+    print('}')
+    return table_names(body)
+
+
+def table_names(body):
+    """Kind and name of the tables of a module"""
+    return [(kind, name) for kind, name in re.findall(
+        r'^\s*static (const|final) (\w+) =', body, re.MULTILINE)
+        if name != 'noCode']
+
+
+def facade(digest, modules):
+    """Print BarcodeMaps, giving access to the tables of all the
+    symbologies under their historical names"""
+    header(digest)
+    # Sorted as the directives_ordering lint expects
+    uris = sorted(f'maps/{file}.dart'
+                  for file in ['common'] + [file for file, _, _ in modules])
+    for uri in uris:
+        print(f"import '{uri}';")
+    print('')
+    for uri in uris:
+        print(f"export '{uri}';")
+    print('')
+    print('/// All the generated tables. The library imports the module of each')
+    print('/// symbology instead, so that the unused tables can be left out')
+    print('class BarcodeMaps {')
+    print('static const noCode = CommonMaps.noCode;\n')
+    for _, name, tables in modules:
+        for kind, table in tables:
+            print(f'static {kind} {table} = {name}.{table};')
+        print('')
     print('}')
+
+
+# Generated modules: file name in lib/src/maps, class name, tables
+MODULES = (
+    ('code39', 'Code39Maps', code39),
+    ('code93', 'Code93Maps', code93),
+    ('code128', 'Code128Maps', code128),
+    ('ean', 'EanMaps', ean13),
+    ('itf', 'ItfMaps', itf),
+    ('telepen', 'TelepenMaps', telepen),
+    ('codabar', 'CodabarMaps', codabar),
+    ('rm4scc', 'Rm4sccMaps', rm4scc),
+    ('postnet', 'PostnetMaps', postnet),
+    ('datamatrix', 'DataMatrixMaps', datamatrix),
+    ('aztec', 'AztecMaps', aztec),
+    ('pdf417', 'Pdf417Maps', pdf417),
+    ('reedsolomon', 'ReedSolomonMaps', reedsolomon),
+)
+
+
+def dependencies(func, found=None):
+    """The functions of this file used by func, and the tables they read,
+    by name"""
+    found = {} if found is None else found
+    found[func.__name__] = func
+    codes = [func.__code__]
+    while codes:
+        code = codes.pop()
+        codes.extend(c for c in code.co_consts if inspect.iscode(c))
+        for name in code.co_names:
+            value = globals().get(name)
+            if name in found or name in STATE or value is None:
+                continue
+            if inspect.isfunction(value):
+                if value.__module__ == __name__:
+                    dependencies(value, found)
+            elif not inspect.ismodule(value) and not inspect.isclass(value):
+                found[name] = value
+    return found
+
+
+def source(func):
+    """Source code of a function, from the line numbers of its code, faster
+    than inspect.getsource"""
+    first = last = func.__code__.co_firstlineno
+    codes = [func.__code__]
+    while codes:
+        code = codes.pop()
+        codes.extend(c for c in code.co_consts if inspect.iscode(c))
+        last = max([last] + [line for _, line in dis.findlinestarts(code)
+                             if line])
+    return ''.join(linecache.getlines(__file__)[first - 1:last])
+
+
+def source_hash(funcs, *values):
+    """Hash of the source code of funcs, the functions and tables they
+    use, and values, the functions by name"""
+    found = {}
+    for func in funcs:
+        dependencies(func, found)
+    digest = hashlib.sha256()
+    for name, value in sorted(found.items()):
+        code = source(value) if inspect.isfunction(value) else repr(value)
+        digest.update(f'{name}\n{code}\n'.encode())
+    digest.update(repr([value.__name__ if inspect.isfunction(value)
+                        else value for value in values]).encode())
+    return digest.hexdigest()[:16]
+
+
+def content_hash(text):
+    """Hash of a generated file, without the line recording it"""
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+def file_hash(path):
+    """The source hash a file was generated from, None if it is missing or
+    its content was changed since"""
+    try:
+        with open(path) as f:
+            text = f.read()
+    except FileNotFoundError:
+        return None
+    match = re.search(r'^// Generated by build_maps.py, source hash '
+                      r'(\w+)\n(// Content hash (\w+)\n)', text, re.MULTILINE)
+    if not match or match.group(3) != content_hash(
+            text[:match.start(2)] + text[match.end(2):]):
+        return None
+    return match.group(1)
+
+
+def dart_format(text):
+    """Indent the printed code and split the long declarations, as dart
+    format does"""
+    lines = []
+    depth = 0
+    for line in text.split('\n'):
+        code = line if line.startswith(' *') else line.strip()
+        if not code:
+            lines.append('')
+            continue
+        if code.startswith(('}', ']')) and depth:
+            depth -= 1
+        # The strings of the packed tables continue an assignment
+        indent = '  ' * depth + ('    ' if code.startswith("'") else '')
+        line = indent + code if depth else code
+        declaration = re.match(r'(\s*static \w+ \w+ =) (.*;)$', line)
+        if len(line) > LINE_LENGTH and declaration:
+            lines.append(declaration.group(1))
+            line = ' ' * (len(indent) + 4) + declaration.group(2)
+        lines.append(line)
+        if code.split(' //')[0].endswith(('{', '[')):
+            depth += 1
+    text = re.sub(r'\n{3,}', '\n\n', '\n'.join(lines))
+    text = re.sub(r'\n\n(\s*[}\]])', r'\n\1', text)
+    return text.rstrip('\n') + '\n'
+
+
+def write(path, func, *args):
+    """Write the formatted output of func to the file path, with the hash
+    of its content after the source hash"""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        result = func(*args)
+    text = dart_format(output.getvalue())
+    end = text.index('\n', text.index('// Generated by build_maps.py')) + 1
+    text = (text[:end] + f'// Content hash {content_hash(text)}\n' +
+            text[end:])
+    with open(path, 'w') as f:
+        f.write(text)
+    return result
+
+
+def update(path, check, force, funcs, func, *args):
+    """Write the output of func to path, unless the file was generated from
+    the same source and left unchanged. With check, only returns whether
+    the file is stale.
+    The source is funcs, the formatter and args, func getting the hash
+    first"""
+    digest = source_hash([write, *funcs], *args)
+    if not force and file_hash(path) == digest:
+        return False
+    if not check:
+        write(path, func, digest, *args)
+    return True
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Generate barcode/lib/src/barcode_maps.dart and the '
+        'tables of each symbology in barcode/lib/src/maps, the files '
+        'generated from the current source being left as is')
+    parser.add_argument('--plain', action='store_true',
+                        help='print all the tables as list literals')
+    parser.add_argument('--output', metavar='DIR',
+                        default=os.path.join(os.path.dirname(__file__),
+                                             'barcode', 'lib', 'src'),
+                        help='source directory of the package')
+    parser.add_argument('--check', action='store_true',
+                        help='list the files that are not generated from '
+                        'the current source, or were changed since, without '
+                        'writing them')
+    parser.add_argument('--force', action='store_true',
+                        help='write all the files')
+    args = parser.parse_args()
+    PACK = not args.plain
+
+    maps = os.path.join(args.output, 'maps')
+    if not args.check:
+        os.makedirs(maps, exist_ok=True)
+
+    stale = []
+    path = os.path.join(maps, 'common.dart')
+    if update(path, args.check, args.force, [common], common):
+        stale.append(path)
+
+    modules = []
+    for file, name, section in MODULES:
+        path = os.path.join(maps, f'{file}.dart')
+        if update(path, args.check, args.force, [module, section], module,
+                  name, section):
+            stale.append(path)
+        # The facade lists the tables of the module as generated
+        with contextlib.suppress(FileNotFoundError), open(path) as f:
+            modules.append((file, name, table_names(f.read())))
+
+    path = os.path.join(args.output, 'barcode_maps.dart')
+    if update(path, args.check, args.force, [facade], facade, modules):
+        stale.append(path)
+
+    for path in stale:
+        print(f'{"Stale" if args.check else "Updated"}: {path}',
+              file=sys.stderr)
+    sys.exit(1 if args.check and stale else 0)
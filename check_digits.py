@@ -0,0 +1,280 @@
+#!/bin/env python3
+# Copyright (C) 2020, David PHAM-VAN <dev.nfet.net@gmail.com>
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compute and verify the check digits of many barcodes at once.
+
+The codes are converted to NumPy arrays of symbol values using the tables
+of build_maps.py, and the checksums of all the codes are computed with
+array arithmetic, giving the same results as the Dart encoders.
+
+The Code 128 check symbol is not printed with the text of the barcode:
+check_digits computes its value from the shortest encoding of each code,
+while validate, complete and the command line handle the symbologies of
+CHECK_CHARS, whose check values are characters of the code.
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+import build_maps
+
+# Length of the GS1 codes, including the check digit
+GS1_LENGTHS = {
+    'ean13': 13,
+    'ean8': 8,
+    'upca': 12,
+    'itf14': 14,
+}
+
+# UPC-E to UPC-A expansion: the UPC-A manufacturer and product digits are
+# taken from these UPC-E digits, depending on the last UPC-E digit. The
+# index 6 is a zero.
+UPCE_EXPANSION = np.array([
+    (0, 1, 5, 6, 6, 6, 6, 2, 3, 4),  # 0
+    (0, 1, 5, 6, 6, 6, 6, 2, 3, 4),  # 1
+    (0, 1, 5, 6, 6, 6, 6, 2, 3, 4),  # 2
+    (0, 1, 2, 6, 6, 6, 6, 6, 3, 4),  # 3
+    (0, 1, 2, 3, 6, 6, 6, 6, 6, 4),  # 4
+    (0, 1, 2, 3, 4, 6, 6, 6, 6, 5),  # 5
+    (0, 1, 2, 3, 4, 6, 6, 6, 6, 5),  # 6
+    (0, 1, 2, 3, 4, 6, 6, 6, 6, 5),  # 7
+    (0, 1, 2, 3, 4, 6, 6, 6, 6, 5),  # 8
+    (0, 1, 2, 3, 4, 6, 6, 6, 6, 5),  # 9
+], dtype=np.intp)
+
+
+def value_table(chars):
+    """Lookup table from code unit to symbol value, the position in chars,
+    -1 for the characters that can't be encoded. The named symbols of
+    chars are skipped"""
+    table = np.full(256, -1, dtype=np.int16)
+    for value, char in enumerate(chars):
+        if len(char) == 1:
+            table[ord(char)] = value
+    return table
+
+
+DIGIT_VALUES = value_table('0123456789')
+CODE93_VALUES = value_table(build_maps.C93)
+RM4SCC_VALUES = value_table(build_maps.RM4SCC_CHARS)
+
+
+def code_units(codes, right=False):
+    """Convert a list of strings to a 2D array of code units, padded with
+    zeros on the right, or on the left if right is True to align the
+    last characters. Returns the array and the length of each code"""
+    try:
+        data = [code.encode('ascii') for code in codes]
+    except UnicodeEncodeError as e:
+        raise ValueError(f'Unable to encode "{e.object}"') from None
+
+    lengths = np.fromiter((len(code) for code in data), dtype=np.intp,
+                          count=len(data))
+    width = int(lengths.max(initial=0))
+    units = np.zeros((len(data), width), dtype=np.uint8)
+    flat = np.frombuffer(b''.join(data), dtype=np.uint8)
+
+    rows = np.repeat(np.arange(len(data)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    cols = np.arange(len(flat)) - np.repeat(starts, lengths)
+    if right:
+        cols += width - lengths[rows]
+    units[rows, cols] = flat
+    return units, lengths
+
+
+def values(codes, table, right=False):
+    """Convert a list of strings to a 2D array of symbol values using
+    table, the padding is set to -1"""
+    units, lengths = code_units(codes, right)
+    result = table[units]
+
+    mask = np.arange(units.shape[1]) < lengths[:, None]
+    if right:
+        mask = mask[:, ::-1]
+    result[~mask] = -1
+
+    invalid = mask & (result < 0)
+    if invalid.any():
+        row, col = np.argwhere(invalid)[0]
+        raise ValueError(f'Unable to encode "{chr(units[row, col])}" '
+                         f'in "{codes[row]}"')
+    return result
+
+
+def fixed_digits(codes, length):
+    """Convert a list of strings of length digits to a 2D array"""
+    for code in codes:
+        if len(code) != length:
+            raise ValueError(f'"{code}" is not {length} digits')
+    return values(codes, DIGIT_VALUES)
+
+
+def mod10(digits):
+    """GS1 check digit of each row of a 2D array of digits, the weight of
+    the last digit is 3"""
+    weights = np.where(np.arange(digits.shape[1])[::-1] % 2 == 0, 3, 1)
+    return (-(digits.astype(np.int64) @ weights)) % 10
+
+
+def upce_to_upca(digits):
+    """Expand a 2D array of UPC-E digits, number system and 6 digits, to
+    the first 11 digits of the UPC-A codes"""
+    if ((digits[:, 0] != 0) & (digits[:, 0] != 1)).any():
+        raise ValueError('The UPC-E number system must be 0 or 1')
+    body = np.concatenate(
+        (digits[:, 1:7], np.zeros((len(digits), 1), dtype=digits.dtype)),
+        axis=1)
+    expansion = UPCE_EXPANSION[digits[:, 6]]
+    product = np.take_along_axis(body, expansion, axis=1)
+    return np.concatenate((digits[:, :1], product), axis=1)
+
+
+def mod103(values):
+    """Code 128 checksum of each row of a 2D array of symbol values,
+    starting with the start symbol and padded with zeros"""
+    weights = np.maximum(np.arange(values.shape[1]), 1)
+    return (values.astype(np.int64) @ weights) % 103
+
+
+def mod47(codes):
+    """Code 93 C and K checksum values of a list of strings"""
+    return mod47_values(values(codes, CODE93_VALUES, right=True))
+
+
+def mod47_values(data):
+    """Code 93 C and K checksum values of each row of a 2D array of
+    symbol values, aligned to the right and padded with -1"""
+    data = np.maximum(data, 0).astype(np.int64)
+    position = np.arange(data.shape[1])[::-1]
+    c = (data @ (position % 20 + 1)) % 47
+    k = (data @ ((position + 1) % 15 + 1) + c) % 47
+    return np.stack((c, k), axis=1)
+
+
+def rm4scc(codes):
+    """RM4SCC checksum value of a list of strings"""
+    data = values(codes, RM4SCC_VALUES)
+    valid = data >= 0
+    top = np.where(valid, (data // 6 + 1) % 6, 0).sum(axis=1)
+    bottom = np.where(valid, (data + 1) % 6, 0).sum(axis=1)
+    return ((top - 1) % 6) * 6 + (bottom - 1) % 6
+
+
+def code128(codes):
+    """Code 128 check symbol value of a list of strings, encoded with the
+    shortest sequence of sets as barcode_batch.encoder.code128 does"""
+    # Imported here as barcode_batch uses the tables of this module
+    from barcode_batch import encoder
+    return mod103(np.maximum(encoder.code128_values(codes), 0))
+
+
+def check_digits(symbology, codes):
+    """Check digits of a list of codes given without them: an array of
+    digit values for the GS1 codes, or of symbol values for Code 93 (two
+    per code), Code 128 and RM4SCC"""
+    if symbology in GS1_LENGTHS:
+        return mod10(fixed_digits(codes, GS1_LENGTHS[symbology] - 1))
+    if symbology == 'upce':
+        return mod10(upce_to_upca(fixed_digits(codes, 7)))
+    if symbology == 'code93':
+        return mod47(codes)
+    if symbology == 'code128':
+        return code128(codes)
+    if symbology == 'rm4scc':
+        return rm4scc(codes)
+    raise ValueError(f'Unknown symbology "{symbology}"')
+
+
+# Characters of the check values, for the symbologies that can print them
+CHECK_CHARS = {
+    'ean13': '0123456789',
+    'ean8': '0123456789',
+    'upca': '0123456789',
+    'upce': '0123456789',
+    'itf14': '0123456789',
+    'code93': ''.join(build_maps.C93),
+    'rm4scc': ''.join(build_maps.RM4SCC_CHARS),
+}
+
+# Number of check values at the end of the codes, one if not listed
+CHECK_LENGTHS = {
+    'code93': 2,
+}
+
+
+def check_rows(symbology, codes):
+    """The check values of check_digits, one row per code"""
+    checks = check_digits(symbology, codes)
+    return checks[:, None] if checks.ndim == 1 else checks
+
+
+def complete(symbology, codes):
+    """Append the check digits to a list of codes. The Code 93 check
+    values of the shift symbols can't be printed"""
+    if symbology not in CHECK_CHARS:
+        raise ValueError(f'The {symbology} check values are not printable')
+    chars = CHECK_CHARS[symbology]
+    checks = check_rows(symbology, codes)
+    unprintable = np.flatnonzero((checks >= len(chars)).any(axis=1))
+    if len(unprintable):
+        raise ValueError(f'The check values of "{codes[unprintable[0]]}" '
+                         'are not printable')
+    checks = np.array(list(chars))[checks]
+    return [code + ''.join(check) for code, check in zip(codes, checks)]
+
+
+def validate(symbology, codes):
+    """Returns a boolean array, True for the codes with correct check
+    digits"""
+    if symbology not in CHECK_CHARS:
+        raise ValueError(f'The {symbology} check values are not printable')
+    table = value_table(CHECK_CHARS[symbology])
+    size = CHECK_LENGTHS.get(symbology, 1)
+    if any(len(code) < size for code in codes):
+        raise ValueError('Unable to validate a code without its check '
+                         'digits')
+    given, _ = code_units([code[-size:] for code in codes])
+    given = table[given].reshape(len(codes), size)
+    checks = check_rows(symbology, [code[:-size] for code in codes])
+    return (checks == given).all(axis=1)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Verify or complete the check digits of a list of '
+        'barcodes, one per line')
+    parser.add_argument('symbology', choices=sorted(CHECK_CHARS),
+                        help='the Code 128 check symbol is not printed, '
+                        'check_digits computes its value')
+    parser.add_argument('file', nargs='?', type=argparse.FileType('r'),
+                        default=sys.stdin)
+    parser.add_argument('--complete', action='store_true',
+                        help='print the codes with their check digit')
+    args = parser.parse_args()
+
+    codes = args.file.read().split()
+    if args.complete:
+        for code in complete(args.symbology, codes):
+            print(code)
+    else:
+        errors = 0
+        for code, valid in zip(codes, validate(args.symbology, codes)):
+            if not valid:
+                print(code)
+                errors += 1
+        sys.exit(1 if errors else 0)
@@ -166,6 +166,29 @@ class RenderBarcode extends RenderBox {
     size = _computeSize(constraints);
   }
 
+  /// Paint the bar [index] of [recipe], only the black bars are painted
+  void paintRecipeBar(
+    PaintingContext context,
+    Offset offset,
+    BarcodeRecipe recipe,
+    int index,
+  ) {
+    if (!recipe.isBlack(index)) {
+      return;
+    }
+
+    context.canvas.drawRect(
+      Rect.fromLTWH(
+        offset.dx + recipe.left(index),
+        offset.dy + recipe.top(index),
+        recipe.width(index),
+        recipe.height(index),
+      ),
+      barStyle,
+    );
+  }
+
+  @Deprecated('The bars are painted by paintRecipeBar')
   void paintBar(PaintingContext context, Offset offset, BarcodeBar element) {
     if (!element.black) {
       return;
@@ -230,7 +253,7 @@ class RenderBarcode extends RenderBox {
   void paint(PaintingContext context, Offset offset) {
     try {
       final recipe = isBytes
-          ? barcode.makeBytes(
+          ? barcode.makeRecipeBytes(
               dataBytes!,
               width: size.width,
               height: size.height,
@@ -238,7 +261,7 @@ class RenderBarcode extends RenderBox {
               fontHeight: style!.fontSize,
               textPadding: textPadding,
             )
-          : barcode.make(
+          : barcode.makeRecipe(
               dataString!,
               width: size.width,
               height: size.height,
@@ -246,12 +269,12 @@ class RenderBarcode extends RenderBox {
               fontHeight: style!.fontSize,
               textPadding: textPadding,
             );
-      for (var element in recipe) {
-        if (element is BarcodeBar) {
-          paintBar(context, offset, element);
-        } else if (element is BarcodeText) {
-          paintText(context, offset, element);
-        }
+      for (var i = 0; i < recipe.length; i++) {
+        paintRecipeBar(context, offset, recipe, i);
+      }
+
+      for (var element in recipe.texts) {
+        paintText(context, offset, element);
       }
     } on BarcodeException catch (error) {
       FlutterError.reportError(FlutterErrorDetails(
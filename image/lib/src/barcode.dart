@@ -85,7 +85,7 @@ void drawBarcode(
   height ??= image.height;
   textPadding ??= 0;
 
-  final recipe = barcode.make(
+  final recipe = barcode.makeRecipe(
     data,
     width: width.toDouble(),
     height: height.toDouble(),
@@ -114,7 +114,7 @@ void drawBarcodeBytes(
   height ??= image.height;
   textPadding ??= 0;
 
-  final recipe = barcode.makeBytes(
+  final recipe = barcode.makeRecipeBytes(
     bytes,
     width: width.toDouble(),
     height: height.toDouble(),
@@ -128,7 +128,7 @@ void drawBarcodeBytes(
 
 void _drawBarcode(
   Image image,
-  Iterable<BarcodeElement> recipe,
+  BarcodeRecipe recipe,
   int x,
   int y,
   BitmapFont? font,
@@ -138,47 +138,51 @@ void _drawBarcode(
       color & 0xff, (color >> 24) & 0xff);
 
   // Draw the barcode
-  for (var elem in recipe) {
-    if (elem is BarcodeBar) {
-      if (elem.black) {
-        // Draw one black bar
-        fillRect(
-          image,
-          x1: (x + elem.left).round(),
-          y1: (y + elem.top).round(),
-          x2: (x + elem.right).round(),
-          y2: (y + elem.bottom).round(),
-          color: imageColor,
-        );
-      }
-    } else if (elem is BarcodeText) {
-      // Get string dimensions
-      final metrics = font!.getMetrics(elem.text);
-      final top = y + elem.top + elem.height - font.size;
-      late double left;
-
-      // Center the text
-      switch (elem.align) {
-        case BarcodeTextAlign.left:
-          left = x + elem.left;
-          break;
-        case BarcodeTextAlign.center:
-          left = x + elem.left + (elem.width - metrics.width) / 2;
-          break;
-        case BarcodeTextAlign.right:
-          left = x + elem.left + elem.width - metrics.width;
-          break;
-      }
-
-      // Draw some text using 14pt arial font
-      drawString(
+  final bounds = recipe.bounds;
+  for (var i = 0; i < recipe.length; i++) {
+    if (recipe.isBlack(i)) {
+      // Draw one black bar
+      final left = x + bounds[i * 4];
+      final top = y + bounds[i * 4 + 1];
+      fillRect(
         image,
-        elem.text,
-        font: font,
-        x: left.round(),
-        y: top.round(),
+        x1: left.round(),
+        y1: top.round(),
+        x2: (left + bounds[i * 4 + 2]).round(),
+        y2: (top + bounds[i * 4 + 3]).round(),
         color: imageColor,
       );
     }
   }
+
+  // Draw the texts
+  for (var elem in recipe.texts) {
+    // Get string dimensions
+    final metrics = font!.getMetrics(elem.text);
+    final top = y + elem.top + elem.height - font.size;
+    late double left;
+
+    // Center the text
+    switch (elem.align) {
+      case BarcodeTextAlign.left:
+        left = x + elem.left;
+        break;
+      case BarcodeTextAlign.center:
+        left = x + elem.left + (elem.width - metrics.width) / 2;
+        break;
+      case BarcodeTextAlign.right:
+        left = x + elem.left + elem.width - metrics.width;
+        break;
+    }
+
+    // Draw some text using 14pt arial font
+    drawString(
+      image,
+      elem.text,
+      font: font,
+      x: left.round(),
+      y: top.round(),
+      color: imageColor,
+    );
+  }
 }
@@ -17,9 +17,9 @@ mixin Pubspec {
 
   static const issue_tracker = 'https://github.com/DavBfr/dart_barcode/issues';
 
-  static const versionFull = '2.0.3';
+  static const versionFull = '2.0.4';
 
-  static const version = '2.0.3';
+  static const version = '2.0.4';
 
   static const versionSmall = '2.0';
 
@@ -27,7 +27,7 @@ mixin Pubspec {
 
   static const versionMinor = 0;
 
-  static const versionPatch = 3;
+  static const versionPatch = 4;
 
   static const versionBuild = 0;
 
@@ -41,7 +41,7 @@ mixin Pubspec {
 
   static const dependencies = <dynamic, dynamic>{
     'args': '^2.3.0',
-    'barcode': '^2.2.4',
+    'barcode': '^2.3.0',
     'image': '^4.0.6',
     'meta': '^1.7.0',
   };